@@ -54,6 +54,7 @@ from forge.monitoring import (
 from forge.resilience.integration import (
     ObservabilityMiddleware,
 )
+from forge.security.password_hasher import PasswordHasherBusyError
 
 # Configure logging early - before any other logging occurs
 _settings = get_settings()
@@ -167,6 +168,21 @@ class ForgeApp:
             logger.critical("database_connection_failed", error=str(e))
             raise RuntimeError(f"Cannot start: Database connection failed - {e}") from e
 
+        # Audit write-behind - without it audit events are written inline
+        if self.settings.audit_write_behind_enabled:
+            try:
+                from forge.repositories.audit_writer import start_audit_writer
+
+                await start_audit_writer(
+                    self.db_client,
+                    batch_size=self.settings.audit_batch_size,
+                    flush_interval_ms=self.settings.audit_flush_interval_ms,
+                    max_queue_size=self.settings.audit_queue_max_size,
+                    journal_dir=self.settings.audit_journal_dir,
+                )
+            except (OSError, ValueError) as e:
+                logger.error("audit_writer_start_failed", error=str(e))
+
         # Kernel - critical for core functionality
         try:
             # PERSISTENCE FIX: Initialize CascadeRepository and inject into EventSystem
@@ -175,7 +191,11 @@ class ForgeApp:
 
             cascade_repo = CascadeRepository(self.db_client)
 
-            self.event_system = EventSystem(cascade_repository=cascade_repo)
+            self.event_system = EventSystem(
+                cascade_repository=cascade_repo,
+                num_shards=self.settings.event_bus_shards,
+                partition_key=self.settings.event_bus_partition_key,
+            )
             # Start event system worker and load active cascade chains from database
             await self.event_system.start()
             self.overlay_manager = OverlayManager(self.event_system)
@@ -355,7 +375,10 @@ class ForgeApp:
 
         # PrimeKG biomedical knowledge graph overlay
         # Provides differential diagnosis, phenotype search, drug-disease interactions
-        primekg = create_primekg_overlay(neo4j_client=self.db_client)
+        primekg = create_primekg_overlay(
+            neo4j_client=self.db_client,
+            adjacency=self._open_primekg_adjacency(),
+        )
 
         # Register with manager (auto-initializes by default)
         if self.overlay_manager:
@@ -368,6 +391,23 @@ class ForgeApp:
             await self.overlay_manager.register_instance(temporal_tracker)
             await self.overlay_manager.register_instance(primekg)
 
+    def _open_primekg_adjacency(self) -> Any:
+        """Open the PrimeKG adjacency snapshot, if one is configured."""
+        path = self.settings.primekg_adjacency_path
+        if not path:
+            return None
+
+        from forge.services.primekg.adjacency import PrimeKGAdjacency
+
+        try:
+            return PrimeKGAdjacency.open(
+                path,
+                max_age_seconds=self.settings.primekg_adjacency_max_age_hours * 3600,
+            )
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning("primekg_adjacency_unavailable", path=path, error=str(e))
+            return None
+
     async def _initialize_diagnosis_services(self) -> None:
         """Initialize the differential diagnosis services."""
         from forge.api.routes.diagnosis import initialize_diagnosis_services
@@ -509,9 +549,35 @@ class ForgeApp:
             except (RuntimeError, OSError, asyncio.CancelledError) as e:
                 logger.warning("event_system_shutdown_failed", error=str(e))
 
+        # Pending password rehashes save to the database, so finish them
+        # before the audit writer and database shut down
+        try:
+            from forge.security.password_hasher import shutdown_password_hasher
+
+            await shutdown_password_hasher()
+        except (RuntimeError, asyncio.CancelledError) as e:
+            logger.warning("password_hasher_shutdown_failed", error=str(e))
+
+        # Flush queued audit events while the database is still connected
+        try:
+            from forge.repositories.audit_writer import stop_audit_writer
+
+            await stop_audit_writer(timeout=min(10.0, timeout_seconds))
+            logger.info("audit_writer_shutdown")
+        except (RuntimeError, OSError, asyncio.CancelledError) as e:
+            logger.warning("audit_writer_shutdown_failed", error=str(e))
+
         if self.db_client:
             await self.db_client.close()
 
+        # Stop the revocation filter sync and close the blacklist's Redis connection
+        try:
+            from forge.security.tokens import TokenBlacklist
+
+            await TokenBlacklist.close()
+        except (ConnectionError, TimeoutError, OSError, ImportError) as e:
+            logger.warning("token_blacklist_shutdown_failed", error=str(e))
+
         logger.info("forge_shutdown_complete")
 
     def get_status(self) -> dict[str, Any]:
@@ -829,6 +895,20 @@ def create_app(
             headers={"Retry-After": "5"},
         )
 
+    @app.exception_handler(PasswordHasherBusyError)
+    async def password_hasher_busy_handler(
+        request: Request, exc: PasswordHasherBusyError
+    ) -> JSONResponse:
+        return JSONResponse(
+            status_code=503,
+            content={
+                "error": "Authentication is temporarily overloaded, please retry",
+                "path": str(request.url.path),
+                "retry_after": 1,
+            },
+            headers={"Retry-After": "1"},
+        )
+
     @app.exception_handler(SessionExpired)
     async def database_session_expired_handler(
         request: Request, exc: SessionExpired
@@ -52,10 +52,9 @@ from forge.resilience.integration import (
 from forge.security.auth_service import AuthenticationError
 from forge.security.password import (
     PasswordValidationError,
-    hash_password,
     validate_password_strength,
-    verify_password,
 )
+from forge.security.password_hasher import get_password_hasher
 
 router = APIRouter()
 
@@ -850,7 +849,7 @@ async def change_password(
         )
 
     # Verify current password
-    if not verify_password(request.current_password, user_in_db.password_hash):
+    if not await get_password_hasher().verify(request.current_password, user_in_db.password_hash):
         # SECURITY FIX (Audit 2): Log failed password change attempts for security monitoring
         await audit_repo.log_user_action(
             actor_id=user.id,
@@ -864,7 +863,7 @@ async def change_password(
         )
 
     # Update password
-    new_hash = hash_password(request.new_password)
+    new_hash = await get_password_hasher().hash(request.new_password)
     await user_repo.update_password(user.id, new_hash)
 
     # Resilience: Record password change metric
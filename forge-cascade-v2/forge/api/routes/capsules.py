@@ -30,6 +30,7 @@ from forge.api.dependencies import (
     EmbeddingServiceDep,
     EventSystemDep,
     PaginationDep,
+    PaginationParams,
     PipelineDep,
     SandboxUserDep,
     StandardUserDep,
@@ -46,6 +47,7 @@ from forge.models.capsule import (
 )
 from forge.models.events import EventType
 from forge.models.user import KeyStorageStrategy
+from forge.repositories.capsule_repository import CapsuleRepository
 
 # Resilience integration - caching, validation, metrics
 from forge.resilience.integration import (
@@ -282,6 +284,7 @@ class CapsuleListResponse(BaseModel):
     page: int
     per_page: int
     total_pages: int  # Frontend expects total_pages, not pages
+    next_cursor: str | None = None
 
 
 class LineageResponse(BaseModel):
@@ -442,6 +445,51 @@ async def create_capsule(
     return CapsuleResponse.from_capsule(capsule)
 
 
+async def _list_capsule_page(
+    capsule_repo: CapsuleRepository,
+    pagination: PaginationParams,
+    filters: dict[str, Any],
+    cursor: str | None,
+    exact_count: bool,
+) -> CapsuleListResponse:
+    """
+    Build one page of a capsule listing.
+
+    The first page and any cursor request use keyset pagination; numbered
+    pages beyond the first fall back to offset pagination.
+    """
+    next_cursor = None
+    if cursor is None and pagination.page > 1:
+        capsules, total = await capsule_repo.list_capsules(
+            offset=pagination.offset,
+            limit=pagination.per_page,
+            filters=filters,
+            exact_count=exact_count,
+        )
+    else:
+        try:
+            capsules, next_cursor = await capsule_repo.list_capsules_after(
+                cursor=cursor,
+                limit=pagination.per_page,
+                filters=filters,
+            )
+        except ValueError as e:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=str(e),
+            ) from e
+        total = await capsule_repo.count_capsules(filters, exact=exact_count)
+
+    return CapsuleListResponse(
+        items=[CapsuleResponse.from_capsule(c) for c in capsules],
+        total=total,
+        page=pagination.page,
+        per_page=pagination.per_page,
+        total_pages=(total + pagination.per_page - 1) // pagination.per_page,
+        next_cursor=next_cursor,
+    )
+
+
 @router.get("/", response_model=CapsuleListResponse)
 async def list_capsules(
     user: ActiveUserDep,
@@ -450,9 +498,14 @@ async def list_capsules(
     capsule_type: CapsuleType | None = None,
     owner_id: str | None = None,
     tag: str | None = None,
+    cursor: str | None = Query(default=None, max_length=512),
+    exact_count: bool = False,
 ) -> CapsuleListResponse:
     """
     List capsules with optional filtering.
+
+    Pass next_cursor from the previous response as cursor to fetch the
+    next page. Totals are cached unless exact_count is set.
     """
     filters = {}
     if capsule_type:
@@ -462,19 +515,7 @@ async def list_capsules(
     if tag:
         filters["tag"] = tag
 
-    capsules, total = await capsule_repo.list_capsules(
-        offset=pagination.offset,
-        limit=pagination.per_page,
-        filters=filters,
-    )
-
-    return CapsuleListResponse(
-        items=[CapsuleResponse.from_capsule(c) for c in capsules],
-        total=total,
-        page=pagination.page,
-        per_page=pagination.per_page,
-        total_pages=(total + pagination.per_page - 1) // pagination.per_page,
-    )
+    return await _list_capsule_page(capsule_repo, pagination, filters, cursor, exact_count)
 
 
 # =============================================================================
@@ -601,6 +642,8 @@ async def get_capsules_by_owner(
     user: ActiveUserDep,
     capsule_repo: CapsuleRepoDep,
     pagination: PaginationDep,
+    cursor: str | None = Query(default=None, max_length=512),
+    exact_count: bool = False,
 ) -> CapsuleListResponse:
     """
     Get capsules by a specific owner.
@@ -617,18 +660,8 @@ async def get_capsules_by_owner(
             detail="Can only view your own capsules",
         )
 
-    capsules, total = await capsule_repo.list_capsules(
-        offset=pagination.offset,
-        limit=pagination.per_page,
-        filters={"owner_id": owner_id},
-    )
-
-    return CapsuleListResponse(
-        items=[CapsuleResponse.from_capsule(c) for c in capsules],
-        total=total,
-        page=pagination.page,
-        per_page=pagination.per_page,
-        total_pages=(total + pagination.per_page - 1) // pagination.per_page,
+    return await _list_capsule_page(
+        capsule_repo, pagination, {"owner_id": owner_id}, cursor, exact_count
     )
 
 
@@ -50,6 +50,7 @@ from forge.federation.models import (
     FederatedPeer,
     PeerHandshake,
     PeerStatus,
+    SyncCursor,
     SyncDirection,
     SyncOperationStatus,
     SyncPayload,
@@ -58,6 +59,7 @@ from forge.federation.models import (
 from forge.federation.protocol import FederationProtocol
 from forge.federation.sync import SyncService
 from forge.federation.trust import PeerTrustManager
+from forge.models.capsule import Capsule
 from forge.models.user import User
 from forge.repositories.capsule_repository import CapsuleRepository
 
@@ -981,6 +983,8 @@ async def get_changes(
     since: datetime | None = None,
     types: str | None = None,
     limit: int = Query(default=100, ge=1, le=100),  # SECURITY FIX (Audit 5): Reduced from 1000
+    cursor: str | None = Query(default=None, max_length=SyncCursor.MAX_LENGTH),
+    nonce: str | None = None,
     x_forge_signature: str = Header(None),
     x_forge_public_key: str = Header(None),
     protocol: FederationProtocol = Depends(get_protocol),
@@ -988,8 +992,11 @@ async def get_changes(
     capsule_repo: CapsuleRepository = Depends(get_capsule_repository),
 ) -> dict[str, Any]:
     """
-    Get changes for a peer to pull.
+    Get one page of changes for a peer to pull.
     Requires signed request with valid peer public key.
+
+    The response is a signed SyncPayload. While has_more is set, the peer
+    passes next_cursor back as ``cursor`` to resume after this page.
     """
     if not x_forge_signature or not x_forge_public_key:
         raise HTTPException(
@@ -999,11 +1006,16 @@ async def get_changes(
     # Verify the request signature
     import json
 
+    # The signature covers every query parameter the peer sent, nonce included
     params: dict[str, int | str] = {"limit": limit}
     if since:
         params["since"] = since.isoformat()
     if types:
         params["types"] = types
+    if cursor:
+        params["cursor"] = cursor
+    if nonce:
+        params["nonce"] = nonce
 
     request_data = json.dumps(params, sort_keys=True).encode("utf-8")
     if not protocol.verify_signature(request_data, x_forge_signature, x_forge_public_key):
@@ -1030,21 +1042,32 @@ async def get_changes(
     # Parse types if provided
     type_list = types.split(",") if types else None
 
-    # Query capsule changes since timestamp
-    capsules, deleted_ids = await capsule_repo.get_changes_since(
-        since=since,
-        types=type_list,
-        min_trust=peer.min_trust_to_sync,
-        limit=actual_limit + 1,  # +1 to check if there's more
-    )
-
-    # Get edge changes
-    edges = await capsule_repo.get_edges_since(since=since, limit=actual_limit)
+    try:
+        position = SyncCursor.decode(cursor) if cursor else SyncCursor()
+
+        # Capsules and edges are paged independently; a drained stream is skipped
+        capsules: list[Capsule] = []
+        deleted_ids: list[str] = []
+        if not position.capsules_done:
+            capsules, deleted_ids, next_capsules = await capsule_repo.get_change_page(
+                since=since,
+                cursor=position.capsules_after,
+                types=type_list,
+                min_trust=peer.min_trust_to_sync,
+                limit=actual_limit,
+            )
+            position.capsules_after = next_capsules
+            position.capsules_done = next_capsules is None
 
-    # Check if there are more results
-    has_more = len(capsules) > actual_limit
-    if has_more:
-        capsules = capsules[:actual_limit]
+        edges: list[dict[str, Any]] = []
+        if not position.edges_done:
+            edges, next_edges = await capsule_repo.get_edge_page(
+                since=since, cursor=position.edges_after, limit=actual_limit
+            )
+            position.edges_after = next_edges
+            position.edges_done = next_edges is None
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail="Invalid sync cursor") from e
 
     # Convert capsules to dict format for federation
     capsule_dicts = [
@@ -1071,13 +1094,17 @@ async def get_changes(
         f"{len(edges)} edges, {len(deleted_ids)} deletions for peer {peer.name}"
     )
 
-    return {
-        "capsules": capsule_dicts,
-        "edges": edges,
-        "deletions": deleted_ids,
-        "has_more": has_more,
-        "next_cursor": capsules[-1].updated_at.isoformat() if has_more and capsules else None,
-    }
+    has_more = not position.drained
+    payload = await protocol.create_sync_payload(
+        sync_id=str(uuid.uuid4()),
+        peer_id=peer.id,
+        capsules=capsule_dicts,
+        edges=edges,
+        deletions=deleted_ids,
+        has_more=has_more,
+        next_cursor=position.encode() if has_more else None,
+    )
+    return payload.model_dump(mode="json")
 
 
 @router.post("/incoming/capsules", dependencies=[Depends(check_federation_rate_limit)])
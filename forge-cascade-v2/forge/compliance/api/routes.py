@@ -793,10 +793,27 @@ async def get_audit_events(
 @router.get("/audit-chain/verify")
 async def verify_audit_chain(
     user: AdminUserDep,
+    full: bool = Query(
+        True, description="Rehash the whole chain, not just since the last checkpoint"
+    ),
     engine: ComplianceEngine = Depends(get_engine),
 ):
     """Verify audit log chain integrity. Requires: Admin role"""
-    is_valid, message = engine.verify_audit_chain()
+    is_valid, message = engine.verify_audit_chain(full=full)
+    return {
+        "valid": is_valid,
+        "message": message,
+    }
+
+
+@router.get("/audit-chain/verify/{event_id}")
+async def verify_audit_event(
+    event_id: str,
+    user: AdminUserDep,
+    engine: ComplianceEngine = Depends(get_engine),
+):
+    """Verify a single audit event with a Merkle inclusion proof. Requires: Admin role"""
+    is_valid, message = engine.verify_audit_event(event_id)
     return {
         "valid": is_valid,
         "message": message,
@@ -3,12 +3,14 @@ Forge Compliance Framework - Core Module
 
 Core components for the compliance framework including:
 - Configuration
+- Audit ledger
 - Enumerations
 - Models
 - Registry
 - Engine
 """
 
+from forge.compliance.core.audit_ledger import AuditLedger
 from forge.compliance.core.config import ComplianceConfig, get_compliance_config
 from forge.compliance.core.engine import (
     ComplianceEngine,
@@ -55,6 +57,8 @@ from forge.compliance.core.repository import (
 )
 
 __all__ = [
+    # Audit ledger
+    "AuditLedger",
     # Config
     "ComplianceConfig",
     "get_compliance_config",
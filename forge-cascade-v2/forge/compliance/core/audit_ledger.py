@@ -0,0 +1,490 @@
+"""
+Forge Compliance Framework - Audit Ledger
+
+In-memory store for the compliance audit chain:
+- Hash chain: every event carries the hash of its predecessor
+- Merkle tree: an RFC 6962 style tree over the event hashes, grown
+  incrementally, giving O(log n) roots and inclusion proofs
+- Checkpoints: the tree root is recorded every checkpoint_interval
+  events; full verification checks each one against a tree rebuilt from
+  the events, and consistency proofs show a later tree extends it
+- Secondary indexes by actor, entity, category and time for audit queries
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterator
+from dataclasses import dataclass
+from datetime import datetime
+
+from forge.compliance.core.enums import AuditEventCategory
+from forge.compliance.core.models import AuditEvent
+
+# Domain separation prefixes (RFC 6962 section 2.1)
+LEAF_PREFIX = b"\x00"
+NODE_PREFIX = b"\x01"
+
+
+def compute_audit_hash(event: AuditEvent) -> str:
+    """Compute the chain hash of an audit event."""
+    event_data = json.dumps(
+        {
+            "id": event.id,
+            "category": event.category.value
+            if hasattr(event.category, "value")
+            else event.category,
+            "event_type": event.event_type,
+            "action": event.action,
+            "timestamp": event.created_at.isoformat(),
+            "previous_hash": event.previous_hash,
+        },
+        sort_keys=True,
+    )
+    return hashlib.sha256(event_data.encode()).hexdigest()
+
+
+def merkle_leaf(event_hash: str) -> bytes:
+    """Merkle leaf hash for an event hash."""
+    return hashlib.sha256(LEAF_PREFIX + bytes.fromhex(event_hash)).digest()
+
+
+def merkle_node(left: bytes, right: bytes) -> bytes:
+    """Merkle interior node hash."""
+    return hashlib.sha256(NODE_PREFIX + left + right).digest()
+
+
+def verify_inclusion(
+    leaf: bytes,
+    index: int,
+    size: int,
+    proof: list[bytes],
+    root: bytes,
+) -> bool:
+    """
+    Verify a Merkle inclusion proof (RFC 9162 section 2.1.3.2).
+
+    Args:
+        leaf: Merkle leaf hash of the event
+        index: Position of the event in the ledger
+        size: Tree size the proof and root were taken at
+        proof: Sibling hashes from the leaf upwards
+        root: Expected tree root
+
+    Returns:
+        True if the proof places the leaf at index in the tree with this root
+    """
+    if index >= size:
+        return False
+
+    fn, sn = index, size - 1
+    node = leaf
+    for sibling in proof:
+        if sn == 0:
+            return False
+        if fn & 1 or fn == sn:
+            node = merkle_node(sibling, node)
+            while not fn & 1 and fn != 0:
+                fn >>= 1
+                sn >>= 1
+        else:
+            node = merkle_node(node, sibling)
+        fn >>= 1
+        sn >>= 1
+    return sn == 0 and node == root
+
+
+def verify_consistency(
+    old_size: int,
+    new_size: int,
+    proof: list[bytes],
+    old_root: bytes,
+    new_root: bytes,
+) -> bool:
+    """
+    Verify a Merkle consistency proof (RFC 9162 section 2.1.4.2).
+
+    Args:
+        old_size: Size of the earlier tree
+        new_size: Size of the later tree
+        proof: Hashes from AuditLedger.consistency_proof
+        old_root: Root of the earlier tree (e.g. a checkpoint root)
+        new_root: Root of the later tree
+
+    Returns:
+        True if the earlier tree is a prefix of the later one
+    """
+    if old_size == new_size:
+        return not proof and old_root == new_root
+    if not 0 < old_size < new_size or not proof:
+        return False
+
+    if old_size & (old_size - 1) == 0:
+        proof = [old_root, *proof]
+    fn, sn = old_size - 1, new_size - 1
+    while fn & 1:
+        fn >>= 1
+        sn >>= 1
+
+    fr = sr = proof[0]
+    for sibling in proof[1:]:
+        if sn == 0:
+            return False
+        if fn & 1 or fn == sn:
+            fr = merkle_node(sibling, fr)
+            sr = merkle_node(sibling, sr)
+            while not fn & 1 and fn != 0:
+                fn >>= 1
+                sn >>= 1
+        else:
+            sr = merkle_node(sr, sibling)
+        fn >>= 1
+        sn >>= 1
+    return sn == 0 and fr == old_root and sr == new_root
+
+
+def _fold_peaks(peaks: list[tuple[int, bytes]]) -> bytes:
+    """Tree root from its perfect subtrees, largest (leftmost) first."""
+    root = peaks[-1][1]
+    for _, node in reversed(peaks[:-1]):
+        root = merkle_node(node, root)
+    return root
+
+
+@dataclass(frozen=True)
+class MerkleCheckpoint:
+    """Tree root recorded after the first size events."""
+
+    size: int
+    root: bytes
+    last_hash: str | None
+
+
+@dataclass(frozen=True)
+class InclusionProof:
+    """Proof that an event is part of the ledger at a given size."""
+
+    event_id: str
+    index: int
+    size: int
+    leaf: bytes
+    proof: list[bytes]
+    root: bytes
+
+    def verify(self) -> bool:
+        """Check the proof against its own root."""
+        return verify_inclusion(self.leaf, self.index, self.size, self.proof, self.root)
+
+
+class AuditLedger:
+    """
+    Append-only, indexed audit event store with Merkle checkpoints.
+
+    Tree nodes are kept per level: level k holds the hash of every complete,
+    aligned block of 2**k leaves, so any subtree used by the RFC 6962 tree
+    shape is either stored or is the fold of at most log n stored blocks.
+    """
+
+    def __init__(self, checkpoint_interval: int = 1024):
+        self._checkpoint_interval = checkpoint_interval
+        self._events: list[AuditEvent] = []
+        self._positions: dict[str, int] = {}
+        self._levels: list[list[bytes]] = [[]]
+        self._checkpoints: list[MerkleCheckpoint] = []
+
+        # Secondary indexes: key -> ascending event positions
+        self._by_actor: dict[str, list[int]] = {}
+        self._by_entity_type: dict[str, list[int]] = {}
+        self._by_entity_id: dict[str, list[int]] = {}
+        self._by_category: dict[AuditEventCategory, list[int]] = {}
+        self._times: list[datetime] = []
+        # Cleared if the clock steps back; time filters then fall back to a scan
+        self._time_ordered = True
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+    def __iter__(self) -> Iterator[AuditEvent]:
+        return iter(self._events)
+
+    @property
+    def checkpoints(self) -> list[MerkleCheckpoint]:
+        """Recorded checkpoints, oldest first."""
+        return list(self._checkpoints)
+
+    def append(self, event: AuditEvent) -> None:
+        """Add an event, update the tree and indexes, and checkpoint if due."""
+        index = len(self._events)
+        self._events.append(event)
+        self._positions[event.id] = index
+
+        self._add_leaf(merkle_leaf(compute_audit_hash(event)))
+
+        if event.actor_id:
+            self._by_actor.setdefault(event.actor_id, []).append(index)
+        if event.entity_type:
+            self._by_entity_type.setdefault(event.entity_type, []).append(index)
+        if event.entity_id:
+            self._by_entity_id.setdefault(event.entity_id, []).append(index)
+        self._by_category.setdefault(event.category, []).append(index)
+        if self._times and event.created_at < self._times[-1]:
+            self._time_ordered = False
+        self._times.append(event.created_at)
+
+        if len(self._events) % self._checkpoint_interval == 0:
+            self._checkpoints.append(
+                MerkleCheckpoint(
+                    size=len(self._events),
+                    root=self.root(),
+                    last_hash=event.hash,
+                )
+            )
+
+    # ═══════════════════════════════════════════════════════════════
+    # Queries
+    # ═══════════════════════════════════════════════════════════════
+
+    def get(self, event_id: str) -> AuditEvent | None:
+        """Get an event by ID."""
+        index = self._positions.get(event_id)
+        return self._events[index] if index is not None else None
+
+    def query(
+        self,
+        start_date: datetime | None = None,
+        end_date: datetime | None = None,
+        category: AuditEventCategory | None = None,
+        actor_id: str | None = None,
+        entity_type: str | None = None,
+        entity_id: str | None = None,
+        limit: int = 100,
+    ) -> list[AuditEvent]:
+        """
+        Get the most recent events matching all filters, oldest first.
+
+        Candidates come from the smallest matching index, narrowed to the
+        time window by bisection, and are scanned newest first until limit
+        matches are found.
+        """
+        candidates: list[list[int]] = []
+        if category:
+            candidates.append(self._by_category.get(category, []))
+        if actor_id:
+            candidates.append(self._by_actor.get(actor_id, []))
+        if entity_type:
+            candidates.append(self._by_entity_type.get(entity_type, []))
+        if entity_id:
+            candidates.append(self._by_entity_id.get(entity_id, []))
+
+        lo, hi = 0, len(self._events)
+        if self._time_ordered:
+            if start_date:
+                lo = bisect_left(self._times, start_date)
+            if end_date:
+                hi = bisect_right(self._times, end_date)
+
+        positions: list[int] | range
+        if candidates:
+            smallest = min(candidates, key=len)
+            positions = smallest[bisect_left(smallest, lo) : bisect_left(smallest, hi)]
+        else:
+            positions = range(lo, hi)
+
+        matches: list[AuditEvent] = []
+        for index in reversed(positions):
+            if len(matches) >= limit:
+                break
+            event = self._events[index]
+            if start_date and event.created_at < start_date:
+                continue
+            if end_date and event.created_at > end_date:
+                continue
+            if category and event.category != category:
+                continue
+            if actor_id and event.actor_id != actor_id:
+                continue
+            if entity_type and event.entity_type != entity_type:
+                continue
+            if entity_id and event.entity_id != entity_id:
+                continue
+            matches.append(event)
+
+        matches.reverse()
+        return matches
+
+    # ═══════════════════════════════════════════════════════════════
+    # Merkle Tree
+    # ═══════════════════════════════════════════════════════════════
+
+    def root(self, size: int | None = None) -> bytes:
+        """Tree root over the first size events (default: all)."""
+        size = len(self._events) if size is None else size
+        if size == 0:
+            return hashlib.sha256(b"").digest()
+        return self._subtree(0, size)
+
+    def inclusion_proof(self, event_id: str) -> InclusionProof | None:
+        """Build an O(log n) inclusion proof for an event at the current size."""
+        index = self._positions.get(event_id)
+        if index is None:
+            return None
+        size = len(self._events)
+        return InclusionProof(
+            event_id=event_id,
+            index=index,
+            size=size,
+            leaf=self._levels[0][index],
+            proof=self._path(index, 0, size),
+            root=self.root(size),
+        )
+
+    def consistency_proof(self, old_size: int, new_size: int | None = None) -> list[bytes]:
+        """
+        Proof that the tree at old_size is a prefix of the tree at new_size
+        (RFC 6962 section 2.1.2), e.g. that a checkpoint is still honoured.
+        """
+        new_size = len(self._events) if new_size is None else new_size
+        if not 0 < old_size <= new_size <= len(self._events):
+            raise ValueError(f"Invalid consistency range {old_size}..{new_size}")
+        if old_size == new_size:
+            return []
+        return self._subproof(old_size, 0, new_size, True)
+
+    def _subproof(self, old_size: int, start: int, size: int, complete: bool) -> list[bytes]:
+        """RFC 6962 SUBPROOF over leaves [start, start + size)."""
+        if old_size == size:
+            return [] if complete else [self._subtree(start, size)]
+        split = 1 << ((size - 1).bit_length() - 1)
+        if old_size <= split:
+            return self._subproof(old_size, start, split, complete) + [
+                self._subtree(start + split, size - split)
+            ]
+        return self._subproof(old_size - split, start + split, size - split, False) + [
+            self._subtree(start, split)
+        ]
+
+    def _add_leaf(self, leaf: bytes) -> None:
+        self._levels[0].append(leaf)
+        level = 0
+        # Each even-length level has just completed a pair
+        while len(self._levels[level]) % 2 == 0:
+            nodes = self._levels[level]
+            if level + 1 == len(self._levels):
+                self._levels.append([])
+            self._levels[level + 1].append(merkle_node(nodes[-2], nodes[-1]))
+            level += 1
+
+    def _subtree(self, start: int, size: int) -> bytes:
+        """Hash of the RFC 6962 subtree over leaves [start, start + size)."""
+        if size & (size - 1) == 0:
+            # Complete, aligned block: stored
+            return self._levels[size.bit_length() - 1][start // size]
+        split = 1 << ((size - 1).bit_length() - 1)
+        return merkle_node(self._subtree(start, split), self._subtree(start + split, size - split))
+
+    def _path(self, index: int, start: int, size: int) -> list[bytes]:
+        """Sibling hashes for leaf index within the subtree [start, start + size)."""
+        if size == 1:
+            return []
+        split = 1 << ((size - 1).bit_length() - 1)
+        if index < start + split:
+            return self._path(index, start, split) + [self._subtree(start + split, size - split)]
+        return self._path(index, start + split, size - split) + [self._subtree(start, split)]
+
+    # ═══════════════════════════════════════════════════════════════
+    # Verification
+    # ═══════════════════════════════════════════════════════════════
+
+    def verify(self, full: bool = True) -> tuple[bool, str]:
+        """
+        Verify chain integrity.
+
+        Full mode rehashes every event, checks the chain links, and rebuilds
+        the tree from the rehashed leaves to compare against every recorded
+        checkpoint root, so an event modified in place is always detected.
+
+        Incremental mode rehashes only the events appended since the last
+        checkpoint and checks the stored tree against that checkpoint. It
+        catches tampering with recent events and with the tree itself, but
+        not an in-place change to an event the checkpoint already covers.
+
+        Returns:
+            (is_valid, message)
+        """
+        if not self._events:
+            return True, "No events to verify"
+
+        checkpoint = self._checkpoints[-1] if self._checkpoints and not full else None
+        if checkpoint is not None:
+            if self.root(checkpoint.size) != checkpoint.root:
+                return False, f"Merkle root mismatch at checkpoint {checkpoint.size}"
+            start, previous_hash = checkpoint.size, checkpoint.last_hash
+        else:
+            # The first in-memory event continues the persisted chain
+            start, previous_hash = 0, self._events[0].previous_hash
+
+        # Perfect subtrees (size, hash) of the rebuilt tree, largest first
+        peaks: list[tuple[int, bytes]] = []
+        pending = iter(self._checkpoints if checkpoint is None else ())
+        next_checkpoint = next(pending, None)
+
+        for index in range(start, len(self._events)):
+            event = self._events[index]
+            if event.previous_hash != previous_hash:
+                return False, f"Chain broken at event {event.id}"
+
+            calculated_hash = compute_audit_hash(event)
+            leaf = merkle_leaf(calculated_hash)
+            if event.hash != calculated_hash or self._levels[0][index] != leaf:
+                return False, f"Hash mismatch at event {event.id}"
+            previous_hash = event.hash
+
+            if checkpoint is None:
+                peaks.append((1, leaf))
+                while len(peaks) > 1 and peaks[-1][0] == peaks[-2][0]:
+                    (size, right), (_, left) = peaks.pop(), peaks.pop()
+                    peaks.append((size * 2, merkle_node(left, right)))
+                if next_checkpoint is not None and next_checkpoint.size == index + 1:
+                    if _fold_peaks(peaks) != next_checkpoint.root:
+                        return False, f"Merkle root mismatch at checkpoint {next_checkpoint.size}"
+                    next_checkpoint = next(pending, None)
+
+        if checkpoint is None:
+            return True, f"Chain verified: {len(self._events)} events"
+        return True, (
+            f"Chain verified: {len(self._events)} events "
+            f"({len(self._events) - start} since checkpoint)"
+        )
+
+    def verify_event(self, event_id: str) -> tuple[bool, str]:
+        """
+        Verify a single event against the tree in O(log n).
+
+        Returns:
+            (is_valid, message)
+        """
+        proof = self.inclusion_proof(event_id)
+        if proof is None:
+            return False, f"Event {event_id} not found"
+
+        event = self._events[proof.index]
+        calculated_hash = compute_audit_hash(event)
+        if event.hash != calculated_hash or proof.leaf != merkle_leaf(calculated_hash):
+            return False, f"Hash mismatch at event {event_id}"
+        if proof.index > 0 and event.previous_hash != self._events[proof.index - 1].hash:
+            return False, f"Chain broken at event {event_id}"
+        if not proof.verify():
+            return False, f"Inclusion proof failed for event {event_id}"
+
+        checkpoint = self._covering_checkpoint(proof.index)
+        if checkpoint is not None and self.root(checkpoint.size) != checkpoint.root:
+            return False, f"Merkle root mismatch at checkpoint {checkpoint.size}"
+
+        return True, f"Event {event_id} verified at position {proof.index} of {proof.size}"
+
+    def _covering_checkpoint(self, index: int) -> MerkleCheckpoint | None:
+        """First checkpoint that includes the event at index."""
+        position = index // self._checkpoint_interval
+        return self._checkpoints[position] if position < len(self._checkpoints) else None
@@ -246,6 +246,14 @@ class ComplianceConfig(BaseSettings):
         description="Enable cryptographic audit log chaining",
     )
 
+    # Merkle checkpoints (incremental verification rehashes only events since the last one)
+    audit_checkpoint_interval: int = Field(
+        default=1024,
+        ge=1,
+        le=1_000_000,
+        description="Audit events between Merkle checkpoints",
+    )
+
     # Real-time SIEM integration
     siem_enabled: bool = Field(
         default=False,
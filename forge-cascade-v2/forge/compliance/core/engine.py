@@ -14,7 +14,6 @@ from __future__ import annotations
 
 import asyncio
 import hashlib
-import json
 from collections.abc import Callable
 from datetime import UTC, datetime, timedelta
 from typing import TYPE_CHECKING, Any
@@ -25,6 +24,7 @@ if TYPE_CHECKING:
 
 import structlog
 
+from forge.compliance.core.audit_ledger import AuditLedger, compute_audit_hash
 from forge.compliance.core.config import ComplianceConfig, get_compliance_config
 from forge.compliance.core.enums import (
     AIRiskClassification,
@@ -84,7 +84,7 @@ class ComplianceEngine:
         self._dsars: dict[str, DataSubjectRequest] = {}
         self._consents: dict[str, list[ConsentRecord]] = {}  # user_id -> consents
         self._breaches: dict[str, BreachNotification] = {}
-        self._audit_events: list[AuditEvent] = []
+        self._audit_ledger = AuditLedger(checkpoint_interval=self.config.audit_checkpoint_interval)
         self._ai_systems: dict[str, AISystemRegistration] = {}
         self._ai_decisions: list[AIDecisionLog] = []
 
@@ -180,24 +180,11 @@ class ComplianceEngine:
 
         # Calculate hash for chain integrity
         if self.config.audit_immutable:
-            event_data = json.dumps(
-                {
-                    "id": event.id,
-                    "category": event.category.value
-                    if hasattr(event.category, "value")
-                    else event.category,
-                    "event_type": event.event_type,
-                    "action": event.action,
-                    "timestamp": event.created_at.isoformat(),
-                    "previous_hash": event.previous_hash,
-                },
-                sort_keys=True,
-            )
-            event.hash = hashlib.sha256(event_data.encode()).hexdigest()
+            event.hash = compute_audit_hash(event)
             self._last_audit_hash = event.hash
 
-        # Store event in memory cache
-        self._audit_events.append(event)
+        # Store event in the indexed in-memory ledger
+        self._audit_ledger.append(event)
 
         # PERSISTENCE FIX: Persist to database (append-only)
         if self._persistence_enabled and self._repository:
@@ -257,57 +244,30 @@ class ComplianceEngine:
         entity_id: str | None = None,
         limit: int = 100,
     ) -> list[AuditEvent]:
-        """Query audit events with filters."""
-        events = self._audit_events
-
-        if start_date:
-            events = [e for e in events if e.created_at >= start_date]
-        if end_date:
-            events = [e for e in events if e.created_at <= end_date]
-        if category:
-            events = [e for e in events if e.category == category]
-        if actor_id:
-            events = [e for e in events if e.actor_id == actor_id]
-        if entity_type:
-            events = [e for e in events if e.entity_type == entity_type]
-        if entity_id:
-            events = [e for e in events if e.entity_id == entity_id]
-
-        return events[-limit:]
-
-    def verify_audit_chain(self) -> tuple[bool, str]:
-        """Verify audit log chain integrity."""
-        if not self._audit_events:
-            return True, "No events to verify"
-
-        previous_hash = None
-        for event in self._audit_events:
-            # Verify previous hash pointer
-            if event.previous_hash != previous_hash:
-                return False, f"Chain broken at event {event.id}"
-
-            # Verify hash calculation
-            event_data = json.dumps(
-                {
-                    "id": event.id,
-                    "category": event.category.value
-                    if hasattr(event.category, "value")
-                    else event.category,
-                    "event_type": event.event_type,
-                    "action": event.action,
-                    "timestamp": event.created_at.isoformat(),
-                    "previous_hash": event.previous_hash,
-                },
-                sort_keys=True,
-            )
-            calculated_hash = hashlib.sha256(event_data.encode()).hexdigest()
+        """Query audit events with filters (most recent limit matches, oldest first)."""
+        return self._audit_ledger.query(
+            start_date=start_date,
+            end_date=end_date,
+            category=category,
+            actor_id=actor_id,
+            entity_type=entity_type,
+            entity_id=entity_id,
+            limit=limit,
+        )
 
-            if event.hash != calculated_hash:
-                return False, f"Hash mismatch at event {event.id}"
+    def verify_audit_chain(self, full: bool = True) -> tuple[bool, str]:
+        """
+        Verify audit log chain integrity.
 
-            previous_hash = event.hash
+        By default every event is rehashed and checked against the Merkle
+        checkpoints; full=False rehashes only events since the last
+        checkpoint and does not detect in-place changes to older events.
+        """
+        return self._audit_ledger.verify(full=full)
 
-        return True, f"Chain verified: {len(self._audit_events)} events"
+    def verify_audit_event(self, event_id: str) -> tuple[bool, str]:
+        """Verify a single audit event with a Merkle inclusion proof."""
+        return self._audit_ledger.verify_event(event_id)
 
     # ═══════════════════════════════════════════════════════════════
     # DATA SUBJECT REQUESTS (DSAR)
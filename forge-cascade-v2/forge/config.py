@@ -94,12 +94,52 @@ class Settings(BaseSettings):
         default=30, ge=1, description="Connection timeout in seconds"
     )
 
+    # Streaming and bulk writes
+    neo4j_fetch_size: int = Field(
+        default=1000, ge=1, description="Records pulled per round trip when streaming"
+    )
+    neo4j_write_batch_size: int = Field(
+        default=1000, ge=1, description="Initial rows per UNWIND batch for bulk writes"
+    )
+
+    # Read/write routing
+    neo4j_route_reads: bool = Field(
+        default=True,
+        description="Send read-only queries to READ sessions (cluster followers)",
+    )
+
+    # Audit write-behind
+    audit_write_behind_enabled: bool = Field(
+        default=False,
+        description="Queue audit events and group-commit them (requires audit_journal_dir)",
+    )
+    audit_batch_size: int = Field(default=500, ge=1, description="Max audit events per commit")
+    audit_flush_interval_ms: int = Field(
+        default=200, ge=1, description="Max time an audit event waits for its batch"
+    )
+    audit_queue_max_size: int = Field(
+        default=10000, ge=1, description="Queued audit events before callers wait"
+    )
+    audit_journal_dir: str | None = Field(
+        default=None,
+        validate_default=True,
+        description="Local journal directory for audit crash recovery",
+    )
+
     # ═══════════════════════════════════════════════════════════════
     # REDIS CACHE (Optional)
     # ═══════════════════════════════════════════════════════════════
     redis_url: str | None = Field(default=None, description="Redis URL")
     redis_password: str | None = Field(default=None, description="Redis password")
     cache_ttl_seconds: int = Field(default=3600, ge=0, description="Cache TTL")
+    capsule_count_cache_ttl_seconds: int = Field(
+        default=300, ge=0, description="Max age of cached capsule list totals"
+    )
+    version_cache_max_bytes: int = Field(
+        default=64 * 1024 * 1024,
+        ge=0,
+        description="Memory budget for reconstructed capsule versions (0 disables)",
+    )
 
     # ═══════════════════════════════════════════════════════════════
     # SECURITY
@@ -120,6 +160,15 @@ class Settings(BaseSettings):
         default=7, ge=1, le=30, description="Refresh token expiry (max 30 days)"
     )
     password_bcrypt_rounds: int = Field(default=12, ge=4, le=31, description="Bcrypt rounds")
+    password_hash_workers: int = Field(
+        default=4, ge=1, le=64, description="Threads hashing and verifying passwords"
+    )
+    password_hash_max_pending: int = Field(
+        default=64,
+        ge=1,
+        le=10000,
+        description="Queued or running password operations before new ones are shed",
+    )
     # SECURITY FIX (Audit 6): Password history to prevent password reuse
     password_history_count: int = Field(
         default=5, ge=1, le=24, description="Number of previous passwords to remember"
@@ -155,6 +204,25 @@ class Settings(BaseSettings):
     token_version_cache_ttl_seconds: int = Field(
         default=60, ge=10, le=300, description="TTL for token version cache (Redis/in-memory)"
     )
+    verified_token_cache_ttl_seconds: int = Field(
+        default=30,
+        ge=0,
+        le=300,
+        description="How long a verified access token skips signature checks (0 disables)",
+    )
+    verified_token_cache_max_entries: int = Field(
+        default=10000, ge=100, le=1000000, description="Max verified access tokens cached"
+    )
+    token_blacklist_local_filter: bool = Field(
+        default=True,
+        description="Check revocations against a local Bloom filter synced over Redis pub/sub",
+    )
+    token_blacklist_filter_capacity: int = Field(
+        default=100000,
+        ge=1000,
+        le=10000000,
+        description="Revoked tokens the local filter sizes for",
+    )
 
     # SECURITY FIX (Audit 6 - Session 2): Session binding settings for IP/User-Agent tracking
     session_ip_binding_mode: Literal["disabled", "log_only", "warn", "flexible", "strict"] = Field(
@@ -277,6 +345,52 @@ class Settings(BaseSettings):
     embedding_cache_size: int = Field(
         default=50000, ge=1000, description="Max embedding cache entries"
     )
+    embedding_cache_max_mb: int = Field(
+        default=256, ge=1, description="Memory budget for cached embeddings in MB"
+    )
+    embedding_cache_path: str | None = Field(
+        default=None, description="SQLite file for a persistent embedding cache tier"
+    )
+    embedding_coalesce_window_ms: float = Field(
+        default=2.0, ge=0.0, description="Window for merging concurrent embed calls"
+    )
+    embedding_coalesce_max_batch: int = Field(
+        default=64, ge=1, description="Max texts per coalesced embedding batch"
+    )
+
+    # In-process vector index (requires numpy; Neo4j stays the source of truth)
+    vector_index_enabled: bool = Field(
+        default=False, description="Serve semantic search from an in-process ANN index"
+    )
+    vector_index_path: str | None = Field(
+        default=None, description="File the vector index is loaded from and saved to"
+    )
+    vector_index_nprobe: int = Field(
+        default=8, ge=1, description="IVF lists scanned per vector index query"
+    )
+    text_index_enabled: bool = Field(
+        default=False, description="Serve keyword search from an in-process BM25 index"
+    )
+
+    # PrimeKG adjacency snapshot (build with scripts/build_primekg_adjacency.py)
+    primekg_adjacency_path: str | None = Field(
+        default=None, description="Directory of the memory-mapped PrimeKG adjacency snapshot"
+    )
+    # The snapshot is built from the import CSVs and never sees later writes
+    # to Neo4j, so by default it is only trusted for a day after its build
+    primekg_adjacency_max_age_hours: float = Field(
+        default=24.0,
+        ge=0.0,
+        description="Age after which the PrimeKG snapshot is ignored (0 = no limit)",
+    )
+
+    @field_validator("audit_journal_dir")
+    @classmethod
+    def validate_audit_journal_dir(cls, v: str | None, info: ValidationInfo) -> str | None:
+        """Queued audit events are lost on a crash unless they are journaled."""
+        if v is None and info.data.get("audit_write_behind_enabled"):
+            raise ValueError("audit_journal_dir is required when audit write-behind is enabled")
+        return v
 
     @field_validator("llm_api_key")
     @classmethod
@@ -430,6 +544,16 @@ class Settings(BaseSettings):
         default=3, ge=1, description="Failures before quarantine"
     )
 
+    # ═══════════════════════════════════════════════════════════════
+    # EVENT BUS
+    # ═══════════════════════════════════════════════════════════════
+    event_bus_shards: int = Field(
+        default=1, ge=1, le=64, description="Number of event dispatch worker shards"
+    )
+    event_bus_partition_key: Literal["correlation_id", "capsule_id", "event_type"] = Field(
+        default="correlation_id", description="Key used to route events to shards"
+    )
+
     # ═══════════════════════════════════════════════════════════════
     # PIPELINE
     # ═══════════════════════════════════════════════════════════════
@@ -5,12 +5,27 @@ Async wrapper for Neo4j Python driver with connection pooling,
 transaction management, and retry logic.
 """
 
-from collections.abc import AsyncGenerator
+import asyncio
+import re
+import time
+from collections.abc import AsyncGenerator, AsyncIterable, Iterable
 from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from functools import lru_cache
+from types import TracebackType
 from typing import Any
 
 import structlog
-from neo4j import AsyncDriver, AsyncGraphDatabase, AsyncSession, AsyncTransaction
+from neo4j import (
+    READ_ACCESS,
+    WRITE_ACCESS,
+    AsyncDriver,
+    AsyncGraphDatabase,
+    AsyncManagedTransaction,
+    AsyncSession,
+    AsyncTransaction,
+    ResultSummary,
+)
 from neo4j.exceptions import (
     ServiceUnavailable,
     SessionExpired,
@@ -32,12 +47,98 @@ logger = structlog.get_logger(__name__)
 RETRYABLE_EXCEPTIONS = (ServiceUnavailable, SessionExpired, TransientError)
 
 
+def _summary_counters(summary: ResultSummary) -> dict[str, int]:
+    """Extract write counters from a result summary."""
+    return {
+        "nodes_created": summary.counters.nodes_created,
+        "nodes_deleted": summary.counters.nodes_deleted,
+        "relationships_created": summary.counters.relationships_created,
+        "relationships_deleted": summary.counters.relationships_deleted,
+        "properties_set": summary.counters.properties_set,
+    }
+
+
+# Clauses that make a query a write. Over-matching (e.g. a keyword inside a
+# string literal) only sends a read to the leader, which is always safe.
+_WRITE_CLAUSES = re.compile(
+    r"\b(?:CREATE|MERGE|SET|DELETE|REMOVE|DROP|FOREACH|LOAD\s+CSV|IN\s+TRANSACTIONS)\b",
+    re.IGNORECASE,
+)
+_PROCEDURE_CALL = re.compile(r"\bCALL\s+([A-Za-z_][\w.]*)", re.IGNORECASE)
+
+# Procedures known to be read-only. Anything else (GDS projections and
+# writes, APOC mutations) stays on the leader.
+_READ_ONLY_PROCEDURES = (
+    "db.index.",
+    "db.labels",
+    "db.relationshiptypes",
+    "db.propertykeys",
+    "db.schema.",
+    "dbms.components",
+)
+
+
+@lru_cache(maxsize=2048)
+def is_read_only_query(query: str) -> bool:
+    """
+    Check whether a Cypher query can run in a READ session.
+
+    Args:
+        query: Cypher query string
+
+    Returns:
+        True if the query contains no write clauses or unknown procedures
+    """
+    if _WRITE_CLAUSES.search(query):
+        return False
+    return all(
+        name.lower().startswith(_READ_ONLY_PROCEDURES) for name in _PROCEDURE_CALL.findall(query)
+    )
+
+
+@dataclass
+class RouteMetrics:
+    """Session metrics for one access mode (READ or WRITE)."""
+
+    route: str
+    sessions_opened: int = 0
+    active_sessions: int = 0
+    peak_active_sessions: int = 0
+    errors: int = 0
+    total_session_ms: float = 0.0
+
+    def opened(self) -> None:
+        """Record a session being checked out."""
+        self.sessions_opened += 1
+        self.active_sessions += 1
+        if self.active_sessions > self.peak_active_sessions:
+            self.peak_active_sessions = self.active_sessions
+
+    def closed(self, elapsed_ms: float, failed: bool) -> None:
+        """Record a session being returned to the pool."""
+        self.active_sessions -= 1
+        self.total_session_ms += elapsed_ms
+        if failed:
+            self.errors += 1
+
+    @property
+    def avg_session_ms(self) -> float:
+        completed = self.sessions_opened - self.active_sessions
+        if not completed:
+            return 0.0
+        return self.total_session_ms / completed
+
+
 class Neo4jClient:
     """
     Async Neo4j client for Forge.
 
     Provides connection pooling, transaction management,
     and helper methods for common operations.
+
+    Read-only queries run in READ sessions, which a routing driver
+    (neo4j:// URI) sends to cluster followers. All sessions share one
+    bookmark manager, so a read always observes the client's earlier writes.
     """
 
     def __init__(
@@ -60,9 +161,17 @@ class Neo4jClient:
         self._user = user or settings.neo4j_user
         self._password = password or settings.neo4j_password
         self._database = database or settings.neo4j_database
+        self._fetch_size = settings.neo4j_fetch_size
+        self._write_batch_size = settings.neo4j_write_batch_size
+        self._route_reads = settings.neo4j_route_reads
 
         self._driver: AsyncDriver | None = None
         self._connected = False
+        self._bookmarks = AsyncGraphDatabase.bookmark_manager()
+        self._route_metrics = {
+            READ_ACCESS: RouteMetrics(READ_ACCESS),
+            WRITE_ACCESS: RouteMetrics(WRITE_ACCESS),
+        }
 
     async def connect(self) -> None:
         """Establish connection to Neo4j."""
@@ -127,21 +236,60 @@ class Neo4jClient:
             raise RuntimeError("Neo4j client not connected. Call connect() first.")
         return self._driver
 
+    def _resolve_access_mode(self, query: str, access_mode: str | None) -> str:
+        """Pick the session access mode for a query."""
+        if access_mode is not None:
+            return access_mode
+        if self._route_reads and is_read_only_query(query):
+            return READ_ACCESS
+        return WRITE_ACCESS
+
     @asynccontextmanager
-    async def session(self) -> AsyncGenerator[AsyncSession, None]:
+    async def session(
+        self,
+        access_mode: str = WRITE_ACCESS,
+        fetch_size: int | None = None,
+    ) -> AsyncGenerator[AsyncSession, None]:
         """
         Get a Neo4j session.
 
         Usage:
             async with client.session() as session:
                 result = await session.run("MATCH (n) RETURN n")
+
+        Args:
+            access_mode: READ_ACCESS or WRITE_ACCESS (default WRITE_ACCESS)
+            fetch_size: Records per round trip (driver default if None)
         """
+        if access_mode not in self._route_metrics:
+            raise ValueError(f"Unknown access mode: {access_mode!r}")
         driver = self._get_driver()
-        async with driver.session(database=self._database) as session:
-            yield session
+        options: dict[str, Any] = {
+            "database": self._database,
+            "default_access_mode": access_mode,
+            "bookmark_manager": self._bookmarks,
+        }
+        if fetch_size is not None:
+            options["fetch_size"] = fetch_size
+
+        metrics = self._route_metrics[access_mode]
+        metrics.opened()
+        start = time.perf_counter()
+        failed = False
+        try:
+            async with driver.session(**options) as session:
+                yield session
+        except Exception:  # Intentional broad catch: counted as a route error, then re-raised
+            failed = True
+            raise
+        finally:
+            metrics.closed((time.perf_counter() - start) * 1000, failed)
 
     @asynccontextmanager
-    async def transaction(self) -> AsyncGenerator[AsyncTransaction, None]:
+    async def transaction(
+        self,
+        access_mode: str = WRITE_ACCESS,
+    ) -> AsyncGenerator[AsyncTransaction, None]:
         """
         Get a Neo4j transaction.
 
@@ -151,8 +299,11 @@ class Neo4jClient:
 
         Note: Transaction commits automatically on successful context exit.
         Rollback happens automatically on exception.
+
+        Args:
+            access_mode: READ_ACCESS or WRITE_ACCESS (default WRITE_ACCESS)
         """
-        async with self.session() as session:
+        async with self.session(access_mode) as session:
             tx = await session.begin_transaction()
             try:
                 yield tx
@@ -176,6 +327,7 @@ class Neo4jClient:
         query: str,
         parameters: dict[str, Any] | None = None,
         timeout: float | None = None,
+        access_mode: str | None = None,
     ) -> list[dict[str, Any]]:
         """
         Execute a Cypher query and return results.
@@ -186,11 +338,13 @@ class Neo4jClient:
             timeout: Optional query timeout in seconds. When set, the server
                      will terminate the query if it runs longer than this.
                      None means no timeout (use server default).
+            access_mode: Session access mode; None routes read-only
+                     queries to READ sessions and everything else to WRITE.
 
         Returns:
             List of result records as dictionaries
         """
-        async with self.session() as session:
+        async with self.session(self._resolve_access_mode(query, access_mode)) as session:
             result = await session.run(query, parameters or {}, timeout=timeout)
             records = [dict(record) async for record in result]
             return records
@@ -205,6 +359,7 @@ class Neo4jClient:
         query: str,
         parameters: dict[str, Any] | None = None,
         timeout: float | None = None,
+        access_mode: str | None = None,
     ) -> dict[str, Any] | None:
         """
         Execute a query and return a single result.
@@ -215,11 +370,13 @@ class Neo4jClient:
             timeout: Optional query timeout in seconds. When set, the server
                      will terminate the query if it runs longer than this.
                      None means no timeout (use server default).
+            access_mode: Session access mode; None routes read-only
+                     queries to READ sessions and everything else to WRITE.
 
         Returns:
             Single result record or None
         """
-        async with self.session() as session:
+        async with self.session(self._resolve_access_mode(query, access_mode)) as session:
             result = await session.run(query, parameters or {}, timeout=timeout)
             record = await result.single()
             return dict(record) if record else None
@@ -251,13 +408,126 @@ class Neo4jClient:
         async with self.session() as session:
             result = await session.run(query, parameters or {}, timeout=timeout)
             summary = await result.consume()
-            return {
-                "nodes_created": summary.counters.nodes_created,
-                "nodes_deleted": summary.counters.nodes_deleted,
-                "relationships_created": summary.counters.relationships_created,
-                "relationships_deleted": summary.counters.relationships_deleted,
-                "properties_set": summary.counters.properties_set,
-            }
+            return _summary_counters(summary)
+
+    async def stream(
+        self,
+        query: str,
+        parameters: dict[str, Any] | None = None,
+        fetch_size: int | None = None,
+        timeout: float | None = None,
+        access_mode: str | None = None,
+    ) -> AsyncGenerator[dict[str, Any], None]:
+        """
+        Stream query results record by record.
+
+        Records are pulled from the server fetch_size at a time, and the
+        next batch is only requested once the consumer has drained the
+        current one, so memory stays bounded regardless of result size.
+        Not retried: a stream cannot be replayed once records were yielded.
+
+        Usage:
+            async with aclosing(client.stream(query, params)) as records:
+                async for record in records:
+                    ...
+
+        Wrapping in contextlib.aclosing releases the session promptly if
+        the consumer stops early.
+
+        Args:
+            query: Cypher query string
+            parameters: Query parameters
+            fetch_size: Records per round trip (defaults to settings)
+            timeout: Optional query timeout in seconds
+            access_mode: Session access mode; None routes by query
+
+        Yields:
+            Result records as dictionaries
+        """
+        async with self.session(
+            self._resolve_access_mode(query, access_mode),
+            fetch_size=fetch_size or self._fetch_size,
+        ) as session:
+            result = await session.run(query, parameters or {}, timeout=timeout)
+            async for record in result:
+                yield dict(record)
+
+    def bulk_writer(
+        self,
+        query: str,
+        parameters: dict[str, Any] | None = None,
+        batch_size: int | None = None,
+        target_batch_seconds: float | None = 1.0,
+    ) -> "Neo4jBulkWriter":
+        """
+        Create a bulk writer that flushes rows through UNWIND $rows.
+
+        Usage:
+            async with client.bulk_writer(
+                "UNWIND $rows AS row MERGE (n:Node {id: row.id}) SET n += row"
+            ) as writer:
+                for row in rows:
+                    await writer.add(row)
+
+        Args:
+            query: Cypher query consuming the $rows list parameter
+            parameters: Extra parameters passed with every batch
+            batch_size: Initial rows per batch (defaults to settings)
+            target_batch_seconds: Batch duration to tune towards; None
+                keeps the batch size fixed
+
+        Returns:
+            Unstarted Neo4jBulkWriter
+        """
+        return Neo4jBulkWriter(
+            self,
+            query,
+            parameters=parameters,
+            batch_size=batch_size or self._write_batch_size,
+            target_batch_seconds=target_batch_seconds,
+        )
+
+    async def write_rows(
+        self,
+        query: str,
+        rows: Iterable[dict[str, Any]] | AsyncIterable[dict[str, Any]],
+        parameters: dict[str, Any] | None = None,
+        batch_size: int | None = None,
+    ) -> dict[str, int]:
+        """
+        Write all rows in UNWIND batches and return the summed counters.
+
+        Args:
+            query: Cypher query consuming the $rows list parameter
+            rows: Rows to write, sync or async iterable
+            parameters: Extra parameters passed with every batch
+            batch_size: Initial rows per batch (defaults to settings)
+
+        Returns:
+            Write counters plus rows_written and batches
+        """
+        async with self.bulk_writer(query, parameters, batch_size) as writer:
+            if isinstance(rows, AsyncIterable):
+                async for row in rows:
+                    await writer.add(row)
+            else:
+                await writer.add_many(rows)
+        return writer.stats
+
+    async def _write_batch(
+        self,
+        query: str,
+        parameters: dict[str, Any],
+    ) -> dict[str, int]:
+        """Run one UNWIND batch in a managed (auto-retried) write transaction."""
+
+        async def work(tx: AsyncManagedTransaction) -> ResultSummary:
+            result = await tx.run(query, parameters)
+            return await result.consume()
+
+        async with self.session() as session:
+            summary = await session.execute_write(work)
+        return _summary_counters(summary)
 
     async def run(
         self,
@@ -294,6 +564,7 @@ class Neo4jClient:
                 "status": "healthy",
                 "database": self._database,
                 "details": result or {},
+                "routes": self.get_route_metrics(),
             }
         except (ServiceUnavailable, SessionExpired, TransientError, OSError, RuntimeError) as e:
             logger.error("Neo4j health check failed", error=str(e))
@@ -303,6 +574,19 @@ class Neo4jClient:
                 "error": str(e),
             }
 
+    def get_route_metrics(self) -> dict[str, dict[str, Any]]:
+        """Get session counts and timings for the READ and WRITE routes."""
+        return {
+            metrics.route.lower(): {
+                "sessions_opened": metrics.sessions_opened,
+                "active_sessions": metrics.active_sessions,
+                "peak_active_sessions": metrics.peak_active_sessions,
+                "errors": metrics.errors,
+                "avg_session_ms": round(metrics.avg_session_ms, 2),
+            }
+            for metrics in self._route_metrics.values()
+        }
+
     async def verify_connection(self) -> bool:
         """
         Verify the database connection is working.
@@ -317,11 +601,142 @@ class Neo4jClient:
             return False
 
 
+class Neo4jBulkWriter:
+    """
+    Buffered UNWIND writer.
+
+    Rows accumulate in memory and are written batch_size at a time in a
+    managed transaction, which the driver retries on transient errors.
+    add() awaits the flush once the buffer is full, so a fast producer is
+    held back to the database's pace. With target_batch_seconds set, the
+    batch size doubles while batches finish well under the target and
+    halves when they run well over it.
+    """
+
+    MIN_BATCH_SIZE = 50
+    MAX_BATCH_SIZE = 20000
+
+    def __init__(
+        self,
+        client: Neo4jClient,
+        query: str,
+        parameters: dict[str, Any] | None = None,
+        batch_size: int = 1000,
+        target_batch_seconds: float | None = 1.0,
+    ):
+        """
+        Initialize the writer.
+
+        Args:
+            client: Connected Neo4j client
+            query: Cypher query consuming the $rows list parameter
+            parameters: Extra parameters passed with every batch
+            batch_size: Initial rows per batch
+            target_batch_seconds: Batch duration to tune towards, or None
+
+        Raises:
+            ValueError: If the query does not reference $rows
+        """
+        if "$rows" not in query:
+            raise ValueError("Bulk write query must UNWIND the $rows parameter")
+
+        self._client = client
+        self._query = query
+        self._parameters = dict(parameters or {})
+        self._batch_size = max(1, batch_size)
+        self._target_batch_seconds = target_batch_seconds
+        self._buffer: list[dict[str, Any]] = []
+        self._lock = asyncio.Lock()
+        self._stats: dict[str, int] = {
+            "rows_written": 0,
+            "batches": 0,
+            "nodes_created": 0,
+            "nodes_deleted": 0,
+            "relationships_created": 0,
+            "relationships_deleted": 0,
+            "properties_set": 0,
+        }
+
+    @property
+    def batch_size(self) -> int:
+        """Current rows per batch."""
+        return self._batch_size
+
+    @property
+    def pending(self) -> int:
+        """Rows buffered but not yet written."""
+        return len(self._buffer)
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """Summed write counters for all flushed batches."""
+        return dict(self._stats)
+
+    async def add(self, row: dict[str, Any]) -> None:
+        """Buffer a row, flushing once a full batch is pending."""
+        self._buffer.append(row)
+        if len(self._buffer) >= self._batch_size:
+            await self.flush(full_batches_only=True)
+
+    async def add_many(self, rows: Iterable[dict[str, Any]]) -> None:
+        """Buffer rows, flushing full batches as they fill."""
+        for row in rows:
+            await self.add(row)
+
+    async def flush(self, full_batches_only: bool = False) -> None:
+        """
+        Write buffered rows.
+
+        Args:
+            full_batches_only: Leave a trailing partial batch buffered
+        """
+        async with self._lock:
+            while self._buffer and (not full_batches_only or len(self._buffer) >= self._batch_size):
+                rows = self._buffer[: self._batch_size]
+                started = time.perf_counter()
+                counters = await self._client._write_batch(
+                    self._query, {**self._parameters, "rows": rows}
+                )
+                elapsed = time.perf_counter() - started
+
+                # Only drop rows once the batch has committed
+                del self._buffer[: len(rows)]
+                self._stats["rows_written"] += len(rows)
+                self._stats["batches"] += 1
+                for key, value in counters.items():
+                    self._stats[key] += value
+                self._tune(len(rows), elapsed)
+
+    def _tune(self, rows: int, elapsed: float) -> None:
+        """Adjust the batch size towards the target batch duration."""
+        target = self._target_batch_seconds
+        if target is None or rows < self._batch_size:
+            return
+        if elapsed < target / 2:
+            self._batch_size = min(self.MAX_BATCH_SIZE, self._batch_size * 2)
+        elif elapsed > target * 2:
+            self._batch_size = max(self.MIN_BATCH_SIZE, self._batch_size // 2)
+
+    async def __aenter__(self) -> "Neo4jBulkWriter":
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        # Don't write a partial tail after the producer failed
+        if exc_type is None:
+            await self.flush()
+        elif self._buffer:
+            logger.warning("neo4j_bulk_write_aborted", unwritten_rows=len(self._buffer))
+
+
 # ═══════════════════════════════════════════════════════════════
 # CLIENT SINGLETON
 # ═══════════════════════════════════════════════════════════════
 
-import asyncio
 import threading
 
 _db_client: Neo4jClient | None = None
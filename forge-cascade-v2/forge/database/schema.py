@@ -266,6 +266,18 @@ class SchemaManager:
                 "capsule_created_idx",
                 "CREATE INDEX capsule_created_idx IF NOT EXISTS FOR (c:Capsule) ON (c.created_at)",
             ),
+            # Keyset pagination orders by (created_at, id)
+            (
+                "capsule_created_id_idx",
+                "CREATE INDEX capsule_created_id_idx IF NOT EXISTS "
+                "FOR (c:Capsule) ON (c.created_at, c.id)",
+            ),
+            # Full-text (BM25) index for keyword search
+            (
+                "capsule_fulltext_idx",
+                "CREATE FULLTEXT INDEX capsule_fulltext_idx IF NOT EXISTS "
+                "FOR (c:Capsule) ON EACH [c.title, c.content]",
+            ),
             # User indexes
             ("user_role_idx", "CREATE INDEX user_role_idx IF NOT EXISTS FOR (u:User) ON (u.role)"),
             (
@@ -684,6 +696,8 @@ class SchemaManager:
             "capsule_owner_idx",
             "capsule_trust_idx",
             "capsule_created_idx",
+            "capsule_created_id_idx",
+            "capsule_fulltext_idx",
             "user_role_idx",
             "user_active_idx",
             "user_trust_idx",
@@ -39,6 +39,7 @@ from forge.federation.models import (
     FederationStats,
     PeerHandshake,
     PeerStatus,
+    SyncCursor,
     SyncDirection,
     SyncPayload,
     SyncState,
@@ -58,6 +59,7 @@ __all__ = [
     "ConflictResolution",
     "PeerHandshake",
     "SyncPayload",
+    "SyncCursor",
     "FederationStats",
     # Services
     "FederationProtocol",
@@ -4,9 +4,10 @@ Federation Data Models
 Defines the data structures for federated knowledge sharing between Forge instances.
 """
 
+import base64
 from datetime import UTC, datetime
 from enum import Enum
-from typing import Any
+from typing import Any, ClassVar
 
 from pydantic import Field
 
@@ -130,6 +131,9 @@ class FederatedPeer(ForgeModel):
     registered_at: datetime = Field(default_factory=lambda: datetime.now(UTC))
     last_sync_at: datetime | None = None
     last_seen_at: datetime | None = None
+    pull_cursor: str | None = Field(
+        default=None, description="Resume cursor of an unfinished pull (opaque, peer-issued)"
+    )
 
     # Stats
     total_syncs: int = Field(default=0)
@@ -280,6 +284,50 @@ class PeerHandshake(ForgeModel):
     )
 
 
+class SyncCursor(ForgeModel):
+    """
+    Resume position of a paginated change feed.
+
+    Issued by the serving instance as SyncPayload.next_cursor and echoed
+    back verbatim by the pulling peer, which never interprets it. Capsules
+    and edges are paged independently; each stream holds the repository
+    page cursor of its last row, and a stream is marked done once drained.
+    """
+
+    capsules_after: str | None = None
+    edges_after: str | None = None
+    capsules_done: bool = False
+    edges_done: bool = False
+
+    MAX_LENGTH: ClassVar[int] = 2048
+
+    @property
+    def drained(self) -> bool:
+        """True once both streams are exhausted."""
+        return self.capsules_done and self.edges_done
+
+    def encode(self) -> str:
+        """Encode as an opaque URL-safe token."""
+        raw = self.model_dump_json(exclude_defaults=True).encode("utf-8")
+        return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+    @classmethod
+    def decode(cls, token: str) -> "SyncCursor":
+        """
+        Decode a token produced by encode().
+
+        Raises:
+            ValueError: If the token is malformed
+        """
+        if len(token) > cls.MAX_LENGTH:
+            raise ValueError("Invalid sync cursor")
+        try:
+            raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+            return cls.model_validate_json(raw)
+        except ValueError as e:
+            raise ValueError("Invalid sync cursor") from e
+
+
 class SyncPayload(ForgeModel):
     """
     Payload for sync operations.
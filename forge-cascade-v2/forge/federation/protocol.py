@@ -1284,6 +1284,7 @@ class FederationProtocol:
         since: datetime | None = None,
         capsule_types: list[str] | None = None,
         limit: int = 100,
+        cursor: str | None = None,
     ) -> SyncPayload | None:
         """
         Request changes from a peer.
@@ -1297,6 +1298,7 @@ class FederationProtocol:
             since: Get changes since this timestamp
             capsule_types: Filter to specific capsule types
             limit: Maximum capsules to retrieve
+            cursor: next_cursor of the previous page, to resume after it
         """
         if not self._http_client:
             raise RuntimeError("Protocol not initialized")
@@ -1324,6 +1326,8 @@ class FederationProtocol:
                 params["since"] = since.isoformat()
             if capsule_types:
                 params["types"] = ",".join(capsule_types)
+            if cursor:
+                params["cursor"] = cursor
 
             # SECURITY FIX (Audit 4 - H29): Add nonce to prevent replay attacks
             # Each sync request includes a unique nonce that is signed
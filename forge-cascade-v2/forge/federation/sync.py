@@ -5,6 +5,7 @@ Orchestrates synchronization of capsules and edges between federated Forge insta
 """
 
 import asyncio
+import contextlib
 import logging
 import uuid
 from datetime import UTC, datetime, timedelta
@@ -19,6 +20,7 @@ from forge.federation.models import (
     PeerStatus,
     SyncDirection,
     SyncOperationStatus,
+    SyncPayload,
     SyncPhase,
     SyncState,
 )
@@ -72,6 +74,9 @@ class SyncService:
         # State caches - backed by Neo4j persistence
         self._peers: dict[str, FederatedPeer] = {}
         self._federated_capsules: dict[str, FederatedCapsule] = {}
+        # Reverse index: local capsule ID -> "peer_id:remote_capsule_id" key
+        # into _federated_capsules, for O(1) echo detection when pushing
+        self._local_origins: dict[str, str] = {}
         self._federated_edges: dict[str, FederatedEdge] = {}
         self._sync_states: dict[str, SyncState] = {}
         self._sync_lock = asyncio.Lock()
@@ -170,18 +175,23 @@ class SyncService:
 
             try:
                 # Execute sync based on direction
+                drained = True
                 if sync_direction == SyncDirection.PULL:
-                    await self._execute_pull(peer, state)
+                    drained = await self._execute_pull(peer, state)
                 elif sync_direction == SyncDirection.PUSH:
                     await self._execute_push(peer, state)
                 else:  # BIDIRECTIONAL
-                    await self._execute_pull(peer, state)
+                    drained = await self._execute_pull(peer, state)
                     await self._execute_push(peer, state)
 
                 # Update success
                 state.status = SyncOperationStatus.COMPLETED
                 state.completed_at = datetime.now(UTC)
-                peer.last_sync_at = state.completed_at
+                # Only move the sync window once the pull has drained it; an
+                # unfinished pull resumes from peer.pull_cursor next time
+                if drained:
+                    peer.last_sync_at = state.sync_to or state.completed_at
+                    await self._save_sync_progress(peer)
                 peer.successful_syncs += 1
                 peer.total_syncs += 1
 
@@ -204,6 +214,14 @@ class SyncService:
     # SECURITY FIX (Audit 4 - H6): Maximum iterations to prevent DoS via unbounded sync loop
     MAX_SYNC_ITERATIONS = 100  # Maximum pagination iterations per sync
 
+    # Pull pipeline: page size requested from peers (the /changes route caps it
+    # at 100) and verified pages buffered ahead of the applier
+    PULL_PAGE_SIZE = 100
+    PULL_PREFETCH_PAGES = 4
+
+    # Local capsules per pushed payload
+    PUSH_PAGE_SIZE = 100
+
     # SECURITY FIX (Audit 9): Maximum sync states to prevent unbounded memory growth
     MAX_SYNC_STATES = 1000
 
@@ -233,8 +251,18 @@ class SyncService:
         }
     )
 
-    async def _execute_pull(self, peer: FederatedPeer, state: SyncState) -> None:
-        """Pull changes from a peer."""
+    async def _execute_pull(self, peer: FederatedPeer, state: SyncState) -> bool:
+        """
+        Pull changes from a peer.
+
+        A fetcher task requests and verifies pages while the previous page
+        is applied, with at most PULL_PREFETCH_PAGES verified pages waiting.
+        The peer's resume cursor is checkpointed after every applied page,
+        so an interrupted pull continues where it stopped.
+
+        Returns:
+            True if the peer has no further changes in the sync window
+        """
         state.phase = SyncPhase.FETCHING
         logger.info(f"Pulling from {peer.name}")
 
@@ -242,105 +270,193 @@ class SyncService:
         state.sync_from = peer.last_sync_at
         state.sync_to = datetime.now(UTC)
 
-        # SECURITY FIX (Audit 4 - H6): Add iteration counter to prevent DoS
-        # A malicious peer could claim has_more=True forever to exhaust resources
-        iterations = 0
+        pages: asyncio.Queue[SyncPayload | None] = asyncio.Queue(maxsize=self.PULL_PREFETCH_PAGES)
+        fetcher = asyncio.create_task(self._fetch_pages(peer, state, pages))
+        # Edges whose endpoints arrive on a later page
+        deferred_edges: list[dict[str, Any]] = []
 
-        while iterations < self.MAX_SYNC_ITERATIONS:
-            iterations += 1
+        try:
+            while (payload := await pages.get()) is not None:
+                state.phase = SyncPhase.PROCESSING
+                await self._process_incoming_capsules(peer, payload.capsules, state)
+                await self._process_incoming_edges(
+                    peer, payload.edges, state, deferred=deferred_edges
+                )
+                await self._handle_remote_deletions(peer, payload.deletions)
 
-            payload = await self.protocol.send_sync_request(
-                peer=peer,
-                since=state.sync_from,
-                capsule_types=peer.sync_capsule_types or None,
-                limit=100,
-            )
+                peer.pull_cursor = payload.next_cursor if payload.has_more else None
+                await self._save_sync_progress(peer)
 
-            if not payload:
-                raise RuntimeError("Failed to fetch changes from peer")
+            # Applied pages are checkpointed, so settle their deferred edges
+            # before a fetch error can surface
+            await self._process_incoming_edges(peer, deferred_edges, state)
 
-            # SECURITY FIX (Audit 4 - H7): Verify content hash against actual content
-            if hasattr(payload, "content_hash") and payload.content_hash:
-                computed_hash = self._compute_content_hash(
-                    payload.capsules, payload.edges, payload.deletions
-                )
-                if computed_hash != payload.content_hash:
-                    logger.error(
-                        f"Content hash mismatch from peer {peer.name}: "
-                        f"claimed={payload.content_hash[:16]}..., computed={computed_hash[:16]}..."
-                    )
-                    raise RuntimeError("Content hash verification failed - possible tampering")
+            drained = await fetcher
+            if drained:
+                peer.pull_cursor = None
+        finally:
+            if not fetcher.done():
+                fetcher.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await fetcher
 
-            state.capsules_fetched += len(payload.capsules)
-            state.edges_fetched += len(payload.edges)
+        state.phase = SyncPhase.FINALIZING
+        peer.capsules_received += state.capsules_fetched
+        logger.info(
+            f"Pull complete: {state.capsules_created} created, "
+            f"{state.capsules_updated} updated, {state.capsules_conflicted} conflicts"
+            + ("" if drained else " (more pending, will resume)")
+        )
+        return drained
+
+    async def _fetch_pages(
+        self,
+        peer: FederatedPeer,
+        state: SyncState,
+        pages: asyncio.Queue[SyncPayload | None],
+    ) -> bool:
+        """
+        Fetch and verify pull pages, handing them to the applier in order.
 
-            # Process capsules
-            state.phase = SyncPhase.PROCESSING
-            await self._process_incoming_capsules(peer, payload.capsules, state)
+        Always ends the stream with None unless cancelled.
 
-            # Process edges
-            await self._process_incoming_edges(peer, payload.edges, state)
+        Returns:
+            True if the sync window is finished, either because the peer
+            reported no more pages or because it cannot page any further
+        """
+        cursor = peer.pull_cursor
+        cancelled = False
+        try:
+            # SECURITY FIX (Audit 4 - H6): Add iteration counter to prevent DoS
+            # A malicious peer could claim has_more=True forever to exhaust resources
+            for iteration in range(self.MAX_SYNC_ITERATIONS):
+                payload = await self.protocol.send_sync_request(
+                    peer=peer,
+                    since=state.sync_from,
+                    capsule_types=peer.sync_capsule_types or None,
+                    limit=self.PULL_PAGE_SIZE,
+                    cursor=cursor,
+                )
 
-            # Handle deletions
-            for deleted_id in payload.deletions:
-                await self._handle_remote_deletion(peer, deleted_id)
+                if not payload:
+                    if iteration == 0 and cursor:
+                        # The saved cursor may have been rejected; restart the window next time
+                        peer.pull_cursor = None
+                    raise RuntimeError("Failed to fetch changes from peer")
 
-            if not payload.has_more:
-                break
-            # Note: cursor pagination not yet implemented in protocol
+                # SECURITY FIX (Audit 4 - H7): Verify content hash against actual content
+                if hasattr(payload, "content_hash") and payload.content_hash:
+                    computed_hash = self._compute_content_hash(
+                        payload.capsules, payload.edges, payload.deletions
+                    )
+                    if computed_hash != payload.content_hash:
+                        logger.error(
+                            f"Content hash mismatch from peer {peer.name}: "
+                            f"claimed={payload.content_hash[:16]}..., computed={computed_hash[:16]}..."
+                        )
+                        raise RuntimeError("Content hash verification failed - possible tampering")
+
+                state.capsules_fetched += len(payload.capsules)
+                state.edges_fetched += len(payload.edges)
+                await pages.put(payload)
+
+                if not payload.has_more:
+                    return True
+                if not payload.next_cursor or payload.next_cursor == cursor:
+                    # Older peers ignore the cursor and would serve the same page
+                    # forever; take what they sent and close the window as before
+                    logger.warning(
+                        f"Peer {peer.name} reported more changes without advancing "
+                        "its cursor; stopping pull"
+                    )
+                    return True
+                cursor = payload.next_cursor
 
-        # SECURITY FIX (Audit 4 - H6): Log if we hit the iteration limit
-        if iterations >= self.MAX_SYNC_ITERATIONS:
+            # SECURITY FIX (Audit 4 - H6): Log if we hit the iteration limit
             logger.warning(
                 f"Sync with peer {peer.name} hit maximum iteration limit ({self.MAX_SYNC_ITERATIONS}). "
-                "This may indicate a malicious peer or very large sync backlog."
+                "Remaining changes will be pulled from the saved cursor on the next sync."
             )
-
-        state.phase = SyncPhase.FINALIZING
-        peer.capsules_received += state.capsules_fetched
-        logger.info(
-            f"Pull complete: {state.capsules_created} created, "
-            f"{state.capsules_updated} updated, {state.capsules_conflicted} conflicts"
-        )
+            return False
+        except asyncio.CancelledError:
+            cancelled = True
+            raise
+        finally:
+            if not cancelled:
+                await pages.put(None)
+
+    async def _save_sync_progress(self, peer: FederatedPeer) -> None:
+        """Persist the peer's sync window and pull cursor."""
+        try:
+            async with self.driver.session() as session:
+                query = """
+                MATCH (p:FederatedPeer {id: $id})
+                SET p.last_sync_at = $last_sync_at,
+                    p.pull_cursor = $pull_cursor
+                """
+                await session.run(
+                    query,
+                    {
+                        "id": peer.id,
+                        "last_sync_at": peer.last_sync_at.isoformat()
+                        if peer.last_sync_at
+                        else None,
+                        "pull_cursor": peer.pull_cursor,
+                    },
+                )
+        except (ConnectionError, TimeoutError, OSError, RuntimeError) as e:
+            logger.error(f"Failed to save sync progress for {peer.id}: {e}")
 
     async def _execute_push(self, peer: FederatedPeer, state: SyncState) -> None:
-        """Push changes to a peer."""
+        """Push local changes to a peer, one page per payload."""
         state.phase = SyncPhase.PROCESSING  # No "preparing" phase in enum
         logger.info(f"Pushing to {peer.name}")
+        state.sync_to = state.sync_to or datetime.now(UTC)
+
+        after: tuple[str, str] | None = None
+        pushed = 0
+        for _ in range(self.MAX_SYNC_ITERATIONS):
+            # Get local changes since last sync
+            capsules, after = await self._get_local_changes(
+                since=peer.last_sync_at,
+                min_trust=peer.min_trust_to_sync,
+                types=peer.sync_capsule_types or None,
+                after=after,
+            )
 
-        # Get local changes since last sync
-        capsules = await self._get_local_changes(
-            since=peer.last_sync_at,
-            min_trust=peer.min_trust_to_sync,
-            types=peer.sync_capsule_types or None,
-        )
+            if capsules:
+                state.phase = SyncPhase.APPLYING
 
-        if not capsules:
-            logger.info(f"No changes to push to {peer.name}")
-            return
+                # Get edge changes since last sync
+                edges = await self._get_edge_changes(
+                    since=peer.last_sync_at,
+                    capsule_ids=[str(c.get("id")) for c in capsules if c.get("id")],
+                )
 
-        state.phase = SyncPhase.APPLYING
+                # Create and send payload
+                payload = await self.protocol.create_sync_payload(
+                    sync_id=state.id,
+                    peer_id=peer.id,
+                    capsules=capsules,
+                    edges=edges,
+                    has_more=after is not None,
+                )
 
-        # Get edge changes since last sync
-        edges = await self._get_edge_changes(
-            since=peer.last_sync_at,
-            capsule_ids=[str(c.get("id")) for c in capsules if c.get("id")],
-        )
+                success = await self.protocol.send_sync_push(peer, payload)
+                if not success:
+                    raise RuntimeError("Failed to push changes to peer")
 
-        # Create and send payload
-        payload = await self.protocol.create_sync_payload(
-            sync_id=state.id,
-            peer_id=peer.id,
-            capsules=capsules,
-            edges=edges,
-        )
+                pushed += len(capsules)
+                peer.capsules_sent += len(capsules)
+
+            if after is None:
+                break
 
-        success = await self.protocol.send_sync_push(peer, payload)
-        if not success:
-            raise RuntimeError("Failed to push changes to peer")
+        if not pushed:
+            logger.info(f"No changes to push to {peer.name}")
+            return
 
-        peer.capsules_sent += len(capsules)
-        logger.info(f"Push complete: {len(capsules)} capsules sent")
+        logger.info(f"Push complete: {pushed} capsules sent")
 
     async def _process_incoming_capsules(
         self,
@@ -348,7 +464,14 @@ class SyncService:
         capsules: list[dict[str, Any]],
         state: SyncState,
     ) -> None:
-        """Process incoming capsules from a peer."""
+        """
+        Process a page of incoming capsules from a peer.
+
+        Local copies of already-federated capsules are read in one query,
+        and creates and updates are each written in one batch.
+        """
+        # Later entries for the same remote capsule supersede earlier ones
+        incoming: dict[str, dict[str, Any]] = {}
         for remote_capsule in capsules:
             remote_id = remote_capsule.get("id")
             if not remote_id:
@@ -360,39 +483,70 @@ class SyncService:
                 state.capsules_skipped += 1
                 continue
 
-            # Check if we already have this capsule
-            fed_capsule = await self._find_federated_capsule(peer.id, remote_id)
+            incoming[str(remote_id)] = remote_capsule
 
+        new_capsules: list[dict[str, Any]] = []
+        known: list[tuple[FederatedCapsule, dict[str, Any]]] = []
+        for remote_id, remote_capsule in incoming.items():
+            # Check if we already have this capsule
+            fed_capsule = self._federated_capsules.get(f"{peer.id}:{remote_id}")
             if fed_capsule and fed_capsule.local_capsule_id:
-                # Check for conflicts
-                conflict = await self._check_conflict(fed_capsule, remote_capsule)
-                if conflict:
-                    resolution = await self._resolve_conflict(peer, conflict)
-                    if resolution == "skip":
-                        state.capsules_conflicted += 1
-                        continue
-                    elif resolution == "update":
-                        await self._update_local_capsule(fed_capsule, remote_capsule)
-                        state.capsules_updated += 1
-                else:
-                    # No conflict, update if changed
-                    if fed_capsule.remote_content_hash != remote_capsule.get("content_hash"):
-                        await self._update_local_capsule(fed_capsule, remote_capsule)
-                        state.capsules_updated += 1
-                    else:
-                        state.capsules_skipped += 1
+                known.append((fed_capsule, remote_capsule))
             else:
-                # New capsule - create local copy
-                await self._create_local_capsule(peer, remote_capsule)
-                state.capsules_created += 1
+                new_capsules.append(remote_capsule)
+
+        local_capsules = await self._get_local_capsules(
+            [
+                fed_capsule.local_capsule_id
+                for fed_capsule, _ in known
+                if fed_capsule.local_capsule_id
+            ]
+        )
+
+        updates: list[tuple[FederatedCapsule, dict[str, Any]]] = []
+        for fed_capsule, remote_capsule in known:
+            local = local_capsules.get(fed_capsule.local_capsule_id or "")
+            # Check for conflicts
+            conflict = self._detect_conflict(fed_capsule, local, remote_capsule)
+            if conflict:
+                resolution = await self._resolve_conflict(peer, conflict)
+                if resolution == "skip":
+                    state.capsules_conflicted += 1
+                    continue
+                elif resolution == "update":
+                    updates.append((fed_capsule, remote_capsule))
+            # No conflict, update if changed
+            elif fed_capsule.remote_content_hash != remote_capsule.get("content_hash"):
+                updates.append((fed_capsule, remote_capsule))
+            else:
+                state.capsules_skipped += 1
+
+        if updates:
+            await self._update_local_capsules(updates)
+            state.capsules_updated += len(updates)
+
+        if new_capsules:
+            # New capsules - create local copies
+            state.capsules_created += await self._create_local_capsules(peer, new_capsules)
 
     async def _process_incoming_edges(
         self,
         peer: FederatedPeer,
         edges: list[dict[str, Any]],
         state: SyncState,
+        deferred: list[dict[str, Any]] | None = None,
     ) -> None:
-        """Process incoming edges from a peer."""
+        """
+        Process incoming edges from a peer.
+
+        Args:
+            peer: The sending peer
+            edges: Remote edge dictionaries
+            state: Sync state to update
+            deferred: If given, edges whose endpoints are not known yet are
+                appended here for a later pass instead of being skipped
+        """
+        resolved: list[tuple[dict[str, Any], str, str]] = []
         for remote_edge in edges:
             remote_id = remote_edge.get("id")
             if not remote_id:
@@ -410,12 +564,17 @@ class SyncService:
             target_local = await self._resolve_to_local_id(peer.id, str(target_id))
 
             if source_local and target_local:
-                # Create local edge
-                await self._create_local_edge(peer, remote_edge, source_local, target_local)
-                state.edges_created += 1
+                resolved.append((remote_edge, source_local, target_local))
+            elif deferred is not None:
+                deferred.append(remote_edge)
             else:
                 state.edges_skipped += 1
 
+        if resolved:
+            # Create local edges
+            await self._create_local_edges(peer, resolved)
+            state.edges_created += len(resolved)
+
     async def _check_conflict(
         self,
         fed_capsule: FederatedCapsule,
@@ -424,6 +583,15 @@ class SyncService:
         """Check if there's a conflict between local and remote versions."""
         # Get local capsule
         local = await self._get_local_capsule(fed_capsule.local_capsule_id)
+        return self._detect_conflict(fed_capsule, local, remote_capsule)
+
+    @staticmethod
+    def _detect_conflict(
+        fed_capsule: FederatedCapsule,
+        local: dict[str, Any] | None,
+        remote_capsule: dict[str, Any],
+    ) -> SyncConflict | None:
+        """Compare a local copy against an incoming remote version."""
         if not local:
             return None
 
@@ -592,78 +760,131 @@ class SyncService:
 
         return None
 
+    async def _get_local_capsules(self, capsule_ids: list[str]) -> dict[str, dict[str, Any]]:
+        """Get local capsules by ID in one query, keyed by ID."""
+        if not capsule_ids:
+            return {}
+
+        try:
+            async with self.driver.session() as session:
+                query = """
+                MATCH (c:Capsule)
+                WHERE c.id IN $ids
+                RETURN c {
+                    .id, .title, .content, .type, .trust_level,
+                    .owner_id, .created_at, .updated_at, .content_hash, .tags
+                } AS capsule
+                """
+                result = await session.run(query, {"ids": capsule_ids})
+                records = await result.data()
+                return {
+                    record["capsule"]["id"]: record["capsule"]
+                    for record in records
+                    if record.get("capsule")
+                }
+        except (ConnectionError, TimeoutError, OSError, RuntimeError) as e:
+            logger.error(f"Failed to get {len(capsule_ids)} local capsules: {e}")
+
+        return {}
+
     async def _create_local_capsule(
         self,
         peer: FederatedPeer,
         remote_capsule: dict[str, Any],
     ) -> None:
         """Create a local copy of a remote capsule."""
-        local_id = str(uuid.uuid4())
+        await self._create_local_capsules(peer, [remote_capsule])
+
+    async def _create_local_capsules(
+        self,
+        peer: FederatedPeer,
+        remote_capsules: list[dict[str, Any]],
+    ) -> int:
+        """
+        Create local copies of remote capsules in one write.
 
-        # Create actual capsule in Neo4j
+        Returns:
+            Number of capsules created
+        """
+        remote_capsules = [c for c in remote_capsules if c.get("id")]
+        rows = [
+            {
+                "id": str(uuid.uuid4()),
+                "title": remote_capsule.get("title", ""),
+                "content": remote_capsule.get("content", ""),
+                "type": remote_capsule.get("type", "knowledge"),
+                # SECURITY: Don't trust remote trust level - use UNVERIFIED default
+                "trust_level": 20,  # UNVERIFIED - will be recalculated locally
+                "owner_id": peer.id,  # Attribute to the peer
+                "content_hash": remote_capsule.get("content_hash", ""),
+                "tags": remote_capsule.get("tags", []),
+                "peer_id": peer.id,
+                "remote_id": remote_capsule["id"],
+            }
+            for remote_capsule in remote_capsules
+        ]
+        if not rows:
+            return 0
+
+        # Create actual capsules in Neo4j
         try:
             async with self.driver.session() as session:
                 query = """
+                UNWIND $rows AS row
                 CREATE (c:Capsule {
-                    id: $id,
-                    title: $title,
-                    content: $content,
-                    type: $type,
-                    trust_level: $trust_level,
-                    owner_id: $owner_id,
+                    id: row.id,
+                    title: row.title,
+                    content: row.content,
+                    type: row.type,
+                    trust_level: row.trust_level,
+                    owner_id: row.owner_id,
                     created_at: datetime(),
                     updated_at: datetime(),
-                    content_hash: $content_hash,
-                    tags: $tags,
+                    content_hash: row.content_hash,
+                    tags: row.tags,
                     federated: true,
-                    source_peer_id: $peer_id,
-                    source_capsule_id: $remote_id
+                    source_peer_id: row.peer_id,
+                    source_capsule_id: row.remote_id
                 })
-                RETURN c.id AS id
                 """
-                result = await session.run(
-                    query,
-                    {
-                        "id": local_id,
-                        "title": remote_capsule.get("title", ""),
-                        "content": remote_capsule.get("content", ""),
-                        "type": remote_capsule.get("type", "knowledge"),
-                        # SECURITY: Don't trust remote trust level - use UNVERIFIED default
-                        "trust_level": 20,  # UNVERIFIED - will be recalculated locally
-                        "owner_id": peer.id,  # Attribute to the peer
-                        "content_hash": remote_capsule.get("content_hash", ""),
-                        "tags": remote_capsule.get("tags", []),
-                        "peer_id": peer.id,
-                        "remote_id": remote_capsule["id"],
-                    },
-                )
-                await result.single()
-                logger.debug(f"Created local capsule {local_id} from peer {peer.name}")
+                result = await session.run(query, {"rows": rows})
+                await result.consume()
+                logger.debug(f"Created {len(rows)} local capsules from peer {peer.name}")
 
-        except (ConnectionError, TimeoutError, OSError, RuntimeError, KeyError) as e:
-            logger.error(f"Failed to create local capsule: {e}")
-            return
+        except (ConnectionError, TimeoutError, OSError, RuntimeError) as e:
+            logger.error(f"Failed to create local capsules: {e}")
+            return 0
+
+        # Create federated tracking records
+        now = datetime.now(UTC)
+        fed_capsules = []
+        for row, remote_capsule in zip(rows, remote_capsules, strict=True):
+            fed_capsule = FederatedCapsule(
+                peer_id=peer.id,
+                remote_capsule_id=remote_capsule["id"],
+                local_capsule_id=row["id"],
+                remote_content_hash=remote_capsule.get("content_hash", ""),
+                local_content_hash=remote_capsule.get("content_hash", ""),
+                sync_status=FederatedSyncStatus.SYNCED,
+                remote_title=remote_capsule.get("title"),
+                remote_type=remote_capsule.get("type"),
+                remote_trust_level=remote_capsule.get("trust_level"),
+                remote_owner_id=remote_capsule.get("owner_id"),
+                last_synced_at=now,
+            )
+            self._track_federated_capsule(fed_capsule)
+            fed_capsules.append(fed_capsule)
 
-        # Create federated tracking record
-        fed_capsule = FederatedCapsule(
-            peer_id=peer.id,
-            remote_capsule_id=remote_capsule["id"],
-            local_capsule_id=local_id,
-            remote_content_hash=remote_capsule.get("content_hash", ""),
-            local_content_hash=remote_capsule.get("content_hash", ""),
-            sync_status=FederatedSyncStatus.SYNCED,
-            remote_title=remote_capsule.get("title"),
-            remote_type=remote_capsule.get("type"),
-            remote_trust_level=remote_capsule.get("trust_level"),
-            remote_owner_id=remote_capsule.get("owner_id"),
-            last_synced_at=datetime.now(UTC),
-        )
+        # Persist to Neo4j
+        await self._persist_federated_capsules(fed_capsules)
+        return len(rows)
 
-        key = f"{peer.id}:{remote_capsule['id']}"
+    def _track_federated_capsule(self, fed_capsule: FederatedCapsule) -> None:
+        """Register a federated capsule mapping and its local-ID index entry."""
+        key = f"{fed_capsule.peer_id}:{fed_capsule.remote_capsule_id}"
         self._federated_capsules[key] = fed_capsule
-
-        # Persist to Neo4j
-        await self._persist_federated_capsule(fed_capsule)
+        if fed_capsule.local_capsule_id:
+            self._local_origins[fed_capsule.local_capsule_id] = key
 
     async def _update_local_capsule(
         self,
@@ -671,38 +892,52 @@ class SyncService:
         remote_capsule: dict[str, Any],
     ) -> None:
         """Update local capsule with remote changes."""
-        # Update actual capsule in Neo4j
-        if fed_capsule.local_capsule_id:
+        await self._update_local_capsules([(fed_capsule, remote_capsule)])
+
+    async def _update_local_capsules(
+        self,
+        updates: list[tuple[FederatedCapsule, dict[str, Any]]],
+    ) -> None:
+        """Apply remote changes to local capsules in one write."""
+        rows = [
+            {
+                "id": fed_capsule.local_capsule_id,
+                "title": remote_capsule.get("title", ""),
+                "content": remote_capsule.get("content", ""),
+                "content_hash": remote_capsule.get("content_hash", ""),
+                "tags": remote_capsule.get("tags", []),
+                # NOTE: Don't update trust_level - must be calculated locally
+            }
+            for fed_capsule, remote_capsule in updates
+            if fed_capsule.local_capsule_id
+        ]
+
+        # Update actual capsules in Neo4j
+        if rows:
             try:
                 async with self.driver.session() as session:
                     query = """
-                    MATCH (c:Capsule {id: $id})
-                    SET c.title = $title,
-                        c.content = $content,
-                        c.content_hash = $content_hash,
-                        c.tags = $tags,
+                    UNWIND $rows AS row
+                    MATCH (c:Capsule {id: row.id})
+                    SET c.title = row.title,
+                        c.content = row.content,
+                        c.content_hash = row.content_hash,
+                        c.tags = row.tags,
                         c.updated_at = datetime()
-                    RETURN c.id AS id
                     """
-                    await session.run(
-                        query,
-                        {
-                            "id": fed_capsule.local_capsule_id,
-                            "title": remote_capsule.get("title", ""),
-                            "content": remote_capsule.get("content", ""),
-                            "content_hash": remote_capsule.get("content_hash", ""),
-                            "tags": remote_capsule.get("tags", []),
-                            # NOTE: Don't update trust_level - must be calculated locally
-                        },
-                    )
-                    logger.debug(f"Updated local capsule {fed_capsule.local_capsule_id}")
+                    result = await session.run(query, {"rows": rows})
+                    await result.consume()
+                    logger.debug(f"Updated {len(rows)} local capsules")
             except (ConnectionError, TimeoutError, OSError, RuntimeError) as e:
-                logger.error(f"Failed to update local capsule: {e}")
+                logger.error(f"Failed to update local capsules: {e}")
 
-        # Update tracking record
-        fed_capsule.remote_content_hash = remote_capsule.get("content_hash", "")
-        fed_capsule.local_content_hash = remote_capsule.get("content_hash", "")
-        fed_capsule.last_synced_at = datetime.now(UTC)
+        # Update tracking records
+        now = datetime.now(UTC)
+        for fed_capsule, remote_capsule in updates:
+            fed_capsule.remote_content_hash = remote_capsule.get("content_hash", "")
+            fed_capsule.local_content_hash = remote_capsule.get("content_hash", "")
+            fed_capsule.last_synced_at = now
+        await self._persist_federated_capsules([fed_capsule for fed_capsule, _ in updates])
 
     async def _handle_remote_deletion(
         self,
@@ -710,13 +945,26 @@ class SyncService:
         remote_id: str,
     ) -> None:
         """Handle a deletion notification from peer."""
-        key = f"{peer.id}:{remote_id}"
-        if key in self._federated_capsules:
-            fed_capsule = self._federated_capsules[key]
-            # Mark as rejected (no "deleted_remote" status) - flag for review
-            fed_capsule.sync_status = FederatedSyncStatus.REJECTED
-            fed_capsule.conflict_reason = "Remote capsule deleted"
-            # Don't delete local copy automatically - flag for review
+        await self._handle_remote_deletions(peer, [remote_id])
+
+    async def _handle_remote_deletions(
+        self,
+        peer: FederatedPeer,
+        remote_ids: list[str],
+    ) -> None:
+        """Handle a batch of deletion notifications from peer."""
+        flagged = []
+        for remote_id in remote_ids:
+            fed_capsule = self._federated_capsules.get(f"{peer.id}:{remote_id}")
+            if fed_capsule:
+                # Mark as rejected (no "deleted_remote" status) - flag for review
+                fed_capsule.sync_status = FederatedSyncStatus.REJECTED
+                fed_capsule.conflict_reason = "Remote capsule deleted"
+                # Don't delete local copy automatically - flag for review
+                flagged.append(fed_capsule)
+
+        if flagged:
+            await self._persist_federated_capsules(flagged)
 
     async def _resolve_to_local_id(
         self,
@@ -738,70 +986,88 @@ class SyncService:
         target_local: str,
     ) -> None:
         """Create a local copy of a remote edge."""
-        relationship_type = remote_edge.get("relationship_type", "RELATED_TO")
+        await self._create_local_edges(peer, [(remote_edge, source_local, target_local)])
 
-        # SECURITY FIX (Audit 9): Validate relationship_type against whitelist
-        # to prevent Cypher injection. The relationship_type comes from remote peer
-        # data and is interpolated into a Cypher query via f-string; a malicious
-        # peer could send a crafted value to execute arbitrary Cypher.
-        if relationship_type not in self.ALLOWED_RELATIONSHIP_TYPES:
-            logger.warning(
-                "federation_invalid_relationship_type: type=%s, peer_id=%s",
-                relationship_type,
-                peer.id,
-            )
-            relationship_type = "RELATED_TO"
-
-        fed_edge = FederatedEdge(
-            peer_id=peer.id,
-            remote_edge_id=remote_edge.get("id", ""),
-            source_capsule_id=source_local,
-            target_capsule_id=target_local,
-            relationship_type=relationship_type,
-            source_is_local=True,
-            target_is_local=True,
-            sync_status=FederatedSyncStatus.SYNCED,
-            last_synced_at=datetime.now(UTC),
-        )
+    async def _create_local_edges(
+        self,
+        peer: FederatedPeer,
+        edges: list[tuple[dict[str, Any], str, str]],
+    ) -> None:
+        """
+        Create local copies of remote edges.
 
-        self._federated_edges[fed_edge.id] = fed_edge
+        Args:
+            peer: The sending peer
+            edges: (remote edge, local source ID, local target ID) tuples
+        """
+        # Relationship types cannot be parameterised, so write one batch per type
+        by_type: dict[str, list[dict[str, Any]]] = {}
+        fed_edges = []
+        now = datetime.now(UTC)
+        for remote_edge, source_local, target_local in edges:
+            relationship_type = remote_edge.get("relationship_type", "RELATED_TO")
+
+            # SECURITY FIX (Audit 9): Validate relationship_type against whitelist
+            # to prevent Cypher injection. The relationship_type comes from remote peer
+            # data and is interpolated into a Cypher query via f-string; a malicious
+            # peer could send a crafted value to execute arbitrary Cypher.
+            if relationship_type not in self.ALLOWED_RELATIONSHIP_TYPES:
+                logger.warning(
+                    "federation_invalid_relationship_type: type=%s, peer_id=%s",
+                    relationship_type,
+                    peer.id,
+                )
+                relationship_type = "RELATED_TO"
+
+            fed_edge = FederatedEdge(
+                peer_id=peer.id,
+                remote_edge_id=remote_edge.get("id", ""),
+                source_capsule_id=source_local,
+                target_capsule_id=target_local,
+                relationship_type=relationship_type,
+                source_is_local=True,
+                target_is_local=True,
+                sync_status=FederatedSyncStatus.SYNCED,
+                last_synced_at=now,
+            )
+            self._federated_edges[fed_edge.id] = fed_edge
+            fed_edges.append(fed_edge)
+
+            by_type.setdefault(relationship_type, []).append(
+                {
+                    "source_id": source_local,
+                    "target_id": target_local,
+                    "remote_edge_id": remote_edge.get("id", ""),
+                    "weight": remote_edge.get("weight", 1.0),
+                    "properties": str(remote_edge.get("properties", {})),
+                }
+            )
 
-        # Persist the mapping to Neo4j
-        await self._persist_federated_edge(fed_edge)
+        # Persist the mappings to Neo4j
+        await self._persist_federated_edges(fed_edges)
 
-        # Create actual edge in Neo4j
+        # Create actual edges in Neo4j
         try:
             async with self.driver.session() as session:
-                # Use MERGE to avoid duplicates
-                query = f"""
-                MATCH (source:Capsule {{id: $source_id}})
-                MATCH (target:Capsule {{id: $target_id}})
-                MERGE (source)-[r:{relationship_type}]->(target)
-                SET r.federated = true,
-                    r.peer_id = $peer_id,
-                    r.remote_edge_id = $remote_edge_id,
-                    r.created_at = datetime(),
-                    r.weight = $weight,
-                    r.properties = $properties
-                RETURN id(r) AS edge_id
-                """
-                await session.run(
-                    query,
-                    {
-                        "source_id": source_local,
-                        "target_id": target_local,
-                        "peer_id": peer.id,
-                        "remote_edge_id": remote_edge.get("id", ""),
-                        "weight": remote_edge.get("weight", 1.0),
-                        "properties": str(remote_edge.get("properties", {})),
-                    },
-                )
-                logger.debug(
-                    f"Created federated edge {relationship_type} "
-                    f"from {source_local} to {target_local}"
-                )
+                for relationship_type, rows in by_type.items():
+                    # Use MERGE to avoid duplicates
+                    query = f"""
+                    UNWIND $rows AS row
+                    MATCH (source:Capsule {{id: row.source_id}})
+                    MATCH (target:Capsule {{id: row.target_id}})
+                    MERGE (source)-[r:{relationship_type}]->(target)
+                    SET r.federated = true,
+                        r.peer_id = $peer_id,
+                        r.remote_edge_id = row.remote_edge_id,
+                        r.created_at = datetime(),
+                        r.weight = row.weight,
+                        r.properties = row.properties
+                    """
+                    result = await session.run(query, {"rows": rows, "peer_id": peer.id})
+                    await result.consume()
+                    logger.debug(f"Created {len(rows)} federated {relationship_type} edges")
         except (ConnectionError, TimeoutError, OSError, RuntimeError) as e:
-            logger.error(f"Failed to create edge in Neo4j: {e}")
+            logger.error(f"Failed to create edges in Neo4j: {e}")
 
     async def _get_edge_changes(
         self,
@@ -856,15 +1122,27 @@ class SyncService:
         since: datetime | None,
         min_trust: int,
         types: list[str] | None,
-    ) -> list[dict[str, Any]]:
-        """Get local capsules that changed since a timestamp."""
+        after: tuple[str, str] | None = None,
+    ) -> tuple[list[dict[str, Any]], tuple[str, str] | None]:
+        """
+        Get one page of local capsules that changed since a timestamp.
+
+        Pages are ordered by (updated_at, id); pass the returned position
+        back as after to continue.
+
+        Returns:
+            Tuple of (capsules, position of the page's last row or None if
+            this was the last page)
+        """
         try:
-            # Build query to get capsules modified since last sync
+            # Build query to get capsules modified since last sync.
+            # Capsules created by federation never echo back to peers.
             query = """
             MATCH (c:Capsule)
             WHERE c.trust_level >= $min_trust
+              AND coalesce(c.federated, false) = false
             """
-            params: dict[str, Any] = {"min_trust": min_trust}
+            params: dict[str, Any] = {"min_trust": min_trust, "limit": self.PUSH_PAGE_SIZE + 1}
 
             if since:
                 query += " AND c.updated_at > $since"
@@ -874,41 +1152,45 @@ class SyncService:
                 query += " AND c.type IN $types"
                 params["types"] = types
 
+            if after:
+                query += (
+                    " AND (c.updated_at > $after_updated_at"
+                    " OR (c.updated_at = $after_updated_at AND c.id > $after_id))"
+                )
+                params["after_updated_at"], params["after_id"] = after
+
             query += """
             RETURN c {
                 .id, .title, .content, .type, .trust_level,
                 .owner_id, .created_at, .updated_at, .content_hash, .tags
             } AS capsule
-            ORDER BY c.updated_at DESC
-            LIMIT 500
+            ORDER BY c.updated_at ASC, c.id ASC
+            LIMIT $limit
             """
 
             async with self.driver.session() as session:
                 result = await session.run(query, params)
                 records = await result.data()
 
-                capsules = []
-                for record in records:
-                    capsule_data = record.get("capsule")
-                    if capsule_data:
-                        # Filter out capsules that originated from this peer (prevent echo)
-                        # by checking if they have a federated source
-                        capsule_id = capsule_data.get("id")
-                        if capsule_id:
-                            # Check if this is a federated capsule - skip if from any peer
-                            is_federated = any(
-                                fc.local_capsule_id == capsule_id
-                                for fc in self._federated_capsules.values()
-                            )
-                            if not is_federated:
-                                capsules.append(capsule_data)
-
-                logger.debug(f"Found {len(capsules)} local changes since {since}")
-                return capsules
+            rows = [record["capsule"] for record in records if record.get("capsule")]
+            next_after = None
+            if len(rows) > self.PUSH_PAGE_SIZE:
+                rows = rows[: self.PUSH_PAGE_SIZE]
+                next_after = (str(rows[-1].get("updated_at")), str(rows[-1].get("id")))
+
+            # Filter out capsules that originated from a peer (prevent echo)
+            capsules = [
+                capsule_data
+                for capsule_data in rows
+                if capsule_data.get("id") and capsule_data["id"] not in self._local_origins
+            ]
+
+            logger.debug(f"Found {len(capsules)} local changes since {since}")
+            return capsules, next_after
 
         except (ConnectionError, TimeoutError, OSError, RuntimeError) as e:
             logger.error(f"Failed to get local changes: {e}")
-            return []
+            return [], None
 
     def _create_skipped_state(self, peer_id: str) -> SyncState:
         """Create a sync state for a skipped sync."""
@@ -980,6 +1262,7 @@ class SyncService:
                     p.sync_direction = $sync_direction,
                     p.conflict_resolution = $conflict_resolution,
                     p.last_sync_at = $last_sync_at,
+                    p.pull_cursor = $pull_cursor,
                     p.created_at = $created_at,
                     p.updated_at = $updated_at,
                     p.metadata = $metadata
@@ -1005,6 +1288,7 @@ class SyncService:
                         "last_sync_at": peer.last_sync_at.isoformat()
                         if peer.last_sync_at
                         else None,
+                        "pull_cursor": peer.pull_cursor,
                         "created_at": peer.registered_at.isoformat()
                         if peer.registered_at
                         else None,
@@ -1072,6 +1356,7 @@ class SyncService:
                             last_sync_at=datetime.fromisoformat(peer_data["last_sync_at"])
                             if peer_data.get("last_sync_at")
                             else None,
+                            pull_cursor=peer_data.get("pull_cursor"),
                             registered_at=datetime.fromisoformat(peer_data["created_at"])
                             if peer_data.get("created_at")
                             else datetime.now(UTC),
@@ -1189,50 +1474,59 @@ class SyncService:
 
     async def _persist_federated_capsule(self, fed_capsule: FederatedCapsule) -> bool:
         """Persist a federated capsule mapping to Neo4j."""
+        return await self._persist_federated_capsules([fed_capsule])
+
+    async def _persist_federated_capsules(self, fed_capsules: list[FederatedCapsule]) -> bool:
+        """Persist federated capsule mappings to Neo4j in one write."""
+        if not fed_capsules:
+            return True
+
+        rows = [
+            {
+                "peer_id": fed_capsule.peer_id,
+                "remote_capsule_id": fed_capsule.remote_capsule_id,
+                "local_capsule_id": fed_capsule.local_capsule_id,
+                "remote_content_hash": fed_capsule.remote_content_hash,
+                "local_content_hash": fed_capsule.local_content_hash,
+                "sync_status": fed_capsule.sync_status.value
+                if hasattr(fed_capsule.sync_status, "value")
+                else str(fed_capsule.sync_status),
+                "remote_title": fed_capsule.remote_title,
+                "remote_type": fed_capsule.remote_type,
+                "remote_trust_level": fed_capsule.remote_trust_level,
+                "remote_owner_id": fed_capsule.remote_owner_id,
+                "last_synced_at": fed_capsule.last_synced_at.isoformat()
+                if fed_capsule.last_synced_at
+                else None,
+                "conflict_reason": fed_capsule.conflict_reason,
+            }
+            for fed_capsule in fed_capsules
+        ]
+
         try:
             async with self.driver.session() as session:
                 query = """
+                UNWIND $rows AS row
                 MERGE (fc:FederatedCapsule {
-                    peer_id: $peer_id,
-                    remote_capsule_id: $remote_capsule_id
+                    peer_id: row.peer_id,
+                    remote_capsule_id: row.remote_capsule_id
                 })
-                SET fc.local_capsule_id = $local_capsule_id,
-                    fc.remote_content_hash = $remote_content_hash,
-                    fc.local_content_hash = $local_content_hash,
-                    fc.sync_status = $sync_status,
-                    fc.remote_title = $remote_title,
-                    fc.remote_type = $remote_type,
-                    fc.remote_trust_level = $remote_trust_level,
-                    fc.remote_owner_id = $remote_owner_id,
-                    fc.last_synced_at = $last_synced_at,
-                    fc.conflict_reason = $conflict_reason
-                RETURN fc.peer_id AS peer_id
+                SET fc.local_capsule_id = row.local_capsule_id,
+                    fc.remote_content_hash = row.remote_content_hash,
+                    fc.local_content_hash = row.local_content_hash,
+                    fc.sync_status = row.sync_status,
+                    fc.remote_title = row.remote_title,
+                    fc.remote_type = row.remote_type,
+                    fc.remote_trust_level = row.remote_trust_level,
+                    fc.remote_owner_id = row.remote_owner_id,
+                    fc.last_synced_at = row.last_synced_at,
+                    fc.conflict_reason = row.conflict_reason
                 """
-                result = await session.run(
-                    query,
-                    {
-                        "peer_id": fed_capsule.peer_id,
-                        "remote_capsule_id": fed_capsule.remote_capsule_id,
-                        "local_capsule_id": fed_capsule.local_capsule_id,
-                        "remote_content_hash": fed_capsule.remote_content_hash,
-                        "local_content_hash": fed_capsule.local_content_hash,
-                        "sync_status": fed_capsule.sync_status.value
-                        if hasattr(fed_capsule.sync_status, "value")
-                        else str(fed_capsule.sync_status),
-                        "remote_title": fed_capsule.remote_title,
-                        "remote_type": fed_capsule.remote_type,
-                        "remote_trust_level": fed_capsule.remote_trust_level,
-                        "remote_owner_id": fed_capsule.remote_owner_id,
-                        "last_synced_at": fed_capsule.last_synced_at.isoformat()
-                        if fed_capsule.last_synced_at
-                        else None,
-                        "conflict_reason": fed_capsule.conflict_reason,
-                    },
-                )
-                await result.single()
+                result = await session.run(query, {"rows": rows})
+                await result.consume()
                 return True
         except (ConnectionError, TimeoutError, OSError, RuntimeError) as e:
-            logger.error(f"Failed to persist federated capsule mapping: {e}")
+            logger.error(f"Failed to persist {len(rows)} federated capsule mappings: {e}")
             return False
 
     async def _load_federated_capsules_from_db(self) -> None:
@@ -1265,8 +1559,7 @@ class SyncService:
                             else None,
                             conflict_reason=fc_data.get("conflict_reason"),
                         )
-                        key = f"{fed_capsule.peer_id}:{fed_capsule.remote_capsule_id}"
-                        self._federated_capsules[key] = fed_capsule
+                        self._track_federated_capsule(fed_capsule)
                     except (ValueError, KeyError, TypeError) as e:
                         logger.error(f"Failed to parse federated capsule: {e}")
 
@@ -1280,44 +1573,53 @@ class SyncService:
 
     async def _persist_federated_edge(self, fed_edge: FederatedEdge) -> bool:
         """Persist a federated edge mapping to Neo4j."""
+        return await self._persist_federated_edges([fed_edge])
+
+    async def _persist_federated_edges(self, fed_edges: list[FederatedEdge]) -> bool:
+        """Persist federated edge mappings to Neo4j in one write."""
+        if not fed_edges:
+            return True
+
+        rows = [
+            {
+                "id": fed_edge.id,
+                "peer_id": fed_edge.peer_id,
+                "remote_edge_id": fed_edge.remote_edge_id,
+                "source_capsule_id": fed_edge.source_capsule_id,
+                "target_capsule_id": fed_edge.target_capsule_id,
+                "relationship_type": fed_edge.relationship_type,
+                "source_is_local": fed_edge.source_is_local,
+                "target_is_local": fed_edge.target_is_local,
+                "sync_status": fed_edge.sync_status.value
+                if hasattr(fed_edge.sync_status, "value")
+                else str(fed_edge.sync_status),
+                "last_synced_at": fed_edge.last_synced_at.isoformat()
+                if fed_edge.last_synced_at
+                else None,
+            }
+            for fed_edge in fed_edges
+        ]
+
         try:
             async with self.driver.session() as session:
                 query = """
-                MERGE (fe:FederatedEdge {id: $id})
-                SET fe.peer_id = $peer_id,
-                    fe.remote_edge_id = $remote_edge_id,
-                    fe.source_capsule_id = $source_capsule_id,
-                    fe.target_capsule_id = $target_capsule_id,
-                    fe.relationship_type = $relationship_type,
-                    fe.source_is_local = $source_is_local,
-                    fe.target_is_local = $target_is_local,
-                    fe.sync_status = $sync_status,
-                    fe.last_synced_at = $last_synced_at
-                RETURN fe.id AS id
+                UNWIND $rows AS row
+                MERGE (fe:FederatedEdge {id: row.id})
+                SET fe.peer_id = row.peer_id,
+                    fe.remote_edge_id = row.remote_edge_id,
+                    fe.source_capsule_id = row.source_capsule_id,
+                    fe.target_capsule_id = row.target_capsule_id,
+                    fe.relationship_type = row.relationship_type,
+                    fe.source_is_local = row.source_is_local,
+                    fe.target_is_local = row.target_is_local,
+                    fe.sync_status = row.sync_status,
+                    fe.last_synced_at = row.last_synced_at
                 """
-                result = await session.run(
-                    query,
-                    {
-                        "id": fed_edge.id,
-                        "peer_id": fed_edge.peer_id,
-                        "remote_edge_id": fed_edge.remote_edge_id,
-                        "source_capsule_id": fed_edge.source_capsule_id,
-                        "target_capsule_id": fed_edge.target_capsule_id,
-                        "relationship_type": fed_edge.relationship_type,
-                        "source_is_local": fed_edge.source_is_local,
-                        "target_is_local": fed_edge.target_is_local,
-                        "sync_status": fed_edge.sync_status.value
-                        if hasattr(fed_edge.sync_status, "value")
-                        else str(fed_edge.sync_status),
-                        "last_synced_at": fed_edge.last_synced_at.isoformat()
-                        if fed_edge.last_synced_at
-                        else None,
-                    },
-                )
-                await result.single()
+                result = await session.run(query, {"rows": rows})
+                await result.consume()
                 return True
         except (ConnectionError, TimeoutError, OSError, RuntimeError) as e:
-            logger.error(f"Failed to persist federated edge mapping: {e}")
+            logger.error(f"Failed to persist {len(rows)} federated edge mappings: {e}")
             return False
 
     async def _load_federated_edges_from_db(self) -> None:
@@ -8,6 +8,7 @@ It coordinates overlays through the seven-phase pipeline.
 from .event_system import (
     EventBus,
     EventSystem,  # Alias for EventBus
+    PartitionKey,
     emit,
     get_event_bus,
     init_event_bus,
@@ -66,6 +67,7 @@ __all__ = [
     # Event System
     "EventBus",
     "EventSystem",  # Alias
+    "PartitionKey",
     "get_event_bus",
     "init_event_bus",
     "shutdown_event_bus",
@@ -6,13 +6,23 @@ overlay coordination, and real-time updates.
 
 PERSISTENCE: Cascade chains are now persisted to Neo4j via CascadeRepository
 to survive server restarts. Active chains are loaded on startup.
+
+SHARDING: Events can be partitioned across N worker shards by a partition
+key (correlation_id, capsule_id or event type). Ordering is preserved for
+events sharing a key while unrelated events are dispatched in parallel.
+
+BATCHING: publish_many() enqueues a list of events in one call, and
+subscribe_batch() delivers events to a handler in micro-batches, flushed
+after N events or T milliseconds, whichever comes first.
 """
 
 import asyncio
+import time
 from collections import defaultdict, deque
 from collections.abc import Callable, Coroutine
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
+from enum import Enum
 from typing import TYPE_CHECKING, Any
 from uuid import uuid4
 
@@ -28,6 +38,25 @@ logger = structlog.get_logger()
 
 # Type alias for event handlers
 EventHandler = Callable[[Event], Coroutine[Any, Any, None]]
+BatchEventHandler = Callable[[list[Event]], Coroutine[Any, Any, None]]
+
+
+# Event models use enum values, so event.type/event.priority may arrive as
+# plain strings. Priorities are compared by rank, not by their string value.
+_PRIORITY_RANK = {
+    EventPriority.LOW: 0,
+    EventPriority.NORMAL: 1,
+    EventPriority.HIGH: 2,
+    EventPriority.CRITICAL: 3,
+}
+
+
+class PartitionKey(str, Enum):
+    """Key used to assign events to worker shards."""
+
+    CORRELATION_ID = "correlation_id"
+    CAPSULE_ID = "capsule_id"
+    EVENT_TYPE = "event_type"
 
 
 @dataclass
@@ -35,19 +64,31 @@ class Subscription:
     """Represents an event subscription."""
 
     id: str
-    handler: EventHandler
+    handler: EventHandler | BatchEventHandler
     event_types: set[EventType]
     min_priority: EventPriority = EventPriority.LOW
     filter_func: Callable[[Event], bool] | None = None
+    # Micro-batching: 0 delivers events one at a time, otherwise the handler
+    # receives a list of up to batch_size events, flushed after batch_wait_ms
+    batch_size: int = 0
+    batch_wait_ms: float = 0.0
+
+    @property
+    def is_batched(self) -> bool:
+        """Whether this subscription receives events in batches."""
+        return self.batch_size > 0
 
     def matches(self, event: Event) -> bool:
         """Check if this subscription matches an event."""
         # Check event type
-        if event.type not in self.event_types:
+        if EventType(event.type) not in self.event_types:
             return False
 
         # Check priority
-        if event.priority.value < self.min_priority.value:
+        if (
+            _PRIORITY_RANK[EventPriority(event.priority)]
+            < _PRIORITY_RANK[EventPriority(self.min_priority)]
+        ):
             return False
 
         # Apply custom filter if present
@@ -82,6 +123,60 @@ class EventMetrics:
             self.avg_delivery_time_ms = sum(self.delivery_times) / len(self.delivery_times)
 
 
+@dataclass
+class ShardMetrics:
+    """
+    Per-shard dispatch metrics.
+
+    Lag is the time an event spent queued before its shard worker
+    picked it up.
+    """
+
+    shard: int
+    events_processed: int = 0
+    last_lag_ms: float = 0.0
+    max_lag_ms: float = 0.0
+    lag_times: deque[float] = field(default_factory=lambda: deque(maxlen=1000))
+
+    def record_lag(self, lag_ms: float) -> None:
+        """Record the queue lag of a dequeued event."""
+        self.events_processed += 1
+        self.last_lag_ms = lag_ms
+        self.lag_times.append(lag_ms)
+        if lag_ms > self.max_lag_ms:
+            self.max_lag_ms = lag_ms
+
+    @property
+    def avg_lag_ms(self) -> float:
+        if not self.lag_times:
+            return 0.0
+        return sum(self.lag_times) / len(self.lag_times)
+
+
+@dataclass
+class BatchBuffer:
+    """
+    Pending events for a batched subscription.
+
+    Events are cut into batches synchronously and appended to ``ready`` so
+    batches are delivered in order no matter which task drains them.
+    """
+
+    events: list[Event] = field(default_factory=list)
+    ready: deque[list[Event]] = field(default_factory=deque)
+    flush_handle: asyncio.TimerHandle | None = None
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+
+    def cut(self) -> None:
+        """Move buffered events into a ready batch and cancel the flush timer."""
+        if self.flush_handle is not None:
+            self.flush_handle.cancel()
+            self.flush_handle = None
+        if self.events:
+            self.ready.append(self.events)
+            self.events = []
+
+
 class EventBus:
     """
     Async event bus for pub/sub messaging.
@@ -92,6 +187,12 @@ class EventBus:
     - Cascade propagation
     - Dead letter queue for failed events
     - Metrics collection
+    - Sharded dispatch with per-partition ordering
+    - Bulk publishing and micro-batched subscriber delivery
+
+    With ``num_shards > 1`` each shard has its own queue and worker. Events
+    are routed by ``partition_key`` so events sharing a key are delivered
+    in publish order, while a slow subscriber only delays its own shard.
     """
 
     # SECURITY FIX (Audit 4 - H13): Maximum dead letter queue size to prevent memory exhaustion
@@ -107,9 +208,21 @@ class EventBus:
         max_dead_letter_size: int = 1000,
         max_subscribers: int = 10000,
         cascade_repository: "CascadeRepository | None" = None,
+        num_shards: int = 1,
+        partition_key: PartitionKey | str = PartitionKey.CORRELATION_ID,
     ):
+        if num_shards < 1:
+            raise ValueError("num_shards must be at least 1")
+
         self._subscriptions: dict[str, Subscription] = {}
-        self._event_queue: asyncio.Queue[Event] = asyncio.Queue(maxsize=max_queue_size)
+        # Each shard owns a bounded queue of (event, enqueue_time) pairs.
+        # max_queue_size bounds every shard individually.
+        self._num_shards = num_shards
+        self._partition_key = PartitionKey(partition_key)
+        self._shard_queues: list[asyncio.Queue[tuple[Event, float]]] = [
+            asyncio.Queue(maxsize=max_queue_size) for _ in range(num_shards)
+        ]
+        self._shard_metrics = [ShardMetrics(shard=i) for i in range(num_shards)]
         # SECURITY FIX (Audit 4 - H13): Bound the dead letter queue to prevent DoS
         self._dead_letter_queue: asyncio.Queue[tuple[Event, Exception]] = asyncio.Queue(
             maxsize=max_dead_letter_size
@@ -120,11 +233,17 @@ class EventBus:
         self._retry_delay = retry_delay_seconds
         self._max_subscribers = max_subscribers
         self._running = False
+        # Supervisor task that runs one worker coroutine per shard
         self._worker_task: asyncio.Task[None] | None = None
 
         # Event type index for faster lookups
         self._type_index: dict[EventType, set[str]] = defaultdict(set)
 
+        # Pending events for batched subscriptions, keyed by subscription ID
+        self._batch_buffers: dict[str, BatchBuffer] = {}
+        # Timer-triggered flush tasks (held to prevent garbage collection)
+        self._batch_tasks: set[asyncio.Task[None]] = set()
+
         # PERSISTENCE: Optional cascade repository for Neo4j persistence
         self._cascade_repo = cascade_repository
 
@@ -151,6 +270,63 @@ class EventBus:
         Returns:
             Subscription ID for unsubscribing
         """
+        subscription = Subscription(
+            id=str(uuid4()),
+            handler=handler,
+            event_types=event_types,
+            min_priority=min_priority,
+            filter_func=filter_func,
+        )
+        return self._add_subscription(subscription)
+
+    def subscribe_batch(
+        self,
+        handler: BatchEventHandler,
+        event_types: set[EventType],
+        max_batch_size: int = 100,
+        max_wait_ms: float = 50.0,
+        min_priority: EventPriority = EventPriority.LOW,
+        filter_func: Callable[[Event], bool] | None = None,
+    ) -> str:
+        """
+        Subscribe to events delivered in micro-batches.
+
+        The handler receives a list of events once max_batch_size events
+        are pending or max_wait_ms has passed since the first of them
+        arrived, whichever comes first. Events are delivered in the order
+        they were dispatched.
+
+        Args:
+            handler: Async function taking a list of events
+            event_types: Set of event types to subscribe to
+            max_batch_size: Maximum events per handler call
+            max_wait_ms: Maximum time an event waits for its batch to fill
+            min_priority: Minimum priority to receive
+            filter_func: Optional additional filter
+
+        Returns:
+            Subscription ID for unsubscribing
+        """
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be at least 1")
+        if max_wait_ms < 0:
+            raise ValueError("max_wait_ms must not be negative")
+
+        subscription = Subscription(
+            id=str(uuid4()),
+            handler=handler,
+            event_types=event_types,
+            min_priority=min_priority,
+            filter_func=filter_func,
+            batch_size=max_batch_size,
+            batch_wait_ms=max_wait_ms,
+        )
+        sub_id = self._add_subscription(subscription)
+        self._batch_buffers[sub_id] = BatchBuffer()
+        return sub_id
+
+    def _add_subscription(self, subscription: Subscription) -> str:
+        """Register a subscription and index it by event type."""
         # SECURITY FIX (Audit 7 - Session 2): Enforce subscriber limit
         if len(self._subscriptions) >= self._max_subscribers:
             logger.error(
@@ -163,26 +339,18 @@ class EventBus:
                 "Cannot add more subscriptions."
             )
 
-        sub_id = str(uuid4())
-
-        subscription = Subscription(
-            id=sub_id,
-            handler=handler,
-            event_types=event_types,
-            min_priority=min_priority,
-            filter_func=filter_func,
-        )
-
+        sub_id = subscription.id
         self._subscriptions[sub_id] = subscription
 
         # Update type index
-        for event_type in event_types:
+        for event_type in subscription.event_types:
             self._type_index[event_type].add(sub_id)
 
         logger.info(
             "event_subscription_created",
             subscription_id=sub_id,
-            event_types=[et.value for et in event_types],
+            event_types=[et.value for et in subscription.event_types],
+            batch_size=subscription.batch_size or None,
         )
 
         return sub_id
@@ -214,6 +382,11 @@ class EventBus:
         for event_type in subscription.event_types:
             self._type_index[event_type].discard(subscription_id)
 
+        # Drop events still waiting for a batch flush
+        buffer = self._batch_buffers.pop(subscription_id, None)
+        if buffer is not None:
+            buffer.cut()
+
         logger.info("event_subscription_removed", subscription_id=subscription_id)
         return True
 
@@ -258,20 +431,7 @@ class EventBus:
             timestamp=datetime.now(UTC),
         )
 
-        # SECURITY FIX (Audit 7 - Session 2): Backpressure - timeout if queue full
-        try:
-            await asyncio.wait_for(self._event_queue.put(event), timeout=10.0)
-        except TimeoutError:
-            logger.error(
-                "event_queue_backpressure",
-                event_type=event_type.value,
-                queue_size=self._event_queue.qsize(),
-                detail="Event queue full - publish timed out after 10s",
-            )
-            raise RuntimeError(
-                f"Event queue full ({self._event_queue.qsize()} events). "
-                "Backpressure timeout exceeded."
-            )
+        await self._enqueue(event)
         self._metrics.events_published += 1
 
         # Alert if dead letter queue is getting full
@@ -293,6 +453,103 @@ class EventBus:
 
         return event
 
+    async def publish_many(
+        self,
+        event_type: EventType,
+        payloads: list[dict[str, Any]],
+        source: str,
+        priority: EventPriority = EventPriority.NORMAL,
+        target: str | None = None,
+        correlation_id: str | None = None,
+        metadata: dict[str, Any] | None = None,
+    ) -> list[Event]:
+        """
+        Publish one event per payload in a single call.
+
+        Intended for bulk operations such as capsule imports. Events are
+        enqueued in payload order, so with a shared correlation_id (or a
+        capsule_id partition key) they are dispatched in that order.
+
+        Args:
+            event_type: Type of every event
+            payloads: Event data, one entry per event
+            source: Source identifier
+            priority: Event priority
+            target: Optional specific target
+            correlation_id: Shared correlation ID (a fresh one per event if None)
+            metadata: Additional metadata copied onto every event
+
+        Returns:
+            Created Events, in payload order
+        """
+        now = datetime.now(UTC)
+        target_overlays = [target] if target else None
+        events = [
+            Event(
+                id=str(uuid4()),
+                type=event_type,
+                payload=payload,
+                source=source,
+                priority=priority,
+                target_overlays=target_overlays,
+                correlation_id=correlation_id or str(uuid4()),
+                metadata=dict(metadata) if metadata else {},
+                timestamp=now,
+            )
+            for payload in payloads
+        ]
+
+        for event in events:
+            await self._enqueue(event)
+            self._metrics.events_published += 1
+
+        logger.debug(
+            "events_published",
+            event_type=event_type.value,
+            source=source,
+            count=len(events),
+        )
+
+        return events
+
+    async def _enqueue(self, event: Event) -> None:
+        """Put an event on its shard queue, applying backpressure."""
+        queue = self._shard_queues[self._shard_for(event)]
+
+        # Fast path: avoid wrapping put() in a wait_for task when there is room
+        if not queue.full():
+            queue.put_nowait((event, time.monotonic()))
+            return
+
+        # SECURITY FIX (Audit 7 - Session 2): Backpressure - timeout if queue full
+        try:
+            await asyncio.wait_for(queue.put((event, time.monotonic())), timeout=10.0)
+        except TimeoutError:
+            logger.error(
+                "event_queue_backpressure",
+                event_type=EventType(event.type).value,
+                queue_size=queue.qsize(),
+                detail="Event queue full - publish timed out after 10s",
+            )
+            raise RuntimeError(
+                f"Event queue full ({queue.qsize()} events). Backpressure timeout exceeded."
+            )
+
+    def _shard_for(self, event: Event) -> int:
+        """Return the shard index an event is routed to."""
+        if self._num_shards == 1:
+            return 0
+
+        key: Any
+        if self._partition_key == PartitionKey.EVENT_TYPE:
+            key = EventType(event.type).value
+        elif self._partition_key == PartitionKey.CAPSULE_ID:
+            key = event.payload.get("capsule_id") or event.correlation_id or event.id
+        else:
+            key = event.correlation_id or event.id
+
+        return hash(str(key)) % self._num_shards
+
     async def emit(
         self,
         event_type: EventType,
@@ -620,23 +877,39 @@ class EventBus:
         start_time = asyncio.get_running_loop().time()
 
         # Find matching subscriptions using type index
-        potential_subs = self._type_index.get(event.type, set())
+        potential_subs = self._type_index.get(EventType(event.type), set())
 
         tasks = []
+        full_batches = []
         for sub_id in potential_subs:
             subscription = self._subscriptions.get(sub_id)
             if subscription and subscription.matches(event):
-                tasks.append(self._deliver_event(subscription, event))
+                if subscription.is_batched:
+                    if self._buffer_event(subscription, event):
+                        full_batches.append(self._drain_batches(subscription))
+                else:
+                    tasks.append(self._deliver_event(subscription, event))
+
+        if full_batches:
+            await asyncio.gather(*full_batches)
 
-        if tasks:
+        results: list[Any] = []
+        if len(tasks) == 1:
+            # Single subscriber: await directly instead of scheduling a gather
+            try:
+                await tasks[0]
+                results.append(None)
+            except Exception as e:  # Intentional broad catch: as gather() would
+                results.append(e)
+        elif tasks:
             results = await asyncio.gather(*tasks, return_exceptions=True)
 
-            for result in results:
-                if isinstance(result, Exception):
-                    self._metrics.events_failed += 1
-                    logger.error("event_delivery_failed", event_id=event.id, error=str(result))
-                else:
-                    self._metrics.events_delivered += 1
+        for result in results:
+            if isinstance(result, Exception):
+                self._metrics.events_failed += 1
+                logger.error("event_delivery_failed", event_id=event.id, error=str(result))
+            else:
+                self._metrics.events_delivered += 1
 
         # Record metrics
         duration_ms = (asyncio.get_running_loop().time() - start_time) * 1000
@@ -644,24 +917,40 @@ class EventBus:
 
     async def _deliver_event(
         self, subscription: Subscription, event: Event, attempt: int = 1
+    ) -> None:
+        """Deliver event to a single subscriber with retry logic."""
+        await self._deliver(subscription, [event], attempt)
+
+    async def _deliver(
+        self, subscription: Subscription, events: list[Event], attempt: int = 1
     ) -> None:
         """
-        Deliver event to a single subscriber with retry logic.
+        Deliver events to a subscriber with retry logic.
+
+        Batched subscriptions receive the whole list in one handler call,
+        other subscriptions receive the single event. On final failure every
+        event is sent to the dead letter queue.
 
         Uses iterative retry instead of recursion to prevent stack overflow
         with high max_retries values.
         """
+        event_id = events[0].id
 
         for current_attempt in range(attempt, self._max_retries + 1):
             try:
+                call = (
+                    subscription.handler(events)  # type: ignore[arg-type]
+                    if subscription.is_batched
+                    else subscription.handler(events[0])  # type: ignore[arg-type]
+                )
                 await asyncio.wait_for(
-                    subscription.handler(event),
+                    call,
                     timeout=30.0,  # 30 second timeout per handler
                 )
                 return  # Success - exit
             except TimeoutError:
                 logger.warning(
-                    "event_handler_timeout", subscription_id=subscription.id, event_id=event.id
+                    "event_handler_timeout", subscription_id=subscription.id, event_id=event_id
                 )
                 raise
             except Exception as e:  # Intentional broad catch: event handlers are user-provided and may raise any exception
@@ -669,7 +958,8 @@ class EventBus:
                     logger.warning(
                         "event_delivery_retry",
                         subscription_id=subscription.id,
-                        event_id=event.id,
+                        event_id=event_id,
+                        batch_size=len(events),
                         attempt=current_attempt,
                         error=str(e),
                         error_type=type(e).__name__,
@@ -679,43 +969,137 @@ class EventBus:
                 else:
                     # All retries exhausted - send to dead letter queue
                     # Use timeout to prevent blocking if queue is full
-                    try:
-                        await asyncio.wait_for(
-                            self._dead_letter_queue.put((event, e)),
-                            timeout=5.0,  # 5 second timeout for dead letter queue
-                        )
-                    except TimeoutError:
-                        logger.error(
-                            "dead_letter_queue_full",
-                            subscription_id=subscription.id,
-                            event_id=event.id,
-                            queue_size=self._dead_letter_queue.qsize(),
-                        )
+                    for event in events:
+                        try:
+                            await asyncio.wait_for(
+                                self._dead_letter_queue.put((event, e)),
+                                timeout=5.0,  # 5 second timeout for dead letter queue
+                            )
+                        except TimeoutError:
+                            logger.error(
+                                "dead_letter_queue_full",
+                                subscription_id=subscription.id,
+                                event_id=event.id,
+                                queue_size=self._dead_letter_queue.qsize(),
+                            )
+                            break
                     raise
 
-    async def _worker(self) -> None:
-        """Background worker that processes events from the queue."""
-        logger.info("event_worker_started")
+    # =========================================================================
+    # Batched Delivery
+    # =========================================================================
+
+    def _buffer_event(self, subscription: Subscription, event: Event) -> bool:
+        """
+        Add an event to a batched subscription's buffer.
+
+        Returns:
+            True if the buffer reached batch_size and a batch is ready to drain
+        """
+        buffer = self._batch_buffers.get(subscription.id)
+        if buffer is None:
+            return False
+
+        buffer.events.append(event)
+        if len(buffer.events) >= subscription.batch_size:
+            buffer.cut()
+            return True
+
+        if buffer.flush_handle is None:
+            buffer.flush_handle = asyncio.get_running_loop().call_later(
+                subscription.batch_wait_ms / 1000, self._on_batch_timer, subscription.id
+            )
+        return False
+
+    def _on_batch_timer(self, subscription_id: str) -> None:
+        """Flush a partially filled batch once its wait time has elapsed."""
+        buffer = self._batch_buffers.get(subscription_id)
+        subscription = self._subscriptions.get(subscription_id)
+        if buffer is None or subscription is None:
+            return
+
+        buffer.flush_handle = None
+        buffer.cut()
+        task = asyncio.create_task(self._drain_batches(subscription))
+        self._batch_tasks.add(task)
+        task.add_done_callback(self._batch_tasks.discard)
+
+    async def _drain_batches(self, subscription: Subscription) -> None:
+        """Deliver all ready batches for a subscription, in order."""
+        buffer = self._batch_buffers.get(subscription.id)
+        if buffer is None:
+            return
+
+        async with buffer.lock:
+            while buffer.ready:
+                batch = buffer.ready.popleft()
+                start_time = asyncio.get_running_loop().time()
+                try:
+                    await self._deliver(subscription, batch)
+                    self._metrics.events_delivered += len(batch)
+                except Exception as e:  # Intentional broad catch: isolate failed batch
+                    self._metrics.events_failed += len(batch)
+                    logger.error(
+                        "event_batch_delivery_failed",
+                        subscription_id=subscription.id,
+                        batch_size=len(batch),
+                        error=str(e),
+                    )
+                duration_ms = (asyncio.get_running_loop().time() - start_time) * 1000
+                self._metrics.record_delivery(duration_ms)
+
+    async def _flush_all_batches(self) -> None:
+        """Deliver every pending batch immediately."""
+        drains = []
+        for sub_id, buffer in list(self._batch_buffers.items()):
+            subscription = self._subscriptions.get(sub_id)
+            if subscription is None:
+                continue
+            buffer.cut()
+            if buffer.ready:
+                drains.append(self._drain_batches(subscription))
+
+        if drains:
+            await asyncio.gather(*drains)
+        if self._batch_tasks:
+            await asyncio.gather(*self._batch_tasks, return_exceptions=True)
+
+    async def _worker(self, shard: int = 0) -> None:
+        """Background worker that processes events from one shard queue."""
+        queue = self._shard_queues[shard]
+        shard_metrics = self._shard_metrics[shard]
+        logger.info("event_worker_started", shard=shard)
 
         while self._running:
             try:
-                # Wait for event with timeout to allow checking _running
-                try:
-                    event = await asyncio.wait_for(self._event_queue.get(), timeout=1.0)
-                except TimeoutError:
-                    continue
+                if not queue.empty():
+                    event, enqueued_at = queue.get_nowait()
+                else:
+                    # Wait for event with timeout to allow checking _running
+                    try:
+                        event, enqueued_at = await asyncio.wait_for(queue.get(), timeout=1.0)
+                    except TimeoutError:
+                        continue
 
-                await self._process_event(event)
-                self._event_queue.task_done()
+                shard_metrics.record_lag((time.monotonic() - enqueued_at) * 1000)
+                try:
+                    await self._process_event(event)
+                finally:
+                    queue.task_done()
 
             except Exception as e:  # Intentional broad catch: prevents background task death
                 logger.error(
                     "event_worker_error",
+                    shard=shard,
                     error=str(e),
                     error_type=type(e).__name__,
                 )
 
-        logger.info("event_worker_stopped")
+        logger.info("event_worker_stopped", shard=shard)
+
+    async def _run_workers(self) -> None:
+        """Run one worker per shard until cancelled."""
+        await asyncio.gather(*(self._worker(shard) for shard in range(self._num_shards)))
 
     # =========================================================================
     # Lifecycle Management
@@ -741,8 +1125,12 @@ class EventBus:
                 )
 
         self._running = True
-        self._worker_task = asyncio.create_task(self._worker())
-        logger.info("event_bus_started")
+        self._worker_task = asyncio.create_task(self._run_workers())
+        logger.info(
+            "event_bus_started",
+            num_shards=self._num_shards,
+            partition_key=self._partition_key.value,
+        )
 
     async def stop(self, timeout: float = 10.0) -> None:
         """
@@ -754,13 +1142,24 @@ class EventBus:
         if not self._running:
             return
 
-        self._running = False
+        # Wait for all shard queues to drain while the workers are still running
+        try:
+            await asyncio.wait_for(
+                asyncio.gather(*(queue.join() for queue in self._shard_queues)),
+                timeout=timeout,
+            )
+        except TimeoutError:
+            logger.warning("event_bus_stop_timeout", pending_events=self.get_queue_size())
 
-        # Wait for queue to drain
+        # Deliver partially filled batches rather than dropping them
         try:
-            await asyncio.wait_for(self._event_queue.join(), timeout=timeout)
+            await asyncio.wait_for(self._flush_all_batches(), timeout=timeout)
         except TimeoutError:
-            logger.warning("event_bus_stop_timeout", pending_events=self._event_queue.qsize())
+            logger.warning(
+                "event_bus_batch_flush_timeout", pending_events=self.get_pending_batch_size()
+            )
+
+        self._running = False
 
         # Cancel worker
         if self._worker_task:
@@ -796,7 +1195,7 @@ class EventBus:
 
     async def retry_dead_letter(self, event: Event) -> None:
         """Retry a dead letter event by re-publishing it."""
-        await self._event_queue.put(event)
+        await self._shard_queues[self._shard_for(event)].put((event, time.monotonic()))
 
     # =========================================================================
     # Metrics & Monitoring
@@ -810,19 +1209,44 @@ class EventBus:
             "events_failed": self._metrics.events_failed,
             "cascade_chains": self._metrics.cascade_chains,
             "avg_delivery_time_ms": round(self._metrics.avg_delivery_time_ms, 2),
-            "queue_size": self._event_queue.qsize(),
+            "queue_size": self.get_queue_size(),
             "dead_letter_size": self._dead_letter_queue.qsize(),
             "active_subscriptions": len(self._subscriptions),
             "active_cascades": len(self._cascade_chains),
+            "num_shards": self._num_shards,
+            "partition_key": self._partition_key.value,
+            "shards": self.get_shard_metrics(),
+            "pending_batched_events": self.get_pending_batch_size(),
         }
 
+    def get_shard_metrics(self) -> list[dict[str, Any]]:
+        """Get queue depth and lag metrics for each shard."""
+        return [
+            {
+                "shard": metrics.shard,
+                "queue_depth": self._shard_queues[metrics.shard].qsize(),
+                "events_processed": metrics.events_processed,
+                "last_lag_ms": round(metrics.last_lag_ms, 2),
+                "avg_lag_ms": round(metrics.avg_lag_ms, 2),
+                "max_lag_ms": round(metrics.max_lag_ms, 2),
+            }
+            for metrics in self._shard_metrics
+        ]
+
     def get_subscription_count(self) -> int:
         """Get number of active subscriptions."""
         return len(self._subscriptions)
 
     def get_queue_size(self) -> int:
-        """Get current event queue size."""
-        return self._event_queue.qsize()
+        """Get current event queue size across all shards."""
+        return sum(queue.qsize() for queue in self._shard_queues)
+
+    def get_pending_batch_size(self) -> int:
+        """Get number of events waiting in batched subscription buffers."""
+        return sum(
+            len(buffer.events) + sum(len(batch) for batch in buffer.ready)
+            for buffer in self._batch_buffers.values()
+        )
 
 
 # =============================================================================
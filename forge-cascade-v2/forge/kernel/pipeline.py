@@ -12,15 +12,20 @@ Phases:
 5. EXECUTION - Core processing and state changes
 6. PROPAGATION - Cascade effect handling, event emission
 7. SETTLEMENT - Finalization, audit logging
+
+DAG SCHEDULING: Phases (via PhaseConfig.reads/writes) and overlays (via
+BaseOverlay.READS/WRITES) may declare the context.data keys they read and
+write. Work that does not conflict runs concurrently; undeclared work is
+ordered as before, so the default pipeline still runs in PHASE_ORDER.
 """
 
 import asyncio
 from collections import deque
-from collections.abc import Callable
-from dataclasses import dataclass, field
+from collections.abc import Callable, Coroutine, Hashable
+from dataclasses import dataclass, field, replace
 from datetime import UTC, datetime
 from enum import Enum
-from typing import Any
+from typing import Any, TypeVar
 from uuid import uuid4
 
 import structlog
@@ -28,12 +33,14 @@ import structlog
 from ..models.base import OverlayState
 from ..models.events import Event, EventType
 from ..models.overlay import Capability, FuelBudget
-from ..overlays.base import OverlayContext, OverlayError, OverlayResult
+from ..overlays.base import BaseOverlay, OverlayContext, OverlayError, OverlayResult
 from .event_system import EventBus, get_event_bus
 from .overlay_manager import OverlayManager, get_overlay_manager
 
 logger = structlog.get_logger()
 
+NodeT = TypeVar("NodeT", bound=Hashable)
+
 
 class PipelinePhase(str, Enum):
     """The seven phases of the Forge pipeline."""
@@ -110,6 +117,13 @@ class PhaseConfig:
     parallel: bool = False  # Execute overlays in parallel
     max_retries: int = 0
     retry_delay_ms: int = 100
+    # context.data keys this phase reads and writes. None means undeclared:
+    # the phase is derived from its overlays' READS/WRITES if they all declare
+    # them, otherwise it is ordered after and before every other phase.
+    reads: frozenset[str] | None = None
+    writes: frozenset[str] | None = None
+    # Phases that must complete first regardless of declared data access
+    depends_on: frozenset[PipelinePhase] = frozenset()
 
 
 @dataclass
@@ -182,6 +196,9 @@ class PipelineResult:
     duration_ms: float = 0.0
     started_at: datetime | None = None
     completed_at: datetime | None = None
+    # Longest chain of dependent phases and the sum of their durations
+    critical_path: list[PipelinePhase] = field(default_factory=list)
+    critical_path_ms: float = 0.0
 
     @property
     def success(self) -> bool:
@@ -211,6 +228,12 @@ class Pipeline:
         PipelinePhase.SETTLEMENT,
     ]
 
+    # Phases that act on a request wait for VALIDATION (and for the approval
+    # and state change before them) even when their data access is disjoint
+    _GATED_BY_VALIDATION = frozenset({PipelinePhase.VALIDATION})
+    _GATED_BY_CONSENSUS = _GATED_BY_VALIDATION | {PipelinePhase.CONSENSUS}
+    _GATED_BY_EXECUTION = _GATED_BY_CONSENSUS | {PipelinePhase.EXECUTION}
+
     # Default phase configurations
     DEFAULT_PHASE_CONFIGS = {
         PipelinePhase.INGESTION: PhaseConfig(
@@ -230,15 +253,27 @@ class Pipeline:
             timeout_ms=5000,
             required=False,  # Not all actions need consensus
             enabled=True,
+            depends_on=_GATED_BY_VALIDATION,
         ),
         PipelinePhase.EXECUTION: PhaseConfig(
-            name=PipelinePhase.EXECUTION, timeout_ms=10000, required=True, max_retries=1
+            name=PipelinePhase.EXECUTION,
+            timeout_ms=10000,
+            required=True,
+            max_retries=1,
+            depends_on=_GATED_BY_CONSENSUS,
         ),
         PipelinePhase.PROPAGATION: PhaseConfig(
-            name=PipelinePhase.PROPAGATION, timeout_ms=5000, required=True, parallel=True
+            name=PipelinePhase.PROPAGATION,
+            timeout_ms=5000,
+            required=True,
+            parallel=True,
+            depends_on=_GATED_BY_EXECUTION,
         ),
         PipelinePhase.SETTLEMENT: PhaseConfig(
-            name=PipelinePhase.SETTLEMENT, timeout_ms=3000, required=True
+            name=PipelinePhase.SETTLEMENT,
+            timeout_ms=3000,
+            required=True,
+            depends_on=_GATED_BY_EXECUTION,
         ),
     }
 
@@ -269,7 +304,10 @@ class Pipeline:
         """
         self._overlay_manager = overlay_manager
         self._event_bus = event_bus
-        self._phase_configs = phase_configs or self.DEFAULT_PHASE_CONFIGS.copy()
+        # Copy each default config so per-pipeline changes don't leak into the class defaults
+        self._phase_configs = phase_configs or {
+            phase: replace(config) for phase, config in self.DEFAULT_PHASE_CONFIGS.items()
+        }
 
         self._logger = logger.bind(component="pipeline")
 
@@ -403,6 +441,184 @@ class Pipeline:
                 skip_phases=skip_phases,
             )
 
+    async def execute_batch(
+        self,
+        inputs: list[dict[str, Any]],
+        triggered_by: str = "batch",
+        event: Event | None = None,
+        user_id: str | None = None,
+        trust_flame: int = 60,
+        capabilities: set[Capability] | None = None,
+        fuel_budget: FuelBudget | None = None,
+        metadata: dict[str, Any] | None = None,
+        skip_phases: set[PipelinePhase] | None = None,
+    ) -> list[PipelineResult]:
+        """
+        Execute the pipeline over a batch of inputs.
+
+        Each phase runs once over every item still in flight: overlays are
+        looked up once per phase and called through run_batch(), so overlays
+        that override execute_batch() process the whole batch in one call.
+        An item whose required phase fails drops out of later phases without
+        affecting the rest of the batch. Phases run in PHASE_ORDER.
+
+        Args:
+            inputs: Initial data, one dict per item (capsule_id is taken from it)
+            triggered_by: What triggered the pipeline
+            event: Triggering event (if any)
+            user_id: User context
+            trust_flame: Trust level
+            capabilities: Capabilities to grant
+            fuel_budget: Resource limits
+            metadata: Additional context
+            skip_phases: Phases to skip
+
+        Returns:
+            One PipelineResult per input, in input order
+        """
+        if not inputs:
+            return []
+
+        async with self._semaphore:
+            return await self._execute_batch_inner(
+                inputs=inputs,
+                triggered_by=triggered_by,
+                event=event,
+                user_id=user_id,
+                trust_flame=trust_flame,
+                capabilities=capabilities,
+                fuel_budget=fuel_budget,
+                metadata=metadata,
+                skip_phases=skip_phases,
+            )
+
+    async def _execute_batch_inner(
+        self,
+        inputs: list[dict[str, Any]],
+        triggered_by: str,
+        event: Event | None,
+        user_id: str | None,
+        trust_flame: int,
+        capabilities: set[Capability] | None,
+        fuel_budget: FuelBudget | None,
+        metadata: dict[str, Any] | None,
+        skip_phases: set[PipelinePhase] | None,
+    ) -> list[PipelineResult]:
+        """Inner batch execution logic (called under semaphore)."""
+        # Items of one batch share a correlation ID
+        correlation_id = event.correlation_id if event and event.correlation_id else str(uuid4())
+        granted = capabilities or set()
+
+        contexts = [
+            PipelineContext(
+                pipeline_id=str(uuid4()),
+                correlation_id=correlation_id,
+                triggered_by=triggered_by,
+                trigger_event=event,
+                user_id=user_id,
+                trust_flame=trust_flame,
+                capsule_id=item.get("capsule_id"),
+                data=item.copy(),
+                capabilities=granted,
+                fuel_budget=fuel_budget,
+                metadata=dict(metadata) if metadata else {},
+            )
+            for item in inputs
+        ]
+        for context in contexts:
+            self._active_pipelines[context.pipeline_id] = context
+
+        self._logger.info(
+            "pipeline_batch_started",
+            correlation_id=correlation_id,
+            triggered_by=triggered_by,
+            batch_size=len(contexts),
+        )
+
+        errors: list[list[str]] = [[] for _ in contexts]
+        in_flight = list(range(len(contexts)))
+        phase_deps: dict[PipelinePhase, set[PipelinePhase]] = {}
+        phase_timings: dict[PipelinePhase, tuple[float, float]] = {}
+        previous: PipelinePhase | None = None
+        start_time = asyncio.get_running_loop().time()
+
+        try:
+            for phase in self.PHASE_ORDER:
+                config = self._phase_configs.get(phase)
+                if not config or not config.enabled:
+                    continue
+                if skip_phases and phase in skip_phases:
+                    continue
+                if not in_flight:
+                    break
+
+                batch = [contexts[i] for i in in_flight]
+                for context in batch:
+                    context.current_phase = phase
+                    await self._run_pre_phase_hooks(context, phase)
+
+                phase_start = asyncio.get_running_loop().time()
+                phase_results = await self._execute_phase_batch(batch, phase, config)
+                phase_timings[phase] = (phase_start, asyncio.get_running_loop().time())
+                phase_deps[phase] = {previous} if previous else set()
+                previous = phase
+
+                still_in_flight = []
+                for i, context, phase_result in zip(in_flight, batch, phase_results, strict=True):
+                    context.phase_results[phase] = phase_result
+                    if phase_result.data:
+                        context.data.update(phase_result.data)
+                    await self._run_post_phase_hooks(context, phase_result)
+                    if self._check_phase_result(context, phase_result, config, errors[i]):
+                        still_in_flight.append(i)
+                in_flight = still_in_flight
+
+        except asyncio.CancelledError:
+            for item_errors in errors:
+                item_errors.append("Pipeline cancelled")
+            self._logger.warning("pipeline_batch_cancelled", correlation_id=correlation_id)
+
+        except (PipelineError, PhaseError, OverlayError, RuntimeError, ValueError, KeyError) as e:
+            for item_errors in errors:
+                item_errors.append(f"Pipeline error: {str(e)}")
+            self._logger.error(
+                "pipeline_batch_error",
+                correlation_id=correlation_id,
+                error=str(e),
+                error_type=type(e).__name__,
+                exc_info=True,
+            )
+
+        finally:
+            for context in contexts:
+                self._active_pipelines.pop(context.pipeline_id, None)
+
+        duration_ms = (asyncio.get_running_loop().time() - start_time) * 1000
+        results = []
+        for context, item_errors in zip(contexts, errors, strict=True):
+            item_timings = {p: t for p, t in phase_timings.items() if p in context.phase_results}
+            results.append(
+                await self._finalize_pipeline(
+                    context,
+                    item_errors,
+                    [],
+                    duration_ms,
+                    _critical_path(phase_deps, item_timings),
+                )
+            )
+
+        self._logger.info(
+            "pipeline_batch_completed",
+            correlation_id=correlation_id,
+            batch_size=len(results),
+            succeeded=sum(1 for r in results if r.success),
+            duration_ms=round(duration_ms, 2),
+        )
+
+        await self._emit_pipeline_events(results)
+
+        return results
+
     async def _execute_inner(
         self,
         input_data: dict[str, Any],
@@ -451,70 +667,41 @@ class Pipeline:
         events_emitted: list[str] = []
         start_time = asyncio.get_running_loop().time()
 
-        try:
-            for phase in self.PHASE_ORDER:
-                config = self._phase_configs.get(phase)
-
-                # Skip disabled phases
-                if not config or not config.enabled:
-                    continue
-
-                # Skip explicitly skipped phases
-                if skip_phases and phase in skip_phases:
-                    continue
-
-                context.current_phase = phase
-
-                # Pre-phase hooks
-                for hook in self._pre_phase_hooks:
-                    try:
-                        await self._run_hook(hook, context, phase)
-                    except (TypeError, ValueError, AttributeError, RuntimeError) as e:
-                        self._logger.warning(
-                            "pre_phase_hook_error",
-                            phase=phase.value,
-                            error=str(e),
-                            error_type=type(e).__name__,
-                        )
-
-                # Execute phase
-                phase_result = await self._execute_phase(context, phase, config)
-                context.phase_results[phase] = phase_result
+        phases = [
+            phase
+            for phase in self.PHASE_ORDER
+            if (config := self._phase_configs.get(phase)) is not None
+            and config.enabled
+            and not (skip_phases and phase in skip_phases)
+        ]
+        phase_deps = self._build_phase_dependencies(phases)
+        phase_timings: dict[PipelinePhase, tuple[float, float]] = {}
+
+        async def run_phase(phase: PipelinePhase, exclusive: bool) -> bool:
+            config = self._phase_configs[phase]
+            context.current_phase = phase
+            await self._run_pre_phase_hooks(context, phase)
+
+            # Execute phase. Concurrent phases work on their own snapshot and
+            # only the keys they changed are merged back.
+            data = context.data if exclusive else dict(context.data)
+            before = dict(data)
+            phase_start = asyncio.get_running_loop().time()
+            phase_result = await self._execute_phase(context, phase, config, data)
+            phase_timings[phase] = (phase_start, asyncio.get_running_loop().time())
+            context.phase_results[phase] = phase_result
+
+            # Merge phase data into context
+            if not exclusive:
+                context.data.update(_changed_keys(before, data))
+            if phase_result.data:
+                context.data.update(_changed_keys(before, phase_result.data))
+
+            await self._run_post_phase_hooks(context, phase_result)
+            return self._check_phase_result(context, phase_result, config, errors)
 
-                # Merge phase data into context
-                if phase_result.data:
-                    context.data.update(phase_result.data)
-
-                # Post-phase hooks
-                for hook in self._post_phase_hooks:
-                    try:
-                        await self._run_hook(hook, context, phase_result)
-                    except (TypeError, ValueError, AttributeError, RuntimeError) as e:
-                        self._logger.warning(
-                            "post_phase_hook_error",
-                            phase=phase.value,
-                            error=str(e),
-                            error_type=type(e).__name__,
-                        )
-
-                # Handle phase failure
-                if phase_result.status == PipelineStatus.FAILED:
-                    errors.extend(phase_result.errors)
-
-                    if config.required:
-                        self._logger.error(
-                            "pipeline_phase_failed",
-                            pipeline_id=pipeline_id,
-                            phase=phase.value,
-                            errors=phase_result.errors,
-                        )
-                        break
-                    else:
-                        self._logger.warning(
-                            "pipeline_optional_phase_failed",
-                            pipeline_id=pipeline_id,
-                            phase=phase.value,
-                        )
+        try:
+            await _run_dag(phases, phase_deps, run_phase)
 
         except asyncio.CancelledError:
             errors.append("Pipeline cancelled")
@@ -533,6 +720,90 @@ class Pipeline:
         finally:
             del self._active_pipelines[pipeline_id]
 
+        result = await self._finalize_pipeline(
+            context,
+            errors,
+            events_emitted,
+            (asyncio.get_running_loop().time() - start_time) * 1000,
+            _critical_path(phase_deps, phase_timings),
+        )
+
+        # Emit completion event
+        await self._emit_pipeline_event(result)
+
+        return result
+
+    async def _run_pre_phase_hooks(self, context: PipelineContext, phase: PipelinePhase) -> None:
+        """Run pre-phase hooks, logging rather than raising hook errors."""
+        for hook in self._pre_phase_hooks:
+            try:
+                await self._run_hook(hook, context, phase)
+            except (TypeError, ValueError, AttributeError, RuntimeError) as e:
+                self._logger.warning(
+                    "pre_phase_hook_error",
+                    phase=phase.value,
+                    error=str(e),
+                    error_type=type(e).__name__,
+                )
+
+    async def _run_post_phase_hooks(
+        self, context: PipelineContext, phase_result: PhaseResult
+    ) -> None:
+        """Run post-phase hooks, logging rather than raising hook errors."""
+        for hook in self._post_phase_hooks:
+            try:
+                await self._run_hook(hook, context, phase_result)
+            except (TypeError, ValueError, AttributeError, RuntimeError) as e:
+                self._logger.warning(
+                    "post_phase_hook_error",
+                    phase=phase_result.phase.value,
+                    error=str(e),
+                    error_type=type(e).__name__,
+                )
+
+    def _check_phase_result(
+        self,
+        context: PipelineContext,
+        phase_result: PhaseResult,
+        config: PhaseConfig,
+        errors: list[str],
+    ) -> bool:
+        """
+        Record a phase failure.
+
+        Returns:
+            False if a required phase failed and the pipeline must stop
+        """
+        if phase_result.status != PipelineStatus.FAILED:
+            return True
+
+        errors.extend(phase_result.errors)
+
+        if config.required:
+            self._logger.error(
+                "pipeline_phase_failed",
+                pipeline_id=context.pipeline_id,
+                phase=phase_result.phase.value,
+                errors=phase_result.errors,
+            )
+            return False
+
+        self._logger.warning(
+            "pipeline_optional_phase_failed",
+            pipeline_id=context.pipeline_id,
+            phase=phase_result.phase.value,
+        )
+        return True
+
+    async def _finalize_pipeline(
+        self,
+        context: PipelineContext,
+        errors: list[str],
+        events_emitted: list[str],
+        duration_ms: float,
+        critical_path: list[PipelinePhase],
+    ) -> PipelineResult:
+        """Build the result, run completion hooks and record history."""
         # Determine final status
         failed_required = any(
             r.status == PipelineStatus.FAILED and self._phase_configs[p].required
@@ -540,12 +811,11 @@ class Pipeline:
         )
 
         status = PipelineStatus.FAILED if failed_required or errors else PipelineStatus.COMPLETED
-        duration_ms = (asyncio.get_running_loop().time() - start_time) * 1000
 
         # Build result
         result = PipelineResult(
-            pipeline_id=pipeline_id,
-            correlation_id=correlation_id,
+            pipeline_id=context.pipeline_id,
+            correlation_id=context.correlation_id,
             status=status,
             phases=context.phase_results,
             final_data=context.data,
@@ -554,6 +824,8 @@ class Pipeline:
             duration_ms=duration_ms,
             started_at=context.started_at,
             completed_at=datetime.now(UTC),
+            critical_path=critical_path,
+            critical_path_ms=sum(context.phase_results[p].duration_ms for p in critical_path),
         )
 
         # Completion hooks
@@ -572,21 +844,94 @@ class Pipeline:
 
         self._logger.info(
             "pipeline_completed",
-            pipeline_id=pipeline_id,
+            pipeline_id=context.pipeline_id,
             status=status.value,
             duration_ms=round(duration_ms, 2),
             phases_completed=len(context.phase_results),
+            critical_path=[p.value for p in critical_path],
         )
 
-        # Emit completion event
-        await self._emit_pipeline_event(result)
-
         return result
 
+    def _get_phase_overlays(self, phase: PipelinePhase) -> list[BaseOverlay]:
+        """Get the active overlays registered for a phase."""
+        overlay_names = self.PHASE_OVERLAYS.get(phase, [])
+        if not overlay_names:
+            return []
+
+        manager = self._get_overlay_manager()
+
+        # Get available overlays (filter to active state only)
+        overlays = []
+        for name in overlay_names:
+            found = manager.get_by_name(name)
+            overlays.extend(
+                [o for o in found if o.state is not None and o.state == OverlayState.ACTIVE]
+            )
+        return overlays
+
+    def _phase_access(
+        self, phase: PipelinePhase, config: PhaseConfig
+    ) -> tuple[frozenset[str] | None, frozenset[str] | None]:
+        """
+        Resolve the context.data keys a phase reads and writes.
+
+        Explicit PhaseConfig declarations win. Otherwise a phase run by its
+        overlays takes the union of their declarations, and a phase with no
+        active overlays passes data through untouched.
+        """
+        if config.reads is not None and config.writes is not None:
+            return config.reads, config.writes
+        if phase in self._custom_handlers:
+            return config.reads, config.writes
+
+        overlays = self._get_phase_overlays(phase)
+        reads: frozenset[str] | None = frozenset()
+        writes: frozenset[str] | None = frozenset()
+        for overlay in overlays:
+            reads = None if reads is None or overlay.READS is None else reads | overlay.READS
+            writes = None if writes is None or overlay.WRITES is None else writes | overlay.WRITES
+
+        return (
+            config.reads if config.reads is not None else reads,
+            config.writes if config.writes is not None else writes,
+        )
+
+    def _build_phase_dependencies(
+        self, phases: list[PipelinePhase]
+    ) -> dict[PipelinePhase, set[PipelinePhase]]:
+        """Map each phase to the earlier phases it must wait for."""
+        access = {phase: self._phase_access(phase, self._phase_configs[phase]) for phase in phases}
+        deps: dict[PipelinePhase, set[PipelinePhase]] = {}
+        for i, phase in enumerate(phases):
+            reads, writes = access[phase]
+            explicit = self._phase_configs[phase].depends_on
+            deps[phase] = {
+                earlier
+                for earlier in phases[:i]
+                if earlier in explicit or _conflicts(*access[earlier], reads, writes)
+            }
+        return deps
+
     async def _execute_phase(
-        self, context: PipelineContext, phase: PipelinePhase, config: PhaseConfig
+        self,
+        context: PipelineContext,
+        phase: PipelinePhase,
+        config: PhaseConfig,
+        data: dict[str, Any] | None = None,
     ) -> PhaseResult:
-        """Execute a single phase."""
+        """
+        Execute a single phase.
+
+        Args:
+            context: Pipeline context
+            phase: Phase to execute
+            config: Phase configuration
+            data: Input data (defaults to context.data)
+        """
+        if data is None:
+            data = context.data
+
         start_time = asyncio.get_running_loop().time()
         started_at = datetime.now(UTC)
 
@@ -615,34 +960,14 @@ class Pipeline:
                 )
 
         # Default: execute registered overlays for this phase
-        overlay_names = self.PHASE_OVERLAYS.get(phase, [])
-        if not overlay_names:
-            # No overlays for this phase, pass through
-            return PhaseResult(
-                phase=phase,
-                status=PipelineStatus.COMPLETED,
-                data=context.data.copy(),
-                duration_ms=(asyncio.get_running_loop().time() - start_time) * 1000,
-                started_at=started_at,
-                completed_at=datetime.now(UTC),
-            )
-
-        manager = self._get_overlay_manager()
-
-        # Get available overlays (filter to active state only)
-        overlays = []
-        for name in overlay_names:
-            found = manager.get_by_name(name)
-            overlays.extend(
-                [o for o in found if o.state is not None and o.state == OverlayState.ACTIVE]
-            )
+        overlays = self._get_phase_overlays(phase)
 
         if not overlays:
             # No active overlays, pass through
             return PhaseResult(
                 phase=phase,
                 status=PipelineStatus.COMPLETED,
-                data=context.data.copy(),
+                data=data.copy(),
                 duration_ms=(asyncio.get_running_loop().time() - start_time) * 1000,
                 started_at=started_at,
                 completed_at=datetime.now(UTC),
@@ -652,30 +977,16 @@ class Pipeline:
         results: list[OverlayResult] = []
         executed: list[str] = []
         errors: list[str] = []
-        merged_data = context.data.copy()
+        merged_data = data.copy()
 
         try:
             if config.parallel:
                 # Execute in parallel
                 tasks = []
                 for overlay in overlays:
-                    overlay_ctx = OverlayContext(
-                        overlay_id=overlay.id,
-                        overlay_name=overlay.NAME,
-                        execution_id=str(uuid4()),
-                        triggered_by=f"pipeline:{context.pipeline_id}",
-                        correlation_id=context.correlation_id,
-                        user_id=context.user_id,
-                        trust_flame=context.trust_flame,
-                        capsule_id=context.capsule_id,
-                        proposal_id=context.proposal_id,
-                        capabilities=context.capabilities | overlay.REQUIRED_CAPABILITIES,
-                        fuel_budget=context.fuel_budget,
-                        metadata={"phase": phase.value, **context.metadata},
-                    )
-
+                    overlay_ctx = self._create_overlay_context(context, phase, overlay)
                     task = asyncio.create_task(
-                        overlay.run(overlay_ctx, context.trigger_event, context.data)
+                        overlay.run(overlay_ctx, context.trigger_event, data)
                     )
                     tasks.append((overlay.NAME, task))
 
@@ -702,47 +1013,49 @@ class Pipeline:
                         except (OverlayError, RuntimeError, ValueError, TypeError, KeyError) as e:
                             errors.append(f"{name}: {str(e)}")
             else:
-                # Execute sequentially
-                for overlay in overlays:
-                    overlay_ctx = OverlayContext(
-                        overlay_id=overlay.id,
-                        overlay_name=overlay.NAME,
-                        execution_id=str(uuid4()),
-                        triggered_by=f"pipeline:{context.pipeline_id}",
-                        correlation_id=context.correlation_id,
-                        user_id=context.user_id,
-                        trust_flame=context.trust_flame,
-                        capsule_id=context.capsule_id,
-                        proposal_id=context.proposal_id,
-                        capabilities=context.capabilities | overlay.REQUIRED_CAPABILITIES,
-                        fuel_budget=context.fuel_budget,
-                        metadata={"phase": phase.value, **context.metadata},
-                    )
+                # Execute sequentially, except that overlays declaring
+                # non-conflicting READS/WRITES run concurrently
+
+                async def run_overlay(overlay: BaseOverlay, exclusive: bool) -> bool:
+                    overlay_ctx = self._create_overlay_context(context, phase, overlay)
+                    overlay_data = merged_data if exclusive else merged_data.copy()
+                    before = {} if exclusive else dict(overlay_data)
 
                     try:
                         overlay_result = await asyncio.wait_for(
-                            overlay.run(overlay_ctx, context.trigger_event, merged_data),
+                            overlay.run(overlay_ctx, context.trigger_event, overlay_data),
                             timeout=config.timeout_ms / 1000,
                         )
                         results.append(overlay_result)
                         executed.append(overlay.NAME)
 
+                        if not exclusive:
+                            merged_data.update(_changed_keys(before, overlay_data))
                         if overlay_result.success and overlay_result.data:
                             merged_data.update(overlay_result.data)
                         elif not overlay_result.success:
                             errors.append(f"{overlay.NAME}: {overlay_result.error}")
-                            if config.required:
-                                break
+                            return not config.required
 
                     except TimeoutError:
                         errors.append(f"{overlay.NAME}: timeout")
-                        if config.required:
-                            break
+                        return not config.required
 
                     except (OverlayError, RuntimeError, ValueError, TypeError, KeyError) as e:
                         errors.append(f"{overlay.NAME}: {str(e)}")
-                        if config.required:
-                            break
+                        return not config.required
+
+                    return True
+
+                overlay_deps = {
+                    overlay: {
+                        earlier
+                        for earlier in overlays[:i]
+                        if _conflicts(earlier.READS, earlier.WRITES, overlay.READS, overlay.WRITES)
+                    }
+                    for i, overlay in enumerate(overlays)
+                }
+                await _run_dag(overlays, overlay_deps, run_overlay)
 
         except (
             OverlayError,
@@ -781,6 +1094,181 @@ class Pipeline:
             completed_at=datetime.now(UTC),
         )
 
+    def _create_overlay_context(
+        self,
+        context: PipelineContext,
+        phase: PipelinePhase,
+        overlay: BaseOverlay,
+        batch: bool = False,
+    ) -> OverlayContext:
+        """
+        Build the execution context for one overlay run within a phase.
+
+        With batch=True the context is shared by every item of a batch, so
+        item-specific fields (pipeline and capsule IDs) are left out.
+        """
+        return OverlayContext(
+            overlay_id=overlay.id,
+            overlay_name=overlay.NAME,
+            execution_id=str(uuid4()),
+            triggered_by=(
+                f"pipeline_batch:{context.correlation_id}"
+                if batch
+                else f"pipeline:{context.pipeline_id}"
+            ),
+            correlation_id=context.correlation_id,
+            user_id=context.user_id,
+            trust_flame=context.trust_flame,
+            capsule_id=None if batch else context.capsule_id,
+            proposal_id=context.proposal_id,
+            capabilities=context.capabilities | overlay.REQUIRED_CAPABILITIES,
+            fuel_budget=context.fuel_budget,
+            metadata={"phase": phase.value, **context.metadata},
+        )
+
+    async def _execute_phase_batch(
+        self,
+        contexts: list[PipelineContext],
+        phase: PipelinePhase,
+        config: PhaseConfig,
+    ) -> list[PhaseResult]:
+        """Execute a single phase over a batch of pipeline contexts."""
+        # Custom handlers take one context at a time
+        if phase in self._custom_handlers:
+            return [await self._execute_phase(context, phase, config) for context in contexts]
+
+        start_time = asyncio.get_running_loop().time()
+        started_at = datetime.now(UTC)
+        overlays = self._get_phase_overlays(phase)
+
+        if not overlays:
+            # No active overlays, pass through
+            duration_ms = (asyncio.get_running_loop().time() - start_time) * 1000
+            return [
+                PhaseResult(
+                    phase=phase,
+                    status=PipelineStatus.COMPLETED,
+                    data=context.data.copy(),
+                    duration_ms=duration_ms,
+                    started_at=started_at,
+                    completed_at=datetime.now(UTC),
+                )
+                for context in contexts
+            ]
+
+        merged = [context.data.copy() for context in contexts]
+        executed: list[list[str]] = [[] for _ in contexts]
+        errors: list[list[str]] = [[] for _ in contexts]
+        failed = [False] * len(contexts)
+        # Items stop at their first failure when the phase is required
+        stopped = [False] * len(contexts)
+        template = contexts[0]
+
+        def record(index: int, name: str, overlay_result: OverlayResult) -> None:
+            executed[index].append(name)
+            if overlay_result.success and overlay_result.data:
+                merged[index].update(overlay_result.data)
+            elif not overlay_result.success:
+                failed[index] = True
+                errors[index].append(f"{name}: {overlay_result.error}")
+                stopped[index] = config.required
+
+        def record_error(indices: list[int], name: str, error: str) -> None:
+            for index in indices:
+                failed[index] = True
+                errors[index].append(f"{name}: {error}")
+                stopped[index] = config.required
+
+        try:
+            if config.parallel:
+                timeout = config.timeout_ms * len(contexts) / 1000
+                tasks = [
+                    (
+                        overlay.NAME,
+                        asyncio.create_task(
+                            overlay.run_batch(
+                                self._create_overlay_context(template, phase, overlay, batch=True),
+                                [context.data for context in contexts],
+                                template.trigger_event,
+                            )
+                        ),
+                    )
+                    for overlay in overlays
+                ]
+                done, pending = await asyncio.wait([t for _, t in tasks], timeout=timeout)
+                for task in pending:
+                    task.cancel()
+
+                indices = list(range(len(contexts)))
+                for name, task in tasks:
+                    if task not in done:
+                        continue
+                    try:
+                        for index, overlay_result in enumerate(task.result()):
+                            record(index, name, overlay_result)
+                    except (OverlayError, RuntimeError, ValueError, TypeError, KeyError) as e:
+                        record_error(indices, name, str(e))
+            else:
+                for overlay in overlays:
+                    indices = [i for i in range(len(contexts)) if not stopped[i]]
+                    if not indices:
+                        break
+
+                    try:
+                        overlay_results = await asyncio.wait_for(
+                            overlay.run_batch(
+                                self._create_overlay_context(template, phase, overlay, batch=True),
+                                [merged[i] for i in indices],
+                                template.trigger_event,
+                            ),
+                            timeout=config.timeout_ms * len(indices) / 1000,
+                        )
+                        for index, overlay_result in zip(indices, overlay_results, strict=True):
+                            record(index, overlay.NAME, overlay_result)
+
+                    except TimeoutError:
+                        record_error(indices, overlay.NAME, "timeout")
+
+                    except (OverlayError, RuntimeError, ValueError, TypeError, KeyError) as e:
+                        record_error(indices, overlay.NAME, str(e))
+
+        except (
+            OverlayError,
+            PipelineError,
+            RuntimeError,
+            ValueError,
+            TypeError,
+            KeyError,
+            asyncio.CancelledError,
+        ) as e:
+            record_error(list(range(len(contexts))), "phase", f"Phase execution error: {str(e)}")
+
+        duration_ms = (asyncio.get_running_loop().time() - start_time) * 1000
+        completed_at = datetime.now(UTC)
+
+        self._logger.debug(
+            "phase_batch_completed",
+            phase=phase.value,
+            batch_size=len(contexts),
+            failed=sum(failed),
+            overlays=len(overlays),
+            duration_ms=round(duration_ms, 2),
+        )
+
+        return [
+            PhaseResult(
+                phase=phase,
+                status=PipelineStatus.FAILED if failed[i] else PipelineStatus.COMPLETED,
+                data=merged[i],
+                overlays_executed=executed[i],
+                errors=errors[i],
+                duration_ms=duration_ms,
+                started_at=started_at,
+                completed_at=completed_at,
+            )
+            for i in range(len(contexts))
+        ]
+
     async def _run_handler(self, handler: PhaseHandler, context: PipelineContext) -> PhaseResult:
         """Run a custom phase handler."""
         if asyncio.iscoroutinefunction(handler):
@@ -814,6 +1302,33 @@ class Pipeline:
             correlation_id=result.correlation_id,
         )
 
+    async def _emit_pipeline_events(self, results: list[PipelineResult]) -> None:
+        """Emit completion events for a batch, one publish call per event type."""
+        event_bus = self._get_event_bus()
+
+        for success, event_type in (
+            (True, EventType.CASCADE_COMPLETE),
+            (False, EventType.SYSTEM_EVENT),
+        ):
+            payloads = [
+                {
+                    "pipeline_id": result.pipeline_id,
+                    "status": result.status.value,
+                    "duration_ms": result.duration_ms,
+                    "phases_completed": len(result.phases),
+                    "success": result.success,
+                }
+                for result in results
+                if result.success is success
+            ]
+            if payloads:
+                await event_bus.publish_many(
+                    event_type=event_type,
+                    payloads=payloads,
+                    source="pipeline",
+                    correlation_id=results[0].correlation_id,
+                )
+
     # =========================================================================
     # Control
     # =========================================================================
@@ -860,6 +1375,107 @@ class Pipeline:
         }
 
 
+# =========================================================================
+# DAG Scheduling Helpers
+# =========================================================================
+
+
+def _overlaps(a: frozenset[str] | None, b: frozenset[str] | None) -> bool:
+    """Check whether two key sets intersect, treating None as all keys."""
+    if a is None:
+        return b is None or bool(b)
+    if b is None:
+        return bool(a)
+    return not a.isdisjoint(b)
+
+
+def _conflicts(
+    reads_a: frozenset[str] | None,
+    writes_a: frozenset[str] | None,
+    reads_b: frozenset[str] | None,
+    writes_b: frozenset[str] | None,
+) -> bool:
+    """Check whether two units of work must be ordered (RAW, WAR or WAW)."""
+    return (
+        _overlaps(writes_a, reads_b)
+        or _overlaps(reads_a, writes_b)
+        or _overlaps(writes_a, writes_b)
+    )
+
+
+def _changed_keys(before: dict[str, Any], after: dict[str, Any]) -> dict[str, Any]:
+    """Return the entries of after that were added or replaced since before."""
+    return {k: v for k, v in after.items() if k not in before or before[k] is not v}
+
+
+async def _run_dag(
+    nodes: list[NodeT],
+    deps: dict[NodeT, set[NodeT]],
+    run: Callable[[NodeT, bool], Coroutine[Any, Any, bool]],
+) -> None:
+    """
+    Run nodes as soon as their dependencies have finished.
+
+    run(node, exclusive) returns False to stop scheduling further nodes;
+    nodes already running are allowed to finish. exclusive is True when no
+    other node runs alongside, in which case the node is awaited inline, so
+    a fully ordered graph executes exactly like a sequential loop.
+    """
+    pending = list(nodes)
+    finished: set[NodeT] = set()
+    running: dict[asyncio.Task[bool], NodeT] = {}
+    stop = False
+
+    try:
+        while pending or running:
+            if not stop:
+                ready = [node for node in pending if deps.get(node, set()) <= finished]
+                for node in ready:
+                    pending.remove(node)
+
+                if len(ready) == 1 and not running:
+                    finished.add(ready[0])
+                    stop = not await run(ready[0], True)
+                    continue
+
+                for node in ready:
+                    running[asyncio.create_task(run(node, False))] = node
+
+            if not running:
+                break
+
+            done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                finished.add(running.pop(task))
+                if not task.result():
+                    stop = True
+    finally:
+        for task in running:
+            task.cancel()
+
+
+def _critical_path(
+    deps: dict[NodeT, set[NodeT]], timings: dict[NodeT, tuple[float, float]]
+) -> list[NodeT]:
+    """
+    Return the chain of nodes that determined total latency.
+
+    Starting from the node that finished last, repeatedly step to the
+    dependency that finished last, i.e. the one that gated its start.
+    """
+    if not timings:
+        return []
+
+    path = [max(timings, key=lambda node: timings[node][1])]
+    while True:
+        gating = [dep for dep in deps.get(path[-1], set()) if dep in timings]
+        if not gating:
+            break
+        path.append(max(gating, key=lambda node: timings[node][1]))
+
+    return path[::-1]
+
+
 # =========================================================================
 # Global Instance
 # =========================================================================
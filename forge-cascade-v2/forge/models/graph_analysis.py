@@ -19,7 +19,7 @@ class GraphBackend(str, Enum):
 
     GDS = "gds"  # Neo4j Graph Data Science
     CYPHER = "cypher"  # Pure Cypher queries
-    NETWORKX = "networkx"  # In-memory NetworkX
+    NETWORKX = "networkx"  # In-memory graph snapshot
 
 
 class AlgorithmType(str, Enum):
@@ -464,7 +464,11 @@ class GraphAlgorithmConfig(ForgeModel):
     max_nodes_for_networkx: int = Field(
         default=10000,
         ge=100,
-        description="Max nodes to load into NetworkX",
+        description="Max nodes to load into the in-memory backend",
+    )
+    in_memory_fallback: bool = Field(
+        default=True,
+        description="Use the in-memory backend when GDS is unavailable",
     )
     gds_graph_name: str = Field(
         default="forge_graph",
@@ -55,6 +55,14 @@ class TimeGranularity(str, Enum):
 # ═══════════════════════════════════════════════════════════════
 
 
+class DiffHunk(ForgeModel):
+    """Positional edit: replace old_count lines starting at old_start with new_lines."""
+
+    old_start: int = Field(ge=0, description="First replaced line (0-based) in the base version")
+    old_count: int = Field(ge=0, description="Number of base lines replaced")
+    new_lines: list[str] = Field(default_factory=list)
+
+
 class VersionDiff(ForgeModel):
     """Represents the difference between two versions."""
 
@@ -63,10 +71,14 @@ class VersionDiff(ForgeModel):
     modified_sections: list[dict[str, Any]] = Field(default_factory=list)
     metadata_changes: dict[str, Any] = Field(default_factory=dict)
     summary: str | None = None
+    hunks: list[DiffHunk] = Field(
+        default_factory=list,
+        description="Positional hunks; added/removed lines are a truncated preview",
+    )
 
     @property
     def is_empty(self) -> bool:
-        return not (self.added_lines or self.removed_lines or self.modified_sections)
+        return not (self.added_lines or self.removed_lines or self.modified_sections or self.hunks)
 
 
 class CapsuleVersionBase(ForgeModel):
@@ -366,6 +378,33 @@ class VersioningPolicy(ForgeModel):
         description="Force snapshot if diff exceeds this size",
     )
 
+    # Adaptive snapshot placement
+    replay_budget_bytes: int = Field(
+        default=1_000_000,
+        ge=1000,
+        description="Max content bytes replayed per reconstruction (shortens chains of large capsules)",
+    )
+    hot_read_threshold: int = Field(
+        default=20,
+        ge=1,
+        description="Recent historical reads after which a capsule counts as hot",
+    )
+    hot_max_diff_chain_length: int = Field(
+        default=3,
+        ge=1,
+        description="Max consecutive diffs for hot capsules",
+    )
+
+    def max_chain_length(self, content_size: int | None = None, hot: bool = False) -> int:
+        """Max consecutive diffs for a capsule of this size and read frequency."""
+        limit = self.max_diff_chain_length
+        if content_size:
+            # Each replayed diff rewrites the whole content
+            limit = min(limit, max(1, self.replay_budget_bytes // content_size))
+        if hot:
+            limit = min(limit, self.hot_max_diff_chain_length)
+        return limit
+
     def should_full_snapshot(
         self,
         change_number: int,
@@ -373,6 +412,9 @@ class VersioningPolicy(ForgeModel):
         is_major_version: bool,
         diff_chain_length: int,
         diff_size: int | None = None,
+        content_size: int | None = None,
+        diff_chain_bytes: int = 0,
+        hot: bool = False,
     ) -> bool:
         """Determine if a full snapshot should be created."""
         return (
@@ -380,8 +422,10 @@ class VersioningPolicy(ForgeModel):
             or change_number % self.snapshot_every_n_changes == 0  # Periodic
             or trust_level >= self.snapshot_for_trust_level  # High trust
             or is_major_version  # Major version bump
-            or diff_chain_length >= self.max_diff_chain_length  # Chain too long
+            or diff_chain_length >= self.max_chain_length(content_size, hot)  # Chain too long
             or (diff_size is not None and diff_size > self.max_diff_size_bytes)  # Diff too large
+            # Diffs since the last snapshot already outweigh the content
+            or (content_size is not None and 0 < content_size <= diff_chain_bytes)
         )
 
     def should_compact(self, version: CapsuleVersion) -> bool:
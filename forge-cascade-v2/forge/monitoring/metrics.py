@@ -617,6 +617,25 @@ canary_traffic_percent = metrics.gauge(
     ["overlay"],
 )
 
+# Security Metrics
+password_hash_duration_seconds = metrics.histogram(
+    "password_hash_duration_seconds",
+    "Password hash/verify latency in seconds, including queue wait",
+    ["operation"],
+    buckets=[0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0],
+)
+
+password_hash_pending = metrics.gauge(
+    "password_hash_pending",
+    "Password operations queued or running",
+)
+
+password_hash_shed_total = metrics.counter(
+    "password_hash_shed_total",
+    "Password operations rejected because the hashing pool was saturated",
+    ["operation"],
+)
+
 
 # =============================================================================
 # Decorators and Context Managers
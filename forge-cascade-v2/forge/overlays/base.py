@@ -147,6 +147,12 @@ class BaseOverlay(ABC):
     # Required capabilities
     REQUIRED_CAPABILITIES: set[Capability] = set()
 
+    # Input data keys this overlay reads and the keys it writes to its result
+    # data. None means undeclared; the pipeline then never runs this overlay
+    # concurrently with another overlay or phase it could conflict with.
+    READS: frozenset[str] | None = None
+    WRITES: frozenset[str] | None = None
+
     # Default fuel budget
     DEFAULT_FUEL_BUDGET = FuelBudget(
         function_name="overlay_execution",
@@ -223,6 +229,34 @@ class BaseOverlay(ABC):
         """
         pass
 
+    async def execute_batch(
+        self,
+        context: OverlayContext,
+        items: list[dict[str, Any]],
+        event: Event | None = None,
+    ) -> list[OverlayResult]:
+        """
+        Execute the overlay over a batch of inputs.
+
+        The default calls execute() once per item. Override this to process
+        the whole batch at once (e.g. one embedding request for all items).
+
+        Args:
+            context: Execution context shared by the batch
+            items: Input data, one dict per item
+            event: Triggering event (if event-driven)
+
+        Returns:
+            One OverlayResult per item, in input order
+        """
+        results: list[OverlayResult] = []
+        for item in items:
+            try:
+                results.append(await self.execute(context, event, item))
+            except (OverlayError, RuntimeError, ValueError, TypeError, KeyError, OSError) as e:
+                results.append(OverlayResult.fail(f"Overlay error: {str(e)}"))
+        return results
+
     # =========================================================================
     # Execution Wrapper
     # =========================================================================
@@ -320,6 +354,95 @@ class BaseOverlay(ABC):
             )
             return OverlayResult.fail(f"Overlay error: {str(e)}")
 
+    async def run_batch(
+        self,
+        context: OverlayContext,
+        items: list[dict[str, Any]],
+        event: Event | None = None,
+    ) -> list[OverlayResult]:
+        """
+        Run the overlay over a batch of inputs.
+
+        Applies the same checks, timeout and metrics as run(), once per
+        batch. The timeout scales with the batch size. A failure of the
+        batch as a whole fails every item.
+        """
+        if not items:
+            return []
+
+        def fail_all(error: str) -> list[OverlayResult]:
+            return [OverlayResult.fail(error) for _ in items]
+
+        if not self._initialized:
+            return fail_all("Overlay not initialized")
+
+        if self.state != OverlayState.ACTIVE:
+            return fail_all(f"Overlay in {self.state.value} state")
+
+        missing = self.REQUIRED_CAPABILITIES - context.capabilities
+        if missing:
+            return fail_all(f"Missing capabilities: {[c.value for c in missing]}")
+
+        timeout_ms = self.DEFAULT_FUEL_BUDGET.timeout_ms
+        if context.fuel_budget:
+            timeout_ms = context.fuel_budget.timeout_ms
+        timeout_ms *= len(items)
+
+        start_time = asyncio.get_running_loop().time()
+
+        try:
+            results = await asyncio.wait_for(
+                self.execute_batch(context, items, event), timeout=timeout_ms / 1000.0
+            )
+            if len(results) != len(items):
+                raise OverlayError(
+                    f"execute_batch returned {len(results)} results for {len(items)} items"
+                )
+        except TimeoutError:
+            self.execution_count += len(items)
+            self.error_count += len(items)
+            self.last_error = f"Timeout after {timeout_ms}ms"
+            self._logger.error(
+                "overlay_batch_timeout",
+                execution_id=context.execution_id,
+                timeout_ms=timeout_ms,
+                batch_size=len(items),
+            )
+            return fail_all(self.last_error)
+        except (OverlayError, RuntimeError, ValueError, TypeError, KeyError, OSError) as e:
+            self.execution_count += len(items)
+            self.error_count += len(items)
+            self.last_error = str(e)
+            self._logger.error(
+                "overlay_batch_error",
+                execution_id=context.execution_id,
+                error=str(e),
+                error_type=type(e).__name__,
+                batch_size=len(items),
+            )
+            return fail_all(f"Overlay error: {str(e)}")
+
+        duration_ms = (asyncio.get_running_loop().time() - start_time) * 1000
+        failed = [r for r in results if not r.success]
+        for result in results:
+            result.duration_ms = duration_ms / len(items)
+
+        self.execution_count += len(items)
+        self.error_count += len(failed)
+        if failed:
+            self.last_error = failed[-1].error or "Execution returned failure"
+        self.last_execution = datetime.now(UTC)
+
+        self._logger.info(
+            "overlay_batch_execution_complete",
+            execution_id=context.execution_id,
+            batch_size=len(items),
+            failed=len(failed),
+            duration_ms=round(duration_ms, 2),
+        )
+
+        return results
+
     # =========================================================================
     # Health & Status
     # =========================================================================
@@ -446,7 +446,7 @@ class GovernanceOverlay(BaseOverlay):
                 "voting_period_hours": self._config.voting_period_hours,
             },
         )
-        return True
+        return await super().initialize()
 
     async def execute(
         self,
@@ -469,7 +469,7 @@ class GovernanceOverlay(BaseOverlay):
 
         start_time = time.time()
 
-        data = input_data or {}
+        data = dict(input_data or {})
         if event:
             data.update(event.payload or {})
             data["event_type"] = event.type
@@ -0,0 +1,636 @@
+"""
+Lineage Graph Engine for Forge Cascade V2
+
+Compact in-memory derivation graph backing the LineageTrackerOverlay.
+
+Capsule IDs are interned to integer slots and parent/child adjacency is
+stored as per-slot integer arrays. The engine keeps, incrementally:
+- Node depth (longest derivation path from a root)
+- Descendant counts and trust-weighted influence, over the descendants
+  within INFLUENCE_GENERATIONS generations
+- O(1) LRU ordering for bounded-memory eviction
+- Interval reachability labels for fast ancestor and cycle checks
+
+Reachability labels follow the GRAIL scheme: every node carries an
+interval such that ``u`` reaching ``v`` implies ``v``'s interval lies
+inside ``u``'s. Together with depth ordering this answers most negative
+queries in O(1); positive candidates are confirmed with a DFS pruned by
+both tests. Labels are only ever widened by mutations, so they stay
+sound, and are rebuilt once widening has degraded them enough.
+
+Bounding influence to a fixed number of generations keeps every update
+local: a change only touches the ancestors within that many generations
+of it, so inserting into an arbitrarily deep chain stays O(1).
+"""
+
+from __future__ import annotations
+
+from array import array
+from collections import OrderedDict, deque
+from collections.abc import Iterable, Iterator, MutableMapping
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .lineage_tracker import LineageNode
+
+
+class LineageGraph(MutableMapping[str, "LineageNode"]):
+    """
+    Integer-interned lineage graph behaving as a mapping of capsule ID to node.
+
+    Storing a LineageNode connects it to any parents and children already
+    present (taken from its ``parent_ids``/``child_ids``) and keeps the
+    derived metrics on every affected node up to date. Storing under an ID
+    that is already present updates that node in place, so its children
+    stay linked to it.
+    """
+
+    # Generations of descendants counted towards descendant_count and influence
+    INFLUENCE_GENERATIONS = 10
+
+    def __init__(self, trust_decay_rate: float = 0.05) -> None:
+        """
+        Initialize an empty lineage graph.
+
+        Args:
+            trust_decay_rate: Per-generation decay applied to descendant
+                trust when computing influence
+        """
+        self._trust_decay_rate = trust_decay_rate
+        self._reset()
+
+    def _reset(self) -> None:
+        """Drop all nodes and labels."""
+        # Slot-indexed storage; freed slots are reused
+        self._index: dict[str, int] = {}
+        self._ids: list[str | None] = []
+        self._records: list[LineageNode | None] = []
+        self._parents: list[array[int]] = []
+        self._children: list[array[int]] = []
+        self._depth: list[int] = []
+        self._free: list[int] = []
+
+        # Reachability interval labels
+        self._lo: list[int] = []
+        self._hi: list[int] = []
+        self._next_rank = 0
+        self._label_debt = 0
+
+        # Least recently used first
+        self._lru: OrderedDict[int, None] = OrderedDict()
+
+    # ═══════════════════════════════════════════════════════════════
+    # MAPPING INTERFACE
+    # ═══════════════════════════════════════════════════════════════
+
+    def __getitem__(self, capsule_id: str) -> LineageNode:
+        record = self._records[self._index[capsule_id]]
+        assert record is not None
+        return record
+
+    def __setitem__(self, capsule_id: str, node: LineageNode) -> None:
+        existing = self._index.get(capsule_id)
+        if existing is not None:
+            self._update(existing, node)
+            return
+
+        slot = self._allocate(capsule_id, node)
+        parents = [self._index[p] for p in node.parent_ids if p in self._index]
+        children = [self._index[c] for c in node.child_ids if c in self._index]
+
+        # Start inside the first parent's interval so the common
+        # single-parent insert never widens any ancestor label
+        if parents:
+            self._lo[slot] = self._hi[slot] = self._hi[parents[0]]
+
+        self._set_depth(slot, self._depth_from_parents(slot))
+        for parent in parents:
+            self._connect(parent, slot)
+
+        if not children:
+            # A fresh leaf is one new descendant for each distinct ancestor
+            self._refresh_metrics([slot])
+            self._credit(slot, self._ancestor_slots([slot], include_self=False))
+            return
+
+        changed = {slot}
+        for child in children:
+            changed |= self._connect(slot, child)
+        self._refresh_metrics(self._ancestor_slots(changed, include_self=True))
+
+    def __delitem__(self, capsule_id: str) -> None:
+        if capsule_id not in self._index:
+            raise KeyError(capsule_id)
+        self.remove_many([capsule_id])
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._index)
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __contains__(self, capsule_id: object) -> bool:
+        return capsule_id in self._index
+
+    def clear(self) -> None:
+        """Remove every node."""
+        self._reset()
+
+    # ═══════════════════════════════════════════════════════════════
+    # MUTATION
+    # ═══════════════════════════════════════════════════════════════
+
+    def link(self, parent_id: str, child_id: str) -> bool:
+        """
+        Record a derivation edge from parent to child.
+
+        Endpoints not in the graph are still recorded on the node that is,
+        matching how dangling parents are kept for broken-chain detection.
+        Callers must check would_create_cycle first.
+
+        Args:
+            parent_id: Parent capsule ID
+            child_id: Child capsule ID
+
+        Returns:
+            True if the child gained a new parent reference
+        """
+        parent = self._index.get(parent_id)
+        child = self._index.get(child_id)
+
+        if parent is not None and child is not None:
+            if child in self._children[parent]:
+                return False
+
+            # Ancestors near the child see new descendants; those near
+            # pushed-down nodes see new depths
+            changed = self._connect(parent, child) | {child}
+            self._refresh_metrics(self._ancestor_slots(changed, include_self=True))
+            return True
+
+        if parent is not None:
+            record = self._records[parent]
+            assert record is not None
+            if child_id not in record.child_ids:
+                record.child_ids.append(child_id)
+            return False
+
+        if child is not None:
+            record = self._records[child]
+            assert record is not None
+            if parent_id in record.parent_ids:
+                return False
+            record.parent_ids.append(parent_id)
+            self.recalculate_depth(child_id)
+            return True
+
+        return False
+
+    def remove_many(self, capsule_ids: Iterable[str]) -> list[str]:
+        """
+        Remove nodes and refresh metrics of their surviving ancestors.
+
+        Args:
+            capsule_ids: Capsule IDs to remove
+
+        Returns:
+            IDs that were present and removed
+        """
+        slots = [self._index[c] for c in capsule_ids if c in self._index]
+        affected = self._ancestor_slots(slots, include_self=False)
+        orphaned = {child for slot in slots for child in self._children[slot]}
+
+        removed: list[str] = []
+        for slot in slots:
+            capsule_id = self._ids[slot]
+            if capsule_id is not None:
+                self._remove(capsule_id)
+                removed.append(capsule_id)
+
+        # Children that lost a parent may now sit on a shorter longest path
+        survivors = [s for s in orphaned if self._ids[s] is not None]
+        affected |= self._ancestor_slots(self._repair_depth(survivors), include_self=True)
+        self._refresh_metrics(s for s in affected if self._ids[s] is not None)
+        return removed
+
+    def touch(self, capsule_id: str) -> None:
+        """Mark a node as most recently used."""
+        slot = self._index.get(capsule_id)
+        if slot is not None:
+            self._lru.move_to_end(slot)
+
+    def evict_lru(self, count: int) -> list[str]:
+        """
+        Evict the least recently used nodes.
+
+        Args:
+            count: Maximum number of nodes to evict
+
+        Returns:
+            Evicted capsule IDs, oldest first
+        """
+        victims: list[str] = []
+        for slot in self._lru:
+            if len(victims) >= count:
+                break
+            capsule_id = self._ids[slot]
+            if capsule_id is not None:
+                victims.append(capsule_id)
+        return self.remove_many(victims)
+
+    def recalculate_depth(self, capsule_id: str) -> None:
+        """
+        Recompute depth for a node and all of its descendants.
+
+        Depths are maintained incrementally; this repairs them after the
+        node records were edited directly.
+        """
+        start = self._index.get(capsule_id)
+        if start is None:
+            return
+
+        changed = self._repair_depth([start])
+        if changed:
+            self._refresh_metrics(self._ancestor_slots(changed, include_self=True))
+
+    # ═══════════════════════════════════════════════════════════════
+    # QUERIES
+    # ═══════════════════════════════════════════════════════════════
+
+    def depth(self, capsule_id: str) -> int:
+        """Get a node's derivation depth."""
+        return self._depth[self._index[capsule_id]]
+
+    def is_ancestor(self, ancestor_id: str, descendant_id: str) -> bool:
+        """
+        Check whether one capsule is a (transitive) ancestor of another.
+
+        Args:
+            ancestor_id: Candidate ancestor
+            descendant_id: Candidate descendant
+
+        Returns:
+            True if a derivation path leads from ancestor to descendant
+        """
+        source = self._index.get(ancestor_id)
+        target = self._index.get(descendant_id)
+        if source is None or target is None or source == target:
+            return False
+        return self._reaches(source, target)
+
+    def would_create_cycle(self, parent_id: str, child_id: str) -> bool:
+        """Check whether linking parent -> child would close a cycle."""
+        if parent_id == child_id:
+            return True
+        return self.is_ancestor(child_id, parent_id)
+
+    def ancestors(self, capsule_id: str, max_depth: int | None = None) -> list[str]:
+        """
+        List ancestors breadth-first, nearest generation first.
+
+        Args:
+            capsule_id: Capsule to start from
+            max_depth: Maximum number of generations to walk
+
+        Returns:
+            Ancestor capsule IDs
+        """
+        return self._walk(capsule_id, self._parents, max_depth)
+
+    def descendants(self, capsule_id: str, max_depth: int | None = None) -> list[str]:
+        """
+        List descendants breadth-first, nearest generation first.
+
+        Args:
+            capsule_id: Capsule to start from
+            max_depth: Maximum number of generations to walk
+
+        Returns:
+            Descendant capsule IDs
+        """
+        return self._walk(capsule_id, self._children, max_depth)
+
+    # ═══════════════════════════════════════════════════════════════
+    # INTERNALS
+    # ═══════════════════════════════════════════════════════════════
+
+    def _allocate(self, capsule_id: str, node: LineageNode) -> int:
+        """Intern a capsule ID into a free slot."""
+        rank = self._next_rank
+        self._next_rank += 1
+
+        if self._free:
+            slot = self._free.pop()
+            self._ids[slot] = capsule_id
+            self._records[slot] = node
+            self._depth[slot] = 0
+            self._lo[slot] = self._hi[slot] = rank
+        else:
+            slot = len(self._ids)
+            self._ids.append(capsule_id)
+            self._records.append(node)
+            self._parents.append(array("i"))
+            self._children.append(array("i"))
+            self._depth.append(0)
+            self._lo.append(rank)
+            self._hi.append(rank)
+
+        self._index[capsule_id] = slot
+        self._lru[slot] = None
+        return slot
+
+    def _remove(self, capsule_id: str) -> None:
+        """Detach and free a node's slot without touching metrics."""
+        slot = self._index.pop(capsule_id)
+
+        for parent in self._parents[slot]:
+            self._children[parent].remove(slot)
+            record = self._records[parent]
+            if record is not None and capsule_id in record.child_ids:
+                record.child_ids.remove(capsule_id)
+        for child in self._children[slot]:
+            self._parents[child].remove(slot)
+            record = self._records[child]
+            if record is not None and capsule_id in record.parent_ids:
+                record.parent_ids.remove(capsule_id)
+
+        self._ids[slot] = None
+        self._records[slot] = None
+        self._parents[slot] = array("i")
+        self._children[slot] = array("i")
+        del self._lru[slot]
+        self._free.append(slot)
+
+    def _update(self, slot: int, node: LineageNode) -> None:
+        """Swap a present node's record, keeping its children attached."""
+        before = self._ancestor_slots([slot], include_self=True)
+        self._records[slot] = node
+        self._lru.move_to_end(slot)
+
+        # The new record's parents replace the old ones; children already
+        # linked here are kept even if the new record does not list them
+        wanted = {self._index[p] for p in node.parent_ids if p in self._index}
+        for parent in [p for p in self._parents[slot] if p not in wanted]:
+            self._disconnect(parent, slot)
+        for child in self._children[slot]:
+            child_id = self._ids[child]
+            if child_id is not None and child_id not in node.child_ids:
+                node.child_ids.append(child_id)
+
+        changed = {slot}
+        for parent in wanted:
+            changed |= self._connect(parent, slot)
+        for child_id in list(node.child_ids):
+            linked = self._index.get(child_id)
+            if linked is not None:
+                changed |= self._connect(slot, linked)
+
+        # Dropped parents can lower depths that _connect only ever raises
+        changed |= self._repair_depth([slot])
+        self._refresh_metrics(before | self._ancestor_slots(changed, include_self=True))
+
+    def _disconnect(self, parent: int, child: int) -> None:
+        """Drop a parent -> child edge without touching depth or metrics."""
+        self._children[parent].remove(child)
+        self._parents[child].remove(parent)
+
+        record = self._records[parent]
+        child_id = self._ids[child]
+        if record is not None and child_id is not None and child_id in record.child_ids:
+            record.child_ids.remove(child_id)
+
+    def _connect(self, parent: int, child: int) -> set[int]:
+        """
+        Add a parent -> child edge between present nodes.
+
+        Returns:
+            Slots whose depth increased as a result
+        """
+        if child in self._children[parent]:
+            return set()
+
+        self._children[parent].append(child)
+        self._parents[child].append(parent)
+
+        parent_record = self._records[parent]
+        child_record = self._records[child]
+        assert parent_record is not None and child_record is not None
+        if child_record.capsule_id not in parent_record.child_ids:
+            parent_record.child_ids.append(child_record.capsule_id)
+        if parent_record.capsule_id not in child_record.parent_ids:
+            child_record.parent_ids.append(parent_record.capsule_id)
+
+        self._widen(parent, self._lo[child], self._hi[child])
+
+        # Push depth increases down until the level ordering holds again
+        changed: set[int] = set()
+        stack = [(parent, child)]
+        while stack:
+            upper, lower = stack.pop()
+            if self._depth[lower] > self._depth[upper]:
+                continue
+            self._set_depth(lower, self._depth[upper] + 1)
+            changed.add(lower)
+            stack.extend((lower, grandchild) for grandchild in self._children[lower])
+        return changed
+
+    def _widen(self, slot: int, lo: int, hi: int) -> None:
+        """Widen a node's label, and its ancestors', to cover [lo, hi]."""
+        stack = [slot]
+        while stack:
+            current = stack.pop()
+            if self._lo[current] <= lo and hi <= self._hi[current]:
+                continue
+            self._lo[current] = min(self._lo[current], lo)
+            self._hi[current] = max(self._hi[current], hi)
+            self._label_debt += 1
+            stack.extend(self._parents[current])
+
+    def _rebuild_labels(self) -> None:
+        """Relabel every node from a fresh post-order traversal."""
+        visited = bytearray(len(self._ids))
+        rank = 0
+        roots = [s for s in self._index.values() if not self._parents[s]]
+
+        for start in (*roots, *self._index.values()):
+            if visited[start]:
+                continue
+            visited[start] = 1
+            stack = [(start, 0)]
+            while stack:
+                slot, position = stack[-1]
+                children = self._children[slot]
+                if position < len(children):
+                    stack[-1] = (slot, position + 1)
+                    child = children[position]
+                    if not visited[child]:
+                        visited[child] = 1
+                        stack.append((child, 0))
+                    continue
+
+                stack.pop()
+                lo = rank
+                for child in children:
+                    lo = min(lo, self._lo[child])
+                self._lo[slot] = lo
+                self._hi[slot] = rank
+                rank += 1
+
+        self._next_rank = rank
+        self._label_debt = 0
+
+    def _reaches(self, source: int, target: int) -> bool:
+        """Check reachability using depth and label pruning."""
+        if self._label_debt > len(self._index) // 2 + 64:
+            self._rebuild_labels()
+
+        depth = self._depth[target]
+        lo, hi = self._lo[target], self._hi[target]
+
+        def may_reach(slot: int) -> bool:
+            return self._depth[slot] < depth and self._lo[slot] <= lo and hi <= self._hi[slot]
+
+        if not may_reach(source):
+            return False
+
+        stack = [source]
+        visited = {source}
+        while stack:
+            for child in self._children[stack.pop()]:
+                if child == target:
+                    return True
+                if child not in visited and may_reach(child):
+                    visited.add(child)
+                    stack.append(child)
+        return False
+
+    def _walk(
+        self, capsule_id: str, adjacency: list[array[int]], max_depth: int | None
+    ) -> list[str]:
+        """Breadth-first walk returning IDs, excluding the start node."""
+        start = self._index.get(capsule_id)
+        if start is None:
+            return []
+
+        found: list[str] = []
+        visited = {start}
+        frontier = [start]
+        generation = 0
+        while frontier and (max_depth is None or generation < max_depth):
+            generation += 1
+            next_frontier = []
+            for slot in frontier:
+                for neighbor in adjacency[slot]:
+                    if neighbor not in visited:
+                        visited.add(neighbor)
+                        next_frontier.append(neighbor)
+                        found.append(self._ids[neighbor])  # type: ignore[arg-type]
+            frontier = next_frontier
+        return found
+
+    def _ancestor_slots(self, slots: Iterable[int], include_self: bool) -> set[int]:
+        """Collect the ancestors within INFLUENCE_GENERATIONS of a set of slots."""
+        seeds = set(slots)
+        found = set(seeds) if include_self else set()
+        visited = set(seeds)
+        frontier = list(seeds)
+        for _ in range(self.INFLUENCE_GENERATIONS):
+            next_frontier = []
+            for slot in frontier:
+                for parent in self._parents[slot]:
+                    if parent not in visited:
+                        visited.add(parent)
+                        found.add(parent)
+                        next_frontier.append(parent)
+            frontier = next_frontier
+        return found
+
+    def _repair_depth(self, starts: Iterable[int]) -> set[int]:
+        """
+        Recompute depth from the given slots down until it stops changing.
+
+        Returns:
+            Slots whose depth changed
+        """
+        starts = set(starts)
+        changed: set[int] = set()
+        queue: deque[int] = deque(starts)
+        pending = set(starts)
+        while queue:
+            slot = queue.popleft()
+            pending.discard(slot)
+            record = self._records[slot]
+            depth = self._depth_from_parents(slot)
+            stale = record is not None and record.depth != depth
+            if depth != self._depth[slot]:
+                changed.add(slot)
+            elif not stale and slot not in starts:
+                continue
+            self._set_depth(slot, depth)
+
+            for child in self._children[slot]:
+                if child not in pending:
+                    pending.add(child)
+                    queue.append(child)
+        return changed
+
+    def _depth_from_parents(self, slot: int) -> int:
+        """Depth implied by a node's parents (dangling parents count as depth 0)."""
+        record = self._records[slot]
+        if record is None or not record.parent_ids:
+            return 0
+        return max((self._depth[p] for p in self._parents[slot]), default=0) + 1
+
+    def _set_depth(self, slot: int, depth: int) -> None:
+        self._depth[slot] = depth
+        record = self._records[slot]
+        if record is not None:
+            record.depth = depth
+
+    def _credit(self, descendant: int, ancestors: Iterable[int]) -> None:
+        """Count a descendant newly reachable from each of the given ancestors."""
+        record = self._records[descendant]
+        assert record is not None
+        keep = 1 - self._trust_decay_rate
+        depth = self._depth[descendant]
+
+        for slot in ancestors:
+            ancestor = self._records[slot]
+            assert ancestor is not None
+            ancestor.descendant_count += 1
+            ancestor.influence_score += (
+                record.trust_at_creation * keep ** (depth - self._depth[slot]) / 100
+            )
+
+    def _refresh_metrics(self, slots: Iterable[int]) -> None:
+        """Recompute descendant count and influence for the given slots."""
+        keep = 1 - self._trust_decay_rate
+        for slot in slots:
+            record = self._records[slot]
+            if record is None:
+                continue
+
+            count = 0
+            influence = 0.0
+            visited = {slot}
+            frontier = [slot]
+            for _ in range(self.INFLUENCE_GENERATIONS):
+                next_frontier = []
+                for current in frontier:
+                    for child in self._children[current]:
+                        if child in visited:
+                            continue
+                        visited.add(child)
+                        next_frontier.append(child)
+                        descendant = self._records[child]
+                        assert descendant is not None
+                        count += 1
+                        influence += (
+                            descendant.trust_at_creation
+                            * keep ** (self._depth[child] - self._depth[slot])
+                            / 100
+                        )
+                frontier = next_frontier
+
+            record.descendant_count = count
+            record.influence_score = influence
@@ -12,6 +12,7 @@ Responsibilities:
 - Generate lineage visualizations
 """
 
+import time
 from collections import defaultdict
 from dataclasses import dataclass, field
 from datetime import UTC, datetime, timedelta
@@ -23,6 +24,7 @@ from ..models.base import CapsuleType
 from ..models.events import Event, EventType
 from ..models.overlay import Capability
 from .base import BaseOverlay, OverlayContext, OverlayError, OverlayResult
+from .lineage_graph import LineageGraph
 
 logger = structlog.get_logger()
 
@@ -189,9 +191,8 @@ class LineageTrackerOverlay(BaseOverlay):
         self._MAX_DERIVATION_USERS: int = 10000  # Max users tracked for derivations
         self._MAX_DERIVATIONS_PER_USER: int = 200  # Max derivations per user
 
-        # In-memory lineage cache with bounded size
-        self._nodes: dict[str, LineageNode] = {}
-        self._nodes_access_order: list[str] = []  # For LRU eviction
+        # In-memory lineage cache with bounded size (LRU-ordered)
+        self._nodes = LineageGraph(trust_decay_rate=trust_decay_rate)
         self._roots: set[str] = set()  # Nodes with no parents
 
         # Recent derivations for anomaly detection
@@ -216,7 +217,7 @@ class LineageTrackerOverlay(BaseOverlay):
             anomaly_detection=self._enable_anomaly_detection,
             trust_decay_rate=self._trust_decay_rate,
         )
-        return True
+        return await super().initialize()
 
     async def execute(
         self,
@@ -235,19 +236,11 @@ class LineageTrackerOverlay(BaseOverlay):
         Returns:
             Lineage tracking result
         """
-        import time
-
         start_time = time.time()
 
-        data = input_data or {}
-        if event:
-            data.update(event.payload or {})
-            data["event_type"] = event.type
+        data = self._merge_input(event, input_data)
 
         # Determine action
-        anomalies: list[LineageAnomaly] = []
-        result_data: dict[str, Any] = {}
-
         if event:
             if event.type == EventType.CAPSULE_CREATED:
                 result_data = await self._handle_capsule_created(data, context)
@@ -263,14 +256,7 @@ class LineageTrackerOverlay(BaseOverlay):
             # Direct call - get lineage info
             result_data = await self._get_lineage_info(data, context)
 
-        # Check for anomalies
-        if self._enable_anomaly_detection:
-            capsule_id = data.get("capsule_id")
-            if capsule_id:
-                anomalies = self._detect_anomalies(capsule_id)
-                if anomalies:
-                    self._stats["anomalies_detected"] += len(anomalies)
-
+        anomalies = self._check_anomalies(data)
         duration_ms = (time.time() - start_time) * 1000
 
         self._logger.info(
@@ -280,22 +266,105 @@ class LineageTrackerOverlay(BaseOverlay):
             duration_ms=round(duration_ms, 2),
         )
 
-        # Prepare events
-        events_to_emit = []
-        if anomalies:
-            for anomaly in anomalies:
-                if anomaly.severity in {"medium", "high"}:
-                    events_to_emit.append(
-                        {
-                            "event_type": EventType.ANOMALY_DETECTED,
-                            "payload": {
-                                "anomaly_type": anomaly.anomaly_type,
-                                "severity": anomaly.severity,
-                                "affected_nodes": anomaly.affected_nodes,
-                                "description": anomaly.description,
-                            },
-                        }
-                    )
+        return self._build_result(result_data, anomalies, duration_ms)
+
+    async def execute_batch(
+        self,
+        context: OverlayContext,
+        items: list[dict[str, Any]],
+        event: Event | None = None,
+    ) -> list[OverlayResult]:
+        """
+        Execute lineage tracking over a batch.
+
+        Capsule creations are handled in one pass, parents first, so that a
+        capsule whose parent is in the same batch gets the correct depth and
+        chain. Results are returned in input order.
+        """
+        if event is None or event.type != EventType.CAPSULE_CREATED:
+            return await super().execute_batch(context, items, event)
+
+        start_time = time.time()
+        position = {
+            item.get("capsule_id"): i for i, item in enumerate(items) if item.get("capsule_id")
+        }
+
+        order: list[int] = []
+        visited: set[int] = set()
+        for i in range(len(items)):
+            # Walk up in-batch parents iteratively, then emit them root-first
+            path: list[int] = []
+            current: int | None = i
+            while current is not None and current not in visited:
+                visited.add(current)
+                path.append(current)
+                current = position.get(items[current].get("parent_id"))
+            order.extend(reversed(path))
+
+        results: list[OverlayResult] = [OverlayResult.fail("Not processed")] * len(items)
+        anomaly_count = 0
+        for i in order:
+            item_start = time.time()
+            data = self._merge_input(event, items[i])
+            try:
+                result_data = await self._handle_capsule_created(data, context)
+            except (OverlayError, RuntimeError, ValueError, TypeError, KeyError, OSError) as e:
+                results[i] = OverlayResult.fail(f"Overlay error: {str(e)}")
+                continue
+            anomalies = self._check_anomalies(data)
+            anomaly_count += len(anomalies)
+            results[i] = self._build_result(
+                result_data, anomalies, (time.time() - item_start) * 1000
+            )
+
+        self._logger.info(
+            "lineage_batch_complete",
+            batch_size=len(items),
+            nodes=len(self._nodes),
+            anomalies=anomaly_count,
+            duration_ms=round((time.time() - start_time) * 1000, 2),
+        )
+        return results
+
+    def _merge_input(
+        self, event: Event | None, input_data: dict[str, Any] | None
+    ) -> dict[str, Any]:
+        """Combine input data with the triggering event's payload."""
+        data = dict(input_data or {})
+        if event:
+            data.update(event.payload or {})
+            data["event_type"] = event.type
+        return data
+
+    def _check_anomalies(self, data: dict[str, Any]) -> list[LineageAnomaly]:
+        """Run anomaly detection for the capsule an input refers to."""
+        capsule_id = data.get("capsule_id")
+        if not self._enable_anomaly_detection or not capsule_id:
+            return []
+        anomalies = self._detect_anomalies(capsule_id)
+        self._stats["anomalies_detected"] += len(anomalies)
+        return anomalies
+
+    def _build_result(
+        self,
+        result_data: dict[str, Any],
+        anomalies: list[LineageAnomaly],
+        duration_ms: float,
+    ) -> OverlayResult:
+        """Wrap handler output and anomalies into an overlay result."""
+        events_to_emit = [
+            {
+                "event_type": EventType.ANOMALY_DETECTED,
+                "payload": {
+                    "anomaly_type": anomaly.anomaly_type,
+                    "severity": anomaly.severity,
+                    "affected_nodes": anomaly.affected_nodes,
+                    "description": anomaly.description,
+                },
+            }
+            for anomaly in anomalies
+            if anomaly.severity in {"medium", "high"}
+        ]
 
         return OverlayResult(
             success=True,
@@ -340,11 +409,7 @@ class LineageTrackerOverlay(BaseOverlay):
             parent_ids=parent_ids,
         )
 
-        # Calculate depth
-        if parent_ids:
-            parent_depths = [self._nodes[pid].depth for pid in parent_ids if pid in self._nodes]
-            node.depth = max(parent_depths, default=0) + 1
-        else:
+        if not parent_ids:
             # Root node
             self._roots.add(capsule_id)
 
@@ -352,17 +417,11 @@ class LineageTrackerOverlay(BaseOverlay):
         if len(self._nodes) >= self._MAX_NODES:
             self._evict_lru_nodes()
 
-        # Store node
+        # Store node; the graph links it to its parent and updates
+        # depth, descendant counts and influence along the ancestry
         self._nodes[capsule_id] = node
-        self._nodes_access_order.append(capsule_id)
         self._stats["nodes_tracked"] += 1
 
-        # Update parent relationships
-        for parent_id in parent_ids:
-            if parent_id in self._nodes:
-                self._nodes[parent_id].child_ids.append(capsule_id)
-                self._update_influence(parent_id)
-
         # Enforce root limit
         if capsule_id in self._roots and len(self._roots) > self._MAX_ROOTS:
             # Remove oldest roots (this shouldn't happen often)
@@ -425,21 +484,12 @@ class LineageTrackerOverlay(BaseOverlay):
                 "child_id": child_id,
             }
 
-        # Update relationships
-        if parent_id in self._nodes:
-            if child_id not in self._nodes[parent_id].child_ids:
-                self._nodes[parent_id].child_ids.append(child_id)
-
-        if child_id in self._nodes:
-            if parent_id not in self._nodes[child_id].parent_ids:
-                self._nodes[child_id].parent_ids.append(parent_id)
-                # Remove from roots if it was there
-                self._roots.discard(child_id)
-                # Recalculate depth
-                self._recalculate_depth(child_id)
-
-        # Update influence
-        self._update_influence(parent_id)
+        # Update relationships, depth and influence
+        if self._nodes.link(parent_id, child_id):
+            # Remove from roots if it was there
+            self._roots.discard(child_id)
+        self._nodes.touch(parent_id)
+        self._nodes.touch(child_id)
 
         return {"linked": True, "parent_id": parent_id, "child_id": child_id}
 
@@ -450,10 +500,9 @@ class LineageTrackerOverlay(BaseOverlay):
         source_id = data.get("source_id")
         affected_ids = data.get("affected_ids", [])
 
-        # Update influence scores for affected nodes
+        # Influence is maintained incrementally; just keep affected nodes warm
         for node_id in affected_ids:
-            if node_id in self._nodes:
-                self._update_influence(node_id)
+            self._nodes.touch(node_id)
 
         # Compute metrics if enabled
         metrics = None
@@ -673,6 +722,7 @@ class LineageTrackerOverlay(BaseOverlay):
             return {"capsule_id": capsule_id, "found": False}
 
         node = self._nodes[capsule_id]
+        self._nodes.touch(capsule_id)
 
         # Get ancestors
         ancestors = self._get_ancestors(capsule_id)
@@ -768,56 +818,16 @@ class LineageTrackerOverlay(BaseOverlay):
         )
 
     def _get_ancestors(self, capsule_id: str, max_depth: int = 50) -> list[str]:
-        """Get all ancestors of a capsule."""
-        ancestors = []
-        queue = [capsule_id]
-        visited = {capsule_id}
-        depth = 0
-
-        while queue and depth < max_depth:
-            current = queue.pop(0)
-            node = self._nodes.get(current)
-            if not node:
-                continue
-
-            for parent_id in node.parent_ids:
-                if parent_id not in visited and parent_id in self._nodes:
-                    visited.add(parent_id)
-                    ancestors.append(parent_id)
-                    queue.append(parent_id)
-
-            depth += 1
-
-        return ancestors
+        """Get ancestors of a capsule, up to max_depth generations."""
+        return self._nodes.ancestors(capsule_id, max_depth)
 
     def _get_descendants(self, capsule_id: str, max_depth: int = 50) -> list[str]:
-        """Get all descendants of a capsule."""
-        descendants = []
-        queue = [capsule_id]
-        visited = {capsule_id}
-        depth = 0
-
-        while queue and depth < max_depth:
-            current = queue.pop(0)
-            node = self._nodes.get(current)
-            if not node:
-                continue
-
-            for child_id in node.child_ids:
-                if child_id not in visited and child_id in self._nodes:
-                    visited.add(child_id)
-                    descendants.append(child_id)
-                    queue.append(child_id)
-
-            depth += 1
-
-        return descendants
+        """Get descendants of a capsule, up to max_depth generations."""
+        return self._nodes.descendants(capsule_id, max_depth)
 
     def _would_create_cycle(self, parent_id: str, child_id: str) -> bool:
         """Check if linking would create a cycle."""
-        # Check if child_id is an ancestor of parent_id
-        ancestors = self._get_ancestors(parent_id)
-        return child_id in ancestors
+        return self._nodes.would_create_cycle(parent_id, child_id)
 
     def _recalculate_depth(self, capsule_id: str) -> None:
         """
@@ -826,72 +836,7 @@ class LineageTrackerOverlay(BaseOverlay):
         SECURITY FIX (Audit 4 - M10): Use iterative BFS instead of recursion
         to prevent stack overflow on deep hierarchies.
         """
-        from collections import deque
-
-        if capsule_id not in self._nodes:
-            return
-
-        # Use BFS queue for iterative depth recalculation
-        queue: deque[str] = deque([capsule_id])
-        visited: set[str] = set()
-        max_iterations = len(self._nodes) + 1000  # Safety limit
-
-        iterations = 0
-        while queue and iterations < max_iterations:
-            iterations += 1
-            current_id = queue.popleft()
-
-            if current_id in visited:
-                continue
-            visited.add(current_id)
-
-            if current_id not in self._nodes:
-                continue
-
-            node = self._nodes[current_id]
-
-            # Calculate depth from parents
-            if node.parent_ids:
-                parent_depths = [
-                    self._nodes[pid].depth for pid in node.parent_ids if pid in self._nodes
-                ]
-                node.depth = max(parent_depths, default=0) + 1
-            else:
-                node.depth = 0
-
-            # Enqueue children for processing
-            for child_id in node.child_ids:
-                if child_id not in visited:
-                    queue.append(child_id)
-
-    def _update_influence(self, capsule_id: str) -> None:
-        """Update influence score for a node."""
-        if capsule_id not in self._nodes:
-            return
-
-        node = self._nodes[capsule_id]
-
-        # Simple influence: based on descendants and their trust
-        descendants = self._get_descendants(capsule_id, max_depth=10)
-
-        if not descendants:
-            node.influence_score = 0.0
-            node.descendant_count = 0
-            return
-
-        node.descendant_count = len(descendants)
-
-        # Calculate weighted influence
-        total_influence = 0.0
-        for desc_id in descendants:
-            desc_node = self._nodes.get(desc_id)
-            if desc_node:
-                # Trust-weighted contribution, decaying with depth
-                depth_diff = desc_node.depth - node.depth
-                decay = (1 - self._trust_decay_rate) ** depth_diff
-                total_influence += desc_node.trust_at_creation * decay
-
-        node.influence_score = total_influence / 100  # Normalize
+        self._nodes.recalculate_depth(capsule_id)
 
     def _compute_subtree_metrics(self, root_id: str) -> LineageMetrics:
         """Compute metrics for a subtree."""
@@ -1047,6 +992,7 @@ class LineageTrackerOverlay(BaseOverlay):
 
     def get_node(self, capsule_id: str) -> LineageNode | None:
         """Get a specific lineage node."""
+        self._nodes.touch(capsule_id)
         return self._nodes.get(capsule_id)
 
     def get_stats(self) -> dict[str, Any]:
@@ -1066,31 +1012,12 @@ class LineageTrackerOverlay(BaseOverlay):
         Returns:
             Number of nodes actually evicted
         """
-        evict_count = min(count, len(self._nodes_access_order))
-        to_evict = self._nodes_access_order[:evict_count]
-        evicted = 0
-
-        for node_id in to_evict:
-            node = self._nodes.pop(node_id, None)
-            if node:
-                evicted += 1
-                # Also remove from roots if applicable
-                self._roots.discard(node_id)
-                # Clean up references from other nodes
-                for parent_id in node.parent_ids:
-                    if parent_id in self._nodes:
-                        try:
-                            self._nodes[parent_id].child_ids.remove(node_id)
-                        except ValueError:
-                            pass
-                for child_id in node.child_ids:
-                    if child_id in self._nodes:
-                        try:
-                            self._nodes[child_id].parent_ids.remove(node_id)
-                        except ValueError:
-                            pass
-
-        self._nodes_access_order = self._nodes_access_order[evict_count:]
+        evicted_ids = self._nodes.evict_lru(count)
+        for node_id in evicted_ids:
+            # Also remove from roots if applicable
+            self._roots.discard(node_id)
+        evicted = len(evicted_ids)
+
         self._stats["nodes_evicted"] += evicted
 
         self._logger.info("lineage_nodes_evicted", evicted=evicted, remaining=len(self._nodes))
@@ -1101,7 +1028,6 @@ class LineageTrackerOverlay(BaseOverlay):
         """Clear in-memory lineage cache."""
         count = len(self._nodes)
         self._nodes.clear()
-        self._nodes_access_order.clear()
         self._roots.clear()
         self._recent_derivations.clear()
         self._derivation_users_order.clear()
@@ -119,6 +119,12 @@ class MLIntelligenceOverlay(BaseOverlay):
 
     REQUIRED_CAPABILITIES = {Capability.DATABASE_READ}
 
+    # Fields analysed, in order of preference; the first non-empty one wins
+    CONTENT_FIELDS = ("content", "text", "body", "message", "title", "description")
+
+    READS = frozenset(CONTENT_FIELDS)
+    WRITES = frozenset({"analysis", "reason"})
+
     # Default classification categories
     DEFAULT_CATEGORIES = {
         "technical": ["code", "api", "function", "algorithm", "database", "server"],
@@ -201,7 +207,7 @@ class MLIntelligenceOverlay(BaseOverlay):
             embedding_dim=self._embedding_dim,
             categories=list(self._categories.keys()),
         )
-        return True
+        return await super().initialize()
 
     async def execute(
         self,
@@ -224,7 +230,7 @@ class MLIntelligenceOverlay(BaseOverlay):
 
         start_time = time.time()
 
-        data = input_data or {}
+        data = dict(input_data or {})
         if event:
             data.update(event.payload or {})
 
@@ -299,10 +305,78 @@ class MLIntelligenceOverlay(BaseOverlay):
             )
             return OverlayResult.fail(error=f"ML analysis failed: {str(e)}")
 
+    async def execute_batch(
+        self,
+        context: OverlayContext,
+        items: list[dict[str, Any]],
+        event: Event | None = None,
+    ) -> list[OverlayResult]:
+        """
+        Analyse a batch of inputs.
+
+        Embeddings missing from the cache are generated with one
+        embed_batch() request per chunk before the per-item analysis runs.
+        Chunks are sized to fit the embedding cache.
+        """
+        chunk_size = max(1, self._cache_max_size // 2)
+        results: list[OverlayResult] = []
+
+        for start in range(0, len(items), chunk_size):
+            chunk = items[start : start + chunk_size]
+            if self._embedding_provider is None:
+                payload = (event.payload or {}) if event else {}
+                await self._prefetch_embeddings(
+                    [self._extract_content({**item, **payload}) for item in chunk]
+                )
+            results.extend(await super().execute_batch(context, chunk, event))
+
+        return results
+
+    async def _prefetch_embeddings(self, contents: list[str]) -> None:
+        """Fill the embedding cache for uncached contents in one request."""
+        missing: dict[str, str] = {}
+        for content in contents:
+            if not content:
+                continue
+            cache_key = hashlib.md5(content.encode(), usedforsecurity=False).hexdigest()
+            if cache_key not in self._embedding_cache:
+                missing[cache_key] = content
+
+        if not missing:
+            return
+
+        from forge.services.embedding import EmbeddingConfigurationError, get_embedding_service
+
+        try:
+            embedding_results = await get_embedding_service().embed_batch(list(missing.values()))
+        except (
+            EmbeddingConfigurationError,
+            EmbeddingError,
+            RuntimeError,
+            ValueError,
+            ConnectionError,
+            OSError,
+        ) as e:
+            # Per-item generation below retries and applies the usual fallbacks
+            self._logger.warning(
+                "embedding_prefetch_failed",
+                batch_size=len(missing),
+                error=str(e),
+                error_type=type(e).__name__,
+            )
+            return
+
+        for cache_key, result in zip(missing, embedding_results, strict=True):
+            if len(self._embedding_cache) >= self._cache_max_size:
+                oldest_key = next(iter(self._embedding_cache))
+                del self._embedding_cache[oldest_key]
+            self._embedding_cache[cache_key] = result.embedding
+            self._embedding_dim = result.dimensions
+
     def _extract_content(self, data: dict[str, Any]) -> str:
         """Extract text content from data."""
-        # Try common content fields
-        for field_name in ["content", "text", "body", "message", "title", "description"]:
+        # Only CONTENT_FIELDS are consulted, so READS stays accurate
+        for field_name in self.CONTENT_FIELDS:
             if field_name in data and data[field_name]:
                 val = data[field_name]
                 if isinstance(val, str):
@@ -310,8 +384,7 @@ class MLIntelligenceOverlay(BaseOverlay):
                 elif isinstance(val, dict):
                     return str(val)
 
-        # Fallback to full data
-        return str(data) if data else ""
+        return ""
 
     async def _analyze(self, content: str, context: OverlayContext) -> AnalysisResult:
         """Perform full analysis on content."""
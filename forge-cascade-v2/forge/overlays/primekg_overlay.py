@@ -12,6 +12,10 @@ Features:
 - Semantic search on clinical descriptions
 - Differential diagnosis generation
 
+Phenotype, gene and discrimination lookups are answered from a memory-mapped
+adjacency snapshot (see forge.services.primekg.adjacency) when one is
+attached and fresh, falling back to Cypher otherwise.
+
 PrimeKG Statistics:
 - 129,375 nodes across 10 biological entity types
 - 4,050,249 edges across 30 relationship types
@@ -88,11 +92,16 @@ class PrimeKGOverlay(BaseOverlay):
         timeout_ms=60000,  # 60s for complex queries
     )
 
+    # Relationship types traversed by the snapshot-backed lookups
+    PHENOTYPE_RELATIONS = ("HAS_PHENOTYPE", "PHENOTYPE_OF")
+    GENE_RELATIONS = ("ASSOCIATED_WITH",)
+
     def __init__(
         self,
         neo4j_client: Any = None,
         embedding_service: Any = None,
         llm_service: Any = None,
+        adjacency: Any = None,
     ) -> None:
         """
         Initialize the PrimeKG overlay.
@@ -101,11 +110,13 @@ class PrimeKGOverlay(BaseOverlay):
             neo4j_client: Neo4j database client
             embedding_service: PrimeKG embedding service for semantic search
             llm_service: LLM service for natural language queries
+            adjacency: PrimeKGAdjacency snapshot for in-process traversal
         """
         super().__init__()
         self._neo4j: Any = neo4j_client
         self._embedding: Any = embedding_service
         self._llm: Any = llm_service
+        self.adjacency: Any = adjacency
 
         # Cached data structures
         self._hpo_hierarchy: dict[str, list[str]] | None = None
@@ -273,6 +284,11 @@ class PrimeKGOverlay(BaseOverlay):
 
         limit = data.get("limit", 20)
 
+        graph = self._fresh_adjacency()
+        if graph is not None:
+            results = await self._phenotype_to_disease_from_graph(graph, phenotypes, limit)
+            return self._phenotype_to_disease_result(phenotypes, results)
+
         query = """
         UNWIND $phenotypes AS hpo_id
         MATCH (p:PrimeKGPhenotype)-[:HAS_PHENOTYPE|PHENOTYPE_OF]-(d:PrimeKGDisease)
@@ -302,7 +318,57 @@ class PrimeKGOverlay(BaseOverlay):
                 "limit": limit,
             },
         )
+        return self._phenotype_to_disease_result(phenotypes, results)
+
+    async def _phenotype_to_disease_from_graph(
+        self,
+        graph: Any,
+        phenotypes: list[str],
+        limit: int,
+    ) -> list[dict[str, Any]]:
+        """Rank diseases by shared phenotypes using the adjacency snapshot."""
+        phenotype_nodes = [
+            node for hpo_id in phenotypes for node in graph.find(hpo_id, "effect/phenotype")
+        ]
+        shared = graph.overlap(phenotype_nodes, self.PHENOTYPE_RELATIONS, "disease")
+
+        rows = []
+        for disease, matched in shared.items():
+            match_count = len(matched)
+            total = graph.degree(disease, self.PHENOTYPE_RELATIONS, "effect/phenotype")
+            rows.append(
+                {
+                    "node": disease,
+                    "matched": matched,
+                    "match_count": match_count,
+                    "total_phenotypes": total,
+                    "recall": match_count / len(phenotypes),
+                    "precision": match_count / total if total > 0 else 0.0,
+                }
+            )
+        rows.sort(key=lambda r: (r["recall"] * r["precision"], r["match_count"]), reverse=True)
+        rows = rows[:limit]
+
+        details = await graph.load_details(self._neo4j, (r["node"] for r in rows))
+        results = []
+        for r in rows:
+            disease = r.pop("node")
+            disease_id = graph.node_id(disease)
+            r.update(
+                disease_id=disease_id,
+                disease_name=graph.node_name(disease),
+                mondo_id=disease_id,
+                description=details.get(disease, {}).get("description"),
+                matched_phenotypes=[graph.node_id(p) for p in r.pop("matched")],
+            )
+            results.append(r)
+        return results
 
+    def _phenotype_to_disease_result(
+        self,
+        phenotypes: list[str],
+        results: list[dict[str, Any]],
+    ) -> dict[str, Any]:
         return {
             "operation": "phenotype_to_disease",
             "input_phenotypes": phenotypes,
@@ -409,7 +475,11 @@ class PrimeKGOverlay(BaseOverlay):
         disease_id = data.get("disease_id")
         limit = data.get("limit", 50)
 
-        if gene_id:
+        graph = self._fresh_adjacency()
+        if graph is not None and (gene_id or disease_id):
+            results = self._gene_disease_from_graph(graph, gene_id, disease_id, limit)
+
+        elif gene_id:
             query = """
             MATCH (g:PrimeKGGene)-[r:ASSOCIATED_WITH|`associated with`]-(d:PrimeKGDisease)
             WHERE g.entrez_id = $gene_id OR g.node_id = $gene_id OR g.symbol = $gene_id
@@ -456,6 +526,38 @@ class PrimeKGOverlay(BaseOverlay):
             ],
         }
 
+    def _gene_disease_from_graph(
+        self,
+        graph: Any,
+        gene_id: str | None,
+        disease_id: str | None,
+        limit: int,
+    ) -> list[dict[str, Any]]:
+        """Gene-disease associations from the adjacency snapshot."""
+        pairs: list[tuple[int, int]] = []
+        if gene_id:
+            genes = graph.find(gene_id, "gene/protein") or graph.find_by_name(
+                gene_id, "gene/protein"
+            )
+            for gene in genes:
+                for disease in graph.neighbors(gene, self.GENE_RELATIONS, "disease").tolist():
+                    pairs.append((gene, disease))
+        elif disease_id:
+            for disease in graph.find(disease_id, "disease"):
+                for gene in graph.neighbors(disease, self.GENE_RELATIONS, "gene/protein").tolist():
+                    pairs.append((gene, disease))
+
+        return [
+            {
+                "gene_symbol": graph.node_name(gene),
+                "gene_id": graph.node_id(gene),
+                "disease_name": graph.node_name(disease),
+                "disease_id": graph.node_id(disease),
+                "relation_type": self.GENE_RELATIONS[0],
+            }
+            for gene, disease in pairs[:limit]
+        ]
+
     async def _pathway_analysis(
         self,
         data: dict[str, Any],
@@ -662,6 +764,13 @@ class PrimeKGOverlay(BaseOverlay):
                 "error": "disease_a and disease_b required",
             }
 
+        graph = self._fresh_adjacency()
+        if graph is not None:
+            results = self._discriminating_phenotypes_from_graph(
+                graph, disease_a, disease_b, already_present
+            )
+            return self._discriminating_phenotypes_result(disease_a, disease_b, results)
+
         query = """
         // Get phenotypes for disease A
         MATCH (da:PrimeKGDisease)-[:HAS_PHENOTYPE|PHENOTYPE_OF]-(pa:PrimeKGPhenotype)
@@ -704,7 +813,52 @@ class PrimeKGOverlay(BaseOverlay):
                 "already_present": already_present,
             },
         )
+        return self._discriminating_phenotypes_result(disease_a, disease_b, results)
 
+    def _discriminating_phenotypes_from_graph(
+        self,
+        graph: Any,
+        disease_a: str,
+        disease_b: str,
+        already_present: list[str],
+    ) -> list[dict[str, Any]]:
+        """Set differences of two diseases' phenotypes from the adjacency snapshot."""
+
+        def phenotypes_of(disease_id: str) -> dict[str, int]:
+            phenotypes: dict[str, int] = {}
+            for disease in graph.find(disease_id, "disease"):
+                for node in graph.neighbors(
+                    disease, self.PHENOTYPE_RELATIONS, "effect/phenotype"
+                ).tolist():
+                    phenotypes.setdefault(graph.node_id(node), node)
+            return phenotypes
+
+        phenotypes_a = phenotypes_of(disease_a)
+        phenotypes_b = phenotypes_of(disease_b)
+        excluded = set(already_present)
+
+        results = []
+        for own, other, label in (
+            (phenotypes_a, phenotypes_b, "supports_a"),
+            (phenotypes_b, phenotypes_a, "supports_b"),
+        ):
+            candidates = [
+                (hpo_id, node)
+                for hpo_id, node in own.items()
+                if hpo_id not in other and hpo_id not in excluded
+            ]
+            for hpo_id, node in candidates[:5]:
+                results.append(
+                    {"hpo_id": hpo_id, "name": graph.node_name(node), "discriminates": label}
+                )
+        return results
+
+    def _discriminating_phenotypes_result(
+        self,
+        disease_a: str,
+        disease_b: str,
+        results: list[dict[str, Any]],
+    ) -> dict[str, Any]:
         return {
             "operation": "find_discriminating_phenotypes",
             "disease_a": disease_a,
@@ -844,6 +998,12 @@ class PrimeKGOverlay(BaseOverlay):
     # Helper Methods
     # =========================================================================
 
+    def _fresh_adjacency(self) -> Any:
+        """The adjacency snapshot, if one is attached and still fresh."""
+        if self.adjacency is None or not self.adjacency.is_fresh():
+            return None
+        return self.adjacency
+
     async def _verify_primekg_data(self) -> dict[str, Any]:
         """Verify PrimeKG data is loaded in Neo4j."""
         query = """
@@ -916,6 +1076,7 @@ def create_primekg_overlay(
     neo4j_client: Any = None,
     embedding_service: Any = None,
     llm_service: Any = None,
+    adjacency: Any = None,
 ) -> PrimeKGOverlay:
     """
     Factory function to create PrimeKG overlay.
@@ -924,6 +1085,7 @@ def create_primekg_overlay(
         neo4j_client: Neo4j database client
         embedding_service: Embedding service for semantic search
         llm_service: LLM service for NL queries
+        adjacency: PrimeKGAdjacency snapshot for in-process traversal
 
     Returns:
         Configured PrimeKGOverlay instance
@@ -932,4 +1094,5 @@ def create_primekg_overlay(
         neo4j_client=neo4j_client,
         embedding_service=embedding_service,
         llm_service=llm_service,
+        adjacency=adjacency,
     )
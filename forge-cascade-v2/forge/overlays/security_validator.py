@@ -330,6 +330,12 @@ class SecurityValidatorOverlay(BaseOverlay):
 
     REQUIRED_CAPABILITIES = {Capability.DATABASE_READ}
 
+    # The default rules only inspect these keys (user and trust come from the
+    # context). sanitized_data echoes whatever else the input holds, but no
+    # rule depends on those keys, so they are not declared as reads.
+    READS: frozenset[str] | None = frozenset({"content", "action"})
+    WRITES: frozenset[str] | None = frozenset({"validation", "sanitized_data", "blocked"})
+
     def __init__(
         self,
         enable_rate_limiting: bool = True,
@@ -406,6 +412,8 @@ class SecurityValidatorOverlay(BaseOverlay):
         # Add custom rules
         if custom_rules:
             self._rules.extend(custom_rules)
+            # Custom rules may inspect any key
+            self.READS = None
 
         # Threat tracking
         # SECURITY FIX (Audit 3): Bounded memory limits to prevent DoS
@@ -430,7 +438,7 @@ class SecurityValidatorOverlay(BaseOverlay):
             rules=len(self._rules),
             rule_names=[r.name for r in self._rules],
         )
-        return True
+        return await super().initialize()
 
     async def execute(
         self,
@@ -453,7 +461,7 @@ class SecurityValidatorOverlay(BaseOverlay):
 
         start_time = time.time()
 
-        data = input_data or {}
+        data = dict(input_data or {})
         if event:
             data.update(event.payload or {})
             data["event_type"] = event.type.value
@@ -4,6 +4,9 @@ Audit Repository for Forge Cascade V2
 Provides comprehensive audit logging for all system actions,
 changes, and events. Supports compliance, forensics, and
 the Immune System's anomaly detection.
+
+When an AuditWriter is running for the client, log() queues events for
+group commit instead of writing them inline (see audit_writer.py).
 """
 
 from __future__ import annotations
@@ -15,13 +18,15 @@ from uuid import uuid4
 from ..database.client import Neo4jClient
 from ..models.base import TrustLevel
 from ..models.events import AuditEvent, EventPriority, EventType
+from .audit_writer import AuditWriter, get_audit_writer
 
 
 class AuditRepository:
     """Repository for audit log operations."""
 
-    def __init__(self, db: Neo4jClient):
+    def __init__(self, db: Neo4jClient, writer: AuditWriter | None = None):
         self.db = db
+        self._writer = writer if writer is not None else get_audit_writer(db)
 
     # =========================================================================
     # Core Audit Operations
@@ -62,7 +67,8 @@ class AuditRepository:
             trust_level_required: Minimum trust to view this audit entry
 
         Returns:
-            Created AuditEvent
+            Created AuditEvent (queued, not yet committed, when write-behind
+            is enabled)
         """
         event_id = str(uuid4())
         now = datetime.now(UTC)
@@ -115,6 +121,10 @@ class AuditRepository:
             "created_at": now.isoformat(),
         }
 
+        if self._writer is not None and self._writer.is_running:
+            await self._writer.submit(params)
+            return self._to_audit_event(params)
+
         record = await self.db.execute_single(query, params)
         if record is None:
             raise RuntimeError("Failed to create audit event")
@@ -632,6 +642,10 @@ class AuditRepository:
 
     async def get_failed_logins(self, since: datetime, threshold: int = 3) -> list[dict[str, Any]]:
         """Get actors with multiple failed login attempts (security concern)."""
+        # Brute-force detection must see attempts still waiting for group commit
+        if self._writer is not None:
+            await self._writer.flush()
+
         query = """
         MATCH (a:AuditLog {event_type: $event_type})
         WHERE a.timestamp >= datetime($since)
@@ -0,0 +1,499 @@
+"""
+Audit Write-Behind Pipeline
+
+Takes audit log writes off the request path. AuditRepository.log() hands
+each event to an AuditWriter, which appends it to a bounded in-process
+queue and group-commits queued events to Neo4j with a single UNWIND
+every batch_size events or flush_interval_ms, whichever comes first.
+
+Durability:
+- With a journal directory configured, every event is appended to a
+  local journal file and fsynced before log() returns. Events arriving
+  together share one write and one fsync, done off the event loop. Events
+  that were never committed (crash, kill, shutdown timeout) are replayed
+  by the next start().
+- Transient commit failures are retried a bounded number of times. Events
+  that still cannot be committed are appended to a dead-letter file in the
+  journal directory (or only logged without one) and dropped.
+- Commits MERGE on the event id, so replaying an event that was already
+  committed is a no-op.
+- stop() drains the queue before closing.
+
+Back-pressure: when the queue is full, log() waits for the writer to
+catch up instead of dropping events.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+import json
+import os
+from contextlib import suppress
+from pathlib import Path
+from typing import Any
+
+import structlog
+from neo4j.exceptions import Neo4jError, ServiceUnavailable, SessionExpired, TransientError
+
+from ..database.client import Neo4jClient
+
+logger = structlog.get_logger(__name__)
+
+# ON CREATE only: a replayed event must never overwrite the committed one
+COMMIT_QUERY = """
+UNWIND $rows AS row
+MERGE (a:AuditLog {id: row.id})
+ON CREATE SET a += row,
+              a.timestamp = datetime(row.timestamp),
+              a.created_at = datetime(row.created_at)
+"""
+
+COMMIT_ERRORS = (ServiceUnavailable, SessionExpired, TransientError, OSError)
+
+JOURNAL_PREFIX = "audit-"
+JOURNAL_SUFFIX = ".journal"
+DEAD_LETTER_FILE = "audit-dead-letter.jsonl"
+
+
+def journal_file(directory: Path, gen: int) -> Path:
+    """Path of a journal generation."""
+    return directory / f"{JOURNAL_PREFIX}{gen:012d}{JOURNAL_SUFFIX}"
+
+
+class AuditWriter:
+    """
+    Bounded queue plus background group-commit task for audit events.
+
+    Journal files are numbered generations. The writer appends to the
+    newest one and rotates once it exceeds journal_max_bytes. An older
+    generation is deleted as soon as every event it holds is committed.
+    """
+
+    RETRY_BASE_SECONDS = 0.5
+    RETRY_MAX_SECONDS = 30.0
+    MAX_COMMIT_ATTEMPTS = 8
+
+    def __init__(
+        self,
+        db: Neo4jClient,
+        batch_size: int = 500,
+        flush_interval_ms: int = 200,
+        max_queue_size: int = 10000,
+        journal_dir: str | Path | None = None,
+        journal_max_bytes: int = 4 * 1024 * 1024,
+    ):
+        """
+        Initialize the writer (call start() before submitting).
+
+        Args:
+            db: Database client to commit to
+            batch_size: Maximum events per UNWIND commit
+            flush_interval_ms: Maximum time an event waits for its batch to fill
+            max_queue_size: Queued events before submit() blocks
+            journal_dir: Directory for the crash-recovery journal (None disables it)
+            journal_max_bytes: Journal size that triggers rotation
+        """
+        self.db = db
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval_ms / 1000
+        self._queue: asyncio.Queue[tuple[int, dict[str, Any]]] = asyncio.Queue(
+            maxsize=max_queue_size
+        )
+        self._task: asyncio.Task[None] | None = None
+
+        self._journal_dir = Path(journal_dir) if journal_dir else None
+        self._journal_max_bytes = journal_max_bytes
+        # Only the journal flush task touches the open file
+        self._journal_fd: int | None = None
+        self._journal_fd_gen = 0
+        # Generation new events are assigned to, and the bytes assigned to it
+        self._journal_gen = 0
+        self._journal_bytes = 0
+        # Lines awaiting the next group fsync, and the future their submitters wait on
+        self._journal_lines: list[tuple[int, bytes]] = []
+        self._journal_synced: asyncio.Future[None] | None = None
+        self._journal_task: asyncio.Task[None] | None = None
+        # Journal generation -> events written to it but not yet committed
+        self._outstanding: dict[int, int] = {}
+
+        self._events_committed = 0
+        self._events_replayed = 0
+        self._events_dropped = 0
+        self._batches = 0
+        self._commit_failures = 0
+
+    @property
+    def is_running(self) -> bool:
+        """Whether the commit task is running."""
+        return self._task is not None and not self._task.done()
+
+    # =========================================================================
+    # Lifecycle
+    # =========================================================================
+
+    async def start(self) -> None:
+        """Start the commit task and replay any journaled, uncommitted events."""
+        if self.is_running:
+            return
+
+        pending = self._recover_journals(self._journal_dir) if self._journal_dir else []
+        self._task = asyncio.create_task(self._run(), name="audit-writer")
+
+        if self._journal_dir:
+            self._open_journal(self._journal_dir)
+        for gen, row in pending:
+            await self._queue.put((gen, row))
+        self._events_replayed += len(pending)
+
+        logger.info(
+            "audit_writer_started",
+            batch_size=self._batch_size,
+            flush_interval_ms=self._flush_interval * 1000,
+            journal_dir=str(self._journal_dir) if self._journal_dir else None,
+            replayed=len(pending),
+        )
+
+    async def stop(self, timeout: float = 10.0) -> None:
+        """
+        Drain queued events and stop the commit task.
+
+        Events still queued after the timeout stay in the journal (if any)
+        and are replayed by the next start().
+        """
+        if self._task is None:
+            return
+
+        try:
+            await asyncio.wait_for(self._queue.join(), timeout=timeout)
+        except TimeoutError:
+            logger.error(
+                "audit_writer_stop_timeout",
+                pending=self._queue.qsize(),
+                journaled=self._journal_dir is not None,
+            )
+
+        self._task.cancel()
+        with suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
+        if self._journal_task is not None:
+            await self._journal_task
+            self._journal_task = None
+        self._close_journal()
+        logger.info("audit_writer_stopped", events_committed=self._events_committed)
+
+    # =========================================================================
+    # Submission
+    # =========================================================================
+
+    async def submit(self, row: dict[str, Any]) -> None:
+        """
+        Queue an audit row for group commit.
+
+        Args:
+            row: AuditLog properties; timestamp and created_at as ISO strings
+
+        Raises:
+            RuntimeError: If the writer is not running
+        """
+        if not self.is_running:
+            raise RuntimeError("Audit writer is not running")
+
+        gen = self._journal_gen
+        if self._journal_dir is not None:
+            # Count first so a concurrent commit cannot delete the generation
+            self._outstanding[gen] = self._outstanding.get(gen, 0) + 1
+            await self._append_journal(gen, row)
+        await self._queue.put((gen, row))
+
+    async def flush(self) -> None:
+        """Wait until every event queued so far is committed."""
+        if self.is_running:
+            await self._queue.join()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get queue depth and commit counters."""
+        return {
+            "running": self.is_running,
+            "queue_depth": self._queue.qsize(),
+            "events_committed": self._events_committed,
+            "events_replayed": self._events_replayed,
+            "events_dropped": self._events_dropped,
+            "batches": self._batches,
+            "commit_failures": self._commit_failures,
+            "journal_generations": len(self._outstanding),
+        }
+
+    # =========================================================================
+    # Commit Loop
+    # =========================================================================
+
+    async def _run(self) -> None:
+        """Collect batches and commit them until cancelled."""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self._flush_interval
+            while len(batch) < self._batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                    continue
+                except asyncio.QueueEmpty:
+                    pass
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout=remaining))
+                except TimeoutError:
+                    break
+
+            rows = [row for _, row in batch]
+            try:
+                await self._commit_with_retry(rows)
+            except Exception as e:  # Intentional broad catch: a dead writer loses all later events
+                logger.error("audit_batch_dropped", error=str(e), batch_size=len(batch))
+                await self._dead_letter(rows)
+            self._release([gen for gen, _ in batch])
+            for _ in batch:
+                self._queue.task_done()
+
+    async def _commit_with_retry(self, rows: list[dict[str, Any]]) -> None:
+        """Commit a batch; if the database rejects it, commit row by row."""
+        rejected = await self._commit(rows)
+        if rejected is None:
+            self._batches += 1
+            return
+
+        # Not transient: isolate the bad rows instead of blocking the queue
+        logger.error("audit_batch_rejected", error=str(rejected), batch_size=len(rows))
+        for row in rows:
+            error: Exception | None
+            try:
+                error = await self._commit([row])
+            except Exception as e:  # Intentional broad catch: only this row is lost
+                error = e
+            if error is not None:
+                logger.error("audit_event_dropped", audit_id=row.get("id"), error=str(error))
+                await self._dead_letter([row])
+        self._batches += 1
+
+    async def _commit(self, rows: list[dict[str, Any]]) -> Neo4jError | None:
+        """
+        Commit rows, retrying transient failures with backoff.
+
+        Returns:
+            None once committed, or the error if the database rejects the rows
+
+        Raises:
+            ServiceUnavailable, SessionExpired, TransientError, OSError: If the
+                rows still fail after MAX_COMMIT_ATTEMPTS attempts
+        """
+        attempt = 0
+        while True:
+            try:
+                await self.db.execute_write(COMMIT_QUERY, {"rows": rows})
+                self._events_committed += len(rows)
+                return None
+            except COMMIT_ERRORS as e:
+                self._commit_failures += 1
+                attempt += 1
+                if attempt >= self.MAX_COMMIT_ATTEMPTS:
+                    raise
+                delay = min(self.RETRY_BASE_SECONDS * 2**attempt, self.RETRY_MAX_SECONDS)
+                logger.warning(
+                    "audit_batch_commit_failed",
+                    error=str(e),
+                    batch_size=len(rows),
+                    retry_in_seconds=delay,
+                )
+                await asyncio.sleep(delay)
+            except Neo4jError as e:
+                return e
+
+    async def _dead_letter(self, rows: list[dict[str, Any]]) -> None:
+        """Drop rows that could not be committed, keeping a copy if possible."""
+        self._events_dropped += len(rows)
+        if self._journal_dir is None:
+            logger.error("audit_events_dead_lettered", audit_ids=[r.get("id") for r in rows])
+            return
+
+        data = b"".join(json.dumps(r, separators=(",", ":")).encode() + b"\n" for r in rows)
+        try:
+            await asyncio.to_thread(self._write_dead_letter, self._journal_dir, data)
+        except OSError as e:
+            logger.error(
+                "audit_dead_letter_failed",
+                error=str(e),
+                audit_ids=[r.get("id") for r in rows],
+            )
+
+    @staticmethod
+    def _write_dead_letter(directory: Path, data: bytes) -> None:
+        fd = os.open(directory / DEAD_LETTER_FILE, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o600)
+        try:
+            os.write(fd, data)
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+    # =========================================================================
+    # Journal
+    # =========================================================================
+
+    def _recover_journals(self, directory: Path) -> list[tuple[int, dict[str, Any]]]:
+        """Read leftover journal files and claim their events for replay."""
+        directory.mkdir(parents=True, exist_ok=True)
+
+        pending: list[tuple[int, dict[str, Any]]] = []
+        for path in sorted(directory.glob(f"{JOURNAL_PREFIX}*{JOURNAL_SUFFIX}")):
+            gen = int(path.name[len(JOURNAL_PREFIX) : -len(JOURNAL_SUFFIX)])
+            self._journal_gen = max(self._journal_gen, gen + 1)
+            rows = []
+            with path.open("rb") as f:
+                for line in f:
+                    try:
+                        rows.append(json.loads(line))
+                    except ValueError:
+                        # Torn final line from a crash mid-write
+                        logger.warning("audit_journal_line_skipped", journal=path.name)
+            if rows:
+                self._outstanding[gen] = len(rows)
+                pending.extend((gen, row) for row in rows)
+            else:
+                path.unlink()
+
+        if pending:
+            logger.warning("audit_journal_replay", events=len(pending))
+        return pending
+
+    def _open_journal(self, directory: Path) -> None:
+        path = journal_file(directory, self._journal_gen)
+        self._journal_fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o600)
+        self._journal_fd_gen = self._journal_gen
+        self._journal_bytes = path.stat().st_size
+
+    def _close_journal(self) -> None:
+        if self._journal_fd is None or self._journal_dir is None:
+            return
+        os.close(self._journal_fd)
+        self._journal_fd = None
+        gen = self._journal_fd_gen
+        if not self._outstanding.get(gen):
+            self._outstanding.pop(gen, None)
+            journal_file(self._journal_dir, gen).unlink(missing_ok=True)
+
+    async def _append_journal(self, gen: int, row: dict[str, Any]) -> None:
+        """Add a row to the next group write and wait until it is fsynced."""
+        line = json.dumps(row, separators=(",", ":")).encode() + b"\n"
+        self._journal_lines.append((gen, line))
+        # Rotation only assigns later events to the next generation; the
+        # flush task switches files when it reaches them
+        self._journal_bytes += len(line)
+        if self._journal_bytes >= self._journal_max_bytes:
+            self._journal_gen += 1
+            self._journal_bytes = 0
+
+        if self._journal_synced is None:
+            self._journal_synced = asyncio.get_running_loop().create_future()
+        synced = self._journal_synced
+        if self._journal_task is None or self._journal_task.done():
+            self._journal_task = asyncio.create_task(
+                self._flush_journal(), name="audit-journal-flush"
+            )
+        await asyncio.shield(synced)
+
+    async def _flush_journal(self) -> None:
+        """Write and fsync queued journal lines, one group at a time."""
+        while self._journal_lines:
+            lines, self._journal_lines = self._journal_lines, []
+            synced, self._journal_synced = self._journal_synced, None
+            assert synced is not None
+            try:
+                await asyncio.to_thread(self._write_journal, lines)
+            except OSError as e:
+                synced.set_exception(e)
+                # Mark it retrieved in case every submitter was cancelled
+                synced.exception()
+            else:
+                synced.set_result(None)
+
+    def _write_journal(self, lines: list[tuple[int, bytes]]) -> None:
+        """Append lines to their generations' files with one fsync per file."""
+        assert self._journal_dir is not None
+        for gen, group in itertools.groupby(lines, key=lambda item: item[0]):
+            if self._journal_fd is None or gen != self._journal_fd_gen:
+                if self._journal_fd is not None:
+                    os.close(self._journal_fd)
+                    self._journal_fd = None
+                path = journal_file(self._journal_dir, gen)
+                self._journal_fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o600)
+                self._journal_fd_gen = gen
+            os.write(self._journal_fd, b"".join(line for _, line in group))
+            os.fsync(self._journal_fd)
+
+    def _release(self, gens: list[int]) -> None:
+        """Mark committed events and delete fully committed, closed generations."""
+        if self._journal_dir is None:
+            return
+        for gen in gens:
+            remaining = self._outstanding.get(gen, 0) - 1
+            if remaining > 0:
+                self._outstanding[gen] = remaining
+                continue
+            self._outstanding.pop(gen, None)
+            if gen != self._journal_gen or self._journal_fd is None:
+                journal_file(self._journal_dir, gen).unlink(missing_ok=True)
+
+
+# =============================================================================
+# Writer Singleton
+# =============================================================================
+
+_audit_writer: AuditWriter | None = None
+
+
+async def start_audit_writer(db: Neo4jClient, **kwargs: Any) -> AuditWriter:
+    """
+    Start the process-wide audit writer for a database client.
+
+    Args:
+        db: Database client to commit to
+        **kwargs: AuditWriter options
+
+    Returns:
+        The running writer
+    """
+    global _audit_writer
+    if _audit_writer is not None and _audit_writer.is_running:
+        return _audit_writer
+    _audit_writer = AuditWriter(db, **kwargs)
+    await _audit_writer.start()
+    return _audit_writer
+
+
+async def stop_audit_writer(timeout: float = 10.0) -> None:
+    """Drain and stop the process-wide audit writer."""
+    global _audit_writer
+    if _audit_writer is not None:
+        await _audit_writer.stop(timeout=timeout)
+        _audit_writer = None
+
+
+def get_audit_writer(db: Neo4jClient | None = None) -> AuditWriter | None:
+    """
+    Get the running audit writer, if any.
+
+    Args:
+        db: Only return the writer if it commits to this client
+
+    Returns:
+        Running AuditWriter or None
+    """
+    writer = _audit_writer
+    if writer is None or not writer.is_running:
+        return None
+    if db is not None and writer.db is not db:
+        return None
+    return writer
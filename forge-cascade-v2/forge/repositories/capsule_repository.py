@@ -9,17 +9,25 @@ Integrity Features:
 - Computes merkle_root for lineage verification
 - Stores parent_content_hash on fork for immutable snapshots
 - Optional integrity verification on read
+
+Listing:
+- Keyset pagination on (created_at, id) with opaque cursors
+- Per-filter totals cached and adjusted on create/archive/delete
 """
 
 from __future__ import annotations
 
+import base64
 import json
 import secrets
+import time
 from datetime import datetime
-from typing import Any
+from typing import Any, ClassVar
+from weakref import WeakKeyDictionary
 
 import structlog
 
+from forge.config import get_settings
 from forge.models.base import CapsuleType, TrustLevel, generate_id
 from forge.models.capsule import (
     Capsule,
@@ -47,6 +55,100 @@ from forge.security.capsule_integrity import (
 
 logger = structlog.get_logger(__name__)
 
+# (type, owner_id, tag) filter combination; None means unfiltered
+CountKey = tuple[str | None, str | None, str | None]
+
+MAX_CURSOR_LENGTH = 512
+
+
+def encode_cursor(created_at: str, capsule_id: str) -> str:
+    """Encode a (created_at, id) position as an opaque page cursor."""
+    raw = json.dumps([created_at, capsule_id], separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[str, str]:
+    """
+    Decode a page cursor back into its (created_at, id) position.
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    if len(cursor) > MAX_CURSOR_LENGTH:
+        raise ValueError("Invalid pagination cursor")
+    try:
+        decoded = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+    except ValueError as e:
+        raise ValueError("Invalid pagination cursor") from e
+    if (
+        not isinstance(decoded, list)
+        or len(decoded) != 2
+        or not all(isinstance(part, str) for part in decoded)
+    ):
+        raise ValueError("Invalid pagination cursor")
+    return decoded[0], decoded[1]
+
+
+class CapsuleCountCache:
+    """
+    Cached capsule totals for list views, one entry per filter combination.
+
+    A total is counted once and then adjusted in place as capsules are
+    created and archived, so list pages skip the full count(c) scan.
+    Entries expire after capsule_count_cache_ttl_seconds, which bounds
+    drift from writes made by other processes. Totals are kept per
+    database client so separate databases never share counts.
+    """
+
+    _counts: ClassVar[WeakKeyDictionary[Any, dict[CountKey, tuple[int, float]]]] = (
+        WeakKeyDictionary()
+    )
+
+    @classmethod
+    def get(cls, client: Any, key: CountKey) -> int | None:
+        """Get a cached total, or None if missing or expired."""
+        entries = cls._counts.get(client)
+        if not entries or key not in entries:
+            return None
+        count, cached_at = entries[key]
+        if time.monotonic() - cached_at > get_settings().capsule_count_cache_ttl_seconds:
+            del entries[key]
+            return None
+        return count
+
+    @classmethod
+    def set(cls, client: Any, key: CountKey, count: int) -> None:
+        """Store an exact total."""
+        cls._counts.setdefault(client, {})[key] = (count, time.monotonic())
+
+    @classmethod
+    def adjust(cls, client: Any, capsule: Capsule, delta: int) -> None:
+        """Add delta to every cached total whose filters match the capsule."""
+        entries = cls._counts.get(client)
+        if not entries:
+            return
+        capsule_type = capsule.type.value if isinstance(capsule.type, CapsuleType) else capsule.type
+        for key, (count, cached_at) in entries.items():
+            type_filter, owner_filter, tag_filter = key
+            if (
+                (type_filter is None or type_filter == capsule_type)
+                and (owner_filter is None or owner_filter == capsule.owner_id)
+                and (tag_filter is None or tag_filter in capsule.tags)
+            ):
+                entries[key] = (max(0, count + delta), cached_at)
+
+    @classmethod
+    def invalidate(cls, client: Any, tagged_only: bool = False) -> None:
+        """Drop cached totals (only tag-filtered ones if tagged_only)."""
+        entries = cls._counts.get(client)
+        if not entries:
+            return
+        if tagged_only:
+            for key in [key for key in entries if key[2] is not None]:
+                del entries[key]
+        else:
+            entries.clear()
+
 
 class CapsuleRepository(BaseRepository[Capsule, CapsuleCreate, CapsuleUpdate]):
     """
@@ -246,6 +348,7 @@ class CapsuleRepository(BaseRepository[Capsule, CapsuleCreate, CapsuleUpdate]):
             capsule = self._to_model(result["capsule"])
             if capsule is None:
                 raise RuntimeError("Failed to deserialize created capsule")
+            CapsuleCountCache.adjust(self.client, capsule, 1)
             return capsule
 
         raise RuntimeError("Failed to create capsule")
@@ -327,6 +430,8 @@ class CapsuleRepository(BaseRepository[Capsule, CapsuleCreate, CapsuleUpdate]):
         )
 
         if result and result.get("capsule"):
+            if data.tags is not None:
+                CapsuleCountCache.invalidate(self.client, tagged_only=True)
             return self._to_model(result["capsule"])
 
         # SECURITY FIX: Log if update failed due to authorization
@@ -569,7 +674,31 @@ class CapsuleRepository(BaseRepository[Capsule, CapsuleCreate, CapsuleUpdate]):
 
     async def archive(self, capsule_id: str) -> Capsule | None:
         """Archive a capsule (soft delete)."""
-        return await self.update_field(capsule_id, "is_archived", True)
+        query = """
+        MATCH (c:Capsule {id: $id})
+        WITH c, c.is_archived AS was_archived
+        SET c.is_archived = true, c.updated_at = $now
+        RETURN c {.*} AS entity, was_archived
+        """
+        result = await self.client.execute_single(
+            query,
+            {"id": capsule_id, "now": self._now().isoformat()},
+            timeout=self.timeout_config.write_timeout,
+        )
+        if not result or not result.get("entity"):
+            return None
+
+        capsule = self._to_model(result["entity"])
+        if capsule is not None and not result.get("was_archived"):
+            CapsuleCountCache.adjust(self.client, capsule, -1)
+        return capsule
+
+    async def delete(self, entity_id: str) -> bool:
+        """Delete a capsule and drop cached list totals."""
+        deleted = await super().delete(entity_id)
+        if deleted:
+            CapsuleCountCache.invalidate(self.client)
+        return deleted
 
     async def increment_view_count(self, capsule_id: str) -> None:
         """Increment the view counter for a capsule."""
@@ -641,30 +770,14 @@ class CapsuleRepository(BaseRepository[Capsule, CapsuleCreate, CapsuleUpdate]):
 
         return [LineageNode(**r["node"]) for r in results if r.get("node") and r["node"].get("id")]
 
-    async def list_capsules(
+    def _list_filters(
         self,
-        offset: int = 0,
-        limit: int = 20,
-        filters: dict[str, Any] | None = None,
-    ) -> tuple[list[Capsule], int]:
-        """
-        List capsules with pagination and filters.
-
-        Args:
-            offset: Number of records to skip
-            limit: Maximum records to return (capped at 200)
-            filters: Optional filters (type, owner_id, tag)
-
-        Returns:
-            Tuple of (capsules, total_count)
-        """
-        # SECURITY FIX (Audit 4 - Session 4): Bound limit/offset to prevent abuse
-        limit = max(1, min(int(limit), 200))
-        offset = max(0, int(offset))
-
+        filters: dict[str, Any] | None,
+    ) -> tuple[list[str], dict[str, Any], CountKey]:
+        """Build WHERE conditions, parameters and count key for list filters."""
         filters = filters or {}
         conditions = ["c.is_archived = false"]
-        params: dict[str, Any] = {"offset": offset, "limit": limit}
+        params: dict[str, Any] = {}
 
         if filters.get("type"):
             conditions.append("c.type = $type")
@@ -678,25 +791,77 @@ class CapsuleRepository(BaseRepository[Capsule, CapsuleCreate, CapsuleUpdate]):
             conditions.append("$tag IN c.tags")
             params["tag"] = filters["tag"]
 
-        where_clause = " AND ".join(conditions)
+        key = (params.get("type"), params.get("owner_id"), params.get("tag"))
+        return conditions, params, key
+
+    async def count_capsules(
+        self,
+        filters: dict[str, Any] | None = None,
+        exact: bool = False,
+    ) -> int:
+        """
+        Count active capsules matching the list filters.
+
+        Args:
+            filters: Optional filters (type, owner_id, tag)
+            exact: Bypass the cached total and count in the database
+
+        Returns:
+            Number of matching capsules
+        """
+        conditions, params, key = self._list_filters(filters)
+        if not exact:
+            cached = CapsuleCountCache.get(self.client, key)
+            if cached is not None:
+                return cached
 
-        # Get count
         count_query = f"""
         MATCH (c:Capsule)
-        WHERE {where_clause}
+        WHERE {" AND ".join(conditions)}
         RETURN count(c) AS total
         """
         count_result = await self.client.execute_single(
             count_query, params, timeout=self.timeout_config.read_timeout
         )
         total = count_result["total"] if count_result else 0
+        CapsuleCountCache.set(self.client, key, total)
+        return int(total)
+
+    async def list_capsules(
+        self,
+        offset: int = 0,
+        limit: int = 20,
+        filters: dict[str, Any] | None = None,
+        exact_count: bool = False,
+    ) -> tuple[list[Capsule], int]:
+        """
+        List capsules with pagination and filters.
+
+        Prefer list_capsules_after() for anything beyond the first few
+        pages: SKIP still has to walk every skipped row.
+
+        Args:
+            offset: Number of records to skip
+            limit: Maximum records to return (capped at 200)
+            filters: Optional filters (type, owner_id, tag)
+            exact_count: Count in the database instead of using the cache
+
+        Returns:
+            Tuple of (capsules, total_count)
+        """
+        # SECURITY FIX (Audit 4 - Session 4): Bound limit/offset to prevent abuse
+        limit = max(1, min(int(limit), 200))
+        offset = max(0, int(offset))
+
+        total = await self.count_capsules(filters, exact=exact_count)
 
-        # Get capsules
+        conditions, params, _ = self._list_filters(filters)
+        params.update(offset=offset, limit=limit)
         query = f"""
         MATCH (c:Capsule)
-        WHERE {where_clause}
+        WHERE {" AND ".join(conditions)}
         RETURN c {{.*}} AS capsule
-        ORDER BY c.created_at DESC
+        ORDER BY c.created_at DESC, c.id DESC
         SKIP $offset
         LIMIT $limit
         """
@@ -706,6 +871,60 @@ class CapsuleRepository(BaseRepository[Capsule, CapsuleCreate, CapsuleUpdate]):
 
         return capsules, total
 
+    async def list_capsules_after(
+        self,
+        cursor: str | None = None,
+        limit: int = 20,
+        filters: dict[str, Any] | None = None,
+    ) -> tuple[list[Capsule], str | None]:
+        """
+        List capsules newest first, continuing from a page cursor.
+
+        Seeks directly to the cursor position on (created_at, id), so
+        every page costs the same regardless of depth.
+
+        Args:
+            cursor: Cursor from a previous page, or None for the first page
+            limit: Maximum records to return (capped at 200)
+            filters: Optional filters (type, owner_id, tag)
+
+        Returns:
+            Tuple of (capsules, next_cursor); next_cursor is None on the
+            last page
+
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        limit = max(1, min(int(limit), 200))
+
+        conditions, params, _ = self._list_filters(filters)
+        if cursor:
+            params["cursor_created_at"], params["cursor_id"] = decode_cursor(cursor)
+            conditions.append(
+                "(c.created_at < $cursor_created_at OR "
+                "(c.created_at = $cursor_created_at AND c.id < $cursor_id))"
+            )
+        # Fetch one extra row to learn whether another page exists
+        params["limit"] = limit + 1
+
+        query = f"""
+        MATCH (c:Capsule)
+        WHERE {" AND ".join(conditions)}
+        RETURN c {{.*}} AS capsule
+        ORDER BY c.created_at DESC, c.id DESC
+        LIMIT $limit
+        """
+
+        results = await self.client.execute(query, params, timeout=self.timeout_config.read_timeout)
+        records = [r["capsule"] for r in results if r.get("capsule")]
+
+        next_cursor = None
+        if len(records) > limit:
+            records = records[:limit]
+            next_cursor = encode_cursor(str(records[-1]["created_at"]), str(records[-1]["id"]))
+
+        return self._to_models(records), next_cursor
+
     async def get_ancestors(
         self,
         capsule_id: str,
@@ -923,6 +1142,140 @@ class CapsuleRepository(BaseRepository[Capsule, CapsuleCreate, CapsuleUpdate]):
         results = await self.client.execute(query, params, timeout=self.timeout_config.read_timeout)
         return [r["edge"] for r in results if r.get("edge")]
 
+    async def get_change_page(
+        self,
+        since: datetime | None,
+        cursor: str | None = None,
+        types: list[str] | None = None,
+        min_trust: int = 0,
+        limit: int = 100,
+    ) -> tuple[list[Capsule], list[str], str | None]:
+        """
+        Get one page of the capsule change feed (for federation sync).
+
+        Live and archived capsules are read in a single pass ordered by
+        (updated_at, id), so consecutive pages are contiguous slices of
+        the feed and the cursor resumes exactly after the last row.
+        Archived capsules are reported as deletions when since is set.
+
+        Args:
+            since: Get changes after this timestamp (None = all)
+            cursor: Cursor from a previous page, or None for the first page
+            types: Filter by capsule types
+            min_trust: Minimum trust level
+            limit: Maximum rows (capped at 500)
+
+        Returns:
+            Tuple of (changed capsules, deleted capsule IDs, next_cursor);
+            next_cursor is None on the last page
+
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        limit = max(1, min(int(limit), 500))
+
+        live = ["c.is_archived = false", "c.trust_level >= $min_trust"]
+        params: dict[str, Any] = {"min_trust": min_trust, "limit": limit + 1}
+        if types:
+            live.append("c.type IN $types")
+            params["types"] = types
+
+        conditions = []
+        if since:
+            conditions.append("c.updated_at > $since")
+            conditions.append(f"(c.is_archived = true OR ({' AND '.join(live)}))")
+            params["since"] = since.isoformat()
+        else:
+            conditions.extend(live)
+        if cursor:
+            params["cursor_updated_at"], params["cursor_id"] = decode_cursor(cursor)
+            conditions.append(
+                "(c.updated_at > $cursor_updated_at OR "
+                "(c.updated_at = $cursor_updated_at AND c.id > $cursor_id))"
+            )
+
+        query = f"""
+        MATCH (c:Capsule)
+        WHERE {" AND ".join(conditions)}
+        RETURN c {{.*}} AS capsule
+        ORDER BY c.updated_at ASC, c.id ASC
+        LIMIT $limit
+        """
+
+        results = await self.client.execute(query, params, timeout=self.timeout_config.read_timeout)
+        records = [r["capsule"] for r in results if r.get("capsule")]
+
+        next_cursor = None
+        if len(records) > limit:
+            records = records[:limit]
+            next_cursor = encode_cursor(str(records[-1]["updated_at"]), str(records[-1]["id"]))
+
+        deleted_ids = [str(r["id"]) for r in records if r.get("is_archived")]
+        live_records = [r for r in records if not r.get("is_archived")]
+        return self._to_models(live_records), deleted_ids, next_cursor
+
+    async def get_edge_page(
+        self,
+        since: datetime | None,
+        cursor: str | None = None,
+        limit: int = 100,
+    ) -> tuple[list[dict[str, Any]], str | None]:
+        """
+        Get one page of the edge change feed, ordered by (timestamp, id).
+
+        Args:
+            since: Get changes after this timestamp (None = all)
+            cursor: Cursor from a previous page, or None for the first page
+            limit: Maximum results (capped at 500)
+
+        Returns:
+            Tuple of (edge dictionaries, next_cursor); next_cursor is None
+            on the last page
+
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        limit = max(1, min(int(limit), 500))
+
+        conditions = []
+        params: dict[str, Any] = {"limit": limit + 1}
+        if since:
+            conditions.append("ts > $since")
+            params["since"] = since.isoformat()
+        if cursor:
+            params["cursor_ts"], params["cursor_id"] = decode_cursor(cursor)
+            conditions.append("(ts > $cursor_ts OR (ts = $cursor_ts AND edge_id > $cursor_id))")
+
+        where_clause = "WHERE " + " AND ".join(conditions) if conditions else ""
+
+        query = f"""
+        MATCH (source:Capsule)-[r:DERIVED_FROM]->(target:Capsule)
+        WITH source, target, r,
+             coalesce(r.timestamp, '') AS ts,
+             source.id + '->' + target.id AS edge_id
+        {where_clause}
+        RETURN {{
+            id: edge_id,
+            source_id: source.id,
+            target_id: target.id,
+            relationship_type: 'DERIVED_FROM',
+            timestamp: r.timestamp,
+            reason: r.reason
+        }} AS edge
+        ORDER BY ts ASC, edge_id ASC
+        LIMIT $limit
+        """
+
+        results = await self.client.execute(query, params, timeout=self.timeout_config.read_timeout)
+        edges = [r["edge"] for r in results if r.get("edge")]
+
+        next_cursor = None
+        if len(edges) > limit:
+            edges = edges[:limit]
+            next_cursor = encode_cursor(str(edges[-1].get("timestamp") or ""), str(edges[-1]["id"]))
+
+        return edges, next_cursor
+
     async def find_similar_by_embedding(
         self,
         embedding: list[float],
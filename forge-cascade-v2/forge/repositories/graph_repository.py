@@ -3,10 +3,12 @@ Graph Algorithm Repository
 
 Provides graph algorithm computations with a layered backend approach:
 1. Neo4j GDS (Graph Data Science) - Best performance
-2. Pure Cypher - Works everywhere
-3. NetworkX - Full algorithm support, in-memory fallback
+2. In-memory CSR snapshot (GraphBackend.NETWORKX) - Full algorithm support
+   without GDS, for graphs up to max_nodes_for_networkx
+3. Pure Cypher - Works everywhere, approximations only
 """
 
+import asyncio
 import re
 from datetime import UTC, datetime
 from typing import Any
@@ -98,6 +100,7 @@ from forge.models.graph_analysis import (
     TrustTransitivityResult,
 )
 from forge.repositories.base import DEFAULT_QUERY_TIMEOUT, QueryTimeoutConfig
+from forge.repositories.graph_snapshot import GraphSnapshot
 
 logger = structlog.get_logger(__name__)
 
@@ -108,8 +111,8 @@ class GraphAlgorithmProvider:
 
     Tries backends in order of preference:
     1. Neo4j GDS (if available)
-    2. Pure Cypher (always available)
-    3. NetworkX (for algorithms not available in Cypher)
+    2. In-memory graph snapshot (if the graph fits in max_nodes_for_networkx)
+    3. Pure Cypher (always available)
     """
 
     def __init__(
@@ -130,8 +133,11 @@ class GraphAlgorithmProvider:
         if self._gds_available is None:
             self._gds_available = await self._check_gds_available()
 
-        if self._gds_available:
+        preferred = self.config.preferred_backend
+        if self._gds_available and preferred != GraphBackend.NETWORKX:
             return GraphBackend.GDS
+        if self.config.in_memory_fallback or preferred == GraphBackend.NETWORKX:
+            return GraphBackend.NETWORKX
         return GraphBackend.CYPHER
 
     async def _check_gds_available(self) -> bool:
@@ -169,6 +175,107 @@ class GraphAlgorithmProvider:
         if self.config.enable_caching:
             self._cache[cache_key] = (value, datetime.now(UTC))
 
+    # ═══════════════════════════════════════════════════════════════
+    # IN-MEMORY SNAPSHOT
+    # ═══════════════════════════════════════════════════════════════
+
+    async def _load_snapshot(
+        self,
+        node_label: str,
+        relationship_types: list[str] | None,
+    ) -> GraphSnapshot | None:
+        """
+        Load a CSR snapshot of nodes with one label and the edges between them.
+
+        Snapshots are cached like algorithm results, so algorithms run back
+        to back share one load.
+
+        Args:
+            node_label: Label of the nodes to load
+            relationship_types: Relationship types to load (all if None)
+
+        Returns:
+            The snapshot, or None if the graph exceeds max_nodes_for_networkx
+            or cannot be loaded
+        """
+        # SECURITY FIX: Validate all user-controlled identifiers to prevent Cypher injection
+        label = validate_neo4j_identifier(node_label, "node_label")
+        rel_clause = ""
+        if relationship_types:
+            rel_clause = f":{validate_relationship_pattern(relationship_types)}"
+
+        cache_key = f"snapshot:{label}:{rel_clause}"
+        cached = self._get_cached(cache_key)
+        if cached is not None:
+            cached_snapshot: GraphSnapshot = cached
+            return cached_snapshot
+
+        try:
+            # Safe: label validated above
+            count_result = await self.client.execute_single(
+                f"MATCH (n:{label}) RETURN count(n) AS count",
+                timeout=self.timeout_config.read_timeout,
+            )
+            node_count = count_result.get("count", 0) if count_result else 0
+            if node_count > self.config.max_nodes_for_networkx:
+                self.logger.info(
+                    "Graph too large for in-memory backend, using Cypher",
+                    node_count=node_count,
+                    max_nodes=self.config.max_nodes_for_networkx,
+                )
+                return None
+
+            # Safe: label validated above
+            nodes = await self.client.execute(
+                f"""
+                MATCH (n:{label})
+                RETURN n.id AS id, n.title AS title, n.trust_level AS trust_level,
+                       n.type AS type
+                LIMIT $limit
+                """,
+                {"limit": self.config.max_nodes_for_networkx},
+                timeout=self.timeout_config.complex_read_timeout,
+            )
+            # Safe: label and rel_clause validated above
+            edges = await self.client.execute(
+                f"""
+                MATCH (a:{label})-[r{rel_clause}]->(b:{label})
+                RETURN a.id AS source, b.id AS target, type(r) AS rel_type
+                """,
+                timeout=self.timeout_config.complex_read_timeout,
+            )
+        except (RuntimeError, OSError, ValueError) as e:
+            self.logger.warning("Graph snapshot load failed, using Cypher", error=str(e))
+            return None
+
+        snapshot = GraphSnapshot.from_records(nodes, edges)
+        self._set_cached(cache_key, snapshot)
+        return snapshot
+
+    def _snapshot_rankings(
+        self,
+        snapshot: GraphSnapshot,
+        scores: Any,
+        node_label: str,
+        limit: int,
+    ) -> list[NodeRanking]:
+        """Top-scored snapshot nodes as rankings."""
+        # SECURITY FIX (Audit 4 - Session 4): Bound limit to prevent memory exhaustion
+        safe_limit = max(1, min(int(limit), 1000))
+        values = [float(score) for score in scores]
+        order = sorted(range(len(values)), key=lambda i: -values[i])[:safe_limit]
+        return [
+            NodeRanking(
+                node_id=snapshot.node_ids[i],
+                node_type=node_label,
+                score=max(0.0, values[i]),
+                rank=rank,
+                title=snapshot.titles[i],
+                trust_level=snapshot.trust_levels[i],
+            )
+            for rank, i in enumerate(order, start=1)
+        ]
+
     # ═══════════════════════════════════════════════════════════════
     # PAGERANK
     # ═══════════════════════════════════════════════════════════════
@@ -193,9 +300,13 @@ class GraphAlgorithmProvider:
         start_time = datetime.now(UTC)
         backend = await self.detect_backend()
 
+        result = None
         if backend == GraphBackend.GDS:
             result = await self._gds_pagerank(request)
-        else:
+        elif backend == GraphBackend.NETWORKX:
+            result = await self._memory_pagerank(request)
+        if result is None:
+            backend = GraphBackend.CYPHER
             result = await self._cypher_pagerank(request)
 
         result.backend_used = backend
@@ -375,6 +486,33 @@ class GraphAlgorithmProvider:
             },
         )
 
+    async def _memory_pagerank(self, request: PageRankRequest) -> NodeRankingResult | None:
+        """Compute PageRank by power iteration over an in-memory snapshot."""
+        snapshot = await self._load_snapshot(request.node_label, [request.relationship_type])
+        if snapshot is None:
+            return None
+
+        scores = await asyncio.to_thread(
+            snapshot.pagerank,
+            damping_factor=request.damping_factor,
+            max_iterations=request.max_iterations,
+            tolerance=request.tolerance,
+            trust_weighted=request.include_trust_weighting,
+        )
+
+        return NodeRankingResult(
+            algorithm=AlgorithmType.PAGERANK,
+            backend_used=GraphBackend.NETWORKX,
+            rankings=self._snapshot_rankings(snapshot, scores, request.node_label, request.limit),
+            total_nodes=snapshot.node_count,
+            computation_time_ms=0.0,
+            parameters={
+                "damping_factor": request.damping_factor,
+                "max_iterations": request.max_iterations,
+                "trust_weighted": request.include_trust_weighting,
+            },
+        )
+
     # ═══════════════════════════════════════════════════════════════
     # CENTRALITY
     # ═══════════════════════════════════════════════════════════════
@@ -395,11 +533,15 @@ class GraphAlgorithmProvider:
         start_time = datetime.now(UTC)
         backend = await self.detect_backend()
 
+        result = None
         if request.algorithm == AlgorithmType.DEGREE_CENTRALITY:
             result = await self._degree_centrality(request)
         elif backend == GraphBackend.GDS:
             result = await self._gds_centrality(request)
-        else:
+        elif backend == GraphBackend.NETWORKX:
+            result = await self._memory_centrality(request)
+        if result is None:
+            backend = GraphBackend.CYPHER
             result = await self._cypher_centrality(request)
 
         result.backend_used = backend
@@ -576,6 +718,48 @@ class GraphAlgorithmProvider:
         request.algorithm = AlgorithmType.DEGREE_CENTRALITY
         return await self._degree_centrality(request)
 
+    # Betweenness and closeness sample this many source/target nodes on larger graphs
+    _BETWEENNESS_MAX_SOURCES = 256
+    _CLOSENESS_MAX_TARGETS = 256
+
+    async def _memory_centrality(self, request: CentralityRequest) -> NodeRankingResult | None:
+        """Compute centrality over an in-memory snapshot."""
+        snapshot = await self._load_snapshot(
+            request.node_label,
+            [request.relationship_type] if request.relationship_type else None,
+        )
+        if snapshot is None:
+            return None
+
+        parameters: dict[str, Any] = {"normalized": request.normalized}
+        if request.algorithm == AlgorithmType.CLOSENESS_CENTRALITY:
+            max_targets = None
+            if snapshot.node_count > self._CLOSENESS_MAX_TARGETS:
+                max_targets = self._CLOSENESS_MAX_TARGETS
+                parameters["sampled_targets"] = max_targets
+            scores = await asyncio.to_thread(snapshot.closeness, max_targets=max_targets)
+        elif request.algorithm == AlgorithmType.EIGENVECTOR_CENTRALITY:
+            scores = await asyncio.to_thread(snapshot.eigenvector)
+        else:
+            max_sources = None
+            if snapshot.node_count > self._BETWEENNESS_MAX_SOURCES:
+                max_sources = self._BETWEENNESS_MAX_SOURCES
+                parameters["sampled_sources"] = max_sources
+            scores = await asyncio.to_thread(
+                snapshot.betweenness,
+                normalized=request.normalized,
+                max_sources=max_sources,
+            )
+
+        return NodeRankingResult(
+            algorithm=request.algorithm,
+            backend_used=GraphBackend.NETWORKX,
+            rankings=self._snapshot_rankings(snapshot, scores, request.node_label, request.limit),
+            total_nodes=snapshot.node_count,
+            computation_time_ms=0.0,
+            parameters=parameters,
+        )
+
     # ═══════════════════════════════════════════════════════════════
     # COMMUNITY DETECTION
     # ═══════════════════════════════════════════════════════════════
@@ -596,9 +780,13 @@ class GraphAlgorithmProvider:
         start_time = datetime.now(UTC)
         backend = await self.detect_backend()
 
+        result = None
         if backend == GraphBackend.GDS:
             result = await self._gds_communities(request)
-        else:
+        elif backend == GraphBackend.NETWORKX:
+            result = await self._memory_communities(request)
+        if result is None:
+            backend = GraphBackend.CYPHER
             result = await self._cypher_communities(request)
 
         result.backend_used = backend
@@ -781,6 +969,72 @@ class GraphAlgorithmProvider:
             parameters={"note": "Connected component approximation"},
         )
 
+    async def _memory_communities(
+        self,
+        request: CommunityDetectionRequest,
+    ) -> CommunityDetectionResult | None:
+        """Detect communities with Louvain or label propagation over a snapshot."""
+        node_label = request.node_label or "Capsule"
+        snapshot = await self._load_snapshot(
+            node_label, [request.relationship_type or "DERIVED_FROM"]
+        )
+        if snapshot is None:
+            return None
+
+        if request.algorithm == AlgorithmType.COMMUNITY_LABEL_PROPAGATION:
+            algorithm = AlgorithmType.COMMUNITY_LABEL_PROPAGATION
+            labels = await asyncio.to_thread(snapshot.label_propagation)
+        else:
+            algorithm = AlgorithmType.COMMUNITY_LOUVAIN
+            labels = await asyncio.to_thread(snapshot.louvain)
+
+        groups: dict[int, list[int]] = {}
+        for node, label in enumerate(labels):
+            groups.setdefault(label, []).append(node)
+        ranked = sorted(groups.values(), key=len, reverse=True)
+
+        communities: list[Community] = []
+        for members in ranked:
+            if len(communities) >= request.max_communities:
+                break
+            if len(members) < request.min_community_size:
+                continue
+
+            types = [snapshot.node_types[m] for m in members if snapshot.node_types[m]]
+            trusts = [t for t in (snapshot.trust_levels[m] for m in members) if t is not None]
+            size = len(members)
+            possible_edges = size * (size - 1) / 2
+
+            communities.append(
+                Community(
+                    community_id=len(communities),
+                    members=[
+                        CommunityMember(node_id=snapshot.node_ids[m], node_type=node_label)
+                        for m in members
+                    ],
+                    size=size,
+                    density=min(1.0, snapshot.internal_edge_count(members) / possible_edges)
+                    if possible_edges
+                    else 0.0,
+                    dominant_type=max(set(types), key=types.count) if types else None,
+                    avg_trust_level=sum(trusts) / len(trusts) if trusts else 60.0,
+                )
+            )
+
+        covered = sum(c.size for c in communities)
+        modularity = snapshot.modularity(labels)
+
+        return CommunityDetectionResult(
+            algorithm=algorithm,
+            backend_used=GraphBackend.NETWORKX,
+            communities=communities,
+            total_communities=len(communities),
+            modularity=max(-1.0, min(1.0, modularity)),
+            coverage=covered / snapshot.node_count if snapshot.node_count else 0.0,
+            computation_time_ms=0.0,
+            parameters={},
+        )
+
     # ═══════════════════════════════════════════════════════════════
     # TRUST TRANSITIVITY
     # ═══════════════════════════════════════════════════════════════
@@ -1018,9 +1272,12 @@ class GraphAlgorithmProvider:
         start_time = datetime.now(UTC)
         backend = await self.detect_backend()
 
+        result = None
         if backend == GraphBackend.GDS:
             result = await self._gds_node_similarity(request)
-        else:
+        elif backend == GraphBackend.NETWORKX:
+            result = await self._memory_node_similarity(request)
+        if result is None:
             result = await self._cypher_node_similarity(request)
 
         result.computation_time_ms = (datetime.now(UTC) - start_time).total_seconds() * 1000
@@ -1230,6 +1487,59 @@ class GraphAlgorithmProvider:
             backend_used=GraphBackend.CYPHER,
         )
 
+    async def _memory_node_similarity(
+        self,
+        request: NodeSimilarityRequest,
+    ) -> NodeSimilarityResult | None:
+        """Compute neighbor-overlap similarity over an in-memory snapshot."""
+        snapshot = await self._load_snapshot(request.node_label, [request.relationship_type])
+        if snapshot is None:
+            return None
+
+        metric = request.similarity_metric
+        if metric not in ("jaccard", "overlap", "cosine"):
+            metric = "jaccard"
+
+        source: int | None = None
+        if request.source_node_id:
+            source = snapshot.index.get(request.source_node_id)
+            if source is None:
+                return NodeSimilarityResult(
+                    source_id=request.source_node_id,
+                    similarity_metric=metric,
+                    top_k=request.top_k,
+                    computation_time_ms=0.0,
+                    backend_used=GraphBackend.NETWORKX,
+                )
+
+        # SECURITY FIX (Audit 4 - Session 4): Bound top_k to prevent memory exhaustion
+        safe_top_k = max(1, min(int(request.top_k), 500))
+        pairs = await asyncio.to_thread(
+            snapshot.similar_nodes,
+            source=source,
+            metric=metric,
+            top_k=safe_top_k,
+            cutoff=request.similarity_cutoff,
+        )
+
+        return NodeSimilarityResult(
+            source_id=request.source_node_id,
+            similar_nodes=[
+                SimilarNode(
+                    node_id=snapshot.node_ids[other],
+                    node_type=snapshot.node_types[other] or request.node_label,
+                    title=snapshot.titles[other],
+                    similarity_score=min(1.0, similarity),
+                    shared_neighbors=shared,
+                )
+                for _, other, similarity, shared in pairs
+            ],
+            similarity_metric=metric,
+            top_k=request.top_k,
+            computation_time_ms=0.0,
+            backend_used=GraphBackend.NETWORKX,
+        )
+
     # ═══════════════════════════════════════════════════════════════
     # SHORTEST PATH
     # ═══════════════════════════════════════════════════════════════
@@ -1241,14 +1551,18 @@ class GraphAlgorithmProvider:
         """
         Compute shortest path between two nodes.
 
-        Uses GDS if available for weighted paths, otherwise Cypher.
+        Uses GDS if available for weighted paths, then the in-memory
+        backend, otherwise Cypher.
         """
         start_time = datetime.now(UTC)
         backend = await self.detect_backend()
 
+        result = None
         if request.weighted and backend == GraphBackend.GDS:
             result = await self._gds_shortest_path(request)
-        else:
+        elif backend == GraphBackend.NETWORKX:
+            result = await self._memory_shortest_path(request)
+        if result is None:
             result = await self._cypher_shortest_path(request)
 
         result.computation_time_ms = (datetime.now(UTC) - start_time).total_seconds() * 1000
@@ -1435,6 +1749,71 @@ class GraphAlgorithmProvider:
                 backend_used=GraphBackend.CYPHER,
             )
 
+    async def _memory_shortest_path(
+        self,
+        request: ShortestPathRequest,
+    ) -> ShortestPathResult | None:
+        """Compute the shortest path over an in-memory snapshot."""
+        snapshot = await self._load_snapshot("Capsule", request.relationship_types)
+        if snapshot is None:
+            return None
+
+        source = snapshot.index.get(request.source_id)
+        target = snapshot.index.get(request.target_id)
+        found = None
+        if source is not None and target is not None:
+            # SECURITY FIX: Clamp max_depth like the Cypher path
+            max_depth = max(1, min(int(request.max_depth), 20))
+            found = await asyncio.to_thread(
+                snapshot.shortest_path,
+                source,
+                target,
+                relationship_types=request.relationship_types,
+                max_depth=max_depth,
+                weighted=request.weighted,
+            )
+
+        if found is None:
+            return ShortestPathResult(
+                source_id=request.source_id,
+                target_id=request.target_id,
+                path_found=False,
+                computation_time_ms=0.0,
+                backend_used=GraphBackend.NETWORKX,
+            )
+
+        path, path_rel_types = found
+        trusts = [snapshot.trust_levels[i] for i in path]
+
+        # Compute total trust if weighted
+        total_trust = None
+        if request.weighted:
+            valid_trusts = [t for t in trusts if t is not None]
+            if valid_trusts:
+                total_trust = 1.0
+                for t in valid_trusts:
+                    total_trust *= t / 100.0
+
+        return ShortestPathResult(
+            source_id=request.source_id,
+            target_id=request.target_id,
+            path_found=True,
+            path_length=len(path) - 1,
+            path_nodes=[
+                PathNode(
+                    node_id=snapshot.node_ids[i],
+                    node_type="Capsule",
+                    title=snapshot.titles[i],
+                    trust_level=snapshot.trust_levels[i],
+                )
+                for i in path
+            ],
+            path_relationships=path_rel_types,
+            total_trust=total_trust,
+            computation_time_ms=0.0,
+            backend_used=GraphBackend.NETWORKX,
+        )
+
 
 class GraphRepository:
     """
@@ -1447,10 +1826,13 @@ class GraphRepository:
         self,
         client: Neo4jClient,
         timeout_config: QueryTimeoutConfig | None = None,
+        config: GraphAlgorithmConfig | None = None,
     ):
         self.client = client
         self.timeout_config = timeout_config or DEFAULT_QUERY_TIMEOUT
-        self.provider = GraphAlgorithmProvider(client, timeout_config=self.timeout_config)
+        self.provider = GraphAlgorithmProvider(
+            client, config=config, timeout_config=self.timeout_config
+        )
         self.logger = structlog.get_logger(self.__class__.__name__)
 
     async def compute_pagerank(
@@ -1567,7 +1949,7 @@ class GraphRepository:
         """Check if GDS is available and return status."""
         backend = await self.provider.detect_backend()
         return {
-            "gds_available": backend == GraphBackend.GDS,
+            "gds_available": bool(self.provider._gds_available),
             "active_backend": backend.value,
             "cache_enabled": self.provider.config.enable_caching,
             "cache_entries": len(self.provider._cache),
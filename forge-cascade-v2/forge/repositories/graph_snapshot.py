@@ -0,0 +1,680 @@
+"""
+In-Memory Graph Snapshot
+
+Compact CSR (compressed sparse row) snapshot of the capsule graph used by
+the in-memory graph algorithm backend (GraphBackend.NETWORKX). Nodes are
+renumbered 0..n-1 and edges are stored as NumPy arrays, so algorithms run
+in-process without the Neo4j GDS plugin:
+
+- PageRank (power iteration, optionally trust-weighted)
+- Betweenness, closeness and eigenvector centrality
+- Louvain and label propagation community detection
+- Neighbor-overlap node similarity (Jaccard, overlap, cosine)
+- Shortest paths (BFS, or trust-weighted Dijkstra)
+"""
+
+from __future__ import annotations
+
+import heapq
+import math
+import random
+from collections import deque
+from dataclasses import dataclass, field
+from functools import cached_property
+from typing import Any, cast
+
+import numpy as np
+from numpy.typing import NDArray
+
+
+@dataclass
+class GraphSnapshot:
+    """
+    Directed multigraph in CSR form.
+
+    Out-edges of node ``i`` are ``indices[indptr[i]:indptr[i + 1]]``, with
+    matching relationship type codes in ``edge_types`` (indexes into
+    ``rel_types``).
+    """
+
+    node_ids: list[str]
+    titles: list[str | None]
+    trust_levels: list[int | None]
+    node_types: list[str | None]
+    rel_types: list[str]
+    indptr: NDArray[Any]
+    indices: NDArray[Any]
+    edge_types: NDArray[Any]
+    index: dict[str, int] = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        if not self.index:
+            self.index = {node_id: i for i, node_id in enumerate(self.node_ids)}
+
+    @classmethod
+    def from_records(
+        cls,
+        nodes: list[dict[str, Any]],
+        edges: list[dict[str, Any]],
+    ) -> GraphSnapshot:
+        """
+        Build a snapshot from query records.
+
+        Args:
+            nodes: Records with ``id`` and optional ``title``, ``trust_level``, ``type``
+            edges: Records with ``source``, ``target`` and ``rel_type``
+
+        Returns:
+            Snapshot; edges to unknown nodes and self-loops are dropped
+        """
+        node_ids: list[str] = []
+        titles: list[str | None] = []
+        trust_levels: list[int | None] = []
+        node_types: list[str | None] = []
+        index: dict[str, int] = {}
+        for record in nodes:
+            node_id = record.get("id")
+            if not node_id or node_id in index:
+                continue
+            index[node_id] = len(node_ids)
+            node_ids.append(node_id)
+            titles.append(record.get("title"))
+            trust_levels.append(record.get("trust_level"))
+            node_types.append(record.get("type"))
+
+        rel_types: list[str] = []
+        rel_codes: dict[str, int] = {}
+        sources: list[int] = []
+        targets: list[int] = []
+        codes: list[int] = []
+        for record in edges:
+            source = index.get(record.get("source", ""))
+            target = index.get(record.get("target", ""))
+            if source is None or target is None or source == target:
+                continue
+            rel_type = record.get("rel_type") or ""
+            if rel_type not in rel_codes:
+                rel_codes[rel_type] = len(rel_types)
+                rel_types.append(rel_type)
+            sources.append(source)
+            targets.append(target)
+            codes.append(rel_codes[rel_type])
+
+        n = len(node_ids)
+        src = np.asarray(sources, dtype=np.int64)
+        order = np.argsort(src, kind="stable")
+        indptr = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(src, minlength=n), out=indptr[1:])
+
+        return cls(
+            node_ids=node_ids,
+            titles=titles,
+            trust_levels=trust_levels,
+            node_types=node_types,
+            rel_types=rel_types,
+            indptr=indptr,
+            indices=np.asarray(targets, dtype=np.int32)[order],
+            edge_types=np.asarray(codes, dtype=np.int16)[order],
+            index=index,
+        )
+
+    @property
+    def node_count(self) -> int:
+        return len(self.node_ids)
+
+    @property
+    def edge_count(self) -> int:
+        return int(self.indices.shape[0])
+
+    # ═══════════════════════════════════════════════════════════════
+    # DERIVED ADJACENCY
+    # ═══════════════════════════════════════════════════════════════
+
+    @cached_property
+    def edge_sources(self) -> NDArray[Any]:
+        """Source node of each edge, aligned with ``indices``."""
+        return np.repeat(
+            np.arange(self.node_count, dtype=np.int64),
+            np.diff(self.indptr),
+        )
+
+    @cached_property
+    def successors(self) -> list[list[int]]:
+        """Distinct out-neighbors of each node."""
+        indices = cast(list[int], self.indices.tolist())
+        indptr = cast(list[int], self.indptr.tolist())
+        return [
+            list(dict.fromkeys(indices[indptr[i] : indptr[i + 1]])) for i in range(self.node_count)
+        ]
+
+    @cached_property
+    def predecessors(self) -> list[list[int]]:
+        """Distinct in-neighbors of each node."""
+        result: list[dict[int, None]] = [{} for _ in range(self.node_count)]
+        sources = cast(list[int], self.edge_sources.tolist())
+        targets = cast(list[int], self.indices.tolist())
+        for source, target in zip(sources, targets, strict=True):
+            result[target][source] = None
+        return [list(preds) for preds in result]
+
+    @cached_property
+    def neighbors(self) -> list[set[int]]:
+        """Distinct neighbors of each node, ignoring direction."""
+        result: list[set[int]] = [set() for _ in range(self.node_count)]
+        sources = cast(list[int], self.edge_sources.tolist())
+        targets = cast(list[int], self.indices.tolist())
+        for source, target in zip(sources, targets, strict=True):
+            result[source].add(target)
+            result[target].add(source)
+        return result
+
+    @cached_property
+    def undirected_weights(self) -> list[dict[int, float]]:
+        """Edge multiplicities between node pairs, ignoring direction."""
+        result: list[dict[int, float]] = [{} for _ in range(self.node_count)]
+        sources = cast(list[int], self.edge_sources.tolist())
+        targets = cast(list[int], self.indices.tolist())
+        for source, target in zip(sources, targets, strict=True):
+            result[source][target] = result[source].get(target, 0.0) + 1.0
+            result[target][source] = result[target].get(source, 0.0) + 1.0
+        return result
+
+    def _typed_neighbors(self, allowed: set[int] | None) -> list[list[tuple[int, int]]]:
+        """(neighbor, type code) pairs per node in both directions, filtered by type."""
+        result: list[list[tuple[int, int]]] = [[] for _ in range(self.node_count)]
+        sources = cast(list[int], self.edge_sources.tolist())
+        targets = cast(list[int], self.indices.tolist())
+        codes = cast(list[int], self.edge_types.tolist())
+        for source, target, code in zip(sources, targets, codes, strict=True):
+            if allowed is None or code in allowed:
+                result[source].append((target, code))
+                result[target].append((source, code))
+        return result
+
+    # ═══════════════════════════════════════════════════════════════
+    # RANKING
+    # ═══════════════════════════════════════════════════════════════
+
+    def pagerank(
+        self,
+        damping_factor: float = 0.85,
+        max_iterations: int = 20,
+        tolerance: float = 1e-7,
+        trust_weighted: bool = False,
+    ) -> NDArray[np.float64]:
+        """
+        PageRank by power iteration.
+
+        Dangling nodes spread their rank uniformly. With ``trust_weighted``
+        each node splits its rank across out-edges in proportion to the
+        trust level of the edge targets.
+
+        Returns:
+            Scores summing to 1.0, indexed by node
+        """
+        n = self.node_count
+        if n == 0:
+            return np.zeros(0)
+
+        src = self.edge_sources
+        dst = self.indices
+        if trust_weighted:
+            trust = np.asarray(
+                [60 if t is None else t for t in self.trust_levels], dtype=np.float64
+            )
+            weights = np.clip(trust, 0.0, None)[dst] / 100.0
+        else:
+            weights = np.ones(src.shape[0])
+
+        out_weight = np.bincount(src, weights=weights, minlength=n)
+        norm = np.divide(
+            weights,
+            out_weight[src],
+            out=np.zeros_like(weights),
+            where=out_weight[src] > 0,
+        )
+        dangling = out_weight == 0
+
+        rank = np.full(n, 1.0 / n)
+        for _ in range(max_iterations):
+            inflow = np.bincount(dst, weights=rank[src] * norm, minlength=n)
+            updated = (1.0 - damping_factor) / n + damping_factor * (
+                inflow + rank[dangling].sum() / n
+            )
+            delta = float(np.abs(updated - rank).sum())
+            rank = updated
+            if delta < n * tolerance:
+                break
+        return rank
+
+    def betweenness(
+        self,
+        normalized: bool = True,
+        max_sources: int | None = None,
+        seed: int = 0,
+    ) -> NDArray[np.float64]:
+        """
+        Betweenness centrality (Brandes) over directed, unweighted edges.
+
+        Args:
+            normalized: Divide by the number of ordered node pairs
+            max_sources: Sample this many source nodes and rescale, for large graphs
+            seed: Seed for source sampling
+
+        Returns:
+            Scores indexed by node
+        """
+        n = self.node_count
+        successors = self.successors
+        sources: list[int] = list(range(n))
+        if max_sources is not None and max_sources < n:
+            sources = random.Random(seed).sample(sources, max_sources)
+
+        scores = [0.0] * n
+        # Buffers are reset only for the nodes each search reaches, so
+        # sparse lineage DAGs stay cheap
+        sigma = [0.0] * n
+        dist = [-1] * n
+        delta = [0.0] * n
+        preds: list[list[int]] = [[] for _ in range(n)]
+        for s in sources:
+            order: list[int] = []
+            sigma[s] = 1.0
+            dist[s] = 0
+            queue = deque([s])
+            while queue:
+                v = queue.popleft()
+                order.append(v)
+                next_dist = dist[v] + 1
+                for w in successors[v]:
+                    if dist[w] < 0:
+                        dist[w] = next_dist
+                        queue.append(w)
+                    if dist[w] == next_dist:
+                        sigma[w] += sigma[v]
+                        preds[w].append(v)
+
+            for w in reversed(order):
+                coefficient = (1.0 + delta[w]) / sigma[w]
+                for v in preds[w]:
+                    delta[v] += sigma[v] * coefficient
+                if w != s:
+                    scores[w] += delta[w]
+
+            for v in order:
+                sigma[v] = 0.0
+                dist[v] = -1
+                delta[v] = 0.0
+                preds[v] = []
+
+        result = np.asarray(scores)
+        if sources and len(sources) < n:
+            result *= n / len(sources)
+        if normalized and n > 2:
+            result /= (n - 1) * (n - 2)
+        return result
+
+    def closeness(self, max_targets: int | None = None, seed: int = 0) -> NDArray[np.float64]:
+        """
+        Closeness centrality over outgoing paths.
+
+        Uses the Wasserman-Faust correction so nodes that reach few others
+        are not scored as central. Distances are gathered by BFS backwards
+        from each target, so sampling targets estimates every node's score
+        (the reached fraction and mean distance are both averages over them).
+
+        Args:
+            max_targets: Sample this many target nodes, for large graphs
+            seed: Seed for target sampling
+
+        Returns:
+            Scores indexed by node
+        """
+        n = self.node_count
+        scores = np.zeros(n)
+        if n < 2:
+            return scores
+
+        predecessors = self.predecessors
+        targets: list[int] = list(range(n))
+        if max_targets is not None and max_targets < n:
+            targets = random.Random(seed).sample(targets, max_targets)
+
+        reached = [0] * n
+        total = [0] * n
+        dist = [-1] * n
+        for t in targets:
+            dist[t] = 0
+            order = [t]
+            queue = deque([t])
+            while queue:
+                v = queue.popleft()
+                next_dist = dist[v] + 1
+                for w in predecessors[v]:
+                    if dist[w] < 0:
+                        dist[w] = next_dist
+                        reached[w] += 1
+                        total[w] += next_dist
+                        order.append(w)
+                        queue.append(w)
+            for v in order:
+                dist[v] = -1
+
+        hits = np.asarray(reached, dtype=np.float64)
+        distances = np.asarray(total, dtype=np.float64)
+        # Targets other than the node itself
+        others = np.full(n, float(len(targets)))
+        others[targets] -= 1
+        mask = distances > 0
+        scores[mask] = (hits[mask] / distances[mask]) * (hits[mask] / others[mask])
+        return scores
+
+    def eigenvector(
+        self, max_iterations: int = 100, tolerance: float = 1e-6
+    ) -> NDArray[np.float64]:
+        """Eigenvector centrality from incoming edges, by power iteration."""
+        n = self.node_count
+        if n == 0:
+            return np.zeros(0)
+
+        src = self.edge_sources
+        dst = self.indices
+        x: NDArray[np.float64] = np.full(n, 1.0 / n)
+        for _ in range(max_iterations):
+            # Adding x keeps the iteration convergent on bipartite graphs
+            incoming: NDArray[Any] = np.bincount(dst, weights=x[src], minlength=n)
+            updated: NDArray[np.float64] = x + incoming
+            norm = float(np.linalg.norm(updated))
+            if norm == 0.0:
+                return np.zeros(n)
+            updated /= norm
+            if float(np.abs(updated - x).sum()) < n * tolerance:
+                return updated
+            x = updated
+        return x
+
+    # ═══════════════════════════════════════════════════════════════
+    # COMMUNITIES
+    # ═══════════════════════════════════════════════════════════════
+
+    def louvain(
+        self,
+        resolution: float = 1.0,
+        max_levels: int = 10,
+        max_passes: int = 50,
+        tolerance: float = 1e-4,
+        seed: int = 0,
+    ) -> list[int]:
+        """
+        Louvain community detection on the undirected graph.
+
+        A level stops once a full pass over its nodes improves modularity
+        by less than ``tolerance``.
+
+        Returns:
+            Community label per node, numbered from 0
+        """
+        n = self.node_count
+        rng = random.Random(seed)
+        partition = list(range(n))
+
+        adjacency: list[dict[int, float]] = [dict(w) for w in self.undirected_weights]
+        internal = [0.0] * n
+        degree = [sum(w.values()) for w in adjacency]
+        two_m = sum(degree)
+        if two_m == 0:
+            return partition
+
+        for _ in range(max_levels):
+            size = len(adjacency)
+            community = list(range(size))
+            totals = list(degree)
+            improved = False
+
+            nodes = list(range(size))
+            rng.shuffle(nodes)
+            for _ in range(max_passes):
+                pass_gain = 0.0
+                for i in nodes:
+                    current = community[i]
+                    k_i = degree[i]
+                    links: dict[int, float] = {}
+                    for j, w in adjacency[i].items():
+                        links[community[j]] = links.get(community[j], 0.0) + w
+
+                    totals[current] -= k_i
+                    best = current
+                    stay_gain = links.get(current, 0.0) - resolution * totals[current] * k_i / two_m
+                    best_gain = stay_gain
+                    for candidate, w in links.items():
+                        gain = w - resolution * totals[candidate] * k_i / two_m
+                        if gain > best_gain:
+                            best, best_gain = candidate, gain
+                    totals[best] += k_i
+
+                    if best != current:
+                        community[i] = best
+                        pass_gain += best_gain - stay_gain
+                        improved = True
+                if 2 * pass_gain / two_m < tolerance:
+                    break
+
+            if not improved:
+                break
+
+            # Aggregate each community into a single node
+            relabel = {c: k for k, c in enumerate(dict.fromkeys(community))}
+            partition = [relabel[community[p]] for p in partition]
+            merged: list[dict[int, float]] = [{} for _ in relabel]
+            merged_internal = [0.0] * len(relabel)
+            merged_degree = [0.0] * len(relabel)
+            for i in range(size):
+                ci = relabel[community[i]]
+                merged_internal[ci] += internal[i]
+                merged_degree[ci] += degree[i]
+                for j, w in adjacency[i].items():
+                    cj = relabel[community[j]]
+                    if ci == cj:
+                        # Each internal edge is seen from both ends
+                        merged_internal[ci] += w / 2
+                    else:
+                        merged[ci][cj] = merged[ci].get(cj, 0.0) + w
+            adjacency, internal, degree = merged, merged_internal, merged_degree
+
+        relabel = {c: k for k, c in enumerate(dict.fromkeys(partition))}
+        return [relabel[c] for c in partition]
+
+    def label_propagation(self, max_iterations: int = 20, seed: int = 0) -> list[int]:
+        """
+        Asynchronous label propagation on the undirected graph.
+
+        Returns:
+            Community label per node, numbered from 0
+        """
+        n = self.node_count
+        rng = random.Random(seed)
+        weights = self.undirected_weights
+        labels = list(range(n))
+
+        nodes = list(range(n))
+        for _ in range(max_iterations):
+            rng.shuffle(nodes)
+            changed = False
+            for i in nodes:
+                if not weights[i]:
+                    continue
+                counts: dict[int, float] = {}
+                for j, w in weights[i].items():
+                    counts[labels[j]] = counts.get(labels[j], 0.0) + w
+                top = max(counts.values())
+                if counts.get(labels[i], 0.0) == top:
+                    continue
+                labels[i] = min(label for label, w in counts.items() if w == top)
+                changed = True
+            if not changed:
+                break
+
+        relabel = {c: k for k, c in enumerate(dict.fromkeys(labels))}
+        return [relabel[c] for c in labels]
+
+    def modularity(self, labels: list[int], resolution: float = 1.0) -> float:
+        """Newman modularity of a partition of the undirected graph."""
+        weights = self.undirected_weights
+        two_m = sum(sum(w.values()) for w in weights)
+        if two_m == 0:
+            return 0.0
+
+        internal: dict[int, float] = {}
+        totals: dict[int, float] = {}
+        for i, neighbors in enumerate(weights):
+            totals[labels[i]] = totals.get(labels[i], 0.0) + sum(neighbors.values())
+            for j, w in neighbors.items():
+                if labels[j] == labels[i]:
+                    internal[labels[i]] = internal.get(labels[i], 0.0) + w
+
+        return sum(
+            internal.get(c, 0.0) / two_m - resolution * (total / two_m) ** 2
+            for c, total in totals.items()
+        )
+
+    def internal_edge_count(self, members: list[int]) -> int:
+        """Number of distinct undirected edges inside a node set."""
+        member_set = set(members)
+        neighbors = self.neighbors
+        return sum(len(neighbors[i] & member_set) for i in members) // 2
+
+    # ═══════════════════════════════════════════════════════════════
+    # SIMILARITY AND PATHS
+    # ═══════════════════════════════════════════════════════════════
+
+    def similar_nodes(
+        self,
+        source: int | None = None,
+        metric: str = "jaccard",
+        top_k: int = 10,
+        cutoff: float = 0.0,
+    ) -> list[tuple[int, int, float, int]]:
+        """
+        Node similarity from shared neighbors, ignoring direction.
+
+        Only pairs with at least one shared neighbor are scored.
+
+        Args:
+            source: Score pairs with this node only; all pairs if None
+            metric: ``jaccard``, ``overlap`` or ``cosine``
+            top_k: Number of pairs to return
+            cutoff: Minimum similarity
+
+        Returns:
+            (node, other, similarity, shared) tuples, most similar first
+        """
+        neighbors = self.neighbors
+
+        def score(a: set[int], b: set[int], shared: int) -> float:
+            if metric == "overlap":
+                return shared / min(len(a), len(b))
+            if metric == "cosine":
+                return shared / math.sqrt(len(a) * len(b))
+            return shared / (len(a) + len(b) - shared)
+
+        heap: list[tuple[float, int, int, int]] = []
+        sources = [source] if source is not None else range(self.node_count)
+        for u in sources:
+            candidates: set[int] = set()
+            for v in neighbors[u]:
+                candidates.update(neighbors[v])
+            candidates.discard(u)
+            for other in candidates:
+                # Each unordered pair is scored once when scanning all nodes
+                if source is None and other < u:
+                    continue
+                shared = len(neighbors[u] & neighbors[other])
+                similarity = score(neighbors[u], neighbors[other], shared)
+                if similarity < cutoff:
+                    continue
+                entry = (similarity, u, other, shared)
+                if len(heap) < top_k:
+                    heapq.heappush(heap, entry)
+                elif entry > heap[0]:
+                    heapq.heapreplace(heap, entry)
+
+        return [
+            (u, other, similarity, shared)
+            for similarity, u, other, shared in sorted(heap, reverse=True)
+        ]
+
+    def shortest_path(
+        self,
+        source: int,
+        target: int,
+        relationship_types: list[str] | None = None,
+        max_depth: int = 10,
+        weighted: bool = False,
+    ) -> tuple[list[int], list[str]] | None:
+        """
+        Shortest path ignoring edge direction.
+
+        Unweighted search minimises hops. Weighted search maximises the
+        product of trust levels along the path, preferring fewer hops on ties.
+
+        Returns:
+            (node path, relationship types along it), or None if unreachable
+            within ``max_depth`` hops
+        """
+        allowed = None
+        if relationship_types is not None:
+            allowed = {i for i, name in enumerate(self.rel_types) if name in relationship_types}
+        adjacency = self._typed_neighbors(allowed)
+
+        previous: dict[int, tuple[int, int]] = {}
+        if source == target:
+            return [source], []
+
+        if weighted:
+            # Cost of entering a node is -log(trust); zero-trust nodes are impassable
+            def cost(node: int) -> float:
+                trust = self.trust_levels[node]
+                trust = 60 if trust is None else trust
+                return -math.log(trust / 100.0) if trust > 0 else math.inf
+
+            best: dict[int, tuple[float, int]] = {source: (0.0, 0)}
+            heap: list[tuple[float, int, int]] = [(0.0, 0, source)]
+            while heap:
+                total, hops, v = heapq.heappop(heap)
+                if best.get(v, (math.inf, 0)) < (total, hops):
+                    continue
+                if v == target:
+                    break
+                if hops >= max_depth:
+                    continue
+                for w, code in adjacency[v]:
+                    candidate = (total + cost(w), hops + 1)
+                    if candidate[0] < math.inf and candidate < best.get(w, (math.inf, 0)):
+                        best[w] = candidate
+                        previous[w] = (v, code)
+                        heapq.heappush(heap, (candidate[0], candidate[1], w))
+        else:
+            depth = {source: 0}
+            queue = deque([source])
+            while queue and target not in depth:
+                v = queue.popleft()
+                if depth[v] >= max_depth:
+                    continue
+                for w, code in adjacency[v]:
+                    if w not in depth:
+                        depth[w] = depth[v] + 1
+                        previous[w] = (v, code)
+                        queue.append(w)
+
+        if target not in previous:
+            return None
+
+        path = [target]
+        rel_path: list[str] = []
+        while path[-1] != source:
+            node, code = previous[path[-1]]
+            rel_path.append(self.rel_types[code])
+            path.append(node)
+        path.reverse()
+        rel_path.reverse()
+        return path, rel_path
@@ -3,14 +3,22 @@ Temporal Repository
 
 Manages capsule versioning and trust snapshot storage with
 hybrid snapshot/diff strategy and smart compression.
+
+Versioning:
+- Diffs are positional hunks, so reconstruction is exact
+- Snapshot placement adapts to content size and read frequency
+- Reconstructed versions are kept in a shared LRU
 """
 
 import hashlib
+from collections import OrderedDict
 from datetime import UTC, datetime, timedelta
-from typing import Any
+from typing import Any, ClassVar
+from weakref import WeakKeyDictionary
 
 import structlog
 
+from forge.config import get_settings
 from forge.database.client import Neo4jClient
 from forge.models.base import generate_id
 from forge.models.temporal import (
@@ -29,9 +37,88 @@ from forge.models.temporal import (
     VersionHistory,
     VersioningPolicy,
 )
+from forge.repositories.version_delta import apply_hunks, compute_hunks
 
 logger = structlog.get_logger(__name__)
 
+# Lines kept in VersionDiff.added_lines/removed_lines for display
+DIFF_PREVIEW_LINES = 100
+
+
+class _ClientVersionCache:
+    """LRU of version contents plus decaying read counts for one client."""
+
+    def __init__(self) -> None:
+        self.contents: OrderedDict[str, str] = OrderedDict()
+        self.size = 0
+        self.reads: dict[str, int] = {}
+        self.reads_since_decay = 0
+
+
+class VersionContentCache:
+    """
+    Reconstructed capsule version contents, shared by all repositories.
+
+    Versions are immutable, so entries never go stale; the LRU is bounded
+    by version_cache_max_bytes. Also counts recent historical reads per
+    capsule, halving all counts every READ_DECAY_INTERVAL reads, so that
+    snapshot placement can favour frequently read capsules. State is kept
+    per database client so separate databases never share entries.
+    """
+
+    READ_DECAY_INTERVAL = 1000
+
+    _caches: ClassVar[WeakKeyDictionary[Any, _ClientVersionCache]] = WeakKeyDictionary()
+
+    @classmethod
+    def _for(cls, client: Any) -> _ClientVersionCache:
+        cache = cls._caches.get(client)
+        if cache is None:
+            cache = cls._caches[client] = _ClientVersionCache()
+        return cache
+
+    @classmethod
+    def get(cls, client: Any, version_id: str) -> str | None:
+        """Get cached content for a version, marking it recently used."""
+        cache = cls._caches.get(client)
+        if cache is None or version_id not in cache.contents:
+            return None
+        cache.contents.move_to_end(version_id)
+        return cache.contents[version_id]
+
+    @classmethod
+    def put(cls, client: Any, version_id: str, content: str) -> None:
+        """Cache a version's content, evicting least recently used entries."""
+        max_bytes = get_settings().version_cache_max_bytes
+        size = len(content)
+        if size > max_bytes:
+            return
+        cache = cls._for(client)
+        previous = cache.contents.pop(version_id, None)
+        if previous is not None:
+            cache.size -= len(previous)
+        cache.contents[version_id] = content
+        cache.size += size
+        while cache.size > max_bytes:
+            _, evicted = cache.contents.popitem(last=False)
+            cache.size -= len(evicted)
+
+    @classmethod
+    def record_read(cls, client: Any, capsule_id: str) -> None:
+        """Count a historical read of a capsule."""
+        cache = cls._for(client)
+        cache.reads[capsule_id] = cache.reads.get(capsule_id, 0) + 1
+        cache.reads_since_decay += 1
+        if cache.reads_since_decay >= cls.READ_DECAY_INTERVAL:
+            cache.reads = {key: count // 2 for key, count in cache.reads.items() if count > 1}
+            cache.reads_since_decay = 0
+
+    @classmethod
+    def read_count(cls, client: Any, capsule_id: str) -> int:
+        """Recent historical reads of a capsule."""
+        cache = cls._caches.get(client)
+        return cache.reads.get(capsule_id, 0) if cache else 0
+
 
 class TemporalRepository:
     """
@@ -79,7 +166,12 @@ class TemporalRepository:
         current = await self._get_latest_version(capsule_id)
         change_number = (current.get("version_count", 0) if current else 0) + 1
         previous_content = current.get("content") if current else None
-        diff_chain_length = current.get("diff_chain_length", 0) if current else 0
+        diff_chain_length = (current.get("diff_chain_length") or 0) if current else 0
+        diff_chain_bytes = (current.get("diff_chain_bytes") or 0) if current else 0
+
+        # The latest version is itself a diff: diff against its reconstruction
+        if current and previous_content is None and current.get("version_id"):
+            previous_content = await self._get_content_by_id(current["version_id"])
 
         # Compute content hash
         content_hash = hashlib.sha256(content.encode()).hexdigest()
@@ -105,31 +197,38 @@ class TemporalRepository:
             trust_level=trust_level,
             is_major_version=is_major,
             diff_chain_length=diff_chain_length,
+            content_size=len(content.encode()),
+            diff_chain_bytes=diff_chain_bytes,
+            hot=VersionContentCache.read_count(self.client, capsule_id)
+            >= self.policy.hot_read_threshold,
         )
 
         # Build version data
         version_id = generate_id()
         now = self._now()
 
+        diff_json: str | None = None
         if should_snapshot or previous_content is None:
             # Full snapshot
             snapshot_type = SnapshotType.FULL
-            content_snapshot = content
-            diff_data = None
+            content_snapshot: str | None = content
             new_diff_chain = 0
+            new_diff_chain_bytes = 0
         else:
             # Diff from previous
             snapshot_type = SnapshotType.DIFF
             content_snapshot = None
-            diff_data = self._compute_diff(previous_content, content)
+            diff_json = self._compute_diff(previous_content, content).model_dump_json()
             new_diff_chain = diff_chain_length + 1
+            new_diff_chain_bytes = diff_chain_bytes + len(diff_json)
 
             # Check if diff is too large
-            if diff_data and len(str(diff_data.model_dump())) > self.policy.max_diff_size_bytes:
+            if len(diff_json) > self.policy.max_diff_size_bytes:
                 snapshot_type = SnapshotType.FULL
                 content_snapshot = content
-                diff_data = None
+                diff_json = None
                 new_diff_chain = 0
+                new_diff_chain_bytes = 0
 
         # Create version in database
         query = """
@@ -150,7 +249,8 @@ class TemporalRepository:
             created_by: $created_by,
             created_at: $now,
             updated_at: $now,
-            diff_chain_length: $diff_chain_length
+            diff_chain_length: $diff_chain_length,
+            diff_chain_bytes: $diff_chain_bytes
         })
         WITH v
         MATCH (c:Capsule {id: $capsule_id})
@@ -170,7 +270,7 @@ class TemporalRepository:
             "snapshot_type": snapshot_type.value,
             "content_snapshot": content_snapshot,
             "content_hash": content_hash,
-            "diff_json": diff_data.model_dump_json() if diff_data else None,
+            "diff_json": diff_json,
             "parent_version_id": current.get("version_id") if current else None,
             "trust_level": trust_level,
             "change_type": change_type.value,
@@ -180,11 +280,13 @@ class TemporalRepository:
             "created_by": created_by,
             "now": now.isoformat(),
             "diff_chain_length": new_diff_chain,
+            "diff_chain_bytes": new_diff_chain_bytes,
         }
 
         result = await self.client.execute_single(query, params)
 
         if result and result.get("version"):
+            VersionContentCache.put(self.client, version_id, content)
             self.logger.info(
                 "Created version",
                 capsule_id=capsule_id,
@@ -270,6 +372,7 @@ class TemporalRepository:
 
         if result and result.get("version"):
             version = self._to_version(result["version"])
+            VersionContentCache.record_read(self.client, capsule_id)
 
             # If it's a diff, reconstruct content
             if version.snapshot_type == SnapshotType.DIFF:
@@ -302,6 +405,7 @@ class TemporalRepository:
 
         va = self._to_version(result["version_a"])
         vb = self._to_version(result["version_b"])
+        VersionContentCache.record_read(self.client, va.capsule_id)
 
         # Reconstruct content if needed
         content_a = va.content_snapshot or await self._reconstruct_content(va)
@@ -331,6 +435,7 @@ class TemporalRepository:
                v.version_number AS version_number,
                v.content_snapshot AS content,
                v.diff_chain_length AS diff_chain_length,
+               v.diff_chain_bytes AS diff_chain_bytes,
                count(all) AS version_count
         """
 
@@ -342,6 +447,18 @@ class TemporalRepository:
         if version.snapshot_type == SnapshotType.FULL:
             content_snapshot = version.content_snapshot
             return str(content_snapshot) if content_snapshot is not None else None
+        return await self._get_content_by_id(version.id)
+
+    async def _get_content_by_id(self, version_id: str) -> str | None:
+        """
+        Get a version's content, replaying diffs if needed.
+
+        Replay starts from the nearest cached version on the chain, or
+        from the full snapshot if none is cached.
+        """
+        cached = VersionContentCache.get(self.client, version_id)
+        if cached is not None:
+            return cached
 
         # Walk back to find a full snapshot
         query = """
@@ -353,16 +470,23 @@ class TemporalRepository:
         RETURN [n IN nodes(path) | n {.*}] AS chain
         """
 
-        result = await self.client.execute_single(query, {"version_id": version.id})
+        result = await self.client.execute_single(query, {"version_id": version_id})
 
         if not result or not result.get("chain"):
             return None
 
-        # Apply diffs in order (from snapshot forward)
-        chain = list(reversed(result["chain"]))
-        content: str = str(chain[0].get("content_snapshot", ""))
+        # Chain runs from the requested version back to the snapshot
+        chain = result["chain"]
+        start = len(chain) - 1
+        content: str = str(chain[start].get("content_snapshot") or "")
+        for index, node in enumerate(chain[:-1]):
+            cached = VersionContentCache.get(self.client, node.get("id") or "")
+            if cached is not None:
+                start, content = index, cached
+                break
 
-        for node in chain[1:]:
+        # Apply diffs in order (from snapshot forward)
+        for node in reversed(chain[:start]):
             diff_json = node.get("diff_from_previous")
             if diff_json:
                 try:
@@ -371,33 +495,44 @@ class TemporalRepository:
                 except (ValueError, TypeError, KeyError) as e:
                     self.logger.error("Failed to apply diff", error=str(e))
 
+        expected_hash = chain[0].get("content_hash")
+        if expected_hash and hashlib.sha256(content.encode()).hexdigest() != expected_hash:
+            self.logger.error("Reconstructed content hash mismatch", version_id=version_id)
+            return content
+
+        VersionContentCache.put(self.client, version_id, content)
         return content
 
     def _compute_diff(self, old_content: str, new_content: str) -> VersionDiff:
-        """Compute a simple line-based diff."""
+        """Compute a positional line-based diff."""
         old_lines = old_content.split("\n")
-        new_lines = new_content.split("\n")
+        hunks = compute_hunks(old_lines, new_content.split("\n"))
 
-        # Simple diff: find added and removed lines
-        old_set = set(old_lines)
-        new_set = set(new_lines)
-
-        added = [line for line in new_lines if line not in old_set]
-        removed = [line for line in old_lines if line not in new_set]
+        added = [line for hunk in hunks for line in hunk.new_lines]
+        removed = [
+            line
+            for hunk in hunks
+            for line in old_lines[hunk.old_start : hunk.old_start + hunk.old_count]
+        ]
 
         return VersionDiff(
-            added_lines=added[:100],  # Limit for storage
-            removed_lines=removed[:100],
+            added_lines=added[:DIFF_PREVIEW_LINES],
+            removed_lines=removed[:DIFF_PREVIEW_LINES],
             summary=f"+{len(added)} -{len(removed)} lines",
+            hunks=hunks,
         )
 
     def _apply_diff(self, content: str, diff: VersionDiff) -> str:
         """
         Apply a diff to content.
 
-        FIX: Reimplemented using proper line-based diff matching.
-        Previous implementation was broken (removed wrong lines, lost ordering).
+        Positional hunks are replayed exactly. Diffs stored before hunks
+        existed only carry added/removed lines; for those, removed lines
+        are dropped and added lines appended.
         """
+        if diff.hunks:
+            return "\n".join(apply_hunks(content.split("\n"), diff.hunks))
+
         if not diff.removed_lines and not diff.added_lines:
             return content
 
@@ -416,7 +551,7 @@ class TemporalRepository:
             else:
                 new_lines.append(line)
 
-        # Add new lines at the end (simplified - proper impl would track positions)
+        # Legacy diffs carry no positions
         new_lines.extend(diff.added_lines)
 
         return "\n".join(new_lines)
@@ -919,7 +1054,8 @@ class TemporalRepository:
             v.content_snapshot = $content,
             v.content_hash = $content_hash,
             v.diff_from_previous = null,
-            v.diff_chain_length = 0
+            v.diff_chain_length = 0,
+            v.diff_chain_bytes = 0
         """
 
         await self.client.execute(
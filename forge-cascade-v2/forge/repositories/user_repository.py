@@ -906,9 +906,9 @@ class UserRepository(BaseRepository[User, UserCreate, UserUpdate]):
         import secrets
 
         random_password = secrets.token_urlsafe(32)
-        from forge.security.password import hash_password
+        from forge.security.password_hasher import get_password_hasher
 
-        password_hash = hash_password(random_password)
+        password_hash = await get_password_hasher().hash(random_password)
 
         params = {
             "id": user_id,
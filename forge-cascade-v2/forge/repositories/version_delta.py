@@ -0,0 +1,147 @@
+"""
+Version Delta Engine
+
+Line-based positional deltas for capsule versions. compute_hunks() runs
+Myers' O(ND) diff after trimming the common prefix and suffix, so a
+small edit to a large capsule costs time proportional to the edit, not
+the content. apply_hunks() replays the hunks exactly, preserving line
+order and duplicates.
+"""
+
+from __future__ import annotations
+
+from forge.models.temporal import DiffHunk
+
+# Beyond this many line edits the delta is replaced by a single hunk; a
+# diff that large exceeds max_diff_size_bytes and is stored as a snapshot
+MAX_EDIT_DISTANCE = 1000
+
+
+def compute_hunks(
+    old_lines: list[str],
+    new_lines: list[str],
+    max_edits: int = MAX_EDIT_DISTANCE,
+) -> list[DiffHunk]:
+    """
+    Compute positional hunks turning old_lines into new_lines.
+
+    Args:
+        old_lines: Lines of the base version
+        new_lines: Lines of the new version
+        max_edits: Edit distance at which to stop searching for a minimal diff
+
+    Returns:
+        Hunks ordered by old_start, non-overlapping
+    """
+    prefix = 0
+    limit = min(len(old_lines), len(new_lines))
+    while prefix < limit and old_lines[prefix] == new_lines[prefix]:
+        prefix += 1
+    suffix = 0
+    while (
+        suffix < limit - prefix
+        and old_lines[len(old_lines) - 1 - suffix] == new_lines[len(new_lines) - 1 - suffix]
+    ):
+        suffix += 1
+
+    a = old_lines[prefix : len(old_lines) - suffix]
+    b = new_lines[prefix : len(new_lines) - suffix]
+    if not a and not b:
+        return []
+    if not a or not b:
+        return [DiffHunk(old_start=prefix, old_count=len(a), new_lines=b)]
+
+    # Compare small ints instead of strings in the inner loop
+    ids: dict[str, int] = {}
+    a_ids = [ids.setdefault(line, len(ids)) for line in a]
+    b_ids = [ids.setdefault(line, len(ids)) for line in b]
+
+    matches = _myers_matches(a_ids, b_ids, max_edits)
+    if matches is None:
+        return [DiffHunk(old_start=prefix, old_count=len(a), new_lines=b)]
+
+    hunks: list[DiffHunk] = []
+    x = y = 0
+    for i, j in [*matches, (len(a), len(b))]:
+        if i > x or j > y:
+            hunks.append(DiffHunk(old_start=prefix + x, old_count=i - x, new_lines=b[y:j]))
+        x, y = i + 1, j + 1
+    return hunks
+
+
+def apply_hunks(lines: list[str], hunks: list[DiffHunk]) -> list[str]:
+    """
+    Apply positional hunks to the lines they were computed against.
+
+    Raises:
+        ValueError: If the hunks overlap or fall outside the content
+    """
+    result: list[str] = []
+    position = 0
+    for hunk in hunks:
+        end = hunk.old_start + hunk.old_count
+        if hunk.old_start < position or end > len(lines):
+            raise ValueError(
+                f"Hunk at line {hunk.old_start} does not fit content of {len(lines)} lines"
+            )
+        result.extend(lines[position : hunk.old_start])
+        result.extend(hunk.new_lines)
+        position = end
+    result.extend(lines[position:])
+    return result
+
+
+def _myers_matches(a: list[int], b: list[int], max_edits: int) -> list[tuple[int, int]] | None:
+    """
+    Matched (a index, b index) pairs of a shortest edit script.
+
+    Returns None if more than max_edits edits are needed.
+    """
+    n, m = len(a), len(b)
+    max_d = min(n + m, max_edits)
+    offset = max_d + 1
+    v = [0] * (2 * max_d + 3)
+    # trace[d] holds v[k] for k in [-d, d] after step d
+    trace: list[list[int]] = []
+
+    for d in range(max_d + 1):
+        for k in range(-d, d + 1, 2):
+            if k == -d or (k != d and v[offset + k - 1] < v[offset + k + 1]):
+                x = v[offset + k + 1]
+            else:
+                x = v[offset + k - 1] + 1
+            y = x - k
+            while x < n and y < m and a[x] == b[y]:
+                x += 1
+                y += 1
+            v[offset + k] = x
+            if x >= n and y >= m:
+                trace.append(v[offset - d : offset + d + 1])
+                return _backtrack(trace, n, m)
+        trace.append(v[offset - d : offset + d + 1])
+    return None
+
+
+def _backtrack(trace: list[list[int]], n: int, m: int) -> list[tuple[int, int]]:
+    matches: list[tuple[int, int]] = []
+    x, y = n, m
+    for d in range(len(trace) - 1, 0, -1):
+        previous = trace[d - 1]
+        k = x - y
+        if k == -d or (k != d and previous[k - 1 + d - 1] < previous[k + 1 + d - 1]):
+            prev_k = k + 1
+        else:
+            prev_k = k - 1
+        prev_x = previous[prev_k + d - 1]
+        prev_y = prev_x - prev_k
+        while x > prev_x and y > prev_y:
+            x -= 1
+            y -= 1
+            matches.append((x, y))
+        x, y = prev_x, prev_y
+    while x > 0 and y > 0:
+        x -= 1
+        y -= 1
+        matches.append((x, y))
+    matches.reverse()
+    return matches
@@ -111,6 +111,11 @@ from .password import (
     validate_password_strength,
     verify_password,
 )
+from .password_hasher import (
+    PasswordHasher,
+    PasswordHasherBusyError,
+    get_password_hasher,
+)
 from .prompt_sanitization import (
     INJECTION_PATTERNS,
     create_safe_user_message,
@@ -187,6 +192,9 @@ __all__ = [
     "needs_rehash",
     "get_password_strength",
     "validate_password_strength",
+    "PasswordHasher",
+    "PasswordHasherBusyError",
+    "get_password_hasher",
     # Prompt Sanitization
     "sanitize_for_prompt",
     "sanitize_dict_for_prompt",
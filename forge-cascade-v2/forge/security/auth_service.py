@@ -46,13 +46,8 @@ from ..models.user import Token, User, UserCreate
 from ..repositories.audit_repository import AuditRepository
 from ..repositories.user_repository import UserRepository
 from .authorization import AuthorizationContext, create_auth_context, get_trust_level_from_score
-from .password import (
-    check_password_history,
-    hash_password,
-    needs_rehash,
-    update_password_history,
-    verify_password,
-)
+from .password import needs_rehash, update_password_history
+from .password_hasher import get_password_hasher
 from .tokens import (
     TokenBlacklist,
     TokenInvalidError,
@@ -436,7 +431,7 @@ class AuthService:
 
         # Hash password (with context-aware validation)
         # SECURITY FIX (Audit 3): Pass username/email for context-aware password validation
-        password_hash = hash_password(password, username=username, email=email)
+        password_hash = await get_password_hasher().hash(password, username=username, email=email)
 
         # Create user
         user_create = UserCreate(
@@ -586,7 +581,7 @@ class AuthService:
             raise AccountDeactivatedError("Account has been deactivated")
 
         # Verify password
-        if not verify_password(password, user.password_hash):
+        if not await get_password_hasher().verify(password, user.password_hash):
             # SECURITY FIX (Audit 4 - M2): Record failed attempt for IP rate limiting
             # SECURITY FIX (Audit 5): Now uses Redis for distributed rate limiting
             if ip_address:
@@ -622,11 +617,9 @@ class AuthService:
             )
             raise InvalidCredentialsError("Invalid username or password")
 
-        # Check if password needs rehashing (security upgrade)
+        # Check if password needs rehashing (security upgrade), off the request path
         if needs_rehash(user.password_hash):
-            # Skip validation - password was already validated when originally created
-            new_hash = hash_password(password, validate=False)
-            await self.user_repo.update_password(user.id, new_hash)
+            get_password_hasher().schedule_rehash(user.id, password, self.user_repo.update_password)
 
         # Clear any lockout and record successful login
         await self.user_repo.clear_lockout(user.id)
@@ -1041,7 +1034,7 @@ class AuthService:
             raise AuthenticationError("User not found")
 
         user_pw_hash: str = getattr(user, "password_hash", "")
-        if not verify_password(current_password, user_pw_hash):
+        if not await get_password_hasher().verify(current_password, user_pw_hash):
             await self.audit_repo.log_security_event(
                 actor_id=user_id,
                 event_name="password_change_failed",
@@ -1055,11 +1048,13 @@ class AuthService:
         password_history = getattr(user, "password_history", []) or []
         # Also check against current password hash
         all_history = [user_pw_hash] + password_history
-        check_password_history(new_password, all_history)
+        await get_password_hasher().check_history(new_password, all_history)
 
         # Hash and update new password (with context-aware validation)
         # SECURITY FIX (Audit 3): Pass username/email for context-aware password validation
-        new_hash = hash_password(new_password, username=user.username, email=user.email)
+        new_hash = await get_password_hasher().hash(
+            new_password, username=user.username, email=user.email
+        )
 
         # SECURITY FIX (Audit 6): Update password history before changing password
         new_history = update_password_history(user_pw_hash, password_history)
@@ -1173,11 +1168,13 @@ class AuthService:
         password_history = getattr(user, "password_history", []) or []
         reset_pw_hash: str = getattr(user, "password_hash", "")
         all_history = [reset_pw_hash] + password_history
-        check_password_history(new_password, all_history)
+        await get_password_hasher().check_history(new_password, all_history)
 
         # Hash and update password (with context-aware validation)
         # SECURITY FIX (Audit 3): Pass username/email for context-aware password validation
-        new_hash = hash_password(new_password, username=user.username, email=user.email)
+        new_hash = await get_password_hasher().hash(
+            new_password, username=user.username, email=user.email
+        )
 
         # SECURITY FIX (Audit 6): Update password history
         new_history = update_password_history(reset_pw_hash, password_history)
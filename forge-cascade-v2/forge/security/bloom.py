@@ -0,0 +1,60 @@
+"""
+Bloom Filter for Forge Cascade V2
+
+A compact set-membership filter with no false negatives. Used to answer
+"is this token revoked?" locally: a miss is definitive, a hit still has to
+be confirmed against the authoritative store.
+"""
+
+import hashlib
+import math
+
+
+class BloomFilter:
+    """
+    Fixed-size Bloom filter over strings.
+
+    Bit positions come from double hashing one BLAKE2b digest
+    (Kirsch-Mitzenmacher), so membership tests cost a single hash.
+    """
+
+    def __init__(self, capacity: int, error_rate: float = 0.001):
+        """
+        Size the filter.
+
+        Args:
+            capacity: Expected number of items
+            error_rate: False positive rate at capacity
+        """
+        if capacity < 1:
+            raise ValueError("capacity must be positive")
+        if not 0 < error_rate < 1:
+            raise ValueError("error_rate must be between 0 and 1")
+
+        self.capacity = capacity
+        self.num_bits = max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self._bits = bytearray((self.num_bits + 7) // 8)
+        self._count = 0
+
+    def __len__(self) -> int:
+        """Items added (duplicates included)."""
+        return self._count
+
+    def __contains__(self, item: str) -> bool:
+        bits = self._bits
+        return all(bits[p >> 3] & (1 << (p & 7)) for p in self._positions(item))
+
+    def add(self, item: str) -> None:
+        """Add an item."""
+        bits = self._bits
+        for p in self._positions(item):
+            bits[p >> 3] |= 1 << (p & 7)
+        self._count += 1
+
+    def _positions(self, item: str) -> list[int]:
+        digest = hashlib.blake2b(item.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        m = self.num_bits
+        return [(h1 + i * h2) % m for i in range(self.num_hashes)]
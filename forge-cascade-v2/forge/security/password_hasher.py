@@ -0,0 +1,195 @@
+"""
+Password Hashing Pool for Forge Cascade V2
+
+bcrypt is deliberately slow: every hash or check costs the full work
+factor in CPU time. Called directly from an async handler, each login
+stalls the event loop for that long. PasswordHasher moves the work onto
+a bounded thread pool (bcrypt releases the GIL while hashing, so the
+threads run in parallel):
+- Load shedding: once password_hash_max_pending operations are queued
+  or running, new ones fail fast with PasswordHasherBusyError
+- Metrics: latency histogram (queue wait included), pending gauge and
+  shed counter
+- Rehash-on-login runs as a background task after the login returns
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, TypeVar
+
+import structlog
+
+from ..config import get_settings
+from ..monitoring.metrics import (
+    password_hash_duration_seconds,
+    password_hash_pending,
+    password_hash_shed_total,
+)
+from .password import check_password_history, hash_password, verify_password
+
+logger = structlog.get_logger(__name__)
+
+T = TypeVar("T")
+
+
+class PasswordHasherBusyError(Exception):
+    """Too many password operations are queued; retry later."""
+
+    pass
+
+
+class PasswordHasher:
+    """
+    Bounded thread pool for bcrypt hashing and verification.
+
+    Shed operations raise before any work is done, so callers can answer
+    with 503 + Retry-After instead of adding to a queue that is already
+    longer than clients will wait.
+    """
+
+    def __init__(self, max_workers: int = 4, max_pending: int = 64):
+        """
+        Initialize the pool.
+
+        Args:
+            max_workers: Threads running bcrypt
+            max_pending: Queued plus running operations before shedding
+        """
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="password-hash"
+        )
+        self._max_pending = max_pending
+        self._pending = 0
+        self._rehash_tasks: set[asyncio.Task[None]] = set()
+
+    @property
+    def pending(self) -> int:
+        """Operations queued or running."""
+        return self._pending
+
+    async def _run(self, operation: str, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        if self._pending >= self._max_pending:
+            password_hash_shed_total.inc(operation=operation)
+            logger.warning("password_hash_shed", operation=operation, pending=self._pending)
+            raise PasswordHasherBusyError("Password hashing is saturated, retry shortly")
+
+        self._pending += 1
+        password_hash_pending.set(self._pending)
+        start = time.perf_counter()
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, partial(func, *args, **kwargs))
+        finally:
+            self._pending -= 1
+            password_hash_pending.set(self._pending)
+            password_hash_duration_seconds.observe(time.perf_counter() - start, operation=operation)
+
+    async def hash(
+        self,
+        password: str,
+        validate: bool = True,
+        username: str | None = None,
+        email: str | None = None,
+    ) -> str:
+        """
+        Hash a password off the event loop (see password.hash_password).
+
+        Raises:
+            PasswordValidationError: If password doesn't meet requirements
+            PasswordHasherBusyError: If the pool is saturated
+        """
+        return await self._run(
+            "hash", hash_password, password, validate=validate, username=username, email=email
+        )
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        """
+        Verify a password off the event loop (see password.verify_password).
+
+        Raises:
+            PasswordHasherBusyError: If the pool is saturated
+        """
+        return await self._run("verify", verify_password, plain_password, hashed_password)
+
+    async def check_history(self, new_password: str, password_history: list[str]) -> bool:
+        """
+        Check password reuse off the event loop (see password.check_password_history).
+
+        Raises:
+            PasswordValidationError: If password was recently used
+            PasswordHasherBusyError: If the pool is saturated
+        """
+        return await self._run("history", check_password_history, new_password, password_history)
+
+    def schedule_rehash(
+        self,
+        user_id: str,
+        password: str,
+        save: Callable[[str, str], Awaitable[Any]],
+    ) -> None:
+        """
+        Rehash a password with current settings in the background.
+
+        Args:
+            user_id: User whose hash is upgraded
+            password: Verified plain text password
+            save: Coroutine function storing (user_id, new_hash)
+        """
+        task = asyncio.create_task(self._rehash(user_id, password, save))
+        self._rehash_tasks.add(task)
+        task.add_done_callback(self._rehash_tasks.discard)
+
+    async def _rehash(
+        self,
+        user_id: str,
+        password: str,
+        save: Callable[[str, str], Awaitable[Any]],
+    ) -> None:
+        try:
+            # Skip validation - password was already validated when originally created
+            new_hash = await self.hash(password, validate=False)
+            await save(user_id, new_hash)
+            logger.info("password_rehashed", user_id=user_id)
+        except PasswordHasherBusyError:
+            # The old hash still verifies; the next login retries
+            logger.info("password_rehash_deferred", user_id=user_id)
+        except Exception as e:  # Intentional broad catch: a failed upgrade must not fail the login
+            logger.warning("password_rehash_failed", user_id=user_id, error=str(e))
+
+    async def shutdown(self) -> None:
+        """Wait for scheduled rehashes and stop the pool."""
+        if self._rehash_tasks:
+            await asyncio.gather(*self._rehash_tasks, return_exceptions=True)
+        self._executor.shutdown(wait=True)
+
+
+# =============================================================================
+# Pool Singleton
+# =============================================================================
+
+_password_hasher: PasswordHasher | None = None
+
+
+def get_password_hasher() -> PasswordHasher:
+    """Get the process-wide password hashing pool."""
+    global _password_hasher
+    if _password_hasher is None:
+        settings = get_settings()
+        _password_hasher = PasswordHasher(
+            max_workers=settings.password_hash_workers,
+            max_pending=settings.password_hash_max_pending,
+        )
+    return _password_hasher
+
+
+async def shutdown_password_hasher() -> None:
+    """Stop the process-wide password hashing pool."""
+    global _password_hasher
+    if _password_hasher is not None:
+        await _password_hasher.shutdown()
+        _password_hasher = None
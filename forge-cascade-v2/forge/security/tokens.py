@@ -8,6 +8,8 @@ Includes:
 - Token creation (access and refresh)
 - Token validation
 - Token blacklisting for revocation (Redis-backed for distributed deployments)
+- A short-lived cache of verified access tokens and a local revocation
+  filter, so most requests are authenticated without leaving the process
 
 SECURITY FIXES (Audit 2):
 - Replaced python-jose with PyJWT>=2.8.0 (CVE-2022-29217 fix)
@@ -20,6 +22,7 @@ import hashlib
 import threading
 import time
 import types
+from collections import OrderedDict
 from datetime import UTC, datetime, timedelta
 from typing import Any
 from uuid import uuid4
@@ -32,6 +35,7 @@ from pydantic import ValidationError
 
 from ..config import get_settings
 from ..models.user import Token, TokenPayload
+from .bloom import BloomFilter
 
 settings = get_settings()
 logger = structlog.get_logger(__name__)
@@ -66,6 +70,14 @@ class TokenBlacklist:
     LRU eviction allowed attackers to flood the blacklist and evict legitimately
     revoked tokens, enabling token replay attacks. Now only expired tokens are
     removed, and all blacklisted tokens must have an expiry time.
+
+    With Redis, each instance also keeps a Bloom filter of revoked JTIs,
+    built from a key scan and kept current by revocation events published
+    on a pub/sub channel. A filter miss is definitive, so only filter hits
+    (revoked tokens and rare false positives) reach Redis. While the
+    subscription is down the filter is ignored and every check goes to
+    Redis. A revocation reaches other instances after pub/sub delivery
+    (typically milliseconds).
     """
 
     # In-memory fallback storage
@@ -85,6 +97,15 @@ class TokenBlacklist:
     _redis_initialized: bool = False
     _redis_prefix: str = "forge:token:blacklist:"
 
+    # Local revocation filter (Redis mode only)
+    _events_channel: str = "forge:token:revocations"
+    _FILTER_REBUILD_SECONDS: float = 600  # Drops expired revocations from the filter
+    _filter: BloomFilter | None = None
+    _next_filter: BloomFilter | None = None  # Being rebuilt; receives local revocations too
+    _filter_synced: bool = False
+    _filter_built_at: float = 0
+    _sync_task: asyncio.Task[None] | None = None
+
     @classmethod
     def _get_async_lock(cls) -> asyncio.Lock:
         """Get or create the async lock (must be called from async context)."""
@@ -131,6 +152,8 @@ class TokenBlacklist:
             await cls._redis_client.ping()
             cls._redis_initialized = True
             logger.info("token_blacklist_redis_connected", redis_url=url[:20] + "...")
+            if settings.token_blacklist_local_filter:
+                cls._sync_task = asyncio.create_task(cls._sync_filter_loop())
             return True
         except (ConnectionError, TimeoutError, OSError) as e:
             logger.warning("token_blacklist_redis_failed", error=str(e))
@@ -168,6 +191,8 @@ class TokenBlacklist:
                     await cls._redis_client.setex(key, 86400, "1")
                 # SECURITY FIX (Audit 4 - L2): Log more JTI chars for debugging
                 logger.debug("token_blacklisted_redis", jti=jti[:16] + "...")
+                cls._note_revoked(jti)
+                await cls._publish("jti", jti)
                 return
             except (ConnectionError, TimeoutError, OSError) as e:
                 logger.warning("token_blacklist_redis_error", error=str(e), operation="add")
@@ -209,6 +234,10 @@ class TokenBlacklist:
 
         # Try Redis first
         if cls._redis_client:
+            # A filter miss is definitive; hits may be false positives
+            revoked_filter = cls._filter
+            if cls._filter_synced and revoked_filter is not None and jti not in revoked_filter:
+                return False
             try:
                 key = f"{cls._redis_prefix}{jti}"
                 result = await cls._redis_client.exists(key)
@@ -340,15 +369,129 @@ class TokenBlacklist:
                         break
             except (ConnectionError, TimeoutError, OSError) as e:
                 logger.warning("token_blacklist_redis_error", error=str(e), operation="clear")
+            if cls._filter is not None:
+                cls._filter = BloomFilter(settings.token_blacklist_filter_capacity)
 
         # Clear in-memory (SECURITY FIX: use async lock)
         async with cls._get_async_lock():
             cls._blacklist.clear()
             cls._expiry_times.clear()
 
+    @classmethod
+    def is_filter_synced(cls) -> bool:
+        """Whether revocation events are being received from Redis."""
+        return cls._filter_synced
+
+    @classmethod
+    def _note_revoked(cls, jti: str) -> None:
+        """Add a revoked JTI to the local filter(s)."""
+        if cls._filter is not None:
+            cls._filter.add(jti)
+        if cls._next_filter is not None:
+            cls._next_filter.add(jti)
+
+    @classmethod
+    async def _publish(cls, kind: str, value: str) -> None:
+        """Announce a revocation or invalidation to other instances."""
+        if not cls._redis_client or not settings.token_blacklist_local_filter:
+            return
+        try:
+            await cls._redis_client.publish(cls._events_channel, f"{kind}:{value}")
+        except (ConnectionError, TimeoutError, OSError) as e:
+            logger.warning("token_blacklist_redis_error", error=str(e), operation="publish")
+
+    @classmethod
+    def _apply_event(cls, data: str) -> None:
+        """Apply a revocation event received from the channel."""
+        kind, _, value = data.partition(":")
+        if kind == "jti":
+            cls._note_revoked(value)
+        elif kind == "tv":
+            TokenVersionCache._cache.pop(value, None)
+
+    @classmethod
+    def _mark_unsynced(cls) -> None:
+        """Stop trusting local state that relies on revocation events."""
+        cls._filter_synced = False
+        cls._next_filter = None
+        # Invalidations may be missed until the next resync
+        TokenVersionCache._cache.clear()
+
+    @classmethod
+    async def _rebuild_filter(cls) -> None:
+        """Build a fresh filter from the revocation keys in Redis and swap it in."""
+        if not cls._redis_client:
+            return
+        fresh = BloomFilter(settings.token_blacklist_filter_capacity)
+        cls._next_filter = fresh
+        prefix_len = len(cls._redis_prefix)
+        cursor = 0
+        while True:
+            cursor, keys = await cls._redis_client.scan(
+                cursor, match=f"{cls._redis_prefix}*", count=1000
+            )
+            for key in keys:
+                fresh.add(key[prefix_len:])
+            if cursor == 0:
+                break
+
+        if not cls._filter_synced:
+            TokenVersionCache._cache.clear()
+        cls._filter = fresh
+        cls._next_filter = None
+        cls._filter_built_at = time.monotonic()
+        cls._filter_synced = True
+        logger.debug("token_blacklist_filter_rebuilt", revoked=len(fresh))
+
+    @classmethod
+    async def _sync_filter_loop(cls) -> None:
+        """
+        Keep the local filter in step with Redis.
+
+        Subscribes before scanning, so revocations published during the scan
+        are buffered and applied afterwards. Any failure drops back to Redis
+        lookups until a resync succeeds.
+        """
+        backoff = 1.0
+        while cls._redis_client:
+            pubsub = cls._redis_client.pubsub()
+            try:
+                await pubsub.subscribe(cls._events_channel)
+                await cls._rebuild_filter()
+                logger.info("token_blacklist_filter_synced")
+                backoff = 1.0
+                while True:
+                    message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=1.0)
+                    if message is not None:
+                        cls._apply_event(message["data"])
+                    revoked_filter = cls._filter
+                    if (
+                        revoked_filter is not None and len(revoked_filter) > revoked_filter.capacity
+                    ) or time.monotonic() - cls._filter_built_at > cls._FILTER_REBUILD_SECONDS:
+                        await cls._rebuild_filter()
+            except Exception as e:  # Intentional broad catch: fall back to Redis lookups
+                cls._mark_unsynced()
+                logger.warning("token_blacklist_filter_sync_failed", error=str(e), retry_in=backoff)
+            finally:
+                try:
+                    await pubsub.aclose()
+                except Exception:  # Intentional broad catch: connection may already be gone
+                    pass
+            await asyncio.sleep(backoff)
+            backoff = min(backoff * 2, 30.0)
+
     @classmethod
     async def close(cls) -> None:
         """Close Redis connection."""
+        if cls._sync_task:
+            cls._sync_task.cancel()
+            try:
+                await cls._sync_task
+            except asyncio.CancelledError:
+                pass
+            cls._sync_task = None
+        cls._mark_unsynced()
+        cls._filter = None
         if cls._redis_client:
             try:
                 await cls._redis_client.close()
@@ -409,7 +552,9 @@ class TokenVersionCache:
     is incremented. This cache allows fast validation of token versions
     without hitting the database on every request.
 
-    Uses Redis when available, falls back to in-memory cache.
+    Uses Redis when available, falls back to in-memory cache. While the
+    blacklist's revocation events are synced, invalidations also reach the
+    in-memory cache, so it is consulted before Redis.
     """
 
     _cache: dict[str, tuple[int, float]] = {}  # user_id -> (version, expiry_timestamp)
@@ -441,6 +586,12 @@ class TokenVersionCache:
             Token version (defaults to 1 if not found)
         """
         now = time.time()
+        synced = TokenBlacklist.is_filter_synced()
+
+        if synced:
+            local_version = await cls._get_local(user_id, now)
+            if local_version is not None:
+                return local_version
 
         # Try Redis first if available
         if TokenBlacklist._redis_client:
@@ -448,18 +599,17 @@ class TokenVersionCache:
                 key = f"{cls._redis_prefix}{user_id}"
                 cached = await TokenBlacklist._redis_client.get(key)
                 if cached is not None:
+                    if synced:
+                        async with cls._get_async_lock():
+                            cls._cache[user_id] = (int(cached), now + cls._get_cache_ttl())
                     return int(cached)
             except (ConnectionError, TimeoutError, OSError) as e:
                 logger.warning("token_version_cache_redis_error", error=str(e))
 
         # Try in-memory cache
-        async with cls._get_async_lock():
-            if user_id in cls._cache:
-                version, expiry = cls._cache[user_id]
-                if now < expiry:
-                    return version
-                # Expired, remove from cache
-                cls._cache.pop(user_id, None)
+        local_version = await cls._get_local(user_id, now)
+        if local_version is not None:
+            return local_version
 
         # Cache miss - fetch from database
         if db_fallback:
@@ -473,6 +623,18 @@ class TokenVersionCache:
         # Default to version 1 (will be valid for legacy users)
         return 1
 
+    @classmethod
+    async def _get_local(cls, user_id: str, now: float) -> int | None:
+        """Get an unexpired version from the in-memory cache."""
+        async with cls._get_async_lock():
+            if user_id in cls._cache:
+                version, expiry = cls._cache[user_id]
+                if now < expiry:
+                    return version
+                # Expired, remove from cache
+                cls._cache.pop(user_id, None)
+        return None
+
     @classmethod
     async def set_version(cls, user_id: str, version: int) -> None:
         """
@@ -491,7 +653,8 @@ class TokenVersionCache:
             try:
                 key = f"{cls._redis_prefix}{user_id}"
                 await TokenBlacklist._redis_client.setex(key, ttl_seconds, str(version))
-                return
+                if not TokenBlacklist.is_filter_synced():
+                    return
             except (ConnectionError, TimeoutError, OSError) as e:
                 logger.warning("token_version_cache_redis_error", error=str(e))
 
@@ -517,9 +680,10 @@ class TokenVersionCache:
             except (ConnectionError, TimeoutError, OSError) as e:
                 logger.warning("token_version_cache_redis_error", error=str(e))
 
-        # Invalidate in-memory cache
+        # Invalidate in-memory cache, here and on other instances
         async with cls._get_async_lock():
             cls._cache.pop(user_id, None)
+        await TokenBlacklist._publish("tv", user_id)
 
         logger.debug("token_version_cache_invalidated", user_id=user_id)
 
@@ -546,6 +710,66 @@ class TokenVersionCache:
             cls._cache.clear()
 
 
+# =============================================================================
+# Verified Access Token Cache
+# =============================================================================
+
+
+class VerifiedTokenCache:
+    """
+    Short-lived LRU cache of access tokens that passed signature and claim checks.
+
+    A hit skips decode_token() entirely. Keyed by the token's SHA-256 so raw
+    tokens are not held in memory. Entries never outlive the token's exp and
+    are dropped when signing keys rotate; revocation and token version are
+    still checked on every request.
+    """
+
+    _entries: OrderedDict[bytes, tuple[TokenPayload, float]] = OrderedDict()
+
+    @staticmethod
+    def _key(token: str) -> bytes:
+        return hashlib.sha256(token.encode("utf-8")).digest()
+
+    @classmethod
+    def get(cls, token: str) -> TokenPayload | None:
+        """Get the payload of a recently verified token."""
+        if settings.verified_token_cache_ttl_seconds <= 0:
+            return None
+        key = cls._key(token)
+        entry = cls._entries.get(key)
+        if entry is None:
+            return None
+        payload, expires_at = entry
+        if time.time() >= expires_at:
+            cls._entries.pop(key, None)
+            return None
+        cls._entries.move_to_end(key)
+        return payload
+
+    @classmethod
+    def put(cls, token: str, payload: TokenPayload) -> None:
+        """Cache a verified token until the TTL or its exp, whichever is first."""
+        ttl = settings.verified_token_cache_ttl_seconds
+        if ttl <= 0:
+            return
+        now = time.time()
+        expires_at = now + ttl
+        if payload.exp is not None:
+            expires_at = min(expires_at, payload.exp.timestamp())
+        if expires_at <= now:
+            return
+
+        cls._entries[cls._key(token)] = (payload, expires_at)
+        while len(cls._entries) > settings.verified_token_cache_max_entries:
+            cls._entries.popitem(last=False)
+
+    @classmethod
+    def clear(cls) -> None:
+        """Drop all cached tokens."""
+        cls._entries.clear()
+
+
 def validate_token_size(token: str) -> None:
     """
     SECURITY FIX (Audit 6): Validate token size to prevent DoS attacks.
@@ -727,6 +951,8 @@ class KeyRotationManager:
                     del cls._keys[oldest_key]
                     del cls._key_created_at[oldest_key]
                     logger.info("old_key_removed", key_id=oldest_key)
+                    # Tokens signed with the removed key must stop verifying
+                    VerifiedTokenCache.clear()
 
             logger.info(
                 "key_rotated",
@@ -748,7 +974,10 @@ class KeyRotationManager:
         leeway: int = 0,
     ) -> dict[str, Any]:
         """
-        Decode a token, trying all valid keys.
+        Decode a token with the key named by its kid header.
+
+        Tokens without a kid (issued before key IDs were added) are tried
+        against all valid keys.
 
         SECURITY FIX (Audit 6): Added issuer and audience validation.
 
@@ -779,21 +1008,16 @@ class KeyRotationManager:
         if audience:
             decode_kwargs["audience"] = audience
 
-        # Try to get key ID from header
-        try:
-            unverified_header = pyjwt.get_unverified_header(token)
-            kid = unverified_header.get("kid")
-            if kid and kid in cls._keys:
-                # Try the specific key first
-                try:
-                    result: dict[str, Any] = pyjwt.decode(token, cls._keys[kid], **decode_kwargs)
-                    return result
-                except (InvalidTokenError, DecodeError):
-                    pass  # Fall through to try all keys
-        except (InvalidTokenError, DecodeError, ValueError, KeyError):
-            pass  # No valid header, try all keys
+        # Dispatch on the key ID instead of trial-decoding with every key
+        kid = pyjwt.get_unverified_header(token).get("kid")
+        if kid is not None:
+            key = cls._keys.get(kid) if isinstance(kid, str) else None
+            if key is None:
+                raise InvalidTokenError("Token verification failed: unknown signing key")
+            result: dict[str, Any] = pyjwt.decode(token, key, **decode_kwargs)
+            return result
 
-        # Try all keys
+        # Legacy token without a key ID: try all keys
         last_error = None
         for key in cls.get_all_keys():
             try:
@@ -1124,6 +1348,44 @@ def decode_token(token: str, verify_exp: bool = True) -> TokenPayload:
         raise TokenInvalidError(f"Token payload validation failed: {str(e)}")
 
 
+def _decode_access_token(token: str) -> TokenPayload:
+    """
+    Decode an access token and check its required claims.
+
+    Verified tokens are cached briefly (see VerifiedTokenCache); callers
+    must still check revocation.
+
+    Raises:
+        TokenError: If token is invalid or not an access token
+    """
+    cached = VerifiedTokenCache.get(token)
+    if cached is not None:
+        return cached
+
+    payload = decode_token(token)
+
+    if payload.type != "access":
+        raise TokenInvalidError("Not an access token")
+
+    # SECURITY FIX: Require all essential claims to be present
+    # This prevents attacks where claims are removed from token
+    if not payload.sub:
+        raise TokenInvalidError("Token missing required sub claim")
+
+    if payload.trust_flame is None:
+        raise TokenInvalidError("Token missing required trust_flame claim")
+
+    if payload.role is None:
+        raise TokenInvalidError("Token missing required role claim")
+
+    # Validate trust_flame is within valid range
+    if not (0 <= payload.trust_flame <= 100):
+        raise TokenInvalidError("Invalid trust_flame value in token")
+
+    VerifiedTokenCache.put(token, payload)
+    return payload
+
+
 def verify_access_token(token: str) -> TokenPayload:
     """
     Verify an access token (sync version).
@@ -1140,10 +1402,7 @@ def verify_access_token(token: str) -> TokenPayload:
     Raises:
         TokenError: If token is invalid or not an access token
     """
-    payload = decode_token(token)
-
-    if payload.type != "access":
-        raise TokenInvalidError("Not an access token")
+    payload = _decode_access_token(token)
 
     # SECURITY FIX: Check token blacklist (sync - in-memory only)
     # For Redis support, use verify_access_token_async()
@@ -1155,21 +1414,6 @@ def verify_access_token(token: str) -> TokenPayload:
         )
         raise TokenInvalidError("Token has been revoked")
 
-    # SECURITY FIX: Require all essential claims to be present
-    # This prevents attacks where claims are removed from token
-    if not payload.sub:
-        raise TokenInvalidError("Token missing required sub claim")
-
-    if payload.trust_flame is None:
-        raise TokenInvalidError("Token missing required trust_flame claim")
-
-    if payload.role is None:
-        raise TokenInvalidError("Token missing required role claim")
-
-    # Validate trust_flame is within valid range
-    if not (0 <= payload.trust_flame <= 100):
-        raise TokenInvalidError("Invalid trust_flame value in token")
-
     return payload
 
 
@@ -1198,10 +1442,7 @@ async def verify_access_token_async(
         TokenError: If token is invalid, blacklisted, or not an access token
         TokenVersionOutdatedError: If token version is outdated
     """
-    payload = decode_token(token)
-
-    if payload.type != "access":
-        raise TokenInvalidError("Not an access token")
+    payload = _decode_access_token(token)
 
     # SECURITY FIX: Check token blacklist (async - Redis + in-memory)
     if await TokenBlacklist.is_blacklisted_async(payload.jti):
@@ -1212,21 +1453,6 @@ async def verify_access_token_async(
         )
         raise TokenInvalidError("Token has been revoked")
 
-    # SECURITY FIX: Require all essential claims to be present
-    # This prevents attacks where claims are removed from token
-    if not payload.sub:
-        raise TokenInvalidError("Token missing required sub claim")
-
-    if payload.trust_flame is None:
-        raise TokenInvalidError("Token missing required trust_flame claim")
-
-    if payload.role is None:
-        raise TokenInvalidError("Token missing required role claim")
-
-    # Validate trust_flame is within valid range
-    if not (0 <= payload.trust_flame <= 100):
-        raise TokenInvalidError("Invalid trust_flame value in token")
-
     # SECURITY FIX (Audit 6): Validate token version
     # If token version getter is provided, check that token's version
     # matches the current version in database (via cache)
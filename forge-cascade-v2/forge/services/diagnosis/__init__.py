@@ -15,6 +15,7 @@ from .engine import (
     EngineConfig,
     create_diagnosis_engine,
 )
+from .frequency_matrix import PhenotypeFrequencyMatrix
 from .models import (
     DiagnosisHypothesis,
     DiagnosisResult,
@@ -62,6 +63,7 @@ __all__ = [
     "FollowUpQuestion",
     # Scoring
     "BayesianScorer",
+    "PhenotypeFrequencyMatrix",
     "ScoringConfig",
     "create_bayesian_scorer",
     # Engine
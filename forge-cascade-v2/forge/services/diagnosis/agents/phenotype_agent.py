@@ -176,12 +176,14 @@ class PhenotypeAgent(DiagnosticAgent):
             WHERE p.hpo_id IN $phenotypes
             WITH d, collect(DISTINCT p.hpo_id) as matched, count(DISTINCT p) as match_count
             OPTIONAL MATCH (d)-[:HAS_PHENOTYPE|PHENOTYPE_OF]-(all_p:PrimeKGPhenotype)
-            WITH d, matched, match_count, count(DISTINCT all_p) as total_phenotypes
+            WITH d, matched, match_count, collect(DISTINCT all_p.hpo_id) as phenotypes
+            WITH d, matched, match_count, phenotypes, size(phenotypes) as total_phenotypes
             WHERE match_count >= $min_matches
             RETURN d.mondo_id as disease_id,
                    d.name as disease_name,
                    matched,
                    match_count,
+                   phenotypes,
                    total_phenotypes,
                    toFloat(match_count) / toFloat($input_count) as recall,
                    toFloat(match_count) / toFloat(total_phenotypes + 0.001) as precision
@@ -214,6 +216,16 @@ class PhenotypeAgent(DiagnosticAgent):
                     }
                     hypotheses.append(hypothesis)
 
+                # Re-rank on ontology similarity, which credits near misses
+                # (a sibling or parent term) that exact matching ignores
+                similarities = self._semantic_similarities(
+                    hpo_codes, [r.get("phenotypes") or [] for r in results or []]
+                )
+                if similarities is not None:
+                    for hypothesis, similarity in zip(hypotheses, similarities, strict=True):
+                        hypothesis["semantic_similarity"] = similarity
+                    hypotheses.sort(key=lambda h: h["semantic_similarity"], reverse=True)
+
             except (RuntimeError, OSError, ConnectionError, ValueError) as e:
                 logger.error("hypothesis_query_failed", error=str(e))
 
@@ -290,7 +302,7 @@ class PhenotypeAgent(DiagnosticAgent):
                 f"Warning: {len(contradicted)} negated phenotypes are expected for this disease"
             )
 
-        return {
+        evaluation: dict[str, Any] = {
             "score": score,
             "reasoning": ". ".join(reasoning_parts) if reasoning_parts else "No specific matches",
             "matched_phenotypes": matched,
@@ -299,6 +311,10 @@ class PhenotypeAgent(DiagnosticAgent):
             "recall": recall,
             "precision": precision,
         }
+        similarities = self._semantic_similarities(patient_hpo, [expected])
+        if similarities is not None:
+            evaluation["semantic_similarity"] = similarities[0]
+        return evaluation
 
     async def suggest_discriminating_phenotypes(
         self,
@@ -575,6 +591,28 @@ class PhenotypeAgent(DiagnosticAgent):
 
         return notes
 
+    def _semantic_similarities(
+        self,
+        patient_hpo: list[str],
+        disease_phenotypes: list[list[str]],
+    ) -> list[float] | None:
+        """
+        Best-match-average Lin similarity of the patient to each disease.
+
+        Returns:
+            One score (0 to 1) per disease, or None without a loaded HPO service
+        """
+        if not patient_hpo or not getattr(self._hpo, "is_loaded", False):
+            return None
+        try:
+            scores: list[float] = self._hpo.get_set_similarities(
+                patient_hpo, disease_phenotypes, method="lin"
+            )
+            return scores
+        except (ValueError, AttributeError, IndexError) as e:
+            logger.warning("semantic_similarity_failed", error=str(e))
+            return None
+
     async def _get_disease_phenotypes(
         self,
         disease_id: str,
@@ -83,6 +83,7 @@ class DiagnosisEngine:
         hpo_service: Any = None,
         genetic_service: Any = None,
         neo4j_client: Any = None,
+        adjacency: Any = None,
     ) -> None:
         """
         Initialize the diagnosis engine.
@@ -94,12 +95,14 @@ class DiagnosisEngine:
             hpo_service: HPO service for phenotype operations
             genetic_service: Genetic service for variant analysis
             neo4j_client: Neo4j client for direct queries
+            adjacency: PrimeKGAdjacency snapshot (defaults to the overlay's)
         """
         self.config = config or EngineConfig()
         self._primekg = primekg_overlay
         self._hpo = hpo_service
         self._genetic = genetic_service
         self._neo4j = neo4j_client
+        self._adjacency = adjacency or getattr(primekg_overlay, "adjacency", None)
 
         # Initialize scorer
         self._scorer = create_bayesian_scorer(
@@ -349,39 +352,54 @@ class DiagnosisEngine:
         if not phenotype_codes:
             return candidates
 
-        if not self._neo4j:
+        graph = self._fresh_adjacency()
+        if not self._neo4j and graph is None:
             return candidates
 
-        # Query diseases with matching phenotypes
+        # Query diseases with matching phenotypes, with each candidate's
+        # expected phenotypes (most frequent first) in the same round trip
         query = """
         MATCH (d:PrimeKGDisease)-[:HAS_PHENOTYPE|PHENOTYPE_OF]-(p:PrimeKGPhenotype)
         WHERE p.hpo_id IN $phenotypes
         WITH d, collect(DISTINCT p.hpo_id) as matched_phenotypes, count(DISTINCT p) as match_count
         WHERE match_count >= $min_matches
+        ORDER BY match_count DESC
+        LIMIT $limit
         OPTIONAL MATCH (d)-[:ASSOCIATED_WITH|`associated with`]-(g:PrimeKGGene)
         WITH d, matched_phenotypes, match_count, collect(DISTINCT g.symbol) as genes
+        OPTIONAL MATCH (d)-[r:HAS_PHENOTYPE|PHENOTYPE_OF]-(ep:PrimeKGPhenotype)
+        WITH d, matched_phenotypes, match_count, genes, r, ep
+        ORDER BY r.frequency DESC
+        WITH d, matched_phenotypes, match_count, genes,
+             collect(ep.hpo_id)[..$expected_limit] as expected_phenotypes
         RETURN d.mondo_id as disease_id,
                d.name as disease_name,
                d.description as description,
                matched_phenotypes,
                match_count,
                genes,
+               expected_phenotypes,
                d.prevalence as prevalence
         ORDER BY match_count DESC
-        LIMIT $limit
         """
 
         min_matches = max(1, int(len(phenotype_codes) * self.config.min_phenotype_overlap))
 
         try:
-            results = await self._neo4j.run(
-                query,
-                {
-                    "phenotypes": phenotype_codes,
-                    "min_matches": min_matches,
-                    "limit": self.config.max_hypotheses,
-                },
-            )
+            if graph is not None:
+                results = await self._phenotype_candidates_from_graph(
+                    graph, phenotype_codes, min_matches
+                )
+            else:
+                results = await self._neo4j.run(
+                    query,
+                    {
+                        "phenotypes": phenotype_codes,
+                        "min_matches": min_matches,
+                        "limit": self.config.max_hypotheses,
+                        "expected_limit": 20,
+                    },
+                )
 
             for r in results or []:
                 hypothesis = DiagnosisHypothesis(
@@ -390,14 +408,10 @@ class DiagnosisEngine:
                     description=r.get("description"),
                     matched_phenotypes=r.get("matched_phenotypes", []),
                     associated_genes=r.get("genes", []),
+                    expected_phenotypes=r.get("expected_phenotypes") or [],
                     prior_probability=self._parse_prevalence(r.get("prevalence")),
                 )
 
-                # Calculate expected phenotypes
-                hypothesis.expected_phenotypes = await self._get_expected_phenotypes(
-                    hypothesis.disease_id
-                )
-
                 # Find missing phenotypes
                 hypothesis.missing_phenotypes = [
                     p
@@ -412,6 +426,99 @@ class DiagnosisEngine:
 
         return candidates
 
+    async def _phenotype_candidates_from_graph(
+        self,
+        graph: Any,
+        phenotype_codes: list[str],
+        min_matches: int,
+        expected_limit: int = 20,
+    ) -> list[dict[str, Any]]:
+        """
+        Phenotype candidates from the PrimeKG adjacency snapshot.
+
+        Produces the same records as the Cypher query, plus each disease's
+        expected phenotypes, so no per-candidate query is needed. The
+        snapshot carries no edge frequencies, so description, prevalence
+        and the most frequent expected phenotypes come from Neo4j in one
+        point lookup; without a client the snapshot's phenotypes are used
+        in node order.
+        """
+        phenotype_relations = ("HAS_PHENOTYPE", "PHENOTYPE_OF")
+        phenotype_nodes = [
+            node for code in phenotype_codes for node in graph.find(code, "effect/phenotype")
+        ]
+        shared = graph.overlap(phenotype_nodes, phenotype_relations, "disease")
+        ranked = sorted(
+            (item for item in shared.items() if len(item[1]) >= min_matches),
+            key=lambda item: len(item[1]),
+            reverse=True,
+        )[: self.config.max_hypotheses]
+
+        details = await self._load_candidate_details(
+            [disease for disease, _ in ranked], expected_limit
+        )
+        records = []
+        for disease, matched in ranked:
+            detail = details.get(disease, {})
+            expected = detail.get("expected_phenotypes")
+            if expected is None:
+                expected = [
+                    graph.node_id(p)
+                    for p in graph.neighbors(disease, phenotype_relations, "effect/phenotype")
+                ][:expected_limit]
+            records.append(
+                {
+                    "disease_id": graph.node_id(disease),
+                    "disease_name": graph.node_name(disease),
+                    "description": detail.get("description"),
+                    "matched_phenotypes": [graph.node_id(p) for p in matched],
+                    "match_count": len(matched),
+                    "genes": [
+                        graph.node_name(g)
+                        for g in graph.neighbors(disease, "ASSOCIATED_WITH", "gene/protein")
+                    ],
+                    "prevalence": detail.get("prevalence"),
+                    "expected_phenotypes": expected,
+                }
+            )
+        return records
+
+    async def _load_candidate_details(
+        self,
+        diseases: list[int],
+        expected_limit: int,
+    ) -> dict[int, Any]:
+        """
+        Description, prevalence and expected phenotypes (most frequent
+        first) for snapshot disease nodes, in one query.
+
+        Returns:
+            node_index mapped to its record (empty without a client)
+        """
+        if not self._neo4j or not diseases:
+            return {}
+        query = """
+        MATCH (d:PrimeKGDisease)
+        WHERE d.node_index IN $indices
+        OPTIONAL MATCH (d)-[r:HAS_PHENOTYPE|PHENOTYPE_OF]-(ep:PrimeKGPhenotype)
+        WITH d, r, ep
+        ORDER BY r.frequency DESC
+        RETURN d.node_index as node_index,
+               d.description as description,
+               d.prevalence as prevalence,
+               collect(ep.hpo_id)[..$expected_limit] as expected_phenotypes
+        """
+        results = await self._neo4j.run(
+            query, {"indices": diseases, "expected_limit": expected_limit}
+        )
+        return {r["node_index"]: r for r in results or []}
+
+    def _fresh_adjacency(self) -> Any:
+        """The adjacency snapshot, if one is attached and still fresh."""
+        if self._adjacency is None or not self._adjacency.is_fresh():
+            return None
+        return self._adjacency
+
     async def _get_gene_candidates(
         self,
         session: DiagnosisSession,
@@ -470,36 +577,6 @@ class DiagnosisEngine:
 
         return candidates
 
-    async def _get_expected_phenotypes(
-        self,
-        disease_id: str,
-        limit: int = 20,
-    ) -> list[str]:
-        """Get expected phenotypes for a disease."""
-        if not self._neo4j or not disease_id:
-            return []
-
-        query = """
-        MATCH (d:PrimeKGDisease)-[r:HAS_PHENOTYPE|PHENOTYPE_OF]-(p:PrimeKGPhenotype)
-        WHERE d.mondo_id = $disease_id
-        RETURN p.hpo_id as hpo_id, r.frequency as frequency
-        ORDER BY r.frequency DESC
-        LIMIT $limit
-        """
-
-        try:
-            results = await self._neo4j.run(
-                query,
-                {
-                    "disease_id": disease_id,
-                    "limit": limit,
-                },
-            )
-            return [r["hpo_id"] for r in (results or []) if r.get("hpo_id")]
-        except (RuntimeError, ValueError, TypeError, ConnectionError, OSError) as e:
-            logger.debug("phenotype_query_failed", disease_id=disease_id, error=str(e))
-            return []
-
     def _parse_prevalence(self, prevalence: Any) -> float:
         """Parse prevalence value to prior probability."""
         if prevalence is None:
@@ -602,15 +679,16 @@ class DiagnosisEngine:
         # Get candidate phenotypes to ask about
         candidate_phenotypes = self._get_candidate_phenotypes(session)
 
-        # Calculate information gain for each
-        phenotype_scores = []
-        for hpo_id in candidate_phenotypes:
-            gain = self._scorer.calculate_information_gain(
-                session.top_hypotheses,
-                hpo_id,
-            )
-            if gain >= self.config.min_information_gain:
-                phenotype_scores.append((hpo_id, gain))
+        # Calculate information gain for all of them in one pass
+        gains = self._scorer.calculate_information_gains(
+            session.top_hypotheses,
+            candidate_phenotypes,
+        )
+        phenotype_scores = [
+            (hpo_id, gain)
+            for hpo_id, gain in zip(candidate_phenotypes, gains, strict=True)
+            if gain >= self.config.min_information_gain
+        ]
 
         # Sort by information gain
         phenotype_scores.sort(key=lambda x: x[1], reverse=True)
@@ -987,6 +1065,7 @@ def create_diagnosis_engine(
     hpo_service: Any = None,
     genetic_service: Any = None,
     neo4j_client: Any = None,
+    adjacency: Any = None,
 ) -> DiagnosisEngine:
     """Create a diagnosis engine instance."""
     return DiagnosisEngine(
@@ -996,4 +1075,5 @@ def create_diagnosis_engine(
         hpo_service=hpo_service,
         genetic_service=genetic_service,
         neo4j_client=neo4j_client,
+        adjacency=adjacency,
     )
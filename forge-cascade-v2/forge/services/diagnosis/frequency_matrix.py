@@ -0,0 +1,220 @@
+"""
+Phenotype Frequency Matrix
+
+Sparse disease x phenotype frequency matrix used by the Bayesian scorer.
+It is loaded once (one Neo4j query, or straight from the PrimeKG adjacency
+snapshot) instead of one query per disease per scoring round.
+
+Stored column-major (CSC): a patient has a handful of phenotypes, so the
+scorer reads a few columns and scatters them into a dense
+hypotheses x phenotypes block in one pass.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Sequence
+from typing import Any
+
+import numpy as np
+import structlog
+from numpy.typing import NDArray
+
+logger = structlog.get_logger(__name__)
+
+# Frequency assumed for a disease-phenotype edge without a frequency property
+DEFAULT_EDGE_FREQUENCY = 0.5
+
+
+class PhenotypeFrequencyMatrix:
+    """
+    Disease x phenotype frequencies (0.01 to 1.0).
+
+    Usage:
+        matrix = await PhenotypeFrequencyMatrix.load(neo4j_client)
+        rows = matrix.disease_rows(["MONDO:0007739", "MONDO:0008300"])
+        block = matrix.gather(rows, ["HP:0001250"], default=0.1)
+    """
+
+    def __init__(
+        self,
+        disease_ids: list[str],
+        phenotype_ids: list[str],
+        indptr: NDArray[np.int64],
+        rows: NDArray[np.int32],
+        frequencies: NDArray[np.float64],
+    ):
+        self.disease_ids = disease_ids
+        self.phenotype_ids = phenotype_ids
+        self._indptr = indptr
+        self._rows = rows
+        self._frequencies = frequencies
+        self._disease_index = {disease_id: i for i, disease_id in enumerate(disease_ids)}
+        self._phenotype_index = {hpo_id: j for j, hpo_id in enumerate(phenotype_ids)}
+
+    @property
+    def disease_count(self) -> int:
+        return len(self.disease_ids)
+
+    @property
+    def entry_count(self) -> int:
+        return len(self._rows)
+
+    # =========================================================================
+    # Construction
+    # =========================================================================
+
+    @classmethod
+    def empty(cls) -> PhenotypeFrequencyMatrix:
+        return cls.from_records([])
+
+    @classmethod
+    def from_records(cls, records: Iterable[tuple[str, str, float]]) -> PhenotypeFrequencyMatrix:
+        """
+        Build from (disease_id, hpo_id, frequency) triples.
+
+        Frequencies are clamped to [0.01, 1.0]; a repeated pair keeps the
+        highest frequency.
+        """
+        disease_index: dict[str, int] = {}
+        phenotype_index: dict[str, int] = {}
+        row_list: list[int] = []
+        col_list: list[int] = []
+        freq_list: list[float] = []
+        for disease_id, hpo_id, frequency in records:
+            if not disease_id or not hpo_id:
+                continue
+            row_list.append(disease_index.setdefault(disease_id, len(disease_index)))
+            col_list.append(phenotype_index.setdefault(hpo_id, len(phenotype_index)))
+            freq_list.append(frequency)
+
+        rows = np.asarray(row_list, dtype=np.int32)
+        cols = np.asarray(col_list, dtype=np.int64)
+        freqs = np.clip(np.asarray(freq_list, dtype=np.float64), 0.01, 1.0)
+
+        # Sort by column, then row, then descending frequency so the first
+        # entry of each (column, row) run is the one kept
+        order = np.lexsort((-freqs, rows, cols))
+        rows, cols, freqs = rows[order], cols[order], freqs[order]
+        if len(rows):
+            keep = np.ones(len(rows), dtype=bool)
+            keep[1:] = (cols[1:] != cols[:-1]) | (rows[1:] != rows[:-1])
+            rows, cols, freqs = rows[keep], cols[keep], freqs[keep]
+
+        indptr = np.zeros(len(phenotype_index) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(cols, minlength=len(phenotype_index)), out=indptr[1:])
+        return cls(list(disease_index), list(phenotype_index), indptr, rows, freqs)
+
+    @classmethod
+    async def load(cls, neo4j_client: Any) -> PhenotypeFrequencyMatrix:
+        """Load every disease-phenotype frequency from PrimeKG in one query."""
+        query = """
+        MATCH (d:PrimeKGDisease)-[r:HAS_PHENOTYPE|PHENOTYPE_OF]-(p:PrimeKGPhenotype)
+        RETURN coalesce(d.mondo_id, d.node_id) as disease_id,
+               p.hpo_id as hpo_id,
+               CASE
+                   WHEN r.frequency IS NOT NULL THEN r.frequency
+                   WHEN r.weight IS NOT NULL THEN r.weight
+                   ELSE $default_frequency
+               END as freq
+        """
+        results = await neo4j_client.run(query, {"default_frequency": DEFAULT_EDGE_FREQUENCY})
+        matrix = cls.from_records(
+            (r.get("disease_id"), r.get("hpo_id"), float(r.get("freq", DEFAULT_EDGE_FREQUENCY)))
+            for r in results or []
+        )
+        logger.info(
+            "phenotype_frequency_matrix_loaded",
+            source="neo4j",
+            diseases=matrix.disease_count,
+            entries=matrix.entry_count,
+        )
+        return matrix
+
+    @classmethod
+    def from_adjacency(cls, graph: Any) -> PhenotypeFrequencyMatrix:
+        """
+        Build from a PrimeKGAdjacency snapshot.
+
+        The snapshot carries no edge properties, so every edge gets
+        DEFAULT_EDGE_FREQUENCY, as the Neo4j query does for edges without
+        a frequency.
+        """
+        relations = ("HAS_PHENOTYPE", "PHENOTYPE_OF")
+        records: list[tuple[str, str, float]] = []
+        for node in range(graph.node_count):
+            if graph.node_type(node) != "disease":
+                continue
+            phenotypes = graph.neighbors(node, relations, "effect/phenotype").tolist()
+            if not phenotypes:
+                continue
+            disease_id = graph.node_id(node)
+            records.extend(
+                (disease_id, graph.node_id(p), DEFAULT_EDGE_FREQUENCY) for p in phenotypes
+            )
+        matrix = cls.from_records(records)
+        logger.info(
+            "phenotype_frequency_matrix_loaded",
+            source="adjacency",
+            diseases=matrix.disease_count,
+            entries=matrix.entry_count,
+        )
+        return matrix
+
+    # =========================================================================
+    # Lookups
+    # =========================================================================
+
+    def disease_rows(self, disease_ids: Sequence[str]) -> NDArray[np.int64]:
+        """Row of each disease, or -1 for diseases without phenotype data."""
+        return np.fromiter(
+            (self._disease_index.get(d, -1) for d in disease_ids),
+            dtype=np.int64,
+            count=len(disease_ids),
+        )
+
+    def frequencies(self, disease_id: str) -> dict[str, float]:
+        """Phenotype frequencies of one disease."""
+        row = self._disease_index.get(disease_id)
+        if row is None:
+            return {}
+        positions = np.flatnonzero(self._rows == row)
+        cols = np.searchsorted(self._indptr, positions, side="right") - 1
+        return {
+            self.phenotype_ids[int(col)]: float(self._frequencies[pos])
+            for pos, col in zip(positions, cols, strict=True)
+        }
+
+    def gather(
+        self,
+        rows: NDArray[np.int64],
+        phenotype_ids: Sequence[str],
+        default: float,
+    ) -> NDArray[np.float64]:
+        """
+        Dense len(rows) x len(phenotype_ids) block of frequencies.
+
+        Entries without a recorded frequency (including rows of -1) are
+        filled with default.
+        """
+        block = np.full((len(rows), len(phenotype_ids)), default, dtype=np.float64)
+        if not len(rows) or not phenotype_ids:
+            return block
+
+        # Position of each matrix row in the block; a row may repeat, so
+        # scatter into the unique rows and expand afterwards
+        unique_rows, inverse = np.unique(rows, return_inverse=True)
+        known = unique_rows >= 0
+        position = np.full(self.disease_count + 1, -1, dtype=np.int64)
+        position[unique_rows[known]] = np.flatnonzero(known)
+
+        unique_block = np.full((len(unique_rows), len(phenotype_ids)), default)
+        for j, hpo_id in enumerate(phenotype_ids):
+            col = self._phenotype_index.get(hpo_id)
+            if col is None:
+                continue
+            start, end = self._indptr[col], self._indptr[col + 1]
+            targets = position[self._rows[start:end]]
+            hit = targets >= 0
+            unique_block[targets[hit], j] = self._frequencies[start:end][hit]
+        block[:] = unique_block[inverse.reshape(-1)]
+        return block
@@ -3,15 +3,24 @@ Bayesian Scoring Module
 
 Implements Bayesian hypothesis scoring for differential diagnosis.
 Uses phenotype-disease frequencies, genetic evidence, and clinical context.
+
+All hypotheses are scored together: phenotype frequencies come from a
+PhenotypeFrequencyMatrix loaded once, likelihood ratios are combined in
+log space as NumPy vectors, and information gain is computed for every
+candidate question in one matrix pass.
 """
 
-import math
+import asyncio
+from collections.abc import Sequence
 from dataclasses import dataclass
 from datetime import UTC, datetime
 from typing import Any
 
+import numpy as np
 import structlog
+from numpy.typing import NDArray
 
+from .frequency_matrix import PhenotypeFrequencyMatrix
 from .models import (
     DiagnosisHypothesis,
     EvidenceItem,
@@ -64,10 +73,16 @@ class BayesianScorer:
     P(Disease|Evidence) = P(Evidence|Disease) * P(Disease) / P(Evidence)
     """
 
+    # Frequency assumed for a phenotype with no recorded disease frequency
+    UNKNOWN_PHENOTYPE_FREQUENCY = 0.1
+    # P(phenotype | no disease), the likelihood ratio denominator
+    BACKGROUND_PHENOTYPE_RATE = 0.01
+
     def __init__(
         self,
         config: ScoringConfig | None = None,
         primekg_overlay: Any = None,
+        frequency_matrix: PhenotypeFrequencyMatrix | None = None,
     ) -> None:
         """
         Initialize the Bayesian scorer.
@@ -75,12 +90,14 @@ class BayesianScorer:
         Args:
             config: Scoring configuration
             primekg_overlay: PrimeKG overlay for phenotype frequencies
+            frequency_matrix: Preloaded frequencies (loaded lazily otherwise)
         """
         self.config = config or ScoringConfig()
         self._primekg = primekg_overlay
 
-        # Cached phenotype frequencies
-        self._phenotype_freq_cache: dict[str, dict[str, float]] = {}
+        # Disease x phenotype frequencies, loaded once on first use
+        self._frequency_matrix = frequency_matrix
+        self._matrix_lock = asyncio.Lock()
 
     async def score_hypothesis(
         self,
@@ -97,66 +114,7 @@ class BayesianScorer:
         Returns:
             Updated hypothesis with scores
         """
-        # Start with prior - ensure it's in valid range (0, 1) exclusive
-        prior = hypothesis.prior_probability
-        if self.config.use_prevalence and prior <= 0:
-            prior = self.config.default_prevalence
-        # Clamp prior to valid range for Bayesian calculation
-        prior = max(self.config.min_posterior, min(self.config.max_posterior, prior))
-
-        # Calculate likelihood ratio from all evidence
-        combined_lr = 1.0
-
-        # Phenotype evidence
-        phenotype_lr = await self._calculate_phenotype_likelihood(
-            hypothesis.disease_id,
-            patient.phenotype_codes,
-            patient.negated_phenotype_codes,
-        )
-        hypothesis.phenotype_score = self._lr_to_score(phenotype_lr)
-
-        # Genetic evidence
-        genetic_lr = self._calculate_genetic_likelihood(
-            hypothesis.associated_genes,
-            list(patient.genetic_variants),
-        )
-        hypothesis.genetic_score = self._lr_to_score(genetic_lr)
-
-        # History evidence
-        history_lr = self._calculate_history_likelihood(
-            hypothesis,
-            patient.medical_history,
-            patient.family_history,
-        )
-        hypothesis.history_score = self._lr_to_score(history_lr)
-
-        # Combine likelihood ratios (weighted geometric mean)
-        combined_lr = (
-            (phenotype_lr**self.config.phenotype_weight)
-            * (genetic_lr**self.config.genetic_weight)
-            * (history_lr**self.config.history_weight)
-        )
-
-        # Apply Bayes' theorem
-        posterior_odds = (prior / (1 - prior)) * combined_lr
-        posterior = posterior_odds / (1 + posterior_odds)
-
-        # Clamp to valid range
-        posterior = max(self.config.min_posterior, min(self.config.max_posterior, posterior))
-
-        hypothesis.posterior_probability = posterior
-
-        # Calculate combined score (weighted average of component scores)
-        hypothesis.combined_score = (
-            hypothesis.phenotype_score * self.config.phenotype_weight
-            + hypothesis.genetic_score * self.config.genetic_weight
-            + hypothesis.history_score * self.config.history_weight
-        )
-
-        # Classify evidence
-        self._classify_evidence(hypothesis, patient)
-
-        hypothesis.updated_at = datetime.now(UTC)
+        await self._score_batch([hypothesis], patient)
         return hypothesis
 
     async def score_all_hypotheses(
@@ -174,10 +132,8 @@ class BayesianScorer:
         Returns:
             Sorted list of hypotheses (highest score first)
         """
-        scored = []
-        for hypothesis in hypotheses:
-            scored_h = await self.score_hypothesis(hypothesis, patient)
-            scored.append(scored_h)
+        await self._score_batch(hypotheses, patient)
+        scored = list(hypotheses)
 
         # Sort by combined score
         scored.sort(key=lambda h: h.combined_score, reverse=True)
@@ -188,50 +144,131 @@ class BayesianScorer:
 
         return scored
 
-    async def _calculate_phenotype_likelihood(
+    async def _score_batch(
         self,
-        disease_id: str,
-        present_phenotypes: list[str],
-        absent_phenotypes: list[str],
-    ) -> float:
+        hypotheses: Sequence[DiagnosisHypothesis],
+        patient: PatientProfile,
+    ) -> None:
         """
-        Calculate phenotype likelihood ratio.
+        Score hypotheses in place.
 
-        Uses phenotype-disease frequencies from PrimeKG.
+        P(Disease|Evidence) is computed in log-odds space: the prior's
+        log-odds plus the weighted log likelihood ratios, so products of
+        many phenotype ratios cannot overflow.
         """
-        if not present_phenotypes and not absent_phenotypes:
-            return 1.0
+        if not hypotheses:
+            return
+        cfg = self.config
 
-        lr = 1.0
+        # Start with prior - ensure it's in valid range (0, 1) exclusive
+        priors = np.array([h.prior_probability for h in hypotheses], dtype=np.float64)
+        if cfg.use_prevalence:
+            priors[priors <= 0] = cfg.default_prevalence
+        priors = np.clip(priors, cfg.min_posterior, cfg.max_posterior)
+
+        # Phenotype evidence for every hypothesis at once
+        matrix = await self._get_frequency_matrix()
+        phenotype_log_lr = self.phenotype_log_likelihoods(
+            matrix,
+            matrix.disease_rows([h.disease_id for h in hypotheses]),
+            patient.phenotype_codes,
+            patient.negated_phenotype_codes,
+        )
 
-        # Get phenotype frequencies for this disease
-        frequencies = await self._get_phenotype_frequencies(disease_id)
+        # Genetic and history evidence (no lookups, cheap per hypothesis)
+        genetic_evidence = list(patient.genetic_variants)
+        with np.errstate(divide="ignore"):
+            genetic_log_lr = np.log(
+                [
+                    self._calculate_genetic_likelihood(h.associated_genes, genetic_evidence)
+                    for h in hypotheses
+                ]
+            )
+            history_log_lr = np.log(
+                [
+                    self._calculate_history_likelihood(
+                        h, patient.medical_history, patient.family_history
+                    )
+                    for h in hypotheses
+                ]
+            )
+
+        # Combine likelihood ratios (weighted geometric mean) and apply
+        # Bayes' theorem
+        combined_log_lr = (
+            cfg.phenotype_weight * phenotype_log_lr
+            + cfg.genetic_weight * genetic_log_lr
+            + cfg.history_weight * history_log_lr
+        )
+        posterior_log_odds = np.log(priors / (1 - priors)) + combined_log_lr
+        posteriors = np.clip(_sigmoid(posterior_log_odds), cfg.min_posterior, cfg.max_posterior)
+
+        phenotype_scores = self._log_lr_to_score(phenotype_log_lr)
+        genetic_scores = self._log_lr_to_score(genetic_log_lr)
+        history_scores = self._log_lr_to_score(history_log_lr)
+
+        # Combined score (weighted average of component scores)
+        combined_scores = (
+            phenotype_scores * cfg.phenotype_weight
+            + genetic_scores * cfg.genetic_weight
+            + history_scores * cfg.history_weight
+        )
 
-        # For each present phenotype
-        for hpo_id in present_phenotypes:
-            freq = frequencies.get(hpo_id, 0.1)  # Default 10% if unknown
+        now = datetime.now(UTC)
+        for i, hypothesis in enumerate(hypotheses):
+            hypothesis.phenotype_score = float(phenotype_scores[i])
+            hypothesis.genetic_score = float(genetic_scores[i])
+            hypothesis.history_score = float(history_scores[i])
+            hypothesis.posterior_probability = float(posteriors[i])
+            hypothesis.combined_score = float(combined_scores[i])
 
-            # Likelihood ratio for present phenotype
-            # LR = P(phenotype|disease) / P(phenotype|no_disease)
-            # Approximate P(phenotype|no_disease) as background rate
-            background = 0.01  # Assume 1% background rate
-            phenotype_lr = freq / background
+            # Classify evidence
+            self._classify_evidence(hypothesis, patient)
+            hypothesis.updated_at = now
 
-            # Clamp to reasonable range
-            phenotype_lr = max(0.1, min(100, phenotype_lr))
-            lr *= phenotype_lr
+    def phenotype_log_likelihoods(
+        self,
+        matrix: PhenotypeFrequencyMatrix,
+        rows: NDArray[np.int64],
+        present_phenotypes: Sequence[str],
+        absent_phenotypes: Sequence[str],
+    ) -> NDArray[np.float64]:
+        """
+        Log phenotype likelihood ratio of each disease row.
 
-        # For each absent phenotype
-        for hpo_id in absent_phenotypes:
-            freq = frequencies.get(hpo_id, 0.1)
+        Pass np.arange(matrix.disease_count) as rows to score every disease.
 
-            if freq > 0.5:  # Core phenotype absent
-                # Strong evidence against
-                lr *= self.config.phenotype_absent_lr
-            elif freq > 0.2:  # Common phenotype absent
-                lr *= 0.6
+        Args:
+            matrix: Disease x phenotype frequencies
+            rows: Matrix rows to score (-1 for diseases without data)
+            present_phenotypes: HPO IDs observed in the patient
+            absent_phenotypes: HPO IDs explicitly absent
 
-        return lr
+        Returns:
+            One log likelihood ratio per row
+        """
+        log_lr = np.zeros(len(rows), dtype=np.float64)
+
+        if present_phenotypes:
+            # LR = P(phenotype|disease) / P(phenotype|no_disease), clamped
+            # to a reasonable range
+            freqs = matrix.gather(rows, present_phenotypes, self.UNKNOWN_PHENOTYPE_FREQUENCY)
+            ratios = np.clip(freqs / self.BACKGROUND_PHENOTYPE_RATE, 0.1, 100)
+            log_lr += np.log(ratios).sum(axis=1)
+
+        if absent_phenotypes:
+            # Absent core phenotypes are strong evidence against, absent
+            # common ones weaker evidence
+            freqs = matrix.gather(rows, absent_phenotypes, self.UNKNOWN_PHENOTYPE_FREQUENCY)
+            ratios = np.where(
+                freqs > 0.5,
+                self.config.phenotype_absent_lr,
+                np.where(freqs > 0.2, 0.6, 1.0),
+            )
+            with np.errstate(divide="ignore"):
+                log_lr += np.log(ratios).sum(axis=1)
+
+        return log_lr
 
     def _calculate_genetic_likelihood(
         self,
@@ -298,70 +335,36 @@ class BayesianScorer:
 
         return lr
 
-    async def _get_phenotype_frequencies(self, disease_id: str) -> dict[str, float]:
+    async def _get_frequency_matrix(self) -> PhenotypeFrequencyMatrix:
         """
-        Get phenotype frequencies for a disease from PrimeKG.
+        Get the disease x phenotype frequency matrix, loading it on first use.
 
-        Returns a dict mapping HPO IDs to their frequency in the disease.
-        Frequency represents how often this phenotype appears in patients
-        with the disease (0.0 to 1.0).
-
-        Frequencies are estimated based on:
-        - "frequency" property if available in the relationship
-        - Number of edges (more edges = more commonly reported)
-        - Default to 0.5 for unknown
+        Built from the overlay's PrimeKG adjacency snapshot when it is fresh,
+        otherwise with a single Neo4j query through the overlay's client.
+        A failed load is not cached, so the next scoring round retries.
         """
-        if disease_id in self._phenotype_freq_cache:
-            return self._phenotype_freq_cache[disease_id]
+        if self._frequency_matrix is not None:
+            return self._frequency_matrix
 
-        frequencies = {}
+        async with self._matrix_lock:
+            if self._frequency_matrix is not None:
+                return self._frequency_matrix
 
-        if self._primekg:
+            graph = getattr(self._primekg, "adjacency", None)
+            neo4j = getattr(self._primekg, "_neo4j", None)
             try:
-                # Query PrimeKG for disease phenotypes with frequencies
-                # Uses relationship properties if available, otherwise estimates
-                query = """
-                MATCH (d:PrimeKGDisease)-[r:HAS_PHENOTYPE|PHENOTYPE_OF]-(p:PrimeKGPhenotype)
-                WHERE d.mondo_id = $disease_id OR d.node_id = $disease_id
-                WITH p.hpo_id as hpo_id,
-                     p.name as name,
-                     // Use frequency if available, otherwise estimate from edge weight
-                     CASE
-                         WHEN r.frequency IS NOT NULL THEN r.frequency
-                         WHEN r.weight IS NOT NULL THEN r.weight
-                         ELSE 0.5
-                     END as freq
-                RETURN hpo_id, name, freq
-                ORDER BY freq DESC
-                """
-
-                # Access Neo4j through the overlay's client
-                neo4j = getattr(self._primekg, "_neo4j", None)
-                if neo4j:
-                    results = await neo4j.run(query, {"disease_id": disease_id})
-
-                    for r in results or []:
-                        hpo_id = r.get("hpo_id")
-                        if hpo_id:
-                            # Clamp frequency to valid range
-                            freq = float(r.get("freq", 0.5))
-                            frequencies[hpo_id] = max(0.01, min(1.0, freq))
-
-                    logger.debug(
-                        "phenotype_frequencies_loaded",
-                        disease_id=disease_id,
-                        count=len(frequencies),
-                    )
-
+                if graph is not None and graph.is_fresh():
+                    matrix = await asyncio.to_thread(PhenotypeFrequencyMatrix.from_adjacency, graph)
+                elif neo4j:
+                    matrix = await PhenotypeFrequencyMatrix.load(neo4j)
+                else:
+                    matrix = PhenotypeFrequencyMatrix.empty()
             except (RuntimeError, ValueError, KeyError, OSError) as e:
-                logger.warning(
-                    "phenotype_freq_query_failed",
-                    disease=disease_id,
-                    error=str(e),
-                )
+                logger.warning("phenotype_freq_query_failed", error=str(e))
+                return PhenotypeFrequencyMatrix.empty()
 
-        self._phenotype_freq_cache[disease_id] = frequencies
-        return frequencies
+            self._frequency_matrix = matrix
+            return matrix
 
     def _classify_evidence(
         self,
@@ -412,14 +415,9 @@ class BayesianScorer:
 
         return EvidencePolarity.NEUTRAL
 
-    def _lr_to_score(self, lr: float) -> float:
-        """Convert likelihood ratio to a 0-1 score."""
-        if lr <= 0:
-            return 0.0
-        # Use logistic transformation
-        log_lr = math.log(lr)
-        score = 1.0 / (1.0 + math.exp(-log_lr / 2))
-        return score
+    def _log_lr_to_score(self, log_lr: NDArray[np.float64]) -> NDArray[np.float64]:
+        """Convert log likelihood ratios to 0-1 scores (logistic of log_lr / 2)."""
+        return _sigmoid(log_lr / 2)
 
     def calculate_information_gain(
         self,
@@ -432,58 +430,86 @@ class BayesianScorer:
         Uses entropy reduction to estimate how much a phenotype question
         would discriminate between hypotheses.
         """
-        if len(hypotheses) <= 1:
-            return 0.0
+        return self.calculate_information_gains(hypotheses, [phenotype_hpo_id])[0]
 
-        # Current entropy
-        probs = [h.combined_score for h in hypotheses]
-        total = sum(probs)
+    def calculate_information_gains(
+        self,
+        hypotheses: list[DiagnosisHypothesis],
+        phenotype_hpo_ids: Sequence[str],
+    ) -> list[float]:
+        """
+        Expected information gain of every candidate phenotype question.
+
+        Each hypothesis is assumed to show a phenotype with probability 0.7
+        if it is expected, 0.3 if it is missing and 0.5 otherwise. The
+        hypothesis x phenotype matrix of those probabilities gives the
+        posterior entropies for all questions in one pass.
+
+        Args:
+            hypotheses: Hypotheses to discriminate between
+            phenotype_hpo_ids: Candidate phenotypes to ask about
+
+        Returns:
+            Information gain of each phenotype, in order
+        """
+        gains = [0.0] * len(phenotype_hpo_ids)
+        if len(hypotheses) <= 1 or not phenotype_hpo_ids:
+            return gains
+
+        weights = np.array([h.combined_score for h in hypotheses], dtype=np.float64)
+        total = weights.sum()
         if total == 0:
-            return 0.0
-
-        probs = [p / total for p in probs]
-        current_entropy = -sum(p * math.log(p + 1e-10) for p in probs)
-
-        # Expected entropy if phenotype is present
-        present_probs = []
-        for h in hypotheses:
-            freq = 0.5  # Default frequency
-            if phenotype_hpo_id in h.expected_phenotypes:
-                freq = 0.7
-            elif phenotype_hpo_id in h.missing_phenotypes:
-                freq = 0.3
-            present_probs.append(h.combined_score * freq)
-
-        # Expected entropy if phenotype is absent
-        absent_probs = []
-        for h in hypotheses:
-            freq = 0.5
-            if phenotype_hpo_id in h.expected_phenotypes:
-                freq = 0.3
-            elif phenotype_hpo_id in h.missing_phenotypes:
-                freq = 0.7
-            absent_probs.append(h.combined_score * freq)
-
-        # Calculate expected post-question entropy
-        p_present = sum(present_probs) / (sum(present_probs) + sum(absent_probs) + 1e-10)
-        p_absent = 1 - p_present
-
-        if sum(present_probs) > 0:
-            present_probs = [p / sum(present_probs) for p in present_probs]
-            entropy_present = -sum(p * math.log(p + 1e-10) for p in present_probs)
-        else:
-            entropy_present = current_entropy
-
-        if sum(absent_probs) > 0:
-            absent_probs = [p / sum(absent_probs) for p in absent_probs]
-            entropy_absent = -sum(p * math.log(p + 1e-10) for p in absent_probs)
-        else:
-            entropy_absent = current_entropy
-
-        expected_entropy = p_present * entropy_present + p_absent * entropy_absent
+            return gains
+
+        # Current entropy
+        current_entropy = _entropy(weights / total)
+
+        # P(phenotype present | hypothesis)
+        columns = {hpo_id: j for j, hpo_id in enumerate(phenotype_hpo_ids)}
+        p_shown = np.full((len(hypotheses), len(phenotype_hpo_ids)), 0.5)
+        for i, h in enumerate(hypotheses):
+            for hpo_id in h.missing_phenotypes:
+                if hpo_id in columns:
+                    p_shown[i, columns[hpo_id]] = 0.3
+            for hpo_id in h.expected_phenotypes:
+                if hpo_id in columns:
+                    p_shown[i, columns[hpo_id]] = 0.7
+
+        present = weights[:, None] * p_shown
+        absent = weights[:, None] * (1 - p_shown)
+        present_total = present.sum(axis=0)
+        absent_total = absent.sum(axis=0)
+        p_present = present_total / (present_total + absent_total + 1e-10)
+
+        # Expected post-question entropy
+        entropy_present = _column_entropy(present, present_total, current_entropy)
+        entropy_absent = _column_entropy(absent, absent_total, current_entropy)
+        expected_entropy = p_present * entropy_present + (1 - p_present) * entropy_absent
 
         # Information gain = reduction in entropy
-        return max(0.0, current_entropy - expected_entropy)
+        gain = np.maximum(0.0, current_entropy - expected_entropy)
+        return [float(g) for g in gain]
+
+
+def _sigmoid(x: NDArray[np.float64]) -> NDArray[np.float64]:
+    # tanh form does not overflow for large |x|
+    return np.asarray(0.5 * (1.0 + np.tanh(x / 2)), dtype=np.float64)
+
+
+def _entropy(probs: NDArray[np.float64]) -> float:
+    return float(-(probs * np.log(probs + 1e-10)).sum())
+
+
+def _column_entropy(
+    weights: NDArray[np.float64],
+    totals: NDArray[np.float64],
+    fallback: float,
+) -> NDArray[np.float64]:
+    """Entropy of each column normalised to sum 1; fallback for empty columns."""
+    nonzero = totals > 0
+    probs = np.divide(weights, totals, out=np.zeros_like(weights), where=nonzero)
+    entropy = -(probs * np.log(probs + 1e-10)).sum(axis=0)
+    return np.where(nonzero, entropy, fallback)
 
 
 # =============================================================================
@@ -494,9 +520,11 @@ class BayesianScorer:
 def create_bayesian_scorer(
     config: ScoringConfig | None = None,
     primekg_overlay: Any = None,
+    frequency_matrix: PhenotypeFrequencyMatrix | None = None,
 ) -> BayesianScorer:
     """Create a Bayesian scorer instance."""
     return BayesianScorer(
         config=config,
         primekg_overlay=primekg_overlay,
+        frequency_matrix=frequency_matrix,
     )
@@ -16,8 +16,13 @@ from __future__ import annotations
 
 import asyncio
 import hashlib
+import sqlite3
+import threading
+import time
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from array import array
+from collections import OrderedDict
+from dataclasses import dataclass, field, replace
 from enum import Enum
 from typing import TYPE_CHECKING, Any
 
@@ -28,6 +33,17 @@ if TYPE_CHECKING:
 
 logger = structlog.get_logger(__name__)
 
+# HTTP statuses meaning the request body itself was rejected
+INPUT_ERROR_STATUSES = frozenset({400, 413, 422})
+
+
+def _is_input_error(error: BaseException) -> bool:
+    """Whether an embedding failure is caused by the texts rather than the provider."""
+    status = getattr(getattr(error, "response", None), "status_code", None)
+    if isinstance(status, int):
+        return status in INPUT_ERROR_STATUSES
+    return isinstance(error, ValueError | TypeError)
+
 
 class EmbeddingProvider(str, Enum):
     """Supported embedding providers."""
@@ -64,6 +80,13 @@ class EmbeddingConfig:
     normalize: bool = True
     # Cost optimization: Configurable cache size (default 50000 for better hit rates)
     cache_size: int = 50000
+    # Memory budget for cached vectors (float32 storage)
+    cache_max_bytes: int = 256 * 1024 * 1024
+    # Optional SQLite file that keeps cached embeddings across restarts
+    cache_persist_path: str | None = None
+    # Concurrent embed() calls arriving within this window share one provider batch
+    coalesce_window_ms: float = 2.0
+    coalesce_max_batch: int = 64
 
     def __repr__(self) -> str:
         """SECURITY FIX: Redact API key in repr/logs."""
@@ -368,67 +391,343 @@ class MockEmbeddingProvider(EmbeddingProviderBase):
 
 
 class EmbeddingCache:
-    """Simple in-memory cache for embeddings with thread-safe operations."""
+    """
+    Sharded LRU cache for embeddings with a memory budget and disk tier.
+
+    Vectors are stored as float32 arrays, which take about an eighth of the
+    memory of a list of Python floats. Entries are spread across shards so
+    that a lookup only holds its own shard's lock, and never across an
+    await. Each shard evicts least-recently-used entries once it exceeds
+    its share of ``max_size`` or ``max_bytes``.
+
+    When ``persist_path`` is set, entries are also written through to a
+    SQLite file so that a restarted process does not have to re-embed
+    content it has already paid for. Disk errors are logged and treated as
+    misses; the cache never fails an embedding request.
+    """
+
+    # Approximate per-entry overhead (key, entry object, dict slot)
+    ENTRY_OVERHEAD_BYTES = 200
 
     # Cost optimization: Increased default from 10000 to 50000 for better hit rates
-    def __init__(self, max_size: int = 50000):
-        self._cache: dict[str, EmbeddingResult] = {}
+    def __init__(
+        self,
+        max_size: int = 50000,
+        max_bytes: int = 256 * 1024 * 1024,
+        persist_path: str | None = None,
+        disk_max_entries: int = 1_000_000,
+        shards: int = 16,
+    ):
         self._max_size = max_size
+        self._max_bytes = max_bytes
+        self._shards = [_CacheShard() for _ in range(max(1, shards))]
+        self._shard_max_size = max(1, -(-max_size // len(self._shards)))
+        self._shard_max_bytes = max(1, max_bytes // len(self._shards))
         self._hits = 0
         self._misses = 0
-        # SECURITY FIX (Audit 3): Add lock to prevent race conditions in cache operations
-        import asyncio
+        self._disk_hits = 0
+        self._evictions = 0
+
+        self._persist_path = persist_path
+        self._disk_max_entries = disk_max_entries
+        self._disk: sqlite3.Connection | None = None
+        self._disk_count = 0
+        # The SQLite connection is shared by the event loop and worker threads
+        self._disk_lock = threading.Lock()
+        if persist_path:
+            self._open_disk(persist_path)
 
-        self._lock = asyncio.Lock()
+    def __len__(self) -> int:
+        return sum(len(shard.entries) for shard in self._shards)
 
     def _make_key(self, text: str, model: str) -> str:
         """Create cache key from text and model."""
         return hashlib.sha256(f"{model}:{text}".encode()).hexdigest()
 
+    def _shard_for(self, key: str) -> _CacheShard:
+        return self._shards[int(key[:8], 16) % len(self._shards)]
+
+    # -------------------------------------------------------------------------
+    # Memory tier
+    # -------------------------------------------------------------------------
+
+    def _memory_get(self, key: str) -> _CacheEntry | None:
+        shard = self._shard_for(key)
+        # move_to_end reorders the shard, so it takes the lock like eviction does
+        with shard.lock:
+            entry = shard.entries.get(key)
+            if entry is not None:
+                shard.entries.move_to_end(key)
+            return entry
+
+    def _memory_put(self, key: str, entry: _CacheEntry) -> None:
+        shard = self._shard_for(key)
+        with shard.lock:
+            previous = shard.entries.pop(key, None)
+            if previous is not None:
+                shard.bytes -= previous.size_bytes
+            shard.entries[key] = entry
+            shard.bytes += entry.size_bytes
+
+            while shard.entries and (
+                len(shard.entries) > self._shard_max_size or shard.bytes > self._shard_max_bytes
+            ):
+                _, evicted = shard.entries.popitem(last=False)
+                shard.bytes -= evicted.size_bytes
+                self._evictions += 1
+
+    # -------------------------------------------------------------------------
+    # Disk tier
+    # -------------------------------------------------------------------------
+
+    def _open_disk(self, path: str) -> None:
+        try:
+            conn = sqlite3.connect(path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings ("
+                " key TEXT PRIMARY KEY,"
+                " model TEXT NOT NULL,"
+                " dimensions INTEGER NOT NULL,"
+                " tokens_used INTEGER NOT NULL,"
+                " vector BLOB NOT NULL,"
+                " accessed_at REAL NOT NULL)"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_embeddings_accessed ON embeddings(accessed_at)"
+            )
+            self._disk_count = conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0]
+            self._disk = conn
+            logger.info("embedding_cache_disk_opened", path=path, entries=self._disk_count)
+        except sqlite3.Error as e:
+            logger.warning("embedding_cache_disk_unavailable", path=path, error=str(e))
+            self._disk = None
+
+    def _disk_get_many(self, keys: list[str]) -> dict[str, _CacheEntry]:
+        if self._disk is None or not keys:
+            return {}
+        found: dict[str, _CacheEntry] = {}
+        with self._disk_lock:
+            try:
+                # SQLite limits bound parameters; query in chunks
+                for start in range(0, len(keys), 500):
+                    chunk = keys[start : start + 500]
+                    placeholders = ",".join("?" * len(chunk))
+                    rows = self._disk.execute(
+                        "SELECT key, model, dimensions, tokens_used, vector FROM embeddings "
+                        f"WHERE key IN ({placeholders})",  # nosec B608 - placeholders only
+                        chunk,
+                    ).fetchall()
+                    for key, model, dimensions, tokens_used, blob in rows:
+                        vector = array("f")
+                        vector.frombytes(blob)
+                        found[key] = _CacheEntry(vector, model, dimensions, tokens_used)
+                if found:
+                    now = time.time()
+                    self._disk.executemany(
+                        "UPDATE embeddings SET accessed_at = ? WHERE key = ?",
+                        [(now, key) for key in found],
+                    )
+                    self._disk.commit()
+            except sqlite3.Error as e:
+                logger.warning("embedding_cache_disk_read_failed", error=str(e))
+                return {}
+        return found
+
+    def _disk_put_many(self, items: list[tuple[str, _CacheEntry]]) -> None:
+        if self._disk is None or not items:
+            return
+        now = time.time()
+        with self._disk_lock:
+            try:
+                before = self._disk.total_changes
+                self._disk.executemany(
+                    "INSERT OR IGNORE INTO embeddings "
+                    "(key, model, dimensions, tokens_used, vector, accessed_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    [
+                        (
+                            key,
+                            entry.model,
+                            entry.dimensions,
+                            entry.tokens_used,
+                            entry.vector.tobytes(),
+                            now,
+                        )
+                        for key, entry in items
+                    ],
+                )
+                self._disk_count += self._disk.total_changes - before
+
+                overflow = self._disk_count - self._disk_max_entries
+                if overflow > 0:
+                    # Spill the least recently used tenth so pruning stays infrequent
+                    prune = max(overflow, self._disk_max_entries // 10)
+                    cursor = self._disk.execute(
+                        "DELETE FROM embeddings WHERE key IN ("
+                        " SELECT key FROM embeddings ORDER BY accessed_at LIMIT ?)",
+                        (prune,),
+                    )
+                    self._disk_count -= cursor.rowcount
+                self._disk.commit()
+            except sqlite3.Error as e:
+                logger.warning("embedding_cache_disk_write_failed", error=str(e))
+
+    def _disk_clear(self) -> None:
+        if self._disk is None:
+            return
+        with self._disk_lock:
+            try:
+                self._disk.execute("DELETE FROM embeddings")
+                self._disk.commit()
+                self._disk_count = 0
+            except sqlite3.Error as e:
+                logger.warning("embedding_cache_disk_clear_failed", error=str(e))
+
+    # -------------------------------------------------------------------------
+    # Public API
+    # -------------------------------------------------------------------------
+
     async def get(self, text: str, model: str) -> EmbeddingResult | None:
-        """Get cached embedding if exists (thread-safe)."""
-        key = self._make_key(text, model)
-        # SECURITY FIX (Audit 3): Use lock for thread-safe cache access
-        async with self._lock:
-            if key in self._cache:
-                self._hits += 1
-                result = self._cache[key]
-                result.cached = True
-                return result
-            self._misses += 1
-            return None
-
-    async def set(self, text: str, model: str, result: EmbeddingResult) -> None:
-        """Cache an embedding result (thread-safe)."""
-        # SECURITY FIX (Audit 3): Use lock for thread-safe cache modification
-        async with self._lock:
-            if len(self._cache) >= self._max_size:
-                # Simple eviction: remove oldest 10%
-                keys_to_remove = list(self._cache.keys())[: self._max_size // 10]
-                for key in keys_to_remove:
-                    del self._cache[key]
-
-            key = self._make_key(text, model)
-            self._cache[key] = result
+        """Get cached embedding if exists."""
+        return (await self.get_many([text], model))[0]
+
+    async def get_many(self, texts: list[str], model: str) -> list[EmbeddingResult | None]:
+        """
+        Look up several texts at once.
+
+        Memory misses are resolved against the disk tier in a single query
+        and promoted back into memory.
+
+        Returns:
+            Cached results in input order, None for misses
+        """
+        keys = [self._make_key(text, model) for text in texts]
+        entries = [self._memory_get(key) for key in keys]
+
+        missing = [key for key, entry in zip(keys, entries, strict=True) if entry is None]
+        if missing and self._disk is not None:
+            from_disk = await asyncio.to_thread(self._disk_get_many, missing)
+            self._disk_hits += len(from_disk)
+            for i, key in enumerate(keys):
+                if entries[i] is None and key in from_disk:
+                    entries[i] = from_disk[key]
+                    self._memory_put(key, from_disk[key])
+
+        hits = sum(1 for entry in entries if entry is not None)
+        self._hits += hits
+        self._misses += len(entries) - hits
+        return [entry.to_result() if entry else None for entry in entries]
+
+    async def set(self, text: str, model: str, result: EmbeddingResult) -> EmbeddingResult:
+        """
+        Cache an embedding result.
+
+        Returns:
+            The result as stored, with float32 precision
+        """
+        return (await self.set_many([text], model, [result]))[0]
+
+    async def set_many(
+        self,
+        texts: list[str],
+        model: str,
+        results: list[EmbeddingResult],
+    ) -> list[EmbeddingResult]:
+        """
+        Cache several embedding results, writing them to disk in one transaction.
+
+        Returns:
+            The results as stored, with float32 precision, in input order
+        """
+        items = [
+            (self._make_key(text, model), _CacheEntry.from_result(result))
+            for text, result in zip(texts, results, strict=False)
+        ]
+        for key, entry in items:
+            self._memory_put(key, entry)
+        if self._disk is not None:
+            await asyncio.to_thread(self._disk_put_many, items)
+        return [entry.to_result(cached=False) for _, entry in items]
 
     async def stats(self) -> dict[str, Any]:
-        """Get cache statistics (thread-safe)."""
-        async with self._lock:
-            total = self._hits + self._misses
-            return {
-                "size": len(self._cache),
-                "max_size": self._max_size,
-                "hits": self._hits,
-                "misses": self._misses,
-                "hit_rate": self._hits / total if total > 0 else 0,
-            }
+        """Get cache statistics."""
+        total = self._hits + self._misses
+        return {
+            "size": len(self),
+            "max_size": self._max_size,
+            "bytes": sum(shard.bytes for shard in self._shards),
+            "max_bytes": self._max_bytes,
+            "hits": self._hits,
+            "misses": self._misses,
+            "disk_hits": self._disk_hits,
+            "disk_entries": self._disk_count,
+            "evictions": self._evictions,
+            "hit_rate": self._hits / total if total > 0 else 0,
+        }
 
     async def clear(self) -> None:
-        """Clear the cache (thread-safe)."""
-        async with self._lock:
-            self._cache.clear()
-            self._hits = 0
-            self._misses = 0
+        """Clear the cache, including the disk tier."""
+        for shard in self._shards:
+            with shard.lock:
+                shard.entries.clear()
+                shard.bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._disk_hits = 0
+        self._evictions = 0
+        await asyncio.to_thread(self._disk_clear)
+
+    async def close(self) -> None:
+        """Release memory and close the disk tier, keeping its contents."""
+        for shard in self._shards:
+            with shard.lock:
+                shard.entries.clear()
+                shard.bytes = 0
+        if self._disk is not None:
+            with self._disk_lock:
+                self._disk.close()
+                self._disk = None
+
+
+@dataclass(slots=True)
+class _CacheEntry:
+    """A cached embedding stored as a float32 array."""
+
+    vector: array[float]
+    model: str
+    dimensions: int
+    tokens_used: int = 0
+
+    @property
+    def size_bytes(self) -> int:
+        return len(self.vector) * self.vector.itemsize + EmbeddingCache.ENTRY_OVERHEAD_BYTES
+
+    @classmethod
+    def from_result(cls, result: EmbeddingResult) -> _CacheEntry:
+        return cls(
+            array("f", result.embedding), result.model, result.dimensions, result.tokens_used
+        )
+
+    def to_result(self, cached: bool = True) -> EmbeddingResult:
+        # A fresh result per lookup so callers never share mutable state
+        return EmbeddingResult(
+            embedding=self.vector.tolist(),
+            model=self.model,
+            dimensions=self.dimensions,
+            tokens_used=self.tokens_used,
+            cached=cached,
+        )
+
+
+@dataclass
+class _CacheShard:
+    """One LRU partition of the embedding cache."""
+
+    entries: OrderedDict[str, _CacheEntry] = field(default_factory=OrderedDict)
+    bytes: int = 0
+    lock: threading.Lock = field(default_factory=threading.Lock)
 
 
 class EmbeddingService:
@@ -459,9 +758,23 @@ class EmbeddingService:
         self._provider = self._create_provider()
         # Use configurable cache size for cost optimization
         self._cache = (
-            EmbeddingCache(max_size=self._config.cache_size) if self._config.cache_enabled else None
+            EmbeddingCache(
+                max_size=self._config.cache_size,
+                max_bytes=self._config.cache_max_bytes,
+                persist_path=self._config.cache_persist_path,
+            )
+            if self._config.cache_enabled
+            else None
         )
 
+        # Request coalescing for embed(): in-flight futures by text, plus
+        # texts waiting for the current batching window to close
+        self._inflight: dict[str, asyncio.Future[EmbeddingResult]] = {}
+        self._pending: list[str] = []
+        self._flush_handle: asyncio.TimerHandle | asyncio.Handle | None = None
+        self._flush_tasks: set[asyncio.Task[None]] = set()
+        self._coalesced_hits = 0
+
         logger.info(
             "embedding_service_initialized",
             provider=self._config.provider.value,
@@ -505,6 +818,10 @@ class EmbeddingService:
         """
         Generate embedding for a single text.
 
+        Concurrent calls are coalesced: identical texts already in flight
+        share one request, and distinct texts arriving within
+        ``coalesce_window_ms`` are sent to the provider as one batch.
+
         Args:
             text: The text to embed
 
@@ -512,28 +829,110 @@ class EmbeddingService:
             EmbeddingResult with the embedding vector
         """
         # Check cache
-        if self._cache:
+        if self._cache is not None:
             cached = await self._cache.get(text, self._config.model)
             if cached:
                 logger.debug("embedding_cache_hit", text_length=len(text))
                 return cached
 
-        # Generate embedding
-        result = await self._provider.embed(text)
+        future = self._inflight.get(text)
+        if future is None:
+            future = asyncio.get_running_loop().create_future()
+            self._inflight[text] = future
+            self._pending.append(text)
+            self._schedule_coalesced_flush()
+        else:
+            self._coalesced_hits += 1
+
+        # Shield so one caller's cancellation does not fail the others
+        result = await asyncio.shield(future)
+        return replace(result, embedding=list(result.embedding))
+
+    def _schedule_coalesced_flush(self) -> None:
+        """Flush pending texts when the batch is full or the window closes."""
+        if len(self._pending) >= self._config.coalesce_max_batch:
+            if self._flush_handle is not None:
+                self._flush_handle.cancel()
+                self._flush_handle = None
+            self._start_coalesced_batch()
+        elif self._flush_handle is None:
+            loop = asyncio.get_running_loop()
+            if self._config.coalesce_window_ms > 0:
+                self._flush_handle = loop.call_later(
+                    self._config.coalesce_window_ms / 1000, self._start_coalesced_batch
+                )
+            else:
+                self._flush_handle = loop.call_soon(self._start_coalesced_batch)
+
+    def _resolve_coalesced(
+        self,
+        texts: list[str],
+        results: list[EmbeddingResult] | None = None,
+        error: BaseException | None = None,
+    ) -> None:
+        for i, text in enumerate(texts):
+            future = self._inflight.pop(text, None)
+            if future is None or future.done():
+                continue
+            if results is not None and i < len(results):
+                future.set_result(results[i])
+            else:
+                future.set_exception(error or RuntimeError("Provider returned too few embeddings"))
+
+    def _start_coalesced_batch(self) -> None:
+        self._flush_handle = None
+        if not self._pending:
+            return
+        texts, self._pending = self._pending, []
+        task = asyncio.create_task(self._run_coalesced_batch(texts))
+        self._flush_tasks.add(task)
+        task.add_done_callback(self._flush_tasks.discard)
+
+    async def _run_coalesced_batch(self, texts: list[str]) -> None:
+        """
+        Embed a coalesced batch and resolve every waiting caller.
 
-        # Cache result
-        if self._cache:
-            await self._cache.set(text, self._config.model, result)
+        A batch rejected because of its input is split in half and each
+        half retried, so one bad text fails only the callers waiting on it.
+        Provider failures (transport, auth, rate limits) fail every caller
+        at once instead of being multiplied by retries.
+        """
+        try:
+            if len(texts) == 1:
+                results = [await self._provider.embed(texts[0])]
+            else:
+                results = await self._provider.embed_batch(texts)
+
+            # Cache results; return the stored form so hits and misses agree
+            if self._cache is not None:
+                results = await self._cache.set_many(texts, self._config.model, results)
+        except Exception as e:  # Intentional broad catch: the error is delivered to the callers
+            if len(texts) == 1 or not _is_input_error(e):
+                self._resolve_coalesced(texts, error=e)
+                return
+            # Bisect so only the callers of the offending text see its error
+            logger.warning("embedding_batch_split", batch_size=len(texts), error=str(e))
+            mid = len(texts) // 2
+            try:
+                await self._run_coalesced_batch(texts[:mid])
+                await self._run_coalesced_batch(texts[mid:])
+            except asyncio.CancelledError:
+                self._resolve_coalesced(texts, error=asyncio.CancelledError())
+                raise
+            return
+        except asyncio.CancelledError:
+            self._resolve_coalesced(texts, error=asyncio.CancelledError())
+            raise
+
+        self._resolve_coalesced(texts, results=results)
 
         logger.debug(
             "embedding_generated",
-            text_length=len(text),
-            dimensions=result.dimensions,
-            tokens=result.tokens_used,
+            batch_size=len(texts),
+            dimensions=results[0].dimensions if results else 0,
+            tokens=sum(r.tokens_used for r in results),
         )
 
-        return result
-
     # SECURITY FIX (Audit 4 - H25): Maximum batch size to prevent cost abuse
     MAX_BATCH_SIZE = 10000
 
@@ -576,14 +975,17 @@ class EmbeddingService:
         results: list[EmbeddingResult | None] = [None] * len(texts)
         texts_to_embed: list[tuple[int, str]] = []
 
-        # Check cache for each text
-        for i, text in enumerate(texts):
-            if self._cache:
-                cached = await self._cache.get(text, self._config.model)
-                if cached:
-                    results[i] = cached
-                    continue
-            texts_to_embed.append((i, text))
+        # Check cache for all texts at once
+        cached_results = (
+            await self._cache.get_many(texts, self._config.model)
+            if self._cache is not None
+            else [None] * len(texts)
+        )
+        for i, (text, cached) in enumerate(zip(texts, cached_results, strict=True)):
+            if cached:
+                results[i] = cached
+            else:
+                texts_to_embed.append((i, text))
 
         cache_hits = len(texts) - len(texts_to_embed)
         if cache_hits > 0:
@@ -620,10 +1022,12 @@ class EmbeddingService:
                         await asyncio.sleep(2**attempt)
 
                 # Store results and cache
-                for (original_idx, text), result in zip(batch, batch_results, strict=False):
+                if self._cache is not None:
+                    batch_results = await self._cache.set_many(
+                        batch_texts, self._config.model, batch_results
+                    )
+                for (original_idx, _), result in zip(batch, batch_results, strict=False):
                     results[original_idx] = result
-                    if self._cache:
-                        await self._cache.set(text, self._config.model, result)
 
         logger.info(
             "embedding_batch_complete",
@@ -636,13 +1040,13 @@ class EmbeddingService:
 
     async def cache_stats(self) -> dict[str, Any]:
         """Get cache statistics."""
-        if self._cache:
-            return await self._cache.stats()
-        return {"cache_enabled": False}
+        if self._cache is not None:
+            return {**await self._cache.stats(), "coalesced_requests": self._coalesced_hits}
+        return {"cache_enabled": False, "coalesced_requests": self._coalesced_hits}
 
     async def clear_cache(self) -> None:
         """Clear the embedding cache."""
-        if self._cache:
+        if self._cache is not None:
             await self._cache.clear()
 
     async def close(self) -> None:
@@ -652,10 +1056,18 @@ class EmbeddingService:
         Close the embedding service and release resources.
         This should be called during application shutdown.
         """
+        # Resolve callers still waiting on a coalesced batch
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+        self._start_coalesced_batch()
+        if self._flush_tasks:
+            await asyncio.gather(*self._flush_tasks, return_exceptions=True)
+
         if hasattr(self._provider, "close"):
             await self._provider.close()
-        if self._cache:
-            await self._cache.clear()
+        if self._cache is not None:
+            # Keep the disk tier so the next process starts warm
+            await self._cache.close()
         logger.info("embedding_service_closed")
 
 
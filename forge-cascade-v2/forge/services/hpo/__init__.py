@@ -19,6 +19,8 @@ from .models import (
 )
 from .normalizer import PhenotypeNormalizer, create_phenotype_normalizer
 from .ontology import HPOOntologyService, create_hpo_ontology_service
+from .search_index import HPOMention, HPOSearchIndex
+from .similarity import HPOSimilarityIndex
 
 __all__ = [
     # Models
@@ -31,6 +33,11 @@ __all__ = [
     # Ontology Service
     "HPOOntologyService",
     "create_hpo_ontology_service",
+    # Search Index
+    "HPOSearchIndex",
+    "HPOMention",
+    # Similarity Index
+    "HPOSimilarityIndex",
     # Extractor
     "PhenotypeExtractor",
     "create_phenotype_extractor",
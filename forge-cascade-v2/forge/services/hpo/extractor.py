@@ -18,6 +18,7 @@ from .models import (
     PhenotypeSeverity,
 )
 from .ontology import HPOOntologyService
+from .search_index import HPOMention
 
 logger = structlog.get_logger(__name__)
 
@@ -183,56 +184,32 @@ class PhenotypeExtractor:
         sections: dict[str, tuple[int, int]],
     ) -> list[ExtractedPhenotype]:
         """Extract phenotypes using rule-based pattern matching."""
-        extractions = []
-        text_lower = text.lower()
+        # One pass over the text's tokens; prefer a name over a synonym and
+        # otherwise the first mention of each term
+        best: dict[str, HPOMention] = {}
+        for mention in self.ontology.find_mentions(text):
+            current = best.get(mention.hpo_id)
+            if current is None or (current.is_synonym and not mention.is_synonym):
+                best[mention.hpo_id] = mention
 
-        # Iterate over all HPO terms
-        for term in self.ontology.iter_terms():
-            if term.is_obsolete:
+        extractions = []
+        for mention in best.values():
+            term = self.ontology.get_term(mention.hpo_id)
+            if term is None:
                 continue
-
-            # Check for exact name match
-            name_lower = term.name.lower()
-            start_idx = text_lower.find(name_lower)
-
-            if start_idx != -1:
-                extraction = self._create_extraction(
+            extractions.append(
+                self._create_extraction(
                     text=text,
                     term=term,
-                    match_text=term.name,
-                    start_idx=start_idx,
-                    match_type="exact",
-                    confidence=0.95,
+                    match_text=text[mention.start : mention.end],
+                    start_idx=mention.start,
+                    match_type="synonym" if mention.is_synonym else "exact",
+                    confidence=0.85 if mention.is_synonym else 0.95,
                     sections=sections,
                 )
-                extractions.append(extraction)
-                continue
-
-            # Check synonyms
-            for synonym in term.synonyms:
-                syn_lower = synonym.lower()
-                start_idx = text_lower.find(syn_lower)
-
-                if start_idx != -1:
-                    extraction = self._create_extraction(
-                        text=text,
-                        term=term,
-                        match_text=synonym,
-                        start_idx=start_idx,
-                        match_type="synonym",
-                        confidence=0.85,
-                        sections=sections,
-                    )
-                    extractions.append(extraction)
-                    break
+            )
 
-        # Deduplicate by HPO ID, keeping highest confidence
-        seen: dict[str, ExtractedPhenotype] = {}
-        for ext in extractions:
-            if ext.hpo_id not in seen or ext.confidence > seen[ext.hpo_id].confidence:
-                seen[ext.hpo_id] = ext
-
-        return list(seen.values())
+        return extractions
 
     def _create_extraction(
         self,
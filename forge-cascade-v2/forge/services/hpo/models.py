@@ -9,6 +9,8 @@ from datetime import datetime
 from enum import Enum
 from typing import Any
 
+from .similarity import HPOSimilarityIndex
+
 
 class PhenotypeSeverity(str, Enum):
     """Severity of a phenotype presentation."""
@@ -194,6 +196,7 @@ class HPOHierarchy:
     child_map: dict[str, set[str]] = field(default_factory=dict)
     ancestor_cache: dict[str, set[str]] = field(default_factory=dict)
     descendant_cache: dict[str, set[str]] = field(default_factory=dict)
+    similarity_index: HPOSimilarityIndex | None = None
 
     def get_ancestors(self, hpo_id: str, include_self: bool = False) -> set[str]:
         """Get all ancestors of an HPO term."""
@@ -259,41 +262,18 @@ class HPOHierarchy:
 
         return lca
 
+    def get_similarity_index(self) -> HPOSimilarityIndex:
+        """Precomputed IC tables for similarity, built on first use if not attached."""
+        if self.similarity_index is None:
+            self.similarity_index = HPOSimilarityIndex.build(self.parent_map)
+        return self.similarity_index
+
     def semantic_similarity(self, term1: str, term2: str) -> float:
         """
         Calculate semantic similarity between two HPO terms.
 
-        Uses Resnik-like information content based on LCA.
+        IC(MICA) / max(IC(term1), IC(term2)), with IC = -log(descendants / total_terms).
         """
         if term1 == term2:
             return 1.0
-
-        lca = self.get_lca(term1, term2)
-        if not lca:
-            return 0.0
-
-        # IC = -log(descendants / total_terms)
-        # Similarity = IC(LCA) / max(IC(term1), IC(term2))
-        total = len(self.terms)
-        if total == 0:
-            return 0.0
-
-        lca_desc = len(self.get_descendants(lca, include_self=True))
-        term1_desc = len(self.get_descendants(term1, include_self=True))
-        term2_desc = len(self.get_descendants(term2, include_self=True))
-
-        # Avoid log(0)
-        if lca_desc == 0 or term1_desc == 0 or term2_desc == 0:
-            return 0.0
-
-        import math
-
-        ic_lca = -math.log(lca_desc / total)
-        ic_term1 = -math.log(term1_desc / total)
-        ic_term2 = -math.log(term2_desc / total)
-
-        max_ic = max(ic_term1, ic_term2)
-        if max_ic == 0:
-            return 0.0
-
-        return min(ic_lca / max_ic, 1.0)
+        return self.get_similarity_index().term_similarity(term1, term2, method="relative")
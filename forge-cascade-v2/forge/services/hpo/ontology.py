@@ -6,8 +6,9 @@ Supports loading from OBO files, JSON, or database.
 """
 
 import json
+import os
 import re
-from collections.abc import Iterator
+from collections.abc import Awaitable, Callable, Iterable, Iterator, Sequence
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
@@ -16,6 +17,8 @@ import httpx
 import structlog
 
 from .models import HPOHierarchy, HPOTerm
+from .search_index import HPOMention, HPOSearchIndex
+from .similarity import HPOSimilarityIndex
 
 logger = structlog.get_logger(__name__)
 
@@ -49,6 +52,12 @@ class HPOOntologyService:
     )
     HPO_ANNOTATIONS_URL = "http://purl.obolibrary.org/obo/hp/hpoa/phenotype.hpoa"
 
+    # Parsed terms plus search index, reused while the source file is unchanged
+    SNAPSHOT_FILE = "hp.index.json"
+    SNAPSHOT_VERSION = 1
+    # Information-content tables for semantic similarity, keyed the same way
+    SIMILARITY_FILE = "hp.similarity.npz"
+
     def __init__(
         self,
         data_dir: Path | str = "./data/hpo",
@@ -69,6 +78,7 @@ class HPOOntologyService:
         self._term_index: dict[str, HPOTerm] = {}
         self._name_index: dict[str, str] = {}  # name -> hpo_id
         self._synonym_index: dict[str, str] = {}  # synonym -> hpo_id
+        self._search_index = HPOSearchIndex()
         self._loaded = False
 
     @property
@@ -99,25 +109,115 @@ class HPOOntologyService:
 
         if json_file.exists() and not force_download:
             logger.info("hpo_loading_from_json", path=str(json_file))
-            return await self._load_from_json(json_file)
+            return await self._load_source(json_file, self._load_from_json)
 
         if obo_file.exists() and not force_download:
             logger.info("hpo_loading_from_obo", path=str(obo_file))
-            return await self._load_from_obo(obo_file)
+            return await self._load_source(obo_file, self._load_from_obo)
 
         # Download if not available
         logger.info("hpo_downloading")
         try:
             await self._download_hpo_files()
             if json_file.exists():
-                return await self._load_from_json(json_file)
+                return await self._load_source(json_file, self._load_from_json)
             elif obo_file.exists():
-                return await self._load_from_obo(obo_file)
+                return await self._load_source(obo_file, self._load_from_obo)
         except (ConnectionError, TimeoutError, ValueError, OSError, RuntimeError) as e:
             logger.error("hpo_download_failed", error=str(e))
 
         return False
 
+    async def _load_source(
+        self,
+        path: Path,
+        parse: Callable[[Path], Awaitable[bool]],
+    ) -> bool:
+        """Load from the snapshot if it matches path, else parse path and snapshot it."""
+        snapshot = self.data_dir / self.SNAPSHOT_FILE
+        if not self._load_snapshot(snapshot, path):
+            if not await parse(path):
+                return False
+            self._save_snapshot(snapshot, path)
+        self._attach_similarity_index(path)
+        return True
+
+    def _source_signature(self, source: Path) -> dict[str, Any]:
+        stat = source.stat()
+        return {"name": source.name, "size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+    def _load_snapshot(self, snapshot: Path, source: Path) -> bool:
+        """Restore terms and search index saved for this exact source file."""
+        if not snapshot.exists():
+            return False
+        try:
+            data = json.loads(snapshot.read_text(encoding="utf-8"))
+            if data.get("version") != self.SNAPSHOT_VERSION or data.get(
+                "source"
+            ) != self._source_signature(source):
+                logger.info("hpo_snapshot_stale", path=str(snapshot))
+                return False
+
+            terms = {}
+            for fields in data["terms"]:
+                term = HPOTerm(**fields)
+                terms[term.hpo_id] = term
+            search_index = HPOSearchIndex.from_dict(data["index"])
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning("hpo_snapshot_load_failed", path=str(snapshot), error=str(e))
+            return False
+
+        self._term_index = terms
+        self._build_indices(search_index)
+        self._build_hierarchy()
+        self._loaded = True
+
+        logger.info("hpo_loaded_from_snapshot", term_count=len(terms))
+        return True
+
+    def _save_snapshot(self, snapshot: Path, source: Path) -> None:
+        """Persist parsed terms and the search index next to the source file."""
+        data = {
+            "version": self.SNAPSHOT_VERSION,
+            "source": self._source_signature(source),
+            "terms": [
+                {
+                    "hpo_id": term.hpo_id,
+                    "name": term.name,
+                    "definition": term.definition,
+                    "synonyms": term.synonyms,
+                    "parents": term.parents,
+                    "children": term.children,
+                    "is_obsolete": term.is_obsolete,
+                    "replaced_by": term.replaced_by,
+                    "category": term.category,
+                    "xrefs": term.xrefs,
+                }
+                for term in self._term_index.values()
+            ],
+            "index": self._search_index.to_dict(),
+        }
+        tmp_path = snapshot.with_suffix(snapshot.suffix + ".tmp")
+        try:
+            tmp_path.write_text(json.dumps(data, separators=(",", ":")), encoding="utf-8")
+            os.replace(tmp_path, snapshot)
+        except (OSError, ValueError) as e:
+            logger.warning("hpo_snapshot_save_failed", path=str(snapshot), error=str(e))
+            return
+        logger.info("hpo_snapshot_saved", path=str(snapshot), term_count=len(self._term_index))
+
+    def _attach_similarity_index(self, source: Path) -> None:
+        """Reuse the similarity tables saved for this source file, else build and save them."""
+        if not self._hierarchy:
+            return
+        path = self.data_dir / self.SIMILARITY_FILE
+        signature = self._source_signature(source)
+        index = HPOSimilarityIndex.load(path, signature)
+        if index is None:
+            index = HPOSimilarityIndex.build(self._hierarchy.parent_map)
+            index.save(path, signature)
+        self._hierarchy.similarity_index = index
+
     async def _download_hpo_files(self) -> None:
         """Download HPO data files."""
         async with httpx.AsyncClient(timeout=300.0) as client:
@@ -331,8 +431,14 @@ class HPOOntologyService:
             xrefs=data.get("xrefs", []),
         )
 
-    def _build_indices(self) -> None:
-        """Build lookup indices for fast search."""
+    def _build_indices(self, search_index: HPOSearchIndex | None = None) -> None:
+        """
+        Build lookup indices for fast search.
+
+        Args:
+            search_index: Previously built search index to reuse
+        """
+        self._search_index = search_index or HPOSearchIndex.build(self._term_index.values())
         self._name_index.clear()
         self._synonym_index.clear()
 
@@ -397,48 +503,25 @@ class HPOOntologyService:
         Returns:
             List of matching terms, sorted by relevance
         """
-        query_lower = query.lower()
         results = []
+        for hpo_id, _score in self._search_index.search(query, limit, include_obsolete):
+            term = self._term_index.get(hpo_id)
+            if term:
+                results.append(term)
+        return results
 
-        # Exact match has highest priority
-        exact_id = self._name_index.get(query_lower)
-        if exact_id:
-            term = self._term_index.get(exact_id)
-            if term and (include_obsolete or not term.is_obsolete):
-                results.append((term, 1.0))
-
-        # Check synonyms
-        syn_id = self._synonym_index.get(query_lower)
-        if syn_id and syn_id != exact_id:
-            term = self._term_index.get(syn_id)
-            if term and (include_obsolete or not term.is_obsolete):
-                results.append((term, 0.95))
-
-        # Partial matches
-        for _hpo_id, term in self._term_index.items():
-            if not include_obsolete and term.is_obsolete:
-                continue
-
-            # Skip if already matched
-            if term in [r[0] for r in results]:
-                continue
-
-            # Name contains query
-            if query_lower in term.name.lower():
-                score = len(query_lower) / len(term.name)
-                results.append((term, score * 0.9))
-                continue
-
-            # Synonym contains query
-            for syn in term.synonyms:
-                if query_lower in syn.lower():
-                    score = len(query_lower) / len(syn)
-                    results.append((term, score * 0.85))
-                    break
+    def find_mentions(self, text: str, include_obsolete: bool = False) -> list[HPOMention]:
+        """
+        Find every term name or synonym mentioned in free text.
 
-        # Sort by score and limit
-        results.sort(key=lambda x: x[1], reverse=True)
-        return [term for term, _ in results[:limit]]
+        Args:
+            text: Text to scan
+            include_obsolete: Include obsolete terms
+
+        Returns:
+            Mentions in text order, including nested and overlapping ones
+        """
+        return self._search_index.find_mentions(text, include_obsolete)
 
     def get_ancestors(
         self,
@@ -466,6 +549,34 @@ class HPOOntologyService:
             return 0.0
         return self._hierarchy.semantic_similarity(term1, term2)
 
+    def get_similarity_index(self) -> HPOSimilarityIndex | None:
+        """Precomputed information-content tables, or None before loading."""
+        if not self._hierarchy:
+            return None
+        return self._hierarchy.get_similarity_index()
+
+    def get_set_similarities(
+        self,
+        query: Iterable[str],
+        candidates: Sequence[Iterable[str]],
+        method: str = "resnik",
+    ) -> list[float]:
+        """
+        Best-match-average similarity of a phenotype set to many others.
+
+        Args:
+            query: Patient HPO terms
+            candidates: One HPO term set per candidate (e.g. disease)
+            method: "resnik", "lin" or "relative"
+
+        Returns:
+            One score per candidate (all 0.0 before loading)
+        """
+        index = self.get_similarity_index()
+        if index is None:
+            return [0.0] * len(candidates)
+        return [float(score) for score in index.set_similarities(query, candidates, method=method)]
+
     def get_category(self, hpo_id: str) -> str | None:
         """
         Get the top-level category for an HPO term.
@@ -0,0 +1,422 @@
+"""
+HPO Term Search Index
+
+Prebuilt lookup structures over every HPO term name and synonym ("label"),
+built once when the ontology loads and serialisable alongside it.
+
+Design:
+- Labels are tokenized with the full-text index tokenizer (lowercase,
+  stop words dropped, light stemming), so "seizures" finds "Seizure".
+- A token inverted index ranks labels with BM25; the last query token
+  also matches as a prefix through a sorted vocabulary, for partially
+  typed queries.
+- A character trigram index answers substring queries and tolerates
+  typos (Dice similarity over trigram sets), without scanning labels.
+- A token trie over label token sequences finds every label mentioned
+  in free text in a single pass over the text's tokens.
+"""
+
+from __future__ import annotations
+
+import bisect
+import heapq
+import math
+from array import array
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import Any
+
+from forge.services.text_index import tokenize
+
+from .models import HPOTerm
+
+# Trie key holding the label rows that end at a node (tokens are never empty)
+_END = ""
+
+# Most vocabulary tokens a trailing query prefix may expand to
+MAX_PREFIX_EXPANSIONS = 64
+
+
+def normalize_label(text: str) -> str:
+    """Lowercase and collapse whitespace."""
+    return " ".join(text.lower().split())
+
+
+def trigrams(text: str) -> set[str]:
+    """Character trigrams of an already normalized string."""
+    return {text[i : i + 3] for i in range(len(text) - 2)}
+
+
+@dataclass
+class HPOMention:
+    """A term label found in free text."""
+
+    hpo_id: str
+    label: str
+    is_synonym: bool
+    start: int  # Character offsets into the text
+    end: int
+
+
+class HPOSearchIndex:
+    """
+    Search index over HPO term names and synonyms.
+
+    Immutable once built, so it is safe to share between threads.
+
+    Usage:
+        index = HPOSearchIndex.build(terms)
+        index.search("seizur", limit=5)     # [(hpo_id, score), ...]
+        index.find_mentions("History of focal seizures")
+    """
+
+    # Minimum Dice similarity for a trigram-only (typo) match
+    FUZZY_MIN_SIMILARITY = 0.6
+
+    def __init__(self, k1: float = 1.2, b: float = 0.75):
+        self._k1 = k1
+        self._b = b
+
+        # One row per label
+        self._ids: list[str] = []
+        self._labels: list[str] = []  # As written in the ontology
+        self._normalized: list[str] = []
+        self._is_synonym = bytearray()
+        self._is_obsolete = bytearray()
+        self._lengths = array("H")  # Tokens per label
+        self._gram_counts = array("H")  # Distinct trigrams per label
+
+        self._exact: dict[str, list[int]] = {}
+        self._postings: dict[str, dict[int, int]] = {}  # token -> row -> tf
+        self._vocabulary: list[str] = []  # Sorted tokens, for prefix lookup
+        self._trigrams: dict[str, array[int]] = {}
+        self._trie: dict[str, Any] = {}
+        self._norms = array("d")
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    # =========================================================================
+    # Construction
+    # =========================================================================
+
+    @classmethod
+    def build(cls, terms: Iterable[HPOTerm]) -> HPOSearchIndex:
+        """Index the name and synonyms of every term."""
+        index = cls()
+        for term in terms:
+            index._add_label(term.hpo_id, term.name, False, term.is_obsolete)
+            for synonym in term.synonyms:
+                index._add_label(term.hpo_id, synonym, True, term.is_obsolete)
+        index._finish()
+        return index
+
+    def _add_label(self, hpo_id: str, label: str, is_synonym: bool, is_obsolete: bool) -> None:
+        normalized = normalize_label(label)
+        if not normalized:
+            return
+
+        row = len(self._ids)
+        self._ids.append(hpo_id)
+        self._labels.append(label)
+        self._normalized.append(normalized)
+        self._is_synonym.append(is_synonym)
+        self._is_obsolete.append(is_obsolete)
+
+        tokens = [term for _, term, _, _ in tokenize(normalized)]
+        self._lengths.append(min(len(tokens), 0xFFFF))
+        for token in tokens:
+            row_tfs = self._postings.setdefault(token, {})
+            row_tfs[row] = row_tfs.get(row, 0) + 1
+
+        grams = trigrams(normalized)
+        self._gram_counts.append(min(len(grams), 0xFFFF))
+        for gram in grams:
+            self._trigrams.setdefault(gram, array("I")).append(row)
+
+        if tokens:
+            node = self._trie
+            for token in tokens:
+                node = node.setdefault(token, {})
+            node.setdefault(_END, []).append(row)
+
+    def _finish(self) -> None:
+        """Derive the structures that are cheap to recompute."""
+        self._exact = {}
+        for row, normalized in enumerate(self._normalized):
+            self._exact.setdefault(normalized, []).append(row)
+        self._vocabulary = sorted(self._postings)
+        avg_length = (sum(self._lengths) / len(self._lengths) if self._lengths else 0.0) or 1.0
+        # BM25 length normalisation depends only on the label, so it is precomputed
+        self._norms = array(
+            "d",
+            (self._k1 * (1 - self._b + self._b * length / avg_length) for length in self._lengths),
+        )
+
+    # =========================================================================
+    # Search
+    # =========================================================================
+
+    def search(
+        self,
+        query: str,
+        limit: int = 20,
+        include_obsolete: bool = False,
+    ) -> list[tuple[str, float]]:
+        """
+        Rank terms against a query.
+
+        Exact name matches score 1.0 and exact synonym matches 0.95. Other
+        labels match if they contain every query word (the last one as a
+        prefix), contain the query as a substring, or are within
+        FUZZY_MIN_SIMILARITY of it; they score up to 0.9 for names and
+        0.85 for synonyms from a blend of BM25 and trigram similarity.
+
+        Returns:
+            (hpo_id, score) pairs, best first, one per term
+        """
+        normalized = normalize_label(query)
+        if not normalized or limit <= 0:
+            return []
+
+        best: dict[str, float] = {}
+
+        def offer(row: int, score: float) -> None:
+            if self._is_obsolete[row] and not include_obsolete:
+                return
+            hpo_id = self._ids[row]
+            if score > best.get(hpo_id, 0.0):
+                best[hpo_id] = score
+
+        for row in self._exact.get(normalized, ()):
+            offer(row, 0.95 if self._is_synonym[row] else 1.0)
+
+        query_tokens = [term for _, term, _, _ in tokenize(normalized)]
+        bm25 = self._bm25_candidates(query_tokens)
+        query_grams = trigrams(normalized)
+        substrings = self._substring_candidates(normalized, query_grams)
+        candidates = set(bm25) | substrings
+        if len(candidates) < limit:
+            candidates.update(self._fuzzy_candidates(query_grams))
+
+        # Score candidates in order of an upper bound (Dice can be no more than
+        # the trigram set sizes allow) and stop once none can reach the top
+        top_bm25 = max(bm25.values(), default=0.0) or 1.0
+        n_grams = len(query_grams)
+        bounded = []
+        for row in candidates:
+            label_grams = self._gram_counts[row]
+            max_similarity = 2 * min(n_grams, label_grams) / (n_grams + label_grams or 1)
+            relevance = 0.5 * bm25.get(row, 0.0) / top_bm25 + 0.5 * max_similarity
+            bounded.append(((0.85 if self._is_synonym[row] else 0.9) * relevance, row))
+        bounded.sort(reverse=True)
+
+        floor = 0.0
+        for scored, (bound, row) in enumerate(bounded, 1):
+            if bound <= floor:
+                break
+            similarity = self._dice(query_grams, row) if query_grams else 0.0
+            if row not in bm25 and row not in substrings:
+                if similarity < self.FUZZY_MIN_SIMILARITY:
+                    continue
+            relevance = 0.5 * bm25.get(row, 0.0) / top_bm25 + 0.5 * similarity
+            offer(row, (0.85 if self._is_synonym[row] else 0.9) * relevance)
+            if len(best) >= limit and scored % 16 == 0:
+                floor = heapq.nlargest(limit, best.values())[-1]
+
+        ranked = sorted(best.items(), key=lambda item: item[1], reverse=True)
+        return ranked[:limit]
+
+    def _bm25_candidates(self, query_tokens: list[str]) -> dict[int, float]:
+        """BM25 scores of labels containing every query token (last as prefix)."""
+        if not query_tokens:
+            return {}
+
+        *whole, last = query_tokens
+        expansions = self._expand_prefix(last)
+        if not expansions:
+            return {}
+
+        rows: set[int] | None = None
+        for token in sorted(whole, key=lambda t: len(self._postings.get(t, ()))):
+            postings = self._postings.get(token)
+            if not postings:
+                return {}
+            rows = set(postings) if rows is None else rows.intersection(postings)
+            if not rows:
+                return {}
+
+        scores: dict[int, float] = {}
+        # The trailing token contributes its best-scoring expansion per label
+        for token in expansions:
+            postings = self._postings[token]
+            idf = self._idf(token)
+            for row, tf in postings.items():
+                if rows is not None and row not in rows:
+                    continue
+                weight = idf * tf * (self._k1 + 1) / (tf + self._norms[row])
+                if weight > scores.get(row, -1.0):
+                    scores[row] = weight
+
+        for token in whole:
+            postings = self._postings[token]
+            idf = self._idf(token)
+            for row in scores:
+                tf = postings[row]
+                scores[row] += idf * tf * (self._k1 + 1) / (tf + self._norms[row])
+        return scores
+
+    def _idf(self, token: str) -> float:
+        n_labels = len(self._ids)
+        df = len(self._postings[token])
+        return math.log(1 + (n_labels - df + 0.5) / (df + 0.5))
+
+    def _expand_prefix(self, prefix: str) -> list[str]:
+        """Vocabulary tokens starting with prefix, the exact token first."""
+        start = bisect.bisect_left(self._vocabulary, prefix)
+        expansions = []
+        for token in self._vocabulary[start : start + MAX_PREFIX_EXPANSIONS]:
+            if not token.startswith(prefix):
+                break
+            expansions.append(token)
+        return expansions
+
+    def _substring_candidates(self, normalized: str, query_grams: set[str]) -> set[int]:
+        """Labels that may contain the query verbatim (verified when scored)."""
+        if not query_grams:
+            return set()
+        lists = sorted((self._trigrams.get(g, ()) for g in query_grams), key=len)
+        if not lists[0]:
+            return set()
+        # The rarest few trigrams narrow the field; containment is checked exactly
+        rows = set(lists[0])
+        for postings in lists[1:3]:
+            rows.intersection_update(postings)
+        return {row for row in rows if normalized in self._normalized[row]}
+
+    def _fuzzy_candidates(self, query_grams: set[str]) -> set[int]:
+        """Labels that could reach FUZZY_MIN_SIMILARITY with the query."""
+        if not query_grams:
+            return set()
+        t = self.FUZZY_MIN_SIMILARITY
+        # Dice >= t needs at least t*|Q|/(2-t) shared trigrams, so a match must
+        # contain one of the |Q| - that + 1 rarest query trigrams
+        needed = math.ceil(t * len(query_grams) / (2 - t))
+        lists = sorted((self._trigrams.get(g, ()) for g in query_grams), key=len)
+        rows: set[int] = set()
+        for postings in lists[: max(1, len(lists) - needed + 1)]:
+            rows.update(postings)
+        return rows
+
+    def _dice(self, query_grams: set[str], row: int) -> float:
+        label_grams = trigrams(self._normalized[row])
+        if not label_grams:
+            return 0.0
+        return 2 * len(query_grams & label_grams) / (len(query_grams) + len(label_grams))
+
+    # =========================================================================
+    # Mention Scanning
+    # =========================================================================
+
+    def find_mentions(self, text: str, include_obsolete: bool = False) -> list[HPOMention]:
+        """
+        Find every label mentioned in text.
+
+        Walks the token trie from each token of the text, so nested labels
+        ("Seizure" inside "Focal seizure") are all reported.
+
+        Returns:
+            Mentions in text order
+        """
+        tokens = tokenize(text)
+        mentions = []
+        for i in range(len(tokens)):
+            node = self._trie
+            for _, token, _, end in tokens[i:]:
+                next_node = node.get(token)
+                if next_node is None:
+                    break
+                node = next_node
+                for row in node.get(_END, ()):
+                    if self._is_obsolete[row] and not include_obsolete:
+                        continue
+                    mentions.append(
+                        HPOMention(
+                            hpo_id=self._ids[row],
+                            label=self._labels[row],
+                            is_synonym=bool(self._is_synonym[row]),
+                            start=tokens[i][2],
+                            end=end,
+                        )
+                    )
+        return mentions
+
+    # =========================================================================
+    # Persistence
+    # =========================================================================
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialise to JSON-compatible data."""
+        return {
+            "k1": self._k1,
+            "b": self._b,
+            "ids": self._ids,
+            "labels": self._labels,
+            "normalized": self._normalized,
+            "is_synonym": list(self._is_synonym),
+            "is_obsolete": list(self._is_obsolete),
+            "lengths": list(self._lengths),
+            "gram_counts": list(self._gram_counts),
+            # Flattened as [row, tf, row, tf, ...]
+            "postings": {
+                token: [value for pair in row_tfs.items() for value in pair]
+                for token, row_tfs in self._postings.items()
+            },
+            "trigrams": {gram: list(rows) for gram, rows in self._trigrams.items()},
+            "trie": self._trie,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> HPOSearchIndex:
+        """
+        Restore an index serialised by to_dict.
+
+        Raises:
+            KeyError, TypeError, ValueError: If the data is malformed
+        """
+        index = cls(k1=float(data["k1"]), b=float(data["b"]))
+        index._ids = list(data["ids"])
+        index._labels = list(data["labels"])
+        index._normalized = list(data["normalized"])
+        index._is_synonym = bytearray(data["is_synonym"])
+        index._is_obsolete = bytearray(data["is_obsolete"])
+        index._lengths = array("H", data["lengths"])
+        index._gram_counts = array("H", data["gram_counts"])
+        if not (
+            len(index._ids)
+            == len(index._labels)
+            == len(index._normalized)
+            == len(index._is_synonym)
+            == len(index._is_obsolete)
+            == len(index._lengths)
+            == len(index._gram_counts)
+        ):
+            raise ValueError("HPO search index rows are inconsistent")
+
+        index._postings = {
+            token: dict(zip(flat[::2], flat[1::2], strict=True))
+            for token, flat in data["postings"].items()
+        }
+        index._trigrams = {gram: array("I", rows) for gram, rows in data["trigrams"].items()}
+        index._trie = data["trie"]
+        index._finish()
+        return index
+
+    def stats(self) -> dict[str, Any]:
+        """Get index statistics."""
+        return {
+            "labels": len(self._ids),
+            "terms": len(set(self._ids)),
+            "vocabulary": len(self._vocabulary),
+            "trigrams": len(self._trigrams),
+        }
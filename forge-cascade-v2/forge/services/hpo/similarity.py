@@ -0,0 +1,382 @@
+"""
+HPO Semantic Similarity Index
+
+Precomputed tables for information-content (IC) based similarity between
+HPO terms and between phenotype sets, built once when the ontology loads
+and cached on disk next to it.
+
+Design:
+- Every term gets an integer row. Its ancestors (including itself) are
+  stored as a sorted int32 array, all concatenated CSR-style.
+- IC(t) = -log(|descendants of t, including t| / total terms); the
+  descendant counts fall out of one bincount over the ancestor arrays.
+- The MICA (most informative common ancestor) of a term against many
+  terms is one gather plus one segmented max: mark the first term's
+  ancestors with their IC in a dense vector, look up every ancestor of
+  the other terms, and take the maximum per term.
+- Phenotype set similarity is the best-match average (BMA) used by
+  Phenomizer, evaluated for thousands of candidate sets at once from a
+  single query x union-of-candidate-terms similarity matrix.
+
+Supported term similarity methods:
+- "resnik": IC(MICA)
+- "lin": 2 * IC(MICA) / (IC(a) + IC(b))
+- "relative": IC(MICA) / max(IC(a), IC(b)), the MICA's information
+  content as a fraction of the more specific term's, capped at 1.0
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from collections.abc import Iterable, Mapping, Sequence
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import structlog
+from numpy.typing import NDArray
+
+logger = structlog.get_logger(__name__)
+
+SIMILARITY_METHODS = ("resnik", "lin", "relative")
+
+
+class HPOSimilarityIndex:
+    """
+    Information-content tables and ancestor arrays for HPO terms.
+
+    Immutable once built, so it is safe to share between threads.
+
+    Usage:
+        index = HPOSimilarityIndex.build(parent_map)
+        index.term_similarity("HP:0001250", "HP:0007359")
+        index.set_similarities(patient_terms, [disease_a_terms, disease_b_terms])
+    """
+
+    VERSION = 1
+
+    def __init__(
+        self,
+        term_ids: list[str],
+        indptr: NDArray[np.int64],
+        indices: NDArray[np.int32],
+        ic: NDArray[np.float64],
+    ):
+        self.term_ids = term_ids
+        self._row = {hpo_id: i for i, hpo_id in enumerate(term_ids)}
+        self._indptr = indptr
+        self._indices = indices
+        self._ic = ic
+
+    @property
+    def term_count(self) -> int:
+        return len(self.term_ids)
+
+    # =========================================================================
+    # Build / Persistence
+    # =========================================================================
+
+    @classmethod
+    def build(cls, parent_map: Mapping[str, Iterable[str]]) -> HPOSimilarityIndex:
+        """
+        Build from each term's direct parents.
+
+        Parents that are not themselves keys (dangling is_a references)
+        become terms too. A cycle in the input is broken where it is found
+        rather than looping.
+        """
+        parent_lists = {hpo_id: list(parents) for hpo_id, parents in parent_map.items()}
+        term_ids = sorted(set(parent_lists).union(*parent_lists.values()))
+        row = {hpo_id: i for i, hpo_id in enumerate(term_ids)}
+        parents = [[row[p] for p in parent_lists.get(hpo_id, ())] for hpo_id in term_ids]
+
+        # Ancestor sets, children after parents (iterative DFS)
+        ancestors: list[set[int] | None] = [None] * len(term_ids)
+        for start in range(len(term_ids)):
+            if ancestors[start] is not None:
+                continue
+            stack = [(start, iter(parents[start]))]
+            on_path = {start}
+            while stack:
+                node, pending = stack[-1]
+                for parent in pending:
+                    if ancestors[parent] is None and parent not in on_path:
+                        on_path.add(parent)
+                        stack.append((parent, iter(parents[parent])))
+                        break
+                else:
+                    stack.pop()
+                    on_path.discard(node)
+                    result = {node}
+                    for parent in parents[node]:
+                        parent_ancestors = ancestors[parent]
+                        if parent_ancestors is not None:
+                            result |= parent_ancestors
+                    ancestors[node] = result
+
+        lengths = np.fromiter((len(a or ()) for a in ancestors), dtype=np.int64)
+        indptr = np.zeros(len(term_ids) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=indptr[1:])
+        indices = np.fromiter(
+            (i for a in ancestors for i in sorted(a or ())),
+            dtype=np.int32,
+            count=int(indptr[-1]),
+        )
+
+        # Each term is counted once as a descendant of every one of its
+        # ancestors, itself included
+        descendants = np.bincount(indices, minlength=len(term_ids))
+        total = max(len(term_ids), 1)
+        ic = -np.log(np.maximum(descendants, 1) / total)
+
+        return cls(term_ids, indptr, indices, ic)
+
+    def save(self, path: Path, source: dict[str, Any]) -> None:
+        """
+        Write the index to an .npz file, tagged with the ontology source it
+        was built from. Written to a temporary file and moved into place.
+        """
+        tmp_path = path.with_name(path.name + ".tmp")
+        try:
+            with open(tmp_path, "wb") as f:
+                np.savez(
+                    f,
+                    meta=np.array(json.dumps({"version": self.VERSION, "source": source})),
+                    term_ids=np.array(self.term_ids, dtype=str),
+                    indptr=self._indptr,
+                    indices=self._indices,
+                    ic=self._ic,
+                )
+            os.replace(tmp_path, path)
+        except (OSError, ValueError) as e:
+            logger.warning("hpo_similarity_save_failed", path=str(path), error=str(e))
+            return
+        logger.info("hpo_similarity_saved", path=str(path), term_count=self.term_count)
+
+    @classmethod
+    def load(cls, path: Path, source: dict[str, Any]) -> HPOSimilarityIndex | None:
+        """
+        Load an index saved for this exact ontology source.
+
+        Returns:
+            The index, or None if the file is missing, stale or unreadable
+        """
+        if not path.exists():
+            return None
+        try:
+            with np.load(path, allow_pickle=False) as data:
+                meta = json.loads(str(data["meta"]))
+                if meta.get("version") != cls.VERSION or meta.get("source") != source:
+                    logger.info("hpo_similarity_stale", path=str(path))
+                    return None
+                index = cls(
+                    data["term_ids"].tolist(),
+                    data["indptr"],
+                    data["indices"],
+                    data["ic"],
+                )
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning("hpo_similarity_load_failed", path=str(path), error=str(e))
+            return None
+        if len(index._indptr) != index.term_count + 1 or len(index._ic) != index.term_count:
+            logger.warning("hpo_similarity_load_failed", path=str(path), error="bad shape")
+            return None
+        return index
+
+    # =========================================================================
+    # Terms
+    # =========================================================================
+
+    def _rows(self, hpo_ids: Iterable[str]) -> NDArray[np.int64]:
+        """Distinct rows of the known terms among hpo_ids, in first-seen order."""
+        rows = dict.fromkeys(self._row[t] for t in hpo_ids if t in self._row)
+        return np.fromiter(rows, dtype=np.int64, count=len(rows))
+
+    def information_content(self, hpo_id: str) -> float:
+        """IC of a term (0.0 for unknown terms and the root)."""
+        row = self._row.get(hpo_id)
+        return float(self._ic[row]) if row is not None else 0.0
+
+    def ancestors(self, hpo_id: str, include_self: bool = False) -> set[str]:
+        row = self._row.get(hpo_id)
+        if row is None:
+            return set()
+        result = {
+            self.term_ids[i] for i in self._indices[self._indptr[row] : self._indptr[row + 1]]
+        }
+        if not include_self:
+            result.discard(hpo_id)
+        return result
+
+    def mica(self, term1: str, term2: str) -> str | None:
+        """Most informative common ancestor of two terms."""
+        row1, row2 = self._row.get(term1), self._row.get(term2)
+        if row1 is None or row2 is None:
+            return None
+        common = np.intersect1d(
+            self._indices[self._indptr[row1] : self._indptr[row1 + 1]],
+            self._indices[self._indptr[row2] : self._indptr[row2 + 1]],
+            assume_unique=True,
+        )
+        if not len(common):
+            return None
+        return self.term_ids[int(common[np.argmax(self._ic[common])])]
+
+    # =========================================================================
+    # Batch similarity
+    # =========================================================================
+
+    def _mica_ic(self, rows_a: NDArray[np.int64], rows_b: NDArray[np.int64]) -> NDArray[np.float64]:
+        """IC of the MICA of every (a, b) pair, as a len(a) x len(b) matrix."""
+        result = np.zeros((len(rows_a), len(rows_b)), dtype=np.float64)
+        if not len(rows_a) or not len(rows_b):
+            return result
+
+        # Every ancestor of every b term, flattened; a term is always its
+        # own ancestor, so no segment is empty
+        starts = self._indptr[rows_b]
+        lengths = self._indptr[rows_b + 1] - starts
+        segments = np.cumsum(lengths) - lengths
+        flat = self._indices[np.arange(int(lengths.sum())) - np.repeat(segments - starts, lengths)]
+
+        marked = np.zeros(self.term_count, dtype=np.float64)
+        for i, row in enumerate(rows_a):
+            ancestors_a = self._indices[self._indptr[row] : self._indptr[row + 1]]
+            marked[ancestors_a] = self._ic[ancestors_a]
+            result[i] = np.maximum.reduceat(marked[flat], segments)
+            marked[ancestors_a] = 0.0
+        return result
+
+    def _similarity(
+        self,
+        rows_a: NDArray[np.int64],
+        rows_b: NDArray[np.int64],
+        method: str,
+    ) -> NDArray[np.float64]:
+        if method not in SIMILARITY_METHODS:
+            raise ValueError(f"Unknown similarity method: {method}")
+        mica = self._mica_ic(rows_a, rows_b)
+        if method == "resnik":
+            return mica
+
+        ic_a = self._ic[rows_a][:, None]
+        ic_b = self._ic[rows_b][None, :]
+        denominator = ic_a + ic_b if method == "lin" else np.maximum(ic_a, ic_b)
+        numerator = 2 * mica if method == "lin" else mica
+        sim = np.divide(numerator, denominator, out=np.zeros_like(mica), where=denominator > 0)
+        # Identical terms are fully similar, even where IC is 0 (the root)
+        sim[rows_a[:, None] == rows_b[None, :]] = 1.0
+        np.minimum(sim, 1.0, out=sim)
+        return sim
+
+    def term_similarity(self, term1: str, term2: str, method: str = "resnik") -> float:
+        """Similarity of two terms (0.0 if either is unknown)."""
+        return float(self.similarity_matrix([term1], [term2], method)[0, 0])
+
+    def similarity_matrix(
+        self,
+        terms_a: Sequence[str],
+        terms_b: Sequence[str],
+        method: str = "resnik",
+    ) -> NDArray[np.float64]:
+        """
+        Pairwise term similarities.
+
+        Args:
+            terms_a: Row terms
+            terms_b: Column terms
+            method: "resnik", "lin" or "relative"
+
+        Returns:
+            len(terms_a) x len(terms_b) matrix; unknown terms score 0.0
+        """
+        known_a = [i for i, t in enumerate(terms_a) if t in self._row]
+        known_b = [j for j, t in enumerate(terms_b) if t in self._row]
+        rows_a = np.array([self._row[terms_a[i]] for i in known_a], dtype=np.int64)
+        rows_b = np.array([self._row[terms_b[j]] for j in known_b], dtype=np.int64)
+
+        result = np.zeros((len(terms_a), len(terms_b)), dtype=np.float64)
+        result[np.ix_(known_a, known_b)] = self._similarity(rows_a, rows_b, method)
+        return result
+
+    def set_similarities(
+        self,
+        query: Iterable[str],
+        candidates: Sequence[Iterable[str]],
+        method: str = "resnik",
+        symmetric: bool = True,
+    ) -> NDArray[np.float64]:
+        """
+        Best-match-average similarity of a phenotype set to many sets.
+
+        For each query term the best-matching candidate term is found and
+        the scores averaged; symmetric scoring averages that with the
+        candidate-to-query direction.
+
+        Args:
+            query: Patient HPO terms
+            candidates: One HPO term set per candidate (e.g. disease)
+            method: Term similarity method
+            symmetric: Average both directions instead of query-to-candidate only
+
+        Returns:
+            One score per candidate (0.0 for candidates with no known terms)
+        """
+        scores = np.zeros(len(candidates), dtype=np.float64)
+        query_rows = self._rows(query)
+        candidate_rows = [self._rows(terms) for terms in candidates]
+        lengths = np.array([len(rows) for rows in candidate_rows], dtype=np.int64)
+        if not len(query_rows) or not lengths.sum():
+            return scores
+
+        # One similarity column per distinct term across all candidates
+        union, columns = np.unique(np.concatenate(candidate_rows), return_inverse=True)
+        sim = self._similarity(query_rows, union, method)
+
+        nonempty = lengths > 0
+        segments = (np.cumsum(lengths) - lengths)[nonempty]
+        columns = columns.reshape(-1)
+
+        # Query -> candidate: best candidate term for each query term
+        best_for_query = np.maximum.reduceat(sim[:, columns], segments, axis=1)
+        query_to_candidate = best_for_query.mean(axis=0)
+        if not symmetric:
+            scores[nonempty] = query_to_candidate
+            return scores
+
+        # Candidate -> query: best query term for each candidate term
+        best_for_candidate = sim.max(axis=0)[columns]
+        candidate_to_query = np.add.reduceat(best_for_candidate, segments) / lengths[nonempty]
+        scores[nonempty] = (query_to_candidate + candidate_to_query) / 2
+        return scores
+
+    def rank(
+        self,
+        query: Iterable[str],
+        candidates: Mapping[str, Iterable[str]],
+        limit: int | None = None,
+        method: str = "resnik",
+        symmetric: bool = True,
+    ) -> list[tuple[str, float]]:
+        """
+        Rank candidates (e.g. disease ID -> phenotypes) by set similarity.
+
+        Returns:
+            (candidate key, score) pairs, best first
+        """
+        keys = list(candidates)
+        scores = self.set_similarities(
+            query, [candidates[k] for k in keys], method=method, symmetric=symmetric
+        )
+        order = np.argsort(-scores, kind="stable")
+        if limit is not None:
+            order = order[:limit]
+        return [(keys[i], float(scores[i])) for i in order]
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "terms": self.term_count,
+            "ancestor_entries": len(self._indices),
+            "max_ic": float(self._ic.max()) if self.term_count else 0.0,
+        }
@@ -7,6 +7,7 @@ Called during application startup in the FastAPI app.
 
 from __future__ import annotations
 
+import asyncio
 from typing import Any
 
 import structlog
@@ -35,6 +36,12 @@ from forge.services.search import (
 
 logger = structlog.get_logger(__name__)
 
+# In-process vector index, saved on shutdown when a path is configured
+_vector_index: Any = None
+
+# Strong references to index rebuilds so they are not garbage collected mid-run
+_rebuild_tasks: set[asyncio.Task[None]] = set()
+
 
 def init_all_services(
     db_client: Any = None,
@@ -129,6 +136,11 @@ def init_all_services(
         dimensions=settings.embedding_dimensions,
         api_key=embedding_api_key,
         cache_enabled=settings.embedding_cache_enabled,
+        cache_size=settings.embedding_cache_size,
+        cache_max_bytes=settings.embedding_cache_max_mb * 1024 * 1024,
+        cache_persist_path=settings.embedding_cache_path,
+        coalesce_window_ms=settings.embedding_coalesce_window_ms,
+        coalesce_max_batch=settings.embedding_coalesce_max_batch,
         batch_size=settings.embedding_batch_size,
     )
 
@@ -222,13 +234,37 @@ def init_all_services(
         auto_detected=selected_provider != llm_provider_map.get(settings.llm_provider),
     )
 
+    # Initialize the optional in-process vector index
+    vector_index = None
+    if settings.vector_index_enabled:
+        vector_index = _init_vector_index(
+            dimensions=embedding_service.dimensions,
+            db_client=db_client,
+            capsule_repo=capsule_repo,
+            event_bus=event_bus,
+        )
+
+    text_index = None
+    if settings.text_index_enabled:
+        text_index = _init_text_index(
+            db_client=db_client,
+            capsule_repo=capsule_repo,
+            event_bus=event_bus,
+        )
+
     # Initialize search service
     init_search_service(
         embedding_service=embedding_service,
         capsule_repo=capsule_repo,
         db_client=db_client,
+        vector_index=vector_index,
+        text_index=text_index,
+    )
+    logger.info(
+        "search_service_ready",
+        vector_index=vector_index is not None,
+        text_index=text_index is not None,
     )
-    logger.info("search_service_ready")
 
     # Initialize Ghost Council service with config from settings
     from forge.services.ghost_council import GhostCouncilConfig
@@ -252,6 +288,107 @@ def init_all_services(
     logger.info("all_services_initialized")
 
 
+def _init_vector_index(
+    dimensions: int,
+    db_client: Any,
+    capsule_repo: Any,
+    event_bus: Any,
+) -> Any:
+    """
+    Create the capsule vector index, load it from disk, and keep it in sync.
+
+    Returns:
+        The index, or None if it cannot be used in this environment
+    """
+    import os
+
+    from forge.services.vector_index import (
+        CapsuleVectorIndex,
+        VectorIndexError,
+        VectorIndexSync,
+    )
+
+    global _vector_index
+
+    path = settings.vector_index_path
+    try:
+        if path and os.path.exists(path):
+            index = CapsuleVectorIndex.load(path, nprobe=settings.vector_index_nprobe)
+            if index.dimensions != dimensions:
+                logger.warning(
+                    "vector_index_dimension_mismatch",
+                    stored=index.dimensions,
+                    expected=dimensions,
+                )
+                index = CapsuleVectorIndex(dimensions, nprobe=settings.vector_index_nprobe)
+        else:
+            index = CapsuleVectorIndex(dimensions, nprobe=settings.vector_index_nprobe)
+    except (VectorIndexError, OSError, ValueError, KeyError) as e:
+        logger.warning("vector_index_unavailable", error=str(e))
+        return None
+
+    sync = VectorIndexSync(index, capsule_repo=capsule_repo, db_client=db_client)
+    if event_bus:
+        sync.attach(event_bus)
+
+    # Reconcile with Neo4j in the background; a loaded file serves queries meanwhile
+    if db_client is not None:
+        _start_background_rebuild(sync, "vector_index")
+
+    _vector_index = index
+    logger.info("vector_index_ready", vectors=len(index), path=path)
+    return index
+
+
+def _init_text_index(db_client: Any, capsule_repo: Any, event_bus: Any) -> Any:
+    """
+    Create the in-process full-text index and keep it in sync.
+
+    The index is built from Neo4j in the background; until it has
+    documents, keyword search uses the Neo4j full-text index.
+    """
+    from forge.services.text_index import CapsuleTextIndex, TextIndexSync
+
+    index = CapsuleTextIndex()
+    sync = TextIndexSync(index, capsule_repo=capsule_repo, db_client=db_client)
+    if event_bus:
+        sync.attach(event_bus)
+    if db_client is not None:
+        _start_background_rebuild(sync, "text_index")
+
+    logger.info("text_index_ready")
+    return index
+
+
+def _start_background_rebuild(sync: Any, name: str) -> None:
+    """Rebuild an in-process search index from Neo4j without blocking startup."""
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return
+
+    async def _safe_rebuild() -> None:
+        try:
+            await sync.rebuild()
+        except (RuntimeError, ValueError, ConnectionError, OSError) as e:
+            logger.error(f"{name}_rebuild_failed", error=str(e))
+
+    task = loop.create_task(_safe_rebuild(), name=f"{name}_rebuild")
+    _rebuild_tasks.add(task)
+    task.add_done_callback(_rebuild_tasks.discard)
+
+
+def _save_vector_index() -> None:
+    """Persist the vector index if a path is configured."""
+    global _vector_index
+    if _vector_index is not None and settings.vector_index_path:
+        try:
+            _vector_index.save(settings.vector_index_path)
+        except OSError as e:
+            logger.warning("vector_index_save_failed", error=str(e))
+    _vector_index = None
+
+
 def _setup_ghost_council_event_handlers(ghost_council: Any, event_bus: Any) -> None:
     """
     Set up event handlers for Ghost Council serious issue detection.
@@ -336,6 +473,7 @@ def shutdown_all_services() -> None:
     logger.info("shutting_down_services")
 
     shutdown_search_service()
+    _save_vector_index()
     # Note: shutdown_llm_service is async; sync shutdown just clears references
     # For proper cleanup, use shutdown_all_services_async() in async contexts
     shutdown_embedding_service()
@@ -353,6 +491,7 @@ async def shutdown_all_services_async() -> None:
     logger.info("shutting_down_services")
 
     shutdown_search_service()
+    _save_vector_index()
     await shutdown_llm_service()
     shutdown_embedding_service()
     shutdown_ghost_council_service()
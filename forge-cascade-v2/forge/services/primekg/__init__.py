@@ -10,6 +10,7 @@ Components:
 - import_service: Neo4j batch import
 - embedding_service: Clinical description embeddings
 - query_service: PrimeKG-specific queries
+- adjacency: Memory-mapped CSR adjacency for in-process traversal
 
 PrimeKG Statistics:
 - 129,375 nodes across 10 types
@@ -18,8 +19,14 @@ PrimeKG Statistics:
 - 20 integrated biomedical data sources
 """
 
+from .adjacency import PrimeKGAdjacency
 from .download import PrimeKGDataFiles, PrimeKGDownloader
-from .import_service import ImportProgress, ImportResult, PrimeKGImportService
+from .import_service import (
+    AdminImportFiles,
+    ImportProgress,
+    ImportResult,
+    PrimeKGImportService,
+)
 from .models import (
     PrimeKGDisease,
     PrimeKGDrug,
@@ -44,6 +51,9 @@ __all__ = [
     "PrimeKGImportService",
     "ImportProgress",
     "ImportResult",
+    "AdminImportFiles",
+    # Adjacency
+    "PrimeKGAdjacency",
     # Models
     "PrimeKGNodeType",
     "PrimeKGEdgeType",
@@ -0,0 +1,519 @@
+"""
+PrimeKG Adjacency Snapshot
+
+Read-only CSR (compressed sparse row) adjacency of PrimeKG, built from the
+same nodes.csv/edges.csv the Neo4j import reads, for in-process neighbour,
+overlap and k-hop lookups without a database round trip.
+
+Layout (one directory):
+- manifest.json: relation and node type vocabularies, source file
+  signatures and build time
+- strings.npy / string_offsets.npy: interned UTF-8 strings (IDs and names)
+- node_ids.npy / node_names.npy / node_types.npy: per-node string refs and
+  type codes, indexed by PrimeKG node_index
+- id_order.npy / name_order.npy: node indices sorted by ID and by name,
+  for binary-search lookups
+- rel_<k>_indptr.npy / rel_<k>_indices.npy: one undirected CSR per
+  relationship type, with each row sorted and de-duplicated
+
+Every array is opened with mmap_mode="r", so worker processes share the
+page cache instead of each holding a copy.
+"""
+
+from __future__ import annotations
+
+import bisect
+import csv
+import json
+import os
+import shutil
+import time
+from array import array
+from collections.abc import Iterable
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any, cast
+
+import numpy as np
+import structlog
+from numpy.typing import NDArray
+
+from .import_service import PrimeKGImportService
+from .models import PrimeKGNodeType
+
+logger = structlog.get_logger(__name__)
+
+SNAPSHOT_VERSION = 1
+
+_EMPTY = np.zeros(0, dtype=np.int32)
+
+
+def _source_signature(path: Path) -> dict[str, Any]:
+    stat = path.stat()
+    return {
+        "path": str(path.resolve()),
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+    }
+
+
+class PrimeKGAdjacency:
+    """
+    Memory-mapped PrimeKG adjacency.
+
+    Node handles are PrimeKG node_index values. Relationship names are the
+    Neo4j types the importer writes (HAS_PHENOTYPE, ASSOCIATED_WITH, ...),
+    and every relationship is traversable in both directions, like an
+    undirected Cypher pattern.
+
+    Usage:
+        PrimeKGAdjacency.build("nodes.csv", "edges.csv", "./data/primekg/adjacency")
+        graph = PrimeKGAdjacency.open("./data/primekg/adjacency")
+        diseases = graph.overlap(phenotype_nodes, "HAS_PHENOTYPE", "disease")
+    """
+
+    # Seconds between re-checking the source files for changes
+    FRESHNESS_CHECK_INTERVAL = 60.0
+
+    def __init__(
+        self,
+        path: Path,
+        manifest: dict[str, Any],
+        arrays: dict[str, NDArray[Any]],
+        max_age_seconds: float | None = None,
+    ):
+        self.path = path
+        self.max_age_seconds = max_age_seconds
+        self.manifest = manifest
+        self.built_at = datetime.fromisoformat(manifest["built_at"])
+        self.relations: list[str] = manifest["relations"]
+        self.node_type_names: list[str] = manifest["node_types"]
+
+        self._strings = arrays["strings"]
+        self._string_offsets = arrays["string_offsets"]
+        self._node_ids = arrays["node_ids"]
+        self._node_names = arrays["node_names"]
+        self._node_types = arrays["node_types"]
+        self._id_order = arrays["id_order"]
+        self._name_order = arrays["name_order"]
+        self._csr = [
+            (arrays[f"rel_{k}_indptr"], arrays[f"rel_{k}_indices"])
+            for k in range(len(self.relations))
+        ]
+        self._relation_codes = {name: k for k, name in enumerate(self.relations)}
+        self._type_codes = {name: k for k, name in enumerate(self.node_type_names)}
+
+        self._fresh: bool | None = None
+        self._fresh_checked_at = 0.0
+        self._expired = False
+
+    @property
+    def node_count(self) -> int:
+        return len(self._node_types)
+
+    @property
+    def edge_count(self) -> int:
+        """Stored (directed) adjacency entries across all relationships."""
+        return sum(len(indices) for _, indices in self._csr)
+
+    # =========================================================================
+    # Build
+    # =========================================================================
+
+    @classmethod
+    def build(
+        cls,
+        nodes_file: Path | str,
+        edges_file: Path | str,
+        output_dir: Path | str,
+    ) -> PrimeKGAdjacency:
+        """
+        Build a snapshot from PrimeKG CSVs and open it.
+
+        Files are written to a temporary directory that replaces output_dir
+        once complete, so readers never see a partial snapshot.
+
+        Args:
+            nodes_file: Path to nodes.csv
+            edges_file: Path to edges.csv
+            output_dir: Snapshot directory
+
+        Returns:
+            The opened snapshot
+        """
+        nodes_file, edges_file, output_dir = Path(nodes_file), Path(edges_file), Path(output_dir)
+        started = time.perf_counter()
+
+        strings: dict[str, int] = {}
+
+        def intern(value: str) -> int:
+            ref = strings.get(value)
+            if ref is None:
+                ref = strings[value] = len(strings)
+            return ref
+
+        type_names = [t.value for t in PrimeKGNodeType]
+        type_codes = {name: k for k, name in enumerate(type_names)}
+        node_ids: dict[int, int] = {}
+        node_names: dict[int, int] = {}
+        node_types: dict[int, int] = {}
+        with open(nodes_file, encoding="utf-8", newline="") as f:
+            for row in csv.DictReader(f):
+                try:
+                    index = int(row.get("node_index", row.get("index", "")))
+                except ValueError:
+                    continue
+                node_type = row.get("node_type", row.get("type", "")).lower()
+                node_ids[index] = intern(row.get("node_id", row.get("id", "")))
+                node_names[index] = intern(row.get("node_name", row.get("name", "")))
+                node_types[index] = type_codes.get(node_type, -1)
+
+        n = max(node_types, default=-1) + 1
+        missing = intern("")
+        ids = np.full(n, missing, dtype=np.int32)
+        names = np.full(n, missing, dtype=np.int32)
+        types = np.full(n, -1, dtype=np.int8)
+        for index, ref in node_ids.items():
+            ids[index] = ref
+            names[index] = node_names[index]
+            types[index] = node_types[index]
+
+        relation_map = PrimeKGImportService.RELATIONSHIP_MAP
+        default_relation = PrimeKGImportService.DEFAULT_RELATIONSHIP
+        endpoints: dict[str, tuple[array[int], array[int]]] = {}
+        with open(edges_file, encoding="utf-8", newline="") as f:
+            for row in csv.DictReader(f):
+                try:
+                    x = int(row.get("x_index", ""))
+                    y = int(row.get("y_index", ""))
+                except ValueError:
+                    continue
+                if not (0 <= x < n and 0 <= y < n):
+                    continue
+                relation = row.get("relation", row.get("display_relation", "")).lower()
+                xs, ys = endpoints.setdefault(
+                    relation_map.get(relation, default_relation), (array("i"), array("i"))
+                )
+                xs.append(x)
+                ys.append(y)
+
+        relations = sorted(endpoints)
+        ordered_strings = sorted(strings, key=strings.__getitem__)
+        encoded = [s.encode("utf-8") for s in ordered_strings]
+        arrays: dict[str, NDArray[Any]] = {
+            "strings": np.frombuffer(b"".join(encoded), dtype=np.uint8),
+            "string_offsets": np.concatenate(
+                ([0], np.cumsum([len(b) for b in encoded], dtype=np.int64))
+            ).astype(np.int64),
+            "node_ids": ids,
+            "node_names": names,
+            "node_types": types,
+            "id_order": np.asarray(sorted(range(n), key=lambda i: encoded[ids[i]]), dtype=np.int32),
+            "name_order": np.asarray(
+                sorted(range(n), key=lambda i: encoded[names[i]]), dtype=np.int32
+            ),
+        }
+        for k, relation in enumerate(relations):
+            xs, ys = endpoints.pop(relation)
+            left = np.frombuffer(xs, dtype=np.int32).astype(np.int64)
+            right = np.frombuffer(ys, dtype=np.int32).astype(np.int64)
+            # Both directions, de-duplicated; unique keys come out sorted by
+            # source then target, which is exactly CSR order
+            keys = np.unique(np.concatenate((left * n + right, right * n + left)))
+            sources = keys // n
+            indptr = np.zeros(n + 1, dtype=np.int64)
+            np.cumsum(np.bincount(sources, minlength=n), out=indptr[1:])
+            arrays[f"rel_{k}_indptr"] = indptr
+            arrays[f"rel_{k}_indices"] = (keys % n).astype(np.int32)
+
+        manifest = {
+            "version": SNAPSHOT_VERSION,
+            "built_at": datetime.now(UTC).isoformat(),
+            "node_count": n,
+            "relations": relations,
+            "node_types": type_names,
+            "sources": {
+                "nodes": _source_signature(nodes_file),
+                "edges": _source_signature(edges_file),
+            },
+        }
+
+        tmp_dir = output_dir.with_name(output_dir.name + ".tmp")
+        old_dir = output_dir.with_name(output_dir.name + ".old")
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        tmp_dir.mkdir(parents=True)
+        for name, values in arrays.items():
+            np.save(tmp_dir / f"{name}.npy", values, allow_pickle=False)
+        (tmp_dir / "manifest.json").write_text(json.dumps(manifest, indent=2))
+
+        # Swap directories; processes that mapped the old files keep them
+        # readable after they are unlinked
+        shutil.rmtree(old_dir, ignore_errors=True)
+        if output_dir.exists():
+            os.replace(output_dir, old_dir)
+        os.replace(tmp_dir, output_dir)
+        shutil.rmtree(old_dir, ignore_errors=True)
+
+        logger.info(
+            "primekg_adjacency_built",
+            path=str(output_dir),
+            nodes=n,
+            relations=len(relations),
+            duration_seconds=round(time.perf_counter() - started, 2),
+        )
+        return cls.open(output_dir)
+
+    # =========================================================================
+    # Open / Freshness
+    # =========================================================================
+
+    @classmethod
+    def open(cls, path: Path | str, max_age_seconds: float | None = None) -> PrimeKGAdjacency:
+        """
+        Memory-map a snapshot directory.
+
+        Args:
+            path: Snapshot directory
+            max_age_seconds: Age after which is_fresh() reports the snapshot
+                stale (None or 0 for no limit)
+
+        Raises:
+            FileNotFoundError: If the snapshot does not exist
+            ValueError: If the snapshot is from another format version
+        """
+        path = Path(path)
+        manifest = json.loads((path / "manifest.json").read_text())
+        if manifest.get("version") != SNAPSHOT_VERSION:
+            raise ValueError(f"Unsupported adjacency snapshot version: {manifest.get('version')}")
+
+        names = ["strings", "string_offsets", "node_ids", "node_names", "node_types"]
+        names += ["id_order", "name_order"]
+        for k in range(len(manifest["relations"])):
+            names += [f"rel_{k}_indptr", f"rel_{k}_indices"]
+        arrays = {
+            name: np.load(path / f"{name}.npy", mmap_mode="r", allow_pickle=False) for name in names
+        }
+
+        graph = cls(path, manifest, arrays, max_age_seconds)
+        logger.info(
+            "primekg_adjacency_loaded",
+            path=str(path),
+            nodes=graph.node_count,
+            relations=len(graph.relations),
+        )
+        return graph
+
+    def is_fresh(self, max_age_seconds: float | None = None) -> bool:
+        """
+        Check the snapshot still matches its source files and is not too old.
+
+        Source files that no longer exist are not held against the snapshot
+        (deployments often ship only the snapshot), and writes made to Neo4j
+        after the build are invisible to it. max_age_seconds, which defaults
+        to the limit given to open(), bounds how stale it may be in both cases.
+        """
+        if max_age_seconds is None:
+            max_age_seconds = self.max_age_seconds
+        age = (datetime.now(UTC) - self.built_at).total_seconds()
+        if max_age_seconds and age > max_age_seconds:
+            if not self._expired:
+                self._expired = True
+                logger.warning("primekg_adjacency_expired", age_hours=round(age / 3600, 1))
+            return False
+
+        now = time.monotonic()
+        if self._fresh is None or now - self._fresh_checked_at >= self.FRESHNESS_CHECK_INTERVAL:
+            self._fresh = True
+            for signature in self.manifest["sources"].values():
+                source = Path(signature["path"])
+                try:
+                    current = _source_signature(source)
+                except OSError:
+                    continue
+                if current != signature:
+                    self._fresh = False
+                    logger.warning("primekg_adjacency_stale", source=str(source))
+                    break
+            self._fresh_checked_at = now
+        return self._fresh
+
+    # =========================================================================
+    # Nodes
+    # =========================================================================
+
+    def _string(self, ref: int) -> str:
+        start, end = self._string_offsets[ref], self._string_offsets[ref + 1]
+        return bytes(self._strings[start:end]).decode("utf-8")
+
+    def node_id(self, node: int) -> str:
+        return self._string(int(self._node_ids[node]))
+
+    def node_name(self, node: int) -> str:
+        return self._string(int(self._node_names[node]))
+
+    def node_type(self, node: int) -> str | None:
+        code = int(self._node_types[node])
+        return self.node_type_names[code] if code >= 0 else None
+
+    def find(self, node_id: str, node_type: str | None = None) -> list[int]:
+        """Nodes whose PrimeKG node_id equals node_id."""
+        return self._lookup(self._id_order, self._node_ids, node_id, node_type)
+
+    def find_by_name(self, name: str, node_type: str | None = None) -> list[int]:
+        """Nodes whose name equals name exactly (gene symbols, for instance)."""
+        return self._lookup(self._name_order, self._node_names, name, node_type)
+
+    def _lookup(
+        self,
+        order: NDArray[Any],
+        refs: NDArray[Any],
+        value: str,
+        node_type: str | None,
+    ) -> list[int]:
+        target = value.encode("utf-8")
+
+        def key(node: Any) -> bytes:
+            ref = int(refs[node])
+            start, end = self._string_offsets[ref], self._string_offsets[ref + 1]
+            return bytes(self._strings[start:end])
+
+        lo = bisect.bisect_left(order, target, key=key)
+        hi = bisect.bisect_right(order, target, lo=lo, key=key)
+        nodes = [int(node) for node in order[lo:hi]]
+        if node_type is not None:
+            code = self._type_codes.get(node_type, -2)
+            nodes = [node for node in nodes if self._node_types[node] == code]
+        return nodes
+
+    # =========================================================================
+    # Traversal
+    # =========================================================================
+
+    def _relation_arrays(self, relations: str | Iterable[str]) -> list[tuple[Any, Any]]:
+        names = [relations] if isinstance(relations, str) else relations
+        return [self._csr[self._relation_codes[r]] for r in names if r in self._relation_codes]
+
+    def neighbors(
+        self,
+        node: int,
+        relations: str | Iterable[str],
+        node_type: str | None = None,
+    ) -> NDArray[np.int32]:
+        """
+        Sorted, distinct neighbours of node over the given relationships.
+
+        For a single relationship and no type filter this is a view into the
+        mapped file, not a copy.
+        """
+        if not 0 <= node < self.node_count:
+            return _EMPTY
+        rows = [
+            indices[indptr[node] : indptr[node + 1]]
+            for indptr, indices in self._relation_arrays(relations)
+        ]
+        if not rows:
+            result = _EMPTY
+        elif len(rows) == 1:
+            result = rows[0]
+        else:
+            result = np.unique(np.concatenate(rows))
+        if node_type is not None and len(result):
+            code = self._type_codes.get(node_type, -2)
+            result = result[self._node_types[result] == code]
+        return result
+
+    def degree(
+        self,
+        node: int,
+        relations: str | Iterable[str],
+        node_type: str | None = None,
+    ) -> int:
+        return len(self.neighbors(node, relations, node_type))
+
+    def overlap(
+        self,
+        nodes: Iterable[int],
+        relations: str | Iterable[str],
+        node_type: str | None = None,
+    ) -> dict[int, list[int]]:
+        """
+        Group the neighbours of several nodes.
+
+        Returns:
+            Each neighbour mapped to the input nodes it is adjacent to
+        """
+        relations = [relations] if isinstance(relations, str) else list(relations)
+        shared: dict[int, list[int]] = {}
+        for node in dict.fromkeys(nodes):
+            neighbors = cast(list[int], self.neighbors(node, relations, node_type).tolist())
+            for neighbor in neighbors:
+                shared.setdefault(neighbor, []).append(node)
+        return shared
+
+    def k_hop(
+        self,
+        nodes: Iterable[int],
+        relations: str | Iterable[str],
+        k: int,
+        node_type: str | None = None,
+    ) -> set[int]:
+        """
+        Nodes reachable in 1..k hops (breadth-first), excluding the start nodes.
+
+        node_type filters the result, not the nodes passed through.
+        """
+        relations = [relations] if isinstance(relations, str) else list(relations)
+        start = set(nodes)
+        seen = set(start)
+        frontier = list(start)
+        for _ in range(k):
+            reached: set[int] = set()
+            for node in frontier:
+                reached.update(cast(list[int], self.neighbors(node, relations).tolist()))
+            frontier = list(reached - seen)
+            if not frontier:
+                break
+            seen.update(frontier)
+
+        found = seen - start
+        if node_type is not None:
+            code = self._type_codes.get(node_type, -2)
+            found = {node for node in found if self._node_types[node] == code}
+        return found
+
+    async def load_details(self, neo4j_client: Any, nodes: Iterable[int]) -> dict[int, Any]:
+        """
+        Fetch the properties the snapshot does not carry (description,
+        prevalence) for a set of nodes in one point lookup.
+
+        Args:
+            neo4j_client: Neo4j client, or None to skip the lookup
+            nodes: Node indices
+
+        Returns:
+            node_index mapped to its record (empty without a client)
+        """
+        indices = list(dict.fromkeys(nodes))
+        if neo4j_client is None or not indices:
+            return {}
+        results = await neo4j_client.run(
+            """
+            MATCH (n:PrimeKGNode)
+            WHERE n.node_index IN $indices
+            RETURN n.node_index as node_index,
+                   n.description as description,
+                   n.prevalence as prevalence
+            """,
+            {"indices": indices},
+        )
+        return {r["node_index"]: r for r in results or []}
+
+    def stats(self) -> dict[str, Any]:
+        """Get snapshot statistics."""
+        return {
+            "path": str(self.path),
+            "nodes": self.node_count,
+            "edges": self.edge_count,
+            "relations": len(self.relations),
+            "built_at": self.built_at.isoformat(),
+        }
@@ -2,23 +2,30 @@
 PrimeKG Neo4j Import Service
 
 Imports PrimeKG data into Neo4j with:
-- Batch processing for efficiency
-- Progress tracking and resume capability
-- Transaction management
+- A pipeline of parser, transformer and writer stages, so CSV parsing
+  overlaps with database writes and stays off the event loop
+- Concurrent writers over batches partitioned by node label or
+  relationship type, each with its label or type written into the query
+- Checkpoints at file byte offsets, so a resume seeks straight to the
+  first unwritten record
+- An offline mode that writes neo4j-admin import CSVs for a cold start
 - Error handling and retry logic
 """
 
 import asyncio
+import csv
 import json
-from collections.abc import Callable
+import os
+from collections.abc import Awaitable, Callable
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from pathlib import Path
-from typing import Any
+from typing import IO, Any
 
 import structlog
+from neo4j.exceptions import Neo4jError
 
-from .models import PrimeKGEdge, PrimeKGNode, PrimeKGNodeType, PrimeKGStats
+from .models import PrimeKGNodeType, PrimeKGStats
 from .parser import PrimeKGParser
 
 logger = structlog.get_logger(__name__)
@@ -39,15 +46,23 @@ class ImportProgress:
     last_error: str | None = None
     is_resuming: bool = False
     resume_from_batch: int = 0
+    # Everything before byte_offset is written; total_records is only known
+    # once the file has been read, so progress is measured in bytes
+    byte_offset: int = 0
+    total_bytes: int = 0
 
     @property
     def progress_percent(self) -> float:
+        if self.total_bytes:
+            return (self.byte_offset / self.total_bytes) * 100
         if self.total_records == 0:
             return 0.0
         return (self.imported_records / self.total_records) * 100
 
     @property
     def is_complete(self) -> bool:
+        if self.total_bytes:
+            return self.byte_offset >= self.total_bytes
         return self.imported_records >= self.total_records
 
 
@@ -65,16 +80,136 @@ class ImportResult:
     stats: PrimeKGStats | None = None
 
 
+@dataclass
+class AdminImportFiles:
+    """CSV files written for an offline neo4j-admin import."""
+
+    node_files: list[Path] = field(default_factory=list)
+    relationship_files: list[Path] = field(default_factory=list)
+    nodes_written: int = 0
+    relationships_written: int = 0
+    invalid_records: int = 0
+
+    def command(self, database: str = "neo4j") -> list[str]:
+        """
+        Build the neo4j-admin command that loads these files.
+
+        The database must be stopped (or not yet created) when it runs.
+        """
+        args = ["neo4j-admin", "database", "import", "full", "--id-type=integer"]
+        args += [f"--nodes={path}" for path in self.node_files]
+        args += [f"--relationships={path}" for path in self.relationship_files]
+        args.append(database)
+        return args
+
+
+@dataclass
+class _Chunk:
+    """Raw CSV rows read between two record boundaries."""
+
+    seq: int
+    end_offset: int
+    rows: list[dict[str, str]]
+
+
+@dataclass
+class _WriteBatch:
+    """Transformed records sharing one node label or relationship type."""
+
+    seq: int
+    key: str
+    records: list[dict[str, Any]]
+
+
+class _CSVChunkReader:
+    """
+    Reads a CSV file in chunks of whole records, tracking byte offsets.
+
+    Lines are read in binary so the offset after each chunk can be saved
+    and later passed back to start reading from exactly that record.
+    """
+
+    def __init__(self, path: Path, start_offset: int = 0):
+        self._file: IO[bytes] = open(path, "rb")
+        header = self._file.readline()
+        self.columns = next(csv.reader([header.decode("utf-8-sig")]), [])
+        if start_offset > self._file.tell():
+            self._file.seek(start_offset)
+        self.offset = self._file.tell()
+        self._seq = 0
+
+    def read(self, max_rows: int) -> _Chunk | None:
+        """Read up to max_rows records, or None at end of file."""
+        lines: list[str] = []
+        while len(lines) < max_rows:
+            line = self._file.readline()
+            if not line:
+                break
+            # A quoted field may span lines; quotes pair up once the record ends
+            while line.count(b'"') % 2:
+                more = self._file.readline()
+                if not more:
+                    break
+                line += more
+            lines.append(line.decode("utf-8"))
+
+        if not lines:
+            return None
+        self.offset = self._file.tell()
+        self._seq += 1
+        rows = [dict(zip(self.columns, values, strict=False)) for values in csv.reader(lines)]
+        return _Chunk(seq=self._seq, end_offset=self.offset, rows=[r for r in rows if r])
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class _CheckpointTracker:
+    """
+    Turns out-of-order batch completions into a safe resume offset.
+
+    A chunk is finished once every batch cut from it is written (or has
+    failed for good); the checkpoint only moves past a chunk when all
+    chunks before it are finished too.
+    """
+
+    def __init__(self, start_offset: int):
+        self.offset = start_offset
+        self._next_seq = 1
+        self._pending: dict[int, int] = {}  # seq -> batches outstanding
+        self._end_offsets: dict[int, int] = {}
+
+    def expect(self, seq: int, end_offset: int, batches: int) -> bool:
+        """Register a chunk; returns True if the checkpoint advanced."""
+        self._pending[seq] = batches
+        self._end_offsets[seq] = end_offset
+        return self._advance()
+
+    def finish(self, seq: int) -> bool:
+        """Record one written batch; returns True if the checkpoint advanced."""
+        self._pending[seq] -= 1
+        return self._advance()
+
+    def _advance(self) -> bool:
+        advanced = False
+        while self._pending.get(self._next_seq) == 0:
+            del self._pending[self._next_seq]
+            self.offset = self._end_offsets.pop(self._next_seq)
+            self._next_seq += 1
+            advanced = True
+        return advanced
+
+
 class PrimeKGImportService:
     """
     Service for importing PrimeKG data into Neo4j.
 
     Features:
     - Batch imports (configurable size)
-    - Resume from last successful batch
+    - Pipelined parsing and concurrent, label-partitioned writes
+    - Resume from the byte offset of the last written record
     - Progress persistence
-    - Transaction management
-    - Concurrent batch processing
+    - Offline neo4j-admin CSV export
     """
 
     # Node labels by type
@@ -91,6 +226,20 @@ class PrimeKGImportService:
         PrimeKGNodeType.EXPOSURE: "PrimeKGExposure",
     }
 
+    # Source-specific ID property set alongside each label
+    NODE_ID_PROPERTIES = {
+        PrimeKGNodeType.DISEASE: "mondo_id",
+        PrimeKGNodeType.GENE_PROTEIN: "entrez_id",
+        PrimeKGNodeType.DRUG: "drugbank_id",
+        PrimeKGNodeType.PHENOTYPE: "hpo_id",
+        PrimeKGNodeType.ANATOMY: "uberon_id",
+        PrimeKGNodeType.PATHWAY: "reactome_id",
+        PrimeKGNodeType.BIOLOGICAL_PROCESS: "go_id",
+        PrimeKGNodeType.MOLECULAR_FUNCTION: "go_id",
+        PrimeKGNodeType.CELLULAR_COMPONENT: "go_id",
+        PrimeKGNodeType.EXPOSURE: "exposure_id",
+    }
+
     # Relationship type mapping (normalize to Neo4j conventions)
     RELATIONSHIP_MAP = {
         "indication": "INDICATED_FOR",
@@ -113,6 +262,7 @@ class PrimeKGImportService:
         "exposure": "EXPOSURE_LINKED",
         "parent-child": "PARENT_OF",
     }
+    DEFAULT_RELATIONSHIP = "RELATED_TO"
 
     def __init__(
         self,
@@ -121,6 +271,7 @@ class PrimeKGImportService:
         edge_batch_size: int = 5000,
         max_retries: int = 3,
         progress_file: Path | None = None,
+        writers: int = 4,
     ):
         """
         Initialize the import service.
@@ -131,12 +282,14 @@ class PrimeKGImportService:
             edge_batch_size: Edges per batch
             max_retries: Max retries per batch
             progress_file: File to persist import progress
+            writers: Concurrent writer sessions
         """
         self.neo4j = neo4j_client
         self.batch_size = batch_size
         self.edge_batch_size = edge_batch_size
         self.max_retries = max_retries
         self.progress_file = progress_file or Path("./data/primekg/import_progress.json")
+        self.writers = max(1, writers)
 
         self.parser = PrimeKGParser(batch_size=batch_size)
         self._progress_callbacks: list[Callable[[ImportProgress], None]] = []
@@ -251,198 +404,66 @@ class PrimeKGImportService:
         Returns:
             ImportProgress with results
         """
-        self._cancelled = False
-        nodes_file = Path(nodes_file)
-
-        # Initialize progress
-        progress = ImportProgress(
-            phase="nodes",
-            started_at=datetime.now(UTC),
+        return await self._run_import(
+            "nodes",
+            Path(nodes_file),
+            resume,
+            self.batch_size,
+            self._transform_nodes,
+            self._import_node_batch,
         )
 
-        # Count total records
-        progress.total_records = self.parser.count_lines(nodes_file)
-        progress.total_batches = (progress.total_records + self.batch_size - 1) // self.batch_size
-
-        # Check for resume
-        if resume:
-            saved_progress = self._load_progress()
-            if saved_progress and saved_progress.get("phase") == "nodes":
-                progress.resume_from_batch = saved_progress.get("current_batch", 0)
-                progress.imported_records = saved_progress.get("imported_records", 0)
-                progress.is_resuming = True
-                logger.info("primekg_resuming_nodes", from_batch=progress.resume_from_batch)
-
-        logger.info(
-            "primekg_importing_nodes",
-            total=progress.total_records,
-            batches=progress.total_batches,
-            resuming=progress.is_resuming,
-        )
-
-        batch_num = 0
-        for batch in self.parser.parse_nodes_batch(nodes_file, self.batch_size):
-            batch_num += 1
-
-            # Skip already imported batches if resuming
-            if progress.is_resuming and batch_num <= progress.resume_from_batch:
+    def _transform_nodes(self, rows: list[dict[str, str]]) -> tuple[dict[str, list[Any]], int]:
+        """Convert raw rows to query parameters, grouped by node type."""
+        by_type: dict[str, list[Any]] = {}
+        invalid = 0
+        for row in rows:
+            try:
+                node_type = self.parser.NODE_TYPE_MAP.get(
+                    row.get("node_type", row.get("type", "")).lower()
+                )
+                if node_type is None:
+                    raise ValueError("Unknown node type")
+                node = {
+                    "node_index": int(row.get("node_index", row.get("index", 0))),
+                    "node_id": row.get("node_id", row.get("id", "")),
+                    "node_type": node_type.value,
+                    "node_name": row.get("node_name", row.get("name", "")),
+                    "node_source": row.get("node_source", row.get("source", "")),
+                }
+            except (ValueError, TypeError, AttributeError):
+                invalid += 1
                 continue
+            by_type.setdefault(node_type.value, []).append(node)
+        return by_type, invalid
 
-            if self._cancelled:
-                logger.info("primekg_import_cancelled")
-                break
-
-            progress.current_batch = batch_num
-
-            # Import batch with retry
-            success = await self._import_node_batch(batch, retries=self.max_retries)
-
-            if success:
-                progress.imported_records += len(batch)
-            else:
-                progress.failed_records += len(batch)
-                progress.last_error = f"Batch {batch_num} failed after {self.max_retries} retries"
-
-            # Save progress checkpoint
-            self._save_progress(progress)
-            self._notify_progress(progress)
-
-        progress.completed_at = datetime.now(UTC)
-        if progress.started_at is not None:
-            duration = (progress.completed_at - progress.started_at).total_seconds()
-        else:
-            duration = 0.0
-        logger.info(
-            "primekg_nodes_imported",
-            imported=progress.imported_records,
-            failed=progress.failed_records,
-            duration_seconds=duration,
+    def _node_query(self, node_type: PrimeKGNodeType) -> str:
+        """MERGE query for one node type, with its label and ID property inline."""
+        extra = (
+            ",\n            n.symbol = node.node_name" if node_type.value == "gene/protein" else ""
         )
-
-        return progress
-
-    async def _import_node_batch(
-        self,
-        nodes: list[PrimeKGNode],
-        retries: int = 3,
-    ) -> bool:
-        """Import a batch of nodes into Neo4j."""
-        query = """
-        UNWIND $nodes AS node
-        MERGE (n:PrimeKGNode {node_index: node.node_index})
-        SET n.node_id = node.node_id,
-            n.node_type = node.node_type,
-            n.name = node.node_name,
-            n.source = node.node_source,
-            n.imported_at = datetime()
-
-        WITH n, node
-        CALL apoc.do.case([
-            node.node_type = 'disease',
-            'SET n:PrimeKGDisease SET n.mondo_id = node.node_id',
-
-            node.node_type = 'gene/protein',
-            'SET n:PrimeKGGene SET n.entrez_id = node.node_id SET n.symbol = node.node_name',
-
-            node.node_type = 'drug',
-            'SET n:PrimeKGDrug SET n.drugbank_id = node.node_id',
-
-            node.node_type = 'effect/phenotype',
-            'SET n:PrimeKGPhenotype SET n.hpo_id = node.node_id',
-
-            node.node_type = 'anatomy',
-            'SET n:PrimeKGAnatomy SET n.uberon_id = node.node_id',
-
-            node.node_type = 'pathway',
-            'SET n:PrimeKGPathway SET n.reactome_id = node.node_id',
-
-            node.node_type = 'biological_process',
-            'SET n:PrimeKGBioProcess SET n.go_id = node.node_id',
-
-            node.node_type = 'molecular_function',
-            'SET n:PrimeKGMolFunction SET n.go_id = node.node_id',
-
-            node.node_type = 'cellular_component',
-            'SET n:PrimeKGCellComponent SET n.go_id = node.node_id',
-
-            node.node_type = 'exposure',
-            'SET n:PrimeKGExposure SET n.exposure_id = node.node_id'
-        ],
-        '', {n: n, node: node}) YIELD value
-        RETURN count(n) as count
-        """
-
-        # Fallback query without APOC (simpler but requires multiple passes)
-        simple_query = """
+        return f"""
         UNWIND $nodes AS node
-        MERGE (n:PrimeKGNode {node_index: node.node_index})
-        SET n.node_id = node.node_id,
+        MERGE (n:PrimeKGNode {{node_index: node.node_index}})
+        SET n:{self.NODE_LABELS[node_type]},
+            n.node_id = node.node_id,
             n.node_type = node.node_type,
             n.name = node.node_name,
             n.source = node.node_source,
+            n.{self.NODE_ID_PROPERTIES[node_type]} = node.node_id{extra},
             n.imported_at = datetime()
         RETURN count(n) as count
         """
 
-        # Convert to dicts for Neo4j
-        node_dicts = [
-            {
-                "node_index": n.node_index,
-                "node_id": n.node_id,
-                "node_type": n.node_type.value,
-                "node_name": n.node_name,
-                "node_source": n.node_source,
-            }
-            for n in nodes
-        ]
-
-        for attempt in range(retries):
-            try:
-                # Try with APOC first, fallback to simple query
-                try:
-                    await self.neo4j.run(query, {"nodes": node_dicts})
-                except (RuntimeError, OSError, ConnectionError, ValueError) as _apoc_err:
-                    await self.neo4j.run(simple_query, {"nodes": node_dicts})
-
-                # Add specialized labels in separate query
-                await self._add_specialized_labels(node_dicts)
-
-                return True
-
-            except (RuntimeError, OSError, ConnectionError, ValueError) as e:
-                logger.warning("primekg_node_batch_retry", attempt=attempt + 1, error=str(e))
-                if attempt < retries - 1:
-                    await asyncio.sleep(2**attempt)  # Exponential backoff
-
-        return False
-
-    async def _add_specialized_labels(self, nodes: list[dict[str, Any]]) -> None:
-        """Add specialized labels based on node type."""
-        label_queries = {
-            "disease": "MATCH (n:PrimeKGNode) WHERE n.node_index IN $indices SET n:PrimeKGDisease",
-            "gene/protein": "MATCH (n:PrimeKGNode) WHERE n.node_index IN $indices SET n:PrimeKGGene",
-            "drug": "MATCH (n:PrimeKGNode) WHERE n.node_index IN $indices SET n:PrimeKGDrug",
-            "effect/phenotype": "MATCH (n:PrimeKGNode) WHERE n.node_index IN $indices SET n:PrimeKGPhenotype",
-            "anatomy": "MATCH (n:PrimeKGNode) WHERE n.node_index IN $indices SET n:PrimeKGAnatomy",
-            "pathway": "MATCH (n:PrimeKGNode) WHERE n.node_index IN $indices SET n:PrimeKGPathway",
-            "biological_process": "MATCH (n:PrimeKGNode) WHERE n.node_index IN $indices SET n:PrimeKGBioProcess",
-            "molecular_function": "MATCH (n:PrimeKGNode) WHERE n.node_index IN $indices SET n:PrimeKGMolFunction",
-            "cellular_component": "MATCH (n:PrimeKGNode) WHERE n.node_index IN $indices SET n:PrimeKGCellComponent",
-            "exposure": "MATCH (n:PrimeKGNode) WHERE n.node_index IN $indices SET n:PrimeKGExposure",
-        }
-
-        # Group nodes by type
-        by_type: dict[str, list[int]] = {}
-        for node in nodes:
-            node_type = node["node_type"]
-            if node_type not in by_type:
-                by_type[node_type] = []
-            by_type[node_type].append(node["node_index"])
-
-        # Execute label queries
-        for node_type, indices in by_type.items():
-            if node_type in label_queries:
-                await self.neo4j.run(label_queries[node_type], {"indices": indices})
+    async def _import_node_batch(
+        self,
+        node_type: str,
+        nodes: list[dict[str, Any]],
+        retries: int = 3,
+    ) -> bool:
+        """Import a batch of nodes of one type into Neo4j."""
+        query = self._node_query(PrimeKGNodeType(node_type))
+        return await self._run_batch(query, {"nodes": nodes}, retries, "primekg_node_batch_retry")
 
     # =========================================================================
     # Edge Import
@@ -463,120 +484,330 @@ class PrimeKGImportService:
         Returns:
             ImportProgress with results
         """
+        return await self._run_import(
+            "edges",
+            Path(edges_file),
+            resume,
+            self.edge_batch_size,
+            self._transform_edges,
+            self._import_edge_batch,
+        )
+
+    def _transform_edges(self, rows: list[dict[str, str]]) -> tuple[dict[str, list[Any]], int]:
+        """Convert raw rows to query parameters, grouped by relationship type."""
+        by_type: dict[str, list[Any]] = {}
+        invalid = 0
+        for row in rows:
+            try:
+                relation = row.get("relation", row.get("display_relation", ""))
+                edge = {
+                    "x_index": int(row.get("x_index", 0)),
+                    "y_index": int(row.get("y_index", 0)),
+                    "relation": relation,
+                }
+            except (ValueError, TypeError):
+                invalid += 1
+                continue
+            rel_type = self.RELATIONSHIP_MAP.get(relation.lower(), self.DEFAULT_RELATIONSHIP)
+            by_type.setdefault(rel_type, []).append(edge)
+        return by_type, invalid
+
+    async def _import_edge_batch(
+        self,
+        rel_type: str,
+        edges: list[dict[str, Any]],
+        retries: int = 3,
+    ) -> bool:
+        """Import a batch of edges of one relationship type into Neo4j."""
+        # rel_type always comes from RELATIONSHIP_MAP, never from the file
+        query = f"""
+        UNWIND $edges AS edge
+        MATCH (source:PrimeKGNode {{node_index: edge.x_index}})
+        MATCH (target:PrimeKGNode {{node_index: edge.y_index}})
+        MERGE (source)-[r:{rel_type} {{relation: edge.relation}}]->(target)
+        ON CREATE SET r.created_at = datetime()
+        RETURN count(r) as count
+        """
+        return await self._run_batch(query, {"edges": edges}, retries, "primekg_edge_batch_retry")
+
+    # =========================================================================
+    # Import Pipeline
+    # =========================================================================
+
+    async def _run_batch(
+        self,
+        query: str,
+        parameters: dict[str, Any],
+        retries: int,
+        retry_event: str,
+    ) -> bool:
+        """Run one batch query with exponential backoff between attempts."""
+        for attempt in range(retries):
+            try:
+                await self.neo4j.run(query, parameters)
+                return True
+            except (Neo4jError, RuntimeError, OSError, ConnectionError, ValueError) as e:
+                logger.warning(retry_event, attempt=attempt + 1, error=str(e))
+                if attempt < retries - 1:
+                    await asyncio.sleep(2**attempt)  # Exponential backoff
+        return False
+
+    async def _run_import(
+        self,
+        phase: str,
+        path: Path,
+        resume: bool,
+        batch_size: int,
+        transform: Callable[[list[dict[str, str]]], tuple[dict[str, list[Any]], int]],
+        write: Callable[[str, list[dict[str, Any]], int], Awaitable[bool]],
+    ) -> ImportProgress:
+        """
+        Stream a CSV file into Neo4j through parser, transformer and writers.
+
+        The parser reads chunks of batch_size records at known byte offsets
+        and the transformer groups each chunk by label or relationship type,
+        both in worker threads. Writers run the grouped batches on separate
+        sessions. Bounded queues between the stages apply backpressure.
+        """
         self._cancelled = False
-        edges_file = Path(edges_file)
+        if not path.exists():
+            raise FileNotFoundError(f"Import file not found: {path}")
 
         progress = ImportProgress(
-            phase="edges",
+            phase=phase,
             started_at=datetime.now(UTC),
+            total_bytes=path.stat().st_size,
         )
+        source = self._source_signature(path)
 
-        # Count total records
-        progress.total_records = self.parser.count_lines(edges_file)
-        progress.total_batches = (
-            progress.total_records + self.edge_batch_size - 1
-        ) // self.edge_batch_size
-
-        # Check for resume
         if resume:
             saved_progress = self._load_progress()
-            if saved_progress and saved_progress.get("phase") == "edges":
-                progress.resume_from_batch = saved_progress.get("current_batch", 0)
+            if (
+                saved_progress
+                and saved_progress.get("phase") == phase
+                and saved_progress.get("source") == source
+            ):
+                progress.byte_offset = saved_progress.get("byte_offset", 0)
                 progress.imported_records = saved_progress.get("imported_records", 0)
-                progress.is_resuming = True
+                progress.failed_records = saved_progress.get("failed_records", 0)
+                progress.resume_from_batch = saved_progress.get("current_batch", 0)
+                progress.current_batch = progress.resume_from_batch
+                progress.is_resuming = progress.byte_offset > 0
+                if progress.is_resuming:
+                    logger.info(
+                        f"primekg_resuming_{phase}",
+                        from_offset=progress.byte_offset,
+                        total_bytes=progress.total_bytes,
+                    )
 
         logger.info(
-            "primekg_importing_edges", total=progress.total_records, batches=progress.total_batches
+            f"primekg_importing_{phase}",
+            total_bytes=progress.total_bytes,
+            writers=self.writers,
+            resuming=progress.is_resuming,
         )
 
-        batch_num = 0
-        for batch in self.parser.parse_edges_batch(edges_file, self.edge_batch_size):
-            batch_num += 1
+        depth = self.writers * 2
+        chunks: asyncio.Queue[_Chunk | None] = asyncio.Queue(maxsize=depth)
+        batches: asyncio.Queue[_WriteBatch | None] = asyncio.Queue(maxsize=depth)
+        tracker = _CheckpointTracker(progress.byte_offset)
+        reader = _CSVChunkReader(path, progress.byte_offset)
 
-            if progress.is_resuming and batch_num <= progress.resume_from_batch:
-                continue
-
-            if self._cancelled:
-                break
-
-            progress.current_batch = batch_num
-
-            success = await self._import_edge_batch(batch, retries=self.max_retries)
+        def checkpoint() -> None:
+            progress.byte_offset = tracker.offset
+            self._save_progress(progress, source)
+            self._notify_progress(progress)
 
-            if success:
-                progress.imported_records += len(batch)
-            else:
-                progress.failed_records += len(batch)
-                progress.last_error = f"Batch {batch_num} failed"
+        # End-of-stream sentinels are only sent on a clean finish. If any
+        # stage fails, the task group cancels the rest, and awaiting a put
+        # on a queue nobody drains any more would hang the import.
+        async def parse_stage() -> None:
+            while not self._cancelled:
+                chunk = await asyncio.to_thread(reader.read, batch_size)
+                if chunk is None:
+                    break
+                await chunks.put(chunk)
+            await chunks.put(None)
+
+        async def transform_stage() -> None:
+            while (chunk := await chunks.get()) is not None:
+                grouped, invalid = await asyncio.to_thread(transform, chunk.rows)
+                progress.failed_records += invalid
+                progress.current_batch = progress.resume_from_batch + chunk.seq
+                if tracker.expect(chunk.seq, chunk.end_offset, len(grouped)):
+                    checkpoint()
+                for key, records in grouped.items():
+                    await batches.put(_WriteBatch(chunk.seq, key, records))
+            for _ in range(self.writers):
+                await batches.put(None)
+
+        async def write_stage() -> None:
+            while (batch := await batches.get()) is not None:
+                if await write(batch.key, batch.records, self.max_retries):
+                    progress.imported_records += len(batch.records)
+                else:
+                    progress.failed_records += len(batch.records)
+                    progress.last_error = (
+                        f"{batch.key} batch in chunk {batch.seq} failed "
+                        f"after {self.max_retries} retries"
+                    )
+                if tracker.finish(batch.seq):
+                    checkpoint()
 
-            self._save_progress(progress)
-            self._notify_progress(progress)
+        try:
+            async with asyncio.TaskGroup() as group:
+                group.create_task(parse_stage())
+                group.create_task(transform_stage())
+                for _ in range(self.writers):
+                    group.create_task(write_stage())
+        finally:
+            reader.close()
+
+        if self._cancelled:
+            logger.info("primekg_import_cancelled", phase=phase, byte_offset=progress.byte_offset)
+        else:
+            progress.total_records = progress.imported_records + progress.failed_records
 
         progress.completed_at = datetime.now(UTC)
+        if progress.started_at is not None:
+            duration = (progress.completed_at - progress.started_at).total_seconds()
+        else:
+            duration = 0.0
         logger.info(
-            "primekg_edges_imported",
+            f"primekg_{phase}_imported",
             imported=progress.imported_records,
             failed=progress.failed_records,
+            duration_seconds=duration,
         )
 
         return progress
 
-    async def _import_edge_batch(
+    # =========================================================================
+    # Offline Import
+    # =========================================================================
+
+    async def export_admin_import(
         self,
-        edges: list[PrimeKGEdge],
-        retries: int = 3,
-    ) -> bool:
-        """Import a batch of edges into Neo4j."""
-        query = """
-        UNWIND $edges AS edge
-        MATCH (source:PrimeKGNode {node_index: edge.x_index})
-        MATCH (target:PrimeKGNode {node_index: edge.y_index})
-        CALL apoc.merge.relationship(
-            source,
-            edge.rel_type,
-            {relation: edge.relation},
-            {created_at: datetime()},
-            target,
-            {}
-        ) YIELD rel
-        RETURN count(rel) as count
+        nodes_file: Path | str,
+        edges_file: Path | str,
+        output_dir: Path | str,
+    ) -> AdminImportFiles:
         """
+        Write neo4j-admin import CSVs for a cold start.
 
-        # Simple fallback without APOC (uses generic RELATED_TO)
-        simple_query = """
-        UNWIND $edges AS edge
-        MATCH (source:PrimeKGNode {node_index: edge.x_index})
-        MATCH (target:PrimeKGNode {node_index: edge.y_index})
-        MERGE (source)-[r:PRIMEKG_RELATION {relation: edge.relation}]->(target)
-        SET r.created_at = datetime()
-        RETURN count(r) as count
-        """
+        One file is written per node label and per relationship type, with
+        the same labels and properties the online import sets. Unlike the
+        online import nothing is merged, so this is only for an empty
+        database; run AdminImportFiles.command() with the database stopped,
+        then setup_schema() once it is started.
 
-        # Convert edges to dicts with normalized relationship types
-        edge_dicts = [
-            {
-                "x_index": e.x_index,
-                "y_index": e.y_index,
-                "relation": e.relation,
-                "rel_type": self.RELATIONSHIP_MAP.get(e.relation.lower(), "RELATED_TO"),
-            }
-            for e in edges
-        ]
+        Args:
+            nodes_file: Path to nodes.csv
+            edges_file: Path to edges.csv
+            output_dir: Directory for the generated CSVs
 
-        for attempt in range(retries):
-            try:
-                try:
-                    await self.neo4j.run(query, {"edges": edge_dicts})
-                except (RuntimeError, OSError, ConnectionError, ValueError) as _apoc_err:
-                    await self.neo4j.run(simple_query, {"edges": edge_dicts})
-                return True
+        Returns:
+            AdminImportFiles listing the files and the import command
+        """
+        files = await asyncio.to_thread(
+            self._write_admin_files, Path(nodes_file), Path(edges_file), Path(output_dir)
+        )
+        logger.info(
+            "primekg_admin_import_exported",
+            nodes=files.nodes_written,
+            relationships=files.relationships_written,
+            invalid=files.invalid_records,
+            output_dir=str(output_dir),
+        )
+        return files
 
-            except (RuntimeError, OSError, ConnectionError, ValueError) as e:
-                logger.warning("primekg_edge_batch_retry", attempt=attempt + 1, error=str(e))
-                if attempt < retries - 1:
-                    await asyncio.sleep(2**attempt)
+    def _write_admin_files(
+        self,
+        nodes_file: Path,
+        edges_file: Path,
+        output_dir: Path,
+    ) -> AdminImportFiles:
+        output_dir.mkdir(parents=True, exist_ok=True)
+        imported_at = datetime.now(UTC).isoformat()
+        files = AdminImportFiles()
+        handles: dict[str, IO[str]] = {}
+        writers: dict[str, Any] = {}
+
+        def writer_for(name: str, header: list[str], paths: list[Path]) -> Any:
+            if name not in writers:
+                path = output_dir / f"{name}.csv"
+                handles[name] = open(path, "w", encoding="utf-8", newline="")
+                writers[name] = csv.writer(handles[name])
+                writers[name].writerow(header)
+                paths.append(path)
+            return writers[name]
 
-        return False
+        try:
+            reader = _CSVChunkReader(nodes_file)
+            try:
+                while (chunk := reader.read(self.batch_size)) is not None:
+                    grouped, invalid = self._transform_nodes(chunk.rows)
+                    files.invalid_records += invalid
+                    for node_type_value, nodes in grouped.items():
+                        node_type = PrimeKGNodeType(node_type_value)
+                        label = self.NODE_LABELS[node_type]
+                        id_property = self.NODE_ID_PROPERTIES[node_type]
+                        is_gene = node_type == PrimeKGNodeType.GENE_PROTEIN
+                        header = [
+                            "node_index:ID(PrimeKGNode)",
+                            "node_id",
+                            "node_type",
+                            "name",
+                            "source",
+                            id_property,
+                            "imported_at:datetime",
+                            ":LABEL",
+                        ] + (["symbol"] if is_gene else [])
+                        out = writer_for(f"nodes_{label}", header, files.node_files)
+                        for n in nodes:
+                            out.writerow(
+                                [
+                                    n["node_index"],
+                                    n["node_id"],
+                                    n["node_type"],
+                                    n["node_name"],
+                                    n["node_source"],
+                                    n["node_id"],
+                                    imported_at,
+                                    f"PrimeKGNode;{label}",
+                                ]
+                                + ([n["node_name"]] if is_gene else [])
+                            )
+                        files.nodes_written += len(nodes)
+            finally:
+                reader.close()
+
+            reader = _CSVChunkReader(edges_file)
+            try:
+                while (chunk := reader.read(self.edge_batch_size)) is not None:
+                    grouped, invalid = self._transform_edges(chunk.rows)
+                    files.invalid_records += invalid
+                    for rel_type, edges in grouped.items():
+                        header = [
+                            ":START_ID(PrimeKGNode)",
+                            ":END_ID(PrimeKGNode)",
+                            "relation",
+                            "created_at:datetime",
+                            ":TYPE",
+                        ]
+                        out = writer_for(f"edges_{rel_type}", header, files.relationship_files)
+                        for e in edges:
+                            out.writerow(
+                                [e["x_index"], e["y_index"], e["relation"], imported_at, rel_type]
+                            )
+                        files.relationships_written += len(edges)
+            finally:
+                reader.close()
+        finally:
+            for handle in handles.values():
+                handle.close()
+
+        return files
 
     # =========================================================================
     # Full Import
@@ -690,20 +921,31 @@ class PrimeKGImportService:
     # Progress Persistence
     # =========================================================================
 
-    def _save_progress(self, progress: ImportProgress) -> None:
+    def _source_signature(self, path: Path) -> dict[str, Any]:
+        """Identify the file a byte offset belongs to."""
+        stat = path.stat()
+        return {"name": path.name, "size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+    def _save_progress(self, progress: ImportProgress, source: dict[str, Any]) -> None:
         """Save progress to file for resume capability."""
         try:
             self.progress_file.parent.mkdir(parents=True, exist_ok=True)
 
             data = {
                 "phase": progress.phase,
+                "source": source,
+                "byte_offset": progress.byte_offset,
                 "current_batch": progress.current_batch,
                 "imported_records": progress.imported_records,
+                "failed_records": progress.failed_records,
                 "timestamp": datetime.now(UTC).isoformat(),
             }
 
-            with open(self.progress_file, "w") as f:
+            # Replace atomically so a crash never leaves a torn checkpoint
+            tmp_path = self.progress_file.with_suffix(self.progress_file.suffix + ".tmp")
+            with open(tmp_path, "w") as f:
                 json.dump(data, f)
+            os.replace(tmp_path, self.progress_file)
 
         except (OSError, ValueError, TypeError) as e:
             logger.warning("primekg_progress_save_error", error=str(e))
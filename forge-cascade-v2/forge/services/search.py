@@ -14,6 +14,12 @@ in the Forge system.
 from __future__ import annotations
 
 import asyncio
+import base64
+import hashlib
+import json
+import re
+import time
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from enum import Enum
@@ -27,6 +33,8 @@ from forge.services.embedding import (
     EmbeddingService,
     get_embedding_service,
 )
+from forge.services.text_index import CapsuleTextIndex
+from forge.services.vector_index import CapsuleVectorIndex, VectorIndexError
 
 logger = structlog.get_logger(__name__)
 
@@ -78,6 +86,9 @@ class SearchRequest:
     min_score: float = 0.5  # Minimum similarity score
     boost_recent: bool = True  # Boost recently created capsules
     boost_popular: bool = True  # Boost high view/fork count capsules
+    cursor: str | None = None  # Opaque cursor from a previous hybrid response
+    semantic_weight: float = 1.0  # Hybrid fusion weight of the semantic ranking
+    keyword_weight: float = 1.0  # Hybrid fusion weight of the keyword ranking
 
 
 @dataclass
@@ -122,6 +133,7 @@ class SearchResponse:
     total: int
     took_ms: float
     filters_applied: dict[str, Any]
+    next_cursor: str | None = None  # Set when a hybrid search has more pages
 
     def to_dict(self) -> dict[str, Any]:
         return {
@@ -131,17 +143,30 @@ class SearchResponse:
             "total": self.total,
             "took_ms": self.took_ms,
             "filters_applied": self.filters_applied,
+            "next_cursor": self.next_cursor,
         }
 
 
+@dataclass
+class _FusedRanking:
+    """Fused hybrid ranking kept between cursor pages."""
+
+    entries: list[tuple[str, float, str]]  # (capsule_id, score, match_type)
+    search_terms: list[str]
+    created_at: float = field(default_factory=time.monotonic)
+
+
 class SearchService:
     """
     Search service for Forge capsules.
 
     Provides semantic search using vector embeddings with support for:
-    - Semantic similarity search (primary mode)
-    - Keyword fallback for when semantic search returns few results
-    - Hybrid mode combining both approaches
+    - Semantic similarity search (primary mode), served from an in-process
+      vector index when one is attached, otherwise from Neo4j
+    - BM25 keyword search, served from an in-process inverted index when
+      one is attached, otherwise from the Neo4j full-text index
+    - Hybrid mode fusing both rankings with reciprocal rank fusion, with
+      cursor pagination over the cached fused ranking
     - Result ranking with recency and popularity boosts
 
     Usage:
@@ -157,15 +182,48 @@ class SearchService:
         ))
     """
 
+    # Capsule fields returned by search queries
+    _CAPSULE_PROJECTION = """capsule {
+            id: capsule.id,
+            title: capsule.title,
+            content: capsule.content,
+            type: capsule.type,
+            owner_id: capsule.owner_id,
+            trust_level: capsule.trust_level,
+            version: capsule.version,
+            tags: capsule.tags,
+            metadata: capsule.metadata,
+            view_count: capsule.view_count,
+            fork_count: capsule.fork_count,
+            is_archived: capsule.is_archived,
+            created_at: capsule.created_at,
+            updated_at: capsule.updated_at
+        }"""
+
+    # Reciprocal rank fusion constant; damps the weight of the top ranks
+    _RRF_K = 60
+
+    # Minimum candidates taken from each backend for hybrid fusion
+    _FUSION_DEPTH = 200
+
+    # Fused rankings kept for cursor pagination
+    _FUSED_CACHE_SIZE = 256
+    _FUSED_CACHE_TTL_SECONDS = 300.0
+
     def __init__(
         self,
         embedding_service: EmbeddingService | None = None,
         capsule_repo: Any | None = None,  # CapsuleRepository
         db_client: Any | None = None,  # Neo4jClient for direct queries
+        vector_index: CapsuleVectorIndex | None = None,
+        text_index: CapsuleTextIndex | None = None,
     ):
         self._embedding_service = embedding_service or get_embedding_service()
         self._capsule_repo = capsule_repo
         self._db = db_client
+        self._vector_index = vector_index
+        self._text_index = text_index
+        self._fused_cache: OrderedDict[str, _FusedRanking] = OrderedDict()
 
         logger.info(
             "search_service_initialized",
@@ -182,28 +240,27 @@ class SearchService:
         Returns:
             SearchResponse with results
         """
-        import time
-
         start_time = time.monotonic()
 
         results: list[SearchResultItem] = []
+        next_cursor: str | None = None
 
         try:
-            if request.mode == SearchMode.SEMANTIC:
-                results = await self._semantic_search(request)
-            elif request.mode == SearchMode.KEYWORD:
-                results = await self._keyword_search(request)
-            elif request.mode == SearchMode.HYBRID:
-                results = await self._hybrid_search(request)
-            elif request.mode == SearchMode.EXACT:
-                results = await self._exact_search(request)
+            if request.mode == SearchMode.HYBRID:
+                # Hybrid search pages and boosts on its own
+                results, next_cursor = await self._hybrid_search(request)
             else:
-                results = await self._semantic_search(request)
-
-            # Apply post-processing
-            results = self._apply_boosts(results, request)
-            results = self._filter_by_score(results, request.min_score)
-            results = results[request.offset : request.offset + request.limit]
+                if request.mode == SearchMode.KEYWORD:
+                    results = await self._keyword_search(request)
+                elif request.mode == SearchMode.EXACT:
+                    results = await self._exact_search(request)
+                else:
+                    results = await self._semantic_search(request)
+
+                # Apply post-processing
+                results = self._apply_boosts(results, request)
+                results = self._filter_by_score(results, request.min_score)
+                results = results[request.offset : request.offset + request.limit]
 
         except (RuntimeError, ValueError, TypeError, OSError, ConnectionError) as e:
             # SECURITY FIX (Audit 3): Truncate search query in error logs to prevent sensitive data leakage
@@ -231,6 +288,7 @@ class SearchService:
             total=len(results),
             took_ms=took_ms,
             filters_applied=request.filters.to_dict(),
+            next_cursor=next_cursor,
         )
 
     async def _semantic_search(self, request: SearchRequest) -> list[SearchResultItem]:
@@ -239,6 +297,14 @@ class SearchService:
         embedding_result = await self._embedding_service.embed(request.query)
         query_embedding = embedding_result.embedding
 
+        # In-process index pre-filters before scoring, so filtered queries
+        # are not short. Neo4j stays the fallback and source of truth.
+        if self._vector_index is not None and len(self._vector_index) > 0:
+            try:
+                return await self._semantic_search_index(query_embedding, request)
+            except VectorIndexError as e:
+                logger.warning("vector_index_search_failed", error=str(e))
+
         # SECURITY FIX (Audit 4): Use direct search when multiple types/owners
         # are specified. The repository path only supports single type/owner,
         # so fall back to direct search which handles multiple values properly.
@@ -279,62 +345,131 @@ class SearchService:
 
         return []
 
-    async def _semantic_search_direct(
+    async def _semantic_search_index(
         self,
         query_embedding: list[float],
         request: SearchRequest,
     ) -> list[SearchResultItem]:
-        """Direct semantic search via Neo4j vector index."""
-        # Build filter conditions
+        """Semantic search via the in-process vector index."""
+        if self._vector_index is None:
+            return []
+
+        filters = request.filters
+        hits = await asyncio.to_thread(
+            self._vector_index.search,
+            query_embedding,
+            k=(request.offset + request.limit) * 2,  # Headroom for boosts and min_score
+            min_trust=filters.min_trust,
+            max_trust=filters.max_trust,
+            capsule_types=[t.value for t in filters.capsule_types]
+            if filters.capsule_types
+            else None,
+            owner_ids=filters.owner_ids,
+            tags=filters.tags,
+            include_archived=filters.include_archived,
+            created_after=filters.created_after,
+            created_before=filters.created_before,
+        )
+        if not hits:
+            return []
+
+        capsules = await self._load_capsules([hit.capsule_id for hit in hits])
+
+        # Capsules deleted since they were indexed are skipped
+        return [
+            SearchResultItem(
+                capsule=capsules[hit.capsule_id],
+                score=hit.score,
+                highlights=[],
+                match_type="semantic",
+            )
+            for hit in hits
+            if hit.capsule_id in capsules
+        ]
+
+    async def _load_capsules(self, capsule_ids: list[str]) -> dict[str, Capsule]:
+        """Fetch capsules by ID in one round trip when a database client is available."""
+        if self._db is not None:
+            query = f"""
+            MATCH (capsule:Capsule)
+            WHERE capsule.id IN $ids
+            RETURN {self._CAPSULE_PROJECTION} AS capsule
+            """
+            try:
+                records = await self._db.execute(query, {"ids": capsule_ids})
+            except (RuntimeError, ValueError, TypeError, OSError, ConnectionError) as e:
+                logger.warning("capsule_hydration_failed", error=str(e))
+                return {}
+            capsules = [self._dict_to_capsule(r["capsule"]) for r in records if r.get("capsule")]
+            return {c.id: c for c in capsules}
+
+        if self._capsule_repo is not None:
+            loaded = await asyncio.gather(
+                *(self._capsule_repo.get_by_id(capsule_id) for capsule_id in capsule_ids)
+            )
+            return {c.id: c for c in loaded if c is not None}
+
+        return {}
+
+    def _filter_clauses(
+        self,
+        filters: SearchFilters,
+        params: dict[str, Any],
+        tags: bool = True,
+    ) -> str:
+        """
+        Build the Cypher WHERE clause for search filters.
+
+        Args:
+            filters: Filters from the search request
+            params: Query parameters, updated in place with filter values
+            tags: Whether to apply the tag filter
+
+        Returns:
+            Conditions joined with AND, over the ``capsule`` variable
+        """
         where_clauses = [
             "capsule.trust_level >= $min_trust",
             "capsule.trust_level <= $max_trust",
         ]
-        params: dict[str, Any] = {
-            "embedding": query_embedding,
-            "limit": request.limit * 2,
-            "min_trust": request.filters.min_trust,
-            "max_trust": request.filters.max_trust,
-        }
+        params["min_trust"] = filters.min_trust
+        params["max_trust"] = filters.max_trust
 
-        if not request.filters.include_archived:
+        if not filters.include_archived:
             where_clauses.append("capsule.is_archived = false")
 
-        if request.filters.capsule_types:
+        if filters.capsule_types:
             where_clauses.append("capsule.type IN $types")
-            params["types"] = [t.value for t in request.filters.capsule_types]
+            params["types"] = [t.value for t in filters.capsule_types]
 
-        if request.filters.owner_ids:
+        if filters.owner_ids:
             where_clauses.append("capsule.owner_id IN $owner_ids")
-            params["owner_ids"] = request.filters.owner_ids
+            params["owner_ids"] = filters.owner_ids
 
-        if request.filters.tags:
+        if tags and filters.tags:
             # Match any tag
             where_clauses.append("ANY(tag IN $tags WHERE tag IN capsule.tags)")
-            params["tags"] = request.filters.tags
+            params["tags"] = filters.tags
+
+        return " AND ".join(where_clauses)
 
-        where_clause = " AND ".join(where_clauses)
+    async def _semantic_search_direct(
+        self,
+        query_embedding: list[float],
+        request: SearchRequest,
+    ) -> list[SearchResultItem]:
+        """Direct semantic search via Neo4j vector index."""
+        params: dict[str, Any] = {
+            "embedding": query_embedding,
+            "limit": request.limit * 2,
+        }
+        where_clause = self._filter_clauses(request.filters, params)
 
         query = f"""
         CALL db.index.vector.queryNodes('capsule_embeddings', $limit, $embedding)
         YIELD node AS capsule, score
         WHERE {where_clause}
-        RETURN capsule {{
-            id: capsule.id,
-            title: capsule.title,
-            content: capsule.content,
-            type: capsule.type,
-            owner_id: capsule.owner_id,
-            trust_level: capsule.trust_level,
-            version: capsule.version,
-            tags: capsule.tags,
-            metadata: capsule.metadata,
-            view_count: capsule.view_count,
-            fork_count: capsule.fork_count,
-            is_archived: capsule.is_archived,
-            created_at: capsule.created_at,
-            updated_at: capsule.updated_at
-        }} AS capsule, score
+        RETURN {self._CAPSULE_PROJECTION} AS capsule, score
         ORDER BY score DESC
         """
 
@@ -361,106 +496,381 @@ class SearchService:
             )
             return []
 
-    def _escape_regex_metacharacters(self, text: str) -> str:
-        """
-        SECURITY FIX (Audit 4 - M20): Escape regex metacharacters in user input.
+    # Lucene query syntax characters, escaped in user input
+    _LUCENE_SPECIAL = re.compile(r'([+\-!(){}\[\]^"~*?:\\/]|&&|\|\|)')
 
-        Prevents regex injection attacks where users could inject malicious
-        regex patterns that cause ReDoS or unexpected behavior.
+    def _to_lucene_query(self, text: str) -> str:
         """
-        import re
+        Build a Lucene query from user input.
 
-        # Escape all regex metacharacters
-        return re.escape(text)
+        SECURITY FIX (Audit 4 - M20): User input is escaped so it cannot
+        inject query operators. Quoted phrases are kept as phrase queries,
+        and bare words are lowercased so AND/OR/NOT are plain terms.
+        """
+        parts = [
+            '"' + self._LUCENE_SPECIAL.sub(r"\\\1", phrase) + '"'
+            for phrase in re.findall(r'"([^"]+)"', text)
+        ]
+        remainder = re.sub(r'"[^"]*"', " ", text)
+        parts.extend(self._LUCENE_SPECIAL.sub(r"\\\1", term.lower()) for term in remainder.split())
+        return " ".join(p for p in parts if p.strip('"'))
 
     async def _keyword_search(self, request: SearchRequest) -> list[SearchResultItem]:
         """
-        Perform keyword/full-text search.
+        Perform keyword/full-text search with BM25 relevance.
 
-        SECURITY FIX (Audit 4 - M20): User input is now escaped to prevent
-        regex injection attacks.
+        Uses the in-process text index when attached, otherwise the Neo4j
+        full-text index. Scores are BM25 normalised to the best hit.
         """
+        if self._text_index is not None and len(self._text_index) > 0:
+            return await self._keyword_search_index(request)
+
         if not self._db:
             return []
 
-        # SECURITY FIX: Escape regex metacharacters in each search term
-        search_terms = request.query.split()
-        escaped_terms = [self._escape_regex_metacharacters(term) for term in search_terms]
-        search_pattern = "|".join(f"(?i).*{term}.*" for term in escaped_terms)
+        lucene_query = self._to_lucene_query(request.query)
+        if not lucene_query:
+            return []
 
-        where_clauses = [
-            "(capsule.content =~ $pattern OR capsule.title =~ $pattern)",
-            "capsule.trust_level >= $min_trust",
-        ]
         params: dict[str, Any] = {
-            "pattern": search_pattern,
-            "limit": request.limit,
-            "min_trust": request.filters.min_trust,
+            "query": lucene_query,
+            "limit": request.offset + request.limit,
         }
-
-        if not request.filters.include_archived:
-            where_clauses.append("capsule.is_archived = false")
-
-        where_clause = " AND ".join(where_clauses)
+        where_clause = self._filter_clauses(request.filters, params, tags=False)
 
         query = f"""
-        MATCH (capsule:Capsule)
+        CALL db.index.fulltext.queryNodes('capsule_fulltext_idx', $query)
+        YIELD node AS capsule, score
         WHERE {where_clause}
-        RETURN capsule {{.*}} AS capsule
-        ORDER BY capsule.view_count DESC, capsule.created_at DESC
+        RETURN capsule {{.*}} AS capsule, score
+        ORDER BY score DESC
         LIMIT $limit
         """
 
+        search_terms = re.sub(r'"', " ", request.query).split()
         try:
-            results = await self._db.execute(query, params)
-
-            return [
-                SearchResultItem(
-                    capsule=self._dict_to_capsule(r["capsule"]),
-                    score=0.8,  # Fixed score for keyword matches
-                    highlights=self._extract_highlights(
-                        r["capsule"].get("content", ""),
-                        search_terms,
-                    ),
-                    match_type="keyword",
-                )
-                for r in results
-                if r.get("capsule")
-            ]
+            results = [r for r in await self._db.execute(query, params) if r.get("capsule")]
         except (RuntimeError, ValueError, TypeError, OSError, ConnectionError) as e:
-            logger.warning("keyword_search_failed", error=str(e))
+            logger.warning(
+                "keyword_search_failed",
+                error=str(e),
+                hint="Full-text index may not be available",
+            )
             return []
 
-    async def _hybrid_search(self, request: SearchRequest) -> list[SearchResultItem]:
-        """Combine semantic and keyword search."""
-        # Run both searches in parallel
-        semantic_task = self._semantic_search(request)
-        keyword_task = self._keyword_search(request)
+        top_score = max((r["score"] for r in results), default=0.0) or 1.0
+        return [
+            SearchResultItem(
+                capsule=self._dict_to_capsule(r["capsule"]),
+                score=r["score"] / top_score,
+                highlights=self._extract_highlights(
+                    r["capsule"].get("content", ""),
+                    search_terms,
+                ),
+                match_type="keyword",
+            )
+            for r in results
+        ]
 
-        semantic_results, keyword_results = await asyncio.gather(semantic_task, keyword_task)
+    async def _keyword_search_index(self, request: SearchRequest) -> list[SearchResultItem]:
+        """Keyword search via the in-process BM25 index."""
+        if self._text_index is None:
+            return []
 
-        # Merge results, preferring semantic matches
-        seen_ids = set()
-        merged = []
+        filters = request.filters
+        hits = await asyncio.to_thread(
+            self._text_index.search,
+            request.query,
+            k=request.offset + request.limit,
+            min_trust=filters.min_trust,
+            max_trust=filters.max_trust,
+            capsule_types=[t.value for t in filters.capsule_types]
+            if filters.capsule_types
+            else None,
+            owner_ids=filters.owner_ids,
+            include_archived=filters.include_archived,
+        )
+        if not hits:
+            return []
 
-        # Add semantic results first
-        for result in semantic_results:
-            if result.capsule.id not in seen_ids:
-                seen_ids.add(result.capsule.id)
-                merged.append(result)
+        capsules = await self._load_capsules([hit.capsule_id for hit in hits])
+        top_score = hits[0].score or 1.0
 
-        # Add keyword results that weren't in semantic
-        for result in keyword_results:
-            if result.capsule.id not in seen_ids:
-                seen_ids.add(result.capsule.id)
-                # Slightly lower score for keyword-only matches
-                result.score *= 0.9
-                merged.append(result)
+        return [
+            SearchResultItem(
+                capsule=capsules[hit.capsule_id],
+                score=hit.score / top_score,
+                highlights=hit.highlights(capsules[hit.capsule_id].content),
+                match_type="keyword",
+            )
+            for hit in hits
+            if hit.capsule_id in capsules
+        ]
 
-        # Re-sort by score
-        merged.sort(key=lambda r: r.score, reverse=True)
+    async def _hybrid_search(
+        self,
+        request: SearchRequest,
+    ) -> tuple[list[SearchResultItem], str | None]:
+        """
+        Combine semantic and keyword search with reciprocal rank fusion.
+
+        Both backends return ranked capsule IDs only. The fused ranking is
+        cached, so following pages with the returned cursor neither re-run
+        the backends nor re-hydrate earlier pages; a request without a
+        cursor always fuses a fresh ranking. Only the capsules on the
+        requested page are loaded, in one batched query.
+
+        Args:
+            request: Search request; ``cursor`` selects a later page
+
+        Returns:
+            Tuple of (page results, cursor for the next page or None)
+        """
+        key = self._fusion_key(request)
+        offset = request.offset
+        if request.cursor:
+            cursor_key, offset = self._decode_cursor(request.cursor)
+            if cursor_key != key:
+                raise ValueError("Search cursor does not match this query")
+
+        # Only cursor pages reuse a cached ranking; a first page is always
+        # fused fresh so it reflects capsules created or deleted since
+        ranking = self._get_fused_ranking(key) if request.cursor else None
+        if ranking is None:
+            depth = max(self._FUSION_DEPTH, (offset + request.limit) * 2)
+            ranking = await self._fuse_rankings(request, depth)
+            self._put_fused_ranking(key, ranking)
+
+        page = ranking.entries[offset : offset + request.limit]
+        capsules = await self._load_capsules([capsule_id for capsule_id, _, _ in page])
+
+        # Capsules deleted since they were ranked are skipped
+        results = [
+            SearchResultItem(
+                capsule=capsules[capsule_id],
+                score=score,
+                highlights=self._extract_highlights(
+                    capsules[capsule_id].content, ranking.search_terms
+                )
+                if match_type != "semantic"
+                else [],
+                match_type=match_type,
+            )
+            for capsule_id, score, match_type in page
+            if capsule_id in capsules
+        ]
+
+        # Boosts reorder within the page; the fused ranking fixes page order
+        results = self._apply_boosts(results, request)
+
+        next_offset = offset + request.limit
+        next_cursor = (
+            self._encode_cursor(key, next_offset) if next_offset < len(ranking.entries) else None
+        )
+        return results, next_cursor
+
+    async def _fuse_rankings(self, request: SearchRequest, depth: int) -> _FusedRanking:
+        """
+        Run both backends and fuse their rankings.
+
+        Each capsule scores sum(weight / (k + rank)) over the rankings it
+        appears in, normalised so a capsule ranked first by both scores 1.0.
+        ``min_score`` applies to semantic similarity before fusion; keyword
+        scores are relative to the best hit and are not thresholded.
+        """
+        semantic, keyword = await asyncio.gather(
+            self._semantic_candidates(request, depth),
+            self._keyword_candidates(request, depth),
+        )
+        semantic = [(cid, score) for cid, score in semantic if score >= request.min_score]
+
+        fused: dict[str, float] = {}
+        sources: dict[str, set[str]] = {}
+        for source, candidates, weight in (
+            ("semantic", semantic, request.semantic_weight),
+            ("keyword", keyword, request.keyword_weight),
+        ):
+            for rank, (capsule_id, _) in enumerate(candidates, start=1):
+                fused[capsule_id] = fused.get(capsule_id, 0.0) + weight / (self._RRF_K + rank)
+                sources.setdefault(capsule_id, set()).add(source)
+
+        best_possible = (request.semantic_weight + request.keyword_weight) / (self._RRF_K + 1)
+        scale = 1.0 / best_possible if best_possible > 0 else 1.0
+
+        entries = [
+            (
+                capsule_id,
+                min(1.0, score * scale),
+                "hybrid" if len(sources[capsule_id]) > 1 else next(iter(sources[capsule_id])),
+            )
+            for capsule_id, score in fused.items()
+        ]
+        entries.sort(key=lambda e: e[1], reverse=True)
+
+        return _FusedRanking(
+            entries=entries,
+            search_terms=re.sub(r'"', " ", request.query).split(),
+        )
+
+    async def _semantic_candidates(
+        self,
+        request: SearchRequest,
+        depth: int,
+    ) -> list[tuple[str, float]]:
+        """Ranked (capsule_id, similarity) pairs without loading capsule bodies."""
+        embedding_result = await self._embedding_service.embed(request.query)
+        query_embedding = embedding_result.embedding
+        filters = request.filters
+
+        if self._vector_index is not None and len(self._vector_index) > 0:
+            try:
+                hits = await asyncio.to_thread(
+                    self._vector_index.search,
+                    query_embedding,
+                    k=depth,
+                    min_trust=filters.min_trust,
+                    max_trust=filters.max_trust,
+                    capsule_types=[t.value for t in filters.capsule_types]
+                    if filters.capsule_types
+                    else None,
+                    owner_ids=filters.owner_ids,
+                    tags=filters.tags,
+                    include_archived=filters.include_archived,
+                    created_after=filters.created_after,
+                    created_before=filters.created_before,
+                )
+                return [(hit.capsule_id, hit.score) for hit in hits]
+            except VectorIndexError as e:
+                logger.warning("vector_index_search_failed", error=str(e))
+
+        if self._db is not None:
+            params: dict[str, Any] = {"embedding": query_embedding, "limit": depth}
+            where_clause = self._filter_clauses(filters, params)
+            query = f"""
+            CALL db.index.vector.queryNodes('capsule_embeddings', $limit, $embedding)
+            YIELD node AS capsule, score
+            WHERE {where_clause}
+            RETURN capsule.id AS id, score
+            ORDER BY score DESC
+            """
+            try:
+                records = await self._db.execute(query, params)
+            except (RuntimeError, ValueError, TypeError, OSError, ConnectionError) as e:
+                logger.warning("semantic_candidates_failed", error=str(e))
+                return []
+            return [(r["id"], r["score"]) for r in records if r.get("id")]
 
-        return merged
+        if self._capsule_repo is not None:
+            search_results = await self._capsule_repo.semantic_search(
+                query_embedding=query_embedding,
+                limit=depth,
+                min_trust=filters.min_trust,
+                capsule_type=filters.capsule_types[0] if filters.capsule_types else None,
+                owner_id=filters.owner_ids[0] if filters.owner_ids else None,
+            )
+            return [(r.capsule.id, r.score) for r in search_results]
+
+        return []
+
+    async def _keyword_candidates(
+        self,
+        request: SearchRequest,
+        depth: int,
+    ) -> list[tuple[str, float]]:
+        """Ranked (capsule_id, relative BM25) pairs without loading capsule bodies."""
+        filters = request.filters
+
+        if self._text_index is not None and len(self._text_index) > 0:
+            hits = await asyncio.to_thread(
+                self._text_index.search,
+                request.query,
+                k=depth,
+                min_trust=filters.min_trust,
+                max_trust=filters.max_trust,
+                capsule_types=[t.value for t in filters.capsule_types]
+                if filters.capsule_types
+                else None,
+                owner_ids=filters.owner_ids,
+                include_archived=filters.include_archived,
+            )
+            top_score = hits[0].score if hits and hits[0].score else 1.0
+            return [(hit.capsule_id, hit.score / top_score) for hit in hits]
+
+        if self._db is None:
+            return []
+
+        lucene_query = self._to_lucene_query(request.query)
+        if not lucene_query:
+            return []
+
+        params: dict[str, Any] = {"query": lucene_query, "limit": depth}
+        where_clause = self._filter_clauses(filters, params, tags=False)
+        query = f"""
+        CALL db.index.fulltext.queryNodes('capsule_fulltext_idx', $query)
+        YIELD node AS capsule, score
+        WHERE {where_clause}
+        RETURN capsule.id AS id, score
+        ORDER BY score DESC
+        LIMIT $limit
+        """
+        try:
+            records = [r for r in await self._db.execute(query, params) if r.get("id")]
+        except (RuntimeError, ValueError, TypeError, OSError, ConnectionError) as e:
+            logger.warning("keyword_candidates_failed", error=str(e))
+            return []
+
+        top_score = max((r["score"] for r in records), default=0.0) or 1.0
+        return [(r["id"], r["score"] / top_score) for r in records]
+
+    def _fusion_key(self, request: SearchRequest) -> str:
+        """Key identifying the fused ranking of a hybrid request."""
+        payload = json.dumps(
+            {
+                "query": request.query,
+                "filters": request.filters.to_dict(),
+                "min_score": request.min_score,
+                "weights": [request.semantic_weight, request.keyword_weight],
+            },
+            sort_keys=True,
+        )
+        return hashlib.sha256(payload.encode()).hexdigest()[:32]
+
+    def _get_fused_ranking(self, key: str) -> _FusedRanking | None:
+        """Return a cached fused ranking unless it has expired."""
+        ranking = self._fused_cache.get(key)
+        if ranking is None:
+            return None
+        if time.monotonic() - ranking.created_at > self._FUSED_CACHE_TTL_SECONDS:
+            del self._fused_cache[key]
+            return None
+        self._fused_cache.move_to_end(key)
+        return ranking
+
+    def _put_fused_ranking(self, key: str, ranking: _FusedRanking) -> None:
+        """Cache a fused ranking, evicting the least recently used."""
+        self._fused_cache[key] = ranking
+        self._fused_cache.move_to_end(key)
+        while len(self._fused_cache) > self._FUSED_CACHE_SIZE:
+            self._fused_cache.popitem(last=False)
+
+    @staticmethod
+    def _encode_cursor(key: str, offset: int) -> str:
+        """Encode an opaque pagination cursor."""
+        raw = json.dumps({"k": key, "o": offset}, separators=(",", ":")).encode()
+        return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+    @staticmethod
+    def _decode_cursor(cursor: str) -> tuple[str, int]:
+        """Decode a pagination cursor into (fusion key, offset)."""
+        try:
+            padded = cursor + "=" * (-len(cursor) % 4)
+            data = json.loads(base64.urlsafe_b64decode(padded.encode()))
+            key, offset = data["k"], data["o"]
+        except (ValueError, TypeError, KeyError) as e:
+            raise ValueError("Invalid search cursor") from e
+        if not isinstance(key, str) or not isinstance(offset, int) or offset < 0:
+            raise ValueError("Invalid search cursor")
+        return key, offset
 
     async def _exact_search(self, request: SearchRequest) -> list[SearchResultItem]:
         """Search for exact content match."""
@@ -640,6 +1050,8 @@ def init_search_service(
     embedding_service: EmbeddingService | None = None,
     capsule_repo: Any | None = None,
     db_client: Any | None = None,
+    vector_index: CapsuleVectorIndex | None = None,
+    text_index: CapsuleTextIndex | None = None,
 ) -> SearchService:
     """Initialize the global search service."""
     global _search_service
@@ -647,6 +1059,8 @@ def init_search_service(
         embedding_service=embedding_service,
         capsule_repo=capsule_repo,
         db_client=db_client,
+        vector_index=vector_index,
+        text_index=text_index,
     )
     return _search_service
 
@@ -0,0 +1,530 @@
+"""
+Forge Cascade V2 - In-Process Full-Text Index
+
+Positional inverted index over capsule titles and content with BM25
+ranking, used as the keyword backend for search. Like the vector index,
+it is a replica of Neo4j kept in sync from capsule events and rebuilt
+from the database on demand.
+
+Design:
+- Text is tokenized on word characters, lowercased, stop words dropped
+  and a light suffix-stripping stemmer applied, for documents and
+  queries alike.
+- Postings map term -> document -> token positions, so quoted phrase
+  queries are answered from positions alone.
+- Each document keeps the character offset of every token, so
+  highlights are cut straight from the matched offsets without
+  re-scanning the content.
+- Scores are BM25 with title matches boosted (BM25F-style weighted
+  term frequency).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import math
+import re
+import threading
+from array import array
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+import structlog
+
+if TYPE_CHECKING:
+    from forge.models.events import Event
+
+logger = structlog.get_logger(__name__)
+
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+_PHRASE_RE = re.compile(r'"([^"]+)"')
+
+STOP_WORDS = frozenset(
+    """
+    a an and are as at be but by for from has have in into is it its of on or
+    that the their then there these they this to was were will with
+    """.split()
+)
+
+# Suffixes stripped by the stemmer, longest first
+_SUFFIXES = (
+    "ational",
+    "ization",
+    "fulness",
+    "iveness",
+    "ations",
+    "ation",
+    "ments",
+    "ness",
+    "ment",
+    "ings",
+    "ing",
+    "ies",
+    "ied",
+    "ers",
+    "er",
+    "ed",
+    "ly",
+    "s",
+)
+
+
+def stem(token: str) -> str:
+    """
+    Reduce a lowercase token to its stem.
+
+    A deliberately small suffix stripper: it keeps at least three
+    characters of stem and maps "-ies/-ied" to "-y", which covers the
+    common English inflections without a language-data dependency.
+    """
+    if len(token) <= 3 or token.isdigit():
+        return token
+    for suffix in _SUFFIXES:
+        if token.endswith(suffix) and len(token) - len(suffix) >= 3:
+            if suffix in ("ies", "ied"):
+                return token[: -len(suffix)] + "y"
+            if suffix == "s" and token.endswith("ss"):
+                return token
+            if suffix == "s" and token.endswith("sses"):
+                return token[:-2]
+            stemmed = token[: -len(suffix)]
+            # "running" -> "runn" -> "run"
+            if len(stemmed) > 3 and stemmed[-1] == stemmed[-2] and stemmed[-1] not in "lsz":
+                stemmed = stemmed[:-1]
+            return stemmed
+    return token
+
+
+def tokenize(text: str) -> list[tuple[int, str, int, int]]:
+    """
+    Split text into index terms.
+
+    Returns:
+        (position, term, start_char, end_char) for every non-stop-word
+        token. Positions count stop words too, so phrases keep their gaps.
+    """
+    terms = []
+    for position, match in enumerate(_TOKEN_RE.finditer(text)):
+        word = match.group().lower()
+        if word in STOP_WORDS:
+            continue
+        terms.append((position, stem(word), match.start(), match.end()))
+    return terms
+
+
+@dataclass
+class TextSearchHit:
+    """A single full-text search hit."""
+
+    capsule_id: str
+    score: float
+    # (start, end) character spans of matched tokens in the content
+    content_spans: list[tuple[int, int]] = field(default_factory=list)
+
+    def highlights(self, content: str, context_chars: int = 100, limit: int = 3) -> list[str]:
+        """Cut snippets around the matched spans of ``content``."""
+        # Merge spans that fall inside one snippet window
+        windows: list[list[int]] = []
+        for start, end in self.content_spans:
+            if windows and start < windows[-1][1]:
+                windows[-1][1] = max(windows[-1][1], end + context_chars)
+            else:
+                windows.append([start - context_chars, end + context_chars])
+
+        snippets: list[str] = []
+        for lo, hi in windows[:limit]:
+            lo, hi = max(0, lo), min(len(content), hi)
+            snippet = content[lo:hi]
+            if lo > 0:
+                snippet = "..." + snippet
+            if hi < len(content):
+                snippet = snippet + "..."
+            snippets.append(snippet)
+        return snippets
+
+
+@dataclass
+class _Document:
+    capsule_id: str
+    title_tokens: int  # Positions below this are in the title
+    length: float  # Weighted length for BM25 normalisation
+    # Character offsets (start, end) per content position
+    content_starts: array[int]
+    content_ends: array[int]
+    content_offset: int  # Position of the first content token
+    trust_level: int
+    capsule_type: str
+    owner_id: str
+    is_archived: bool
+
+
+class CapsuleTextIndex:
+    """
+    BM25 inverted index over capsule title and content.
+
+    All public methods are thread-safe.
+
+    Usage:
+        index = CapsuleTextIndex()
+        index.upsert("cap-1", title="Async Python", content="...")
+
+        hits = index.search('"event loop" asyncio', k=10)
+    """
+
+    def __init__(self, k1: float = 1.2, b: float = 0.75, title_boost: float = 2.0):
+        self._k1 = k1
+        self._b = b
+        self._title_boost = title_boost
+        self._lock = threading.RLock()
+
+        self._docs: dict[int, _Document] = {}
+        self._rows: dict[str, int] = {}
+        self._next_row = 0
+        self._postings: dict[str, dict[int, array[int]]] = {}
+        self._doc_terms: dict[int, list[str]] = {}
+        self._total_length = 0.0
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __contains__(self, capsule_id: object) -> bool:
+        return capsule_id in self._rows
+
+    # =========================================================================
+    # Mutation
+    # =========================================================================
+
+    def upsert(
+        self,
+        capsule_id: str,
+        title: str | None,
+        content: str,
+        trust_level: int = 60,
+        capsule_type: str = "knowledge",
+        owner_id: str = "",
+        is_archived: bool = False,
+    ) -> None:
+        """Index or re-index a capsule."""
+        title_terms = tokenize(title or "")
+        content_terms = tokenize(content or "")
+        # Content positions start after the title plus a gap, so phrases never
+        # span the two fields
+        content_offset = (title_terms[-1][0] + 2) if title_terms else 0
+
+        with self._lock:
+            self._remove_locked(capsule_id)
+
+            row = self._next_row
+            self._next_row += 1
+
+            positions: dict[str, list[int]] = {}
+            for position, term, _, _ in title_terms:
+                positions.setdefault(term, []).append(position)
+            for position, term, _, _ in content_terms:
+                positions.setdefault(term, []).append(content_offset + position)
+
+            for term, term_positions in positions.items():
+                self._postings.setdefault(term, {})[row] = array("I", term_positions)
+            self._doc_terms[row] = list(positions)
+
+            # Map content positions back to character offsets for highlights
+            last_position = content_terms[-1][0] + 1 if content_terms else 0
+            starts = array("I", [0]) * last_position
+            ends = array("I", [0]) * last_position
+            for position, _, start, end in content_terms:
+                starts[position] = start
+                ends[position] = end
+
+            length = self._title_boost * len(title_terms) + len(content_terms)
+            self._docs[row] = _Document(
+                capsule_id=capsule_id,
+                title_tokens=content_offset,
+                length=length,
+                content_starts=starts,
+                content_ends=ends,
+                content_offset=content_offset,
+                trust_level=trust_level,
+                capsule_type=capsule_type.lower(),
+                owner_id=owner_id,
+                is_archived=is_archived,
+            )
+            self._rows[capsule_id] = row
+            self._total_length += length
+
+    def remove(self, capsule_id: str) -> bool:
+        """Remove a capsule. Returns False if it was absent."""
+        with self._lock:
+            return self._remove_locked(capsule_id)
+
+    def retain(self, capsule_ids: set[str]) -> int:
+        """Remove every capsule not in ``capsule_ids``. Returns the number removed."""
+        with self._lock:
+            stale = [capsule_id for capsule_id in self._rows if capsule_id not in capsule_ids]
+            for capsule_id in stale:
+                self._remove_locked(capsule_id)
+            return len(stale)
+
+    def _remove_locked(self, capsule_id: str) -> bool:
+        row = self._rows.pop(capsule_id, None)
+        if row is None:
+            return False
+        for term in self._doc_terms.pop(row, []):
+            postings = self._postings.get(term)
+            if postings is not None:
+                postings.pop(row, None)
+                if not postings:
+                    del self._postings[term]
+        doc = self._docs.pop(row)
+        self._total_length -= doc.length
+        return True
+
+    # =========================================================================
+    # Search
+    # =========================================================================
+
+    def search(
+        self,
+        query: str,
+        k: int = 10,
+        min_trust: int = 0,
+        max_trust: int = 100,
+        capsule_types: list[str] | None = None,
+        owner_ids: list[str] | None = None,
+        include_archived: bool = False,
+    ) -> list[TextSearchHit]:
+        """
+        Rank capsules against ``query`` with BM25.
+
+        Bare words match any document containing them; every quoted phrase
+        must appear verbatim (after stemming) for a document to match.
+
+        Returns:
+            Hits ordered by descending score
+        """
+        phrases = [
+            [(position, term) for position, term, _, _ in tokenize(p)]
+            for p in _PHRASE_RE.findall(query)
+        ]
+        phrases = [p for p in phrases if p]
+        bare = [term for _, term, _, _ in tokenize(_PHRASE_RE.sub(" ", query))]
+        terms = list(dict.fromkeys(bare + [term for phrase in phrases for _, term in phrase]))
+        if not terms:
+            return []
+
+        type_set = {t.lower() for t in capsule_types} if capsule_types else None
+        owner_set = set(owner_ids) if owner_ids else None
+
+        with self._lock:
+            n_docs = len(self._docs)
+            if n_docs == 0:
+                return []
+            avg_length = self._total_length / n_docs or 1.0
+
+            scores: dict[int, float] = {}
+            for term in terms:
+                postings = self._postings.get(term)
+                if not postings:
+                    continue
+                idf = math.log(1 + (n_docs - len(postings) + 0.5) / (len(postings) + 0.5))
+                for row, term_positions in postings.items():
+                    doc = self._docs[row]
+                    tf = sum(
+                        self._title_boost if p < doc.title_tokens else 1.0 for p in term_positions
+                    )
+                    norm = self._k1 * (1 - self._b + self._b * doc.length / avg_length)
+                    scores[row] = scores.get(row, 0.0) + idf * tf * (self._k1 + 1) / (tf + norm)
+
+            hits: list[TextSearchHit] = []
+            for row, score in scores.items():
+                doc = self._docs[row]
+                if not (min_trust <= doc.trust_level <= max_trust):
+                    continue
+                if doc.is_archived and not include_archived:
+                    continue
+                if type_set is not None and doc.capsule_type not in type_set:
+                    continue
+                if owner_set is not None and doc.owner_id not in owner_set:
+                    continue
+
+                matched: list[int] = []
+                if phrases:
+                    phrase_starts = [self._match_phrase(row, phrase) for phrase in phrases]
+                    if not all(phrase_starts):
+                        continue
+                    for phrase, starts in zip(phrases, phrase_starts, strict=True):
+                        base = phrase[0][0]
+                        for start in starts:
+                            matched.extend(start + position - base for position, _ in phrase)
+                for term in bare:
+                    matched.extend(self._postings.get(term, {}).get(row, ()))
+
+                hits.append(
+                    TextSearchHit(
+                        capsule_id=doc.capsule_id,
+                        score=score,
+                        content_spans=self._content_spans(doc, matched),
+                    )
+                )
+
+            hits.sort(key=lambda h: h.score, reverse=True)
+            return hits[:k]
+
+    def _match_phrase(self, row: int, phrase: list[tuple[int, str]]) -> list[int]:
+        """Positions in document ``row`` where ``phrase`` starts."""
+        base_position, first_term = phrase[0]
+        first = self._postings.get(first_term, {}).get(row)
+        if first is None:
+            return []
+        others = []
+        for position, term in phrase[1:]:
+            term_positions = self._postings.get(term, {}).get(row)
+            if term_positions is None:
+                return []
+            others.append((position - base_position, set(term_positions)))
+        return [start for start in first if all(start + gap in ps for gap, ps in others)]
+
+    @staticmethod
+    def _content_spans(doc: _Document, positions: list[int]) -> list[tuple[int, int]]:
+        spans = set()
+        for position in positions:
+            local = position - doc.content_offset
+            if 0 <= local < len(doc.content_starts):
+                spans.add((doc.content_starts[local], doc.content_ends[local]))
+        return sorted(spans)
+
+    def stats(self) -> dict[str, Any]:
+        """Get index statistics."""
+        with self._lock:
+            return {
+                "documents": len(self._docs),
+                "terms": len(self._postings),
+                "postings": sum(len(p) for p in self._postings.values()),
+            }
+
+
+class TextIndexSync:
+    """
+    Keeps a CapsuleTextIndex in step with Neo4j.
+
+    Mirrors VectorIndexSync: capsule events trigger a reload of the
+    affected capsule from the repository.
+    """
+
+    SYNC_EVENTS = {
+        "capsule.created",
+        "capsule.updated",
+        "capsule.deleted",
+        "capsule.archived",
+        "capsule.unarchived",
+    }
+
+    def __init__(
+        self,
+        index: CapsuleTextIndex,
+        capsule_repo: Any | None = None,
+        db_client: Any | None = None,
+    ):
+        self._index = index
+        self._capsule_repo = capsule_repo
+        self._db = db_client
+
+    def attach(self, event_bus: Any) -> str:
+        """Subscribe to capsule events on the event bus."""
+        from forge.models.events import EventType
+
+        return event_bus.subscribe(  # type: ignore[no-any-return]
+            handler=self.handle_event,
+            event_types={EventType(value) for value in self.SYNC_EVENTS},
+        )
+
+    async def handle_event(self, event: Event) -> None:
+        """Apply one capsule event to the index."""
+        capsule_id = (event.payload or {}).get("capsule_id")
+        if not capsule_id:
+            return
+
+        event_type = getattr(event.type, "value", event.type)
+        if event_type == "capsule.deleted":
+            self._index.remove(capsule_id)
+            return
+
+        if self._capsule_repo is None:
+            return
+
+        try:
+            capsule = await self._capsule_repo.get_by_id(capsule_id)
+        except (RuntimeError, OSError, ValueError, ConnectionError) as e:
+            logger.warning("text_index_sync_failed", capsule_id=capsule_id, error=str(e))
+            return
+
+        if capsule is None:
+            self._index.remove(capsule_id)
+            return
+
+        self._upsert_record(capsule.model_dump())
+
+    def _upsert_records(self, records: list[dict[str, Any]]) -> list[str | None]:
+        return [self._upsert_record(record) for record in records]
+
+    def _upsert_record(self, record: dict[str, Any]) -> str | None:
+        capsule_id = record.get("id")
+        if not capsule_id:
+            return None
+        type_value = record.get("type") or "knowledge"
+        trust_value = record.get("trust_level", 60)
+        self._index.upsert(
+            str(capsule_id),
+            title=record.get("title"),
+            content=record.get("content") or "",
+            trust_level=int(trust_value) if isinstance(trust_value, int | float) else 60,
+            capsule_type=str(getattr(type_value, "value", type_value)),
+            owner_id=str(record.get("owner_id") or ""),
+            is_archived=bool(record.get("is_archived", False)),
+        )
+        return str(capsule_id)
+
+    async def rebuild(self, page_size: int = 1000) -> int:
+        """
+        Reload every capsule from Neo4j.
+
+        Returns:
+            Number of capsules indexed
+        """
+        if self._db is None:
+            raise RuntimeError("A database client is required to rebuild the index")
+
+        query = """
+        MATCH (capsule:Capsule)
+        RETURN capsule {
+            .id, .title, .content, .trust_level, .type, .owner_id, .is_archived
+        } AS capsule
+        ORDER BY capsule.id
+        SKIP $skip
+        LIMIT $limit
+        """
+
+        seen: set[str] = set()
+        skip = 0
+        while True:
+            records = await self._db.execute(query, {"skip": skip, "limit": page_size})
+            batch = [r.get("capsule") or {} for r in records]
+            # Tokenizing is CPU-bound; keep it off the event loop
+            indexed = await asyncio.to_thread(self._upsert_records, batch)
+            seen.update(capsule_id for capsule_id in indexed if capsule_id)
+            if len(records) < page_size:
+                break
+            skip += page_size
+
+        self._index.retain(seen)
+        logger.info("text_index_rebuilt", documents=len(seen))
+        return len(seen)
+
+
+__all__ = [
+    "STOP_WORDS",
+    "CapsuleTextIndex",
+    "TextIndexSync",
+    "TextSearchHit",
+    "stem",
+    "tokenize",
+]
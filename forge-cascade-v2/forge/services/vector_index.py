@@ -0,0 +1,731 @@
+"""
+Forge Cascade V2 - In-Process Vector Index
+
+Approximate nearest-neighbour index for capsule embeddings, used as a
+low-latency backend for semantic search. Neo4j remains the source of
+truth; this index is a replica kept in sync from capsule events and can
+be rebuilt from the database at any time.
+
+Design:
+- Vectors live in one contiguous float32 matrix (rows are L2-normalized,
+  so cosine similarity is a dot product).
+- Trust, type, owner, archive state and creation time are stored as
+  parallel arrays, so filters are applied as boolean masks BEFORE
+  scoring. Filtered queries return up to ``k`` results instead of
+  coming back short.
+- Past ``train_threshold`` vectors an IVF coarse quantizer (k-means
+  centroids) restricts scoring to the ``nprobe`` closest lists. If the
+  probed lists hold fewer than ``k`` matches the search falls back to an
+  exact scan of the filtered rows.
+- The index can be saved to and loaded from a single ``.npz`` file.
+
+Requires numpy (see requirements-ml.txt).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import math
+import os
+import threading
+from dataclasses import dataclass
+from datetime import datetime
+from typing import TYPE_CHECKING, Any
+
+import structlog
+
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:  # pragma: no cover - exercised only without numpy
+    np = None  # type: ignore[assignment]
+    NUMPY_AVAILABLE = False
+
+if TYPE_CHECKING:
+    from forge.models.events import Event
+
+logger = structlog.get_logger(__name__)
+
+
+class VectorIndexError(Exception):
+    """Raised when the vector index cannot be used."""
+
+    pass
+
+
+@dataclass
+class VectorSearchHit:
+    """A single index search hit."""
+
+    capsule_id: str
+    score: float
+
+
+@dataclass
+class IndexedCapsule:
+    """Capsule attributes the index needs for scoring and pre-filtering."""
+
+    capsule_id: str
+    embedding: list[float]
+    trust_level: int = 60
+    capsule_type: str = "knowledge"
+    owner_id: str = ""
+    tags: list[str] | None = None
+    is_archived: bool = False
+    created_at: datetime | None = None
+
+    @classmethod
+    def from_record(cls, record: dict[str, Any]) -> IndexedCapsule | None:
+        """Build from a capsule dict as returned by Neo4j, or None if unusable."""
+        capsule_id = record.get("id")
+        embedding = record.get("embedding")
+        if not capsule_id or not embedding:
+            return None
+
+        type_value = record.get("type") or "knowledge"
+        created_at = record.get("created_at")
+        if isinstance(created_at, str):
+            try:
+                created_at = datetime.fromisoformat(created_at)
+            except ValueError:
+                created_at = None
+        elif created_at is not None and hasattr(created_at, "to_native"):
+            created_at = created_at.to_native()
+
+        trust_value = record.get("trust_level", 60)
+        return cls(
+            capsule_id=str(capsule_id),
+            embedding=list(embedding),
+            trust_level=int(trust_value) if isinstance(trust_value, int | float) else 60,
+            capsule_type=str(getattr(type_value, "value", type_value)).lower(),
+            owner_id=str(record.get("owner_id") or ""),
+            tags=list(record.get("tags") or []),
+            is_archived=bool(record.get("is_archived", False)),
+            created_at=created_at if isinstance(created_at, datetime) else None,
+        )
+
+
+class CapsuleVectorIndex:
+    """
+    IVF vector index over capsule embeddings with attribute pre-filtering.
+
+    All public methods are thread-safe; ``search`` is CPU-bound and is
+    meant to be called through ``asyncio.to_thread`` by async callers.
+
+    Usage:
+        index = CapsuleVectorIndex(dimensions=1536)
+        index.upsert(IndexedCapsule("cap-1", embedding, trust_level=80))
+
+        hits = index.search(query_embedding, k=10, min_trust=60)
+    """
+
+    def __init__(
+        self,
+        dimensions: int,
+        train_threshold: int = 10_000,
+        nprobe: int = 8,
+        initial_capacity: int = 1024,
+    ):
+        if not NUMPY_AVAILABLE:
+            raise VectorIndexError("numpy is required for the vector index")
+
+        self._dim = dimensions
+        self._train_threshold = train_threshold
+        self._nprobe = nprobe
+        self._lock = threading.RLock()
+
+        capacity = max(1, initial_capacity)
+        self._vectors: Any = np.zeros((capacity, dimensions), dtype=np.float32)
+        self._trust: Any = np.zeros(capacity, dtype=np.int16)
+        self._type: Any = np.zeros(capacity, dtype=np.int32)
+        self._owner: Any = np.zeros(capacity, dtype=np.int32)
+        self._archived: Any = np.zeros(capacity, dtype=bool)
+        self._alive: Any = np.zeros(capacity, dtype=bool)
+        self._created: Any = np.full(capacity, np.nan, dtype=np.float64)
+        self._assign: Any = np.full(capacity, -1, dtype=np.int32)
+
+        self._ids: list[str | None] = [None] * capacity
+        self._rows: dict[str, int] = {}
+        self._free: list[int] = []
+        self._size = 0  # High-water mark of used rows
+
+        # Attribute vocabularies (value -> code) and tag postings
+        self._type_codes: dict[str, int] = {}
+        self._owner_codes: dict[str, int] = {}
+        self._tag_rows: dict[str, set[int]] = {}
+        self._row_tags: dict[int, list[str]] = {}
+
+        # IVF state. While train() clusters outside the lock, rows written
+        # meanwhile are collected in _touched and re-assigned at install.
+        self._centroids: Any = None
+        self._trained_size = 0
+        self._touched: set[int] | None = None
+        self._epoch = 0  # Bumped by clear() so an in-flight training is discarded
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __contains__(self, capsule_id: object) -> bool:
+        return capsule_id in self._rows
+
+    @property
+    def dimensions(self) -> int:
+        return self._dim
+
+    @property
+    def is_trained(self) -> bool:
+        return self._centroids is not None
+
+    # =========================================================================
+    # Mutation
+    # =========================================================================
+
+    def upsert(self, capsule: IndexedCapsule) -> None:
+        """
+        Insert or replace a capsule's vector and attributes.
+
+        Raises:
+            VectorIndexError: If the embedding has the wrong size or is zero
+        """
+        with self._lock:
+            self._upsert_locked(capsule)
+        self._maybe_train()
+
+    def upsert_many(self, capsules: list[IndexedCapsule]) -> int:
+        """
+        Insert or replace several capsules, skipping unusable embeddings.
+
+        Returns:
+            Number of capsules indexed
+        """
+        indexed = 0
+        with self._lock:
+            for capsule in capsules:
+                try:
+                    self._upsert_locked(capsule)
+                    indexed += 1
+                except VectorIndexError as e:
+                    logger.warning(
+                        "vector_index_upsert_rejected",
+                        capsule_id=capsule.capsule_id,
+                        error=str(e),
+                    )
+        self._maybe_train()
+        return indexed
+
+    def remove(self, capsule_id: str) -> bool:
+        """Remove a capsule from the index. Returns False if it was absent."""
+        with self._lock:
+            row = self._rows.pop(capsule_id, None)
+            if row is None:
+                return False
+            self._release_row(row)
+            return True
+
+    def retain(self, capsule_ids: set[str]) -> int:
+        """Remove every capsule not in ``capsule_ids``. Returns the number removed."""
+        with self._lock:
+            stale = [capsule_id for capsule_id in self._rows if capsule_id not in capsule_ids]
+            for capsule_id in stale:
+                self._release_row(self._rows.pop(capsule_id))
+            return len(stale)
+
+    def clear(self) -> None:
+        """Remove every vector, keeping capacity."""
+        with self._lock:
+            self._alive[:] = False
+            self._assign[:] = -1
+            self._ids = [None] * len(self._ids)
+            self._rows.clear()
+            self._free.clear()
+            self._size = 0
+            self._tag_rows.clear()
+            self._row_tags.clear()
+            self._centroids = None
+            self._trained_size = 0
+            self._epoch += 1
+
+    def _upsert_locked(self, capsule: IndexedCapsule) -> None:
+        if len(capsule.embedding) != self._dim:
+            raise VectorIndexError(
+                f"Embedding has {len(capsule.embedding)} dimensions, index expects {self._dim}"
+            )
+
+        vector = np.asarray(capsule.embedding, dtype=np.float32)
+        norm = float(np.linalg.norm(vector))
+        if norm == 0.0 or not math.isfinite(norm):
+            raise VectorIndexError(f"Capsule {capsule.capsule_id} has a zero or invalid embedding")
+
+        row = self._rows.get(capsule.capsule_id)
+        if row is None:
+            row = self._allocate_row()
+            self._rows[capsule.capsule_id] = row
+            self._ids[row] = capsule.capsule_id
+        else:
+            self._drop_tags(row)
+
+        self._vectors[row] = vector / norm
+        self._trust[row] = capsule.trust_level
+        self._type[row] = self._code(self._type_codes, capsule.capsule_type.lower())
+        self._owner[row] = self._code(self._owner_codes, capsule.owner_id)
+        self._archived[row] = capsule.is_archived
+        self._created[row] = capsule.created_at.timestamp() if capsule.created_at else np.nan
+        self._alive[row] = True
+
+        tags = list(dict.fromkeys(capsule.tags or []))
+        for tag in tags:
+            self._tag_rows.setdefault(tag, set()).add(row)
+        self._row_tags[row] = tags
+
+        if self._centroids is not None:
+            self._assign[row] = int(np.argmax(self._centroids @ self._vectors[row]))
+        if self._touched is not None:
+            self._touched.add(row)
+
+    def _allocate_row(self) -> int:
+        if self._free:
+            return self._free.pop()
+        if self._size == len(self._ids):
+            self._grow(len(self._ids) * 2)
+        row = self._size
+        self._size += 1
+        return row
+
+    def _release_row(self, row: int) -> None:
+        self._alive[row] = False
+        self._assign[row] = -1
+        self._ids[row] = None
+        self._drop_tags(row)
+        self._free.append(row)
+
+    def _drop_tags(self, row: int) -> None:
+        for tag in self._row_tags.pop(row, []):
+            rows = self._tag_rows.get(tag)
+            if rows is not None:
+                rows.discard(row)
+                if not rows:
+                    del self._tag_rows[tag]
+
+    def _grow(self, capacity: int) -> None:
+        extra = capacity - len(self._ids)
+        self._vectors = np.vstack([self._vectors, np.zeros((extra, self._dim), dtype=np.float32)])
+        self._trust = np.concatenate([self._trust, np.zeros(extra, dtype=np.int16)])
+        self._type = np.concatenate([self._type, np.zeros(extra, dtype=np.int32)])
+        self._owner = np.concatenate([self._owner, np.zeros(extra, dtype=np.int32)])
+        self._archived = np.concatenate([self._archived, np.zeros(extra, dtype=bool)])
+        self._alive = np.concatenate([self._alive, np.zeros(extra, dtype=bool)])
+        self._created = np.concatenate([self._created, np.full(extra, np.nan)])
+        self._assign = np.concatenate([self._assign, np.full(extra, -1, dtype=np.int32)])
+        self._ids.extend([None] * extra)
+
+    @staticmethod
+    def _code(vocabulary: dict[str, int], value: str) -> int:
+        code = vocabulary.get(value)
+        if code is None:
+            code = len(vocabulary)
+            vocabulary[value] = code
+        return code
+
+    # =========================================================================
+    # IVF training
+    # =========================================================================
+
+    def _maybe_train(self) -> None:
+        """Train (without holding the lock) once the collection is large enough."""
+        with self._lock:
+            count = len(self._rows)
+            if count < self._train_threshold or self._touched is not None:
+                return
+            # Retrain as the collection doubles so lists stay balanced
+            if self._centroids is not None and count < 2 * self._trained_size:
+                return
+        self.train()
+
+    def train(self, iterations: int = 10, seed: int = 0) -> None:
+        """
+        Train the IVF quantizer with k-means over the live vectors.
+
+        The lock is only held to snapshot the live rows and to install the
+        result, so searches and upserts carry on while k-means runs.
+        Concurrent calls return immediately while a training is running.
+        """
+        with self._lock:
+            if self._touched is not None:
+                return
+            live = np.flatnonzero(self._alive[: self._size])
+            if len(live) == 0:
+                return
+            # _grow() replaces the array, so this reference stays stable;
+            # rows rewritten in place meanwhile are re-assigned at install
+            vectors = self._vectors
+            epoch = self._epoch
+            self._touched = set()
+
+        try:
+            nlist = max(1, int(math.sqrt(len(live))))
+            rng = np.random.default_rng(seed)
+            sample_size = min(len(live), nlist * 64)
+            sample = vectors[rng.choice(live, size=sample_size, replace=False)]
+
+            centroids = sample[rng.choice(sample_size, size=nlist, replace=False)].copy()
+            for _ in range(iterations):
+                labels = np.argmax(sample @ centroids.T, axis=1)
+                for c in range(nlist):
+                    members = sample[labels == c]
+                    if len(members):
+                        centroid = members.mean(axis=0)
+                        norm = np.linalg.norm(centroid)
+                        centroids[c] = centroid / norm if norm > 0 else centroid
+
+            assign = np.concatenate(
+                [
+                    np.argmax(vectors[live[start : start + 4096]] @ centroids.T, axis=1)
+                    for start in range(0, len(live), 4096)
+                ]
+            )
+        except BaseException:
+            with self._lock:
+                self._touched = None
+            raise
+
+        with self._lock:
+            touched, self._touched = self._touched, None
+            if epoch != self._epoch:
+                return
+            still_alive = self._alive[live]
+            self._assign[live[still_alive]] = assign[still_alive]
+            for row in touched:
+                if self._alive[row]:
+                    self._assign[row] = int(np.argmax(centroids @ self._vectors[row]))
+            self._centroids = centroids
+            self._trained_size = len(live)
+
+        logger.info("vector_index_trained", vectors=len(live), lists=nlist)
+
+    # =========================================================================
+    # Search
+    # =========================================================================
+
+    def search(
+        self,
+        query: list[float],
+        k: int = 10,
+        min_trust: int = 0,
+        max_trust: int = 100,
+        capsule_types: list[str] | None = None,
+        owner_ids: list[str] | None = None,
+        tags: list[str] | None = None,
+        include_archived: bool = False,
+        created_after: datetime | None = None,
+        created_before: datetime | None = None,
+    ) -> list[VectorSearchHit]:
+        """
+        Find the ``k`` capsules most similar to ``query`` that pass the filters.
+
+        Scores use the same scale as the Neo4j cosine vector index,
+        ``(1 + cosine) / 2``, so thresholds carry over unchanged.
+
+        Returns:
+            Hits ordered by descending score
+        """
+        if len(query) != self._dim:
+            raise VectorIndexError(f"Query has {len(query)} dimensions, index expects {self._dim}")
+        q = np.asarray(query, dtype=np.float32)
+        norm = float(np.linalg.norm(q))
+        if norm == 0.0:
+            return []
+        q /= norm
+
+        with self._lock:
+            mask = self._filter_mask(
+                min_trust,
+                max_trust,
+                capsule_types,
+                owner_ids,
+                tags,
+                include_archived,
+                created_after,
+                created_before,
+            )
+            candidates = np.flatnonzero(mask)
+            if len(candidates) == 0:
+                return []
+
+            if self._centroids is not None and len(candidates) > k * self._nprobe:
+                probes = np.argsort(-(self._centroids @ q))[: self._nprobe]
+                probed = candidates[np.isin(self._assign[candidates], probes)]
+                # Exact fallback keeps filtered queries from coming back short
+                if len(probed) >= k:
+                    candidates = probed
+
+            scores = self._vectors[candidates] @ q
+            top = min(k, len(candidates))
+            best = np.argpartition(-scores, top - 1)[:top]
+            best = best[np.argsort(-scores[best])]
+
+            return [
+                VectorSearchHit(
+                    capsule_id=self._ids[candidates[i]],
+                    score=float((1.0 + scores[i]) / 2.0),
+                )
+                for i in best
+            ]
+
+    def _filter_mask(
+        self,
+        min_trust: int,
+        max_trust: int,
+        capsule_types: list[str] | None,
+        owner_ids: list[str] | None,
+        tags: list[str] | None,
+        include_archived: bool,
+        created_after: datetime | None,
+        created_before: datetime | None,
+    ) -> Any:
+        n = self._size
+        mask = self._alive[:n].copy()
+        mask &= (self._trust[:n] >= min_trust) & (self._trust[:n] <= max_trust)
+
+        if not include_archived:
+            mask &= ~self._archived[:n]
+
+        if capsule_types:
+            codes = [
+                self._type_codes[t.lower()] for t in capsule_types if t.lower() in self._type_codes
+            ]
+            mask &= np.isin(self._type[:n], codes)
+
+        if owner_ids:
+            codes = [self._owner_codes[o] for o in owner_ids if o in self._owner_codes]
+            mask &= np.isin(self._owner[:n], codes)
+
+        if tags:
+            # Match any tag
+            tag_mask = np.zeros(n, dtype=bool)
+            for tag in tags:
+                rows = self._tag_rows.get(tag)
+                if rows:
+                    tag_mask[list(rows)] = True
+            mask &= tag_mask
+
+        if created_after is not None:
+            mask &= self._created[:n] >= created_after.timestamp()
+        if created_before is not None:
+            mask &= self._created[:n] <= created_before.timestamp()
+
+        return mask
+
+    # =========================================================================
+    # Persistence
+    # =========================================================================
+
+    def save(self, path: str) -> None:
+        """Write the index to ``path`` atomically."""
+        with self._lock:
+            live = np.flatnonzero(self._alive[: self._size])
+            meta = {
+                "dimensions": self._dim,
+                "ids": [self._ids[row] for row in live],
+                "tags": [self._row_tags.get(int(row), []) for row in live],
+                "types": sorted(self._type_codes, key=self._type_codes.__getitem__),
+                "owners": sorted(self._owner_codes, key=self._owner_codes.__getitem__),
+                "trained_size": self._trained_size,
+            }
+            arrays: dict[str, Any] = {
+                "vectors": self._vectors[live],
+                "trust": self._trust[live],
+                "type": self._type[live],
+                "owner": self._owner[live],
+                "archived": self._archived[live],
+                "created": self._created[live],
+                "meta": np.array(json.dumps(meta)),
+            }
+            if self._centroids is not None:
+                arrays["centroids"] = self._centroids
+
+            tmp_path = f"{path}.tmp"
+            with open(tmp_path, "wb") as f:
+                np.savez(f, **arrays)
+            os.replace(tmp_path, path)
+
+        logger.info("vector_index_saved", path=path, vectors=len(live))
+
+    @classmethod
+    def load(cls, path: str, **kwargs: Any) -> CapsuleVectorIndex:
+        """Load an index written by ``save``."""
+        if not NUMPY_AVAILABLE:
+            raise VectorIndexError("numpy is required for the vector index")
+
+        with np.load(path, allow_pickle=False) as data:
+            meta = json.loads(str(data["meta"]))
+            count = len(meta["ids"])
+            index = cls(meta["dimensions"], initial_capacity=max(count, 1), **kwargs)
+
+            index._vectors[:count] = data["vectors"]
+            index._trust[:count] = data["trust"]
+            index._type[:count] = data["type"]
+            index._owner[:count] = data["owner"]
+            index._archived[:count] = data["archived"]
+            index._created[:count] = data["created"]
+            index._alive[:count] = True
+            index._size = count
+
+            index._type_codes = {t: i for i, t in enumerate(meta["types"])}
+            index._owner_codes = {o: i for i, o in enumerate(meta["owners"])}
+            for row, (capsule_id, tags) in enumerate(zip(meta["ids"], meta["tags"], strict=True)):
+                index._ids[row] = capsule_id
+                index._rows[capsule_id] = row
+                index._row_tags[row] = tags
+                for tag in tags:
+                    index._tag_rows.setdefault(tag, set()).add(row)
+
+            if "centroids" in data:
+                index._centroids = data["centroids"]
+                index._trained_size = meta["trained_size"]
+                index._assign[:count] = np.argmax(
+                    index._vectors[:count] @ index._centroids.T, axis=1
+                )
+
+        logger.info("vector_index_loaded", path=path, vectors=count)
+        return index
+
+    def stats(self) -> dict[str, Any]:
+        """Get index statistics."""
+        with self._lock:
+            return {
+                "vectors": len(self._rows),
+                "capacity": len(self._ids),
+                "dimensions": self._dim,
+                "trained": self._centroids is not None,
+                "lists": 0 if self._centroids is None else len(self._centroids),
+                "memory_bytes": int(self._vectors.nbytes),
+            }
+
+
+class VectorIndexSync:
+    """
+    Keeps a CapsuleVectorIndex in step with Neo4j.
+
+    Subscribes to capsule lifecycle events and reloads the affected
+    capsule from the repository, so the index never trusts event payloads
+    for embeddings or filter attributes.
+    """
+
+    SYNC_EVENTS = {
+        "capsule.created",
+        "capsule.updated",
+        "capsule.deleted",
+        "capsule.archived",
+        "capsule.unarchived",
+    }
+
+    def __init__(
+        self,
+        index: CapsuleVectorIndex,
+        capsule_repo: Any | None = None,
+        db_client: Any | None = None,
+    ):
+        self._index = index
+        self._capsule_repo = capsule_repo
+        self._db = db_client
+        self._subscription_id: str | None = None
+
+    def attach(self, event_bus: Any) -> str:
+        """Subscribe to capsule events on the event bus."""
+        from forge.models.events import EventType
+
+        self._subscription_id = event_bus.subscribe(
+            handler=self.handle_event,
+            event_types={EventType(value) for value in self.SYNC_EVENTS},
+        )
+        return self._subscription_id  # type: ignore[return-value]
+
+    async def handle_event(self, event: Event) -> None:
+        """Apply one capsule event to the index."""
+        capsule_id = (event.payload or {}).get("capsule_id")
+        if not capsule_id:
+            return
+
+        event_type = getattr(event.type, "value", event.type)
+        if event_type == "capsule.deleted":
+            self._index.remove(capsule_id)
+            return
+
+        if self._capsule_repo is None:
+            return
+
+        try:
+            capsule = await self._capsule_repo.get_by_id(capsule_id)
+        except (RuntimeError, OSError, ValueError, ConnectionError) as e:
+            logger.warning("vector_index_sync_failed", capsule_id=capsule_id, error=str(e))
+            return
+
+        if capsule is None:
+            self._index.remove(capsule_id)
+            return
+
+        entry = IndexedCapsule.from_record(capsule.model_dump())
+        if entry is None:
+            # Capsule has no embedding yet; make sure a stale vector is gone
+            self._index.remove(capsule_id)
+            return
+
+        # Off the event loop: an upsert can trigger a k-means retrain
+        try:
+            await asyncio.to_thread(self._index.upsert, entry)
+        except VectorIndexError as e:
+            logger.warning("vector_index_upsert_rejected", capsule_id=capsule_id, error=str(e))
+
+    async def rebuild(self, page_size: int = 1000) -> int:
+        """
+        Reload every embedded capsule from Neo4j.
+
+        Returns:
+            Number of capsules indexed
+        """
+        if self._db is None:
+            raise VectorIndexError("A database client is required to rebuild the index")
+
+        query = """
+        MATCH (capsule:Capsule)
+        WHERE capsule.embedding IS NOT NULL
+        RETURN capsule {
+            .id, .embedding, .trust_level, .type, .owner_id,
+            .tags, .is_archived, .created_at
+        } AS capsule
+        ORDER BY capsule.id
+        SKIP $skip
+        LIMIT $limit
+        """
+
+        fresh: list[IndexedCapsule] = []
+        skip = 0
+        while True:
+            records = await self._db.execute(query, {"skip": skip, "limit": page_size})
+            for record in records:
+                entry = IndexedCapsule.from_record(record.get("capsule") or {})
+                if entry is not None:
+                    fresh.append(entry)
+            if len(records) < page_size:
+                break
+            skip += page_size
+
+        # Bulk insert off the event loop; training can take a moment. The
+        # index stays searchable throughout, and stale entries go last.
+        indexed = await asyncio.to_thread(self._index.upsert_many, fresh)
+        self._index.retain({entry.capsule_id for entry in fresh})
+
+        logger.info("vector_index_rebuilt", vectors=indexed)
+        return indexed
+
+
+__all__ = [
+    "NUMPY_AVAILABLE",
+    "CapsuleVectorIndex",
+    "IndexedCapsule",
+    "VectorIndexError",
+    "VectorIndexSync",
+    "VectorSearchHit",
+]
@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+Forge Cascade V2 - Differential Diagnosis Scoring Benchmark
+
+Measures one diagnosis iteration (score every hypothesis, then rank the
+follow-up questions by information gain) on synthetic patients, comparing
+the original per-hypothesis Python loops with the vectorised scorer over
+a PhenotypeFrequencyMatrix. Also checks both produce the same scores.
+
+The legacy path is timed with its frequency lookups already cached; in
+production it additionally issued one Neo4j query per hypothesis for
+frequencies and another for expected phenotypes, which this benchmark
+reports but does not simulate.
+
+Usage:
+    python scripts/benchmark_diagnosis_scoring.py --diseases 17000 --patients 20
+    python scripts/benchmark_diagnosis_scoring.py --phenotypes 8000 --per-disease 40
+"""
+
+import argparse
+import asyncio
+import itertools
+import math
+import random
+import sys
+import time
+
+import numpy as np
+
+# Add parent directory to path
+sys.path.insert(0, str(__file__).rsplit("/", 2)[0])
+
+from forge.monitoring.logging import configure_logging
+from forge.services.diagnosis import (
+    BayesianScorer,
+    DiagnosisHypothesis,
+    EvidenceItem,
+    EvidenceType,
+    PatientProfile,
+    PhenotypeFrequencyMatrix,
+)
+
+
+def synthetic_matrix(
+    diseases: int, phenotypes: int, per_disease: int, rng: random.Random
+) -> PhenotypeFrequencyMatrix:
+    """Diseases with a Zipf-ish spread of phenotypes and frequencies."""
+    cum_weights = list(itertools.accumulate(1 / (i + 1) ** 0.7 for i in range(phenotypes)))
+    records = []
+    for d in range(diseases):
+        for p in set(rng.choices(range(phenotypes), cum_weights=cum_weights, k=per_disease)):
+            records.append((f"MONDO:{d:07d}", f"HP:{p:07d}", rng.choice([0.05, 0.3, 0.6, 0.9])))
+    return PhenotypeFrequencyMatrix.from_records(records)
+
+
+def synthetic_patient(
+    matrix: PhenotypeFrequencyMatrix, rng: random.Random
+) -> tuple[PatientProfile, list[DiagnosisHypothesis]]:
+    """A patient drawn from one disease, with candidate hypotheses."""
+    source = rng.choice(matrix.disease_ids)
+    present = list(matrix.frequencies(source))[:8]
+    absent = rng.sample(matrix.phenotype_ids, 2)
+    patient = PatientProfile(
+        phenotypes=[EvidenceItem(evidence_type=EvidenceType.PHENOTYPE, code=c) for c in present]
+        + [EvidenceItem(evidence_type=EvidenceType.PHENOTYPE, code=c, negated=True) for c in absent]
+    )
+    hypotheses = []
+    for disease_id in [source, *rng.sample(matrix.disease_ids, 49)]:
+        expected = list(matrix.frequencies(disease_id))[:20]
+        hypotheses.append(
+            DiagnosisHypothesis(
+                disease_id=disease_id,
+                disease_name=disease_id,
+                expected_phenotypes=expected,
+                missing_phenotypes=[p for p in expected if p not in present],
+                prior_probability=0.001,
+            )
+        )
+    return patient, hypotheses
+
+
+def legacy_phenotype_lr(frequencies: dict[str, float], present: list[str], absent: list[str]):
+    """The original per-hypothesis phenotype likelihood loop."""
+    lr = 1.0
+    for hpo_id in present:
+        lr *= max(0.1, min(100, frequencies.get(hpo_id, 0.1) / 0.01))
+    for hpo_id in absent:
+        freq = frequencies.get(hpo_id, 0.1)
+        if freq > 0.5:
+            lr *= 0.3
+        elif freq > 0.2:
+            lr *= 0.6
+    return lr
+
+
+def legacy_information_gain(hypotheses: list[DiagnosisHypothesis], hpo_id: str) -> float:
+    """The original per-question entropy loop."""
+    probs = [h.combined_score for h in hypotheses]
+    total = sum(probs)
+    probs = [p / total for p in probs]
+    current = -sum(p * math.log(p + 1e-10) for p in probs)
+
+    def shown(h: DiagnosisHypothesis, present: bool) -> float:
+        if hpo_id in h.expected_phenotypes:
+            return 0.7 if present else 0.3
+        if hpo_id in h.missing_phenotypes:
+            return 0.3 if present else 0.7
+        return 0.5
+
+    present_probs = [h.combined_score * shown(h, True) for h in hypotheses]
+    absent_probs = [h.combined_score * shown(h, False) for h in hypotheses]
+    p_present = sum(present_probs) / (sum(present_probs) + sum(absent_probs) + 1e-10)
+    entropies = []
+    for values in (present_probs, absent_probs):
+        s = sum(values)
+        entropies.append(-sum(v / s * math.log(v / s + 1e-10) for v in values) if s else current)
+    return max(0.0, current - (p_present * entropies[0] + (1 - p_present) * entropies[1]))
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="Diagnosis scoring benchmark")
+    parser.add_argument("--diseases", type=int, default=17000, help="Diseases in the matrix")
+    parser.add_argument("--phenotypes", type=int, default=15000, help="Distinct phenotypes")
+    parser.add_argument("--per-disease", type=int, default=25, help="Phenotypes per disease")
+    parser.add_argument("--patients", type=int, default=20, help="Synthetic patients")
+    parser.add_argument("--seed", type=int, default=7, help="Random seed")
+    args = parser.parse_args()
+
+    configure_logging(level="WARNING")
+    rng = random.Random(args.seed)
+
+    start = time.perf_counter()
+    matrix = synthetic_matrix(args.diseases, args.phenotypes, args.per_disease, rng)
+    print(
+        f"Matrix: {matrix.disease_count} diseases, {matrix.entry_count} entries "
+        f"(built in {time.perf_counter() - start:.2f}s)"
+    )
+    patients = [synthetic_patient(matrix, rng) for _ in range(args.patients)]
+    scorer = BayesianScorer(frequency_matrix=matrix)
+    cache = {d: matrix.frequencies(d) for _, hs in patients for d in (h.disease_id for h in hs)}
+
+    legacy_time = vector_time = 0.0
+    max_diff = 0.0
+    for patient, hypotheses in patients:
+        present, absent = patient.phenotype_codes, patient.negated_phenotype_codes
+        candidates = sorted({p for h in hypotheses for p in h.expected_phenotypes})
+
+        # Information gain weights hypotheses by their combined scores
+        await scorer.score_all_hypotheses(hypotheses, patient)
+
+        start = time.perf_counter()
+        legacy_scores = [
+            legacy_phenotype_lr(cache[h.disease_id], present, absent) for h in hypotheses
+        ]
+        legacy_gains = [legacy_information_gain(hypotheses, c) for c in candidates]
+        legacy_time += time.perf_counter() - start
+
+        start = time.perf_counter()
+        await scorer.score_all_hypotheses(hypotheses, patient)
+        gains = scorer.calculate_information_gains(hypotheses, candidates)
+        vector_time += time.perf_counter() - start
+
+        for h, lr in zip(hypotheses, legacy_scores, strict=True):
+            expected = 1 / (1 + math.exp(-math.log(lr) / 2))
+            max_diff = max(max_diff, abs(h.phenotype_score - expected))
+        max_diff = max(max_diff, float(np.max(np.abs(np.subtract(gains, legacy_gains)))))
+
+    # Whole-catalogue pass: every disease against one patient
+    patient = patients[0][0]
+    start = time.perf_counter()
+    scorer.phenotype_log_likelihoods(
+        matrix,
+        np.arange(matrix.disease_count),
+        patient.phenotype_codes,
+        patient.negated_phenotype_codes,
+    )
+    catalogue_ms = (time.perf_counter() - start) * 1000
+
+    n = args.patients
+    print(f"Per iteration (50 hypotheses, {len(candidates)} questions):")
+    print(f"  legacy loops:  {legacy_time / n * 1000:8.2f} ms  (+100 Neo4j queries in production)")
+    print(f"  vectorised:    {vector_time / n * 1000:8.2f} ms  (matrix loaded once)")
+    print(f"  speedup:       {legacy_time / vector_time:8.1f}x")
+    print(f"All {matrix.disease_count} diseases scored for one patient in {catalogue_ms:.2f} ms")
+    print(f"Max difference from legacy results: {max_diff:.2e}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Forge Cascade V2 - EventBus Shard Scaling Benchmark
+
+Measures end-to-end event throughput for increasing shard counts. Each
+subscriber simulates an I/O-bound handler (e.g. a Neo4j write) by sleeping
+for a fixed time, which is where a single dispatch worker serialises.
+
+Usage:
+    python scripts/benchmark_event_bus.py --events 20000 --shards 1 2 4 8 16 32
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+
+# Add parent directory to path
+sys.path.insert(0, str(__file__).rsplit("/", 2)[0])
+
+from forge.kernel.event_system import EventBus, PartitionKey
+from forge.models.events import Event, EventType
+from forge.monitoring.logging import configure_logging
+
+
+async def run_once(num_events: int, num_shards: int, handler_ms: float, keys: int) -> dict:
+    """Publish num_events and wait for all of them to be delivered."""
+    bus = EventBus(
+        max_queue_size=num_events,
+        num_shards=num_shards,
+        partition_key=PartitionKey.CAPSULE_ID,
+    )
+    delivered = 0
+    done = asyncio.Event()
+
+    async def handler(event: Event) -> None:
+        nonlocal delivered
+        if handler_ms:
+            await asyncio.sleep(handler_ms / 1000)
+        delivered += 1
+        if delivered == num_events:
+            done.set()
+
+    bus.subscribe(handler=handler, event_types={EventType.CAPSULE_CREATED})
+    await bus.start()
+
+    start = time.perf_counter()
+    for i in range(num_events):
+        await bus.publish(
+            event_type=EventType.CAPSULE_CREATED,
+            payload={"capsule_id": f"capsule-{i % keys}"},
+            source="benchmark",
+        )
+    await done.wait()
+    elapsed = time.perf_counter() - start
+
+    shards = bus.get_shard_metrics()
+    await bus.stop()
+
+    return {
+        "shards": num_shards,
+        "elapsed_s": elapsed,
+        "events_per_s": num_events / elapsed,
+        "max_lag_ms": max(shard["max_lag_ms"] for shard in shards),
+    }
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="EventBus shard scaling benchmark")
+    parser.add_argument("--events", type=int, default=20000, help="Events per run")
+    parser.add_argument(
+        "--shards", type=int, nargs="+", default=[1, 4, 16, 64], help="Shard counts"
+    )
+    parser.add_argument(
+        "--handler-ms", type=float, default=1.0, help="Simulated handler latency (ms)"
+    )
+    parser.add_argument("--keys", type=int, default=1000, help="Distinct partition keys")
+    args = parser.parse_args()
+
+    # Per-event debug logging would dominate the measurement
+    configure_logging(level="WARNING")
+
+    print(
+        f"EventBus benchmark: {args.events} events, handler={args.handler_ms}ms, "
+        f"{args.keys} partition keys"
+    )
+    print(f"{'shards':>8} {'elapsed (s)':>12} {'events/s':>12} {'speedup':>9} {'max lag (ms)':>13}")
+
+    baseline: float | None = None
+    for num_shards in args.shards:
+        result = await run_once(args.events, num_shards, args.handler_ms, args.keys)
+        baseline = baseline or result["events_per_s"]
+        print(
+            f"{result['shards']:>8} {result['elapsed_s']:>12.2f} "
+            f"{result['events_per_s']:>12.0f} {result['events_per_s'] / baseline:>8.1f}x "
+            f"{result['max_lag_ms']:>13.1f}"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
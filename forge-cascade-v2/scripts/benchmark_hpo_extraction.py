@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+Forge Cascade V2 - HPO Term Search and Extraction Benchmark
+
+Measures search_terms() queries/sec and rule-based phenotype extraction
+notes/sec over a corpus of clinical notes, comparing the original linear
+scan over every term with the prebuilt search index. Also reports how
+long loading takes from the source file versus the saved snapshot.
+
+Uses a synthetic ontology of realistic size unless --data-dir points at
+a directory holding hp.json or hp.obo.
+
+Usage:
+    python scripts/benchmark_hpo_extraction.py --terms 18000 --notes 200 --queries 100
+    python scripts/benchmark_hpo_extraction.py --data-dir ./data/hpo
+"""
+
+import argparse
+import asyncio
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(__file__).rsplit("/", 2)[0])
+
+from forge.monitoring.logging import configure_logging
+from forge.services.hpo import HPOOntologyService, HPOTerm, PhenotypeExtractor
+
+MODIFIERS = [
+    "abnormal", "absent", "aplasia of the", "decreased", "delayed", "hypoplasia of the",
+    "increased", "progressive", "recurrent", "severe", "congenital", "bilateral",
+]  # fmt: skip
+STRUCTURES = [
+    "heart", "kidney", "liver", "retina", "cerebellum", "thumb", "femur", "cornea",
+    "aorta", "thyroid", "pancreas", "spleen", "cochlea", "skull", "palate", "ulna",
+    "lens", "iris", "tibia", "radius", "lung", "trachea", "bladder", "ureter",
+]  # fmt: skip
+FINDINGS = [
+    "seizure", "ataxia", "hypotonia", "macrocephaly", "microcephaly", "scoliosis",
+    "nystagmus", "cataract", "tremor", "dysarthria", "spasticity", "myopathy",
+    "neuropathy", "cardiomyopathy", "hepatomegaly", "splenomegaly", "anemia",
+]  # fmt: skip
+QUALIFIERS = ["morphology", "size", "function", "position", "shape", "density"]
+FILLER = [
+    "The patient is a 7 year old referred for evaluation.",
+    "Family history is notable for consanguinity.",
+    "On examination vital signs were stable.",
+    "Parents report the symptoms began in infancy.",
+    "Laboratory studies were otherwise unremarkable.",
+    "Follow up was arranged with the genetics clinic.",
+]  # fmt: skip
+
+
+def synthetic_terms(count: int, rng: random.Random) -> dict[str, HPOTerm]:
+    """Generate HPO-like terms with names and synonyms."""
+    terms: dict[str, HPOTerm] = {}
+    names: set[str] = set()
+    while len(terms) < count:
+        shape = rng.random()
+        if shape < 0.4:
+            name = f"{rng.choice(MODIFIERS)} {rng.choice(STRUCTURES)} {rng.choice(QUALIFIERS)}"
+        elif shape < 0.7:
+            name = f"{rng.choice(MODIFIERS)} {rng.choice(FINDINGS)}"
+        else:
+            name = f"{rng.choice(FINDINGS)} of the {rng.choice(STRUCTURES)}"
+        name = f"{name} type {len(terms) % 40}" if name in names else name
+        names.add(name)
+        hpo_id = f"HP:{len(terms) + 1:07d}"
+        synonyms = [f"{name} variant", f"{rng.choice(MODIFIERS)} {name.split()[-1]}"]
+        terms[hpo_id] = HPOTerm(
+            hpo_id=hpo_id,
+            name=name.capitalize(),
+            synonyms=synonyms[: rng.randint(0, 2)],
+            parents=[f"HP:{rng.randint(1, len(terms)):07d}"] if terms else [],
+        )
+    return terms
+
+
+def clinical_notes(terms: list[HPOTerm], count: int, rng: random.Random) -> list[str]:
+    """Build notes that mention a handful of terms among filler sentences."""
+    notes = []
+    for _ in range(count):
+        sentences = rng.sample(FILLER, 3)
+        for term in rng.sample(terms, min(6, len(terms))):
+            sentences.append(f"There is {term.name.lower()} noted on exam.")
+        if rng.random() < 0.5:
+            sentences.append(f"No evidence of {rng.choice(terms).name.lower()}.")
+        rng.shuffle(sentences)
+        notes.append(" ".join(sentences))
+    return notes
+
+
+def legacy_search(ontology: HPOOntologyService, query: str, limit: int = 20) -> list[HPOTerm]:
+    """The original search_terms: a scan over every term."""
+    query_lower = query.lower()
+    results: list[tuple[HPOTerm, float]] = []
+    for term in ontology.iter_terms():
+        if term.is_obsolete or term in [r[0] for r in results]:
+            continue
+        if query_lower in term.name.lower():
+            results.append((term, len(query_lower) / len(term.name) * 0.9))
+            continue
+        for syn in term.synonyms:
+            if query_lower in syn.lower():
+                results.append((term, len(query_lower) / len(syn) * 0.85))
+                break
+    results.sort(key=lambda x: x[1], reverse=True)
+    return [term for term, _ in results[:limit]]
+
+
+def legacy_extract(ontology: HPOOntologyService, text: str) -> set[str]:
+    """The original rule-based extraction: str.find for every label."""
+    text_lower = text.lower()
+    found = set()
+    for term in ontology.iter_terms():
+        if term.is_obsolete:
+            continue
+        if term.name.lower() in text_lower or any(s.lower() in text_lower for s in term.synonyms):
+            found.add(term.hpo_id)
+    return found
+
+
+def rate(label: str, count: int, fn) -> float:
+    start = time.perf_counter()
+    for i in range(count):
+        fn(i)
+    elapsed = time.perf_counter() - start
+    per_sec = count / elapsed if elapsed else float("inf")
+    print(f"{label:>30} {count:>8} {elapsed:>10.2f} {per_sec:>12.1f}")
+    return per_sec
+
+
+async def load_ontology(args: argparse.Namespace, rng: random.Random) -> HPOOntologyService:
+    if args.data_dir:
+        ontology = HPOOntologyService(args.data_dir)
+        for attempt in ("source or snapshot", "snapshot"):
+            start = time.perf_counter()
+            if not await ontology.load():
+                raise SystemExit(f"Could not load HPO from {args.data_dir}")
+            print(f"Load ({attempt}): {time.perf_counter() - start:.2f}s")
+        return ontology
+
+    ontology = HPOOntologyService(tempfile.mkdtemp(prefix="hpo-bench-"))
+    start = time.perf_counter()
+    ontology._term_index = synthetic_terms(args.terms, rng)
+    ontology._build_indices()
+    ontology._build_hierarchy()
+    print(f"Index build: {time.perf_counter() - start:.2f}s")
+    return ontology
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="HPO search and extraction benchmark")
+    parser.add_argument("--data-dir", type=Path, help="Directory with hp.json or hp.obo")
+    parser.add_argument("--terms", type=int, default=18000, help="Synthetic ontology size")
+    parser.add_argument("--notes", type=int, default=200, help="Clinical notes to extract")
+    parser.add_argument("--queries", type=int, default=100, help="Search queries to run")
+    parser.add_argument("--seed", type=int, default=7, help="Random seed")
+    args = parser.parse_args()
+
+    configure_logging(level="WARNING")
+    rng = random.Random(args.seed)
+
+    ontology = await load_ontology(args, rng)
+    terms = [t for t in ontology.iter_terms() if not t.is_obsolete]
+    notes = clinical_notes(terms, args.notes, rng)
+    queries = [rng.choice(terms).name.lower()[: rng.randint(4, 12)] for _ in range(args.queries)]
+    extractor = PhenotypeExtractor(ontology)
+
+    print(f"Ontology: {len(terms)} terms, {args.notes} notes, {args.queries} queries")
+    print(f"{'mode':>30} {'count':>8} {'time (s)':>10} {'per sec':>12}")
+    legacy_qps = rate(
+        "search (linear scan)", args.queries, lambda i: legacy_search(ontology, queries[i])
+    )
+    indexed_qps = rate("search (index)", args.queries, lambda i: ontology.search_terms(queries[i]))
+    legacy_nps = rate(
+        "extract (linear scan)", args.notes, lambda i: legacy_extract(ontology, notes[i])
+    )
+    start = time.perf_counter()
+    for note in notes:
+        await extractor._extract_rule_based(note, {})
+    elapsed = time.perf_counter() - start
+    indexed_nps = args.notes / elapsed if elapsed else float("inf")
+    print(f"{'extract (index)':>30} {args.notes:>8} {elapsed:>10.2f} {indexed_nps:>12.1f}")
+
+    print(f"Search speedup: {indexed_qps / legacy_qps:.1f}x")
+    print(f"Extraction speedup: {indexed_nps / legacy_nps:.1f}x")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Forge Cascade V2 - HPO Semantic Similarity Benchmark
+
+Ranks diseases against synthetic patients by best-match-average
+phenotype similarity on a synthetic multi-parent HPO-sized hierarchy,
+comparing the original per-pair HPOHierarchy.semantic_similarity (LCA and
+descendant sets recomputed on every call, with set caches) against the
+precomputed HPOSimilarityIndex.
+
+The legacy path is slow enough that it only scores --legacy-diseases
+diseases; its per-disease time is reported alongside the batch time for
+the whole catalogue.
+
+Usage:
+    python scripts/benchmark_hpo_similarity.py --terms 18000 --diseases 8000
+    python scripts/benchmark_hpo_similarity.py --legacy-diseases 50 --patients 3
+"""
+
+import argparse
+import math
+import random
+import sys
+import time
+
+import numpy as np
+
+# Add parent directory to path
+sys.path.insert(0, str(__file__).rsplit("/", 2)[0])
+
+from forge.monitoring.logging import configure_logging
+from forge.services.hpo import HPOSimilarityIndex
+
+
+def synthetic_hierarchy(terms: int, rng: random.Random) -> dict[str, list[str]]:
+    """A rooted DAG where about a fifth of terms have a second parent."""
+    ids = [f"HP:{i:07d}" for i in range(terms)]
+    parents: dict[str, list[str]] = {ids[0]: []}
+    for i in range(1, terms):
+        # Uniform attachment keeps depth logarithmic, roughly like HPO
+        chosen = {ids[rng.randrange(i)]}
+        if i > 2 and rng.random() < 0.2:
+            chosen.add(ids[rng.randrange(i)])
+        parents[ids[i]] = sorted(chosen)
+    return parents
+
+
+class LegacyHierarchy:
+    """The original pairwise semantic_similarity, with its ancestor/descendant caches."""
+
+    def __init__(self, parent_map: dict[str, list[str]]):
+        self.parent_map = parent_map
+        self.child_map: dict[str, list[str]] = {t: [] for t in parent_map}
+        for term, parents in parent_map.items():
+            for parent in parents:
+                self.child_map[parent].append(term)
+        self.ancestor_cache: dict[str, set[str]] = {}
+        self.descendant_cache: dict[str, set[str]] = {}
+
+    def _closure(self, hpo_id: str, edges: dict[str, list[str]], cache: dict[str, set[str]]):
+        if hpo_id not in cache:
+            result: set[str] = set()
+            to_process = [hpo_id]
+            while to_process:
+                for nxt in edges.get(to_process.pop(), []):
+                    if nxt not in result:
+                        result.add(nxt)
+                        to_process.append(nxt)
+            cache[hpo_id] = result
+        return cache[hpo_id] | {hpo_id}
+
+    def semantic_similarity(self, term1: str, term2: str) -> float:
+        if term1 == term2:
+            return 1.0
+        ancestors = self.ancestor_cache
+        common = self._closure(term1, self.parent_map, ancestors) & self._closure(
+            term2, self.parent_map, ancestors
+        )
+        if not common:
+            return 0.0
+        lca = max(common, key=lambda a: len(self._closure(a, self.parent_map, ancestors)) - 1)
+        total = len(self.parent_map)
+
+        def ic(term: str) -> float:
+            return -math.log(
+                len(self._closure(term, self.child_map, self.descendant_cache)) / total
+            )
+
+        max_ic = max(ic(term1), ic(term2))
+        return min(ic(lca) / max_ic, 1.0) if max_ic else 0.0
+
+    def best_match_average(self, query: list[str], disease: list[str]) -> float:
+        sims = [[self.semantic_similarity(q, d) for d in disease] for q in query]
+        forward = sum(max(row) for row in sims) / len(query)
+        backward = sum(max(col) for col in zip(*sims, strict=True)) / len(disease)
+        return (forward + backward) / 2
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="HPO semantic similarity benchmark")
+    parser.add_argument("--terms", type=int, default=18000, help="Terms in the hierarchy")
+    parser.add_argument("--diseases", type=int, default=8000, help="Diseases to rank")
+    parser.add_argument("--per-disease", type=int, default=15, help="Phenotypes per disease")
+    parser.add_argument("--per-patient", type=int, default=8, help="Phenotypes per patient")
+    parser.add_argument("--patients", type=int, default=5, help="Synthetic patients")
+    parser.add_argument("--legacy-diseases", type=int, default=100, help="Diseases for legacy")
+    parser.add_argument("--seed", type=int, default=7, help="Random seed")
+    args = parser.parse_args()
+
+    configure_logging(level="WARNING")
+    rng = random.Random(args.seed)
+    parent_map = synthetic_hierarchy(args.terms, rng)
+    term_ids = list(parent_map)
+
+    start = time.perf_counter()
+    index = HPOSimilarityIndex.build(parent_map)
+    print(f"Index: {index.stats()} (built in {time.perf_counter() - start:.2f}s)")
+
+    diseases = [rng.sample(term_ids, args.per_disease) for _ in range(args.diseases)]
+    patients = [rng.sample(term_ids, args.per_patient) for _ in range(args.patients)]
+    legacy = LegacyHierarchy(parent_map)
+    subset = diseases[: args.legacy_diseases]
+
+    legacy_time = batch_time = 0.0
+    max_diff = 0.0
+    for query in patients:
+        start = time.perf_counter()
+        legacy_scores = [legacy.best_match_average(query, d) for d in subset]
+        legacy_time += time.perf_counter() - start
+
+        start = time.perf_counter()
+        scores = index.set_similarities(query, diseases, method="relative")
+        batch_time += time.perf_counter() - start
+
+        # The legacy LCA is the deepest common ancestor, not always the
+        # most informative one, so the two can legitimately differ
+        max_diff = max(max_diff, float(np.max(np.abs(scores[: len(subset)] - legacy_scores))))
+
+    n = args.patients
+    legacy_per_disease = legacy_time / (n * len(subset))
+    batch_per_disease = batch_time / (n * args.diseases)
+    print(f"Per patient ({args.per_patient} phenotypes, {args.per_disease} per disease):")
+    print(f"  legacy pairwise: {legacy_per_disease * 1e6:10.1f} us/disease")
+    print(f"  batch index:     {batch_per_disease * 1e6:10.1f} us/disease")
+    print(f"  speedup:         {legacy_per_disease / batch_per_disease:10.1f}x")
+    print(f"All {args.diseases} diseases ranked in {batch_time / n * 1000:.1f} ms per patient")
+    print(f"Max difference from legacy (LCA by depth vs MICA): {max_diff:.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Forge Cascade V2 - Neo4j Bulk Write and Streaming Benchmark
+
+Compares write throughput of one execute_write() per row against the
+UNWIND bulk writer, and peak Python memory of execute() against stream()
+when reading the written nodes back. Runs against the Neo4j instance
+configured in settings and deletes its benchmark nodes afterwards.
+
+Usage:
+    python scripts/benchmark_neo4j_writes.py --rows 20000 --per-row-rows 2000
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+import tracemalloc
+from contextlib import aclosing
+
+# Add parent directory to path
+sys.path.insert(0, str(__file__).rsplit("/", 2)[0])
+
+from forge.database.client import Neo4jClient
+from forge.monitoring.logging import configure_logging
+
+LABEL = "BenchmarkBulkWrite"
+
+PER_ROW_QUERY = f"CREATE (n:{LABEL} {{id: $id, payload: $payload}})"
+BULK_QUERY = f"UNWIND $rows AS row CREATE (n:{LABEL} {{id: row.id, payload: row.payload}})"
+READ_QUERY = f"MATCH (n:{LABEL}) RETURN n.id AS id, n.payload AS payload"
+
+
+def make_rows(count: int, payload_bytes: int) -> list[dict]:
+    payload = "x" * payload_bytes
+    return [{"id": f"bench-{i}", "payload": payload} for i in range(count)]
+
+
+async def cleanup(client: Neo4jClient) -> None:
+    """Delete benchmark nodes in batches so large runs do not exhaust memory."""
+    while True:
+        result = await client.execute_single(
+            f"MATCH (n:{LABEL}) WITH n LIMIT 10000 DETACH DELETE n RETURN count(*) AS deleted"
+        )
+        if not result or not result["deleted"]:
+            return
+
+
+async def bench_per_row(client: Neo4jClient, rows: list[dict]) -> float:
+    start = time.perf_counter()
+    for row in rows:
+        await client.execute_write(PER_ROW_QUERY, row)
+    return len(rows) / (time.perf_counter() - start)
+
+
+async def bench_bulk(client: Neo4jClient, rows: list[dict], batch_size: int) -> tuple[float, dict]:
+    start = time.perf_counter()
+    stats = await client.write_rows(BULK_QUERY, rows, batch_size=batch_size)
+    return len(rows) / (time.perf_counter() - start), stats
+
+
+async def bench_read(client: Neo4jClient, streaming: bool, fetch_size: int) -> tuple[int, float]:
+    """Return (records read, peak traced memory in MiB)."""
+    tracemalloc.start()
+    count = 0
+    if streaming:
+        async with aclosing(client.stream(READ_QUERY, fetch_size=fetch_size)) as records:
+            async for _ in records:
+                count += 1
+    else:
+        count = len(await client.execute(READ_QUERY))
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return count, peak / (1024 * 1024)
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="Neo4j bulk write and streaming benchmark")
+    parser.add_argument("--rows", type=int, default=20000, help="Rows for the bulk path")
+    parser.add_argument("--per-row-rows", type=int, default=2000, help="Rows for the per-row path")
+    parser.add_argument("--payload-bytes", type=int, default=256, help="Payload size per row")
+    parser.add_argument("--batch-size", type=int, default=1000, help="Initial UNWIND batch size")
+    parser.add_argument("--fetch-size", type=int, default=1000, help="Streaming fetch size")
+    args = parser.parse_args()
+
+    # Per-query debug logging would dominate the measurement
+    configure_logging(level="WARNING")
+
+    client = Neo4jClient()
+    await client.connect()
+    try:
+        await cleanup(client)
+
+        per_row = await bench_per_row(client, make_rows(args.per_row_rows, args.payload_bytes))
+        await cleanup(client)
+        bulk, stats = await bench_bulk(
+            client, make_rows(args.rows, args.payload_bytes), args.batch_size
+        )
+
+        print(f"Neo4j write benchmark: payload={args.payload_bytes}B")
+        print(f"{'path':>10} {'rows':>8} {'rows/s':>12} {'speedup':>9}")
+        print(f"{'per-row':>10} {args.per_row_rows:>8} {per_row:>12.0f} {1.0:>8.1f}x")
+        print(f"{'unwind':>10} {args.rows:>8} {bulk:>12.0f} {bulk / per_row:>8.1f}x")
+        print(f"  {stats['batches']} batches, {stats['nodes_created']} nodes created")
+
+        print(f"\nNeo4j read benchmark: {args.rows} records, fetch_size={args.fetch_size}")
+        print(f"{'path':>10} {'records':>8} {'peak MiB':>10}")
+        for name, streaming in (("execute", False), ("stream", True)):
+            count, peak = await bench_read(client, streaming, args.fetch_size)
+            print(f"{name:>10} {count:>8} {peak:>10.1f}")
+    finally:
+        await cleanup(client)
+        await client.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Forge Cascade V2 - Per-Request Token Verification Benchmark
+
+Measures the cost of verify_access_token_async() as seen by one request,
+with the verified-token cache off and on. Redis is simulated by a client
+whose calls sleep for a fixed round-trip time, so the numbers show how
+many checks still leave the process once the local revocation filter is
+synced.
+
+Usage:
+    python scripts/benchmark_token_auth.py --requests 20000 --tokens 100 --redis-rtt-ms 0.3
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+
+# Add parent directory to path
+sys.path.insert(0, str(__file__).rsplit("/", 2)[0])
+
+from forge.monitoring.logging import configure_logging
+from forge.security.bloom import BloomFilter
+from forge.security.tokens import (
+    TokenBlacklist,
+    TokenVersionCache,
+    VerifiedTokenCache,
+    create_access_token,
+    settings,
+    verify_access_token_async,
+)
+
+
+class SimulatedRedis:
+    """Redis stand-in that counts round trips and sleeps for each."""
+
+    def __init__(self, rtt_ms: float):
+        self.rtt = rtt_ms / 1000
+        self.round_trips = 0
+
+    async def _round_trip(self) -> None:
+        self.round_trips += 1
+        if self.rtt:
+            await asyncio.sleep(self.rtt)
+
+    async def exists(self, key: str) -> int:
+        await self._round_trip()
+        return 0
+
+    async def get(self, key: str) -> str:
+        await self._round_trip()
+        return "1"
+
+    async def setex(self, key: str, ttl: int, value: str) -> None:
+        await self._round_trip()
+
+
+async def token_version(user_id: str) -> int:
+    return 1
+
+
+async def run_once(
+    label: str, issued: list[str], num_requests: int, redis: SimulatedRedis, local: bool
+) -> dict:
+    """Verify num_requests tokens round-robin and time each call."""
+    VerifiedTokenCache.clear()
+    TokenVersionCache._cache.clear()
+    settings.verified_token_cache_ttl_seconds = 30 if local else 0
+    TokenBlacklist._filter = BloomFilter(settings.token_blacklist_filter_capacity)
+    TokenBlacklist._filter_synced = local
+    redis.round_trips = 0
+
+    latencies = []
+    for i in range(num_requests):
+        start = time.perf_counter()
+        await verify_access_token_async(issued[i % len(issued)], token_version)
+        latencies.append(time.perf_counter() - start)
+
+    latencies.sort()
+    return {
+        "label": label,
+        "mean_us": sum(latencies) / len(latencies) * 1e6,
+        "p50_us": latencies[len(latencies) // 2] * 1e6,
+        "p99_us": latencies[int(len(latencies) * 0.99)] * 1e6,
+        "round_trips": redis.round_trips / num_requests,
+    }
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="Token verification benchmark")
+    parser.add_argument("--requests", type=int, default=20000, help="Verifications per run")
+    parser.add_argument("--tokens", type=int, default=100, help="Distinct live tokens")
+    parser.add_argument(
+        "--redis-rtt-ms", type=float, default=0.3, help="Simulated Redis round trip (ms)"
+    )
+    args = parser.parse_args()
+
+    configure_logging(level="WARNING")
+
+    issued = [create_access_token(f"user-{i}", f"user{i}", "user", 60) for i in range(args.tokens)]
+    redis = SimulatedRedis(args.redis_rtt_ms)
+    TokenBlacklist._redis_client = redis
+
+    print(
+        f"Token verification: {args.requests} requests over {args.tokens} tokens, "
+        f"Redis RTT={args.redis_rtt_ms}ms"
+    )
+    print(f"{'mode':>22} {'mean (us)':>10} {'p50 (us)':>10} {'p99 (us)':>10} {'redis/req':>10}")
+    for label, local in (("decode + redis", False), ("cache + local filter", True)):
+        result = await run_once(label, issued, args.requests, redis, local)
+        print(
+            f"{result['label']:>22} {result['mean_us']:>10.1f} {result['p50_us']:>10.1f} "
+            f"{result['p99_us']:>10.1f} {result['round_trips']:>10.2f}"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
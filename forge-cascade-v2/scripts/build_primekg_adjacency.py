@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Forge Cascade V2 - Build PrimeKG Adjacency Snapshot
+
+Builds the memory-mapped adjacency snapshot served by the PrimeKG overlay
+and diagnosis engine from the nodes.csv/edges.csv used for the Neo4j
+import, then times a few lookups against it. Point
+PRIMEKG_ADJACENCY_PATH at the output directory to enable it.
+
+Usage:
+    python scripts/build_primekg_adjacency.py --data-dir ./data/primekg
+    python scripts/build_primekg_adjacency.py --nodes nodes.csv --edges edges.csv \
+        --output ./data/primekg/adjacency
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(__file__).rsplit("/", 2)[0])
+
+from forge.monitoring.logging import configure_logging
+from forge.services.primekg import PrimeKGAdjacency
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Build the PrimeKG adjacency snapshot")
+    parser.add_argument("--data-dir", type=Path, default=Path("./data/primekg"))
+    parser.add_argument("--nodes", type=Path, help="nodes.csv (default: <data-dir>/nodes.csv)")
+    parser.add_argument("--edges", type=Path, help="edges.csv (default: <data-dir>/edges.csv)")
+    parser.add_argument("--output", type=Path, help="Output (default: <data-dir>/adjacency)")
+    parser.add_argument("--samples", type=int, default=1000, help="Lookups to time")
+    args = parser.parse_args()
+
+    configure_logging(level="WARNING")
+    nodes = args.nodes or args.data_dir / "nodes.csv"
+    edges = args.edges or args.data_dir / "edges.csv"
+    output = args.output or args.data_dir / "adjacency"
+
+    start = time.perf_counter()
+    graph = PrimeKGAdjacency.build(nodes, edges, output)
+    print(f"Built {output} in {time.perf_counter() - start:.1f}s")
+    for key, value in graph.stats().items():
+        print(f"  {key}: {value}")
+    if not graph.node_count or not args.samples:
+        return
+
+    rng = random.Random(7)
+    sample = [rng.randrange(graph.node_count) for _ in range(args.samples)]
+
+    start = time.perf_counter()
+    for node in sample:
+        graph.neighbors(node, graph.relations)
+    elapsed = time.perf_counter() - start
+    print(f"neighbors (all relations): {elapsed / len(sample) * 1e6:.1f} us/lookup")
+
+    start = time.perf_counter()
+    for node in sample:
+        graph.find(graph.node_id(node))
+    elapsed = time.perf_counter() - start
+    print(f"find by node_id: {elapsed / len(sample) * 1e6:.1f} us/lookup")
+
+
+if __name__ == "__main__":
+    main()
@@ -724,6 +724,8 @@ def app() -> FastAPI:
         _mock_capsule_repo.update = AsyncMock(return_value=True)
         _mock_capsule_repo.delete = AsyncMock(return_value=True)
         _mock_capsule_repo.list_capsules = AsyncMock(return_value=([], 0))
+        _mock_capsule_repo.list_capsules_after = AsyncMock(return_value=([], None))
+        _mock_capsule_repo.count_capsules = AsyncMock(return_value=0)
         _mock_capsule_repo.create_semantic_edge = AsyncMock(return_value=MagicMock(id="edge-123"))
         _mock_capsule_repo.get_semantic_edge = AsyncMock(return_value=None)
         _mock_capsule_repo.get_semantic_edges = AsyncMock(return_value=[])
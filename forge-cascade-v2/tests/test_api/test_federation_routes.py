@@ -20,6 +20,7 @@ from fastapi.testclient import TestClient
 from forge.federation.models import (
     ConflictResolution,
     PeerStatus,
+    SyncCursor,
     SyncDirection,
     SyncOperationStatus,
     SyncPhase,
@@ -99,6 +100,11 @@ def mock_protocol():
         )
     )
     protocol.verify_signature = MagicMock(return_value=True)
+    protocol.create_sync_payload = AsyncMock(
+        return_value=MagicMock(
+            model_dump=lambda mode: {"capsules": [], "has_more": False, "signature": "sig123"}
+        )
+    )
     protocol.API_VERSION = "1.0"
     return protocol
 
@@ -162,6 +168,8 @@ def mock_capsule_repo():
     repo = AsyncMock()
     repo.get_changes_since = AsyncMock(return_value=([], []))
     repo.get_edges_since = AsyncMock(return_value=[])
+    repo.get_change_page = AsyncMock(return_value=([], [], None))
+    repo.get_edge_page = AsyncMock(return_value=([], None))
     repo.get_by_id = AsyncMock(return_value=None)
     repo.create = AsyncMock()
     repo.update = AsyncMock()
@@ -713,6 +721,63 @@ class TestGetChanges:
 
         assert response.status_code in [401, 403]
 
+    def test_get_changes_returns_resume_cursor(
+        self, client: TestClient, mock_protocol, mock_capsule_repo
+    ):
+        """A partial page is signed and carries a cursor for the next one."""
+        mock_capsule_repo.get_change_page.return_value = ([], ["gone-1"], "capsules-c1")
+
+        response = client.get(
+            "/federation/changes?limit=50&nonce=n1",
+            headers={
+                "X-Forge-Signature": "valid_signature",
+                "X-Forge-Public-Key": "peer_pubkey",
+            },
+        )
+
+        assert response.status_code == 200
+        signed = mock_protocol.verify_signature.call_args[0][0]
+        assert b'"nonce": "n1"' in signed
+        kwargs = mock_protocol.create_sync_payload.call_args.kwargs
+        assert kwargs["deletions"] == ["gone-1"]
+        assert kwargs["has_more"] is True
+        position = SyncCursor.decode(kwargs["next_cursor"])
+        assert position.capsules_after == "capsules-c1"
+        assert position.edges_done is True
+
+    def test_get_changes_resumes_from_cursor(
+        self, client: TestClient, mock_protocol, mock_capsule_repo
+    ):
+        """A cursor resumes the unfinished stream and skips drained ones."""
+        cursor = SyncCursor(capsules_after="capsules-c1", edges_done=True).encode()
+
+        response = client.get(
+            f"/federation/changes?cursor={cursor}",
+            headers={
+                "X-Forge-Signature": "valid_signature",
+                "X-Forge-Public-Key": "peer_pubkey",
+            },
+        )
+
+        assert response.status_code == 200
+        assert mock_capsule_repo.get_change_page.call_args.kwargs["cursor"] == "capsules-c1"
+        mock_capsule_repo.get_edge_page.assert_not_awaited()
+        kwargs = mock_protocol.create_sync_payload.call_args.kwargs
+        assert kwargs["has_more"] is False
+        assert kwargs["next_cursor"] is None
+
+    def test_get_changes_invalid_cursor(self, client: TestClient):
+        """A malformed cursor is rejected."""
+        response = client.get(
+            "/federation/changes?cursor=not-a-cursor!",
+            headers={
+                "X-Forge-Signature": "valid_signature",
+                "X-Forge-Public-Key": "peer_pubkey",
+            },
+        )
+
+        assert response.status_code == 400
+
 
 class TestReceiveCapsules:
     """Tests for POST /federation/incoming/capsules endpoint."""
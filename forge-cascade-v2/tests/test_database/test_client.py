@@ -101,6 +101,9 @@ def neo4j_client():
         mock_settings.neo4j_max_connection_lifetime = 3600
         mock_settings.neo4j_max_connection_pool_size = 50
         mock_settings.neo4j_connection_timeout = 30.0
+        mock_settings.neo4j_fetch_size = 1000
+        mock_settings.neo4j_write_batch_size = 1000
+        mock_settings.neo4j_route_reads = True
         return Neo4jClient()
 
 
@@ -592,6 +595,296 @@ class TestNeo4jClientExecute:
         mock_session.run.assert_called_once_with("RETURN 1", {"param": "value"}, timeout=10.0)
 
 
+# =============================================================================
+# Read/Write Routing Tests
+# =============================================================================
+
+
+class TestReadOnlyQueryClassification:
+    """Tests for read-only query detection."""
+
+    @pytest.mark.parametrize(
+        "query",
+        [
+            "MATCH (n:Capsule {id: $id}) RETURN n",
+            "MATCH (n) WITH n ORDER BY n.created_at DESC RETURN n LIMIT 10",
+            "CALL db.index.vector.queryNodes('idx', 5, $vec) YIELD node RETURN node",
+            "CALL dbms.components() YIELD name RETURN name",
+            "MATCH (n) WHERE n.offset > 0 RETURN n.created_by",
+        ],
+    )
+    def test_read_queries(self, query):
+        """Plain reads and known read-only procedures route to READ."""
+        from forge.database.client import is_read_only_query
+
+        assert is_read_only_query(query)
+
+    @pytest.mark.parametrize(
+        "query",
+        [
+            "CREATE (n:Capsule $props) RETURN n",
+            "MATCH (n {id: $id}) SET n.title = $title RETURN n",
+            "MATCH (n {id: $id}) DETACH DELETE n",
+            "merge (n:User {id: $id})",
+            "UNWIND $rows AS row MATCH (n {id: row.id}) REMOVE n.flag",
+            "CALL gds.pageRank.stream('g') YIELD nodeId RETURN nodeId",
+            "CALL apoc.create.node(['X'], {})",
+        ],
+    )
+    def test_write_queries(self, query):
+        """Write clauses and unknown procedures route to WRITE."""
+        from forge.database.client import is_read_only_query
+
+        assert not is_read_only_query(query)
+
+
+class TestNeo4jClientRouting:
+    """Tests for routing queries to READ and WRITE sessions."""
+
+    @pytest.fixture
+    def connected_client(self, neo4j_client, mock_driver, mock_session, mock_result):
+        mock_driver.session = MagicMock(return_value=mock_session)
+        mock_session.__aenter__ = AsyncMock(return_value=mock_session)
+        mock_session.__aexit__ = AsyncMock(return_value=None)
+        mock_result.__aiter__.return_value = []
+        mock_result.single = AsyncMock(return_value=None)
+        mock_session.run = AsyncMock(return_value=mock_result)
+        neo4j_client._driver = mock_driver
+        return neo4j_client
+
+    def _access_modes(self, driver):
+        return [c.kwargs["default_access_mode"] for c in driver.session.call_args_list]
+
+    @pytest.mark.asyncio
+    async def test_execute_routes_by_query(self, connected_client, mock_driver):
+        """Reads go to READ sessions and writes to WRITE sessions."""
+        await connected_client.execute("MATCH (n) RETURN n")
+        await connected_client.execute_single("CREATE (n:Node) RETURN n")
+        await connected_client.execute_write("MATCH (n) RETURN n")
+
+        assert self._access_modes(mock_driver) == ["READ", "WRITE", "WRITE"]
+
+    @pytest.mark.asyncio
+    async def test_explicit_access_mode_wins(self, connected_client, mock_driver):
+        """An explicit access mode overrides query classification."""
+        await connected_client.execute("MATCH (n) RETURN n", access_mode="WRITE")
+
+        assert self._access_modes(mock_driver) == ["WRITE"]
+
+    @pytest.mark.asyncio
+    async def test_routing_disabled(self, connected_client, mock_driver):
+        """With routing disabled every query uses a WRITE session."""
+        connected_client._route_reads = False
+
+        await connected_client.execute("MATCH (n) RETURN n")
+
+        assert self._access_modes(mock_driver) == ["WRITE"]
+
+    @pytest.mark.asyncio
+    async def test_sessions_share_bookmark_manager(self, connected_client, mock_driver):
+        """Reads carry the bookmarks of earlier writes."""
+        await connected_client.execute_write("CREATE (n:Node)")
+        await connected_client.execute("MATCH (n) RETURN n")
+
+        managers = {id(c.kwargs["bookmark_manager"]) for c in mock_driver.session.call_args_list}
+        assert managers == {id(connected_client._bookmarks)}
+
+    @pytest.mark.asyncio
+    async def test_route_metrics(self, connected_client, mock_session):
+        """Route metrics count sessions and errors per access mode."""
+        await connected_client.execute("MATCH (n) RETURN n")
+        mock_session.run = AsyncMock(side_effect=ValueError("boom"))
+        with pytest.raises(ValueError):
+            await connected_client.execute_write("CREATE (n:Node)")
+
+        metrics = connected_client.get_route_metrics()
+
+        assert metrics["read"]["sessions_opened"] == 1
+        assert metrics["read"]["errors"] == 0
+        assert metrics["write"]["sessions_opened"] == 1
+        assert metrics["write"]["errors"] == 1
+        assert metrics["write"]["active_sessions"] == 0
+
+    @pytest.mark.asyncio
+    async def test_unknown_access_mode(self, connected_client):
+        """Unknown access modes are rejected."""
+        with pytest.raises(ValueError, match="Unknown access mode"):
+            async with connected_client.session("LEADER"):
+                pass
+
+
+# =============================================================================
+# Streaming and Bulk Write Tests
+# =============================================================================
+
+
+class TestNeo4jClientStreaming:
+    """Tests for streaming query results."""
+
+    @pytest.mark.asyncio
+    async def test_stream_yields_records_with_fetch_size(
+        self, neo4j_client, mock_driver, mock_session, mock_result
+    ):
+        """Stream yields dicts and opens the session with the fetch size."""
+        mock_driver.session = MagicMock(return_value=mock_session)
+        mock_session.__aenter__ = AsyncMock(return_value=mock_session)
+        mock_session.__aexit__ = AsyncMock(return_value=None)
+
+        mock_result.__aiter__.return_value = [{"i": i} for i in range(3)]
+        mock_session.run = AsyncMock(return_value=mock_result)
+        neo4j_client._driver = mock_driver
+
+        records = [r async for r in neo4j_client.stream("MATCH (n) RETURN n", fetch_size=2)]
+
+        assert records == [{"i": 0}, {"i": 1}, {"i": 2}]
+        mock_driver.session.assert_called_once_with(
+            database="neo4j",
+            default_access_mode="READ",
+            bookmark_manager=neo4j_client._bookmarks,
+            fetch_size=2,
+        )
+
+    @pytest.mark.asyncio
+    async def test_stream_closes_session_on_early_exit(
+        self, neo4j_client, mock_driver, mock_session, mock_result
+    ):
+        """Closing the stream early releases the session."""
+        from contextlib import aclosing
+
+        mock_driver.session = MagicMock(return_value=mock_session)
+        mock_session.__aenter__ = AsyncMock(return_value=mock_session)
+        mock_session.__aexit__ = AsyncMock(return_value=None)
+
+        mock_result.__aiter__.return_value = [{"i": i} for i in range(100)]
+        mock_session.run = AsyncMock(return_value=mock_result)
+        neo4j_client._driver = mock_driver
+
+        async with aclosing(neo4j_client.stream("MATCH (n) RETURN n")) as records:
+            async for _ in records:
+                break
+
+        mock_session.__aexit__.assert_called_once()
+
+
+class TestNeo4jBulkWriter:
+    """Tests for UNWIND bulk writes."""
+
+    @pytest.fixture
+    def counters(self):
+        return {
+            "nodes_created": 1,
+            "nodes_deleted": 0,
+            "relationships_created": 0,
+            "relationships_deleted": 0,
+            "properties_set": 2,
+        }
+
+    def test_query_must_use_rows(self, neo4j_client):
+        """Queries that never read $rows are rejected."""
+        with pytest.raises(ValueError, match="rows"):
+            neo4j_client.bulk_writer("CREATE (n:Node)")
+
+    @pytest.mark.asyncio
+    async def test_flushes_full_batches_and_tail(self, neo4j_client, counters):
+        """Rows are written in batch_size chunks plus a final partial batch."""
+        neo4j_client._write_batch = AsyncMock(return_value=counters)
+
+        async with neo4j_client.bulk_writer(
+            "UNWIND $rows AS row CREATE (n:Node {id: row.id})",
+            parameters={"label": "x"},
+            batch_size=4,
+            target_batch_seconds=None,
+        ) as writer:
+            await writer.add_many({"id": i} for i in range(10))
+            assert writer.pending == 2
+
+        sizes = [len(c.args[1]["rows"]) for c in neo4j_client._write_batch.await_args_list]
+        assert sizes == [4, 4, 2]
+        assert neo4j_client._write_batch.await_args_list[0].args[1]["label"] == "x"
+        assert writer.stats["rows_written"] == 10
+        assert writer.stats["batches"] == 3
+        assert writer.stats["nodes_created"] == 3
+
+    @pytest.mark.asyncio
+    async def test_failed_batch_stays_buffered(self, neo4j_client, counters):
+        """Rows are only dropped from the buffer once their batch commits."""
+        neo4j_client._write_batch = AsyncMock(side_effect=[TransientError("busy"), counters])
+        writer = neo4j_client.bulk_writer("UNWIND $rows AS row CREATE (n)", batch_size=2)
+
+        with pytest.raises(TransientError):
+            await writer.add_many([{"id": 1}, {"id": 2}])
+        assert writer.pending == 2
+
+        await writer.flush()
+        assert writer.pending == 0
+        assert writer.stats["rows_written"] == 2
+
+    @pytest.mark.asyncio
+    async def test_no_tail_flush_after_producer_error(self, neo4j_client, counters):
+        """A failing producer does not write its partial tail."""
+        neo4j_client._write_batch = AsyncMock(return_value=counters)
+
+        with pytest.raises(RuntimeError):
+            async with neo4j_client.bulk_writer("UNWIND $rows AS row CREATE (n)") as writer:
+                await writer.add({"id": 1})
+                raise RuntimeError("producer failed")
+
+        neo4j_client._write_batch.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_batch_size_tuning(self, neo4j_client, counters):
+        """Fast batches grow the batch size, slow ones shrink it."""
+        writer = neo4j_client.bulk_writer(
+            "UNWIND $rows AS row CREATE (n)", batch_size=100, target_batch_seconds=1.0
+        )
+
+        writer._tune(100, elapsed=0.1)
+        assert writer.batch_size == 200
+        writer._tune(200, elapsed=5.0)
+        writer._tune(100, elapsed=5.0)
+        assert writer.batch_size == 50
+        writer._tune(50, elapsed=5.0)
+        assert writer.batch_size == writer.MIN_BATCH_SIZE
+
+    @pytest.mark.asyncio
+    async def test_write_rows_accepts_async_iterables(self, neo4j_client, counters):
+        """write_rows drains async iterables and returns summed counters."""
+        neo4j_client._write_batch = AsyncMock(return_value=counters)
+
+        async def rows():
+            for i in range(5):
+                yield {"id": i}
+
+        stats = await neo4j_client.write_rows(
+            "UNWIND $rows AS row CREATE (n)", rows(), batch_size=2
+        )
+
+        assert stats["rows_written"] == 5
+        assert len(neo4j_client._write_batch.await_args_list[0].args[1]["rows"]) == 2
+
+    @pytest.mark.asyncio
+    async def test_write_batch_uses_managed_transaction(
+        self, neo4j_client, mock_driver, mock_session, mock_summary
+    ):
+        """Each batch runs through session.execute_write."""
+        mock_driver.session = MagicMock(return_value=mock_session)
+        mock_session.__aenter__ = AsyncMock(return_value=mock_session)
+        mock_session.__aexit__ = AsyncMock(return_value=None)
+        tx = AsyncMock()
+        tx.run = AsyncMock(return_value=AsyncMock(consume=AsyncMock(return_value=mock_summary)))
+
+        async def execute_write(work):
+            return await work(tx)
+
+        mock_session.execute_write = execute_write
+        neo4j_client._driver = mock_driver
+
+        counters = await neo4j_client._write_batch("UNWIND $rows AS row CREATE (n)", {"rows": [{}]})
+
+        tx.run.assert_awaited_once_with("UNWIND $rows AS row CREATE (n)", {"rows": [{}]})
+        assert counters["relationships_created"] == 2
+
+
 # =============================================================================
 # Health Check Tests
 # =============================================================================
@@ -281,6 +281,7 @@ class TestSchemaManagerIndexes:
         assert "capsule_owner_idx" in results
         assert "capsule_trust_idx" in results
         assert "capsule_created_idx" in results
+        assert "capsule_fulltext_idx" in results
 
         # Verify user indexes
         assert "user_role_idx" in results
@@ -820,6 +821,8 @@ class TestSchemaManagerVerifySchema:
             "capsule_owner_idx",
             "capsule_trust_idx",
             "capsule_created_idx",
+            "capsule_created_id_idx",
+            "capsule_fulltext_idx",
             "user_role_idx",
             "user_active_idx",
             "user_trust_idx",
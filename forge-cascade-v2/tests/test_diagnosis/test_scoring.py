@@ -0,0 +1,154 @@
+"""
+Tests for diagnosis scoring module.
+
+Tests the phenotype frequency matrix, vectorised Bayesian scoring and
+batched information gain.
+"""
+
+import math
+
+import numpy as np
+import pytest
+
+from forge.services.diagnosis.frequency_matrix import PhenotypeFrequencyMatrix
+from forge.services.diagnosis.models import (
+    DiagnosisHypothesis,
+    EvidenceItem,
+    EvidenceType,
+    PatientProfile,
+)
+from forge.services.diagnosis.scoring import BayesianScorer
+
+RECORDS = [
+    ("MONDO:1", "HP:1", 1.0),
+    ("MONDO:1", "HP:2", 0.3),
+    ("MONDO:2", "HP:2", 0.9),
+    ("MONDO:2", "HP:2", 0.4),
+    ("MONDO:2", "HP:3", 5.0),
+]
+
+
+def phenotype(code, negated=False):
+    return EvidenceItem(evidence_type=EvidenceType.PHENOTYPE, code=code, negated=negated)
+
+
+def hypothesis(disease_id, **kwargs):
+    return DiagnosisHypothesis(disease_id=disease_id, disease_name=disease_id, **kwargs)
+
+
+class FakeOverlay:
+    """Overlay exposing a Neo4j client that returns frequency rows."""
+
+    def __init__(self, records):
+        self.queries = 0
+        self.adjacency = None
+        self._neo4j = self
+        self._records = records
+
+    async def run(self, query, params=None):
+        self.queries += 1
+        return [{"disease_id": d, "hpo_id": p, "freq": f} for d, p, f in self._records]
+
+
+class TestPhenotypeFrequencyMatrix:
+    """Tests for the sparse frequency matrix."""
+
+    def test_duplicates_keep_highest_and_clamp(self):
+        matrix = PhenotypeFrequencyMatrix.from_records(RECORDS)
+
+        assert matrix.disease_count == 2
+        assert matrix.entry_count == 4
+        assert matrix.frequencies("MONDO:2") == {"HP:2": 0.9, "HP:3": 1.0}
+        assert matrix.frequencies("MONDO:9") == {}
+
+    def test_gather_fills_defaults(self):
+        matrix = PhenotypeFrequencyMatrix.from_records(RECORDS)
+        rows = matrix.disease_rows(["MONDO:2", "MONDO:9", "MONDO:1", "MONDO:2"])
+
+        block = matrix.gather(rows, ["HP:1", "HP:2", "HP:404"], default=0.1)
+
+        assert rows.tolist()[1] == -1
+        np.testing.assert_allclose(
+            block,
+            [[0.1, 0.9, 0.1], [0.1, 0.1, 0.1], [1.0, 0.3, 0.1], [0.1, 0.9, 0.1]],
+        )
+
+
+class TestBayesianScorer:
+    """Tests for vectorised hypothesis scoring."""
+
+    @pytest.mark.asyncio
+    async def test_phenotype_score_from_frequencies(self):
+        scorer = BayesianScorer(frequency_matrix=PhenotypeFrequencyMatrix.from_records(RECORDS))
+        patient = PatientProfile(phenotypes=[phenotype("HP:1")])
+
+        scored = await scorer.score_all_hypotheses(
+            [hypothesis("MONDO:2"), hypothesis("MONDO:1")], patient
+        )
+
+        # LR 100 for frequency 1.0, LR 10 for the unknown default of 0.1
+        assert [h.disease_id for h in scored] == ["MONDO:1", "MONDO:2"]
+        assert [h.rank for h in scored] == [1, 2]
+        assert scored[0].phenotype_score == pytest.approx(10 / 11)
+        assert scored[1].phenotype_score == pytest.approx(math.sqrt(10) / (1 + math.sqrt(10)))
+
+    @pytest.mark.asyncio
+    async def test_absent_core_phenotype_lowers_score(self):
+        scorer = BayesianScorer(frequency_matrix=PhenotypeFrequencyMatrix.from_records(RECORDS))
+        patient = PatientProfile(phenotypes=[phenotype("HP:3", negated=True)])
+
+        scored = await scorer.score_all_hypotheses(
+            [hypothesis("MONDO:1"), hypothesis("MONDO:2")], patient
+        )
+        by_id = {h.disease_id: h for h in scored}
+
+        assert by_id["MONDO:1"].phenotype_score == pytest.approx(0.5)
+        assert by_id["MONDO:2"].phenotype_score < 0.5
+
+    @pytest.mark.asyncio
+    async def test_many_phenotypes_stay_finite(self):
+        records = [("MONDO:1", f"HP:{i}", 1.0) for i in range(400)]
+        scorer = BayesianScorer(frequency_matrix=PhenotypeFrequencyMatrix.from_records(records))
+        patient = PatientProfile(phenotypes=[phenotype(f"HP:{i}") for i in range(400)])
+
+        scored = await scorer.score_hypothesis(hypothesis("MONDO:1"), patient)
+
+        assert scored.posterior_probability == scorer.config.max_posterior
+        assert math.isfinite(scored.combined_score)
+
+    @pytest.mark.asyncio
+    async def test_matrix_loaded_once_from_overlay(self):
+        overlay = FakeOverlay(RECORDS)
+        scorer = BayesianScorer(primekg_overlay=overlay)
+        patient = PatientProfile(phenotypes=[phenotype("HP:1")])
+
+        await scorer.score_all_hypotheses([hypothesis("MONDO:1"), hypothesis("MONDO:2")], patient)
+        await scorer.score_all_hypotheses([hypothesis("MONDO:2")], patient)
+
+        assert overlay.queries == 1
+
+
+class TestInformationGain:
+    """Tests for batched information gain."""
+
+    def test_batch_matches_single(self):
+        scorer = BayesianScorer()
+        hypotheses = [
+            hypothesis("MONDO:1", combined_score=0.6, expected_phenotypes=["HP:1", "HP:2"]),
+            hypothesis("MONDO:2", combined_score=0.3, expected_phenotypes=["HP:2"]),
+            hypothesis("MONDO:3", combined_score=0.1, missing_phenotypes=["HP:3"]),
+        ]
+        candidates = ["HP:1", "HP:2", "HP:3", "HP:4"]
+
+        gains = scorer.calculate_information_gains(hypotheses, candidates)
+
+        assert gains == pytest.approx(
+            [scorer.calculate_information_gain(hypotheses, c) for c in candidates]
+        )
+        assert gains[0] > 0
+        assert gains[3] == pytest.approx(0.0, abs=1e-9)
+
+    def test_single_hypothesis_has_no_gain(self):
+        scorer = BayesianScorer()
+
+        assert scorer.calculate_information_gains([hypothesis("MONDO:1")], ["HP:1"]) == [0.0]
@@ -885,3 +885,169 @@ class TestSyncService:
         # Should fail due to hash mismatch
         assert state.status == SyncOperationStatus.FAILED
         assert "hash" in state.error_message.lower()
+
+    # =========================================================================
+    # Pull Pipeline Tests
+    # =========================================================================
+
+    @pytest.fixture
+    def db_session(self, mock_driver):
+        """Install a session whose queries succeed and return no rows."""
+        session = AsyncMock()
+        result = AsyncMock()
+        result.data.return_value = []
+        session.run.return_value = result
+        mock_driver.session.return_value.__aenter__.return_value = session
+        return session
+
+    def _page(self, sync_service, capsules=(), edges=(), has_more=False, next_cursor=None):
+        """Build a pull page with a valid content hash."""
+        payload = MagicMock()
+        payload.capsules = list(capsules)
+        payload.edges = list(edges)
+        payload.deletions = []
+        payload.has_more = has_more
+        payload.next_cursor = next_cursor
+        payload.content_hash = sync_service._compute_content_hash(
+            payload.capsules, payload.edges, payload.deletions
+        )
+        return payload
+
+    @pytest.mark.asyncio
+    async def test_pull_follows_cursor(self, sync_service, mock_protocol, db_session, sample_peer):
+        """Each request resumes from the previous page's cursor."""
+        sample_peer.sync_direction = SyncDirection.PULL
+        sync_service._peers[sample_peer.id] = sample_peer
+        mock_protocol.send_sync_request.side_effect = [
+            self._page(sync_service, has_more=True, next_cursor="c1"),
+            self._page(sync_service, has_more=True, next_cursor="c2"),
+            self._page(sync_service),
+        ]
+
+        state = await sync_service.sync_with_peer(sample_peer.id, force=True)
+
+        assert state.status == SyncOperationStatus.COMPLETED
+        cursors = [c.kwargs["cursor"] for c in mock_protocol.send_sync_request.call_args_list]
+        assert cursors == [None, "c1", "c2"]
+        assert sample_peer.last_sync_at == state.sync_to
+        assert sample_peer.pull_cursor is None
+
+    @pytest.mark.asyncio
+    async def test_interrupted_pull_keeps_cursor(
+        self, sync_service, mock_protocol, db_session, sample_peer
+    ):
+        """A failed pull keeps its checkpoint and does not move the sync window."""
+        sample_peer.sync_direction = SyncDirection.PULL
+        sync_service._peers[sample_peer.id] = sample_peer
+        mock_protocol.send_sync_request.side_effect = [
+            self._page(sync_service, has_more=True, next_cursor="c1"),
+            None,
+        ]
+
+        state = await sync_service.sync_with_peer(sample_peer.id, force=True)
+
+        assert state.status == SyncOperationStatus.FAILED
+        assert sample_peer.pull_cursor == "c1"
+        assert sample_peer.last_sync_at is None
+
+        mock_protocol.send_sync_request.side_effect = [self._page(sync_service)]
+        await sync_service.sync_with_peer(sample_peer.id, force=True)
+
+        assert mock_protocol.send_sync_request.call_args.kwargs["cursor"] == "c1"
+        assert sample_peer.pull_cursor is None
+
+    @pytest.mark.asyncio
+    async def test_pull_stops_on_stalled_cursor(
+        self, sync_service, mock_protocol, db_session, sample_peer
+    ):
+        """A peer that claims more without advancing its cursor is not polled forever."""
+        sample_peer.sync_direction = SyncDirection.PULL
+        sync_service._peers[sample_peer.id] = sample_peer
+        mock_protocol.send_sync_request.return_value = self._page(
+            sync_service, has_more=True, next_cursor="same"
+        )
+
+        state = await sync_service.sync_with_peer(sample_peer.id, force=True)
+
+        assert state.status == SyncOperationStatus.COMPLETED
+        assert mock_protocol.send_sync_request.call_count == 2
+        assert sample_peer.pull_cursor is None
+
+    @pytest.mark.asyncio
+    async def test_edge_resolved_on_later_page(
+        self, sync_service, mock_protocol, db_session, sample_peer
+    ):
+        """Edges wait for endpoints that arrive on later pages."""
+        sample_peer.sync_direction = SyncDirection.PULL
+        sync_service._peers[sample_peer.id] = sample_peer
+        capsule = {"trust_level": 60, "content_hash": "h"}
+        edge = {"id": "e1", "source_id": "r1", "target_id": "r2"}
+        mock_protocol.send_sync_request.side_effect = [
+            self._page(sync_service, [{**capsule, "id": "r1"}], [edge], True, "c1"),
+            self._page(sync_service, [{**capsule, "id": "r2"}]),
+        ]
+
+        state = await sync_service.sync_with_peer(sample_peer.id, force=True)
+
+        assert state.capsules_created == 2
+        assert state.edges_created == 1
+        assert state.edges_skipped == 0
+
+    @pytest.mark.asyncio
+    async def test_process_incoming_capsules_batches_writes(
+        self, sync_service, db_session, sample_peer
+    ):
+        """A page of new capsules is created and tracked in two writes."""
+        capsules = [{"id": f"r{i}", "trust_level": 60, "content_hash": "h"} for i in range(3)]
+        state = SyncState(peer_id=sample_peer.id, direction=SyncDirection.PULL)
+
+        await sync_service._process_incoming_capsules(sample_peer, capsules, state)
+
+        assert state.capsules_created == 3
+        assert db_session.run.call_count == 2
+        assert len(db_session.run.call_args_list[0].args[1]["rows"]) == 3
+        assert len(sync_service._local_origins) == 3
+
+    # =========================================================================
+    # Push Tests
+    # =========================================================================
+
+    @pytest.mark.asyncio
+    async def test_get_local_changes_skips_federated_origins(
+        self, sync_service, db_session, sample_peer
+    ):
+        """Capsules that came from a peer are not pushed back."""
+        fed = FederatedCapsule(
+            peer_id=sample_peer.id,
+            remote_capsule_id="remote-1",
+            local_capsule_id="local-1",
+            remote_content_hash="h",
+        )
+        sync_service._track_federated_capsule(fed)
+        db_session.run.return_value.data.return_value = [
+            {"capsule": {"id": "local-1", "updated_at": "t1"}},
+            {"capsule": {"id": "local-2", "updated_at": "t2"}},
+        ]
+
+        capsules, after = await sync_service._get_local_changes(since=None, min_trust=0, types=None)
+
+        assert [c["id"] for c in capsules] == ["local-2"]
+        assert after is None
+        assert "coalesce(c.federated, false) = false" in db_session.run.call_args.args[0]
+
+    @pytest.mark.asyncio
+    async def test_push_sends_every_page(self, sync_service, mock_protocol, sample_peer):
+        """Pushes walk all pages of local changes instead of stopping at one."""
+        sync_service._get_local_changes = AsyncMock(
+            side_effect=[([{"id": "a"}], ("t1", "a")), ([{"id": "b"}], None)]
+        )
+        sync_service._get_edge_changes = AsyncMock(return_value=[])
+        state = SyncState(peer_id=sample_peer.id, direction=SyncDirection.PUSH)
+
+        await sync_service._execute_push(sample_peer, state)
+
+        assert mock_protocol.send_sync_push.await_count == 2
+        has_more = [c.kwargs["has_more"] for c in mock_protocol.create_sync_payload.call_args_list]
+        assert has_more == [True, False]
+        assert sync_service._get_local_changes.call_args.kwargs["after"] == ("t1", "a")
+        assert sample_peer.capsules_sent == 2
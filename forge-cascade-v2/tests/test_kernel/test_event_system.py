@@ -9,6 +9,7 @@ Tests cover:
 - Metrics collection
 - Lifecycle management (start, stop)
 - Security limits (subscriber limits, queue backpressure)
+- Sharded dispatch and batched publish/delivery
 """
 
 import asyncio
@@ -20,6 +21,8 @@ import pytest
 from forge.kernel.event_system import (
     EventBus,
     EventMetrics,
+    PartitionKey,
+    ShardMetrics,
     Subscription,
     emit,
     get_event_bus,
@@ -879,6 +882,295 @@ class TestConvenienceFunctions:
         es._event_bus = None
 
 
+# =============================================================================
+# Sharded Dispatch Tests
+# =============================================================================
+
+
+class TestShardedDispatch:
+    """Tests for sharded multi-worker dispatch."""
+
+    def test_invalid_shard_count(self) -> None:
+        """Test that a shard count below one is rejected."""
+        with pytest.raises(ValueError):
+            EventBus(num_shards=0)
+
+    def test_same_key_routes_to_same_shard(self) -> None:
+        """Test that events sharing a partition key share a shard."""
+        bus = EventBus(num_shards=8, partition_key=PartitionKey.CAPSULE_ID)
+        first = Event(
+            id="e1", type=EventType.CAPSULE_CREATED, source="test", payload={"capsule_id": "c1"}
+        )
+        second = Event(
+            id="e2", type=EventType.CAPSULE_UPDATED, source="test", payload={"capsule_id": "c1"}
+        )
+
+        assert bus._shard_for(first) == bus._shard_for(second)
+
+    def test_event_type_partitioning(self) -> None:
+        """Test partitioning by event type."""
+        bus = EventBus(num_shards=4, partition_key="event_type")
+        first = Event(id="e1", type=EventType.CAPSULE_CREATED, source="a", correlation_id="x")
+        second = Event(id="e2", type=EventType.CAPSULE_CREATED, source="b", correlation_id="y")
+
+        assert bus._shard_for(first) == bus._shard_for(second)
+
+    @pytest.mark.asyncio
+    async def test_ordering_preserved_per_key(self) -> None:
+        """Test that events with the same key are delivered in publish order."""
+        bus = EventBus(num_shards=4, partition_key=PartitionKey.CAPSULE_ID)
+        received: dict[str, list[int]] = {}
+
+        async def handler(event: Event) -> None:
+            # Vary processing time so unordered dispatch would reorder events
+            await asyncio.sleep(0.001 * (event.payload["seq"] % 3))
+            received.setdefault(event.payload["capsule_id"], []).append(event.payload["seq"])
+
+        bus.subscribe(handler=handler, event_types={EventType.CAPSULE_UPDATED})
+        await bus.start()
+
+        for seq in range(20):
+            for capsule_id in ("c1", "c2", "c3"):
+                await bus.publish(
+                    event_type=EventType.CAPSULE_UPDATED,
+                    payload={"capsule_id": capsule_id, "seq": seq},
+                    source="test",
+                )
+
+        await bus.stop()
+
+        for capsule_id in ("c1", "c2", "c3"):
+            assert received[capsule_id] == list(range(20))
+
+    @pytest.mark.asyncio
+    async def test_slow_subscriber_does_not_block_other_shards(self) -> None:
+        """Test that a slow partition does not hold up unrelated partitions."""
+        bus = EventBus(num_shards=2, partition_key=PartitionKey.CORRELATION_ID)
+        fast_done = asyncio.Event()
+        release_slow = asyncio.Event()
+
+        # Pick correlation IDs that land on different shards
+        slow_key = "slow"
+        fast_key = next(
+            f"fast-{i}"
+            for i in range(100)
+            if bus._shard_for(
+                Event(id="p", type=EventType.SYSTEM_EVENT, source="t", correlation_id=f"fast-{i}")
+            )
+            != bus._shard_for(
+                Event(id="p", type=EventType.SYSTEM_EVENT, source="t", correlation_id=slow_key)
+            )
+        )
+
+        async def handler(event: Event) -> None:
+            if event.correlation_id == slow_key:
+                await release_slow.wait()
+            else:
+                fast_done.set()
+
+        bus.subscribe(handler=handler, event_types={EventType.SYSTEM_EVENT})
+        await bus.start()
+
+        await bus.publish(EventType.SYSTEM_EVENT, {}, "test", correlation_id=slow_key)
+        await bus.publish(EventType.SYSTEM_EVENT, {}, "test", correlation_id=fast_key)
+
+        await asyncio.wait_for(fast_done.wait(), timeout=1.0)
+        release_slow.set()
+        await bus.stop()
+
+    @pytest.mark.asyncio
+    async def test_shard_metrics_reported(self) -> None:
+        """Test per-shard queue depth and lag metrics."""
+        bus = EventBus(num_shards=3)
+
+        for i in range(6):
+            await bus.publish(EventType.SYSTEM_EVENT, {}, "test", correlation_id=f"k{i}")
+
+        metrics = bus.get_metrics()
+
+        assert metrics["num_shards"] == 3
+        assert metrics["partition_key"] == "correlation_id"
+        assert len(metrics["shards"]) == 3
+        assert sum(shard["queue_depth"] for shard in metrics["shards"]) == 6
+        assert metrics["queue_size"] == 6
+
+        await bus.start()
+        await bus.stop()
+
+        shards = bus.get_shard_metrics()
+        assert sum(shard["events_processed"] for shard in shards) == 6
+        assert all(shard["queue_depth"] == 0 for shard in shards)
+
+    def test_record_lag(self) -> None:
+        """Test shard lag recording."""
+        metrics = ShardMetrics(shard=0)
+        metrics.record_lag(2.0)
+        metrics.record_lag(6.0)
+
+        assert metrics.events_processed == 2
+        assert metrics.last_lag_ms == 6.0
+        assert metrics.max_lag_ms == 6.0
+        assert metrics.avg_lag_ms == 4.0
+
+
+# =============================================================================
+# Batched Publish and Delivery Tests
+# =============================================================================
+
+
+class TestBatching:
+    """Tests for publish_many and micro-batched subscriptions."""
+
+    @pytest.mark.asyncio
+    async def test_publish_many(self, event_bus: EventBus) -> None:
+        """Test that publish_many creates and enqueues one event per payload."""
+        events = await event_bus.publish_many(
+            event_type=EventType.CAPSULE_CREATED,
+            payloads=[{"capsule_id": f"c{i}"} for i in range(5)],
+            source="import",
+            correlation_id="bulk-1",
+        )
+
+        assert [e.payload["capsule_id"] for e in events] == [f"c{i}" for i in range(5)]
+        assert all(e.correlation_id == "bulk-1" for e in events)
+        assert event_bus.get_queue_size() == 5
+        assert event_bus.get_metrics()["events_published"] == 5
+
+    def test_subscribe_batch_validation(self, event_bus: EventBus) -> None:
+        """Test that invalid batch parameters are rejected."""
+
+        async def handler(events: list[Event]) -> None:
+            pass
+
+        with pytest.raises(ValueError):
+            event_bus.subscribe_batch(handler, {EventType.CAPSULE_CREATED}, max_batch_size=0)
+        with pytest.raises(ValueError):
+            event_bus.subscribe_batch(handler, {EventType.CAPSULE_CREATED}, max_wait_ms=-1)
+
+    @pytest.mark.asyncio
+    async def test_batch_flushed_by_size(self, started_event_bus: EventBus) -> None:
+        """Test that a full batch is delivered in one handler call."""
+        batches: list[list[str]] = []
+
+        async def handler(events: list[Event]) -> None:
+            batches.append([e.payload["capsule_id"] for e in events])
+
+        started_event_bus.subscribe_batch(
+            handler=handler,
+            event_types={EventType.CAPSULE_CREATED},
+            max_batch_size=10,
+            max_wait_ms=10_000,
+        )
+
+        await started_event_bus.publish_many(
+            event_type=EventType.CAPSULE_CREATED,
+            payloads=[{"capsule_id": f"c{i}"} for i in range(20)],
+            source="import",
+        )
+        await asyncio.sleep(0.1)
+
+        assert batches == [
+            [f"c{i}" for i in range(10)],
+            [f"c{i}" for i in range(10, 20)],
+        ]
+        assert started_event_bus.get_metrics()["events_delivered"] == 20
+
+    @pytest.mark.asyncio
+    async def test_batch_flushed_by_time(self, started_event_bus: EventBus) -> None:
+        """Test that a partial batch is delivered once its wait time elapses."""
+        batches: list[list[Event]] = []
+
+        async def handler(events: list[Event]) -> None:
+            batches.append(events)
+
+        started_event_bus.subscribe_batch(
+            handler=handler,
+            event_types={EventType.CAPSULE_CREATED},
+            max_batch_size=100,
+            max_wait_ms=20,
+        )
+
+        await started_event_bus.publish_many(
+            event_type=EventType.CAPSULE_CREATED,
+            payloads=[{"n": i} for i in range(3)],
+            source="import",
+        )
+        await asyncio.sleep(0.01)
+        assert started_event_bus.get_pending_batch_size() == 3
+
+        await asyncio.sleep(0.1)
+        assert len(batches) == 1
+        assert [e.payload["n"] for e in batches[0]] == [0, 1, 2]
+        assert started_event_bus.get_pending_batch_size() == 0
+
+    @pytest.mark.asyncio
+    async def test_stop_flushes_pending_batches(self, event_bus: EventBus) -> None:
+        """Test that stopping the bus delivers partially filled batches."""
+        received: list[Event] = []
+
+        async def handler(events: list[Event]) -> None:
+            received.extend(events)
+
+        event_bus.subscribe_batch(
+            handler=handler,
+            event_types={EventType.CAPSULE_CREATED},
+            max_batch_size=100,
+            max_wait_ms=60_000,
+        )
+        await event_bus.start()
+        await event_bus.publish(EventType.CAPSULE_CREATED, {}, "test")
+        await asyncio.sleep(0.05)
+        assert received == []
+
+        await event_bus.stop()
+        assert len(received) == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_batch_goes_to_dead_letter(self, started_event_bus: EventBus) -> None:
+        """Test that every event of a failing batch is dead-lettered."""
+
+        async def failing_handler(events: list[Event]) -> None:
+            raise ValueError("Batch handler error")
+
+        started_event_bus.subscribe_batch(
+            handler=failing_handler,
+            event_types={EventType.CAPSULE_CREATED},
+            max_batch_size=3,
+        )
+
+        await started_event_bus.publish_many(
+            event_type=EventType.CAPSULE_CREATED,
+            payloads=[{}, {}, {}],
+            source="test",
+        )
+        await asyncio.sleep(0.2)
+
+        assert started_event_bus._dead_letter_queue.qsize() == 3
+        assert started_event_bus.get_metrics()["events_failed"] == 3
+
+    @pytest.mark.asyncio
+    async def test_unsubscribe_batch_drops_pending(self, started_event_bus: EventBus) -> None:
+        """Test that unsubscribing discards events waiting for a batch."""
+        received: list[Event] = []
+
+        async def handler(events: list[Event]) -> None:
+            received.extend(events)
+
+        sub_id = started_event_bus.subscribe_batch(
+            handler=handler,
+            event_types={EventType.CAPSULE_CREATED},
+            max_wait_ms=20,
+        )
+        await started_event_bus.publish(EventType.CAPSULE_CREATED, {}, "test")
+        await asyncio.sleep(0.005)
+
+        assert started_event_bus.unsubscribe(sub_id) is True
+        await asyncio.sleep(0.05)
+
+        assert received == []
+        assert started_event_bus.get_pending_batch_size() == 0
+
+
 # =============================================================================
 # Queue Backpressure Tests
 # =============================================================================
@@ -4,6 +4,8 @@ Comprehensive tests for the Pipeline.
 Tests cover:
 - Pipeline configuration (phase configs, enable/disable)
 - Phase execution (sequential and parallel)
+- Dependency-aware DAG scheduling and critical-path timing
+- Batched execution
 - Custom phase handlers
 - Hooks (pre-phase, post-phase, completion)
 - Error handling and failure modes
@@ -37,6 +39,8 @@ from forge.kernel.pipeline import (
 from forge.models.events import Event, EventType
 from forge.models.overlay import Capability, FuelBudget
 from forge.overlays.base import BaseOverlay, OverlayContext, OverlayResult
+from forge.overlays.ml_intelligence import MLIntelligenceOverlay
+from forge.overlays.security_validator import SecurityValidatorOverlay
 
 # =============================================================================
 # Test Overlays for Pipeline
@@ -858,6 +862,315 @@ class TestGlobalPipeline:
         assert p._pipeline is None
 
 
+# =============================================================================
+# DAG Scheduling Tests
+# =============================================================================
+
+
+def _sleeping_handler(phase: PipelinePhase, key: str, delay: float = 0.1) -> Any:
+    """Build a custom phase handler that sleeps and then writes one key."""
+
+    async def handler(context: PipelineContext) -> PhaseResult:
+        await asyncio.sleep(delay)
+        return PhaseResult(
+            phase=phase,
+            status=PipelineStatus.COMPLETED,
+            data={**context.data, key: True},
+        )
+
+    return handler
+
+
+class TestDagScheduling:
+    """Tests for dependency-aware phase and overlay scheduling."""
+
+    def test_conflicts(self) -> None:
+        """Test read/write conflict detection."""
+        from forge.kernel.pipeline import _conflicts
+
+        a = frozenset({"a"})
+        b = frozenset({"b"})
+
+        assert _conflicts(frozenset(), a, a, b)  # read after write
+        assert _conflicts(a, b, frozenset(), a)  # write after read
+        assert _conflicts(frozenset(), a, frozenset(), a)  # write after write
+        assert not _conflicts(a, b, a, frozenset({"c"}))
+        assert _conflicts(None, None, a, b)
+        assert not _conflicts(None, None, frozenset(), frozenset())
+
+    def test_undeclared_phases_stay_ordered(self, pipeline: Pipeline) -> None:
+        """Test that undeclared phases depend on every earlier phase."""
+        for phase in (PipelinePhase.ANALYSIS, PipelinePhase.VALIDATION):
+            pipeline.set_phase_handler(phase, _sleeping_handler(phase, phase.value))
+
+        deps = pipeline._build_phase_dependencies(
+            [PipelinePhase.ANALYSIS, PipelinePhase.VALIDATION]
+        )
+
+        assert deps[PipelinePhase.VALIDATION] == {PipelinePhase.ANALYSIS}
+
+    @pytest.mark.asyncio
+    async def test_independent_phases_run_concurrently(self, pipeline: Pipeline) -> None:
+        """Test that phases with disjoint data access run in parallel."""
+        for phase in (PipelinePhase.ANALYSIS, PipelinePhase.VALIDATION):
+            pipeline.configure_phase(
+                phase,
+                PhaseConfig(
+                    name=phase, reads=frozenset({"content"}), writes=frozenset({phase.value})
+                ),
+            )
+            pipeline.set_phase_handler(phase, _sleeping_handler(phase, phase.value))
+
+        result = await pipeline.execute(input_data={"content": "x"})
+
+        assert result.status == PipelineStatus.COMPLETED
+        assert result.final_data["analysis"] is True
+        assert result.final_data["validation"] is True
+        assert result.duration_ms < 180
+        # Only one of the two is on the critical path; the later default
+        # phases (gated on VALIDATION) pass straight through
+        assert not {PipelinePhase.ANALYSIS, PipelinePhase.VALIDATION} <= set(result.critical_path)
+        assert result.critical_path_ms >= 100
+
+    @pytest.mark.asyncio
+    async def test_dependent_phases_are_ordered(self, pipeline: Pipeline) -> None:
+        """Test that a phase reading another's output waits for it."""
+        order: list[PipelinePhase] = []
+
+        def tracking(phase: PipelinePhase, reads: set[str], writes: set[str]) -> None:
+            async def handler(context: PipelineContext) -> PhaseResult:
+                await asyncio.sleep(0.05)
+                order.append(phase)
+                return PhaseResult(
+                    phase=phase,
+                    status=PipelineStatus.COMPLETED,
+                    data={key: True for key in writes},
+                )
+
+            pipeline.configure_phase(
+                phase,
+                PhaseConfig(name=phase, reads=frozenset(reads), writes=frozenset(writes)),
+            )
+            pipeline.set_phase_handler(phase, handler)
+
+        tracking(PipelinePhase.ANALYSIS, {"content"}, {"embedding"})
+        tracking(PipelinePhase.VALIDATION, {"embedding"}, {"validated"})
+
+        result = await pipeline.execute(input_data={"content": "x"})
+
+        assert order == [PipelinePhase.ANALYSIS, PipelinePhase.VALIDATION]
+        assert result.critical_path[:2] == [PipelinePhase.ANALYSIS, PipelinePhase.VALIDATION]
+
+    @pytest.mark.asyncio
+    async def test_explicit_dependency(self, pipeline: Pipeline) -> None:
+        """Test that depends_on orders phases without a data conflict."""
+        pipeline.configure_phase(
+            PipelinePhase.VALIDATION,
+            PhaseConfig(
+                name=PipelinePhase.VALIDATION,
+                reads=frozenset(),
+                writes=frozenset({"v"}),
+                depends_on=frozenset({PipelinePhase.ANALYSIS}),
+            ),
+        )
+        pipeline.configure_phase(
+            PipelinePhase.ANALYSIS,
+            PhaseConfig(name=PipelinePhase.ANALYSIS, reads=frozenset(), writes=frozenset({"a"})),
+        )
+
+        deps = pipeline._build_phase_dependencies(
+            [PipelinePhase.ANALYSIS, PipelinePhase.VALIDATION]
+        )
+
+        assert deps[PipelinePhase.VALIDATION] == {PipelinePhase.ANALYSIS}
+
+    @pytest.mark.asyncio
+    async def test_declared_overlays_run_concurrently(
+        self, overlay_manager: OverlayManager, event_bus: EventBus
+    ) -> None:
+        """Test that declared overlays in a sequential phase run in parallel."""
+        await overlay_manager.start()
+
+        first = SlowOverlay(delay=0.1)
+        second = SlowOverlay(delay=0.1)
+        first.NAME = "ingestion"
+        second.NAME = "normalization"
+        first.READS = second.READS = frozenset()
+        first.WRITES = frozenset({"slow_processed"})
+        second.WRITES = frozenset({"normalized"})
+        await overlay_manager.register_instance(first)
+        await overlay_manager.register_instance(second)
+
+        pipeline = Pipeline(overlay_manager=overlay_manager, event_bus=event_bus)
+        start = asyncio.get_running_loop().time()
+        result = await pipeline.execute(input_data={})
+        elapsed = asyncio.get_running_loop().time() - start
+
+        ingestion = result.phases[PipelinePhase.INGESTION]
+        assert ingestion.status == PipelineStatus.COMPLETED
+        assert sorted(ingestion.overlays_executed) == ["ingestion", "normalization"]
+        assert elapsed < 0.18
+
+        await overlay_manager.stop()
+
+    @pytest.mark.asyncio
+    async def test_builtin_analysis_and_validation_run_concurrently(
+        self, overlay_manager: OverlayManager, event_bus: EventBus
+    ) -> None:
+        """Test that the ML and security overlays' declarations let their phases overlap."""
+        await overlay_manager.start()
+        started: set[str] = set()
+        overlapped: list[bool] = []
+
+        async def pause(name: str) -> None:
+            started.add(name)
+            await asyncio.sleep(0.1)
+            overlapped.append(started == {"ml", "validator"})
+
+        async def embed(text: str) -> list[float]:
+            await pause("ml")
+            return ml._pseudo_embedding(text)
+
+        ml = MLIntelligenceOverlay(embedding_provider=embed)
+        validator = SecurityValidatorOverlay(enable_rate_limiting=False)
+        validate = validator._validate
+
+        async def slow_validate(*args: Any) -> Any:
+            await pause("validator")
+            return await validate(*args)
+
+        validator._validate = slow_validate  # type: ignore[method-assign]
+        await overlay_manager.register_instance(ml)
+        await overlay_manager.register_instance(validator)
+        pipeline = Pipeline(overlay_manager=overlay_manager, event_bus=event_bus)
+
+        deps = pipeline._build_phase_dependencies(pipeline.PHASE_ORDER)
+        result = await pipeline.execute(input_data={"content": "Notes on protein folding"})
+
+        assert PipelinePhase.ANALYSIS not in deps[PipelinePhase.VALIDATION]
+        assert deps[PipelinePhase.CONSENSUS] >= {PipelinePhase.VALIDATION}
+        assert result.status == PipelineStatus.COMPLETED
+        assert result.final_data["analysis"]["keywords"]
+        assert result.final_data["validation"]["valid"] is True
+        assert overlapped == [True, True]
+        assert result.critical_path_ms < 180
+
+        await overlay_manager.stop()
+
+    @pytest.mark.asyncio
+    async def test_required_failure_stops_scheduling(self, pipeline: Pipeline) -> None:
+        """Test that a failed required phase prevents dependent phases."""
+
+        async def failing(context: PipelineContext) -> PhaseResult:
+            return PhaseResult(
+                phase=PipelinePhase.ANALYSIS, status=PipelineStatus.FAILED, errors=["boom"]
+            )
+
+        pipeline.set_phase_handler(PipelinePhase.ANALYSIS, failing)
+        pipeline.set_phase_handler(
+            PipelinePhase.VALIDATION,
+            _sleeping_handler(PipelinePhase.VALIDATION, "validated", delay=0),
+        )
+
+        result = await pipeline.execute(input_data={})
+
+        assert result.status == PipelineStatus.FAILED
+        assert PipelinePhase.VALIDATION not in result.phases
+
+
+# =============================================================================
+# Batch Execution Tests
+# =============================================================================
+
+
+class BatchIngestionOverlay(IngestionOverlay):
+    """Ingestion overlay recording how it is called."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.batch_sizes: list[int] = []
+
+    async def execute_batch(
+        self,
+        context: OverlayContext,
+        items: list[dict[str, Any]],
+        event: Event | None = None,
+    ) -> list[OverlayResult]:
+        self.batch_sizes.append(len(items))
+        return [OverlayResult.ok(data={"ingested": True, "n": item["n"]}) for item in items]
+
+
+class TestPipelineBatchExecution:
+    """Tests for Pipeline.execute_batch."""
+
+    @pytest.mark.asyncio
+    async def test_execute_batch_empty(self, pipeline: Pipeline) -> None:
+        """Test that an empty batch returns no results."""
+        assert await pipeline.execute_batch([]) == []
+
+    @pytest.mark.asyncio
+    async def test_execute_batch_calls_overlay_once(
+        self, overlay_manager: OverlayManager, event_bus: EventBus
+    ) -> None:
+        """Test that each overlay is called once for the whole batch."""
+        await overlay_manager.start()
+        ingestion = BatchIngestionOverlay()
+        await overlay_manager.register_instance(ingestion)
+        pipeline = Pipeline(overlay_manager=overlay_manager, event_bus=event_bus)
+
+        results = await pipeline.execute_batch([{"n": i, "capsule_id": f"c{i}"} for i in range(5)])
+
+        assert ingestion.batch_sizes == [5]
+        assert [r.final_data["n"] for r in results] == list(range(5))
+        assert all(r.success for r in results)
+        assert all(r.final_data["ingested"] for r in results)
+        assert len({r.pipeline_id for r in results}) == 5
+        assert len({r.correlation_id for r in results}) == 1
+        assert event_bus.get_metrics()["events_published"] == 5
+
+        await overlay_manager.stop()
+
+    @pytest.mark.asyncio
+    async def test_execute_batch_failure_is_per_item(
+        self, overlay_manager: OverlayManager, event_bus: EventBus
+    ) -> None:
+        """Test that an item failing a required phase stops only that item."""
+
+        class SelectiveValidator(ValidationOverlay):
+            async def execute(self, context, event=None, input_data=None):
+                if input_data and input_data.get("bad"):
+                    return OverlayResult.fail("Validation failed")
+                return await super().execute(context, event, input_data)
+
+        await overlay_manager.start()
+        await overlay_manager.register_instance(SelectiveValidator())
+        pipeline = Pipeline(overlay_manager=overlay_manager, event_bus=event_bus)
+
+        results = await pipeline.execute_batch([{"bad": False}, {"bad": True}, {"bad": False}])
+
+        assert [r.status for r in results] == [
+            PipelineStatus.COMPLETED,
+            PipelineStatus.FAILED,
+            PipelineStatus.COMPLETED,
+        ]
+        assert PipelinePhase.CONSENSUS not in results[1].phases
+        assert PipelinePhase.SETTLEMENT in results[0].phases
+        assert results[0].final_data["validated"] is True
+
+        await overlay_manager.stop()
+
+    @pytest.mark.asyncio
+    async def test_execute_batch_runs_hooks_per_item(self, pipeline: Pipeline) -> None:
+        """Test that completion hooks and history see every item."""
+        completed: list[PipelineResult] = []
+        pipeline.add_completion_hook(completed.append)
+
+        results = await pipeline.execute_batch([{}, {}])
+
+        assert completed == results
+        assert pipeline.get_pipeline_stats()["total"] == 2
+
+
 # =============================================================================
 # Phase Order Tests
 # =============================================================================
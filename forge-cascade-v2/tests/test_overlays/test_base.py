@@ -628,6 +628,76 @@ class TestBaseOverlay:
         assert context.metadata["custom_key"] == "custom_value"
 
 
+# =============================================================================
+# Batch Execution Tests
+# =============================================================================
+
+
+class TestBatchExecution:
+    """Tests for run_batch and the default execute_batch."""
+
+    @pytest.mark.asyncio
+    async def test_run_batch_calls_execute_per_item(self):
+        """Test that the default execute_batch runs execute for every item."""
+        overlay = ConcreteOverlay()
+        await overlay.initialize()
+        context = overlay.create_context()
+
+        results = await overlay.run_batch(context, [{"n": 1}, {"n": 2}, {"n": 3}])
+
+        assert len(results) == 3
+        assert all(r.success for r in results)
+        assert [call[2] for call in overlay.execute_calls] == [{"n": 1}, {"n": 2}, {"n": 3}]
+        assert overlay.execution_count == 3
+        assert overlay.error_count == 0
+
+    @pytest.mark.asyncio
+    async def test_run_batch_isolates_item_errors(self):
+        """Test that an item raising an error fails only that item."""
+        overlay = ErrorOverlay(ValueError("bad item"))
+        await overlay.initialize()
+
+        results = await overlay.run_batch(overlay.create_context(), [{}, {}])
+
+        assert [r.success for r in results] == [False, False]
+        assert "bad item" in results[0].error
+        assert overlay.error_count == 2
+
+    @pytest.mark.asyncio
+    async def test_run_batch_without_initialization(self):
+        """Test run_batch fails every item when not initialized."""
+        overlay = ConcreteOverlay()
+
+        results = await overlay.run_batch(overlay.create_context(), [{}, {}])
+
+        assert len(results) == 2
+        assert all("not initialized" in r.error.lower() for r in results)
+
+    @pytest.mark.asyncio
+    async def test_run_batch_empty(self):
+        """Test run_batch with no items."""
+        overlay = ConcreteOverlay()
+        await overlay.initialize()
+
+        assert await overlay.run_batch(overlay.create_context(), []) == []
+
+    @pytest.mark.asyncio
+    async def test_run_batch_rejects_mismatched_results(self):
+        """Test that execute_batch must return one result per item."""
+
+        class ShortBatchOverlay(ConcreteOverlay):
+            async def execute_batch(self, context, items, event=None):
+                return [OverlayResult.ok()]
+
+        overlay = ShortBatchOverlay()
+        await overlay.initialize()
+
+        results = await overlay.run_batch(overlay.create_context(), [{}, {}])
+
+        assert [r.success for r in results] == [False, False]
+        assert "2 items" in results[0].error
+
+
 # =============================================================================
 # PassthroughOverlay Tests
 # =============================================================================
@@ -0,0 +1,328 @@
+"""
+Tests for the Lineage Graph Engine
+
+Tests the compact lineage graph backing the lineage tracker:
+- Mapping behaviour and adjacency bookkeeping
+- Incremental depth, descendant counts and influence
+- Reachability and cycle checks
+- LRU eviction
+"""
+
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from forge.overlays.lineage_graph import LineageGraph
+from forge.overlays.lineage_tracker import LineageNode
+
+
+def add(graph: LineageGraph, capsule_id: str, *parents: str, trust: int = 60) -> LineageNode:
+    node = LineageNode(
+        capsule_id=capsule_id,
+        capsule_type="KNOWLEDGE",
+        trust_at_creation=trust,
+        parent_ids=list(parents),
+    )
+    graph[capsule_id] = node
+    return node
+
+
+def recompute(graph: LineageGraph) -> dict[str, tuple[int, int, float]]:
+    """Depth, descendant count and influence per node, computed from scratch."""
+    depths: dict[str, int] = {}
+
+    def depth(capsule_id: str) -> int:
+        if capsule_id not in depths:
+            parents = graph[capsule_id].parent_ids
+            depths[capsule_id] = max((depth(p) for p in parents), default=-1) + 1
+        return depths[capsule_id]
+
+    keep = 1 - graph._trust_decay_rate
+    expected = {}
+    for capsule_id in graph:
+        nearby = graph.descendants(capsule_id, max_depth=graph.INFLUENCE_GENERATIONS)
+        influence = sum(
+            graph[d].trust_at_creation * keep ** (depth(d) - depth(capsule_id)) / 100
+            for d in nearby
+        )
+        expected[capsule_id] = (depth(capsule_id), len(nearby), influence)
+    return expected
+
+
+@pytest.fixture
+def diamond():
+    """root -> a, root -> b, a -> c, b -> c, c -> d"""
+    graph = LineageGraph(trust_decay_rate=0.5)
+    add(graph, "root", trust=100)
+    add(graph, "a", "root", trust=100)
+    add(graph, "b", "root", trust=100)
+    add(graph, "c", "a", "b", trust=100)
+    add(graph, "d", "c", trust=100)
+    return graph
+
+
+# =============================================================================
+# Structure Tests
+# =============================================================================
+
+
+class TestLineageGraphStructure:
+    """Tests for mapping behaviour and adjacency."""
+
+    def test_mapping_interface(self, diamond):
+        assert len(diamond) == 5
+        assert "c" in diamond
+        assert list(diamond) == ["root", "a", "b", "c", "d"]
+        assert diamond.get("missing") is None
+
+    def test_records_mirror_adjacency(self, diamond):
+        assert diamond["root"].child_ids == ["a", "b"]
+        assert diamond["c"].parent_ids == ["a", "b"]
+        assert diamond["a"].child_ids == ["c"]
+
+    def test_insert_with_existing_children(self):
+        graph = LineageGraph()
+        add(graph, "child")
+        graph["parent"] = LineageNode(
+            capsule_id="parent", capsule_type="KNOWLEDGE", child_ids=["child"]
+        )
+
+        assert graph["child"].parent_ids == ["parent"]
+        assert graph["child"].depth == 1
+        assert graph["parent"].descendant_count == 1
+
+    def test_remove_detaches_neighbours(self, diamond):
+        del diamond["c"]
+
+        assert diamond["a"].child_ids == []
+        assert diamond["d"].parent_ids == []
+        assert diamond["root"].descendant_count == 2
+        assert diamond.ancestors("d") == []
+
+    def test_slot_reuse(self, diamond):
+        del diamond["d"]
+        add(diamond, "e", "c")
+
+        assert diamond.ancestors("e") == ["c", "a", "b", "root"]
+
+    def test_reinsert_keeps_children_linked(self, diamond):
+        add(diamond, "c", "a", trust=40)
+
+        assert diamond["d"].parent_ids == ["c"]
+        assert diamond["c"].child_ids == ["d"]
+        assert diamond["b"].child_ids == []
+        assert diamond.is_ancestor("a", "d")
+        assert not diamond.is_ancestor("b", "d")
+        assert diamond["c"].descendant_count == 1
+        assert diamond["root"].descendant_count == 4
+        assert diamond["b"].descendant_count == 0
+        assert len(diamond) == 5
+
+
+# =============================================================================
+# Metric Tests
+# =============================================================================
+
+
+class TestLineageGraphMetrics:
+    """Tests for incrementally maintained metrics."""
+
+    def test_depth_uses_longest_path(self, diamond):
+        add(diamond, "shortcut", "root")
+        diamond.link("shortcut", "d")
+
+        assert diamond["shortcut"].depth == 1
+        assert diamond["c"].depth == 2
+        assert diamond["d"].depth == 3
+        assert add(diamond, "deep", "d").depth == 4
+
+    def test_link_pushes_depth_down(self):
+        graph = LineageGraph()
+        for capsule_id in ("r", "x", "y"):
+            add(graph, capsule_id)
+        add(graph, "x1", "x")
+        add(graph, "x2", "x1")
+        add(graph, "y1", "y")
+
+        graph.link("x2", "y")
+
+        assert [graph[c].depth for c in ("y", "y1")] == [3, 4]
+
+    def test_descendants_counted_once(self, diamond):
+        assert diamond["root"].descendant_count == 4
+        assert diamond["a"].descendant_count == 2
+        assert diamond["d"].descendant_count == 0
+
+    def test_influence_matches_full_recompute(self, diamond):
+        # root sees a, b at depth 1, c at depth 2 and d at depth 3
+        assert diamond["root"].influence_score == pytest.approx(0.5 + 0.5 + 0.25 + 0.125)
+
+        diamond.link("root", "d")
+        assert diamond["root"].descendant_count == 4
+        assert diamond["root"].influence_score == pytest.approx(1.375)
+
+    def test_incremental_metrics_on_random_dag(self):
+        rng = random.Random(5)
+        graph = LineageGraph(trust_decay_rate=0.1)
+        ids = [f"n{i}" for i in range(200)]
+        for i, capsule_id in enumerate(ids):
+            parents = rng.sample(ids[:i], k=min(i, rng.randint(0, 2)))
+            add(graph, capsule_id, *parents, trust=rng.randint(10, 100))
+        for _ in range(100):
+            parent, child = rng.sample(ids, 2)
+            if not graph.would_create_cycle(parent, child):
+                graph.link(parent, child)
+
+        incremental = {c: (n.descendant_count, n.influence_score) for c, n in graph.items()}
+        graph._refresh_metrics(graph._index.values())
+
+        for capsule_id, node in graph.items():
+            count, influence = incremental[capsule_id]
+            assert count == node.descendant_count
+            assert influence == pytest.approx(node.influence_score)
+
+    def test_reinsert_pushes_depth_to_other_parents(self):
+        graph = LineageGraph(trust_decay_rate=0.05)
+        add(graph, "r")
+        add(graph, "d1", "r")
+        add(graph, "d2", "d1")
+        add(graph, "k")
+        add(graph, "s")
+        add(graph, "leaf", "k", "s", trust=100)
+
+        add(graph, "k", "d2")
+
+        assert graph["leaf"].depth == 4
+        assert graph["s"].influence_score == pytest.approx(0.95**4)
+
+    def test_remove_lowers_orphaned_depths(self, diamond):
+        add(diamond, "e", "d", trust=100)
+
+        del diamond["c"]
+
+        assert [diamond[c].depth for c in ("d", "e")] == [0, 1]
+        assert diamond["d"].influence_score == pytest.approx(0.5)
+
+    def test_influence_is_bounded_to_nearby_generations(self):
+        graph = LineageGraph()
+        for i in range(5000):
+            add(graph, f"n{i}", *([f"n{i - 1}"] if i else []))
+
+        assert graph["n0"].descendant_count == graph.INFLUENCE_GENERATIONS
+        assert graph["n4999"].depth == 4999
+
+    def test_metrics_match_recompute_under_mutation(self):
+        rng = random.Random(23)
+        graph = LineageGraph(trust_decay_rate=0.1)
+        ids = [f"n{i}" for i in range(150)]
+        for i, capsule_id in enumerate(ids):
+            parents = rng.sample(ids[:i], k=min(i, rng.randint(0, 2)))
+            add(graph, capsule_id, *parents, trust=rng.randint(10, 100))
+
+        for step in range(300):
+            live = list(graph)
+            action = step % 4
+            if action == 0:
+                parent, child = rng.sample(live, 2)
+                if not graph.would_create_cycle(parent, child):
+                    graph.link(parent, child)
+            elif action == 1:
+                capsule_id = rng.choice(live)
+                parents = [
+                    p
+                    for p in rng.sample(live, k=rng.randint(0, 2))
+                    if not graph.would_create_cycle(p, capsule_id)
+                ]
+                add(graph, capsule_id, *parents, trust=rng.randint(10, 100))
+            elif action == 2:
+                graph.remove_many(rng.sample(live, k=2))
+            else:
+                capsule_id = f"x{step}"
+                add(graph, capsule_id, *rng.sample(live, k=min(len(live), 2)))
+
+            expected = recompute(graph)
+            for capsule_id, node in graph.items():
+                depth, count, influence = expected[capsule_id]
+                assert (node.depth, node.descendant_count) == (depth, count), capsule_id
+                assert node.influence_score == pytest.approx(influence), capsule_id
+
+    def test_recalculate_depth_repairs_records(self, diamond):
+        for node in diamond.values():
+            node.depth = 0
+
+        diamond.recalculate_depth("root")
+
+        assert [diamond[c].depth for c in ("root", "a", "b", "c", "d")] == [0, 1, 1, 2, 3]
+
+
+# =============================================================================
+# Reachability Tests
+# =============================================================================
+
+
+class TestLineageGraphReachability:
+    """Tests for ancestor queries and cycle detection."""
+
+    def test_is_ancestor(self, diamond):
+        assert diamond.is_ancestor("root", "d")
+        assert diamond.is_ancestor("b", "c")
+        assert not diamond.is_ancestor("a", "b")
+        assert not diamond.is_ancestor("d", "root")
+        assert not diamond.is_ancestor("root", "root")
+
+    def test_would_create_cycle(self, diamond):
+        assert diamond.would_create_cycle("d", "root")
+        assert diamond.would_create_cycle("c", "c")
+        assert not diamond.would_create_cycle("a", "b")
+        assert not diamond.would_create_cycle("root", "missing")
+
+    def test_walk_respects_generations(self, diamond):
+        assert diamond.descendants("root", max_depth=1) == ["a", "b"]
+        assert diamond.descendants("root", max_depth=2) == ["a", "b", "c"]
+        assert diamond.ancestors("d") == ["c", "a", "b", "root"]
+
+    def test_matches_exhaustive_search_on_random_dag(self):
+        rng = random.Random(11)
+        graph = LineageGraph()
+        ids = [f"n{i}" for i in range(300)]
+        for i, capsule_id in enumerate(ids):
+            parents = rng.sample(ids[:i], k=min(i, rng.randint(0, 2)))
+            add(graph, capsule_id, *parents)
+        for _ in range(150):
+            parent, child = rng.sample(ids, 2)
+            if not graph.would_create_cycle(parent, child):
+                graph.link(parent, child)
+        graph.remove_many(rng.sample(ids, 30))
+
+        live = list(graph)
+        for _ in range(500):
+            source, target = rng.sample(live, 2)
+            assert graph.is_ancestor(source, target) == (target in graph.descendants(source))
+
+
+# =============================================================================
+# Eviction Tests
+# =============================================================================
+
+
+class TestLineageGraphEviction:
+    """Tests for LRU eviction."""
+
+    def test_evicts_least_recently_used(self, diamond):
+        diamond.touch("root")
+
+        evicted = diamond.evict_lru(2)
+
+        assert evicted == ["a", "b"]
+        assert "root" in diamond
+        assert diamond["root"].descendant_count == 0
+        assert diamond["c"].parent_ids == []
+
+    def test_clear(self, diamond):
+        diamond.clear()
+
+        assert len(diamond) == 0
+        add(diamond, "fresh")
+        assert diamond["fresh"].depth == 0
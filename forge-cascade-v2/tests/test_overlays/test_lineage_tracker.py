@@ -747,6 +747,48 @@ class TestLineageTrackerOverlay:
         assert len(overlay._nodes) == 0
         assert len(overlay._roots) == 0
 
+    @pytest.mark.asyncio
+    async def test_execute_batch_processes_parents_first(self, overlay, context):
+        """Test batched creation resolves in-batch parents before children."""
+        await overlay.initialize()
+
+        event = Event(
+            id="event-batch",
+            type=EventType.CAPSULE_CREATED,
+            source="test",
+            payload={},
+        )
+        items = [
+            {"capsule_id": "grandchild", "type": "KNOWLEDGE", "parent_id": "child"},
+            {"capsule_id": "child", "type": "KNOWLEDGE", "parent_id": "root"},
+            {"capsule_id": "root", "type": "KNOWLEDGE"},
+        ]
+
+        results = await overlay.execute_batch(context, items, event=event)
+
+        assert [r.data["capsule_id"] for r in results] == ["grandchild", "child", "root"]
+        assert all(r.success for r in results)
+        assert results[0].data["depth"] == 2
+        assert results[1].data["depth"] == 1
+        assert results[2].data["is_root"] is True
+
+    @pytest.mark.asyncio
+    async def test_execute_batch_handles_creations_in_one_pass(self, overlay, context):
+        """Test batched creation does not go through per-item execute()."""
+        await overlay.initialize()
+
+        async def per_item(*args, **kwargs):
+            raise AssertionError("execute() should not be called per item")
+
+        overlay.execute = per_item
+        event = Event(id="event-batch", type=EventType.CAPSULE_CREATED, source="test", payload={})
+        items = [{"capsule_id": f"cap-{i}", "type": "KNOWLEDGE"} for i in range(5)]
+
+        results = await overlay.execute_batch(context, items, event=event)
+
+        assert [r.data["capsule_id"] for r in results] == [f"cap-{i}" for i in range(5)]
+        assert all(r.success and r.data["anomalies"] == [] for r in results)
+
 
 # =============================================================================
 # Memory Management Tests
@@ -833,7 +875,6 @@ class TestLineageMemoryManagement:
             overlay._nodes[f"cap-{i}"] = LineageNode(
                 capsule_id=f"cap-{i}", capsule_type="KNOWLEDGE"
             )
-            overlay._nodes_access_order.append(f"cap-{i}")
 
         # Evict 5 nodes
         evicted = overlay._evict_lru_nodes(count=5)
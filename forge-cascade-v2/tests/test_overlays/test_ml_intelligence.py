@@ -17,6 +17,7 @@ Tests cover:
 """
 
 import math
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -312,6 +313,30 @@ class TestEmbeddingGeneration:
         assert result.model == "external"
         assert len(result.embedding) == 128
 
+    @pytest.mark.asyncio
+    async def test_execute_batch_prefetches_embeddings(
+        self,
+        initialized_overlay: MLIntelligenceOverlay,
+        overlay_context: OverlayContext,
+    ) -> None:
+        """Test batched execution embeds uncached content in one request."""
+        service = MagicMock()
+        service.embed_batch = AsyncMock(
+            side_effect=lambda texts: [
+                MagicMock(embedding=[0.5] * 384, dimensions=384) for _ in texts
+            ]
+        )
+        items = [{"content": f"batched content {i}"} for i in range(4)]
+
+        with patch("forge.services.embedding.get_embedding_service", return_value=service):
+            results = await initialized_overlay.execute_batch(overlay_context, items)
+
+        assert len(results) == 4
+        assert all(r.success for r in results)
+        service.embed_batch.assert_awaited_once()
+        assert len(service.embed_batch.await_args.args[0]) == 4
+        assert initialized_overlay._stats["cache_hits"] >= 4
+
 
 # =============================================================================
 # Classification Tests
@@ -0,0 +1,347 @@
+"""
+Audit Writer Tests for Forge Cascade V2
+
+Tests for the write-behind audit pipeline:
+- Group commit by size and by interval
+- Back-pressure and retry
+- Journal replay and cleanup
+- AuditRepository integration
+"""
+
+import asyncio
+import json
+import os
+from unittest.mock import AsyncMock
+
+import pytest
+from neo4j.exceptions import ClientError, DatabaseError, ServiceUnavailable, TransientError
+
+from forge.database.client import Neo4jClient
+from forge.models.events import EventType
+from forge.repositories.audit_repository import AuditRepository
+from forge.repositories.audit_writer import DEAD_LETTER_FILE, AuditWriter
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+
+
+@pytest.fixture
+def mock_db_client():
+    """Create mock database client."""
+    client = AsyncMock(spec=Neo4jClient)
+    client.execute_write = AsyncMock(return_value={})
+    client.execute_single = AsyncMock(return_value=None)
+    return client
+
+
+def row(i: int) -> dict:
+    return {
+        "id": f"audit-{i}",
+        "event_type": "system.event",
+        "actor_id": "user-001",
+        "timestamp": "2024-01-01T00:00:00+00:00",
+        "created_at": "2024-01-01T00:00:00+00:00",
+    }
+
+
+def committed_ids(db) -> list[str]:
+    return [r["id"] for call in db.execute_write.call_args_list for r in call.args[1]["rows"]]
+
+
+# =============================================================================
+# Group Commit Tests
+# =============================================================================
+
+
+class TestAuditWriterGroupCommit:
+    """Tests for batching queued events into UNWIND commits."""
+
+    @pytest.mark.asyncio
+    async def test_commits_in_batches(self, mock_db_client):
+        """Queued events are committed at most batch_size at a time."""
+        writer = AuditWriter(mock_db_client, batch_size=2, flush_interval_ms=50)
+        await writer.start()
+
+        for i in range(5):
+            await writer.submit(row(i))
+        await writer.flush()
+
+        assert committed_ids(mock_db_client) == [f"audit-{i}" for i in range(5)]
+        assert all(len(c.args[1]["rows"]) <= 2 for c in mock_db_client.execute_write.call_args_list)
+        assert "UNWIND $rows" in mock_db_client.execute_write.call_args.args[0]
+        assert writer.get_stats()["events_committed"] == 5
+        await writer.stop()
+
+    @pytest.mark.asyncio
+    async def test_interval_flushes_partial_batch(self, mock_db_client):
+        """A partial batch is committed once the flush interval passes."""
+        writer = AuditWriter(mock_db_client, batch_size=100, flush_interval_ms=10)
+        await writer.start()
+
+        for i in range(3):
+            await writer.submit(row(i))
+        await asyncio.sleep(0.1)
+
+        assert mock_db_client.execute_write.await_count == 1
+        assert len(committed_ids(mock_db_client)) == 3
+        await writer.stop()
+
+    @pytest.mark.asyncio
+    async def test_back_pressure(self, mock_db_client):
+        """submit() waits while the queue is full."""
+        release = asyncio.Event()
+
+        async def slow_write(query, params):
+            await release.wait()
+            return {}
+
+        mock_db_client.execute_write.side_effect = slow_write
+        writer = AuditWriter(mock_db_client, batch_size=1, flush_interval_ms=1, max_queue_size=1)
+        await writer.start()
+
+        await writer.submit(row(0))
+        await asyncio.sleep(0.01)  # writer takes row 0 and blocks committing it
+        await writer.submit(row(1))
+        blocked = asyncio.create_task(writer.submit(row(2)))
+        await asyncio.sleep(0.01)
+        assert not blocked.done()
+
+        release.set()
+        await blocked
+        await writer.stop()
+        assert committed_ids(mock_db_client) == ["audit-0", "audit-1", "audit-2"]
+
+    @pytest.mark.asyncio
+    async def test_retries_transient_failures(self, mock_db_client):
+        """Failed commits are retried rather than dropped."""
+        mock_db_client.execute_write.side_effect = [ServiceUnavailable("down"), {}]
+        writer = AuditWriter(mock_db_client, flush_interval_ms=1)
+        writer.RETRY_BASE_SECONDS = 0
+        await writer.start()
+
+        await writer.submit(row(0))
+        await writer.flush()
+
+        stats = writer.get_stats()
+        assert stats["commit_failures"] == 1
+        assert stats["events_committed"] == 1
+        await writer.stop()
+
+    @pytest.mark.asyncio
+    async def test_client_error_isolates_bad_rows(self, mock_db_client):
+        """A rejected batch is retried row by row and only bad rows are dropped."""
+
+        async def reject_bad(query, params):
+            if any(r["id"] == "audit-1" for r in params["rows"]):
+                raise ClientError("bad row")
+            return {}
+
+        mock_db_client.execute_write.side_effect = reject_bad
+        writer = AuditWriter(mock_db_client, batch_size=10, flush_interval_ms=10)
+        await writer.start()
+
+        for i in range(3):
+            await writer.submit(row(i))
+        await writer.flush()
+
+        stats = writer.get_stats()
+        assert stats["events_committed"] == 2
+        assert stats["events_dropped"] == 1
+        await writer.stop()
+
+    @pytest.mark.asyncio
+    async def test_transient_error_while_isolating_is_retried(self, mock_db_client):
+        """A transient failure during row-by-row commits is retried, not dropped."""
+        mock_db_client.execute_write.side_effect = [
+            DatabaseError("rejected"),
+            TransientError("deadlock"),
+            {},
+            {},
+        ]
+        writer = AuditWriter(mock_db_client, batch_size=10, flush_interval_ms=10)
+        writer.RETRY_BASE_SECONDS = 0
+        await writer.start()
+
+        await writer.submit(row(0))
+        await writer.submit(row(1))
+        await writer.flush()
+
+        stats = writer.get_stats()
+        assert stats["events_committed"] == 2
+        assert stats["events_dropped"] == 0
+        await writer.stop()
+
+    @pytest.mark.asyncio
+    async def test_unexpected_error_keeps_writer_running(self, mock_db_client):
+        """An unexpected commit error drops its batch but later events still commit."""
+        mock_db_client.execute_write.side_effect = [TypeError("not serialisable"), {}]
+        writer = AuditWriter(mock_db_client, flush_interval_ms=1)
+        await writer.start()
+
+        await writer.submit(row(0))
+        await writer.flush()
+        await writer.submit(row(1))
+        await writer.flush()
+
+        stats = writer.get_stats()
+        assert writer.is_running
+        assert stats["events_dropped"] == 1
+        assert stats["events_committed"] == 1
+        await writer.stop()
+
+    @pytest.mark.asyncio
+    async def test_exhausted_retries_dead_letter_the_batch(self, mock_db_client, tmp_path):
+        """A batch that keeps failing is dead-lettered and the queue moves on."""
+        mock_db_client.execute_write.side_effect = [
+            ServiceUnavailable("down"),
+            ServiceUnavailable("down"),
+            RuntimeError("bug"),
+            {},
+        ]
+        writer = AuditWriter(mock_db_client, flush_interval_ms=1, journal_dir=tmp_path)
+        writer.RETRY_BASE_SECONDS = 0
+        writer.MAX_COMMIT_ATTEMPTS = 2
+        await writer.start()
+
+        for i in range(3):
+            await writer.submit(row(i))
+            await writer.flush()
+
+        lines = (tmp_path / DEAD_LETTER_FILE).read_text().splitlines()
+        assert [json.loads(line)["id"] for line in lines] == ["audit-0", "audit-1"]
+        stats = writer.get_stats()
+        assert stats["events_dropped"] == 2
+        assert stats["events_committed"] == 1
+        await writer.stop()
+        assert not list(tmp_path.glob("*.journal"))
+
+    @pytest.mark.asyncio
+    async def test_submit_requires_running_writer(self, mock_db_client):
+        """Submitting before start() raises."""
+        writer = AuditWriter(mock_db_client)
+
+        with pytest.raises(RuntimeError, match="not running"):
+            await writer.submit(row(0))
+
+
+# =============================================================================
+# Journal Tests
+# =============================================================================
+
+
+class TestAuditWriterJournal:
+    """Tests for crash-recovery journaling."""
+
+    @pytest.mark.asyncio
+    async def test_uncommitted_events_are_replayed(self, mock_db_client, tmp_path):
+        """Events left in the journal are committed by the next writer."""
+        failing_db = AsyncMock(spec=Neo4jClient)
+        failing_db.execute_write = AsyncMock(side_effect=ServiceUnavailable("down"))
+        crashed = AuditWriter(failing_db, flush_interval_ms=1, journal_dir=tmp_path)
+        crashed.RETRY_BASE_SECONDS = 10
+        await crashed.start()
+        for i in range(3):
+            await crashed.submit(row(i))
+        await crashed.stop(timeout=0.05)
+        assert list(tmp_path.glob("*.journal"))
+
+        writer = AuditWriter(mock_db_client, flush_interval_ms=1, journal_dir=tmp_path)
+        await writer.start()
+        await writer.flush()
+
+        assert committed_ids(mock_db_client) == ["audit-0", "audit-1", "audit-2"]
+        assert writer.get_stats()["events_replayed"] == 3
+        await writer.stop()
+        assert not list(tmp_path.glob("*.journal"))
+
+    @pytest.mark.asyncio
+    async def test_concurrent_submits_share_one_fsync(self, mock_db_client, tmp_path, monkeypatch):
+        """Events submitted together are journaled with a single fsync."""
+        fsyncs = []
+        real_fsync = os.fsync
+        monkeypatch.setattr(os, "fsync", lambda fd: (fsyncs.append(fd), real_fsync(fd)))
+        writer = AuditWriter(mock_db_client, flush_interval_ms=1, journal_dir=tmp_path)
+        await writer.start()
+
+        await asyncio.gather(*(writer.submit(row(i)) for i in range(10)))
+
+        assert len(fsyncs) == 1
+        (journal,) = tmp_path.glob("*.journal")
+        assert len(journal.read_text().splitlines()) == 10
+        await writer.flush()
+        await writer.stop()
+
+    @pytest.mark.asyncio
+    async def test_torn_line_is_skipped(self, mock_db_client, tmp_path):
+        """A partially written final line does not block replay."""
+        (tmp_path / "audit-000000000000.journal").write_bytes(b'{"id": "audit-0"}\n{"id": "au')
+
+        writer = AuditWriter(mock_db_client, flush_interval_ms=1, journal_dir=tmp_path)
+        await writer.start()
+        await writer.flush()
+
+        assert committed_ids(mock_db_client) == ["audit-0"]
+        await writer.stop()
+
+    @pytest.mark.asyncio
+    async def test_rotated_generations_are_deleted(self, mock_db_client, tmp_path):
+        """Fully committed journal generations are removed."""
+        writer = AuditWriter(
+            mock_db_client, flush_interval_ms=1, journal_dir=tmp_path, journal_max_bytes=200
+        )
+        await writer.start()
+
+        for i in range(20):
+            await writer.submit(row(i))
+        await writer.flush()
+
+        assert len(committed_ids(mock_db_client)) == 20
+        assert len(list(tmp_path.glob("*.journal"))) <= 1
+        await writer.stop()
+        assert not list(tmp_path.glob("*.journal"))
+
+
+# =============================================================================
+# Repository Integration Tests
+# =============================================================================
+
+
+class TestAuditRepositoryWriteBehind:
+    """Tests for AuditRepository.log() with a running writer."""
+
+    @pytest.mark.asyncio
+    async def test_log_queues_event(self, mock_db_client):
+        """log() returns immediately and the event is committed by the writer."""
+        writer = AuditWriter(mock_db_client, flush_interval_ms=1)
+        await writer.start()
+        repo = AuditRepository(mock_db_client, writer=writer)
+
+        event = await repo.log(
+            event_type=EventType.SYSTEM_EVENT,
+            actor_id="user-001",
+            action="Test",
+            resource_type="system",
+            details={"key": "value"},
+        )
+        mock_db_client.execute_single.assert_not_awaited()
+
+        await writer.flush()
+        committed = mock_db_client.execute_write.call_args.args[1]["rows"][0]
+        assert committed["id"] == event.id
+        assert event.details == {"key": "value"}
+        await writer.stop()
+
+    @pytest.mark.asyncio
+    async def test_stopped_writer_falls_back_to_inline_write(self, mock_db_client):
+        """Without a running writer, log() writes inline."""
+        repo = AuditRepository(mock_db_client, writer=AuditWriter(mock_db_client))
+
+        with pytest.raises(RuntimeError, match="Failed to create audit event"):
+            await repo.log(
+                event_type=EventType.SYSTEM_EVENT,
+                actor_id="user-001",
+                action="Test",
+                resource_type="system",
+            )
+        mock_db_client.execute_single.assert_awaited_once()
@@ -23,7 +23,11 @@ from forge.models.semantic_edges import (
     SemanticEdgeCreate,
     SemanticRelationType,
 )
-from forge.repositories.capsule_repository import CapsuleRepository
+from forge.repositories.capsule_repository import (
+    CapsuleRepository,
+    decode_cursor,
+    encode_cursor,
+)
 from forge.security.capsule_integrity import CapsuleIntegrityService
 
 # =============================================================================
@@ -302,6 +306,116 @@ class TestCapsuleRepositoryRetrieval:
         assert total == 1
 
 
+# =============================================================================
+# Pagination Tests
+# =============================================================================
+
+
+class TestCapsuleRepositoryPagination:
+    """Tests for keyset pagination and cached totals."""
+
+    def _rows(self, sample_capsule_data, count):
+        rows = []
+        for i in range(count):
+            data = dict(sample_capsule_data)
+            data["id"] = f"cap{i:03d}"
+            data["created_at"] = f"2024-01-01T00:00:{59 - i:02d}+00:00"
+            rows.append({"capsule": data})
+        return rows
+
+    def test_cursor_round_trip(self):
+        """Cursors decode back to their position."""
+        cursor = encode_cursor("2024-01-01T00:00:00+00:00", "cap1")
+
+        assert "=" not in cursor
+        assert decode_cursor(cursor) == ("2024-01-01T00:00:00+00:00", "cap1")
+
+    @pytest.mark.parametrize("cursor", ["not-base64!", "W10", "x" * 600, "eyJhIjoxfQ"])
+    def test_invalid_cursor(self, cursor):
+        """Malformed cursors raise ValueError."""
+        with pytest.raises(ValueError, match="Invalid pagination cursor"):
+            decode_cursor(cursor)
+
+    @pytest.mark.asyncio
+    async def test_first_page_returns_next_cursor(
+        self, capsule_repository, mock_db_client, sample_capsule_data
+    ):
+        """A full page returns a cursor at its last row."""
+        mock_db_client.execute.return_value = self._rows(sample_capsule_data, 3)
+
+        capsules, next_cursor = await capsule_repository.list_capsules_after(limit=2)
+
+        assert [c.id for c in capsules] == ["cap000", "cap001"]
+        assert decode_cursor(next_cursor) == ("2024-01-01T00:00:58+00:00", "cap001")
+        query, params = mock_db_client.execute.call_args[0][:2]
+        assert "ORDER BY c.created_at DESC, c.id DESC" in query
+        assert "SKIP" not in query
+        assert params["limit"] == 3
+
+    @pytest.mark.asyncio
+    async def test_cursor_seeks_past_position(
+        self, capsule_repository, mock_db_client, sample_capsule_data
+    ):
+        """The cursor becomes a keyset predicate; the last page has no cursor."""
+        mock_db_client.execute.return_value = self._rows(sample_capsule_data, 1)
+        cursor = encode_cursor("2024-01-01T00:00:58+00:00", "cap001")
+
+        capsules, next_cursor = await capsule_repository.list_capsules_after(
+            cursor=cursor, limit=2, filters={"tag": "test"}
+        )
+
+        assert len(capsules) == 1
+        assert next_cursor is None
+        query, params = mock_db_client.execute.call_args[0][:2]
+        assert "c.created_at < $cursor_created_at" in query
+        assert params["cursor_id"] == "cap001"
+        assert params["tag"] == "test"
+
+    @pytest.mark.asyncio
+    async def test_count_is_cached(self, capsule_repository, mock_db_client):
+        """Repeated counts hit the database once unless exact is requested."""
+        mock_db_client.execute_single.return_value = {"total": 7}
+
+        assert await capsule_repository.count_capsules({"owner_id": "user123"}) == 7
+        assert await capsule_repository.count_capsules({"owner_id": "user123"}) == 7
+        assert mock_db_client.execute_single.await_count == 1
+
+        await capsule_repository.count_capsules({"owner_id": "user123"}, exact=True)
+        assert mock_db_client.execute_single.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_count_adjusted_on_create_and_archive(
+        self, capsule_repository, mock_db_client, sample_capsule_data
+    ):
+        """Matching cached totals follow creates and archives."""
+        mock_db_client.execute_single.return_value = {"total": 5}
+        await capsule_repository.count_capsules({"owner_id": "user123"})
+        await capsule_repository.count_capsules({"owner_id": "someone-else"})
+        await capsule_repository.count_capsules({"tag": "test"})
+
+        mock_db_client.execute_single.return_value = {"capsule": sample_capsule_data}
+        await capsule_repository.create(
+            CapsuleCreate(content="New content", type=CapsuleType.INSIGHT, tags=["test"]),
+            owner_id="user123",
+        )
+        mock_db_client.execute_single.return_value = None
+        assert await capsule_repository.count_capsules({"owner_id": "user123"}) == 6
+        assert await capsule_repository.count_capsules({"owner_id": "someone-else"}) == 5
+        assert await capsule_repository.count_capsules({"tag": "test"}) == 6
+
+        for was_archived in (False, True):
+            mock_db_client.execute_single.return_value = {
+                "entity": sample_capsule_data,
+                "was_archived": was_archived,
+            }
+            await capsule_repository.archive("cap123")
+
+        # Re-archiving an archived capsule leaves totals alone
+        mock_db_client.execute_single.return_value = None
+        assert await capsule_repository.count_capsules({"owner_id": "user123"}) == 5
+        assert await capsule_repository.count_capsules({"tag": "test"}) == 5
+
+
 # =============================================================================
 # Lineage Tests
 # =============================================================================
@@ -778,6 +892,60 @@ class TestCapsuleRepositoryFederation:
 
         assert len(edges) == 1
 
+    @pytest.mark.asyncio
+    async def test_get_change_page(self, capsule_repository, mock_db_client, sample_capsule_data):
+        """Live and archived rows share one page; a full page returns a cursor."""
+        archived = {**sample_capsule_data, "id": "gone", "is_archived": True}
+        live = {**sample_capsule_data, "updated_at": "2024-01-01T00:00:01+00:00"}
+        mock_db_client.execute.return_value = [
+            {"capsule": archived},
+            {"capsule": live},
+            {"capsule": {**live, "id": "extra"}},
+        ]
+
+        since = datetime.now(UTC) - timedelta(hours=1)
+        capsules, deleted_ids, next_cursor = await capsule_repository.get_change_page(
+            since=since, limit=2
+        )
+
+        assert [c.id for c in capsules] == [sample_capsule_data["id"]]
+        assert deleted_ids == ["gone"]
+        assert decode_cursor(next_cursor) == (
+            "2024-01-01T00:00:01+00:00",
+            sample_capsule_data["id"],
+        )
+        query, params = mock_db_client.execute.call_args[0][:2]
+        assert "ORDER BY c.updated_at ASC, c.id ASC" in query
+        assert params["limit"] == 3
+
+    @pytest.mark.asyncio
+    async def test_get_change_page_seeks_past_cursor(self, capsule_repository, mock_db_client):
+        """The cursor becomes a keyset predicate; the last page has no cursor."""
+        mock_db_client.execute.return_value = []
+        cursor = encode_cursor("2024-01-01T00:00:01+00:00", "cap1")
+
+        capsules, deleted_ids, next_cursor = await capsule_repository.get_change_page(
+            since=None, cursor=cursor
+        )
+
+        assert capsules == [] and deleted_ids == [] and next_cursor is None
+        query, params = mock_db_client.execute.call_args[0][:2]
+        assert "c.updated_at > $cursor_updated_at" in query
+        assert params["cursor_id"] == "cap1"
+
+    @pytest.mark.asyncio
+    async def test_get_edge_page(self, capsule_repository, mock_db_client):
+        """Edge pages are keyed on (timestamp, id)."""
+        mock_db_client.execute.return_value = [
+            {"edge": {"id": "a->b", "timestamp": "2024-01-01T00:00:00+00:00"}},
+            {"edge": {"id": "c->d", "timestamp": None}},
+        ]
+
+        edges, next_cursor = await capsule_repository.get_edge_page(since=None, limit=1)
+
+        assert [e["id"] for e in edges] == ["a->b"]
+        assert decode_cursor(next_cursor) == ("2024-01-01T00:00:00+00:00", "a->b")
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
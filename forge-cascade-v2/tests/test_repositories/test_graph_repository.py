@@ -22,6 +22,7 @@ from forge.models.graph_analysis import (
     CentralityRequest,
     CommunityDetectionRequest,
     CommunityDetectionResult,
+    GraphAlgorithmConfig,
     GraphBackend,
     GraphMetrics,
     NodeRanking,
@@ -57,15 +58,21 @@ def mock_db_client():
 
 
 @pytest.fixture
-def graph_provider(mock_db_client):
+def cypher_config():
+    """Config that falls back to Cypher when GDS is unavailable."""
+    return GraphAlgorithmConfig(in_memory_fallback=False)
+
+
+@pytest.fixture
+def graph_provider(mock_db_client, cypher_config):
     """Create graph algorithm provider with mock client."""
-    return GraphAlgorithmProvider(mock_db_client)
+    return GraphAlgorithmProvider(mock_db_client, config=cypher_config)
 
 
 @pytest.fixture
-def graph_repository(mock_db_client):
+def graph_repository(mock_db_client, cypher_config):
     """Create graph repository with mock client."""
-    return GraphRepository(mock_db_client)
+    return GraphRepository(mock_db_client, config=cypher_config)
 
 
 @pytest.fixture
@@ -919,6 +926,96 @@ class TestGDSAlgorithms:
         assert result.path_found is True
 
 
+# =============================================================================
+# In-Memory Backend Tests
+# =============================================================================
+
+
+class TestInMemoryBackend:
+    """Tests for the in-memory snapshot backend used without GDS."""
+
+    @pytest.fixture
+    def memory_provider(self, mock_db_client):
+        mock_db_client.execute_single.side_effect = [
+            RuntimeError("GDS not installed"),  # Backend check
+            {"count": 4},  # Snapshot size check
+        ]
+        mock_db_client.execute.side_effect = [
+            [
+                {"id": "root", "title": "Root", "trust_level": 90, "type": "KNOWLEDGE"},
+                {"id": "a", "title": "A", "trust_level": 70, "type": "KNOWLEDGE"},
+                {"id": "b", "title": "B", "trust_level": 70, "type": "CODE"},
+                {"id": "c", "title": "C", "trust_level": 50, "type": "CODE"},
+            ],
+            [
+                {"source": "a", "target": "root", "rel_type": "DERIVED_FROM"},
+                {"source": "b", "target": "root", "rel_type": "DERIVED_FROM"},
+                {"source": "c", "target": "a", "rel_type": "DERIVED_FROM"},
+            ],
+        ]
+        return GraphAlgorithmProvider(mock_db_client)
+
+    @pytest.mark.asyncio
+    async def test_detect_backend_without_gds(self, memory_provider):
+        assert await memory_provider.detect_backend() == GraphBackend.NETWORKX
+
+    @pytest.mark.asyncio
+    async def test_pagerank(self, memory_provider):
+        result = await memory_provider.compute_pagerank(PageRankRequest(limit=2))
+
+        assert result.backend_used == GraphBackend.NETWORKX
+        assert result.total_nodes == 4
+        assert [r.node_id for r in result.rankings] == ["root", "a"]
+        assert result.rankings[0].title == "Root"
+
+    @pytest.mark.asyncio
+    async def test_snapshot_shared_between_algorithms(self, memory_provider, mock_db_client):
+        await memory_provider.compute_pagerank(PageRankRequest())
+        result = await memory_provider.compute_shortest_path(
+            ShortestPathRequest(source_id="c", target_id="b", relationship_types=["DERIVED_FROM"])
+        )
+
+        assert mock_db_client.execute.await_count == 2
+        assert result.backend_used == GraphBackend.NETWORKX
+        assert [n.node_id for n in result.path_nodes] == ["c", "a", "root", "b"]
+        assert result.path_relationships == ["DERIVED_FROM"] * 3
+
+    @pytest.mark.asyncio
+    async def test_communities(self, memory_provider):
+        result = await memory_provider.detect_communities(
+            CommunityDetectionRequest(min_community_size=1)
+        )
+
+        assert result.backend_used == GraphBackend.NETWORKX
+        assert sum(c.size for c in result.communities) == 4
+        assert result.coverage == 1.0
+
+    @pytest.mark.asyncio
+    async def test_node_similarity(self, memory_provider):
+        result = await memory_provider.compute_node_similarity(
+            NodeSimilarityRequest(source_node_id="b", similarity_cutoff=0.5)
+        )
+
+        assert result.backend_used == GraphBackend.NETWORKX
+        assert [n.node_id for n in result.similar_nodes] == ["a"]
+
+    @pytest.mark.asyncio
+    async def test_large_graph_falls_back_to_cypher(self, mock_db_client, sample_ranking_data):
+        mock_db_client.execute_single.side_effect = [
+            RuntimeError("GDS not installed"),
+            {"count": 50_000},  # Snapshot size check
+            {"count": 50_000},  # Cypher node count
+        ]
+        mock_db_client.execute.side_effect = None
+        mock_db_client.execute.return_value = sample_ranking_data
+        provider = GraphAlgorithmProvider(mock_db_client)
+
+        result = await provider.compute_pagerank(PageRankRequest())
+
+        assert result.backend_used == GraphBackend.CYPHER
+        assert len(result.rankings) == 2
+
+
 # =============================================================================
 # Error Handling Tests
 # =============================================================================
@@ -0,0 +1,237 @@
+"""
+Graph Snapshot Tests for Forge Cascade V2
+
+Tests for the in-memory CSR graph used by the in-memory algorithm backend:
+- Snapshot construction
+- PageRank and centrality
+- Community detection
+- Node similarity
+- Shortest paths
+"""
+
+import pytest
+
+from forge.repositories.graph_snapshot import GraphSnapshot
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+
+
+@pytest.fixture
+def two_cliques():
+    """Two 5-node cliques joined by a single bridge edge n4 -> n5."""
+    nodes = [{"id": f"n{i}", "title": f"Node {i}", "trust_level": 80} for i in range(10)]
+    edges = [
+        {"source": f"n{a}", "target": f"n{b}", "rel_type": "RELATED_TO"}
+        for group in (range(0, 5), range(5, 10))
+        for a in group
+        for b in group
+        if a < b
+    ]
+    edges.append({"source": "n4", "target": "n5", "rel_type": "DERIVED_FROM"})
+    return GraphSnapshot.from_records(nodes, edges)
+
+
+@pytest.fixture
+def star():
+    """Leaves l0..l3 all derived from a hub."""
+    nodes = [{"id": "hub", "trust_level": 90}] + [{"id": f"l{i}"} for i in range(4)]
+    edges = [{"source": f"l{i}", "target": "hub", "rel_type": "DERIVED_FROM"} for i in range(4)]
+    return GraphSnapshot.from_records(nodes, edges)
+
+
+# =============================================================================
+# Construction Tests
+# =============================================================================
+
+
+class TestSnapshotConstruction:
+    """Tests for building the CSR snapshot."""
+
+    def test_csr_layout(self, star):
+        assert star.node_count == 5
+        assert star.edge_count == 4
+        assert star.indptr.tolist() == [0, 0, 1, 2, 3, 4]
+        assert star.indices.tolist() == [0, 0, 0, 0]
+
+    def test_drops_unknown_endpoints_and_self_loops(self):
+        snapshot = GraphSnapshot.from_records(
+            [{"id": "a"}, {"id": "b"}, {"id": "a"}],
+            [
+                {"source": "a", "target": "b", "rel_type": "R"},
+                {"source": "a", "target": "missing", "rel_type": "R"},
+                {"source": "b", "target": "b", "rel_type": "R"},
+            ],
+        )
+
+        assert snapshot.node_count == 2
+        assert snapshot.edge_count == 1
+
+    def test_empty_graph(self):
+        snapshot = GraphSnapshot.from_records([], [])
+
+        assert snapshot.pagerank().size == 0
+        assert snapshot.louvain() == []
+
+
+# =============================================================================
+# Ranking Tests
+# =============================================================================
+
+
+class TestRanking:
+    """Tests for PageRank and centrality."""
+
+    def test_pagerank_ranks_hub_first(self, star):
+        scores = star.pagerank(max_iterations=100)
+
+        assert scores.sum() == pytest.approx(1.0)
+        assert scores.argmax() == star.index["hub"]
+        assert scores[star.index["l0"]] == pytest.approx(scores[star.index["l3"]])
+
+    def test_trust_weighting_favours_trusted_targets(self):
+        snapshot = GraphSnapshot.from_records(
+            [
+                {"id": "child", "trust_level": 60},
+                {"id": "trusted", "trust_level": 90},
+                {"id": "untrusted", "trust_level": 10},
+            ],
+            [
+                {"source": "child", "target": "trusted", "rel_type": "R"},
+                {"source": "child", "target": "untrusted", "rel_type": "R"},
+            ],
+        )
+        trusted, untrusted = snapshot.index["trusted"], snapshot.index["untrusted"]
+
+        unweighted = snapshot.pagerank(max_iterations=100)
+        weighted = snapshot.pagerank(max_iterations=100, trust_weighted=True)
+
+        assert unweighted[trusted] == pytest.approx(unweighted[untrusted])
+        assert weighted[trusted] > weighted[untrusted]
+        assert weighted.sum() == pytest.approx(1.0)
+
+    def test_betweenness_bridge(self, two_cliques):
+        scores = two_cliques.betweenness()
+
+        bridge = {two_cliques.index["n4"], two_cliques.index["n5"]}
+        assert set(scores.argsort()[-2:].tolist()) == bridge
+        assert all(scores[i] == 0 for i in range(10) if i not in bridge)
+
+    def test_betweenness_sampling_rescales(self, two_cliques):
+        exact = two_cliques.betweenness(normalized=False)
+        sampled = two_cliques.betweenness(normalized=False, max_sources=10)
+
+        assert sampled == pytest.approx(exact)
+
+    def test_closeness_matches_definition(self, two_cliques):
+        scores = two_cliques.closeness()
+
+        # n0 reaches n1..n4 at distance 1, n5 over the bridge at 2 and n6..n9 at 3
+        reached, total = 9, 4 * 1 + 2 + 4 * 3
+        assert scores[two_cliques.index["n0"]] == pytest.approx((reached / total) * (9 / 9))
+        assert scores[two_cliques.index["n9"]] == 0
+
+    def test_closeness_sampling_with_every_target_is_exact(self, two_cliques):
+        exact = two_cliques.closeness()
+        sampled = two_cliques.closeness(max_targets=10)
+        estimate = two_cliques.closeness(max_targets=6)
+
+        assert sampled == pytest.approx(exact)
+        assert estimate.argmax() == exact.argmax()
+
+    def test_closeness_and_eigenvector(self, star):
+        closeness = star.closeness()
+        eigenvector = star.eigenvector()
+
+        assert closeness[star.index["hub"]] == 0
+        assert closeness[star.index["l0"]] > 0
+        assert eigenvector.argmax() == star.index["hub"]
+
+
+# =============================================================================
+# Community Tests
+# =============================================================================
+
+
+class TestCommunities:
+    """Tests for community detection."""
+
+    @pytest.mark.parametrize("method", ["louvain", "label_propagation"])
+    def test_finds_cliques(self, two_cliques, method):
+        labels = getattr(two_cliques, method)()
+
+        assert len(set(labels[:5])) == 1
+        assert len(set(labels[5:])) == 1
+        assert labels[0] != labels[9]
+
+    def test_modularity(self, two_cliques):
+        together = two_cliques.modularity([0] * 10)
+        split = two_cliques.modularity(two_cliques.louvain())
+
+        assert together == pytest.approx(0.0)
+        assert split > 0.4
+
+    def test_internal_edge_count(self, two_cliques):
+        assert two_cliques.internal_edge_count(list(range(5))) == 10
+        assert two_cliques.internal_edge_count([4, 5]) == 1
+
+
+# =============================================================================
+# Similarity and Path Tests
+# =============================================================================
+
+
+class TestSimilarityAndPaths:
+    """Tests for node similarity and shortest paths."""
+
+    def test_similar_nodes_for_source(self, star):
+        pairs = star.similar_nodes(source=star.index["l0"], top_k=10)
+
+        assert {other for _, other, _, _ in pairs} == {star.index[f"l{i}"] for i in (1, 2, 3)}
+        assert all(similarity == 1.0 and shared == 1 for _, _, similarity, shared in pairs)
+
+    def test_similar_nodes_all_pairs(self, star):
+        pairs = star.similar_nodes(top_k=3, cutoff=0.5)
+
+        assert len(pairs) == 3
+        assert all(node < other for node, other, _, _ in pairs)
+
+    def test_shortest_path(self, two_cliques):
+        path, rel_types = two_cliques.shortest_path(
+            two_cliques.index["n0"], two_cliques.index["n9"]
+        )
+
+        assert [two_cliques.node_ids[i] for i in path] == ["n0", "n4", "n5", "n9"]
+        assert rel_types == ["RELATED_TO", "DERIVED_FROM", "RELATED_TO"]
+
+    def test_shortest_path_respects_types_and_depth(self, two_cliques):
+        source, target = two_cliques.index["n0"], two_cliques.index["n9"]
+
+        assert two_cliques.shortest_path(source, target, relationship_types=["RELATED_TO"]) is None
+        assert two_cliques.shortest_path(source, target, max_depth=2) is None
+
+    def test_weighted_path_prefers_trusted_nodes(self):
+        snapshot = GraphSnapshot.from_records(
+            [
+                {"id": "s", "trust_level": 80},
+                {"id": "low", "trust_level": 20},
+                {"id": "high1", "trust_level": 95},
+                {"id": "high2", "trust_level": 95},
+                {"id": "t", "trust_level": 80},
+            ],
+            [
+                {"source": "s", "target": "low", "rel_type": "R"},
+                {"source": "low", "target": "t", "rel_type": "R"},
+                {"source": "s", "target": "high1", "rel_type": "R"},
+                {"source": "high1", "target": "high2", "rel_type": "R"},
+                {"source": "high2", "target": "t", "rel_type": "R"},
+            ],
+        )
+        source, target = snapshot.index["s"], snapshot.index["t"]
+
+        hops, _ = snapshot.shortest_path(source, target)
+        trusted, _ = snapshot.shortest_path(source, target, weighted=True)
+
+        assert len(hops) == 3
+        assert [snapshot.node_ids[i] for i in trusted] == ["s", "high1", "high2", "t"]
@@ -10,6 +10,7 @@ Comprehensive tests for TemporalRepository including:
 - Trust timeline queries
 - Graph snapshots
 - Compaction operations
+- Positional diffs and cached reconstruction
 """
 
 import hashlib
@@ -19,6 +20,7 @@ from unittest.mock import AsyncMock
 
 import pytest
 
+from forge.config import get_settings
 from forge.models.temporal import (
     ChangeType,
     GraphSnapshot,
@@ -30,7 +32,7 @@ from forge.models.temporal import (
     VersionHistory,
     VersioningPolicy,
 )
-from forge.repositories.temporal_repository import TemporalRepository
+from forge.repositories.temporal_repository import TemporalRepository, VersionContentCache
 
 # =============================================================================
 # Fixtures
@@ -839,6 +841,34 @@ class TestTemporalRepositoryHelpers:
 
         assert result == content
 
+    def test_positional_diff_round_trips(self, temporal_repository):
+        """Positional diffs reproduce moved, duplicated and inserted lines exactly."""
+        old_content = "a\nb\nc\nb\nd\ne"
+        new_content = "b\na\nc\nx\nb\nd\nd\ne"
+
+        diff = temporal_repository._compute_diff(old_content, new_content)
+
+        assert diff.hunks
+        assert temporal_repository._apply_diff(old_content, diff) == new_content
+
+    def test_diff_preview_is_truncated_but_hunks_are_not(self, temporal_repository):
+        """Only the added/removed preview is truncated."""
+        old_content = "keep"
+        new_content = "\n".join(["keep", *(f"line {i}" for i in range(250))])
+
+        diff = temporal_repository._compute_diff(old_content, new_content)
+
+        assert len(diff.added_lines) == 100
+        assert diff.summary == "+250 -0 lines"
+        assert temporal_repository._apply_diff(old_content, diff) == new_content
+
+    def test_apply_diff_rejects_hunks_for_other_content(self, temporal_repository):
+        """Hunks that do not fit the base content raise instead of corrupting it."""
+        diff = temporal_repository._compute_diff("a\nb\nc\nd", "a\nb\nc\nX")
+
+        with pytest.raises(ValueError, match="does not fit"):
+            temporal_repository._apply_diff("a", diff)
+
     def test_increment_version_patch(self, temporal_repository):
         """Increment patch version."""
         result = temporal_repository._increment_version("1.2.3")
@@ -1024,6 +1054,148 @@ class TestVersioningPolicy:
 
         assert result is False
 
+    def test_large_content_shortens_chain(self):
+        """Large capsules get shorter diff chains to bound replay cost."""
+        policy = VersioningPolicy(max_diff_chain_length=10, replay_budget_bytes=1_000_000)
+
+        assert policy.max_chain_length(content_size=100) == 10
+        assert policy.max_chain_length(content_size=250_000) == 4
+        assert policy.max_chain_length(content_size=5_000_000) == 1
+        assert policy.should_full_snapshot(
+            change_number=6,
+            trust_level=60,
+            is_major_version=False,
+            diff_chain_length=4,
+            content_size=250_000,
+        )
+
+    def test_hot_capsule_shortens_chain(self):
+        """Frequently read capsules get shorter diff chains."""
+        policy = VersioningPolicy(hot_max_diff_chain_length=3)
+
+        kwargs = {"change_number": 6, "trust_level": 60, "is_major_version": False}
+        assert not policy.should_full_snapshot(diff_chain_length=3, hot=False, **kwargs)
+        assert policy.should_full_snapshot(diff_chain_length=3, hot=True, **kwargs)
+
+    def test_snapshot_when_chain_outweighs_content(self):
+        """Snapshot once the diffs since the last snapshot are larger than the content."""
+        policy = VersioningPolicy()
+
+        result = policy.should_full_snapshot(
+            change_number=3,
+            trust_level=60,
+            is_major_version=False,
+            diff_chain_length=2,
+            content_size=500,
+            diff_chain_bytes=600,
+        )
+
+        assert result is True
+
+
+# =============================================================================
+# Reconstruction Tests
+# =============================================================================
+
+
+def chain_node(version_id: str, content: str, base: str | None = None) -> dict:
+    """Chain record: a full snapshot, or a positional diff from base."""
+    node = {
+        "id": version_id,
+        "content_hash": hashlib.sha256(content.encode()).hexdigest(),
+        "content_snapshot": content if base is None else None,
+        "diff_from_previous": None,
+    }
+    if base is not None:
+        repo = TemporalRepository(AsyncMock())
+        node["diff_from_previous"] = repo._compute_diff(base, content).model_dump_json()
+    return node
+
+
+class TestTemporalRepositoryReconstruction:
+    """Tests for diff replay and the reconstructed version cache."""
+
+    @pytest.mark.asyncio
+    async def test_replays_chain_and_caches_result(self, temporal_repository, mock_db_client):
+        """Diffs are replayed exactly and the result is served from cache afterwards."""
+        v1, v2, v3 = "intro\nbody\noutro", "intro\nnew\nbody\noutro", "new\nintro\nbody"
+        mock_db_client.execute_single.return_value = {
+            "chain": [chain_node("v3", v3, v2), chain_node("v2", v2, v1), chain_node("v1", v1)]
+        }
+
+        assert await temporal_repository._get_content_by_id("v3") == v3
+        assert await temporal_repository._get_content_by_id("v3") == v3
+        assert mock_db_client.execute_single.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_replay_starts_from_nearest_cached_version(
+        self, temporal_repository, mock_db_client
+    ):
+        """A cached intermediate version replaces the snapshot as replay base."""
+        v1, v2, v3 = "a\nb", "a\nb\nc", "a\nc"
+        snapshot = chain_node("v1", v1)
+        snapshot["content_snapshot"] = "corrupt"
+        mock_db_client.execute_single.return_value = {
+            "chain": [chain_node("v3", v3, v2), chain_node("v2", v2, v1), snapshot]
+        }
+        VersionContentCache.put(mock_db_client, "v2", v2)
+
+        assert await temporal_repository._get_content_by_id("v3") == v3
+
+    @pytest.mark.asyncio
+    async def test_hash_mismatch_is_not_cached(self, temporal_repository, mock_db_client):
+        """Content that fails its hash check is returned but not cached."""
+        node = chain_node("v1", "content")
+        node["content_hash"] = "0" * 64
+        mock_db_client.execute_single.return_value = {"chain": [node]}
+
+        assert await temporal_repository._get_content_by_id("v1") == "content"
+        assert VersionContentCache.get(mock_db_client, "v1") is None
+
+    @pytest.mark.asyncio
+    async def test_create_version_diffs_against_reconstructed_latest(
+        self, temporal_repository, mock_db_client, sample_version_data
+    ):
+        """A diff latest version is reconstructed so the chain can continue."""
+        VersionContentCache.put(mock_db_client, "prev123", "line 1\nline 2")
+        mock_db_client.execute_single.side_effect = [
+            {
+                "version_id": "prev123",
+                "version_number": "1.0.1",
+                "content": None,
+                "diff_chain_length": 1,
+                "diff_chain_bytes": 10,
+                "version_count": 2,
+            },
+            {"version": {**sample_version_data, "snapshot_type": "diff"}},
+        ]
+
+        await temporal_repository.create_version(
+            capsule_id="capsule123",
+            content="line 1\nline 2\nline 3",
+            change_type=ChangeType.UPDATE,
+            created_by="user123",
+        )
+
+        params = mock_db_client.execute_single.call_args[0][1]
+        assert params["snapshot_type"] == "diff"
+        assert params["diff_chain_length"] == 2
+        assert params["diff_chain_bytes"] == 10 + len(params["diff_json"])
+        assert VersionContentCache.get(mock_db_client, params["id"]) == "line 1\nline 2\nline 3"
+
+    def test_cache_evicts_least_recently_used(self, mock_db_client, monkeypatch):
+        """The cache stays within its byte budget, evicting the oldest entry."""
+        monkeypatch.setattr(get_settings(), "version_cache_max_bytes", 10)
+
+        VersionContentCache.put(mock_db_client, "v1", "aaaa")
+        VersionContentCache.put(mock_db_client, "v2", "bbbb")
+        VersionContentCache.get(mock_db_client, "v1")
+        VersionContentCache.put(mock_db_client, "v3", "cccc")
+
+        assert VersionContentCache.get(mock_db_client, "v1") == "aaaa"
+        assert VersionContentCache.get(mock_db_client, "v2") is None
+        assert VersionContentCache.get(mock_db_client, "v3") == "cccc"
+
 
 # =============================================================================
 # Trust Snapshot Compressor Tests
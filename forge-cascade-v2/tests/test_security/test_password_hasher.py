@@ -0,0 +1,139 @@
+"""
+Password Hashing Pool Tests for Forge Cascade V2
+
+Tests for the off-event-loop password hashing pool:
+- Hashing and verification through the pool
+- Event loop stays responsive during bcrypt
+- Load shedding when saturated
+- Background rehash-on-login
+"""
+
+import asyncio
+import threading
+from unittest.mock import AsyncMock
+
+import pytest
+
+from forge.monitoring.metrics import password_hash_shed_total
+from forge.security.password import PasswordValidationError, verify_password
+from forge.security.password_hasher import PasswordHasher, PasswordHasherBusyError
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+
+
+@pytest.fixture
+async def hasher():
+    """Create a small hashing pool."""
+    pool = PasswordHasher(max_workers=2, max_pending=4)
+    yield pool
+    await pool.shutdown()
+
+
+# =============================================================================
+# Pool Tests
+# =============================================================================
+
+
+class TestPasswordHasher:
+    """Tests for hashing and verification through the pool."""
+
+    @pytest.mark.asyncio
+    async def test_hash_and_verify(self, hasher):
+        """Hashes produced by the pool verify through the pool."""
+        hashed = await hasher.hash("SecureP@ss123!", validate=False)
+
+        assert await hasher.verify("SecureP@ss123!", hashed)
+        assert not await hasher.verify("WrongP@ss123!", hashed)
+        assert hasher.pending == 0
+
+    @pytest.mark.asyncio
+    async def test_validation_errors_propagate(self, hasher):
+        """Password validation still rejects weak passwords."""
+        with pytest.raises(PasswordValidationError):
+            await hasher.hash("short")
+
+    @pytest.mark.asyncio
+    async def test_event_loop_not_blocked(self, hasher):
+        """Other coroutines keep running while bcrypt works."""
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.005)
+
+        task = asyncio.create_task(ticker())
+        await hasher.hash("SecureP@ss123!", validate=False)
+        task.cancel()
+
+        assert ticks > 5
+
+    @pytest.mark.asyncio
+    async def test_sheds_when_saturated(self):
+        """Operations beyond max_pending fail fast."""
+        pool = PasswordHasher(max_workers=1, max_pending=1)
+        release = threading.Event()
+        before = sum(item["value"] for item in password_hash_shed_total.collect())
+
+        blocked = asyncio.create_task(pool._run("hash", release.wait))
+        await asyncio.sleep(0.01)
+
+        with pytest.raises(PasswordHasherBusyError):
+            await pool.verify("SecureP@ss123!", "$2b$12$hash")
+
+        release.set()
+        await blocked
+        await pool.shutdown()
+        after = sum(item["value"] for item in password_hash_shed_total.collect())
+        assert after == before + 1
+
+
+# =============================================================================
+# Rehash Tests
+# =============================================================================
+
+
+class TestPasswordRehash:
+    """Tests for background rehash-on-login."""
+
+    @pytest.mark.asyncio
+    async def test_rehash_saves_new_hash(self, hasher):
+        """A scheduled rehash stores a hash of the same password."""
+        save = AsyncMock()
+
+        hasher.schedule_rehash("user-1", "SecureP@ss123!", save)
+        await hasher.shutdown()
+
+        user_id, new_hash = save.await_args.args
+        assert user_id == "user-1"
+        assert verify_password("SecureP@ss123!", new_hash)
+
+    @pytest.mark.asyncio
+    async def test_rehash_failure_is_swallowed(self, hasher):
+        """A failed save is logged, not raised."""
+        save = AsyncMock(side_effect=RuntimeError("db down"))
+
+        hasher.schedule_rehash("user-1", "SecureP@ss123!", save)
+        await hasher.shutdown()
+
+        save.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_rehash_deferred_when_saturated(self):
+        """A saturated pool skips the rehash; the next login retries."""
+        pool = PasswordHasher(max_workers=1, max_pending=1)
+        release = threading.Event()
+        save = AsyncMock()
+
+        blocked = asyncio.create_task(pool._run("hash", release.wait))
+        await asyncio.sleep(0.01)
+        pool.schedule_rehash("user-1", "SecureP@ss123!", save)
+        await asyncio.sleep(0.01)
+
+        release.set()
+        await blocked
+        await pool.shutdown()
+        save.assert_not_awaited()
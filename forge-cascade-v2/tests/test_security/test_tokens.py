@@ -5,21 +5,29 @@ Comprehensive tests for JWT token handling including:
 - Token creation (access and refresh)
 - Token validation and verification
 - Token blacklisting
+- Verified token cache and local revocation filter
 - Key rotation
 - Token hashing utilities
 """
 
+import asyncio
 import time
 from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock
 
+import jwt as pyjwt
 import pytest
 
+from forge.security import tokens
+from forge.security.bloom import BloomFilter
 from forge.security.tokens import (
     ALLOWED_JWT_ALGORITHMS,
     KeyRotationManager,
     TokenBlacklist,
     TokenInvalidError,
     TokenService,
+    TokenVersionCache,
+    VerifiedTokenCache,
     create_access_token,
     create_refresh_token,
     create_token_pair,
@@ -30,6 +38,7 @@ from forge.security.tokens import (
     hash_refresh_token,
     is_token_expired,
     verify_access_token,
+    verify_access_token_async,
     verify_refresh_token,
     verify_refresh_token_hash,
     verify_token,
@@ -342,6 +351,212 @@ class TestTokenBlacklist:
             verify_access_token(token)
 
 
+# =============================================================================
+# Verified Token Cache Tests
+# =============================================================================
+
+
+class TestVerifiedTokenCache:
+    """Tests for skipping signature checks on recently verified tokens."""
+
+    def setup_method(self):
+        VerifiedTokenCache.clear()
+        TokenBlacklist.clear()
+
+    def teardown_method(self):
+        VerifiedTokenCache.clear()
+        TokenBlacklist.clear()
+
+    def _token(self) -> str:
+        return create_access_token(
+            user_id="user123", username="testuser", role="user", trust_flame=60
+        )
+
+    def test_second_verification_skips_decode(self, monkeypatch):
+        """A cached token is not decoded again."""
+        token = self._token()
+        verify_access_token(token)
+
+        decode = MagicMock(side_effect=AssertionError("decoded twice"))
+        monkeypatch.setattr(tokens, "decode_token", decode)
+
+        assert verify_access_token(token).sub == "user123"
+        decode.assert_not_called()
+
+    def test_revocation_checked_on_cache_hit(self):
+        """Blacklisting a cached token still rejects it."""
+        token = self._token()
+        payload = verify_access_token(token)
+
+        TokenBlacklist.add(payload.jti, time.time() + 3600)
+
+        with pytest.raises(TokenInvalidError, match="revoked"):
+            verify_access_token(token)
+
+    def test_invalid_tokens_not_cached(self):
+        """Tokens failing claim checks are never cached."""
+        token = create_refresh_token("user123", "testuser")
+
+        with pytest.raises(TokenInvalidError):
+            verify_access_token(token)
+        assert VerifiedTokenCache.get(token) is None
+
+    def test_entry_never_outlives_token(self):
+        """Entries expire with the token even if the TTL is longer."""
+        token = self._token()
+        payload = decode_token(token)
+        payload.exp = datetime.now(UTC) - timedelta(seconds=1)
+
+        VerifiedTokenCache.put(token, payload)
+
+        assert VerifiedTokenCache.get(token) is None
+
+    def test_bounded_size(self, monkeypatch):
+        """The least recently used entries are evicted."""
+        monkeypatch.setattr(tokens.settings, "verified_token_cache_max_entries", 2)
+        issued = [self._token() for _ in range(3)]
+        for token in issued:
+            verify_access_token(token)
+
+        assert VerifiedTokenCache.get(issued[0]) is None
+        assert VerifiedTokenCache.get(issued[2]) is not None
+
+    @pytest.mark.asyncio
+    async def test_removed_key_invalidates_cache(self):
+        """Rotating out a signing key drops tokens it signed."""
+        token = self._token()
+        verify_access_token(token)
+
+        for i in range(3):
+            await KeyRotationManager.rotate_key(f"rotated-secret-{i}-" + "x" * 32)
+
+        with pytest.raises(TokenInvalidError):
+            verify_access_token(token)
+        KeyRotationManager._keys.clear()
+        KeyRotationManager._key_created_at.clear()
+
+
+# =============================================================================
+# Revocation Filter Tests
+# =============================================================================
+
+
+@pytest.fixture
+def fake_redis(monkeypatch):
+    """Install a mock Redis client with a synced, empty revocation filter."""
+    client = AsyncMock()
+    client.exists = AsyncMock(return_value=1)
+    client.get = AsyncMock(return_value=None)
+    monkeypatch.setattr(TokenBlacklist, "_redis_client", client)
+    monkeypatch.setattr(TokenBlacklist, "_filter", BloomFilter(1000))
+    monkeypatch.setattr(TokenBlacklist, "_filter_synced", True)
+    monkeypatch.setattr(TokenVersionCache, "_cache", {})
+    return client
+
+
+class TestRevocationFilter:
+    """Tests for the local Bloom filter in front of the Redis blacklist."""
+
+    def test_bloom_filter_has_no_false_negatives(self):
+        """Every added item is found and the false positive rate is near target."""
+        bloom = BloomFilter(10000, error_rate=0.01)
+        for i in range(10000):
+            bloom.add(f"jti-{i}")
+
+        assert all(f"jti-{i}" in bloom for i in range(10000))
+        false_positives = sum(f"other-{i}" in bloom for i in range(10000))
+        assert false_positives < 300
+
+    @pytest.mark.asyncio
+    async def test_filter_miss_skips_redis(self, fake_redis):
+        """Tokens absent from the filter are accepted without a Redis call."""
+        assert await TokenBlacklist.is_blacklisted_async("never-revoked") is False
+        fake_redis.exists.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_revocation_is_filtered_and_published(self, fake_redis):
+        """Revoking adds to the filter, publishes, and hits confirm against Redis."""
+        await TokenBlacklist.add_async("revoked-jti", time.time() + 3600)
+
+        fake_redis.publish.assert_awaited_once_with(
+            TokenBlacklist._events_channel, "jti:revoked-jti"
+        )
+        assert await TokenBlacklist.is_blacklisted_async("revoked-jti") is True
+        fake_redis.exists.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_unsynced_filter_is_ignored(self, fake_redis, monkeypatch):
+        """Without a live subscription every check goes to Redis."""
+        monkeypatch.setattr(TokenBlacklist, "_filter_synced", False)
+
+        assert await TokenBlacklist.is_blacklisted_async("revoked-elsewhere") is True
+        fake_redis.exists.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_rebuild_from_redis_keys(self, fake_redis, monkeypatch):
+        """A rebuild loads revoked JTIs from a key scan."""
+        monkeypatch.setattr(TokenBlacklist, "_filter_synced", False)
+        fake_redis.scan = AsyncMock(return_value=(0, [f"{TokenBlacklist._redis_prefix}old-jti"]))
+
+        await TokenBlacklist._rebuild_filter()
+
+        assert TokenBlacklist.is_filter_synced()
+        assert "old-jti" in TokenBlacklist._filter
+
+    @pytest.mark.asyncio
+    async def test_sync_loop_applies_events_and_recovers(self, fake_redis, monkeypatch):
+        """Channel events update local state; a dropped subscription desyncs."""
+        monkeypatch.setattr(TokenBlacklist, "_filter_synced", False)
+        fake_redis.scan = AsyncMock(return_value=(0, []))
+        TokenVersionCache._cache["user-1"] = (3, time.time() + 60)
+        events = [
+            {"data": "jti:remote-jti"},
+            {"data": "tv:user-1"},
+            ConnectionError("subscription lost"),
+        ]
+        pubsub = MagicMock()
+        pubsub.subscribe = AsyncMock()
+        pubsub.aclose = AsyncMock()
+        pubsub.get_message = AsyncMock(side_effect=events)
+        fake_redis.pubsub = MagicMock(return_value=pubsub)
+
+        task = asyncio.create_task(TokenBlacklist._sync_filter_loop())
+        await asyncio.sleep(0.01)
+        task.cancel()
+
+        assert "remote-jti" in TokenBlacklist._filter
+        assert TokenVersionCache._cache == {}
+        assert not TokenBlacklist.is_filter_synced()
+
+    @pytest.mark.asyncio
+    async def test_token_version_served_locally_while_synced(self, fake_redis):
+        """Cached versions are answered in process while invalidations are synced."""
+        fake_redis.get = AsyncMock(return_value="2")
+
+        assert await TokenVersionCache.get_version("user-1") == 2
+        assert await TokenVersionCache.get_version("user-1") == 2
+        fake_redis.get.assert_awaited_once()
+
+        await TokenVersionCache.invalidate("user-1")
+        fake_redis.publish.assert_awaited_with(TokenBlacklist._events_channel, "tv:user-1")
+        assert "user-1" not in TokenVersionCache._cache
+
+    @pytest.mark.asyncio
+    async def test_async_verification_without_redis_round_trip(self, fake_redis):
+        """A valid, cached, unrevoked token is verified entirely in process."""
+        VerifiedTokenCache.clear()
+        token = create_access_token(
+            user_id="user123", username="testuser", role="user", trust_flame=60
+        )
+
+        await verify_access_token_async(token)
+        payload = await verify_access_token_async(token)
+
+        assert payload.sub == "user123"
+        fake_redis.exists.assert_not_awaited()
+        VerifiedTokenCache.clear()
+
+
 # =============================================================================
 # Token Utility Tests
 # =============================================================================
@@ -529,6 +744,43 @@ class TestKeyRotation:
 
         assert payload["sub"] == "user123"
 
+    @pytest.mark.asyncio
+    async def test_decode_dispatches_on_kid(self):
+        """Tokens are checked only against the key their kid names."""
+        from forge.config import get_settings
+
+        settings = get_settings()
+        old_token = create_access_token(
+            user_id="user123", username="testuser", role="user", trust_flame=60
+        )
+        await KeyRotationManager.rotate_key("n" * 40)
+        kwargs = {
+            "algorithms": ALLOWED_JWT_ALGORITHMS,
+            "issuer": settings.jwt_issuer,
+            "audience": settings.jwt_audience,
+        }
+
+        # Previous key still verifies its own tokens
+        assert KeyRotationManager.decode_with_rotation(old_token, **kwargs)["sub"] == "user123"
+
+        # A kid naming the wrong valid key is not retried against the others
+        claims = pyjwt.decode(old_token, options={"verify_signature": False})
+        mislabelled = pyjwt.encode(
+            claims, settings.jwt_secret_key, algorithm="HS256", headers={"kid": "key_2"}
+        )
+        with pytest.raises(pyjwt.InvalidTokenError):
+            KeyRotationManager.decode_with_rotation(mislabelled, **kwargs)
+
+        unknown = pyjwt.encode(
+            claims, settings.jwt_secret_key, algorithm="HS256", headers={"kid": "key_99"}
+        )
+        with pytest.raises(pyjwt.InvalidTokenError, match="unknown signing key"):
+            KeyRotationManager.decode_with_rotation(unknown, **kwargs)
+
+        # Legacy tokens without a kid fall back to trying every key
+        legacy = pyjwt.encode(claims, settings.jwt_secret_key, algorithm="HS256")
+        assert KeyRotationManager.decode_with_rotation(legacy, **kwargs)["sub"] == "user123"
+
     def test_get_rotation_status(self):
         """Get rotation status returns info dict."""
         KeyRotationManager.initialize()
@@ -9,9 +9,12 @@ Tests cover:
 - Similarity calculations
 """
 
+import asyncio
+
 import pytest
 
 from forge.services.embedding import (
+    EmbeddingCache,
     EmbeddingConfig,
     EmbeddingProvider,
     EmbeddingResult,
@@ -177,6 +180,188 @@ class TestEmbeddingCache:
 
         assert (await service_with_cache.cache_stats())["size"] == 0
 
+    @pytest.mark.asyncio
+    async def test_cache_hits_do_not_share_state(self, service_with_cache):
+        await service_with_cache.embed("shared")
+
+        hit1 = await service_with_cache.embed("shared")
+        hit2 = await service_with_cache.embed("shared")
+        hit1.embedding[0] = 42.0
+
+        assert hit1 is not hit2
+        assert hit2.embedding[0] != 42.0
+
+    @pytest.mark.asyncio
+    async def test_lru_eviction(self):
+        cache = EmbeddingCache(max_size=2, shards=1)
+        for text in ("a", "b"):
+            await cache.set(text, "m", EmbeddingResult([0.1, 0.2], "m", 2))
+
+        await cache.get("a", "m")  # "b" becomes least recently used
+        await cache.set("c", "m", EmbeddingResult([0.3, 0.4], "m", 2))
+
+        assert await cache.get("a", "m") is not None
+        assert await cache.get("b", "m") is None
+        assert (await cache.stats())["evictions"] == 1
+
+    @pytest.mark.asyncio
+    async def test_byte_budget(self):
+        entry_bytes = 4 * 1536 + EmbeddingCache.ENTRY_OVERHEAD_BYTES
+        cache = EmbeddingCache(max_size=1000, max_bytes=entry_bytes * 3, shards=1)
+
+        for i in range(10):
+            await cache.set(f"text {i}", "m", EmbeddingResult([0.5] * 1536, "m", 1536))
+
+        stats = await cache.stats()
+        assert stats["size"] == 3
+        assert stats["bytes"] <= stats["max_bytes"]
+
+    @pytest.mark.asyncio
+    async def test_disk_tier_survives_restart(self, tmp_path):
+        path = str(tmp_path / "embeddings.db")
+        config = EmbeddingConfig(provider=EmbeddingProvider.MOCK, cache_persist_path=path)
+
+        first = EmbeddingService(config)
+        original = await first.embed("persist me")
+        await first.close()
+
+        second = EmbeddingService(config)
+        restored = await second.embed("persist me")
+        await second.close()
+
+        assert restored.cached is True
+        assert restored.embedding == original.embedding
+        assert (await second.cache_stats())["disk_hits"] == 1
+
+
+class TestRequestCoalescing:
+    """Tests for coalescing of concurrent embed() calls."""
+
+    @pytest.fixture
+    def service(self):
+        config = EmbeddingConfig(provider=EmbeddingProvider.MOCK, coalesce_window_ms=5.0)
+        return EmbeddingService(config)
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_one_batch(self, service):
+        calls = []
+        original = service._provider.embed_batch
+
+        async def counting_embed_batch(texts):
+            calls.append(list(texts))
+            return await original(texts)
+
+        service._provider.embed_batch = counting_embed_batch
+
+        texts = [f"text {i}" for i in range(5)]
+        results = await asyncio.gather(*(service.embed(t) for t in texts))
+
+        assert len(calls) == 1
+        assert sorted(calls[0]) == sorted(texts)
+        for text, result in zip(texts, results, strict=True):
+            expected = await service._provider.embed(text)
+            assert result.embedding == pytest.approx(expected.embedding, abs=1e-6)
+
+    @pytest.mark.asyncio
+    async def test_identical_texts_in_flight_are_deduplicated(self, service):
+        calls = []
+        original = service._provider.embed
+
+        async def counting_embed(text):
+            calls.append(text)
+            return await original(text)
+
+        service._provider.embed = counting_embed
+
+        results = await asyncio.gather(*(service.embed("same") for _ in range(4)))
+
+        assert calls == ["same"]
+        assert all(r.embedding == results[0].embedding for r in results)
+        assert (await service.cache_stats())["coalesced_requests"] == 3
+
+    @pytest.mark.asyncio
+    async def test_max_batch_flushes_early(self):
+        config = EmbeddingConfig(
+            provider=EmbeddingProvider.MOCK,
+            coalesce_window_ms=10_000.0,
+            coalesce_max_batch=3,
+        )
+        service = EmbeddingService(config)
+
+        results = await asyncio.wait_for(
+            asyncio.gather(*(service.embed(f"t{i}") for i in range(3))), timeout=1.0
+        )
+
+        assert len(results) == 3
+
+    @pytest.mark.asyncio
+    async def test_provider_error_reaches_all_callers(self, service):
+        calls = []
+
+        async def failing_embed(text):
+            calls.append([text])
+            raise ConnectionError("provider down")
+
+        async def failing_embed_batch(texts):
+            calls.append(texts)
+            raise ConnectionError("provider down")
+
+        service._provider.embed = failing_embed
+        service._provider.embed_batch = failing_embed_batch
+
+        results = await asyncio.gather(
+            service.embed("a"), service.embed("b"), return_exceptions=True
+        )
+
+        assert all(isinstance(r, ConnectionError) for r in results)
+        assert calls == [["a", "b"]]
+        assert service._inflight == {}
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_is_not_split(self, service):
+        httpx = pytest.importorskip("httpx")
+        request = httpx.Request("POST", "https://api.example.com/v1/embeddings")
+        calls = []
+
+        async def embed_batch(texts):
+            calls.append(texts)
+            raise httpx.HTTPStatusError(
+                "rate limited", request=request, response=httpx.Response(429, request=request)
+            )
+
+        service._provider.embed_batch = embed_batch
+
+        texts = ["a", "b", "c", "d"]
+        results = await asyncio.gather(*(service.embed(t) for t in texts), return_exceptions=True)
+
+        assert all(isinstance(r, httpx.HTTPStatusError) for r in results)
+        assert len(calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_bad_text_fails_only_its_caller(self, service):
+        original_embed = service._provider.embed
+        original_batch = service._provider.embed_batch
+
+        async def embed(text):
+            if text == "bad":
+                raise ValueError("input too long")
+            return await original_embed(text)
+
+        async def embed_batch(texts):
+            if "bad" in texts:
+                raise ValueError("input too long")
+            return await original_batch(texts)
+
+        service._provider.embed = embed
+        service._provider.embed_batch = embed_batch
+
+        texts = ["a", "b", "bad", "c", "d"]
+        results = await asyncio.gather(*(service.embed(t) for t in texts), return_exceptions=True)
+
+        assert isinstance(results[2], ValueError)
+        assert all(len(r.embedding) == service.dimensions for i, r in enumerate(results) if i != 2)
+        assert service._inflight == {}
+
 
 class TestSimilarityFunctions:
     """Tests for similarity utility functions."""
@@ -0,0 +1,187 @@
+"""
+Tests for the HPO term search index
+
+Tests cover:
+- Exact, prefix, substring and typo-tolerant search
+- Mention scanning over clinical text
+- Serialisation round trip
+- Ontology snapshot reuse and rule-based extraction
+"""
+
+import os
+
+import pytest
+
+from forge.services.hpo import HPOOntologyService, HPOSearchIndex, HPOTerm, PhenotypeExtractor
+
+HPO_OBO = """\
+[Term]
+id: HP:0001250
+name: Seizure
+synonym: "Epileptic seizure" EXACT []
+
+[Term]
+id: HP:0007359
+name: Focal-onset seizure
+synonym: "Focal seizure" EXACT []
+is_a: HP:0001250
+
+[Term]
+id: HP:0000252
+name: Microcephaly
+synonym: "Small head" EXACT []
+
+[Term]
+id: HP:0001263
+name: Global developmental delay
+
+[Term]
+id: HP:0009999
+name: Obsolete seizure finding
+is_obsolete: true
+"""
+
+
+@pytest.fixture
+def terms():
+    return [
+        HPOTerm(hpo_id="HP:0001250", name="Seizure", synonyms=["Epileptic seizure"]),
+        HPOTerm(hpo_id="HP:0007359", name="Focal-onset seizure", synonyms=["Focal seizure"]),
+        HPOTerm(hpo_id="HP:0000252", name="Microcephaly", synonyms=["Small head"]),
+        HPOTerm(hpo_id="HP:0001263", name="Global developmental delay"),
+        HPOTerm(hpo_id="HP:0009999", name="Obsolete seizure finding", is_obsolete=True),
+    ]
+
+
+@pytest.fixture
+def index(terms):
+    return HPOSearchIndex.build(terms)
+
+
+class TestHPOSearch:
+    """Tests for ranked term search."""
+
+    def test_exact_name_and_synonym_scores(self, index):
+        assert index.search("seizure")[0] == ("HP:0001250", 1.0)
+        assert index.search("Small  Head")[0] == ("HP:0000252", 0.95)
+
+    def test_prefix_of_last_word(self, index):
+        ids = [hpo_id for hpo_id, _ in index.search("focal seiz")]
+
+        assert ids == ["HP:0007359"]
+
+    def test_substring_inside_word(self, index):
+        ids = [hpo_id for hpo_id, _ in index.search("cephal")]
+
+        assert ids == ["HP:0000252"]
+
+    def test_typo_tolerance(self, index):
+        ids = [hpo_id for hpo_id, _ in index.search("microcefaly")]
+
+        assert ids == ["HP:0000252"]
+
+    def test_one_result_per_term_best_first(self, index):
+        results = index.search("seizure", limit=10)
+        ids = [hpo_id for hpo_id, _ in results]
+
+        assert len(ids) == len(set(ids))
+        assert [score for _, score in results] == sorted(
+            (score for _, score in results), reverse=True
+        )
+
+    def test_obsolete_excluded_by_default(self, index):
+        assert "HP:0009999" not in [hpo_id for hpo_id, _ in index.search("seizure finding")]
+        assert "HP:0009999" in [
+            hpo_id for hpo_id, _ in index.search("seizure finding", include_obsolete=True)
+        ]
+
+    def test_no_match(self, index):
+        assert index.search("zzzz") == []
+        assert index.search("   ") == []
+
+
+class TestHPOMentions:
+    """Tests for scanning text for term labels."""
+
+    def test_finds_nested_mentions_with_offsets(self, index):
+        text = "History of focal seizures and a small head."
+        mentions = index.find_mentions(text)
+
+        found = {(m.hpo_id, text[m.start : m.end], m.is_synonym) for m in mentions}
+        assert found == {
+            ("HP:0007359", "focal seizures", True),
+            ("HP:0001250", "seizures", False),
+            ("HP:0000252", "small head", True),
+        }
+
+    def test_partial_label_not_matched(self, index):
+        assert index.find_mentions("No developmental delay reported.") == []
+
+
+class TestHPOSearchIndexPersistence:
+    """Tests for serialisation."""
+
+    def test_round_trip(self, index):
+        restored = HPOSearchIndex.from_dict(index.to_dict())
+
+        assert restored.search("focal seiz") == index.search("focal seiz")
+        assert restored.find_mentions("small head") == index.find_mentions("small head")
+        assert restored.stats() == index.stats()
+
+    def test_inconsistent_rows_rejected(self, index):
+        data = index.to_dict()
+        data["labels"] = data["labels"][:-1]
+
+        with pytest.raises(ValueError):
+            HPOSearchIndex.from_dict(data)
+
+
+class TestHPOOntologySnapshot:
+    """Tests for reusing the parsed ontology across loads."""
+
+    @pytest.mark.asyncio
+    async def test_second_load_uses_snapshot(self, tmp_path, monkeypatch):
+        (tmp_path / "hp.obo").write_text(HPO_OBO)
+        first = HPOOntologyService(tmp_path)
+        assert await first.load()
+        assert (tmp_path / HPOOntologyService.SNAPSHOT_FILE).exists()
+
+        async def no_parse(self, path):
+            raise AssertionError("source should not be parsed again")
+
+        monkeypatch.setattr(HPOOntologyService, "_load_from_obo", no_parse)
+        second = HPOOntologyService(tmp_path)
+
+        assert await second.load()
+        assert second.term_count == first.term_count
+        assert second.get_ancestors("HP:0007359") == {"HP:0001250"}
+        assert second.search_terms("small head")[0].hpo_id == "HP:0000252"
+
+    @pytest.mark.asyncio
+    async def test_changed_source_is_reparsed(self, tmp_path):
+        source = tmp_path / "hp.obo"
+        source.write_text(HPO_OBO)
+        assert await HPOOntologyService(tmp_path).load()
+
+        source.write_text(HPO_OBO + "\n[Term]\nid: HP:0001249\nname: Intellectual disability\n")
+        os.utime(source, ns=(0, 0))
+        ontology = HPOOntologyService(tmp_path)
+
+        assert await ontology.load()
+        assert ontology.get_term("HP:0001249") is not None
+
+    @pytest.mark.asyncio
+    async def test_rule_based_extraction(self, tmp_path):
+        (tmp_path / "hp.obo").write_text(HPO_OBO)
+        ontology = HPOOntologyService(tmp_path)
+        await ontology.load()
+        extractor = PhenotypeExtractor(ontology)
+        text = "Seen for focal seizures. Head circumference shows a small head."
+
+        extractions = await extractor._extract_rule_based(text, {})
+        by_id = {e.hpo_id: e for e in extractions}
+
+        assert set(by_id) == {"HP:0007359", "HP:0001250", "HP:0000252"}
+        assert by_id["HP:0001250"].confidence == 0.95
+        assert by_id["HP:0000252"].confidence == 0.85
+        assert by_id["HP:0007359"].original_text == "focal seizures"
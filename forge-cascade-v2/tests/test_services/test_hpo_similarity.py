@@ -0,0 +1,157 @@
+"""
+Tests for the HPO semantic similarity index
+
+Tests cover:
+- Information content and MICA over a multi-parent hierarchy
+- Batch term x term similarity against pairwise results
+- Best-match-average set similarity and ranking
+- On-disk cache reuse by the ontology service
+"""
+
+import math
+
+import numpy as np
+import pytest
+
+from forge.services.hpo import HPOOntologyService, HPOSimilarityIndex
+
+# R -> A -> C, R -> B -> E, and D under both A and B
+PARENTS = {
+    "HP:0000001": [],
+    "HP:0000002": ["HP:0000001"],
+    "HP:0000003": ["HP:0000001"],
+    "HP:0000004": ["HP:0000002"],
+    "HP:0000005": ["HP:0000002", "HP:0000003"],
+    "HP:0000006": ["HP:0000003"],
+}
+ROOT, A, B, C, D, E = sorted(PARENTS)
+
+HPO_OBO = """\
+[Term]
+id: HP:0000001
+name: All
+
+[Term]
+id: HP:0001250
+name: Seizure
+is_a: HP:0000001
+
+[Term]
+id: HP:0007359
+name: Focal-onset seizure
+is_a: HP:0001250
+
+[Term]
+id: HP:0000252
+name: Microcephaly
+is_a: HP:0000001
+"""
+
+
+@pytest.fixture
+def index():
+    return HPOSimilarityIndex.build(PARENTS)
+
+
+class TestHPOSimilarityIndex:
+    """Tests for term information content and similarity."""
+
+    def test_information_content(self, index):
+        assert index.information_content(ROOT) == 0.0
+        assert index.information_content(A) == pytest.approx(math.log(2))
+        assert index.information_content(D) == pytest.approx(math.log(6))
+        assert index.information_content("HP:9999999") == 0.0
+
+    def test_mica_across_multiple_parents(self, index):
+        assert index.ancestors(D) == {ROOT, A, B}
+        assert index.mica(C, D) == A
+        assert index.mica(D, E) == B
+        assert index.mica(C, E) == ROOT
+        assert index.mica(C, "HP:9999999") is None
+
+    def test_methods(self, index):
+        assert index.term_similarity(C, D, "resnik") == pytest.approx(math.log(2))
+        assert index.term_similarity(C, D, "lin") == pytest.approx(math.log(2) / math.log(6))
+        assert index.term_similarity(A, C, "relative") == pytest.approx(math.log(2) / math.log(6))
+        assert index.term_similarity(ROOT, ROOT, "lin") == 1.0
+        assert index.term_similarity(C, E, "lin") == 0.0
+
+        with pytest.raises(ValueError):
+            index.term_similarity(C, D, "cosine")
+
+    def test_matrix_matches_pairwise(self, index):
+        terms = [*sorted(PARENTS), "HP:9999999"]
+
+        matrix = index.similarity_matrix(terms, terms, "lin")
+
+        expected = [[index.term_similarity(a, b, "lin") for b in terms] for a in terms]
+        np.testing.assert_allclose(matrix, expected)
+        assert not matrix[-1].any()
+
+    def test_cycle_does_not_hang(self):
+        index = HPOSimilarityIndex.build({"HP:1": ["HP:2"], "HP:2": ["HP:1"]})
+
+        assert index.ancestors("HP:1") == {"HP:2"}
+
+
+class TestHPOSetSimilarity:
+    """Tests for best-match-average phenotype set similarity."""
+
+    def test_best_match_average(self, index):
+        log2, log6 = math.log(2), math.log(6)
+
+        scores = index.set_similarities([C, D], [[C], [E], [], ["HP:9999999"]])
+
+        np.testing.assert_allclose(scores, [((log6 + log2) / 2 + log6) / 2, 0.75 * log2, 0.0, 0.0])
+
+    def test_one_sided(self, index):
+        scores = index.set_similarities([C, D], [[C, E]], symmetric=False)
+
+        np.testing.assert_allclose(scores, [(math.log(6) + math.log(2)) / 2])
+
+    def test_rank(self, index):
+        ranked = index.rank([C], {"MONDO:2": [E], "MONDO:1": [D, C], "MONDO:3": []}, limit=2)
+
+        assert [disease_id for disease_id, _ in ranked] == ["MONDO:1", "MONDO:2"]
+
+
+class TestHPOSimilarityPersistence:
+    """Tests for the on-disk similarity cache."""
+
+    def test_round_trip_and_stale_source(self, index, tmp_path):
+        path = tmp_path / "hp.similarity.npz"
+        index.save(path, {"name": "hp.obo", "size": 1})
+
+        loaded = HPOSimilarityIndex.load(path, {"name": "hp.obo", "size": 1})
+
+        assert loaded is not None
+        assert loaded.term_ids == index.term_ids
+        assert loaded.term_similarity(C, D) == index.term_similarity(C, D)
+        assert HPOSimilarityIndex.load(path, {"name": "hp.obo", "size": 2}) is None
+
+    def test_corrupt_file_ignored(self, tmp_path):
+        path = tmp_path / "hp.similarity.npz"
+        path.write_bytes(b"not an archive")
+
+        assert HPOSimilarityIndex.load(path, {}) is None
+
+    @pytest.mark.asyncio
+    async def test_ontology_reuses_cache(self, tmp_path, monkeypatch):
+        (tmp_path / "hp.obo").write_text(HPO_OBO)
+        assert await HPOOntologyService(tmp_path).load()
+        assert (tmp_path / HPOOntologyService.SIMILARITY_FILE).exists()
+
+        def no_build(cls, parent_map):
+            raise AssertionError("similarity index should not be rebuilt")
+
+        monkeypatch.setattr(HPOSimilarityIndex, "build", classmethod(no_build))
+        ontology = HPOOntologyService(tmp_path)
+        assert await ontology.load()
+
+        scores = ontology.get_set_similarities(
+            ["HP:0007359"], [["HP:0001250"], ["HP:0000252"]], method="lin"
+        )
+        assert scores[0] > scores[1] == 0.0
+        assert ontology.get_semantic_similarity("HP:0007359", "HP:0001250") == pytest.approx(
+            math.log(2) / math.log(4)
+        )
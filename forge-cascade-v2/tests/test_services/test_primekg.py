@@ -7,10 +7,25 @@ Tests cover:
 - Edge type validation
 - Data model serialization
 - Clinical data structure validation
+- Pipelined import with byte-offset resume and offline export
+- Memory-mapped adjacency snapshot and the lookups served from it
 """
 
-from datetime import datetime
-
+import asyncio
+import csv
+import os
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+from neo4j.exceptions import ConstraintError
+
+from forge.config import Settings
+from forge.overlays.primekg_overlay import PrimeKGOverlay
+from forge.services.diagnosis.engine import DiagnosisEngine
+from forge.services.diagnosis.models import DiagnosisSession, EvidenceItem, PatientProfile
+from forge.services.primekg.adjacency import PrimeKGAdjacency
+from forge.services.primekg.import_service import PrimeKGImportService, _CheckpointTracker
 from forge.services.primekg.models import (
     PrimeKGAnatomy,
     PrimeKGDisease,
@@ -481,3 +496,374 @@ class TestModelSerialization:
         assert data["relation"] == "test"
         assert data["x_id"] == "A"
         assert data["y_id"] == "B"
+
+
+# =============================================================================
+# Import Service
+# =============================================================================
+
+NODES_CSV = """node_index,node_id,node_type,node_name,node_source
+0,MONDO:1,disease,Disease one,MONDO
+1,HP:1,effect/phenotype,"Seizure, focal",HPO
+2,1234,gene/protein,BRCA1,NCBI
+3,MONDO:2,disease,"Multi
+line name",MONDO
+4,X,not-a-type,Bad,NONE
+5,DB01,drug,Aspirin,DrugBank
+"""
+
+EDGES_CSV = """relation,display_relation,x_index,y_index
+phenotype present,phenotype present,0,1
+associated with,associated with,2,0
+indication,indication,5,3
+mystery,mystery,1,2
+"""
+
+
+class FakeNeo4j:
+    """Records every write; can cancel the import or raise after a number of writes."""
+
+    def __init__(self, service=None, cancel_after=None):
+        self.calls = []
+        self.service = service
+        self.cancel_after = cancel_after
+        self.fail_on = None
+        self.error: Exception | None = None
+
+    async def run(self, query, parameters=None):
+        self.calls.append((query, parameters or {}))
+        if self.cancel_after is not None and len(self.calls) >= self.cancel_after:
+            self.service.cancel()
+        if len(self.calls) == self.fail_on:
+            raise self.error
+        return []
+
+
+@pytest.fixture
+def primekg_files(tmp_path):
+    nodes = tmp_path / "nodes.csv"
+    edges = tmp_path / "edges.csv"
+    nodes.write_text(NODES_CSV)
+    edges.write_text(EDGES_CSV)
+    return nodes, edges
+
+
+def make_service(tmp_path, **kwargs):
+    service = PrimeKGImportService(FakeNeo4j(), progress_file=tmp_path / "progress.json", **kwargs)
+    service.neo4j.service = service
+    return service
+
+
+class TestPrimeKGImport:
+    """Tests for the pipelined importer."""
+
+    @pytest.mark.asyncio
+    async def test_nodes_partitioned_by_label(self, tmp_path, primekg_files):
+        service = make_service(tmp_path, batch_size=10)
+
+        progress = await service.import_nodes(primekg_files[0])
+
+        assert progress.imported_records == 5
+        assert progress.failed_records == 1
+        assert progress.total_records == 6
+        assert progress.is_complete
+        assert progress.progress_percent == 100
+        written = {}
+        for query, params in service.neo4j.calls:
+            assert "apoc" not in query
+            types = {node["node_type"] for node in params["nodes"]}
+            assert len(types) == 1
+            written[types.pop()] = (query, params["nodes"])
+        assert "n:PrimeKGDisease" in written["disease"][0]
+        assert "n.mondo_id = node.node_id" in written["disease"][0]
+        assert "n.symbol = node.node_name" in written["gene/protein"][0]
+        names = {n["node_name"] for n in written["disease"][1]}
+        assert names == {"Disease one", "Multi\nline name"}
+        assert written["effect/phenotype"][1][0]["node_name"] == "Seizure, focal"
+
+    @pytest.mark.asyncio
+    async def test_edges_use_mapped_relationship_types(self, tmp_path, primekg_files):
+        service = make_service(tmp_path, edge_batch_size=10)
+
+        progress = await service.import_edges(primekg_files[1])
+
+        assert progress.imported_records == 4
+        queries = {query.split("[r:")[1].split(" ")[0]: p for query, p in service.neo4j.calls}
+        assert set(queries) == {"HAS_PHENOTYPE", "ASSOCIATED_WITH", "INDICATED_FOR", "RELATED_TO"}
+        assert queries["INDICATED_FOR"]["edges"] == [
+            {"x_index": 5, "y_index": 3, "relation": "indication"}
+        ]
+
+    @pytest.mark.asyncio
+    async def test_resume_continues_from_byte_offset(self, tmp_path, primekg_files):
+        service = make_service(tmp_path, batch_size=1, writers=1)
+        service.neo4j.cancel_after = 2
+
+        first = await service.import_nodes(primekg_files[0])
+
+        assert 0 < first.byte_offset < first.total_bytes
+        assert not first.is_complete
+
+        resumed = make_service(tmp_path, batch_size=1, writers=2)
+        second = await resumed.import_nodes(primekg_files[0])
+
+        assert second.is_resuming
+        assert second.is_complete
+        indices = [
+            node["node_index"]
+            for neo4j in (service.neo4j, resumed.neo4j)
+            for _, params in neo4j.calls
+            for node in params["nodes"]
+        ]
+        assert sorted(indices) == [0, 1, 2, 3, 5]
+        assert second.imported_records == 5
+
+    @pytest.mark.asyncio
+    async def test_changed_file_starts_over(self, tmp_path, primekg_files):
+        service = make_service(tmp_path, batch_size=1, writers=1)
+        service.neo4j.cancel_after = 1
+        await service.import_nodes(primekg_files[0])
+
+        primekg_files[0].write_text(NODES_CSV + "6,HP:2,effect/phenotype,Ataxia,HPO\n")
+        restarted = make_service(tmp_path, batch_size=10)
+        progress = await restarted.import_nodes(primekg_files[0])
+
+        assert not progress.is_resuming
+        assert progress.imported_records == 6
+
+    @pytest.mark.asyncio
+    async def test_neo4j_error_fails_only_its_batch(self, tmp_path, primekg_files):
+        service = make_service(tmp_path, batch_size=10, writers=1, max_retries=1)
+        service.neo4j.fail_on = 1
+        service.neo4j.error = ConstraintError("duplicate node_index")
+
+        progress = await asyncio.wait_for(service.import_nodes(primekg_files[0]), 5)
+
+        assert progress.failed_records > 1
+        assert progress.imported_records + progress.failed_records == 6
+        assert "failed after 1 retries" in progress.last_error
+
+    @pytest.mark.asyncio
+    async def test_unexpected_writer_error_does_not_hang(self, tmp_path, primekg_files):
+        service = make_service(tmp_path, batch_size=1, writers=1)
+        service.neo4j.fail_on = 1
+        service.neo4j.error = TypeError("unexpected")
+
+        with pytest.raises(ExceptionGroup) as raised:
+            await asyncio.wait_for(service.import_nodes(primekg_files[0]), 5)
+
+        assert raised.group_contains(TypeError)
+
+    @pytest.mark.asyncio
+    async def test_admin_export(self, tmp_path, primekg_files):
+        service = make_service(tmp_path)
+
+        files = await service.export_admin_import(*primekg_files, tmp_path / "admin")
+
+        assert files.nodes_written == 5
+        assert files.relationships_written == 4
+        assert files.invalid_records == 1
+        disease_file = tmp_path / "admin" / "nodes_PrimeKGDisease.csv"
+        with open(disease_file, newline="") as f:
+            rows = list(csv.reader(f))
+        assert rows[0][0] == "node_index:ID(PrimeKGNode)"
+        assert rows[0][5] == "mondo_id"
+        assert {row[-1] for row in rows[1:]} == {"PrimeKGNode;PrimeKGDisease"}
+        assert rows[2][3] == "Multi\nline name"
+
+        command = files.command()
+        assert command[:4] == ["neo4j-admin", "database", "import", "full"]
+        assert f"--nodes={disease_file}" in command
+        assert command[-1] == "neo4j"
+        assert service.neo4j.calls == []
+
+
+class TestCheckpointTracker:
+    """Tests for turning out-of-order completions into resume offsets."""
+
+    def test_offset_waits_for_earlier_chunks(self):
+        tracker = _CheckpointTracker(10)
+        tracker.expect(1, 20, 2)
+        tracker.expect(2, 30, 1)
+
+        assert tracker.finish(2) is False
+        assert tracker.offset == 10
+        assert tracker.finish(1) is False
+        assert tracker.finish(1) is True
+        assert tracker.offset == 30
+
+    def test_empty_chunk_advances_immediately(self):
+        tracker = _CheckpointTracker(0)
+
+        assert tracker.expect(1, 15, 0) is True
+        assert tracker.offset == 15
+
+
+# =============================================================================
+# Adjacency Snapshot
+# =============================================================================
+
+GRAPH_NODES_CSV = """node_index,node_id,node_type,node_name,node_source
+0,MONDO:1,disease,Disease one,MONDO
+1,HP:1,effect/phenotype,Seizure,HPO
+2,HP:2,effect/phenotype,Ataxia,HPO
+3,HP:3,effect/phenotype,Tremor,HPO
+4,MONDO:2,disease,Disease two,MONDO
+5,1234,gene/protein,BRCA1,NCBI
+"""
+
+GRAPH_EDGES_CSV = """relation,display_relation,x_index,y_index
+phenotype present,phenotype present,0,1
+phenotype present,phenotype present,0,2
+phenotype present,phenotype present,1,0
+phenotype present,phenotype present,4,2
+phenotype present,phenotype present,4,3
+associated with,associated with,5,0
+"""
+
+
+@pytest.fixture
+def graph_files(tmp_path):
+    nodes = tmp_path / "nodes.csv"
+    edges = tmp_path / "edges.csv"
+    nodes.write_text(GRAPH_NODES_CSV)
+    edges.write_text(GRAPH_EDGES_CSV)
+    return nodes, edges
+
+
+@pytest.fixture
+def graph(graph_files, tmp_path):
+    return PrimeKGAdjacency.build(*graph_files, tmp_path / "adjacency")
+
+
+class TestPrimeKGAdjacency:
+    """Tests for building and querying the snapshot."""
+
+    def test_build_and_reopen(self, graph, tmp_path):
+        reopened = PrimeKGAdjacency.open(tmp_path / "adjacency")
+
+        assert reopened.stats() == graph.stats()
+        assert reopened.node_count == 6
+        assert reopened.relations == ["ASSOCIATED_WITH", "HAS_PHENOTYPE"]
+        assert isinstance(reopened._csr[0][1], np.memmap)
+
+    def test_open_missing_snapshot(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            PrimeKGAdjacency.open(tmp_path / "missing")
+
+    def test_find_by_id_and_name(self, graph):
+        assert graph.find("HP:2") == [2]
+        assert graph.find("HP:2", "disease") == []
+        assert graph.find_by_name("BRCA1", "gene/protein") == [5]
+        assert graph.find("nope") == []
+        assert (graph.node_id(4), graph.node_name(4), graph.node_type(4)) == (
+            "MONDO:2",
+            "Disease two",
+            "disease",
+        )
+
+    def test_neighbors_are_undirected_and_distinct(self, graph):
+        assert graph.neighbors(0, "HAS_PHENOTYPE").tolist() == [1, 2]
+        assert graph.neighbors(2, "HAS_PHENOTYPE").tolist() == [0, 4]
+        assert graph.neighbors(0, ["HAS_PHENOTYPE", "ASSOCIATED_WITH"]).tolist() == [1, 2, 5]
+        assert graph.neighbors(0, "UNKNOWN").tolist() == []
+        assert graph.degree(0, "HAS_PHENOTYPE", "effect/phenotype") == 2
+
+    def test_overlap_and_k_hop(self, graph):
+        assert graph.overlap([1, 2], "HAS_PHENOTYPE", "disease") == {0: [1, 2], 4: [2]}
+        assert graph.k_hop([1], "HAS_PHENOTYPE", 2) == {0, 2}
+        assert graph.k_hop([1], "HAS_PHENOTYPE", 3, "disease") == {0, 4}
+
+    def test_changed_source_or_age_makes_stale(self, graph, graph_files):
+        assert graph.is_fresh()
+        assert not graph.is_fresh(max_age_seconds=1e-9)
+
+        graph.FRESHNESS_CHECK_INTERVAL = 0
+        os.utime(graph_files[1], ns=(0, 0))
+
+        assert not graph.is_fresh()
+
+    def test_snapshot_without_sources_expires(self, graph, graph_files, tmp_path):
+        for path in graph_files:
+            path.unlink()
+        reopened = PrimeKGAdjacency.open(tmp_path / "adjacency", max_age_seconds=3600)
+        assert reopened.is_fresh()
+
+        reopened.built_at -= timedelta(hours=2)
+
+        assert not reopened.is_fresh()
+        assert Settings.model_fields["primekg_adjacency_max_age_hours"].default > 0
+
+
+class TestPrimeKGAdjacencyLookups:
+    """Tests for overlay and engine lookups served from the snapshot."""
+
+    @pytest.mark.asyncio
+    async def test_phenotype_to_disease(self, graph):
+        overlay = PrimeKGOverlay(adjacency=graph)
+
+        result = await overlay._phenotype_to_disease({"phenotypes": ["HP:1", "HP:2"]}, None)
+        ranked = [(r["disease_id"], r["score"]) for r in result["results"]]
+
+        assert ranked == [("MONDO:1", 1.0), ("MONDO:2", 0.25)]
+        assert result["results"][0]["matched_phenotypes"] == ["HP:1", "HP:2"]
+
+    @pytest.mark.asyncio
+    async def test_gene_association_and_discriminating_phenotypes(self, graph):
+        overlay = PrimeKGOverlay(adjacency=graph)
+
+        genes = await overlay._gene_disease_association({"gene_id": "BRCA1"}, None)
+        discriminating = await overlay._find_discriminating_phenotypes(
+            {"disease_a": "MONDO:1", "disease_b": "MONDO:2"}, None
+        )
+
+        assert [a["disease_id"] for a in genes["associations"]] == ["MONDO:1"]
+        assert [(p["hpo_id"], p["discriminates"]) for p in discriminating["phenotypes"]] == [
+            ("HP:1", "supports_a"),
+            ("HP:3", "supports_b"),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_stale_snapshot_falls_back_to_cypher(self, graph, graph_files):
+        neo4j = FakeNeo4j()
+        overlay = PrimeKGOverlay(neo4j_client=neo4j, adjacency=graph)
+        graph.FRESHNESS_CHECK_INTERVAL = 0
+        os.utime(graph_files[0], ns=(0, 0))
+
+        result = await overlay._phenotype_to_disease({"phenotypes": ["HP:1"]}, None)
+
+        assert result["results"] == []
+        assert len(neo4j.calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_engine_candidates(self, graph):
+        overlay = PrimeKGOverlay(adjacency=graph)
+        engine = DiagnosisEngine(primekg_overlay=overlay)
+        patient = PatientProfile(phenotypes=[EvidenceItem(code="HP:1"), EvidenceItem(code="HP:3")])
+
+        candidates = await engine._get_phenotype_candidates(DiagnosisSession(patient=patient))
+        by_id = {c.disease_id: c for c in candidates}
+
+        assert set(by_id) == {"MONDO:1", "MONDO:2"}
+        assert by_id["MONDO:1"].associated_genes == ["BRCA1"]
+        assert by_id["MONDO:1"].missing_phenotypes == ["HP:2"]
+        assert by_id["MONDO:2"].expected_phenotypes == ["HP:2", "HP:3"]
+
+    @pytest.mark.asyncio
+    async def test_engine_expected_phenotypes_follow_edge_frequency(self, graph):
+        neo4j = FakeNeo4j()
+
+        async def details(query, parameters=None):
+            neo4j.calls.append((query, parameters))
+            return [{"node_index": 4, "prevalence": None, "expected_phenotypes": ["HP:3", "HP:2"]}]
+
+        neo4j.run = details
+        overlay = PrimeKGOverlay(adjacency=graph)
+        engine = DiagnosisEngine(primekg_overlay=overlay, neo4j_client=neo4j)
+        patient = PatientProfile(phenotypes=[EvidenceItem(code="HP:3")])
+
+        candidates = await engine._get_phenotype_candidates(DiagnosisSession(patient=patient))
+
+        assert [c.expected_phenotypes for c in candidates] == [["HP:3", "HP:2"]]
+        assert "ORDER BY r.frequency DESC" in neo4j.calls[0][0]
+        assert len(neo4j.calls) == 1
@@ -181,6 +181,137 @@ class TestSearchService:
         assert response.filters_applied["tags"] == ["python"]
 
 
+class TestKeywordSearch:
+    """Tests for BM25 keyword search."""
+
+    @pytest.fixture
+    def search_service(self):
+        embedding_service = AsyncMock()
+        embedding_service.dimensions = 1536
+        return SearchService(embedding_service=embedding_service, db_client=AsyncMock())
+
+    def test_lucene_query_escapes_operators(self, search_service):
+        query = search_service._to_lucene_query('python AND "event loop" c++ title:x')
+
+        assert query == '"event loop" python and c\\+\\+ title\\:x'
+
+    @pytest.mark.asyncio
+    async def test_fulltext_scores_are_relative(self, search_service):
+        search_service._db.execute = AsyncMock(
+            return_value=[
+                {"capsule": {"id": "cap-1", "content": "asyncio event loop"}, "score": 4.0},
+                {"capsule": {"id": "cap-2", "content": "event sourcing"}, "score": 1.0},
+            ]
+        )
+
+        results = await search_service._keyword_search(SearchRequest(query="event loop"))
+
+        cypher = search_service._db.execute.await_args.args[0]
+        assert "db.index.fulltext.queryNodes" in cypher
+        assert "=~" not in cypher
+        assert [r.score for r in results] == [1.0, 0.25]
+        assert results[0].highlights
+
+
+class TestHybridSearch:
+    """Tests for rank-fusion hybrid search."""
+
+    @pytest.fixture
+    def search_service(self):
+        embedding_service = AsyncMock()
+        embedding_service.dimensions = 1536
+        embedding_service.embed = AsyncMock(return_value=MagicMock(embedding=[0.1] * 1536))
+        db = AsyncMock()
+        semantic = [{"id": f"sem-{i}", "score": 0.9 - i * 0.01} for i in range(10)]
+        keyword = [{"id": "sem-3", "score": 5.0}] + [
+            {"id": f"kw-{i}", "score": 4.0 - i * 0.1} for i in range(10)
+        ]
+
+        async def fake_execute(cypher, params):
+            if "vector.queryNodes" in cypher:
+                return semantic
+            if "fulltext.queryNodes" in cypher:
+                return keyword
+            return [
+                {"capsule": {"id": cid, "content": f"content of {cid}", "type": "knowledge"}}
+                for cid in params["ids"]
+            ]
+
+        db.execute = AsyncMock(side_effect=fake_execute)
+        return SearchService(embedding_service=embedding_service, db_client=db)
+
+    def hybrid_request(self, **kwargs):
+        return SearchRequest(
+            query="content",
+            mode=SearchMode.HYBRID,
+            limit=5,
+            boost_recent=False,
+            boost_popular=False,
+            **kwargs,
+        )
+
+    @pytest.mark.asyncio
+    async def test_rank_fusion_order(self, search_service):
+        response = await search_service.search(self.hybrid_request())
+
+        ids = [r.capsule.id for r in response.results]
+        assert ids[0] == "sem-3"
+        assert response.results[0].match_type == "hybrid"
+        assert response.results[0].score < 1.0
+        assert ids[1] == "sem-0"
+        assert "kw-0" in ids
+
+    @pytest.mark.asyncio
+    async def test_hydrates_page_only(self, search_service):
+        await search_service.search(self.hybrid_request())
+
+        hydration = [
+            call.args[1]["ids"]
+            for call in search_service._db.execute.await_args_list
+            if "ids" in call.args[1]
+        ]
+        assert len(hydration) == 1
+        assert len(hydration[0]) == 5
+
+    @pytest.mark.asyncio
+    async def test_cursor_pages_reuse_fused_ranking(self, search_service):
+        first = await search_service.search(self.hybrid_request())
+        calls_after_first = search_service._db.execute.await_count
+
+        seen = [r.capsule.id for r in first.results]
+        cursor = first.next_cursor
+        while cursor:
+            page = await search_service.search(self.hybrid_request(cursor=cursor))
+            seen.extend(r.capsule.id for r in page.results)
+            cursor = page.next_cursor
+
+        # Each later page costs one hydration query and no backend queries
+        pages = len(seen) // 5
+        assert search_service._db.execute.await_count == calls_after_first + pages - 1
+        assert len(seen) == len(set(seen)) == 20
+
+    @pytest.mark.asyncio
+    async def test_first_page_is_not_served_from_cache(self, search_service):
+        await search_service.search(self.hybrid_request())
+        calls_after_first = search_service._db.execute.await_count
+
+        await search_service.search(self.hybrid_request())
+
+        # Both backends and the hydration query run again
+        assert search_service._db.execute.await_count == calls_after_first * 2
+
+    @pytest.mark.asyncio
+    async def test_cursor_for_other_query_rejected(self, search_service):
+        first = await search_service.search(self.hybrid_request())
+
+        response = await search_service.search(
+            SearchRequest(query="other", mode=SearchMode.HYBRID, cursor=first.next_cursor)
+        )
+
+        assert response.results == []
+        assert response.next_cursor is None
+
+
 class TestResultRanking:
     """Tests for result ranking and boosting."""
 
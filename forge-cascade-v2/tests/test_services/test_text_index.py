@@ -0,0 +1,173 @@
+"""
+Tests for the in-process capsule full-text index
+
+Tests cover:
+- Tokenisation and stemming
+- BM25 ranking and filtering
+- Phrase queries
+- Highlights from stored offsets
+- Event-driven sync
+- SearchService integration
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from forge.models.events import Event, EventType
+from forge.services.search import SearchMode, SearchRequest, SearchService
+from forge.services.text_index import CapsuleTextIndex, TextIndexSync, stem, tokenize
+
+ASYNC_CONTENT = (
+    "The event loop runs coroutines. Running tasks concurrently is the point of the event loop."
+)
+
+
+@pytest.fixture
+def index():
+    idx = CapsuleTextIndex()
+    idx.upsert("async", "Async Python", ASYNC_CONTENT, trust_level=80)
+    idx.upsert("graphs", "Databases", "Neo4j stores graphs; the loop of events is different.")
+    idx.upsert("pasta", "Cooking", "Recipes for pasta", capsule_type="code", owner_id="chef")
+    idx.upsert("old", "Event loop history", "Archived notes", is_archived=True)
+    return idx
+
+
+class TestTokenization:
+    """Tests for tokenisation and stemming."""
+
+    def test_stem_common_inflections(self):
+        assert stem("running") == stem("runs") == "run"
+        assert stem("recipes") == stem("recipe")
+        assert stem("stories") == "story"
+        assert stem("classes") == "class"
+
+    def test_stop_words_keep_positions(self):
+        terms = tokenize("state of the art")
+
+        assert [(p, t) for p, t, _, _ in terms] == [(0, "state"), (3, "art")]
+
+
+class TestTextIndexSearch:
+    """Tests for BM25 ranking, filters and phrases."""
+
+    def test_bm25_ranks_denser_match_first(self, index):
+        hits = index.search("event loop")
+
+        assert [h.capsule_id for h in hits] == ["async", "graphs"]
+        assert hits[0].score > hits[1].score > 0
+
+    def test_stemmed_query_matches(self, index):
+        assert [h.capsule_id for h in index.search("recipe")] == ["pasta"]
+
+    def test_phrase_query_requires_adjacency(self, index):
+        assert [h.capsule_id for h in index.search('"event loop"')] == ["async"]
+        assert [h.capsule_id for h in index.search('"loop of events"')] == ["graphs"]
+
+    def test_filters(self, index):
+        assert index.search("pasta", owner_ids=["someone"]) == []
+        assert [h.capsule_id for h in index.search("pasta", capsule_types=["CODE"])] == ["pasta"]
+        assert [h.capsule_id for h in index.search("event", min_trust=70)] == ["async"]
+        assert "old" in {h.capsule_id for h in index.search("history", include_archived=True)}
+        assert index.search("history") == []
+
+    def test_highlights_from_offsets(self, index):
+        hit = index.search('"event loop"')[0]
+
+        assert hit.highlights(ASYNC_CONTENT, context_chars=5) == [
+            "The event loop runs...",
+            "... the event loop.",
+        ]
+
+    def test_reindex_and_remove(self, index):
+        index.upsert("pasta", "Cooking", "Bread baking")
+        assert index.search("pasta") == []
+        assert [h.capsule_id for h in index.search("bread")] == ["pasta"]
+
+        assert index.remove("pasta") is True
+        assert index.search("bread") == []
+        assert len(index) == 3
+
+
+class TestTextIndexSync:
+    """Tests for event-driven index maintenance."""
+
+    @pytest.mark.asyncio
+    async def test_updated_and_deleted_events(self, index):
+        capsule = MagicMock()
+        capsule.model_dump.return_value = {
+            "id": "pasta",
+            "title": "Cooking",
+            "content": "Slow risotto",
+            "trust_level": 60,
+            "type": "knowledge",
+        }
+        repo = MagicMock()
+        repo.get_by_id = AsyncMock(return_value=capsule)
+        sync = TextIndexSync(index, capsule_repo=repo)
+
+        await sync.handle_event(
+            Event(
+                id="e1",
+                type=EventType.CAPSULE_UPDATED,
+                source="test",
+                payload={"capsule_id": "pasta"},
+            )
+        )
+        assert [h.capsule_id for h in index.search("risotto")] == ["pasta"]
+
+        await sync.handle_event(
+            Event(
+                id="e2",
+                type=EventType.CAPSULE_DELETED,
+                source="test",
+                payload={"capsule_id": "pasta"},
+            )
+        )
+        assert "pasta" not in index
+
+    @pytest.mark.asyncio
+    async def test_rebuild_drops_stale_entries(self, index):
+        db = MagicMock()
+        db.execute = AsyncMock(
+            return_value=[{"capsule": {"id": "fresh", "title": "New", "content": "fresh text"}}]
+        )
+
+        count = await TextIndexSync(index, db_client=db).rebuild()
+
+        assert count == 1
+        assert len(index) == 1
+        assert "fresh" in index
+
+
+class TestSearchServiceWithTextIndex:
+    """Tests for SearchService keyword search using the text index."""
+
+    @pytest.mark.asyncio
+    async def test_keyword_search_uses_index(self, index):
+        db = MagicMock()
+
+        async def fake_execute(cypher, params):
+            assert "=~" not in cypher
+            return [
+                {"capsule": {"id": cid, "content": ASYNC_CONTENT, "trust_level": 80}}
+                for cid in params["ids"]
+            ]
+
+        db.execute = AsyncMock(side_effect=fake_execute)
+        embedding_service = MagicMock()
+        embedding_service.dimensions = 16
+        service = SearchService(embedding_service=embedding_service, db_client=db, text_index=index)
+
+        response = await service.search(
+            SearchRequest(
+                query='"event loop"',
+                mode=SearchMode.KEYWORD,
+                boost_recent=False,
+                boost_popular=False,
+            )
+        )
+
+        assert [r.capsule.id for r in response.results] == ["async"]
+        assert response.results[0].score == 1.0
+        assert response.results[0].highlights
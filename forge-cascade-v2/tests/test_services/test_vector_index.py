@@ -0,0 +1,281 @@
+"""
+Tests for the in-process capsule vector index
+
+Tests cover:
+- Exact and IVF search
+- Attribute pre-filtering
+- Upsert, removal and persistence
+- Event-driven sync
+- SearchService integration
+"""
+
+import random
+import threading
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from forge.models.capsule import CapsuleType  # noqa: E402
+from forge.models.events import Event, EventType  # noqa: E402
+from forge.services.search import (  # noqa: E402
+    SearchFilters,
+    SearchMode,
+    SearchRequest,
+    SearchService,
+)
+from forge.services.vector_index import (  # noqa: E402
+    CapsuleVectorIndex,
+    IndexedCapsule,
+    VectorIndexError,
+    VectorIndexSync,
+)
+
+DIM = 16
+
+
+def random_vector(rng: random.Random) -> list[float]:
+    return [rng.gauss(0, 1) for _ in range(DIM)]
+
+
+def brute_force(index_items, query, k):
+    q = np.asarray(query) / np.linalg.norm(query)
+    scored = [
+        (item.capsule_id, float(np.asarray(item.embedding) @ q / np.linalg.norm(item.embedding)))
+        for item in index_items
+    ]
+    scored.sort(key=lambda x: x[1], reverse=True)
+    return [capsule_id for capsule_id, _ in scored[:k]]
+
+
+@pytest.fixture
+def items():
+    rng = random.Random(7)
+    return [
+        IndexedCapsule(
+            capsule_id=f"cap-{i}",
+            embedding=random_vector(rng),
+            trust_level=20 + (i % 80),
+            capsule_type="code" if i % 5 == 0 else "knowledge",
+            owner_id=f"user-{i % 3}",
+            tags=["rare"] if i % 50 == 0 else ["common"],
+        )
+        for i in range(500)
+    ]
+
+
+@pytest.fixture
+def index(items):
+    idx = CapsuleVectorIndex(dimensions=DIM)
+    idx.upsert_many(items)
+    return idx
+
+
+class TestVectorIndexSearch:
+    """Tests for exact and approximate search."""
+
+    def test_exact_search_matches_brute_force(self, index, items):
+        query = random_vector(random.Random(1))
+
+        hits = index.search(query, k=10)
+
+        assert [h.capsule_id for h in hits] == brute_force(items, query, 10)
+        assert all(0.0 <= h.score <= 1.0 for h in hits)
+        assert hits == sorted(hits, key=lambda h: h.score, reverse=True)
+
+    def test_prefilter_returns_full_page(self, index, items):
+        query = random_vector(random.Random(2))
+
+        hits = index.search(query, k=5, capsule_types=["code"], owner_ids=["user-1"], min_trust=60)
+
+        expected = [
+            i
+            for i in items
+            if i.capsule_type == "code" and i.owner_id == "user-1" and i.trust_level >= 60
+        ]
+        assert len(hits) == min(5, len(expected))
+        assert [h.capsule_id for h in hits] == brute_force(expected, query, 5)
+
+    def test_tag_filter(self, index):
+        hits = index.search(random_vector(random.Random(3)), k=50, min_trust=0, tags=["rare"])
+
+        assert {h.capsule_id for h in hits} == {f"cap-{i}" for i in range(0, 500, 50)}
+
+    def test_ivf_recall(self, items):
+        idx = CapsuleVectorIndex(dimensions=DIM, train_threshold=100, nprobe=6)
+        idx.upsert_many(items)
+        assert idx.is_trained
+
+        rng = random.Random(4)
+        recalled = 0
+        for _ in range(20):
+            query = random_vector(rng)
+            expected = set(brute_force(items, query, 10))
+            recalled += len(expected & {h.capsule_id for h in idx.search(query, k=10)})
+
+        assert recalled / 200 >= 0.8
+
+    def test_dimension_mismatch(self, index):
+        with pytest.raises(VectorIndexError):
+            index.search([1.0, 0.0], k=1)
+
+
+class TestVectorIndexMutation:
+    """Tests for upsert, removal and persistence."""
+
+    def test_upsert_replaces_attributes(self, index, items):
+        item = items[1]
+        index.upsert(IndexedCapsule(item.capsule_id, item.embedding, trust_level=5))
+
+        hits = index.search(item.embedding, k=1, min_trust=40)
+
+        assert hits[0].capsule_id != item.capsule_id
+        assert len(index) == 500
+
+    def test_remove(self, index, items):
+        assert index.remove("cap-3") is True
+        assert index.remove("cap-3") is False
+
+        hits = index.search(items[3].embedding, k=1, min_trust=0)
+        assert hits[0].capsule_id != "cap-3"
+        assert "cap-3" not in index
+
+    def test_zero_embedding_rejected(self, index):
+        with pytest.raises(VectorIndexError):
+            index.upsert(IndexedCapsule("zero", [0.0] * DIM))
+
+    def test_training_runs_outside_the_lock(self, items, monkeypatch):
+        idx = CapsuleVectorIndex(dimensions=DIM)
+        idx.upsert_many(items[:400])
+        started, resume = threading.Event(), threading.Event()
+        default_rng = np.random.default_rng
+
+        def paused_rng(seed):
+            started.set()
+            resume.wait(5)
+            return default_rng(seed)
+
+        monkeypatch.setattr(np.random, "default_rng", paused_rng)
+        trainer = threading.Thread(target=idx.train)
+        trainer.start()
+        assert started.wait(5)
+
+        # Mid-training the index stays usable, and a new row gets a list
+        assert idx._lock.acquire(timeout=1)
+        idx._lock.release()
+        late = items[400]
+        idx.upsert(late)
+        resume.set()
+        trainer.join(5)
+
+        assert idx.is_trained
+        assert idx.search(late.embedding, k=1, min_trust=0)[0].capsule_id == late.capsule_id
+
+    def test_save_and_load(self, tmp_path, items):
+        idx = CapsuleVectorIndex(dimensions=DIM, train_threshold=100)
+        idx.upsert_many(items)
+        path = str(tmp_path / "index.npz")
+
+        idx.save(path)
+        loaded = CapsuleVectorIndex.load(path)
+
+        query = random_vector(random.Random(5))
+        assert len(loaded) == len(idx)
+        assert loaded.is_trained
+        assert loaded.search(query, k=5, tags=["common"]) == idx.search(query, k=5, tags=["common"])
+
+
+class TestVectorIndexSync:
+    """Tests for event-driven index maintenance."""
+
+    @pytest.mark.asyncio
+    async def test_created_and_deleted_events(self):
+        index = CapsuleVectorIndex(dimensions=DIM)
+        capsule = MagicMock()
+        capsule.model_dump.return_value = {
+            "id": "cap-new",
+            "embedding": [1.0] + [0.0] * (DIM - 1),
+            "trust_level": 80,
+            "type": CapsuleType.KNOWLEDGE,
+            "owner_id": "user-1",
+        }
+        repo = MagicMock()
+        repo.get_by_id = AsyncMock(return_value=capsule)
+        sync = VectorIndexSync(index, capsule_repo=repo)
+
+        await sync.handle_event(
+            Event(
+                id="e1",
+                type=EventType.CAPSULE_CREATED,
+                source="test",
+                payload={"capsule_id": "cap-new"},
+            )
+        )
+        assert "cap-new" in index
+
+        await sync.handle_event(
+            Event(
+                id="e2",
+                type=EventType.CAPSULE_DELETED,
+                source="test",
+                payload={"capsule_id": "cap-new"},
+            )
+        )
+        assert "cap-new" not in index
+
+    @pytest.mark.asyncio
+    async def test_rebuild_drops_stale_entries(self, index):
+        rng = random.Random(6)
+        db = MagicMock()
+        db.execute = AsyncMock(
+            return_value=[
+                {"capsule": {"id": "fresh", "embedding": random_vector(rng), "trust_level": 60}}
+            ]
+        )
+
+        count = await VectorIndexSync(index, db_client=db).rebuild()
+
+        assert count == 1
+        assert len(index) == 1
+        assert "fresh" in index
+
+
+class TestSearchServiceWithIndex:
+    """Tests for SearchService using the vector index."""
+
+    @pytest.mark.asyncio
+    async def test_semantic_search_uses_index(self, index, items):
+        query = items[10].embedding
+        embedding_service = MagicMock()
+        embedding_service.dimensions = DIM
+        embedding_service.embed = AsyncMock(return_value=MagicMock(embedding=query))
+
+        db = MagicMock()
+
+        async def fake_execute(cypher, params):
+            assert "queryNodes" not in cypher
+            return [
+                {"capsule": {"id": cid, "content": "text", "type": "knowledge", "trust_level": 60}}
+                for cid in params["ids"]
+            ]
+
+        db.execute = AsyncMock(side_effect=fake_execute)
+        service = SearchService(
+            embedding_service=embedding_service, db_client=db, vector_index=index
+        )
+
+        response = await service.search(
+            SearchRequest(
+                query="anything",
+                mode=SearchMode.SEMANTIC,
+                limit=3,
+                min_score=0.0,
+                filters=SearchFilters(min_trust=0),
+                boost_recent=False,
+                boost_popular=False,
+            )
+        )
+
+        assert response.results[0].capsule.id == "cap-10"
+        assert len(response.results) == 3